@@ -0,0 +1,163 @@
+# -------------------------------------------------------------------------------
+#   Scaling benchmark for gen_ir and the bindings generators.
+#
+#   Generates synthetic sokol-style headers of increasing size (see
+#   benchmarks/synth_header.py), and measures the time and peak memory of
+#   each phase per size:
+#
+#       clang       the declaration-only AST dump (peak RSS of the clang process)
+#       json        decoding the AST dump
+#       parse       turning the AST into the IR
+#       layouts     the struct layout pass (one more clang run)
+#       <backend>   each backend's gen_module()
+#
+#   The 'exp' column is the scaling exponent against the previous size
+#   (log(t1/t0) / log(n1/n0)): around 1.0 is linear, anything approaching
+#   2.0 hints at quadratic behaviour (string building, linear scans...).
+#   Run from the bindgen directory, needs clang (see SOKOL_BINDGEN_CLANG):
+#
+#       python3 benchmarks/scaling.py [sizes] [num_deps] [csv_path]
+#       python3 benchmarks/scaling.py 250,500,1000,2000,4000 2 scaling.csv
+# -------------------------------------------------------------------------------
+import json, math, os, subprocess, sys, tempfile, time, tracemalloc
+
+bench_dir = os.path.dirname(os.path.abspath(__file__))
+bindgen_dir = os.path.dirname(bench_dir)
+
+sys.path.insert(0, bindgen_dir)
+sys.path.insert(0, bench_dir)
+import gen_ir, gen_zig, gen_rust, gen_d, gen_v, gen_nim, gen_odin, gen_jai, gen_python
+import synth_header
+
+backends = {
+    "zig": gen_zig,
+    "rust": gen_rust,
+    "d": gen_d,
+    "v": gen_v,
+    "nim": gen_nim,
+    "odin": gen_odin,
+    "jai": gen_jai,
+    "python": gen_python,
+}
+
+
+# make the synthetic modules known to gen_ir and the backends, the C source
+# paths are derived from the backend's sokol_gfx entry
+def register_modules(modules):
+    for module in modules:
+        gen_ir.api_headers[module.prefix] = module.header_name
+        for backend in backends.values():
+            backend.module_names[module.prefix] = module.name
+            for table_name in ["c_source_paths", "c_source_names"]:
+                table = getattr(backend, table_name, None)
+                if table is not None:
+                    table[module.prefix] = table["sg_"].replace("sokol_gfx", f"sokol_{module.name}")
+
+
+def unregister_modules(modules):
+    for module in modules:
+        gen_ir.api_headers.pop(module.prefix, None)
+        for backend in backends.values():
+            backend.module_names.pop(module.prefix, None)
+            for table_name in ["c_source_paths", "c_source_names"]:
+                getattr(backend, table_name, {}).pop(module.prefix, None)
+
+
+# run clang on the declaration-only source, returns the AST dump and
+# the peak RSS of the clang process in KiB (None if not available)
+def run_clang(src):
+    proc = subprocess.Popen(gen_ir.clang_cmd(None), stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    if not hasattr(os, "wait4"):
+        outp, _ = proc.communicate(src)
+        return outp, None
+    proc.stdin.write(src)
+    proc.stdin.close()
+    outp = proc.stdout.read()
+    _, status, rusage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode != 0:
+        sys.exit(f"ERROR: clang failed with exit code {proc.returncode}")
+    # ru_maxrss is in KiB on Linux, but in bytes on macOS
+    return outp, rusage.ru_maxrss // 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+
+
+# call func and return (result, seconds, peak Python heap in KiB), func is
+# called twice since tracing the allocations would distort the timing
+def measure(func):
+    t0 = time.perf_counter()
+    res = func()
+    secs = time.perf_counter() - t0
+    del res
+    tracemalloc.start()
+    res = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return res, secs, peak // 1024
+
+
+def run_backend(backend, ir, c_prefix, dep_prefixes):
+    backend.reset_globals()
+    if backend in [gen_odin, gen_jai]:
+        backend.gen_module(ir, c_prefix, dep_prefixes)
+    else:
+        backend.gen_module(ir, dep_prefixes)
+    return backend.out_lines
+
+
+# returns a list of (phase, seconds, peak memory in KiB) tuples
+def run_size(work_dir, num_decls, num_deps):
+    main, deps = synth_header.synth_modules(num_decls, num_deps)
+    header_path = synth_header.write_headers(work_dir, main, deps)
+    dep_prefixes = [dep.prefix for dep in deps]
+    register_modules([main, *deps])
+    try:
+        results = []
+        src = gen_ir.decl_only_source(header_path, main.prefix, dep_prefixes)
+        t0 = time.perf_counter()
+        ast_dump, clang_rss = run_clang(src)
+        results.append(("clang", time.perf_counter() - t0, clang_rss))
+        ast, secs, mem = measure(lambda: json.loads(ast_dump))
+        results.append(("json", secs, mem))
+        del ast_dump
+        ir, secs, mem = measure(lambda: gen_ir.parse_ast(ast, main.name, main.prefix, dep_prefixes))
+        results.append(("parse", secs, mem))
+        del ast
+        _, secs, mem = measure(lambda: gen_ir.add_layouts(ir, header_path, main.prefix, dep_prefixes))
+        results.append(("layouts", secs, mem))
+        for backend_name, backend in backends.items():
+            _, secs, mem = measure(lambda: run_backend(backend, ir, main.prefix, dep_prefixes))
+            results.append((backend_name, secs, mem))
+        return main.config.num_decls, results
+    finally:
+        unregister_modules([main, *deps])
+
+
+def main():
+    sizes = [int(s) for s in sys.argv[1].split(",")] if len(sys.argv) > 1 else [250, 500, 1000, 2000, 4000]
+    num_deps = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    csv_path = sys.argv[3] if len(sys.argv) > 3 else None
+    rows = []
+    prev = {}
+    print(f"=== scaling with {num_deps} dependency modules:")
+    print(f"  {'decls':>6} {'phase':<8} {'ms':>9} {'exp':>5} {'peak KiB':>10}")
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in sizes:
+            num_decls, results = run_size(work_dir, size, num_deps)
+            for phase, secs, mem in results:
+                exp = ""
+                if phase in prev and prev[phase][1] > 0 and secs > 0 and num_decls != prev[phase][0]:
+                    exp = f"{math.log(secs / prev[phase][1]) / math.log(num_decls / prev[phase][0]):.2f}"
+                prev[phase] = (num_decls, secs)
+                mem_str = "-" if mem is None else str(mem)
+                print(f"  {num_decls:>6} {phase:<8} {secs * 1000:>9.1f} {exp:>5} {mem_str:>10}")
+                rows.append((num_decls, phase, secs, mem))
+    if csv_path:
+        with open(csv_path, "w", newline="\n") as f:
+            f.write("decls,phase,seconds,peak_kib\n")
+            for num_decls, phase, secs, mem in rows:
+                f.write(f"{num_decls},{phase},{secs:.6f},{'' if mem is None else mem}\n")
+        print(f"  wrote {csv_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+# -------------------------------------------------------------------------------
+#   Generator for synthetic sokol-style headers, for scaling tests of gen_ir
+#   and the bindings generators beyond the ~300 decls of sokol_gfx.h.
+#
+#   A synthetic module has handle structs, enums (with the usual _DEFAULT,
+#   _NUM and _FORCE_U32 items), anonymous enum consts, desc structs with
+#   nested struct fields, 1D and 2D array fields, function pointer fields,
+#   fields using the types of dependency modules, and API functions taking
+#   and returning those structs. Write a header (and its dependency headers)
+#   into a directory:
+#
+#       python3 benchmarks/synth_header.py [out_dir] [num_decls] [num_deps]
+#
+#   Used by benchmarks/scaling.py.
+# -------------------------------------------------------------------------------
+import os, random, sys
+
+
+class SynthConfig:
+    def __init__(self, num_structs=100, num_enums=20, num_funcs=150, num_consts=8, array_ratio=0.2, funcptr_ratio=0.05, nested_ratio=0.2, seed=1):
+        self.num_structs = num_structs
+        self.num_enums = num_enums
+        self.num_funcs = num_funcs
+        self.num_consts = num_consts
+        # the fraction of struct fields which are arrays, function pointers or nested structs
+        self.array_ratio = array_ratio
+        self.funcptr_ratio = funcptr_ratio
+        self.nested_ratio = nested_ratio
+        self.seed = seed
+
+    # a config with roughly num_decls decls, in the proportions of sokol_gfx.h
+    @staticmethod
+    def with_num_decls(num_decls, seed=1):
+        return SynthConfig(
+            num_structs=max(1, num_decls * 40 // 100),
+            num_enums=max(1, num_decls * 10 // 100),
+            num_funcs=max(1, num_decls * 48 // 100),
+            num_consts=max(1, num_decls * 2 // 100),
+            seed=seed,
+        )
+
+    @property
+    def num_decls(self):
+        return self.num_structs + self.num_enums + self.num_funcs + 1
+
+
+prim_field_types = ["int", "bool", "float", "uint8_t", "uint16_t", "uint32_t", "uint64_t", "size_t", "const char*", "const void*"]
+funcptr_types = [
+    "void (*{name})(void* user_data)",
+    "void (*{name})(const char* tag, uint32_t log_level, uint32_t log_item_id, const char* message, uint32_t line, const char* filename, void* user_data)",
+    "void* (*{name})(size_t size, void* user_data)",
+    "void (*{name})(void* ptr, void* user_data)",
+]
+
+
+# prefix 'sx_' => API declaration macro 'SOKOL_SX_API_DECL'
+def api_decl_macro(prefix):
+    return f"SOKOL_{prefix[:-1].upper()}_API_DECL"
+
+
+# the types a module exports to depending modules
+class SynthModule:
+    def __init__(self, name, prefix, config, deps=()):
+        self.name = name
+        self.prefix = prefix
+        self.config = config
+        self.deps = list(deps)
+        self.rnd = random.Random(f"{config.seed}:{prefix}")
+        self.enum_names = [f"{prefix}enum{i}" for i in range(config.num_enums)]
+        self.struct_names = [f"{prefix}struct{i}" for i in range(config.num_structs)]
+        self.dep_struct_names = [name for dep in self.deps for name in dep.struct_names]
+
+    @property
+    def header_name(self):
+        return f"sokol_{self.name}.h"
+
+    def gen_consts(self, lines):
+        lines.append("enum {")
+        for i in range(self.config.num_consts):
+            lines.append(f"    {self.prefix.upper()}MAX_ITEMS{i} = {self.rnd.randint(1, 16)},")
+        lines.append("};")
+        lines.append("")
+
+    def gen_enum(self, lines, enum_name):
+        upper = enum_name.upper()
+        lines.append(f"typedef enum {enum_name} {{")
+        lines.append(f"    _{upper}_DEFAULT,")
+        for i in range(self.rnd.randint(2, 12)):
+            lines.append(f"    {upper}_ITEM{i},")
+        lines.append(f"    _{upper}_NUM,")
+        lines.append(f"    _{upper}_FORCE_U32 = 0x7FFFFFFF")
+        lines.append(f"}} {enum_name};")
+        lines.append("")
+
+    # the non-array types which a field of struct number struct_index can use,
+    # nested structs must be declared before
+    def field_type(self, struct_index):
+        r = self.rnd.random()
+        if r < self.config.nested_ratio:
+            candidates = self.struct_names[:struct_index] + self.dep_struct_names
+            if candidates:
+                return self.rnd.choice(candidates)
+        elif r < self.config.nested_ratio + 0.1:
+            candidates = self.enum_names + [name for dep in self.deps for name in dep.enum_names]
+            if candidates:
+                return self.rnd.choice(candidates)
+        return self.rnd.choice(prim_field_types)
+
+    def gen_struct(self, lines, struct_index):
+        struct_name = self.struct_names[struct_index]
+        lines.append(f"typedef struct {struct_name} {{")
+        if struct_index % 10 == 0:
+            lines.append("    uint32_t _start_canary;")
+        for i in range(self.rnd.randint(1, 12)):
+            r = self.rnd.random()
+            if r < self.config.funcptr_ratio:
+                lines.append(f"    {self.rnd.choice(funcptr_types).format(name=f'func{i}')};")
+                continue
+            field_type = self.field_type(struct_index)
+            if r < self.config.funcptr_ratio + self.config.array_ratio:
+                # only the array element types which also appear in the sokol headers
+                if field_type not in self.struct_names and field_type not in self.dep_struct_names:
+                    field_type = self.rnd.choice(["int", "uint32_t", "float", "const void*"])
+                if self.rnd.random() < 0.25 and field_type not in ["int", "uint32_t", "const void*"]:
+                    lines.append(f"    {field_type} field{i}[{self.rnd.randint(2, 8)}][{self.rnd.randint(2, 16)}];")
+                else:
+                    lines.append(f"    {field_type} field{i}[{self.rnd.randint(2, 16)}];")
+            else:
+                lines.append(f"    {field_type} field{i};")
+        if struct_index % 10 == 0:
+            lines.append("    uint32_t _end_canary;")
+        lines.append(f"}} {struct_name};")
+        lines.append("")
+
+    def gen_func(self, lines, func_index):
+        api = api_decl_macro(self.prefix)
+        struct_name = self.rnd.choice(self.struct_names)
+        kind = func_index % 4
+        if kind == 0:
+            lines.append(f"{api} void {self.prefix}func{func_index}(const {struct_name}* desc);")
+        elif kind == 1:
+            lines.append(f"{api} {struct_name} {self.prefix}func{func_index}(int index, float value);")
+        elif kind == 2:
+            enum_name = self.rnd.choice(self.enum_names)
+            lines.append(f"{api} bool {self.prefix}func{func_index}({enum_name} kind, const char* label, uint32_t count);")
+        else:
+            lines.append(f"{api} void {self.prefix}func{func_index}({struct_name} value, const void* ptr, size_t size);")
+
+    def gen_header(self):
+        guard = f"SOKOL_{self.name.upper()}_INCLUDED"
+        api = api_decl_macro(self.prefix)
+        lines = [
+            f"#if defined(SOKOL_IMPL) && !defined(SOKOL_{self.name.upper()}_IMPL)",
+            f"#define SOKOL_{self.name.upper()}_IMPL",
+            "#endif",
+            f"#ifndef {guard}",
+            f"/* machine generated synthetic sokol-style header, see bindgen/benchmarks/synth_header.py */",
+            f"#define {guard} (1)",
+            "#include <stddef.h>",
+            "#include <stdint.h>",
+            "#include <stdbool.h>",
+            "",
+        ]
+        for dep in self.deps:
+            lines.append(f"#if !defined({'SOKOL_' + dep.name.upper() + '_INCLUDED'})")
+            lines.append(f'#error "Please include {dep.header_name} before {self.header_name}"')
+            lines.append("#endif")
+        lines += [
+            f"#ifndef {api}",
+            f"#define {api} extern",
+            "#endif",
+            "",
+            "#ifdef __cplusplus",
+            'extern "C" {',
+            "#endif",
+            "",
+        ]
+        self.gen_consts(lines)
+        for enum_name in self.enum_names:
+            self.gen_enum(lines, enum_name)
+        for i in range(len(self.struct_names)):
+            self.gen_struct(lines, i)
+        for i in range(self.config.num_funcs):
+            self.gen_func(lines, i)
+        lines += [
+            "",
+            "#ifdef __cplusplus",
+            '} /* extern "C" */',
+            "#endif",
+            f"#endif /* {guard} */",
+            "",
+        ]
+        return "\n".join(lines)
+
+
+# the main module 'synth' with prefix 'sx_' and num_deps dependency modules
+# 'synth_dep0', 'synth_dep1'... with prefixes 'sx0_', 'sx1_'..., a quarter
+# of the main module's size each
+def synth_modules(num_decls, num_deps=1, seed=1):
+    deps = []
+    for i in range(num_deps):
+        deps.append(SynthModule(f"synth_dep{i}", f"sx{i}_", SynthConfig.with_num_decls(max(4, num_decls // 4), seed), deps=list(deps)))
+    main = SynthModule("synth", "sx_", SynthConfig.with_num_decls(num_decls, seed), deps=deps)
+    return main, deps
+
+
+# write the header files of a module and its dependencies into out_dir,
+# returns the main header path
+def write_headers(out_dir, main, deps):
+    os.makedirs(out_dir, exist_ok=True)
+    for module in [*deps, main]:
+        with open(os.path.join(out_dir, module.header_name), "w", newline="\n") as f:
+            f.write(module.gen_header())
+    return os.path.join(out_dir, main.header_name)
+
+
+if __name__ == "__main__":
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else "synth"
+    num_decls = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    num_deps = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    main, deps = synth_modules(num_decls, num_deps)
+    print(f"  {write_headers(out_dir, main, deps)} ({main.config.num_decls} decls, {len(deps)} dependency modules)")
@@ -0,0 +1,85 @@
+# -------------------------------------------------------------------------------
+#   Compile-time benchmark for the array field defaults in the generated Zig
+#   bindings: `[_]T{.{}} ** N` expressions vs std.mem.zeroes().
+#
+#   Generates gfx.zig from the IR fixture in tests/fixtures once with each
+#   strategy, together with a small consumer which default-initializes every
+#   struct, and measures `zig build-obj -fno-emit-bin` (semantic analysis
+#   only, no codegen). Run from the bindgen directory:
+#
+#       python3 benchmarks/zig_array_defaults.py [path/to/zig] [runs]
+#
+#   Note that Zig versions which removed the `**` operator can only compile
+#   the std.mem.zeroes() variant.
+# -------------------------------------------------------------------------------
+import json, os, shutil, subprocess, sys, tempfile, time
+
+bench_dir = os.path.dirname(os.path.abspath(__file__))
+bindgen_dir = os.path.dirname(bench_dir)
+fixtures_dir = f"{bindgen_dir}/tests/fixtures"
+
+sys.path.insert(0, bindgen_dir)
+import gen_zig
+
+
+def gen_gfx_zig(ir, zeroes_array_defaults):
+    gen_zig.zeroes_array_defaults = zeroes_array_defaults
+    gen_zig.reset_globals()
+    gen_zig.gen_module(ir, ir["dep_prefixes"])
+    return gen_zig.out_lines
+
+
+# a consumer which forces the comptime evaluation of all struct defaults
+def gen_consumer(ir):
+    lines = ['const sg = @import("gfx.zig");', "export fn bench() void {"]
+    for decl in ir["decls"]:
+        if decl["kind"] == "struct" and not gen_zig.check_ignore(decl["name"]):
+            zig_type = gen_zig.as_zig_struct_type(gen_zig.check_override(decl["name"]), ir["prefix"])
+            lines.append(f"    var {decl['name']}: sg.{zig_type} = .{{}};")
+            lines.append(f"    _ = &{decl['name']};")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def measure(zig, workdir, runs):
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        res = subprocess.run(
+            [zig, "build-obj", "-fno-emit-bin", "--cache-dir", f"{workdir}/cache", "--global-cache-dir", f"{workdir}/cache", "bench.zig"],
+            cwd=workdir,
+            capture_output=True,
+            text=True,
+        )
+        times.append(time.perf_counter() - t0)
+        if res.returncode != 0:
+            return None, res.stderr.strip().splitlines()[0]
+        # discard the cache so that every run starts from scratch
+        shutil.rmtree(f"{workdir}/cache", ignore_errors=True)
+    return min(times), None
+
+
+def main():
+    zig = sys.argv[1] if len(sys.argv) > 1 else "zig"
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    with open(f"{fixtures_dir}/gfx.json", "r") as f:
+        ir = json.load(f)
+    ir["module"] = gen_zig.module_names[ir["prefix"]]
+    print(f"=== Zig array defaults, gfx.zig, best of {runs} runs:")
+    for zeroes in [False, True]:
+        with tempfile.TemporaryDirectory() as workdir:
+            with open(f"{workdir}/gfx.zig", "w", newline="\n") as f:
+                f.write(gen_gfx_zig(ir, zeroes))
+            with open(f"{workdir}/bench.zig", "w", newline="\n") as f:
+                f.write(gen_consumer(ir))
+            secs, err = measure(zig, workdir, runs)
+        name = "std.mem.zeroes()" if zeroes else "[_]T{...} ** N"
+        if err is None:
+            print(f"  {name:<20} {secs * 1000:8.1f} ms")
+        else:
+            print(f"  {name:<20} failed: {err}")
+    gen_zig.zeroes_array_defaults = True
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-import os, gen_nim, gen_zig, gen_odin, gen_rust, gen_d, gen_jai, gen_v
+import os, gen_nim, gen_zig, gen_odin, gen_rust, gen_d, gen_jai, gen_v, gen_python, gen_util, gen_validate
 
 tasks = [
     ["../sokol_log.h", "slog_", []],
@@ -65,3 +65,20 @@ for task in v_tasks:
 # for task in tasks:
 #     [c_header_path, main_prefix, dep_prefixes] = task
 #     gen_rust.gen(c_header_path, main_prefix, dep_prefixes)
+
+# Python (sokol_imgui.h isn't included since it needs the cimgui headers
+# and library, build the shared library with sokol-python/build.py)
+# python_tasks = [
+#     *tasks,
+#     ["../sokol_fetch.h", "sfetch_", []],
+# ]
+# gen_python.prepare()
+# for task in python_tasks:
+#     [c_header_path, main_prefix, dep_prefixes] = task
+#     gen_python.gen(c_header_path, main_prefix, dep_prefixes)
+
+gen_util.print_vendor_summary()
+
+# optional validation of the generated files with the target toolchains
+if gen_validate.enabled:
+    gen_validate.validate(gen_util.generated_files)
@@ -8,7 +8,6 @@
 #-------------------------------------------------------------------------------
 import gen_ir
 import os
-import shutil
 import sys
 
 import gen_util as util
@@ -253,7 +252,8 @@ def as_d_arg_type(arg_prefix, arg_type, prefix):
     elif is_struct_ptr(arg_type):
         return f"scope ref {as_d_struct_type(util.extract_ptr_type(arg_type), prefix)}" + pre
     elif is_const_struct_ptr(arg_type):
-        return f"scope ref {as_d_struct_type(util.extract_ptr_type(arg_type), prefix)}" + pre
+        # passed by reference without copying, const also accepts const and immutable structs
+        return f"scope ref const({as_d_struct_type(util.extract_ptr_type(arg_type), prefix)})" + pre
     elif is_prim_ptr(arg_type):
         return f"scope {as_d_prim_type(util.extract_ptr_type(arg_type))} *" + pre
     elif is_const_prim_ptr(arg_type):
@@ -415,8 +415,20 @@ def gen_enum(decl, prefix):
                 l(f"    {item_name},")
     l("}")
 
+# true if the D wrapper would have exactly the same signature as the extern(C) function,
+# this is only the case for functions without pointer args or results
+def is_abi_identical(decl, prefix):
+    func_name = decl['name']
+    for param_decl in decl['params']:
+        param_type = check_override(f"{func_name}.{param_decl['name']}", default=param_decl['type'])
+        if as_c_arg_type(param_type, prefix) != as_d_arg_type('', param_type, prefix):
+            return False
+    return funcdecl_result_c(decl, prefix) == funcdecl_result_d(decl, prefix)
+
 def gen_func_c(decl, prefix):
-    l(f"extern(C) {funcdecl_result_c(decl, prefix)} {decl['name']}({funcdecl_args_c(decl, prefix)}) @system @nogc nothrow;")
+    # functions without pointers in their signature can be safely called from @safe code
+    attr = "@trusted" if is_abi_identical(decl, prefix) else "@system"
+    l(f"extern(C) {funcdecl_result_c(decl, prefix)} {decl['name']}({funcdecl_args_c(decl, prefix)}) {attr} @nogc nothrow;")
 
 def gen_func_d(decl, prefix):
     c_func_name = decl['name']
@@ -424,6 +436,9 @@ def gen_func_d(decl, prefix):
     if c_func_name in c_callbacks:
         # a simple forwarded C callback function
         l(f"alias {d_func_name} = {c_func_name};")
+    elif is_abi_identical(decl, prefix):
+        # no argument conversion needed, alias the extern(C) function instead of wrapping it
+        l(f"alias {d_func_name} = {c_func_name};")
     else:
         d_res_type = funcdecl_result_d(decl, prefix)
         l(f"{d_res_type} {d_func_name}({funcdecl_args_d(decl, prefix)}) @trusted @nogc nothrow {{")
@@ -468,26 +483,128 @@ def gen_imports(inp, dep_prefixes):
         l(f'import {dep_prefix[:-1]} = sokol.{dep_module_name};')
     l('')
 
+def gen_helpers(inp):
+    if util.range_struct_name(inp) is not None:
+        gen_range_helpers(inp)
+    if inp['prefix'] == 'sg_':
+        gen_frame_stats_helpers(inp)
+
+# non-copying conversions of slices, fixed-size arrays and single values
+# into the module's Range struct, the attributes of the template functions'
+# parameters are inferred so that -preview=dip1000 catches escaping ranges
+def gen_range_helpers(inp):
+    range_type = as_d_struct_type(util.range_struct_name(inp), inp['prefix'])
+    l(f'/// a {range_type} pointing into a slice or fixed-size array (e.g. `sliceAsRange(vertices[])`), without copying')
+    l(f'{range_type} sliceAsRange(T)(const(T)[] data) @trusted @nogc nothrow pure {{')
+    l(f'    return {range_type}(data.ptr, data.length * T.sizeof);')
+    l('}')
+    l(f'/// a {range_type} pointing to a single value, without copying')
+    l(f'{range_type} valueAsRange(T)(ref const(T) value) @trusted @nogc nothrow pure if (!is(T == U[], U)) {{')
+    l(f'    return {range_type}(&value, T.sizeof);')
+    l('}')
+    l('')
+
+# a flat array view of FrameStats and a ring buffer collector with rolling
+# averages and percentiles over the last N frames, without allocations
+def gen_frame_stats_helpers(inp):
+    values = util.frame_stats_values(inp)
+    l('/// number of values in a flattened FrameStats struct')
+    l(f'enum frameStatsNumValues = {len(values)};')
+    l('/// names of the values in a flattened FrameStats struct')
+    l('immutable string[frameStatsNumValues] frameStatsNames = [')
+    for name, _ in values:
+        l(f'    "{name}",')
+    l('];')
+    l('/// flat array view of a FrameStats struct, for instance for exporting')
+    l('uint[frameStatsNumValues] frameStatsFlatten(in FrameStats stats) @safe @nogc nothrow pure {')
+    l('    return [')
+    for _, path in values:
+        l(f"        stats.{'.'.join([check_override(field['name']) for field in path])},")
+    l('    ];')
+    l('}')
+    l('/// records the flattened frame stats of the last numFrames frames,')
+    l('/// call push(queryFrameStats()) once per frame (the `in` parameters also')
+    l('/// accept rvalues, and are passed by reference with -preview=in)')
+    l('struct FrameStatsCollector(size_t numFrames) {')
+    l('    private uint[frameStatsNumValues][numFrames] frames;')
+    l('    private size_t num = 0;')
+    l('    private size_t pos = 0;')
+    l('')
+    l('    void push(in FrameStats stats) @safe @nogc nothrow {')
+    l('        frames[pos] = frameStatsFlatten(stats);')
+    l('        pos = (pos + 1) % numFrames;')
+    l('        if (num < numFrames) {')
+    l('            num++;')
+    l('        }')
+    l('    }')
+    l('    /// number of recorded frames')
+    l('    size_t length() const @safe @nogc nothrow {')
+    l('        return num;')
+    l('    }')
+    l('    /// the most recently pushed frame stats, length() must be > 0')
+    l('    uint[frameStatsNumValues] latest() const @safe @nogc nothrow {')
+    l('        assert(num > 0);')
+    l('        return frames[(pos + numFrames - 1) % numFrames];')
+    l('    }')
+    l('    /// average of a value over the recorded frames')
+    l('    double average(size_t valueIndex) const @safe @nogc nothrow {')
+    l('        if (num == 0) {')
+    l('            return 0.0;')
+    l('        }')
+    l('        ulong sum = 0;')
+    l('        foreach (i; 0 .. num) {')
+    l('            sum += frames[i][valueIndex];')
+    l('        }')
+    l('        return cast(double) sum / num;')
+    l('    }')
+    l('    /// nearest-rank percentile (0..100) of a value over the recorded frames')
+    l('    uint percentile(size_t valueIndex, uint p) const @safe @nogc nothrow {')
+    l('        if (num == 0) {')
+    l('            return 0;')
+    l('        }')
+    l('        // insertion sort into a stack buffer, numFrames is small')
+    l('        uint[numFrames] values;')
+    l('        foreach (i; 0 .. num) {')
+    l('            const uint value = frames[i][valueIndex];')
+    l('            size_t j = i;')
+    l('            for (; j > 0 && values[j - 1] > value; j--) {')
+    l('                values[j] = values[j - 1];')
+    l('            }')
+    l('            values[j] = value;')
+    l('        }')
+    l('        const size_t rank = ((p < 100 ? p : 100) * num + 99) / 100;')
+    l('        return values[rank > 0 ? rank - 1 : 0];')
+    l('    }')
+    l('}')
+    l('')
+
+# the code for a single decl of the module, emitted through the fragment cache
+def gen_decl(decl, prefix):
+    kind = decl['kind']
+    if kind == 'consts':
+        gen_consts(decl, prefix)
+    elif not check_ignore(decl['name']):
+        if kind == 'struct':
+            gen_struct(decl, prefix)
+        elif kind == 'enum':
+            gen_enum(decl, prefix)
+        elif kind == 'func':
+            gen_func_c(decl, prefix)
+            gen_func_d(decl, prefix)
+
 def gen_module(inp, dep_prefixes):
     l('// machine generated, do not edit')
     l('')
     l(f'module sokol.{inp["module"]};')
     gen_imports(inp, dep_prefixes)
+    gen_helpers(inp)
     pre_parse(inp)
     prefix = inp['prefix']
+    fragment_cache = util.FragmentCache(sys.modules[__name__], inp, [ignores, overrides])
     for decl in inp['decls']:
         if not decl['is_dep']:
-            kind = decl['kind']
-            if kind == 'consts':
-                gen_consts(decl, prefix)
-            elif not check_ignore(decl['name']):
-                if kind == 'struct':
-                    gen_struct(decl, prefix)
-                elif kind == 'enum':
-                    gen_enum(decl, prefix)
-                elif kind == 'func':
-                    gen_func_c(decl, prefix)
-                    gen_func_d(decl, prefix)
+            fragment_cache.emit(decl, lambda: gen_decl(decl, prefix))
+    fragment_cache.save()
 
 def prepare():
     print('=== Generating d bindings:')
@@ -496,6 +613,10 @@ def prepare():
     if not os.path.isdir('sokol-d/src/sokol/c'):
         os.makedirs('sokol-d/src/sokol/c')
 
+# the path of the generated bindings file for a C prefix
+def get_output_path(c_prefix):
+    return f'sokol-d/src/sokol/{module_names[c_prefix]}.d'
+
 def gen(c_header_path, c_prefix, dep_c_prefixes):
     if not c_prefix in module_names:
         print(f' >> warning: skipping generation for {c_prefix} prefix...')
@@ -504,9 +625,10 @@ def gen(c_header_path, c_prefix, dep_c_prefixes):
     c_source_path = c_source_paths[c_prefix]
     print(f'  {c_header_path} => {module_name}')
     reset_globals()
-    shutil.copyfile(c_header_path, f'sokol-d/src/sokol/c/{os.path.basename(c_header_path)}')
+    util.vendor_file(c_header_path, f'sokol-d/src/sokol/c/{os.path.basename(c_header_path)}')
     ir = gen_ir.gen(c_header_path, c_source_path, module_name, c_prefix, dep_c_prefixes)
     gen_module(ir, dep_c_prefixes)
-    output_path = f"sokol-d/src/sokol/{ir['module']}.d"
+    output_path = get_output_path(c_prefix)
     with open(output_path, 'w', newline='\n') as f_outp:
         f_outp.write(out_lines)
+    util.generated_files[output_path] = 'd'
@@ -1,7 +1,55 @@
 # -------------------------------------------------------------------------------
 #   Generate an intermediate representation of a clang AST dump.
 # -------------------------------------------------------------------------------
-import json, sys, subprocess
+import bisect, difflib, itertools, json, mmap, os, re, sys, subprocess, tempfile, textwrap, time
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+
+# if enabled, clang writes the AST dump into an anonymous temp file which is
+# then memory-mapped and decoded from the mapping, instead of being read
+# through a pipe into a Python bytes object. The JSON decoder still needs the
+# whole dump as one str, but the bytes copy is avoided (lower peak memory when
+# several dumps run at once)
+mmap_ast_dump = os.environ.get("SOKOL_BINDGEN_MMAP_AST_DUMP", "0") == "1"
+
+# the clang executable, can be overridden with SOKOL_BINDGEN_CLANG
+clang_exe = os.environ.get(
+    "SOKOL_BINDGEN_CLANG", r"C:\Users\phcre\Downloads\clang-18.1.8-windows-amd64-msvc17-libcmt\bin\clang.exe"
+)
+
+# if enabled, clang only parses a synthesized translation unit which includes
+# the declaration part of the module's header and its dependency headers (no
+# SOKOL_IMPL, no platform headers, -fsyntax-only) instead of the bindings'
+# C source files which also compile the implementation
+decl_only_parse = os.environ.get("SOKOL_BINDGEN_DECL_ONLY", "0") == "1"
+
+# if enabled, the declaration-only parse is checked against a full parse of
+# the bindings' C source file, and generation stops if the IRs differ
+verify_decl_only_parse = os.environ.get("SOKOL_BINDGEN_VERIFY_DECL_ONLY", "0") == "1"
+
+# if enabled, the doc comments of the decls are extracted from the header text
+# and added to the IR as 'comment' (on decls, struct fields and enum items)
+doc_comments = os.environ.get("SOKOL_BINDGEN_DOC_COMMENTS", "1") == "1"
+
+# if enabled, the struct sizes, alignments and field offsets are evaluated in
+# one extra clang run and added to the IR (see add_layouts())
+struct_layouts = os.environ.get("SOKOL_BINDGEN_STRUCT_LAYOUTS", "0") == "1"
+
+# API prefix => header path relative to the sokol root directory, used to
+# resolve the dependency headers of a declaration-only parse
+api_headers = {
+    "slog_": "sokol_log.h",
+    "sg_": "sokol_gfx.h",
+    "sapp_": "sokol_app.h",
+    "sglue_": "sokol_glue.h",
+    "stm_": "sokol_time.h",
+    "saudio_": "sokol_audio.h",
+    "sfetch_": "sokol_fetch.h",
+    "sgl_": "util/sokol_gl.h",
+    "sdtx_": "util/sokol_debugtext.h",
+    "sshape_": "util/sokol_shape.h",
+    "simgui_": "util/sokol_imgui.h",
+}
 
 
 def is_api_decl(decl, prefix):
@@ -121,20 +169,63 @@ def parse_decl(decl):
         return None
 
 
-def clang(csrc_path):
+def clang_cmd(csrc_path):
     cmd = [
-        r"C:\Users\phcre\Downloads\clang-18.1.8-windows-amd64-msvc17-libcmt\bin\clang.exe",
+        clang_exe,
         "-Xclang",
         "-ast-dump=json",
-        "-c",
     ]
-    cmd.append(csrc_path)
-    return subprocess.check_output(cmd)
+    if csrc_path is None:
+        # a declaration-only source from stdin, only run the frontend
+        cmd.extend(["-fsyntax-only", "-x", "c", "-"])
+    else:
+        cmd.extend(["-c", csrc_path])
+    return cmd
 
 
-def gen(header_path, source_path, module, main_prefix, dep_prefixes):
-    ast = clang(source_path)
-    inp = json.loads(ast)
+def clang(csrc_path, src=None):
+    return subprocess.check_output(clang_cmd(csrc_path), input=src)
+
+
+# run clang with stdout redirected into a temp file, and decode the
+# memory-mapped file into the JSON tree. The decoded str is the only full
+# copy of the dump (json.loads() on bytes would decode into a str as well)
+def clang_mmap(csrc_path, src=None):
+    with tempfile.TemporaryFile() as f:
+        subprocess.run(clang_cmd(csrc_path), input=src, stdout=f, check=True)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return json.loads(str(m, "utf-8"))
+
+
+# csrc_path is None for a declaration-only parse of the source code in src
+def load_ast(csrc_path, src=None):
+    if mmap_ast_dump:
+        return clang_mmap(csrc_path, src)
+    else:
+        return json.loads(clang(csrc_path, src))
+
+
+# resolve the header of a dependency prefix relative to the module's header
+def dep_header_path(header_path, main_prefix, prefix):
+    if main_prefix not in api_headers or prefix not in api_headers:
+        sys.exit(f"ERROR: no header known for prefix {prefix}, add it to gen_ir.api_headers")
+    main_dir = os.path.dirname(api_headers[main_prefix]) or "."
+    rel_path = os.path.relpath(api_headers[prefix], main_dir)
+    return os.path.normpath(os.path.join(os.path.dirname(header_path), rel_path))
+
+
+# a translation unit which only includes the declaration part of the
+# dependency headers and the module's header
+def decl_only_source(header_path, main_prefix, dep_prefixes):
+    paths = [dep_header_path(header_path, main_prefix, prefix) for prefix in dep_prefixes]
+    paths.append(header_path)
+    lines = [f'#include "{os.path.abspath(path).replace(os.sep, "/")}"' for path in paths]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+# headers is an optional dict of API prefix => HeaderText to take the doc
+# comments from
+def parse_ast(inp, module, main_prefix, dep_prefixes, headers=None):
     outp = {}
     outp["module"] = module
     outp["prefix"] = main_prefix
@@ -147,7 +238,485 @@ def gen(header_path, source_path, module, main_prefix, dep_prefixes):
             if outp_decl is not None:
                 outp_decl["is_dep"] = is_dep
                 outp_decl["dep_prefix"] = dep_prefix(decl, dep_prefixes)
+                if headers is not None:
+                    add_comments(outp_decl, decl, headers[outp_decl["dep_prefix"] or main_prefix])
                 outp["decls"].append(outp_decl)
+    return outp
+
+
+# doc comments are taken from the header text instead of the AST dump (with
+# -fparse-all-comments clang would add comment nodes for the system headers
+# too), the source offset of a decl in the AST dump is mapped to its line
+# through a line-offset index of the header: the comment block right above
+# the first line of a decl is the decl's comment, a '//' comment behind a
+# struct field or enum item on the same line is the field's or item's comment
+class HeaderText:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.text = f.read()
+        self.line_offsets = list(itertools.accumulate(map(len, self.text.splitlines(keepends=True)), initial=0))
+
+    def line_index(self, offset):
+        return bisect.bisect_right(self.line_offsets, offset) - 1
+
+    def line(self, line_index):
+        line = self.text[self.line_offsets[line_index] : self.line_offsets[line_index + 1]]
+        return line.decode("utf-8", errors="replace").rstrip()
+
+    # the offset of an AST source location, if it's located in this header
+    # (checked by the token at the offset, the AST dump omits unchanged
+    # file names), otherwise None
+    def offset(self, loc, token):
+        offset = loc.get("expansionLoc", loc).get("offset")
+        if offset is None or not self.text.startswith(token.encode("utf-8"), offset):
+            return None
+        return offset
+
+    def leading_comment(self, line_index):
+        end = line_index - 1
+        if end < 0:
+            return None
+        last = self.line(end).strip()
+        if last.startswith("//"):
+            start = end
+            while start > 0 and self.line(start - 1).strip().startswith("//"):
+                start -= 1
+            lines = [self.line(i).strip()[2:].lstrip("/") for i in range(start, end + 1)]
+        elif last.endswith("*/"):
+            start = end
+            while start > 0 and "/*" not in self.line(start):
+                start -= 1
+            if not self.line(start).strip().startswith("/*"):
+                return None
+            lines = [self.line(i) for i in range(start, end + 1)]
+            lines[-1] = lines[-1][: lines[-1].rfind("*/")]
+            lines[0] = lines[0][lines[0].find("/*") + 2 :]
+        else:
+            return None
+        return clean_comment(lines)
+
+    # true if the line after a decl is another decl, a comment above the decl
+    # then describes a whole group of decls, e.g.:
+    #
+    #   // resource creation, destruction and updating
+    #   SOKOL_GFX_API_DECL sg_buffer sg_make_buffer(const sg_buffer_desc* desc);
+    #   SOKOL_GFX_API_DECL sg_image sg_make_image(const sg_image_desc* desc);
+    def is_followed_by_decl(self, end_offset):
+        line_index = self.line_index(end_offset) + 1
+        if line_index + 1 >= len(self.line_offsets):
+            return False
+        line = self.line(line_index).strip()
+        return line != "" and not line.startswith(("//", "/*", "#", "}"))
+
+    def trailing_comment(self, offset):
+        line_index = self.line_index(offset)
+        line = self.text[offset : self.line_offsets[line_index + 1]].decode("utf-8", errors="replace")
+        pos = line.find("//")
+        if pos == -1:
+            return None
+        return clean_comment([line[pos + 2 :].lstrip("/")])
+
+
+# a banner line of a section comment, e.g. '=== resources ===' or '------'
+re_banner_line = re.compile(r"^\s*([-=*#~])\1{2,}")
+
+
+# dedent the comment lines, and join them without the surrounding empty
+# lines, banner comments of sections are not doc comments
+def clean_comment(lines):
+    lines = textwrap.dedent("\n".join(line.rstrip() for line in lines)).split("\n")
+    while lines and not lines[0].strip():
+        lines.pop(0)
+    while lines and not lines[-1].strip():
+        lines.pop()
+    if not lines or any(re_banner_line.match(line) for line in lines):
+        return None
+    return "\n".join(lines)
+
+
+def header_texts(header_path, main_prefix, dep_prefixes):
+    headers = {main_prefix: HeaderText(header_path)}
+    for prefix in dep_prefixes:
+        headers[prefix] = HeaderText(dep_header_path(header_path, main_prefix, prefix))
+    return headers
+
+
+def add_comments(outp_decl, decl, header):
+    token = decl["name"] if "name" in decl else "enum"
+    if header.offset(decl["loc"], token) is None:
+        return
+    begin = header.offset(decl["range"]["begin"], "")
+    end = header.offset(decl["range"]["end"], "")
+    comment = header.leading_comment(header.line_index(begin))
+    if comment is not None and (end is None or not header.is_followed_by_decl(end)):
+        outp_decl["comment"] = comment
+    if outp_decl["kind"] == "struct":
+        items, item_decls = outp_decl["fields"], [d for d in decl["inner"] if d["kind"] == "FieldDecl"]
+    elif outp_decl["kind"] in ["enum", "consts"]:
+        items, item_decls = outp_decl["items"], [d for d in decl["inner"] if d["kind"] == "EnumConstantDecl"]
+    else:
+        return
+    for item, item_decl in zip(items, item_decls):
+        if "name" in item_decl:
+            offset = header.offset(item_decl["loc"], item_decl["name"])
+            comment = None if offset is None else header.trailing_comment(offset)
+            if comment is not None:
+                item["comment"] = comment
+
+
+# struct sizes, alignments and field offsets are not part of the AST dump,
+# instead they are evaluated by clang as the values of an anonymous enum in
+# one extra declaration-only parse
+layout_item_prefix = "_bindgen_layout_"
+
+
+def layout_source(header_path, main_prefix, dep_prefixes, struct_decls):
+    lines = [
+        decl_only_source(header_path, main_prefix, dep_prefixes).decode("utf-8"),
+        "#include <stddef.h>",
+        "enum {",
+        f"    {layout_item_prefix}_pointer_size = (int)sizeof(void*),",
+    ]
+    for decl in struct_decls:
+        name = decl["name"]
+        lines.append(f"    {layout_item_prefix}{name}__size = (int)sizeof({name}),")
+        lines.append(f"    {layout_item_prefix}{name}__align = (int)_Alignof({name}),")
+        for field in decl["fields"]:
+            if "name" in field:
+                lines.append(
+                    f"    {layout_item_prefix}{name}__offset__{field['name']} = (int)offsetof({name}, {field['name']}),"
+                )
+    lines.append("};")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+# add 'size' and 'align' to all struct decls, 'offset' to all struct fields,
+# and the target's 'pointer_size' to the IR
+def add_layouts(outp, header_path, main_prefix, dep_prefixes):
+    struct_decls = [decl for decl in outp["decls"] if decl["kind"] == "struct"]
+    src = layout_source(header_path, main_prefix, dep_prefixes, struct_decls)
+    values = {}
+    for decl in load_ast(None, src)["inner"]:
+        if decl["kind"] == "EnumDecl" and "name" not in decl:
+            for item in decl["inner"]:
+                if item["name"].startswith(layout_item_prefix):
+                    values[item["name"][len(layout_item_prefix) :]] = int(item["inner"][0]["value"])
+    outp["pointer_size"] = values["_pointer_size"]
+    for decl in struct_decls:
+        name = decl["name"]
+        decl["size"] = values[f"{name}__size"]
+        decl["align"] = values[f"{name}__align"]
+        for field in decl["fields"]:
+            if "name" in field:
+                field["offset"] = values[f"{name}__offset__{field['name']}"]
+
+
+# the IR with the dependency decls grouped by prefix, the bindings' C sources
+# may include the dependency headers in a different order
+def canonical_ir(outp):
+    order = [None, *outp["dep_prefixes"]]
+    return {**outp, "decls": sorted(outp["decls"], key=lambda decl: order.index(decl["dep_prefix"]))}
+
+
+# parse the declaration-only source and the bindings' C source, and check
+# that both result in the same IR
+def verify_decl_only(header_path, source_path, module, main_prefix, dep_prefixes, headers=None):
+    t0 = time.perf_counter()
+    src = decl_only_source(header_path, main_prefix, dep_prefixes)
+    outp = parse_ast(load_ast(None, src), module, main_prefix, dep_prefixes, headers)
+    t1 = time.perf_counter()
+    full_outp = parse_ast(load_ast(source_path), module, main_prefix, dep_prefixes, headers)
+    t2 = time.perf_counter()
+    if canonical_ir(outp) != canonical_ir(full_outp):
+        diff = difflib.unified_diff(
+            json.dumps(canonical_ir(full_outp), indent=2).splitlines(),
+            json.dumps(canonical_ir(outp), indent=2).splitlines(),
+            fromfile=f"{source_path} (full parse)",
+            tofile=f"{header_path} (declaration-only parse)",
+            lineterm="",
+        )
+        print("\n".join(list(diff)[:50]))
+        sys.exit(f"ERROR: declaration-only IR of {module} differs from full parse")
+    print(f"  >> verified declaration-only IR of {module} ({t1 - t0:.2f}s vs {t2 - t1:.2f}s full parse)")
+    return outp
+
+
+def gen(header_path, source_path, module, main_prefix, dep_prefixes):
+    headers = header_texts(header_path, main_prefix, dep_prefixes) if doc_comments else None
+    if verify_decl_only_parse:
+        outp = verify_decl_only(header_path, source_path, module, main_prefix, dep_prefixes, headers)
+    elif decl_only_parse:
+        src = decl_only_source(header_path, main_prefix, dep_prefixes)
+        outp = parse_ast(load_ast(None, src), module, main_prefix, dep_prefixes, headers)
+    else:
+        outp = parse_ast(load_ast(source_path), module, main_prefix, dep_prefixes, headers)
+    if struct_layouts:
+        add_layouts(outp, header_path, main_prefix, dep_prefixes)
     with open(f"{module}.json", "w") as f:
         f.write(json.dumps(outp, indent=2))
     return outp
+
+
+# -------------------------------------------------------------------------------
+#   Read-only access to previously generated IR files, so that tools can
+#   consume the IR without running clang or a language backend, e.g.:
+#
+#       ir = gen_ir.load_ir("gfx")
+#       ir.by_name["sg_desc"]["fields"]
+#       ir.by_kind["func"]
+#       ir.by_prefix["sg_"]
+# -------------------------------------------------------------------------------
+def freeze(val):
+    if isinstance(val, dict):
+        return MappingProxyType({k: freeze(v) for k, v in val.items()})
+    elif isinstance(val, list):
+        return tuple(freeze(v) for v in val)
+    else:
+        return val
+
+
+class IR:
+    def __init__(self, ir):
+        self.module = ir["module"]
+        self.prefix = ir["prefix"]
+        self.dep_prefixes = tuple(ir["dep_prefixes"])
+        # the pointer size of the target the struct layouts were evaluated for
+        self.pointer_size = ir.get("pointer_size")
+        self.decls = freeze(ir["decls"])
+
+    # all named decls (structs, enums, funcs) by C name
+    @cached_property
+    def by_name(self):
+        return MappingProxyType({d["name"]: d for d in self.decls if "name" in d})
+
+    # all decls grouped by kind ('struct', 'enum', 'consts', 'func')
+    @cached_property
+    def by_kind(self):
+        outp = {}
+        for decl in self.decls:
+            outp.setdefault(decl["kind"], []).append(decl)
+        return MappingProxyType({k: tuple(v) for k, v in outp.items()})
+
+    # all decls grouped by their API prefix (main prefix or dependency prefix)
+    @cached_property
+    def by_prefix(self):
+        outp = {self.prefix: []}
+        for prefix in self.dep_prefixes:
+            outp[prefix] = []
+        for decl in self.decls:
+            prefix = decl["dep_prefix"] if decl["is_dep"] else self.prefix
+            outp[prefix].append(decl)
+        return MappingProxyType({k: tuple(v) for k, v in outp.items()})
+
+    # only the decls of the module itself, without dependencies
+    @cached_property
+    def api_decls(self):
+        return self.by_prefix[self.prefix]
+
+
+@lru_cache(maxsize=None)
+def _load_ir_file(path, mtime_ns):
+    with open(path, "r") as f:
+        return IR(json.load(f))
+
+
+def load_ir(module, ir_dir="."):
+    path = os.path.abspath(os.path.join(ir_dir, f"{module}.json"))
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"IR file {path} not found (run gen_all.py first)")
+    return _load_ir_file(path, os.stat(path).st_mtime_ns)
+
+
+# -------------------------------------------------------------------------------
+#   Semantic diff of two IRs at the decl level, and the generated files which
+#   are affected by the changes. Compares two IR files or two directories
+#   with IR files (e.g. a copy of the previous gen_all.py run):
+#
+#       python3 gen_ir.py diff old/gfx.json gfx.json
+#       python3 gen_ir.py diff old_ir_dir .
+# -------------------------------------------------------------------------------
+def decl_key(decl):
+    if decl["kind"] == "consts":
+        # anonymous enums are identified by their first item
+        return ("consts", decl["items"][0]["name"])
+    return (decl["kind"], decl["name"])
+
+
+def diff_items(old_items, new_items, what, key, describe):
+    old_by_key = {key(item): item for item in old_items}
+    new_by_key = {key(item): item for item in new_items}
+    details = []
+    for k, item in old_by_key.items():
+        if k not in new_by_key:
+            details.append(f"{what} removed: {describe(item)}")
+        elif new_by_key[k] != item:
+            if describe(item) == describe(new_by_key[k]):
+                attrs = sorted(a for a in item.keys() | new_by_key[k].keys() if item.get(a) != new_by_key[k].get(a))
+                details.append(f"{what} changed: {describe(item)} ({', '.join(attrs)})")
+            else:
+                details.append(f"{what} changed: {describe(item)} => {describe(new_by_key[k])}")
+    for k, item in new_by_key.items():
+        if k not in old_by_key:
+            details.append(f"{what} added: {describe(item)}")
+    if not details and [key(item) for item in old_items] != [key(item) for item in new_items]:
+        details.append(f"{what}s reordered")
+    return details
+
+
+def describe_field(field):
+    return f"{field.get('name', '(unnamed)')}: {field['type']}"
+
+
+def describe_item(item):
+    return f"{item['name']} = {item['value']}" if "value" in item else item["name"]
+
+
+def describe_param(param):
+    return f"{param['name']}: {param['type']}"
+
+
+# a list of human readable changes between two versions of a decl
+def diff_decl(old, new):
+    details = []
+    if old["kind"] == "struct":
+        details += diff_items(old["fields"], new["fields"], "field", lambda f: f.get("name"), describe_field)
+        for attr in ["size", "align"]:
+            if old.get(attr) != new.get(attr):
+                details.append(f"{attr} changed: {old.get(attr)} => {new.get(attr)}")
+    elif old["kind"] in ["enum", "consts"]:
+        details += diff_items(old["items"], new["items"], "item", lambda i: i["name"], describe_item)
+    elif old["kind"] == "func":
+        if old["type"] != new["type"]:
+            details.append(f"signature changed: {old['type']} => {new['type']}")
+        elif old["params"] != new["params"]:
+            details.append(
+                "params changed: "
+                f"({', '.join(map(describe_param, old['params']))}) => ({', '.join(map(describe_param, new['params']))})"
+            )
+    if old.get("comment") != new.get("comment"):
+        details.append("comment changed")
+    if old["is_dep"] != new["is_dep"] or old["dep_prefix"] != new["dep_prefix"]:
+        details.append(f"dependency changed: {old['dep_prefix']} => {new['dep_prefix']}")
+    return details
+
+
+# the decl-level changes between two IRs (as loaded from the JSON files), as
+# a list of dicts with 'change' ('added', 'removed' or 'changed'), 'kind',
+# 'name', 'is_dep' and the list of changes in 'details'
+def diff_ir(old_ir, new_ir):
+    old_decls = {decl_key(decl): decl for decl in old_ir["decls"]}
+    new_decls = {decl_key(decl): decl for decl in new_ir["decls"]}
+    changes = []
+
+    def add_change(change, decl, details):
+        changes.append(
+            {"change": change, "kind": decl["kind"], "name": decl_key(decl)[1], "is_dep": decl["is_dep"], "details": details}
+        )
+
+    for key, decl in old_decls.items():
+        if key not in new_decls:
+            add_change("removed", decl, [])
+        elif new_decls[key] != decl:
+            add_change("changed", new_decls[key], diff_decl(decl, new_decls[key]) or ["changed"])
+    for key, decl in new_decls.items():
+        if key not in old_decls:
+            add_change("added", decl, [])
+    return changes
+
+
+# dependency decls only affect the generated code through the struct and
+# enum types collected in each backend's pre_parse(), and ignored functions
+# don't appear in the generated code at all
+def change_affects_backend(change, backend):
+    if change["is_dep"]:
+        return change["kind"] in ["struct", "enum"]
+    if change["kind"] == "func":
+        return not backend.check_ignore(change["name"])
+    return True
+
+
+# backend name => path of the generated file which is affected by the changes
+def affected_outputs(changes, c_prefix, backends):
+    outp = {}
+    for backend_name, backend in backends.items():
+        if c_prefix in backend.module_names:
+            if any(change_affects_backend(change, backend) for change in changes):
+                outp[backend_name] = backend.get_output_path(c_prefix)
+    return outp
+
+
+def load_ir_json(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+# pairs of (module name, old IR path, new IR path) for two IR files or two
+# directories with IR files, a module which only exists on one side has None
+# as path on the other
+def ir_path_pairs(old_path, new_path):
+    if os.path.isdir(old_path) and os.path.isdir(new_path):
+        names = sorted(
+            set(n for n in os.listdir(old_path) if n.endswith(".json"))
+            | set(n for n in os.listdir(new_path) if n.endswith(".json"))
+        )
+        pairs = []
+        for name in names:
+            old_file = os.path.join(old_path, name)
+            new_file = os.path.join(new_path, name)
+            pairs.append(
+                (
+                    name[: -len(".json")],
+                    old_file if os.path.isfile(old_file) else None,
+                    new_file if os.path.isfile(new_file) else None,
+                )
+            )
+        return pairs
+    elif os.path.isfile(old_path) and os.path.isfile(new_path):
+        return [(os.path.basename(new_path)[: -len(".json")], old_path, new_path)]
+    else:
+        sys.exit(f"ERROR: {old_path} and {new_path} must both be IR files or directories")
+
+
+def diff_main(old_path, new_path):
+    import gen_zig, gen_rust, gen_d, gen_v, gen_nim, gen_odin, gen_jai, gen_python
+
+    backends = {
+        "zig": gen_zig,
+        "rust": gen_rust,
+        "d": gen_d,
+        "v": gen_v,
+        "nim": gen_nim,
+        "odin": gen_odin,
+        "jai": gen_jai,
+        "python": gen_python,
+    }
+    num_changed_modules = 0
+    for module, old_file, new_file in ir_path_pairs(old_path, new_path):
+        old_ir = load_ir_json(old_file) if old_file else None
+        new_ir = load_ir_json(new_file) if new_file else None
+        c_prefix = (new_ir or old_ir)["prefix"]
+        changes = diff_ir(old_ir or {"decls": []}, new_ir or {"decls": []})
+        if not changes:
+            continue
+        num_changed_modules += 1
+        print(f"=== {module} ({c_prefix}): {len(changes)} changed decls")
+        for change in changes:
+            dep = " (dependency)" if change["is_dep"] else ""
+            print(f"  {change['change']} {change['kind']} {change['name']}{dep}")
+            for detail in change["details"]:
+                print(f"      {detail}")
+        outputs = affected_outputs(changes, c_prefix, backends)
+        print("  affected outputs:")
+        for backend_name, path in outputs.items():
+            print(f"    {backend_name:<8} {path}")
+        if not outputs:
+            print("    none")
+    if num_changed_modules == 0:
+        print("no changes")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "diff":
+        diff_main(sys.argv[2], sys.argv[3])
+    else:
+        sys.exit("usage: python3 gen_ir.py diff [old IR file or dir] [new IR file or dir]")
@@ -5,7 +5,7 @@
 #-------------------------------------------------------------------------------
 import gen_ir
 import gen_util as util
-import os, shutil, sys
+import os, sys
 
 bindings_root = 'sokol-jai'
 c_root = f'{bindings_root}/sokol/c'
@@ -309,7 +309,7 @@ def get_system_libs(module, platform, backend):
                     return f"{libs}"
     return ''
 
-def gen_c_imports(inp, c_prefix, prefix):
+def gen_c_imports(inp, c_prefix, prefix, fragment_cache):
     module_name = inp["module"]
     clib_prefix = f'sokol_{module_name}'
     clib_import = f'{clib_prefix}_clib'
@@ -392,12 +392,15 @@ def gen_c_imports(inp, c_prefix, prefix):
     prefix = inp['prefix']
     for decl in inp['decls']:
         if decl['kind'] == 'func' and not decl['is_dep'] and not check_ignore(decl['name']):
-            args = funcdecl_args_c(decl, prefix)
-            res_type = funcdecl_result_c(decl, prefix)
-            res_str = '-> void' if res_type == '' else f'-> {res_type}'
-            l(f"{decl['name']} :: ({args}) {res_str} #foreign {clib_import};")
+            fragment_cache.emit(decl, lambda: gen_c_import_func(decl, prefix, clib_import), part='c_import')
     l('')
 
+def gen_c_import_func(decl, prefix, clib_import):
+    args = funcdecl_args_c(decl, prefix)
+    res_type = funcdecl_result_c(decl, prefix)
+    res_str = '-> void' if res_type == '' else f'-> {res_type}'
+    l(f"{decl['name']} :: ({args}) {res_str} #foreign {clib_import};")
+
 def gen_consts(decl, prefix):
     for item in decl['items']:
         item_name = check_override(item['name'])
@@ -439,12 +442,101 @@ def gen_imports(dep_prefixes):
     l('')
 
 def gen_helpers(inp):
+    if util.range_struct_name(inp) is not None:
+        gen_range_helpers(inp)
     if inp['prefix'] == 'sdtx_':
         l('sdtx_printf :: (s: string, args: ..Any) {')
         l('    #import "Basic";')
         l('    fstr := tprint(s, ..args);')
         l('    sdtx_putr(to_c_string(fstr), xx fstr.count);')
         l('}')
+    elif inp['prefix'] == 'sg_':
+        gen_frame_stats_helpers(inp)
+
+# non-copying conversions of array views (fixed-size arrays convert to those
+# implicitly) and single values into the module's range struct
+def gen_range_helpers(inp):
+    prefix = inp['prefix']
+    range_type = util.range_struct_name(inp)
+    l(f'{prefix}slice_as_range :: (data: [] $T) -> {range_type} {{')
+    l('    return .{ ptr = data.data, size = xx (data.count * size_of(T)) };')
+    l('}')
+    l(f'{prefix}value_as_range :: (value: *$T) -> {range_type} {{')
+    l('    return .{ ptr = value, size = xx size_of(T) };')
+    l('}')
+    l('')
+
+# a flat array view of sg_frame_stats and a ring buffer collector with rolling
+# averages and percentiles over the last N frames, without allocations
+def gen_frame_stats_helpers(inp):
+    values = util.frame_stats_values(inp)
+    l(f'SG_FRAME_STATS_NUM_VALUES :: {len(values)};')
+    l('sg_frame_stats_names :: string.[')
+    for name, _ in values:
+        l(f'    "{name}",')
+    l('];')
+    l('// flat array view of a sg_frame_stats struct, for instance for exporting')
+    l('sg_frame_stats_flatten :: (stats: sg_frame_stats) -> [SG_FRAME_STATS_NUM_VALUES] u32 {')
+    l('    return u32.[')
+    for _, path in values:
+        l(f"        stats.{'.'.join([check_override(field['name']) for field in path])},")
+    l('    ];')
+    l('}')
+    l('// records the flattened frame stats of the last N frames,')
+    l('// call sg_frame_stats_collector_push(*c, sg_query_frame_stats()) once per frame')
+    l('sg_frame_stats_collector :: struct(N: int) {')
+    l('    frames: [N][SG_FRAME_STATS_NUM_VALUES] u32;')
+    l('    num: int;')
+    l('    pos: int;')
+    l('}')
+    l('sg_frame_stats_collector_push :: (c: *sg_frame_stats_collector($N), stats: sg_frame_stats) {')
+    l('    #import "Basic";')
+    l('    c.frames[c.pos] = sg_frame_stats_flatten(stats);')
+    l('    c.pos = (c.pos + 1) % N;')
+    l('    c.num = min(c.num + 1, N);')
+    l('}')
+    l('// the most recently pushed frame stats, c.num must be > 0')
+    l('sg_frame_stats_collector_latest :: (c: *sg_frame_stats_collector($N)) -> [SG_FRAME_STATS_NUM_VALUES] u32 {')
+    l('    #import "Basic";')
+    l('    assert(c.num > 0);')
+    l('    return c.frames[(c.pos + N - 1) % N];')
+    l('}')
+    l('// average of a value over the recorded frames')
+    l('sg_frame_stats_collector_average :: (c: *sg_frame_stats_collector($N), value_index: int) -> float64 {')
+    l('    if c.num == 0  return 0;')
+    l('    sum: u64 = 0;')
+    l('    for i: 0..c.num-1  sum += c.frames[i][value_index];')
+    l('    return cast(float64) sum / cast(float64) c.num;')
+    l('}')
+    l('// nearest-rank percentile (0..100) of a value over the recorded frames')
+    l('sg_frame_stats_collector_percentile :: (c: *sg_frame_stats_collector($N), value_index: int, p: int) -> u32 {')
+    l('    #import "Basic";')
+    l('    if c.num == 0  return 0;')
+    l('    // insertion sort into a stack buffer, avoids allocating')
+    l('    values: [N] u32;')
+    l('    for i: 0..c.num-1 {')
+    l('        value := c.frames[i][value_index];')
+    l('        j := i;')
+    l('        while j > 0 && values[j - 1] > value {')
+    l('            values[j] = values[j - 1];')
+    l('            j -= 1;')
+    l('        }')
+    l('        values[j] = value;')
+    l('    }')
+    l('    rank := (min(p, 100) * c.num + 99) / 100;')
+    l('    return values[max(rank - 1, 0)];')
+    l('}')
+
+# the code for a single decl of the module, emitted through the fragment cache
+def gen_decl(decl, prefix):
+    kind = decl['kind']
+    if kind == 'consts':
+        gen_consts(decl, prefix)
+    elif not check_ignore(decl['name']):
+        if kind == 'struct':
+            gen_struct(decl, prefix)
+        elif kind == 'enum':
+            gen_enum(decl, prefix)
 
 def gen_module(inp, c_prefix, dep_prefixes):
     pre_parse(inp)
@@ -452,17 +544,12 @@ def gen_module(inp, c_prefix, dep_prefixes):
     gen_imports(dep_prefixes)
     gen_helpers(inp)
     prefix = inp['prefix']
-    gen_c_imports(inp, c_prefix, prefix)
+    fragment_cache = util.FragmentCache(sys.modules[__name__], inp, [ignores, overrides, c_prefix])
+    gen_c_imports(inp, c_prefix, prefix, fragment_cache)
     for decl in inp['decls']:
         if not decl['is_dep']:
-            kind = decl['kind']
-            if kind == 'consts':
-                gen_consts(decl, prefix)
-            elif not check_ignore(decl['name']):
-                if kind == 'struct':
-                    gen_struct(decl, prefix)
-                elif kind == 'enum':
-                    gen_enum(decl, prefix)
+            fragment_cache.emit(decl, lambda: gen_decl(decl, prefix))
+    fragment_cache.save()
 
 def pre_parse(inp):
     global struct_types
@@ -485,6 +572,10 @@ def prepare():
     if not os.path.isdir(c_root):
         os.makedirs(c_root)
 
+# the path of the generated bindings file for a C prefix
+def get_output_path(c_prefix):
+    return f'{module_root}/{module_names[c_prefix]}/module.jai'
+
 def gen(c_header_path, c_prefix, dep_c_prefixes):
     if not c_prefix in module_names:
         print(f'  >> warning: skipping generation for {c_prefix} prefix...')
@@ -492,10 +583,11 @@ def gen(c_header_path, c_prefix, dep_c_prefixes):
     reset_globals()
     make_jai_module_directory(c_prefix)
     print(f'  {c_header_path} => {module_names[c_prefix]}')
-    shutil.copyfile(c_header_path, f'{c_root}/{os.path.basename(c_header_path)}')
+    util.vendor_file(c_header_path, f'{c_root}/{os.path.basename(c_header_path)}')
     csource_path = get_csource_path(c_prefix)
     module_name = module_names[c_prefix]
     ir = gen_ir.gen(c_header_path, csource_path, module_name, c_prefix, dep_c_prefixes)
     gen_module(ir, c_prefix, dep_c_prefixes)
-    with open(f"{module_root}/{ir['module']}/module.jai", 'w', newline='\n') as f_outp:
+    with open(get_output_path(c_prefix), 'w', newline='\n') as f_outp:
         f_outp.write(out_lines)
+    util.generated_files[get_output_path(c_prefix)] = 'jai'
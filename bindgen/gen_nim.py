@@ -7,7 +7,7 @@
 #-------------------------------------------------------------------------------
 import gen_ir
 import gen_util as util
-import os, shutil, sys
+import os, sys
 
 module_names = {
     'slog_':    'log',
@@ -452,19 +452,24 @@ def gen_array_converters(decl, prefix):
             array_base_type = as_nim_type(array_type, prefix)
             if util.is_1d_array_type(field['type']):
                 n = array_sizes[0]
-                l(f'converter to{struct_name}{field_name}*[N:static[int]](items: array[N, {array_base_type}]): array[{n}, {array_base_type}] =')
+                # the array items are plain C data, copy them with a single copyMem into the zero-initialized result
+                l(f'converter to{struct_name}{field_name}*[N:static[int]](items: array[N, {array_base_type}]): array[{n}, {array_base_type}] {{.inline.}} =')
                 l(f'  static: assert(N <= {n})')
-                l(f'  for index,item in items.pairs: result[index]=item')
+                l(f'  when N > 0:')
+                l(f'    copyMem(result[0].addr, items[0].unsafeAddr, N * sizeof({array_base_type}))')
                 l('')
             elif util.is_2d_array_type(field['type']):
                 x = array_sizes[1]
                 y = array_sizes[0]
-                l(f'converter to{struct_name}{field_name}*[Y:static[int], X:static[int]](items: array[Y, array[X, {array_base_type}]]): array[{y}, array[{x}, {array_base_type}]] =')
+                # if the inner array sizes match, the items are copied with a single copyMem, otherwise one copyMem per row
+                l(f'converter to{struct_name}{field_name}*[Y:static[int], X:static[int]](items: array[Y, array[X, {array_base_type}]]): array[{y}, array[{x}, {array_base_type}]] {{.inline.}} =')
                 l(f'  static: assert(X <= {x})')
                 l(f'  static: assert(Y <= {y})')
-                l(f'  for indexY,itemY in items.pairs:')
-                l(f'    for indexX, itemX in itemY.pairs:')
-                l(f'      result[indexY][indexX] = itemX')
+                l(f'  when X == {x} and Y > 0:')
+                l(f'    copyMem(result[0][0].addr, items[0][0].unsafeAddr, Y * X * sizeof({array_base_type}))')
+                l(f'  elif X > 0:')
+                l(f'    for indexY in 0..<Y:')
+                l(f'      copyMem(result[indexY][0].addr, items[indexY][0].unsafeAddr, X * sizeof({array_base_type}))')
                 l('')
             else:
                 sys.exit('Unsupported converter array dimension (> 2)!')
@@ -486,7 +491,74 @@ def gen_imports(inp, dep_prefixes):
         l(f'import {dep_module_name}')
     l('')
 
+# a flat array view of FrameStats and a ring buffer collector with rolling
+# averages and percentiles over the last N frames, without allocations
+def gen_frame_stats_helpers(inp):
+    prefix = inp['prefix']
+    values = util.frame_stats_values(inp)
+    l(f'const frameStatsNumValues* = {len(values)}')
+    l('const frameStatsNames*: array[frameStatsNumValues, string] = [')
+    for name, _ in values:
+        l(f'  "{name}",')
+    l(']')
+    l('')
+    l(f"proc frameStatsFlatten*(stats: {as_nim_type_name('sg_frame_stats', prefix)}): array[frameStatsNumValues, uint32] =")
+    l('  ## flat array view of a FrameStats struct, for instance for exporting')
+    l('  [')
+    for _, path in values:
+        l(f"    stats.{'.'.join([as_nim_field_name(field, prefix, check_private=False) for field in path])},")
+    l('  ]')
+    l('')
+    l('type FrameStatsCollector*[N: static int] = object')
+    l('  ## records the flattened frame stats of the last N frames,')
+    l('  ## call push(queryFrameStats()) once per frame')
+    l('  frames: array[N, array[frameStatsNumValues, uint32]]')
+    l('  num: int')
+    l('  pos: int')
+    l('')
+    l(f"proc push*[N: static int](c: var FrameStatsCollector[N], stats: {as_nim_type_name('sg_frame_stats', prefix)}) =")
+    l('  c.frames[c.pos] = frameStatsFlatten(stats)')
+    l('  c.pos = (c.pos + 1) mod N')
+    l('  c.num = min(c.num + 1, N)')
+    l('')
+    l('proc len*[N: static int](c: FrameStatsCollector[N]): int =')
+    l('  ## number of recorded frames')
+    l('  c.num')
+    l('')
+    l('proc latest*[N: static int](c: FrameStatsCollector[N]): array[frameStatsNumValues, uint32] =')
+    l('  ## the most recently pushed frame stats, len() must be > 0')
+    l('  assert c.num > 0')
+    l('  c.frames[(c.pos + N - 1) mod N]')
+    l('')
+    l('proc average*[N: static int](c: FrameStatsCollector[N], valueIndex: int): float64 =')
+    l('  ## average of a value over the recorded frames')
+    l('  if c.num == 0:')
+    l('    return 0.0')
+    l('  var sum: uint64 = 0')
+    l('  for i in 0..<c.num:')
+    l('    sum += c.frames[i][valueIndex].uint64')
+    l('  sum.float64 / c.num.float64')
+    l('')
+    l('proc percentile*[N: static int](c: FrameStatsCollector[N], valueIndex: int, p: int): uint32 =')
+    l('  ## nearest-rank percentile (0..100) of a value over the recorded frames')
+    l('  if c.num == 0:')
+    l('    return 0')
+    l('  # insertion sort into a stack buffer, avoids allocating')
+    l('  var values: array[N, uint32]')
+    l('  for i in 0..<c.num:')
+    l('    let value = c.frames[i][valueIndex]')
+    l('    var j = i')
+    l('    while j > 0 and values[j - 1] > value:')
+    l('      values[j] = values[j - 1]')
+    l('      dec j')
+    l('    values[j] = value')
+    l('  let rank = (min(p, 100) * c.num + 99) div 100')
+    l('  values[max(rank - 1, 0)]')
+    l('')
+
 def gen_extra(inp):
+    if inp['prefix'] == 'sg_':
+        gen_frame_stats_helpers(inp)
     if inp['prefix'] in ['sg_']:
         # FIXME: remove when sokol-shdc has been integrated!
         l('when defined emscripten:')
@@ -582,25 +654,31 @@ def gen_extra(inp):
     l('  {.passc:"-DNDEBUG".}')
     l(f'{{.compile:"{c_source_path}".}}')
 
+# the code for a single decl of the module, emitted through the fragment cache
+def gen_decl(decl, prefix):
+    kind = decl['kind']
+    if kind == 'consts':
+        gen_consts(decl, prefix)
+    elif not check_ignore(decl['name']):
+        if kind == 'struct':
+            gen_struct(decl, prefix)
+            gen_array_converters(decl, prefix)
+        elif kind == 'enum':
+            gen_enum(decl, prefix)
+        elif kind == 'func':
+            gen_func_nim(decl, prefix)
+
 def gen_module(inp, dep_prefixes):
     l('## machine generated, do not edit')
     l('')
     gen_imports(inp, dep_prefixes)
     pre_parse(inp)
     prefix = inp['prefix']
+    fragment_cache = util.FragmentCache(sys.modules[__name__], inp, [ignores, overrides])
     for decl in inp['decls']:
         if not decl['is_dep']:
-            kind = decl['kind']
-            if kind == 'consts':
-                gen_consts(decl, prefix)
-            elif not check_ignore(decl['name']):
-                if kind == 'struct':
-                    gen_struct(decl, prefix)
-                    gen_array_converters(decl, prefix)
-                elif kind == 'enum':
-                    gen_enum(decl, prefix)
-                elif kind == 'func':
-                    gen_func_nim(decl, prefix)
+            fragment_cache.emit(decl, lambda: gen_decl(decl, prefix))
+    fragment_cache.save()
     gen_extra(inp)
 
 def prepare():
@@ -610,6 +688,10 @@ def prepare():
     if not os.path.isdir('sokol-nim/src/sokol/c'):
         os.makedirs('sokol-nim/src/sokol/c')
 
+# the path of the generated bindings file for a C prefix
+def get_output_path(c_prefix):
+    return f'sokol-nim/src/sokol/{module_names[c_prefix]}.nim'
+
 def gen(c_header_path, c_prefix, dep_c_prefixes):
     if not c_prefix in module_names:
         print(f'  >> warning: skipping generation for {c_prefix} prefix...')
@@ -619,9 +701,10 @@ def gen(c_header_path, c_prefix, dep_c_prefixes):
     c_source_path = c_source_paths[c_prefix]
     print(f'  {c_header_path} => {module_name}')
     reset_globals()
-    shutil.copyfile(c_header_path, f'sokol-nim/src/sokol/c/{os.path.basename(c_header_path)}')
+    util.vendor_file(c_header_path, f'sokol-nim/src/sokol/c/{os.path.basename(c_header_path)}')
     ir = gen_ir.gen(c_header_path, c_source_path, module_name, c_prefix, dep_c_prefixes)
     gen_module(ir, dep_c_prefixes)
-    output_path = f"sokol-nim/src/sokol/{ir['module']}.nim"
+    output_path = get_output_path(c_prefix)
     with open(output_path, 'w', newline='\n') as f_outp:
         f_outp.write(out_lines)
+    util.generated_files[output_path] = 'nim'
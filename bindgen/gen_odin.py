@@ -5,7 +5,7 @@
 #-------------------------------------------------------------------------------
 import gen_ir
 import gen_util as util
-import os, shutil, sys
+import os, sys
 
 bindings_root = 'sokol-odin'
 c_root = f'{bindings_root}/sokol/c'
@@ -336,7 +336,7 @@ def get_system_libs(module, platform, backend):
                     return f", {libs}"
     return ''
 
-def gen_c_imports(inp, c_prefix, prefix):
+def gen_c_imports(inp, c_prefix, prefix, fragment_cache):
     module_name = inp["module"]
     clib_prefix = f'sokol_{module_name}'
     clib_import = f'{clib_prefix}_clib'
@@ -417,31 +417,43 @@ def gen_c_imports(inp, c_prefix, prefix):
     prefix = inp['prefix']
     for decl in inp['decls']:
         if decl['kind'] == 'func' and not decl['is_dep'] and not check_ignore(decl['name']):
-            args = funcdecl_args_c(decl, prefix)
-            res_type = funcdecl_result_c(decl, prefix)
-            res_str = '' if res_type == '' else f'-> {res_type}'
-            # Need to special case sapp_sg to avoid Odin's context keyword
-            if c_prefix == "sapp_sg":
-                l(f'    @(link_name="{decl["name"]}")')
-                l(f"    {check_override(as_snake_case(decl['name'], c_prefix))} :: proc({args}) {res_str} ---")
-            else:
-                l(f"    {as_snake_case(decl['name'], c_prefix)} :: proc({args}) {res_str} ---")
+            fragment_cache.emit(decl, lambda: gen_c_import_func(decl, c_prefix, prefix), part='c_import')
     l('}')
     l('')
 
+def gen_c_import_func(decl, c_prefix, prefix):
+    args = funcdecl_args_c(decl, prefix)
+    res_type = funcdecl_result_c(decl, prefix)
+    res_str = '' if res_type == '' else f'-> {res_type}'
+    gen_doc_comment(decl, '    ')
+    # Need to special case sapp_sg to avoid Odin's context keyword
+    if c_prefix == "sapp_sg":
+        l(f'    @(link_name="{decl["name"]}")')
+        l(f"    {check_override(as_snake_case(decl['name'], c_prefix))} :: proc({args}) {res_str} ---")
+    else:
+        l(f"    {as_snake_case(decl['name'], c_prefix)} :: proc({args}) {res_str} ---")
+
+def gen_doc_comment(item, indent=''):
+    for line in util.doc_comment_lines(item, '//'):
+        l(f"{indent}{line}")
+
 def gen_consts(decl, prefix):
+    gen_doc_comment(decl)
     for item in decl['items']:
         item_name = check_override(item['name'])
+        gen_doc_comment(item)
         l(f"{as_snake_case(item_name, prefix)} :: {item['value']}")
     l('')
 
 def gen_struct(decl, prefix):
     c_struct_name = check_override(decl['name'])
     struct_name = as_struct_or_enum_type(c_struct_name, prefix)
+    gen_doc_comment(decl)
     l(f'{struct_name} :: struct {{')
     for field in decl['fields']:
         field_name = check_override(field['name'])
         field_type = map_type(check_override(f'{c_struct_name}.{field_name}', default=field['type']), prefix, 'struct_field')
+        gen_doc_comment(field, '    ')
         # any field name starting with _ is considered private
         if field_name.startswith('_'):
             l(f'    _ : {field_type},')
@@ -452,10 +464,12 @@ def gen_struct(decl, prefix):
 
 def gen_enum(decl, prefix):
     enum_name = check_override(decl['name'])
+    gen_doc_comment(decl)
     l(f'{as_struct_or_enum_type(enum_name, prefix)} :: enum i32 {{')
     for item in decl['items']:
         item_name = as_enum_item_name(check_override(item['name']))
         if item_name != 'FORCE_U32' and item_name != 'NUM':
+            gen_doc_comment(item, '    ')
             if 'value' in item:
                 l(f"    {item_name} = {item['value']},")
             else:
@@ -470,6 +484,8 @@ def gen_imports(dep_prefixes):
     l('')
 
 def gen_helpers(inp):
+    if util.range_struct_name(inp) is not None:
+        gen_range_helpers(inp)
     if inp['prefix'] == 'sdtx_':
         l('import "core:fmt"')
         l('import "core:strings"')
@@ -477,6 +493,100 @@ def gen_helpers(inp):
         l('    fstr := fmt.tprintf(s, ..args)')
         l('    putr(strings.unsafe_string_to_cstring(fstr), len(fstr))')
         l('}')
+    elif inp['prefix'] == 'sg_':
+        gen_frame_stats_helpers(inp)
+
+# non-copying conversions of slices (including sliced fixed-size arrays) and
+# single values into the module's Range struct, as_range() accepts both
+def gen_range_helpers(inp):
+    range_type = as_struct_or_enum_type(util.range_struct_name(inp), inp['prefix'])
+    l(f'// helper functions to get a {range_type} pointing into a slice (e.g. `as_range(vertices[:])`)')
+    l('// or to a single value (e.g. `as_range(&uniforms)`), without copying')
+    l(f'slice_as_range :: proc "contextless" (data: []$T) -> {range_type} {{')
+    l('    return { ptr = raw_data(data), size = c.size_t(len(data) * size_of(T)) }')
+    l('}')
+    l(f'value_as_range :: proc "contextless" (value: ^$T) -> {range_type} {{')
+    l('    return { ptr = value, size = size_of(T) }')
+    l('}')
+    l('as_range :: proc{slice_as_range, value_as_range}')
+    l('')
+
+# a flat array view of Frame_Stats and a ring buffer collector with rolling
+# averages and percentiles over the last N frames, without allocations
+def gen_frame_stats_helpers(inp):
+    prefix = inp['prefix']
+    values = util.frame_stats_values(inp)
+    stats_type = as_struct_or_enum_type('sg_frame_stats', prefix)
+    l(f'FRAME_STATS_NUM_VALUES :: {len(values)}')
+    l('FRAME_STATS_NAMES := [FRAME_STATS_NUM_VALUES]string {')
+    for name, _ in values:
+        l(f'    "{name}",')
+    l('}')
+    l('// flat array view of a Frame_Stats struct, for instance for exporting')
+    l(f'frame_stats_flatten :: proc(stats: {stats_type}) -> [FRAME_STATS_NUM_VALUES]u32 {{')
+    l('    return {')
+    for _, path in values:
+        l(f"        stats.{'.'.join([check_override(field['name']) for field in path])},")
+    l('    }')
+    l('}')
+    l('// records the flattened frame stats of the last N frames,')
+    l('// call frame_stats_collector_push(&c, query_frame_stats()) once per frame')
+    l('Frame_Stats_Collector :: struct($N: int) {')
+    l('    frames: [N][FRAME_STATS_NUM_VALUES]u32,')
+    l('    num: int,')
+    l('    pos: int,')
+    l('}')
+    l(f'frame_stats_collector_push :: proc(c: ^Frame_Stats_Collector($N), stats: {stats_type}) {{')
+    l('    c.frames[c.pos] = frame_stats_flatten(stats)')
+    l('    c.pos = (c.pos + 1) % N')
+    l('    c.num = min(c.num + 1, N)')
+    l('}')
+    l('// the most recently pushed frame stats, c.num must be > 0')
+    l('frame_stats_collector_latest :: proc(c: ^Frame_Stats_Collector($N)) -> [FRAME_STATS_NUM_VALUES]u32 {')
+    l('    assert(c.num > 0)')
+    l('    return c.frames[(c.pos + N - 1) % N]')
+    l('}')
+    l('// average of a value over the recorded frames')
+    l('frame_stats_collector_average :: proc(c: ^Frame_Stats_Collector($N), value_index: int) -> f64 {')
+    l('    if c.num == 0 {')
+    l('        return 0')
+    l('    }')
+    l('    sum: u64 = 0')
+    l('    for i in 0..<c.num {')
+    l('        sum += u64(c.frames[i][value_index])')
+    l('    }')
+    l('    return f64(sum) / f64(c.num)')
+    l('}')
+    l('// nearest-rank percentile (0..100) of a value over the recorded frames')
+    l('frame_stats_collector_percentile :: proc(c: ^Frame_Stats_Collector($N), value_index: int, p: int) -> u32 {')
+    l('    if c.num == 0 {')
+    l('        return 0')
+    l('    }')
+    l('    // insertion sort into a stack buffer, avoids allocating')
+    l('    values: [N]u32')
+    l('    for i in 0..<c.num {')
+    l('        value := c.frames[i][value_index]')
+    l('        j := i')
+    l('        for j > 0 && values[j - 1] > value {')
+    l('            values[j] = values[j - 1]')
+    l('            j -= 1')
+    l('        }')
+    l('        values[j] = value')
+    l('    }')
+    l('    rank := (min(p, 100) * c.num + 99) / 100')
+    l('    return values[max(rank - 1, 0)]')
+    l('}')
+
+# the code for a single decl of the module, emitted through the fragment cache
+def gen_decl(decl, prefix):
+    kind = decl['kind']
+    if kind == 'consts':
+        gen_consts(decl, prefix)
+    elif not check_ignore(decl['name']):
+        if kind == 'struct':
+            gen_struct(decl, prefix)
+        elif kind == 'enum':
+            gen_enum(decl, prefix)
 
 def gen_module(inp, c_prefix, dep_prefixes):
     pre_parse(inp)
@@ -486,17 +596,12 @@ def gen_module(inp, c_prefix, dep_prefixes):
     gen_imports(dep_prefixes)
     gen_helpers(inp)
     prefix = inp['prefix']
-    gen_c_imports(inp, c_prefix, prefix)
+    fragment_cache = util.FragmentCache(sys.modules[__name__], inp, [ignores, overrides, c_prefix])
+    gen_c_imports(inp, c_prefix, prefix, fragment_cache)
     for decl in inp['decls']:
         if not decl['is_dep']:
-            kind = decl['kind']
-            if kind == 'consts':
-                gen_consts(decl, prefix)
-            elif not check_ignore(decl['name']):
-                if kind == 'struct':
-                    gen_struct(decl, prefix)
-                elif kind == 'enum':
-                    gen_enum(decl, prefix)
+            fragment_cache.emit(decl, lambda: gen_decl(decl, prefix))
+    fragment_cache.save()
 
 def pre_parse(inp):
     global struct_types
@@ -519,6 +624,10 @@ def prepare():
     if not os.path.isdir(c_root):
         os.makedirs(c_root)
 
+# the path of the generated bindings file for a C prefix
+def get_output_path(c_prefix):
+    return f'{module_root}/{module_names[c_prefix]}/{module_names[c_prefix]}.odin'
+
 def gen(c_header_path, c_prefix, dep_c_prefixes):
     if not c_prefix in module_names:
         print(f'  >> warning: skipping generation for {c_prefix} prefix...')
@@ -526,10 +635,11 @@ def gen(c_header_path, c_prefix, dep_c_prefixes):
     reset_globals()
     make_odin_module_directory(c_prefix)
     print(f'  {c_header_path} => {module_names[c_prefix]}')
-    shutil.copyfile(c_header_path, f'{c_root}/{os.path.basename(c_header_path)}')
+    util.vendor_file(c_header_path, f'{c_root}/{os.path.basename(c_header_path)}')
     csource_path = get_csource_path(c_prefix)
     module_name = module_names[c_prefix]
     ir = gen_ir.gen(c_header_path, csource_path, module_name, c_prefix, dep_c_prefixes)
     gen_module(ir, c_prefix, dep_c_prefixes)
-    with open(f"{module_root}/{ir['module']}/{ir['module']}.odin", 'w', newline='\n') as f_outp:
+    with open(get_output_path(c_prefix), 'w', newline='\n') as f_outp:
         f_outp.write(out_lines)
+    util.generated_files[get_output_path(c_prefix)] = 'odin'
@@ -0,0 +1,764 @@
+# -------------------------------------------------------------------------------
+#   Generate Python ctypes bindings.
+#
+#   Python coding style:
+#   - types are PascalCase
+#   - functions are snake_case
+#   - constants and enum items are UPPER_SNAKE_CASE
+#
+#   All modules load the same sokol shared library (see clib.py written by
+#   prepare()). C functions are bound directly to private ctypes foreign function
+#   objects with argtypes/restype configured once at import time, so there's
+#   no Python wrapper function between the caller and the C call.
+#
+#   The shared library is built from the C sources written into sokol/c (one
+#   per module, plus sokol_defines.h for the backend selection) by the
+#   generated build.py script in the bindings root.
+# -------------------------------------------------------------------------------
+import gen_ir
+import keyword, os, re, sys
+
+import gen_util as util
+
+bindings_root = "sokol-python"
+c_root = f"{bindings_root}/sokol/c"
+module_root = f"{bindings_root}/sokol"
+
+module_names = {
+    "slog_": "log",
+    "sg_": "gfx",
+    "sapp_": "app",
+    "stm_": "time",
+    "saudio_": "audio",
+    "sgl_": "gl",
+    "sdtx_": "debugtext",
+    "sshape_": "shape",
+    "sglue_": "glue",
+    "sfetch_": "fetch",
+    "simgui_": "imgui",
+}
+
+c_source_paths = {
+    "slog_": "sokol-python/sokol/c/sokol_log.c",
+    "sg_": "sokol-python/sokol/c/sokol_gfx.c",
+    "sapp_": "sokol-python/sokol/c/sokol_app.c",
+    "stm_": "sokol-python/sokol/c/sokol_time.c",
+    "saudio_": "sokol-python/sokol/c/sokol_audio.c",
+    "sgl_": "sokol-python/sokol/c/sokol_gl.c",
+    "sdtx_": "sokol-python/sokol/c/sokol_debugtext.c",
+    "sshape_": "sokol-python/sokol/c/sokol_shape.c",
+    "sglue_": "sokol-python/sokol/c/sokol_glue.c",
+    "sfetch_": "sokol-python/sokol/c/sokol_fetch.c",
+    "simgui_": "sokol-python/sokol/c/sokol_imgui.c",
+}
+
+# the headers included by the C source of each module, the last one is the
+# module's own header which is implemented when compiled with -DIMPL
+c_source_includes = {
+    "slog_": ["sokol_log.h"],
+    "sg_": ["sokol_gfx.h"],
+    "sapp_": ["sokol_app.h"],
+    "stm_": ["sokol_time.h"],
+    "saudio_": ["sokol_audio.h"],
+    "sgl_": ["sokol_gfx.h", "sokol_gl.h"],
+    "sdtx_": ["sokol_gfx.h", "sokol_debugtext.h"],
+    "sshape_": ["sokol_gfx.h", "sokol_shape.h"],
+    "sglue_": ["sokol_app.h", "sokol_gfx.h", "sokol_glue.h"],
+    "sfetch_": ["sokol_fetch.h"],
+    "simgui_": ["cimgui.h", "sokol_app.h", "sokol_gfx.h", "sokol_imgui.h"],
+}
+
+ignores = [
+    "sdtx_printf",
+    "sdtx_vprintf",
+]
+
+# functions that need to be exposed as 'raw' C callbacks which can be
+# assigned to function pointer struct fields
+c_callbacks = ["slog_func"]
+
+# NOTE: syntax for function results: "func_name.RESULT"
+overrides = {
+    "sgl_error": "sgl_get_error",
+    "sgl_deg": "sgl_as_degrees",
+    "sgl_rad": "sgl_as_radians",
+    "SGL_NO_ERROR": "SGL_ERROR_NO_ERROR",
+    "sfetch_continue": "sfetch_continue_fetching",
+}
+
+prim_types = {
+    "int": "ctypes.c_int",
+    "bool": "ctypes.c_bool",
+    "char": "ctypes.c_char",
+    "int8_t": "ctypes.c_int8",
+    "uint8_t": "ctypes.c_uint8",
+    "int16_t": "ctypes.c_int16",
+    "uint16_t": "ctypes.c_uint16",
+    "int32_t": "ctypes.c_int32",
+    "uint32_t": "ctypes.c_uint32",
+    "int64_t": "ctypes.c_int64",
+    "uint64_t": "ctypes.c_uint64",
+    "float": "ctypes.c_float",
+    "double": "ctypes.c_double",
+    "uintptr_t": "ctypes.c_size_t",
+    "intptr_t": "ctypes.c_ssize_t",
+    "size_t": "ctypes.c_size_t",
+}
+
+struct_types = []
+enum_types = []
+out_lines = ""
+
+
+def reset_globals():
+    global struct_types
+    global enum_types
+    global out_lines
+    struct_types = []
+    enum_types = []
+    out_lines = ""
+
+
+def l(s):
+    global out_lines
+    out_lines += s + "\n"
+
+
+def check_override(name, default=None):
+    if name in overrides:
+        return overrides[name]
+    elif default is None:
+        return name
+    else:
+        return default
+
+
+def check_ignore(name):
+    return name in ignores
+
+
+def wrap_keywords(s):
+    if keyword.iskeyword(s):
+        return f"{s}_"
+    else:
+        return s
+
+
+def as_python_prim_type(s):
+    return prim_types[s]
+
+
+# prefix_bla_blub(_t) => (dep.)BlaBlub
+def as_python_struct_type(s, prefix):
+    parts = s.lower().split("_")
+    outp = "" if s.startswith(prefix) else f"{parts[0]}."
+    for part in parts[1:]:
+        # ignore '_t' type postfix
+        if part != "t":
+            outp += part.capitalize()
+    return outp
+
+
+# prefix_bla_blub(_t) => (dep.)BlaBlub
+def as_python_enum_type(s, prefix):
+    return as_python_struct_type(s, prefix)
+
+
+# PREFIX_BLA_BLUB => BLA_BLUB
+def as_upper_snake_case(s, prefix):
+    return util.as_lower_snake_case(s, prefix).upper()
+
+
+# PREFIX_ENUM_BLA => BLA, _PREFIX_ENUM_BLA => BLA
+def as_enum_item_name(s):
+    outp = s.lstrip("_")
+    parts = outp.split("_")[2:]
+    outp = "_".join(parts)
+    if outp[0].isdigit():
+        outp = "_" + outp
+    return outp
+
+
+def is_prim_type(s):
+    return s in prim_types
+
+
+def is_struct_type(s):
+    return s in struct_types
+
+
+def is_enum_type(s):
+    return s in enum_types
+
+
+def is_const_prim_ptr(s):
+    for prim_type in prim_types:
+        if s == f"const {prim_type} *":
+            return True
+    return False
+
+
+def is_prim_ptr(s):
+    for prim_type in prim_types:
+        if s == f"{prim_type} *":
+            return True
+    return False
+
+
+def is_const_struct_ptr(s):
+    for struct_type in struct_types:
+        if s == f"const {struct_type} *":
+            return True
+    return False
+
+
+def is_struct_ptr(s):
+    for struct_type in struct_types:
+        if s == f"{struct_type} *":
+            return True
+    return False
+
+
+# the pointer/size range structs of the modules, sg_range, sdtx_range,
+# sfetch_range_t... (see util.range_struct_name())
+re_range_struct_type = re.compile(r"^[a-z]+_range(?:_t)?$")
+
+
+def is_range_struct_type(s):
+    return is_struct_type(s) and re_range_struct_type.match(s) is not None
+
+
+def has_range_struct(inp):
+    return util.range_struct_name(inp) is not None
+
+
+def is_const_range_ptr(s):
+    return is_const_struct_ptr(s) and is_range_struct_type(util.extract_ptr_type(s))
+
+
+# a ctypes type expression for struct fields, function pointer args and results
+def as_ctypes_type(c_type, prefix):
+    if c_type == "void":
+        return "None"
+    elif is_prim_type(c_type):
+        return as_python_prim_type(c_type)
+    elif is_struct_type(c_type):
+        return as_python_struct_type(c_type, prefix)
+    elif is_enum_type(c_type):
+        # C enums are passed as plain ints, the IntEnum classes are int subclasses
+        return "ctypes.c_int"
+    elif util.is_string_ptr(c_type):
+        return "ctypes.c_char_p"
+    elif util.is_void_ptr(c_type) or util.is_const_void_ptr(c_type):
+        return "ctypes.c_void_p"
+    elif is_const_struct_ptr(c_type) or is_struct_ptr(c_type):
+        return f"ctypes.POINTER({as_python_struct_type(util.extract_ptr_type(c_type), prefix)})"
+    elif is_const_prim_ptr(c_type) or is_prim_ptr(c_type):
+        return f"ctypes.POINTER({as_python_prim_type(util.extract_ptr_type(c_type))})"
+    elif util.is_func_ptr(c_type):
+        return f"ctypes.CFUNCTYPE({funcptr_result(c_type, prefix)}{funcptr_args(c_type, prefix)})"
+    elif util.is_1d_array_type(c_type):
+        array_type = util.extract_array_type(c_type)
+        array_sizes = util.extract_array_sizes(c_type)
+        return f"({as_ctypes_type(array_type, prefix)} * {array_sizes[0]})"
+    elif util.is_2d_array_type(c_type):
+        array_type = util.extract_array_type(c_type)
+        array_sizes = util.extract_array_sizes(c_type)
+        return f"({as_ctypes_type(array_type, prefix)} * {array_sizes[1]} * {array_sizes[0]})"
+    else:
+        sys.exit(f"ERROR as_ctypes_type(): {c_type}")
+
+
+# a ctypes argtypes entry, these may convert Python args on the fly
+def as_ctypes_arg_type(c_type, prefix):
+    if util.is_string_ptr(c_type):
+        return "_CStrParam"
+    elif is_const_range_ptr(c_type):
+        range_type = as_python_struct_type(util.extract_ptr_type(c_type), prefix)
+        return f"{range_type}Param"
+    else:
+        return as_ctypes_type(c_type, prefix)
+
+
+# get the arguments of a function pointer as ctypes.CFUNCTYPE() args
+def funcptr_args(field_type, prefix):
+    tokens = field_type[field_type.index("(*)") + 4 : -1].split(",")
+    s = ""
+    for token in tokens:
+        arg_type = token.strip()
+        if arg_type == "void":
+            return ""
+        s += f", {as_ctypes_type(arg_type, prefix)}"
+    return s
+
+
+def funcptr_result(field_type, prefix):
+    res_type = field_type[: field_type.index("(*)")].strip()
+    return as_ctypes_type(res_type, prefix)
+
+
+def funcdecl_result_type(decl):
+    func_name = decl["name"]
+    decl_type = decl["type"]
+    return check_override(f"{func_name}.RESULT", default=decl_type[: decl_type.index("(")].strip())
+
+
+def gen_struct(decl, prefix):
+    struct_name = check_override(decl["name"])
+    l(f"class {as_python_struct_type(struct_name, prefix)}(ctypes.Structure):")
+    l("    _fields_ = [")
+    for field in decl["fields"]:
+        field_name = check_override(field["name"])
+        field_type = check_override(f"{struct_name}.{field_name}", default=field["type"])
+        l(f'        ("{wrap_keywords(field_name)}", {as_ctypes_type(field_type, prefix)}),')
+    l("    ]")
+    l("")
+
+
+def gen_range_helpers(decl, prefix):
+    range_type = as_python_struct_type(check_override(decl["name"]), prefix)
+    l("# helper function to create a Range over any object supporting the buffer")
+    l("# protocol (bytes, bytearray, memoryview, array.array, NumPy arrays, ctypes")
+    l("# objects...) without copying. The Range holds the buffer export of the")
+    l("# object until it is garbage collected, so that resizable objects like a")
+    l("# bytearray can't be resized or reallocated while the Range points to them")
+    l(f"def as_range(data) -> {range_type}:")
+    l("    export = _BufferExport(data)")
+    l("    # a void pointer which references the buffer export through ctypes' keep-alive")
+    l("    # mechanism, this is also carried over when the Range is copied into a struct")
+    l("    ptr = ctypes.cast((ctypes.py_object * 1)(export), ctypes.c_void_p)")
+    l("    ptr.value = export.view.buf")
+    l(f"    rng = {range_type}()")
+    l("    rng.ptr = ptr")
+    l("    rng.size = export.view.len")
+    l("    return rng")
+    l("")
+    l(f"# argtypes converter for 'const {decl['name']} *' args, accepts a {range_type} or any")
+    l("# object supporting the buffer protocol")
+    l(f"class {range_type}Param:")
+    l("    @classmethod")
+    l("    def from_param(cls, obj):")
+    l(f"        if not isinstance(obj, {range_type}):")
+    l("            obj = as_range(obj)")
+    l("        return ctypes.byref(obj)")
+    l("")
+
+
+def gen_consts(decl, prefix):
+    for item in decl["items"]:
+        item_name = check_override(item["name"])
+        l(f"{as_upper_snake_case(item_name, prefix)} = {item['value']}")
+    l("")
+
+
+def gen_enum(decl, prefix):
+    enum_name = check_override(decl["name"])
+    l(f"class {as_python_enum_type(enum_name, prefix)}(enum.IntEnum):")
+    value = -1
+    for item in decl["items"]:
+        item_name = as_enum_item_name(check_override(item["name"]))
+        if "value" in item:
+            value = int(item["value"])
+        else:
+            value += 1
+        if item_name != "FORCE_U32":
+            l(f"    {item_name} = {value}")
+    l("")
+
+
+def gen_func(decl, prefix):
+    c_func_name = decl["name"]
+    py_func_name = wrap_keywords(util.as_lower_snake_case(check_override(c_func_name), prefix))
+    res_type = funcdecl_result_type(decl)
+    arg_types = []
+    for param_decl in decl["params"]:
+        param_type = check_override(f"{c_func_name}.{param_decl['name']}", default=param_decl["type"])
+        if c_func_name in c_callbacks:
+            arg_types.append(as_ctypes_type(param_type, prefix))
+        else:
+            arg_types.append(as_ctypes_arg_type(param_type, prefix))
+    if c_func_name in c_callbacks:
+        # ctypes caches CFUNCTYPE prototypes, so this has the same type as
+        # the matching function pointer struct fields
+        prototype = f"ctypes.CFUNCTYPE({', '.join([as_ctypes_type(res_type, prefix), *arg_types])})"
+        l(f'{py_func_name} = {prototype}(("{c_func_name}", _lib))')
+        l("")
+        return
+    # NOTE: item access returns a new function object, unlike attribute access
+    l(f'{py_func_name} = _lib["{c_func_name}"]')
+    l(f"{py_func_name}.argtypes = [{', '.join(arg_types)}]")
+    l(f"{py_func_name}.restype = {as_ctypes_type(res_type, prefix)}")
+    if util.is_string_ptr(res_type):
+        l(f"{py_func_name}.errcheck = _c_str_to_python")
+    elif is_enum_type(res_type):
+        l(f"{py_func_name}.errcheck = _enum_result({as_python_enum_type(res_type, prefix)})")
+    l("")
+
+
+def pre_parse(inp):
+    global struct_types
+    global enum_types
+    for decl in inp["decls"]:
+        kind = decl["kind"]
+        if kind == "struct":
+            struct_types.append(decl["name"])
+        elif kind == "enum":
+            enum_types.append(decl["name"])
+
+
+def gen_imports(inp, dep_prefixes):
+    l("import ctypes, enum")
+    l("from . import clib")
+    for dep_prefix in dep_prefixes:
+        dep_module_name = module_names[dep_prefix]
+        l(f"from . import {dep_module_name} as {dep_prefix[:-1]}")
+    l("")
+    l("_lib = clib.load()")
+    l("")
+
+
+def gen_helpers(inp):
+    l("# argtypes converter for 'const char *' args, accepts str or bytes")
+    l("class _CStrParam:")
+    l("    @classmethod")
+    l("    def from_param(cls, obj):")
+    l("        if isinstance(obj, str):")
+    l('            obj = obj.encode("utf-8")')
+    l("        return ctypes.c_char_p.from_param(obj)")
+    l("")
+    l("# errcheck function to convert a C string result to a Python string")
+    l("def _c_str_to_python(result, func, args):")
+    l('    return result.decode("utf-8") if result is not None else ""')
+    l("")
+    l("# errcheck function factory to convert a C enum result to an IntEnum")
+    l("def _enum_result(enum_type):")
+    l("    def errcheck(result, func, args):")
+    l("        return enum_type(result)")
+    l("    return errcheck")
+    l("")
+    if has_range_struct(inp):
+        l("# CPython's Py_buffer struct, used for zero-copy access to buffer-protocol objects")
+        l("class _PyBuffer(ctypes.Structure):")
+        l("    _fields_ = [")
+        l('        ("buf", ctypes.c_void_p),')
+        l('        ("obj", ctypes.c_void_p),')
+        l('        ("len", ctypes.c_ssize_t),')
+        l('        ("itemsize", ctypes.c_ssize_t),')
+        l('        ("readonly", ctypes.c_int),')
+        l('        ("ndim", ctypes.c_int),')
+        l('        ("format", ctypes.c_char_p),')
+        l('        ("shape", ctypes.c_void_p),')
+        l('        ("strides", ctypes.c_void_p),')
+        l('        ("suboffsets", ctypes.c_void_p),')
+        l('        ("internal", ctypes.c_void_p),')
+        l("    ]")
+        l("")
+        l('_PyObject_GetBuffer = ctypes.pythonapi["PyObject_GetBuffer"]')
+        l("_PyObject_GetBuffer.argtypes = [ctypes.py_object, ctypes.POINTER(_PyBuffer), ctypes.c_int]")
+        l("_PyObject_GetBuffer.restype = ctypes.c_int")
+        l('_PyBuffer_Release = ctypes.pythonapi["PyBuffer_Release"]')
+        l("_PyBuffer_Release.argtypes = [ctypes.POINTER(_PyBuffer)]")
+        l("_PyBuffer_Release.restype = None")
+        l("")
+        l("# owns a buffer export of an object, and releases it when garbage collected")
+        l("class _BufferExport:")
+        l("    def __init__(self, obj):")
+        l("        self.view = _PyBuffer()")
+        l("        _PyObject_GetBuffer(obj, ctypes.byref(self.view), 0)")
+        l("")
+        l("    def __del__(self):")
+        l("        # the module globals may already be gone at interpreter shutdown")
+        l("        if _PyBuffer_Release is not None and self.view.obj:")
+        l("            _PyBuffer_Release(ctypes.byref(self.view))")
+        l("")
+    if inp["prefix"] == "sg_":
+        gen_frame_stats_helpers(inp)
+
+
+# a flat tuple view of FrameStats and a ring buffer collector with rolling
+# averages and percentiles over the last N frames
+def gen_frame_stats_helpers(inp):
+    values = util.frame_stats_values(inp)
+    l("# names of the values in a flattened FrameStats struct")
+    l("FRAME_STATS_NAMES = (")
+    for name, _ in values:
+        l(f'    "{name}",')
+    l(")")
+    l("")
+    l("")
+    l("def frame_stats_flatten(stats):")
+    l('    """Flat tuple view of a FrameStats struct, for instance for exporting"""')
+    l("    return (")
+    for _, path in values:
+        l(f"        stats.{'.'.join([wrap_keywords(check_override(field['name'])) for field in path])},")
+    l("    )")
+    l("")
+    l("")
+    l("class FrameStatsCollector:")
+    l('    """Records the flattened frame stats of the last num_frames frames,')
+    l('    call push(query_frame_stats()) once per frame"""')
+    l("")
+    l("    def __init__(self, num_frames=120):")
+    l("        self.num_frames = num_frames")
+    l("        self._frames = [None] * num_frames")
+    l("        self._num = 0")
+    l("        self._pos = 0")
+    l("")
+    l("    def __len__(self):")
+    l("        return self._num")
+    l("")
+    l("    def push(self, stats):")
+    l("        self._frames[self._pos] = frame_stats_flatten(stats)")
+    l("        self._pos = (self._pos + 1) % self.num_frames")
+    l("        self._num = min(self._num + 1, self.num_frames)")
+    l("")
+    l("    def latest(self):")
+    l('        """The most recently pushed frame stats or None"""')
+    l("        if self._num == 0:")
+    l("            return None")
+    l("        return self._frames[(self._pos - 1) % self.num_frames]")
+    l("")
+    l("    def average(self, value_index):")
+    l('        """Average of a value over the recorded frames"""')
+    l("        if self._num == 0:")
+    l("            return 0.0")
+    l("        return sum(frame[value_index] for frame in self._frames[: self._num]) / self._num")
+    l("")
+    l("    def percentile(self, value_index, p):")
+    l('        """Nearest-rank percentile (0..100) of a value over the recorded frames"""')
+    l("        if self._num == 0:")
+    l("            return 0")
+    l("        values = sorted(frame[value_index] for frame in self._frames[: self._num])")
+    l("        rank = (min(p, 100) * self._num + 99) // 100")
+    l("        return values[max(rank - 1, 0)]")
+    l("")
+
+
+# the code for a single decl of the module, emitted through the fragment cache
+def gen_decl(decl, prefix):
+    kind = decl["kind"]
+    if kind == "consts":
+        gen_consts(decl, prefix)
+    elif not check_ignore(decl["name"]):
+        if kind == "struct":
+            gen_struct(decl, prefix)
+            if is_range_struct_type(decl["name"]):
+                gen_range_helpers(decl, prefix)
+        elif kind == "enum":
+            gen_enum(decl, prefix)
+        elif kind == "func":
+            gen_func(decl, prefix)
+
+
+def gen_module(inp, dep_prefixes):
+    l("# machine generated, do not edit")
+    l("")
+    gen_imports(inp, dep_prefixes)
+    pre_parse(inp)
+    gen_helpers(inp)
+    prefix = inp["prefix"]
+    fragment_cache = util.FragmentCache(sys.modules[__name__], inp, [ignores, overrides])
+    for decl in inp["decls"]:
+        if not decl["is_dep"]:
+            fragment_cache.emit(decl, lambda: gen_decl(decl, prefix))
+    fragment_cache.save()
+
+
+def gen_clib():
+    with open(f"{module_root}/clib.py", "w", newline="\n") as f_outp:
+        f_outp.write(
+            "# machine generated, do not edit\n"
+            "import ctypes, ctypes.util, os, sys\n"
+            "\n"
+            "_lib = None\n"
+            "\n"
+            "# the file name of the shared library built by build.py into this directory\n"
+            'lib_name = {"win32": "sokol.dll", "darwin": "libsokol.dylib"}.get(sys.platform, "libsokol.so")\n'
+            "\n"
+            "# load the sokol shared library, either from the path in SOKOL_PYTHON_LIB,\n"
+            "# the library built by build.py next to this file, or a 'sokol' library in\n"
+            "# the system's library search path\n"
+            "def load():\n"
+            "    global _lib\n"
+            "    if _lib is None:\n"
+            '        path = os.environ.get("SOKOL_PYTHON_LIB")\n'
+            "        if path is None:\n"
+            "            path = os.path.join(os.path.dirname(os.path.abspath(__file__)), lib_name)\n"
+            "            if not os.path.isfile(path):\n"
+            '                path = ctypes.util.find_library("sokol")\n'
+            "        if path is None:\n"
+            '            raise OSError("sokol shared library not found (run build.py, or set SOKOL_PYTHON_LIB)")\n'
+            "        _lib = ctypes.CDLL(path)\n"
+            "    return _lib\n"
+        )
+    with open(f"{module_root}/__init__.py", "w", newline="\n") as f_outp:
+        f_outp.write("# machine generated, do not edit\n")
+
+
+# the backend selection for all C sources, SOKOL_NO_ENTRY since Python owns
+# main(), SOKOL_DLL exports the API from the DLL on Windows
+def gen_c_defines():
+    with open(f"{c_root}/sokol_defines.h", "w", newline="\n") as f_outp:
+        f_outp.write(
+            "// machine generated, do not edit\n"
+            "#pragma once\n"
+            "#define SOKOL_NO_ENTRY\n"
+            "#if defined(_WIN32)\n"
+            "#define SOKOL_DLL\n"
+            "#endif\n"
+            "#if !defined(SOKOL_GLCORE) && !defined(SOKOL_GLES3) && !defined(SOKOL_D3D11) && !defined(SOKOL_METAL) && !defined(SOKOL_WGPU) && !defined(SOKOL_DUMMY_BACKEND)\n"
+            "#if defined(__APPLE__)\n"
+            "#define SOKOL_METAL\n"
+            "#elif defined(_WIN32)\n"
+            "#define SOKOL_D3D11\n"
+            "#else\n"
+            "#define SOKOL_GLCORE\n"
+            "#endif\n"
+            "#endif\n"
+        )
+
+
+# the C source of a module, only compiles the implementation with -DIMPL
+# (gen_ir parses it without)
+def gen_c_source(c_prefix):
+    includes = c_source_includes[c_prefix]
+    impl_define = f"SOKOL_{includes[-1][len('sokol_'):-len('.h')].upper()}_IMPL"
+    with open(c_source_paths[c_prefix], "w", newline="\n") as f_outp:
+        f_outp.write("// machine generated, do not edit\n")
+        f_outp.write("#if defined(IMPL)\n")
+        f_outp.write(f"#define {impl_define}\n")
+        f_outp.write("#endif\n")
+        f_outp.write('#include "sokol_defines.h"\n')
+        for include in includes:
+            f_outp.write(f'#include "{include}"\n')
+
+
+# a script which builds the sokol shared library from the C sources of the
+# generated modules into the package directory, where clib.load() finds it
+def gen_build_script():
+    with open(f"{bindings_root}/build.py", "w", newline="\n") as f_outp:
+        f_outp.write(
+            "# machine generated, do not edit\n"
+            "#\n"
+            "# Builds the sokol shared library for the Python bindings from the C sources\n"
+            "# in sokol/c into the sokol package directory:\n"
+            "#\n"
+            "#     python3 build.py [--backend dummy] [--modules log,time,fetch] [extra compiler args]\n"
+            "#\n"
+            "# Only the system libraries of the selected modules and backend are linked,\n"
+            "# e.g. '--backend dummy --modules log,gfx,time' needs no GL, X11 or ALSA\n"
+            "# libraries. The default backend is Metal on macOS, D3D11 on Windows and\n"
+            "# GL elsewhere. The C compiler can be set with CC (default cc, or cl on\n"
+            "# Windows, where the headers link their system libraries themselves).\n"
+            "import argparse, glob, os, subprocess, sys, tempfile\n"
+            "\n"
+            "root = os.path.dirname(os.path.abspath(__file__))\n"
+            'pkg_dir = os.path.join(root, "sokol")\n'
+            'c_dir = os.path.join(pkg_dir, "c")\n'
+            "\n"
+            "backend_defines = {\n"
+            '    "glcore": "SOKOL_GLCORE",\n'
+            '    "gles3": "SOKOL_GLES3",\n'
+            '    "d3d11": "SOKOL_D3D11",\n'
+            '    "metal": "SOKOL_METAL",\n'
+            '    "wgpu": "SOKOL_WGPU",\n'
+            '    "dummy": "SOKOL_DUMMY_BACKEND",\n'
+            "}\n"
+            "\n"
+            "# the system libraries of the modules, and of the backend for the modules\n"
+            "# which render (on Linux and macOS)\n"
+            'render_modules = ["gfx", "app"]\n'
+            'linux_libs = {"app": ["-lX11", "-lXi", "-lXcursor"], "audio": ["-lasound"]}\n'
+            'linux_backend_libs = {"glcore": ["-lGL"], "gles3": ["-lGLESv2", "-lEGL"]}\n'
+            'macos_frameworks = {"app": ["Cocoa", "QuartzCore"], "audio": ["AudioToolbox"]}\n'
+            'macos_backend_frameworks = {"metal": ["Metal", "MetalKit", "QuartzCore"], "glcore": ["OpenGL"]}\n'
+            "\n"
+            "def default_backend():\n"
+            '    return {"win32": "d3d11", "darwin": "metal"}.get(sys.platform, "glcore")\n'
+            "\n"
+            "# c/sokol_gfx.c => gfx\n"
+            "def module_name(source):\n"
+            '    return os.path.basename(source)[len("sokol_"):-len(".c")]\n'
+            "\n"
+            "def system_libs(modules, backend, module_libs, backend_libs):\n"
+            "    libs = []\n"
+            "    for module in modules:\n"
+            "        libs += module_libs.get(module, [])\n"
+            "    if any(module in render_modules for module in modules):\n"
+            "        libs += backend_libs.get(backend, [])\n"
+            "    # without duplicates, in order\n"
+            "    return list(dict.fromkeys(libs))\n"
+            "\n"
+            "def build_cmd(sources, backend, extra_args):\n"
+            "    modules = [module_name(source) for source in sources]\n"
+            "    define = backend_defines[backend]\n"
+            '    if sys.platform == "win32":\n'
+            '        cc = os.environ.get("CC", "cl")\n'
+            '        lib_path = os.path.join(pkg_dir, "sokol.dll")\n'
+            '        return [cc, "/nologo", "/O2", "/LD", "/DIMPL", f"/D{define}", *extra_args, *sources, f"/Fe{lib_path}"]\n'
+            '    cc = os.environ.get("CC", "cc")\n'
+            '    if sys.platform == "darwin":\n'
+            '        lib_path = os.path.join(pkg_dir, "libsokol.dylib")\n'
+            '        frameworks = ["Foundation", *system_libs(modules, backend, macos_frameworks, macos_backend_frameworks)]\n'
+            '        libs = [arg for framework in dict.fromkeys(frameworks) for arg in ["-framework", framework]]\n'
+            '        return [cc, "-shared", "-fPIC", "-O2", "-DIMPL", f"-D{define}", "-x", "objective-c", *extra_args, *sources, "-o", lib_path, *libs]\n'
+            '    lib_path = os.path.join(pkg_dir, "libsokol.so")\n'
+            '    libs = [*system_libs(modules, backend, linux_libs, linux_backend_libs), "-lm", "-ldl", "-lpthread"]\n'
+            '    return [cc, "-shared", "-fPIC", "-O2", "-DIMPL", f"-D{define}", *extra_args, *sources, "-o", lib_path, *libs]\n'
+            "\n"
+            "def main():\n"
+            '    parser = argparse.ArgumentParser(description="Build the sokol shared library, unknown args are passed to the C compiler")\n'
+            '    parser.add_argument("--backend", choices=backend_defines.keys(), default=default_backend())\n'
+            '    parser.add_argument("--modules", help="comma-separated modules to build (default: all in sokol/c)")\n'
+            "    args, extra_args = parser.parse_known_args()\n"
+            '    sources = sorted(glob.glob(os.path.join(c_dir, "sokol_*.c")))\n'
+            "    if args.modules:\n"
+            "        available = {module_name(source): source for source in sources}\n"
+            '        modules = args.modules.split(",")\n'
+            "        missing = [module for module in modules if module not in available]\n"
+            "        if missing:\n"
+            '            sys.exit(f"unknown modules: {\', \'.join(missing)} (available: {\', \'.join(available)})")\n'
+            "        sources = [available[module] for module in modules]\n"
+            "    cmd = build_cmd(sources, args.backend, extra_args)\n"
+            '    print(" ".join(cmd))\n'
+            "    # object files of cl go into the working directory\n"
+            "    with tempfile.TemporaryDirectory() as build_dir:\n"
+            "        subprocess.run(cmd, cwd=build_dir, check=True)\n"
+            "\n"
+            'if __name__ == "__main__":\n'
+            "    main()\n"
+        )
+
+
+def prepare():
+    print("=== Generating Python bindings:")
+    if not os.path.isdir(module_root):
+        os.makedirs(module_root)
+    if not os.path.isdir(c_root):
+        os.makedirs(c_root)
+    gen_clib()
+    gen_c_defines()
+    gen_build_script()
+
+
+# the path of the generated bindings file for a C prefix
+def get_output_path(c_prefix):
+    return f"{module_root}/{module_names[c_prefix]}.py"
+
+
+def gen(c_header_path, c_prefix, dep_c_prefixes):
+    if c_prefix not in module_names:
+        print(f" >> warning: skipping generation for {c_prefix} prefix...")
+        return
+    module_name = module_names[c_prefix]
+    c_source_path = c_source_paths[c_prefix]
+    print(f"  {c_header_path} => {module_name}")
+    reset_globals()
+    util.vendor_file(c_header_path, f"{c_root}/{os.path.basename(c_header_path)}")
+    gen_c_source(c_prefix)
+    ir = gen_ir.gen(c_header_path, c_source_path, module_name, c_prefix, dep_c_prefixes)
+    gen_module(ir, dep_c_prefixes)
+    output_path = get_output_path(c_prefix)
+    with open(output_path, "w", newline="\n") as f_outp:
+        f_outp.write(out_lines)
+    util.generated_files[output_path] = "python"
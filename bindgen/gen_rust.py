@@ -6,7 +6,7 @@
 #   - otherwise snake_case
 # -------------------------------------------------------------------------------
 import gen_ir
-import os, shutil, sys
+import os, re, sys
 
 import gen_util as util
 
@@ -44,8 +44,6 @@ ignores = [
     "sdtx_printf",
     "sdtx_vprintf",
     "simgui_add_key_event",
-    # "sg_install_trace_hooks",
-    # "sg_trace_hooks",
 ]
 
 range_struct_name = "Range"
@@ -327,18 +325,20 @@ def is_rust_string(rust_type):
 
 # get C-style arguments of a function pointer as string
 def funcptr_args_c(field_type, prefix):
+    return ", ".join(funcptr_arg_types_c(field_type, prefix))
+
+
+# get C-style argument types of a function pointer as list
+def funcptr_arg_types_c(field_type, prefix):
     tokens = field_type[field_type.index("(*)") + 4: -1].split(",")
-    s = ""
+    arg_types = []
     for token in tokens:
-        arg_type = token.strip()
-        if s != "":
-            s += ", "
-        c_arg = as_c_arg_type(None, arg_type, prefix)
+        c_arg = as_c_arg_type(None, token.strip(), prefix)
         if c_arg == "void":
-            return ""
+            return []
         else:
-            s += c_arg
-    return s
+            arg_types.append(c_arg)
+    return arg_types
 
 
 # get C-style result of a function pointer as string
@@ -370,7 +370,8 @@ def funcdecl_args_c(decl, prefix):
     return s
 
 
-def funcdecl_args_rust(decl, prefix):
+# NOTE: if c_str_args is True, string args are passed as &CStr instead of &str
+def funcdecl_args_rust(decl, prefix, c_str_args=False):
     s = ""
     func_name = decl["name"]
     for param_decl in decl["params"]:
@@ -380,7 +381,10 @@ def funcdecl_args_rust(decl, prefix):
         param_type = check_override(
             f"{func_name}.{param_name}", default=param_decl["type"]
         )
-        s += f"{as_rust_arg_type(f'{param_name}: ', param_type, prefix)}"
+        if c_str_args and util.is_string_ptr(param_type):
+            s += f"{param_name}: &core::ffi::CStr"
+        else:
+            s += f"{as_rust_arg_type(f'{param_name}: ', param_type, prefix)}"
     return s
 
 
@@ -415,6 +419,30 @@ def funcdecl_result_rust(decl, prefix):
         return f" -> {rust_res_type }"
 
 
+# rustdoc treats indented comment lines as Rust code blocks (and runs them as
+# doctests), so comments with indented lines are wrapped into a text block
+re_doc_url = re.compile(r"https?://[^\s<>]*[^\s<>.,;:)]")
+
+
+# the C comments are plain text, escape what rustdoc would parse as
+# intra-doc links (e.g. 'colors[i]') or HTML tags (e.g. 'id<MTLBuffer>'),
+# and turn bare URLs into autolinks
+def escape_doc_line(line):
+    for c in "[]<>":
+        line = line.replace(c, f"\\{c}")
+    return re_doc_url.sub(lambda m: f"<{m.group(0)}>", line)
+
+
+def gen_doc_comment(item, indent=""):
+    lines = util.doc_comment_lines(item, "///")
+    if any(line.startswith(("///     ", "///\t")) for line in lines):
+        lines = ["/// ```text", *lines, "/// ```"]
+    else:
+        lines = [escape_doc_line(line) for line in lines]
+    for line in lines:
+        l(f"{indent}{line}")
+
+
 def gen_struct(decl, prefix):
     struct_name = check_override(decl["name"])
     rust_type = as_rust_struct_type(struct_name, prefix)
@@ -564,10 +592,12 @@ def gen_struct(decl, prefix):
     #       core::mem::zeroed() cleaner?
     #
 
+    gen_doc_comment(decl)
     l("#[repr(C)]")
     l("#[derive(Copy, Clone, Debug)]")
     l(f"pub struct {rust_struct_type} {{")
-    for line in struct_lines:
+    for field, line in zip(decl["fields"], struct_lines):
+        gen_doc_comment(field, "    ")
         l(f"    {line},")
     l("}")
 
@@ -588,6 +618,9 @@ def gen_struct(decl, prefix):
 
 
 def gen_consts(decl, prefix):
+    # the comment of an anonymous enum describes the whole group of constants
+    for line in util.doc_comment_lines(decl, "//"):
+        l(line)
     for item in decl["items"]:
         #
         # TODO: What type should these constants have? Currently giving all `usize`
@@ -595,6 +628,7 @@ def gen_consts(decl, prefix):
         #
 
         item_name = check_override(item["name"])
+        gen_doc_comment(item)
         if item_name in special_constant_types:
             special_type = special_constant_types[item_name]
             l(f"pub const {as_upper_snake_case(item_name, prefix)}: {special_type} = {item['value']};")
@@ -615,6 +649,7 @@ def gen_enum(decl, prefix):
             is_u32 = True
             break
 
+    gen_doc_comment(decl)
     l("#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]")
     if is_u32:
         l("#[repr(u32)]")
@@ -626,6 +661,7 @@ def gen_enum(decl, prefix):
     l(f"pub enum {rust_enum_name} {{")
     for item_name, item in zip(names, decl["items"]):
         if item_name != "ForceU32":
+            gen_doc_comment(item, "    ")
             if "value" in item:
                 l(f"    {item_name} = {item['value']},")
             else:
@@ -652,20 +688,24 @@ def gen_func_c(decl, prefix):
     l("}")
 
 
-def gen_c_funcs(funcs):
+def gen_c_funcs(funcs, fragment_cache):
     l("pub mod ffi {")
     l("    #![allow(unused_imports)]")
     l("    use super::*;")
     l("    extern \"C\" {")
     for decl, prefix in funcs:
-        l(f"        pub fn {decl['name']}({funcdecl_args_c(decl, prefix)}){funcdecl_result_c(decl, prefix)};")
+        fragment_cache.emit(decl, lambda: gen_ffi_func(decl, prefix), part="ffi")
     l("    }")
     l("}")
 
 
-def gen_rust_funcs(funcs):
+def gen_ffi_func(decl, prefix):
+    l(f"        pub fn {decl['name']}({funcdecl_args_c(decl, prefix)}){funcdecl_result_c(decl, prefix)};")
+
+
+def gen_rust_funcs(funcs, fragment_cache):
     for decl, prefix in funcs:
-        gen_func_rust(decl, prefix)
+        fragment_cache.emit(decl, lambda: gen_func_rust(decl, prefix))
 
 
 def gen_func_rust(decl, prefix):
@@ -673,6 +713,7 @@ def gen_func_rust(decl, prefix):
     rust_func_name = util.as_lower_snake_case(check_override(decl["name"]), prefix)
     rust_res_type = funcdecl_result_rust(decl, prefix)
 
+    gen_doc_comment(decl)
     if c_func_name in c_callbacks:
         c_res_type = funcdecl_result_c(decl, prefix)
         l("#[inline]")
@@ -689,38 +730,66 @@ def gen_func_rust(decl, prefix):
         l("    }")
         l("}")
     else:
+        has_string_args = any(util.is_string_ptr(p["type"]) for p in decl["params"])
         l("#[inline]")
         l(f"pub fn {rust_func_name}({funcdecl_args_rust(decl, prefix)}){rust_res_type} {{")
-        for i, param_decl in enumerate(decl["params"]):
-            arg_name = param_decl["name"]
-            arg_type = param_decl["type"]
-            if util.is_string_ptr(arg_type):
-                l(f"        let tmp_{i} = std::ffi::CString::new({arg_name}).unwrap();")
-
-        l("    unsafe {")
+        gen_func_rust_body(decl, rust_res_type, "c_char_ptr_to_rust_str")
+        l("}")
+        if has_string_args:
+            # a variant which takes &CStr string args and passes them through without copying
+            l("#[inline]")
+            l(f"pub fn {rust_func_name}_cstr({funcdecl_args_rust(decl, prefix, c_str_args=True)}){rust_res_type} {{")
+            l("    unsafe {")
+            gen_func_rust_call(decl, rust_res_type, lambda i, arg_name: f"{arg_name}.as_ptr()", "c_char_ptr_to_rust_str")
+            l("    }")
+            l("}")
         if is_rust_string(rust_res_type):
-            # special case: convert C string to rust string slice
-            s = f"        c_char_ptr_to_rust_str(ffi::{c_func_name}("
+            # variants which skip the UTF-8 validation of the returned C string
+            l("#[inline]")
+            l(f"pub fn {rust_func_name}_as_cstr({funcdecl_args_rust(decl, prefix)}) -> &'static core::ffi::CStr {{")
+            gen_func_rust_body(decl, rust_res_type, "c_char_ptr_to_c_str")
+            l("}")
+            l("/// # Safety")
+            l("///")
+            l("/// The returned C string must be valid UTF-8, this isn't checked.")
+            l("#[inline]")
+            l(f"pub unsafe fn {rust_func_name}_unchecked({funcdecl_args_rust(decl, prefix)}){rust_res_type} {{")
+            gen_func_rust_body(decl, rust_res_type, "c_char_ptr_to_rust_str_unchecked")
+            l("}")
+
+
+# the body of a Rust wrapper function, &str args are copied into a
+# zero-terminated stack buffer if they're short enough
+def gen_func_rust_body(decl, rust_res_type, str_res_conv):
+    string_args = [(i, p["name"]) for i, p in enumerate(decl["params"]) if util.is_string_ptr(p["type"])]
+    l("    " + "".join(f"with_c_str({name}, |tmp_{i}| " for i, name in string_args) + "unsafe {")
+    gen_func_rust_call(decl, rust_res_type, lambda i, arg_name: f"tmp_{i}", str_res_conv)
+    l("    }" + ")" * len(string_args))
+
+
+# the C function call inside a Rust wrapper function, string args are
+# converted with as_c_str(arg_index, arg_name), a string result with
+# the str_res_conv helper function
+def gen_func_rust_call(decl, rust_res_type, as_c_str, str_res_conv):
+    c_func_name = decl["name"]
+    if is_rust_string(rust_res_type):
+        # special case: convert C string to rust string slice
+        s = f"        {str_res_conv}(ffi::{c_func_name}("
+    else:
+        s = f"        ffi::{c_func_name}("
+    for i, param_decl in enumerate(decl["params"]):
+        if i > 0:
+            s += ", "
+        arg_name = param_decl["name"]
+        arg_type = param_decl["type"]
+        if util.is_string_ptr(arg_type):
+            s += as_c_str(i, arg_name)
         else:
-            s = f"        ffi::{c_func_name}("
-
-        for i, param_decl in enumerate(decl["params"]):
-            if i > 0:
-                s += ", "
-            arg_name = param_decl["name"]
-            arg_type = param_decl["type"]
-
-            if util.is_string_ptr(arg_type):
-                s += f"tmp_{i}.as_ptr()"
-            else:
-                s += arg_name
-
-        if is_rust_string(rust_res_type):
-            s += ")"
+            s += arg_name
+    if is_rust_string(rust_res_type):
         s += ")"
-        l(s)
-        l("    }")
-        l("}")
+    s += ")"
+    l(s)
 
 
 def pre_parse(inp):
@@ -753,6 +822,35 @@ def gen_helpers(inp):
     l("    c_str.to_str().expect(\"c_char_ptr contained invalid Utf8 Data\")")
     l("}")
     l("")
+    l("/// Helper function to convert a C string to a CStr, skips the UTF-8 validation")
+    l("#[inline]")
+    l("fn c_char_ptr_to_c_str(c_char_ptr: *const core::ffi::c_char) -> &'static core::ffi::CStr {")
+    l("    unsafe { core::ffi::CStr::from_ptr(c_char_ptr) }")
+    l("}")
+    l("")
+    l("/// Helper function to convert a C string to a Rust string slice without UTF-8 validation,")
+    l("/// the caller must guarantee that the C string is valid UTF-8")
+    l("#[inline]")
+    l("unsafe fn c_char_ptr_to_rust_str_unchecked(c_char_ptr: *const core::ffi::c_char) -> &'static str {")
+    l("    core::str::from_utf8_unchecked(core::ffi::CStr::from_ptr(c_char_ptr).to_bytes())")
+    l("}")
+    l("")
+    l("/// Helper function to pass a Rust string slice to C as a zero-terminated string,")
+    l("/// short strings are copied into a stack buffer instead of allocating a CString")
+    l("#[inline]")
+    l("fn with_c_str<R>(s: &str, f: impl FnOnce(*const core::ffi::c_char) -> R) -> R {")
+    l("    const STACK_BUF_SIZE: usize = 256;")
+    l("    let bytes = s.as_bytes();")
+    l("    if bytes.len() < STACK_BUF_SIZE && !bytes.contains(&0) {")
+    l("        let mut buf = [0u8; STACK_BUF_SIZE];")
+    l("        buf[..bytes.len()].copy_from_slice(bytes);")
+    l("        f(buf.as_ptr() as *const core::ffi::c_char)")
+    l("    } else {")
+    l("        let c_string = std::ffi::CString::new(s).unwrap();")
+    l("        f(c_string.as_ptr())")
+    l("    }")
+    l("}")
+    l("")
 
     if inp['prefix'] in ['sg_', 'sdtx_', 'sshape_', 'sapp_']:
         l("/// Helper function to cast a Rust slice into a sokol Range")
@@ -803,6 +901,116 @@ def gen_helpers(inp):
     #     l("}")
     #     l("")
 
+    if inp["prefix"] == "sgl_":
+        gen_vertex_slice_helpers(inp)
+
+    if inp["prefix"] == "sg_":
+        gen_frame_stats_helpers(inp)
+
+
+# a flat array view of FrameStats and a ring buffer collector with rolling
+# averages and percentiles over the last N frames, without allocations
+def gen_frame_stats_helpers(inp):
+    values = util.frame_stats_values(inp)
+    l("/// Number of values in a flattened `FrameStats` struct")
+    l(f"pub const FRAME_STATS_NUM_VALUES: usize = {len(values)};")
+    l("/// Names of the values in a flattened `FrameStats` struct")
+    l("pub const FRAME_STATS_NAMES: [&str; FRAME_STATS_NUM_VALUES] = [")
+    for name, _ in values:
+        l(f'    "{name}",')
+    l("];")
+    l("/// Flat array view of a `FrameStats` struct, for instance for exporting")
+    l("pub fn frame_stats_flatten(stats: &FrameStats) -> [u32; FRAME_STATS_NUM_VALUES] {")
+    l("    [")
+    for _, path in values:
+        l(f"        stats.{'.'.join([check_override(field['name']) for field in path])},")
+    l("    ]")
+    l("}")
+    l("")
+    l("/// Records the flattened frame stats of the last `N` frames,")
+    l("/// call `push(&query_frame_stats())` once per frame")
+    l("#[derive(Copy, Clone, Debug)]")
+    l("pub struct FrameStatsCollector<const N: usize> {")
+    l("    frames: [[u32; FRAME_STATS_NUM_VALUES]; N],")
+    l("    num: usize,")
+    l("    pos: usize,")
+    l("}")
+    l("impl<const N: usize> Default for FrameStatsCollector<N> {")
+    l("    fn default() -> Self {")
+    l("        Self::new()")
+    l("    }")
+    l("}")
+    l("impl<const N: usize> FrameStatsCollector<N> {")
+    l("    pub const fn new() -> Self {")
+    l("        Self { frames: [[0; FRAME_STATS_NUM_VALUES]; N], num: 0, pos: 0 }")
+    l("    }")
+    l("    pub fn push(&mut self, stats: &FrameStats) {")
+    l("        self.frames[self.pos] = frame_stats_flatten(stats);")
+    l("        self.pos = (self.pos + 1) % N;")
+    l("        self.num = (self.num + 1).min(N);")
+    l("    }")
+    l("    /// Number of recorded frames")
+    l("    pub fn len(&self) -> usize {")
+    l("        self.num")
+    l("    }")
+    l("    pub fn is_empty(&self) -> bool {")
+    l("        self.num == 0")
+    l("    }")
+    l("    /// The most recently pushed frame stats")
+    l("    pub fn latest(&self) -> Option<&[u32; FRAME_STATS_NUM_VALUES]> {")
+    l("        if self.num == 0 {")
+    l("            return None;")
+    l("        }")
+    l("        Some(&self.frames[(self.pos + N - 1) % N])")
+    l("    }")
+    l("    /// Average of a value over the recorded frames")
+    l("    pub fn average(&self, value_index: usize) -> f64 {")
+    l("        if self.num == 0 {")
+    l("            return 0.0;")
+    l("        }")
+    l("        let sum: u64 = self.frames[..self.num].iter().map(|frame| frame[value_index] as u64).sum();")
+    l("        sum as f64 / self.num as f64")
+    l("    }")
+    l("    /// Nearest-rank percentile (0..100) of a value over the recorded frames")
+    l("    pub fn percentile(&self, value_index: usize, p: u32) -> u32 {")
+    l("        if self.num == 0 {")
+    l("            return 0;")
+    l("        }")
+    l("        let mut values = [0u32; N];")
+    l("        for (value, frame) in values.iter_mut().zip(&self.frames[..self.num]) {")
+    l("            *value = frame[value_index];")
+    l("        }")
+    l("        let values = &mut values[..self.num];")
+    l("        values.sort_unstable();")
+    l("        let rank = (p.min(100) as usize * self.num + 99) / 100;")
+    l("        values[rank.saturating_sub(1)]")
+    l("    }")
+    l("}")
+    l("")
+
+
+def gen_vertex_slice_helpers(inp):
+    prefix = inp["prefix"]
+    for decl in util.vertex_funcs(inp):
+        c_func_name = decl["name"]
+        vtx_type = util.as_upper_camel_case(c_func_name, prefix)
+        l(f"/// Vertex struct for the slice-taking variant of `{util.as_lower_snake_case(c_func_name, prefix)}`")
+        l("#[repr(C)]")
+        l("#[derive(Copy, Clone, Debug, Default)]")
+        l(f"pub struct {vtx_type} {{")
+        for param_decl in decl["params"]:
+            l(f"    pub {param_decl['name']}: {as_rust_prim_type(param_decl['type'])},")
+        l("}")
+        l("/// Submit a slice of vertices, the loop runs on the Rust side without per-vertex wrapper calls")
+        l("#[inline]")
+        l(f"pub fn {util.as_lower_snake_case(c_func_name, prefix)}_slice(vertices: &[{vtx_type}]) {{")
+        l("    for vtx in vertices {")
+        args = ", ".join([f"vtx.{param_decl['name']}" for param_decl in decl["params"]])
+        l(f"        unsafe {{ ffi::{c_func_name}({args}) }}")
+        l("    }")
+        l("}")
+    l("")
+
 
 def gen_module(inp, dep_prefixes):
     module = inp['module']
@@ -824,6 +1032,7 @@ def gen_module(inp, dep_prefixes):
 
     funcs = []
 
+    fragment_cache = util.FragmentCache(sys.modules[__name__], inp, [ignores, overrides])
     for decl in inp["decls"]:
         #
         #    HACK: gen_ir.py accidentally marks all sg_imgui_ declarations as is_dep since sg_imgui
@@ -836,17 +1045,105 @@ def gen_module(inp, dep_prefixes):
         if not decl["is_dep"] or dep_hack:
             kind = decl["kind"]
             if kind == "consts":
-                gen_consts(decl, prefix)
+                fragment_cache.emit(decl, lambda: gen_consts(decl, prefix))
             elif not check_ignore(decl["name"]):
                 if kind == "struct":
-                    gen_struct(decl, prefix)
+                    fragment_cache.emit(decl, lambda: gen_struct(decl, prefix))
                 elif kind == "enum":
-                    gen_enum(decl, prefix)
+                    fragment_cache.emit(decl, lambda: gen_enum(decl, prefix))
                 elif kind == "func":
                     funcs.append((decl, prefix))
 
-    gen_c_funcs(funcs)
-    gen_rust_funcs(funcs)
+    gen_c_funcs(funcs, fragment_cache)
+    gen_rust_funcs(funcs, fragment_cache)
+    fragment_cache.save()
+
+    if prefix == "sg_":
+        gen_tracer(inp, prefix)
+
+
+# a Tracer struct which installs itself into the sg_trace_hooks callback table,
+# one callback per traced function which bumps a counter and chains to the previous hooks
+def gen_tracer(inp, prefix):
+    hooks = [decl for decl in inp["decls"] if decl["kind"] == "struct" and decl["name"] == "sg_trace_hooks"][0]
+    hook_fields = [field for field in hooks["fields"] if util.is_func_ptr(field["type"])]
+    l("/// Call counts of the sokol-gfx functions traced by a `Tracer`")
+    l("#[derive(Copy, Clone, Debug, Default)]")
+    l("pub struct TracerCounts {")
+    for field in hook_fields:
+        l(f"    pub {field['name']}: u32,")
+    l("}")
+    l("")
+    l("/// A lightweight sokol-gfx call tracer which counts the calls of each traced")
+    l("/// function and measures the CPU time spent between `begin_pass()` and `end_pass()`.")
+    l("/// The previously installed trace hooks are called too. The sokol-gfx")
+    l("/// implementation must be compiled with `SOKOL_TRACE_HOOKS`.")
+    l("#[derive(Debug)]")
+    l("pub struct Tracer {")
+    l("    pub counts: TracerCounts,")
+    l("    pub pass_time: std::time::Duration,")
+    l("    pass_start: Option<std::time::Instant>,")
+    l("    prev_hooks: TraceHooks,")
+    l("}")
+    l("impl Default for Tracer {")
+    l("    fn default() -> Self {")
+    l("        Self::new()")
+    l("    }")
+    l("}")
+    l("impl Tracer {")
+    l("    pub const fn new() -> Self {")
+    l("        Self {")
+    l("            counts: TracerCounts {")
+    for field in hook_fields:
+        l(f"                {field['name']}: 0,")
+    l("            },")
+    l("            pass_time: std::time::Duration::ZERO,")
+    l("            pass_start: None,")
+    l("            prev_hooks: TraceHooks::new(),")
+    l("        }")
+    l("    }")
+    l("    /// Install the tracer")
+    l("    ///")
+    l("    /// # Safety")
+    l("    ///")
+    l("    /// The tracer must not be moved or dropped until `uninstall()` is called.")
+    l("    pub unsafe fn install(&mut self) {")
+    l("        self.prev_hooks = install_trace_hooks(&TraceHooks {")
+    l("            user_data: self as *mut Tracer as *mut core::ffi::c_void,")
+    for field in hook_fields:
+        l(f"            {field['name']}: Some(Self::trace_{field['name']}),")
+    l("        });")
+    l("    }")
+    l("    /// Restore the trace hooks which were installed before the tracer")
+    l("    pub fn uninstall(&mut self) {")
+    l("        install_trace_hooks(&self.prev_hooks);")
+    l("    }")
+    l("    /// Reset the counters and timings, for instance at the start of a frame")
+    l("    pub fn reset(&mut self) {")
+    l("        self.counts = TracerCounts::default();")
+    l("        self.pass_time = std::time::Duration::ZERO;")
+    l("    }")
+    for field in hook_fields:
+        field_name = field["name"]
+        arg_types = funcptr_arg_types_c(field["type"], prefix)
+        if arg_types[-1] != "*mut core::ffi::c_void":
+            sys.exit(f"ERROR gen_tracer(): {field_name} has no user_data arg")
+        arg_names = [f"a{i}" for i in range(len(arg_types) - 1)]
+        args = ", ".join([f"{name}: {arg_type}" for name, arg_type in zip(arg_names, arg_types)] + ["user_data: *mut core::ffi::c_void"])
+        l(f'    extern "C" fn trace_{field_name}({args}) {{')
+        l("        let tracer = unsafe { &mut *(user_data as *mut Tracer) };")
+        l(f"        tracer.counts.{field_name} += 1;")
+        if field_name == "begin_pass":
+            l("        tracer.pass_start = Some(std::time::Instant::now());")
+        elif field_name == "end_pass":
+            l("        if let Some(start) = tracer.pass_start.take() {")
+            l("            tracer.pass_time += start.elapsed();")
+            l("        }")
+        l(f"        if let Some(prev) = tracer.prev_hooks.{field_name} {{")
+        l(f"            prev({', '.join(arg_names + ['tracer.prev_hooks.user_data'])});")
+        l("        }")
+        l("    }")
+    l("}")
 
 
 def prepare():
@@ -860,6 +1157,11 @@ def prepare():
         f_outp.write("//! Automatically generated sokol bindings for Rust\n\n")
 
 
+# the path of the generated bindings file for a C prefix
+def get_output_path(c_prefix):
+    return f"sokol-rust/src/{module_names[c_prefix]}.rs"
+
+
 def gen(c_header_path, c_prefix, dep_c_prefixes):
     if c_prefix not in module_names:
         print(f' >> warning: skipping generation for {c_prefix} prefix...')
@@ -870,12 +1172,13 @@ def gen(c_header_path, c_prefix, dep_c_prefixes):
     print(f'  {c_header_path} => {module_name}')
     reset_globals()
     c_path_in_project = f'sokol-rust/src/sokol/c/{os.path.basename(c_header_path)}'
-    shutil.copyfile(c_header_path, c_path_in_project)
+    util.vendor_file(c_header_path, c_path_in_project)
     ir = gen_ir.gen(c_header_path, c_source_path, module_name, c_prefix, dep_c_prefixes)
     gen_module(ir, dep_c_prefixes)
-    output_path = f"sokol-rust/src/{ir['module']}.rs"
+    output_path = get_output_path(c_prefix)
     with open(output_path, 'w', newline='\n') as f_outp:
         f_outp.write(out_lines)
+    util.generated_files[output_path] = 'rust'
 
     with open("sokol-rust/src/lib.rs", "a", newline="\n") as f_outp:
         module = ir['module']
@@ -1,5 +1,11 @@
 # common utility functions for all bindings generators
-import re
+import hashlib, json, os, re, shutil, sys
+from functools import lru_cache
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 re_1d_array = re.compile(r"^(?:const )?\w*\s*\*?\[\d*\]$")
 re_2d_array = re.compile(r"^(?:const )?\w*\s*\*?\[\d*\]\[\d*\]$")
@@ -67,3 +73,274 @@ def as_lower_camel_case(s, prefix):
     for part in parts[1:]:
         outp += part.capitalize()
     return outp
+
+
+# prefix_bla_blub => BlaBlub
+def as_upper_camel_case(s, prefix):
+    outp = as_lower_camel_case(s, prefix)
+    return outp[:1].upper() + outp[1:]
+
+
+re_vertex_func = re.compile(r"^sgl_v[23]f(?:_t2f)?(?:_c(?:3f|3b|4f|4b|1i))?$")
+
+
+# the per-vertex sokol_gl functions (sgl_v2f, sgl_v3f_t2f_c4b, ...) which
+# get slice-taking bulk variants in the bindings
+def vertex_funcs(inp):
+    return [
+        decl
+        for decl in inp["decls"]
+        if decl["kind"] == "func" and re_vertex_func.match(decl["name"]) is not None
+    ]
+
+
+# the leaf fields of a struct and its nested struct fields as list of
+# (field decl path, field type) tuples, for flat array views of nested
+# structs like sg_frame_stats
+def flat_struct_fields(inp, struct_name):
+    struct_decls = {decl["name"]: decl for decl in inp["decls"] if decl["kind"] == "struct"}
+
+    def walk(name, path):
+        outp = []
+        for field in struct_decls[name]["fields"]:
+            if field["type"] in struct_decls:
+                outp += walk(field["type"], path + [field])
+            else:
+                outp.append((path + [field], field["type"]))
+        return outp
+
+    return walk(struct_name, [])
+
+
+# the flat value names of sg_frame_stats for the frame stats collector
+# helpers, nested field names are joined with '.' (e.g. "gl.num_bind_buffer")
+def frame_stats_values(inp):
+    values = []
+    for path, field_type in flat_struct_fields(inp, "sg_frame_stats"):
+        if field_type != "uint32_t":
+            sys.exit(f"ERROR frame_stats_values(): {'.'.join(f['name'] for f in path)}: {field_type}")
+        values.append((".".join([field["name"] for field in path]), path))
+    return values
+
+
+# the C name of the module's own pointer/size range struct (e.g. 'sg_range',
+# 'sfetch_range_t') for the slice-to-range helpers, or None
+def range_struct_name(inp):
+    for decl in inp["decls"]:
+        if decl["kind"] == "struct" and not decl["is_dep"] and decl["name"] in [f"{inp['prefix']}range", f"{inp['prefix']}range_t"]:
+            return decl["name"]
+    return None
+
+
+# the (size, alignment, {field name: offset}) of a struct decl as evaluated
+# by clang for the target the IR was generated on (see the IR's
+# 'pointer_size'), or None for IR files without layout information
+def struct_layout(decl):
+    if "size" not in decl:
+        return None
+    offsets = {field["name"]: field["offset"] for field in decl["fields"] if "name" in field}
+    return decl["size"], decl["align"], offsets
+
+
+# the lines of the doc comment of a decl, struct field or enum item (see
+# gen_ir.HeaderText), each prefixed with the comment marker, e.g. '///'
+def doc_comment_lines(item, marker):
+    if "comment" not in item:
+        return []
+    return [f"{marker} {line}".rstrip() for line in item["comment"].split("\n")]
+
+
+# a copy of a decl without the doc comments
+def without_comments(decl):
+    outp = {k: v for k, v in decl.items() if k != "comment"}
+    for key in ["fields", "items"]:
+        if key in outp:
+            outp[key] = [{k: v for k, v in item.items() if k != "comment"} for item in outp[key]]
+    return outp
+
+
+# -------------------------------------------------------------------------------
+#   Decl-level cache of generated code across runs, enabled by setting
+#   SOKOL_BINDGEN_FRAGMENT_CACHE to a cache directory. Each backend stores
+#   the code it emitted for a decl under a hash of the decl's IR, the module
+#   context (struct and enum decls are used for type mapping everywhere),
+#   the backend's config (overrides, ignores...) and the generator sources.
+#   On the next run unchanged decls are copied from the cache and only
+#   changed decls are generated again.
+# -------------------------------------------------------------------------------
+fragment_cache_dir = os.environ.get("SOKOL_BINDGEN_FRAGMENT_CACHE")
+
+# (backend module name, module name) => (reused fragments, generated fragments)
+fragment_cache_stats = {}
+
+
+def content_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).digest()
+
+
+@lru_cache(maxsize=None)
+def _source_hash(path, mtime_ns):
+    return content_hash(path)
+
+
+def source_hash(path):
+    return _source_hash(path, os.stat(path).st_mtime_ns)
+
+
+class FragmentCache:
+    # backend is the generator module which emits code into its out_lines
+    # global, config everything besides the IR which affects the output
+    def __init__(self, backend, inp, config):
+        self.backend = backend
+        self.module = inp["module"]
+        self.fragments = {}
+        self.used = {}
+        self.hits = 0
+        self.misses = 0
+        if fragment_cache_dir is None:
+            return
+        self.path = os.path.join(fragment_cache_dir, backend.__name__, f"{self.module}.json")
+        h = hashlib.blake2b(digest_size=16)
+        h.update(source_hash(backend.__file__))
+        h.update(source_hash(__file__))
+        context = [
+            inp["module"],
+            inp["prefix"],
+            inp["dep_prefixes"],
+            # doc comments only end up in the code of their own decl
+            [without_comments(decl) for decl in inp["decls"] if decl["kind"] in ["struct", "enum"]],
+            config,
+        ]
+        h.update(json.dumps(context, sort_keys=True, default=repr).encode("utf-8"))
+        self.base_key = h.hexdigest()
+        if os.path.isfile(self.path):
+            with open(self.path, "r") as f:
+                self.fragments = json.load(f)
+
+    # emit the code for a decl, either from the cache or by calling gen_func,
+    # part distinguishes several fragments generated for the same decl
+    def emit(self, decl, gen_func, part=""):
+        if fragment_cache_dir is None:
+            gen_func()
+            return
+        key = hashlib.blake2b(
+            f"{self.base_key}:{part}:{json.dumps(decl, sort_keys=True)}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+        fragment = self.fragments.get(key)
+        if fragment is None:
+            start = len(self.backend.out_lines)
+            gen_func()
+            fragment = self.backend.out_lines[start:]
+            self.misses += 1
+        else:
+            self.backend.out_lines += fragment
+            self.hits += 1
+        self.used[key] = fragment
+
+    # write the fragments of this run back, which drops stale fragments
+    def save(self):
+        if fragment_cache_dir is None:
+            return
+        fragment_cache_stats[(self.backend.__name__, self.module)] = (self.hits, self.misses)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", newline="\n") as f:
+            f.write(json.dumps(self.used))
+        os.replace(tmp_path, self.path)
+
+
+# generated bindings file path => language, for the validation in gen_validate.py
+generated_files = {}
+
+
+# -------------------------------------------------------------------------------
+#   Vendoring of the sokol headers into the bindings repositories. Each
+#   source header is hashed once per run, a destination file which is
+#   already identical is left alone, otherwise the destination is replaced
+#   atomically with a reflink (copy-on-write clone, Linux only) or a hardlink
+#   of the source if the filesystem allows, or with a copy. Hardlinks are
+#   opt-in with SOKOL_BINDGEN_VENDOR_HARDLINKS=1, since an edit of a
+#   hardlinked header in a bindings repository would also change the sokol
+#   header and all other vendored copies. Replaced destinations get a fresh
+#   mtime, so that mtime-based build systems rebuild after a header change.
+# -------------------------------------------------------------------------------
+vendor_hardlinks = os.environ.get("SOKOL_BINDGEN_VENDOR_HARDLINKS", "0") == "1"
+
+# the ioctl to clone a file on Linux (btrfs, xfs...)
+FICLONE = 0x40049409
+
+# destination path => 'unchanged', 'reflinked', 'hardlinked' or 'copied'
+vendored_files = {}
+
+
+# a destination of the same size is compared by content, the source hash is
+# cached since a header is vendored into several bindings repositories
+def is_same_file(src_path, dst_path):
+    if not os.path.isfile(dst_path):
+        return False
+    src_stat = os.stat(src_path)
+    dst_stat = os.stat(dst_path)
+    if os.path.samestat(src_stat, dst_stat):
+        return True
+    if src_stat.st_size != dst_stat.st_size:
+        return False
+    return source_hash(src_path) == content_hash(dst_path)
+
+
+def reflink(src_path, tmp_path):
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    with open(src_path, "rb") as src, open(tmp_path, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return True
+        except OSError:
+            pass
+    os.remove(tmp_path)
+    return False
+
+
+def hardlink(src_path, tmp_path):
+    if not vendor_hardlinks:
+        return False
+    try:
+        os.link(src_path, tmp_path)
+        return True
+    except OSError:
+        return False
+
+
+# copy src_path to dst_path unless it's already identical, returns how the
+# file was vendored
+def vendor_file(src_path, dst_path):
+    if is_same_file(src_path, dst_path):
+        method = "unchanged"
+    else:
+        tmp_path = f"{dst_path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        if reflink(src_path, tmp_path):
+            method = "reflinked"
+        elif hardlink(src_path, tmp_path):
+            method = "hardlinked"
+        else:
+            shutil.copyfile(src_path, tmp_path)
+            method = "copied"
+        os.replace(tmp_path, dst_path)
+    # keep the first change to a destination when it's vendored several times
+    if vendored_files.get(dst_path, "unchanged") == "unchanged":
+        vendored_files[dst_path] = method
+    return method
+
+
+def print_vendor_summary():
+    if not vendored_files:
+        return
+    counts = {}
+    for method in vendored_files.values():
+        counts[method] = counts.get(method, 0) + 1
+    print(f"  vendored {len(vendored_files)} headers ({', '.join(f'{n} {m}' for m, n in counts.items())})")
+    for dst_path, method in vendored_files.items():
+        if method != "unchanged":
+            print(f"    {method}: {dst_path}")
@@ -8,7 +8,6 @@
 # -------------------------------------------------------------------------------
 import gen_ir
 import os
-import shutil
 import sys
 
 import gen_util as util
@@ -113,6 +112,8 @@ keywords = """
 shared lock continue
 """.split()
 
+# number of frames recorded by the generated FrameStatsCollector
+frame_stats_num_frames = 120
 
 struct_types = []
 enum_types = []
@@ -505,6 +506,20 @@ def gen_enum(decl, prefix):
     l("}")
 
 
+# true if the vlang wrapper would have exactly the same signature as the C function
+def is_abi_identical(decl, prefix):
+    func_name = decl["name"]
+    for param_decl in decl["params"]:
+        param_type = check_override(
+            f"{func_name}.{param_decl['name']}", default=param_decl["type"]
+        )
+        c_arg_type = as_c_arg_type(param_type, prefix)
+        if c_arg_type != as_vlang_arg_type("", param_type, prefix):
+            return False
+    c_res_type = funcdecl_result_c(decl, prefix) or "void"
+    return c_res_type == funcdecl_result_vlang(decl, prefix)
+
+
 def gen_func_c(decl, prefix):
     l(
         f"fn C.{decl['name']}({funcdecl_args_c(decl, prefix)}) {funcdecl_result_c(decl, prefix)}"
@@ -519,37 +534,53 @@ def gen_func_vlang(decl, prefix):
         l(f"pub const {vlang_func_name} = {c_func_name}")
     else:
         vlang_res_type = funcdecl_result_vlang(decl, prefix)
+        if is_abi_identical(decl, prefix):
+            # vlang has no function aliases, instead let the C compiler
+            # inline the wrapper so that it collapses into the C call
+            l("@[inline]")
         if vlang_res_type == "void":
             l(f"pub fn {vlang_func_name}({funcdecl_args_vlang(decl, prefix)}) {{")
         else:
             l(
                 f"pub fn {vlang_func_name}({funcdecl_args_vlang(decl, prefix)}) {vlang_res_type} {{"
             )
+        c_call = f"C.{c_func_name}({funcdecl_call_args_vlang(decl)})"
         if is_vlang_string(vlang_res_type):
             # special case: convert C string to vlang string slice
-            s = f"    return unsafe {{ cstring_to_vstring(C.{c_func_name}("
+            l(f"    return unsafe {{ cstring_to_vstring({c_call}) }}")
         elif vlang_res_type != "void":
-            s = f"    return C.{c_func_name}("
+            l(f"    return {c_call}")
         else:
-            s = f"    C.{c_func_name}("
-        for i, param_decl in enumerate(decl["params"]):
-            if i > 0:
-                s += ", "
-            arg_name = wrap_keywords(param_decl["name"])
-            arg_type = param_decl["type"]
-            if is_const_struct_ptr(arg_type):
-                s += f"{arg_name}"
-            elif util.is_string_ptr(arg_type):
-                s += f"vstring_to_cstring({arg_name})"
-            else:
-                s += arg_name
-        if is_vlang_string(vlang_res_type):
-            s += ")"
-        s += ")"
-        if is_vlang_string(vlang_res_type):
-            s += " }"
-        l(s)
+            l(f"    {c_call}")
         l("}")
+        if is_vlang_string(vlang_res_type):
+            # non-allocating variants for frequently polled string getters
+            args = funcdecl_args_vlang(decl, prefix)
+            l("// same as above, but the returned string borrows the C string without copying")
+            l(f"pub fn {vlang_func_name}_view({args}) string {{")
+            l(f"    return unsafe {{ {c_call}.vstring() }}")
+            l("}")
+            l("// same as above, but returns the raw C string pointer")
+            l(f"pub fn {vlang_func_name}_raw({args}) &u8 {{")
+            l(f"    return {c_call}")
+            l("}")
+
+
+# the arguments of a C function call inside a vlang wrapper function
+def funcdecl_call_args_vlang(decl):
+    s = ""
+    for i, param_decl in enumerate(decl["params"]):
+        if i > 0:
+            s += ", "
+        arg_name = wrap_keywords(param_decl["name"])
+        arg_type = param_decl["type"]
+        if is_const_struct_ptr(arg_type):
+            s += f"{arg_name}"
+        elif util.is_string_ptr(arg_type):
+            s += f"vstring_to_cstring({arg_name})"
+        else:
+            s += arg_name
+    return s
 
 
 def pre_parse(inp):
@@ -581,6 +612,107 @@ def gen_helpers(inp):
     l("fn vstring_to_cstring(v_str string) &u8 {")
     l("    return v_str.str")
     l("}")
+    if util.range_struct_name(inp) is not None:
+        gen_range_helpers(inp)
+    if inp["prefix"] == "sg_":
+        gen_frame_stats_helpers(inp)
+
+
+# non-copying conversions of arrays, fixed-size arrays and single values
+# into the module's Range struct
+def gen_range_helpers(inp):
+    range_type = as_vlang_struct_type(util.range_struct_name(inp), inp["prefix"])
+    l(f"// helper function to get a {range_type} pointing into an array, without copying")
+    l(f"pub fn slice_as_range[T](data []T) {range_type} {{")
+    l(f"    return {range_type}{{")
+    l("        ptr: data.data")
+    l("        size: usize(data.len) * usize(sizeof(T))")
+    l("    }")
+    l("}")
+    l(f"// helper function to get a {range_type} pointing to a single value or a fixed-size")
+    l("// array (e.g. `value_as_range(&vertices)`), without copying")
+    l(f"pub fn value_as_range[T](value &T) {range_type} {{")
+    l(f"    return {range_type}{{")
+    l("        ptr: voidptr(value)")
+    l("        size: usize(sizeof(T))")
+    l("    }")
+    l("}")
+
+
+# a flat array view of FrameStats and a ring buffer collector with rolling
+# averages and percentiles over the last frames, without allocations
+def gen_frame_stats_helpers(inp):
+    values = util.frame_stats_values(inp)
+    l("// number of values in a flattened FrameStats struct")
+    l(f"pub const frame_stats_num_values = {len(values)}")
+    l("// number of frames recorded by a FrameStatsCollector")
+    l(f"pub const frame_stats_num_frames = {frame_stats_num_frames}")
+    l("// names of the values in a flattened FrameStats struct")
+    l("pub const frame_stats_names = [")
+    for name, _ in values:
+        l(f"    '{name}',")
+    l("]!")
+    l("// flat array view of a FrameStats struct, for instance for exporting")
+    l("pub fn frame_stats_flatten(stats &FrameStats) [frame_stats_num_values]u32 {")
+    l("    return [")
+    for _, path in values:
+        l(f"        stats.{'.'.join([check_override(field['name']) for field in path])},")
+    l("    ]!")
+    l("}")
+    l("// records the flattened frame stats of the last frame_stats_num_frames frames,")
+    l("// call push(query_frame_stats()) once per frame")
+    l("pub struct FrameStatsCollector {")
+    l("mut:")
+    l("    frames [frame_stats_num_frames][frame_stats_num_values]u32")
+    l("    num    int")
+    l("    pos    int")
+    l("}")
+    l("pub fn (mut c FrameStatsCollector) push(stats &FrameStats) {")
+    l("    c.frames[c.pos] = frame_stats_flatten(stats)")
+    l("    c.pos = (c.pos + 1) % frame_stats_num_frames")
+    l("    if c.num < frame_stats_num_frames {")
+    l("        c.num++")
+    l("    }")
+    l("}")
+    l("// number of recorded frames")
+    l("pub fn (c &FrameStatsCollector) len() int {")
+    l("    return c.num")
+    l("}")
+    l("// the most recently pushed frame stats, len() must be > 0")
+    l("pub fn (c &FrameStatsCollector) latest() [frame_stats_num_values]u32 {")
+    l("    assert c.num > 0")
+    l("    return c.frames[(c.pos + frame_stats_num_frames - 1) % frame_stats_num_frames]")
+    l("}")
+    l("// average of a value over the recorded frames")
+    l("pub fn (c &FrameStatsCollector) average(value_index int) f64 {")
+    l("    if c.num == 0 {")
+    l("        return 0.0")
+    l("    }")
+    l("    mut sum := u64(0)")
+    l("    for i in 0 .. c.num {")
+    l("        sum += u64(c.frames[i][value_index])")
+    l("    }")
+    l("    return f64(sum) / f64(c.num)")
+    l("}")
+    l("// nearest-rank percentile (0..100) of a value over the recorded frames")
+    l("pub fn (c &FrameStatsCollector) percentile(value_index int, p int) u32 {")
+    l("    if c.num == 0 {")
+    l("        return 0")
+    l("    }")
+    l("    // insertion sort into a stack buffer, avoids allocating")
+    l("    mut values := [frame_stats_num_frames]u32{}")
+    l("    for i in 0 .. c.num {")
+    l("        value := c.frames[i][value_index]")
+    l("        mut j := i")
+    l("        for j > 0 && values[j - 1] > value {")
+    l("            values[j] = values[j - 1]")
+    l("            j--")
+    l("        }")
+    l("        values[j] = value")
+    l("    }")
+    l("    rank := ((if p < 100 { p } else { 100 }) * c.num + 99) / 100")
+    l("    return values[if rank > 0 { rank - 1 } else { 0 }]")
+    l("}")
 
 
 def gen_extra(inp):
@@ -654,6 +786,21 @@ def gen_extra(inp):
     l(f'#include "{c_source_path}"')
 
 
+# the code for a single decl of the module, emitted through the fragment cache
+def gen_decl(decl, prefix):
+    kind = decl["kind"]
+    if kind == "consts":
+        gen_consts(decl, prefix)
+    elif not check_ignore(decl["name"]):
+        if kind == "struct":
+            gen_struct(decl, prefix)
+        elif kind == "enum":
+            gen_enum(decl, prefix)
+        elif kind == "func":
+            gen_func_c(decl, prefix)
+            gen_func_vlang(decl, prefix)
+
+
 def gen_module(inp, dep_prefixes):
     l("// machine generated, do not edit")
     l("")
@@ -664,19 +811,11 @@ def gen_module(inp, dep_prefixes):
     gen_helpers(inp)
     pre_parse(inp)
     prefix = inp["prefix"]
+    fragment_cache = util.FragmentCache(sys.modules[__name__], inp, [ignores, overrides, frame_stats_num_frames])
     for decl in inp["decls"]:
         if not decl["is_dep"]:
-            kind = decl["kind"]
-            if kind == "consts":
-                gen_consts(decl, prefix)
-            elif not check_ignore(decl["name"]):
-                if kind == "struct":
-                    gen_struct(decl, prefix)
-                elif kind == "enum":
-                    gen_enum(decl, prefix)
-                elif kind == "func":
-                    gen_func_c(decl, prefix)
-                    gen_func_vlang(decl, prefix)
+            fragment_cache.emit(decl, lambda: gen_decl(decl, prefix))
+    fragment_cache.save()
 
 
 def prepare():
@@ -687,6 +826,11 @@ def prepare():
         os.makedirs("sokol-v/src/sokol/c")
 
 
+# the path of the generated bindings file for a C prefix
+def get_output_path(c_prefix):
+    return f"{module_root}/{module_names[c_prefix]}/{module_names[c_prefix]}.c.v"
+
+
 def gen(c_header_path, c_prefix, dep_c_prefixes):
     if c_prefix not in module_names:
         print(f" >> warning: skipping generation for {c_prefix} prefix...")
@@ -697,9 +841,10 @@ def gen(c_header_path, c_prefix, dep_c_prefixes):
     reset_globals()
 
     make_v_module_directory(c_prefix)
-    shutil.copyfile(c_header_path, f"{c_root}/{os.path.basename(c_header_path)}")
+    util.vendor_file(c_header_path, f"{c_root}/{os.path.basename(c_header_path)}")
     ir = gen_ir.gen(c_header_path, c_source_path, module_name, c_prefix, dep_c_prefixes)
     gen_module(ir, dep_c_prefixes)
-    output_path = f"{module_root}/{ir['module']}/{ir['module']}.c.v"
+    output_path = get_output_path(c_prefix)
     with open(output_path, "w", newline="\n") as f_outp:
         f_outp.write(out_lines)
+    util.generated_files[output_path] = "v"
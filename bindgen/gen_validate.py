@@ -0,0 +1,163 @@
+#-------------------------------------------------------------------------------
+#   Optional validation of the generated bindings with the target language
+#   toolchains, run at the end of gen_all.py with SOKOL_BINDGEN_VALIDATE=1,
+#   or on the already generated files with:
+#
+#       python3 gen_validate.py
+#
+#   The validators of all generated files run concurrently. Successful
+#   results are cached (in SOKOL_BINDGEN_VALIDATE_CACHE, default
+#   validate_cache.json) under the hash of the generated file, the validator
+#   and the toolchain executable, so that only changed files are validated
+#   again. Languages whose toolchain isn't installed are skipped. The
+#   toolchain executables can be overridden with SOKOL_BINDGEN_{TOOL}, e.g.
+#   SOKOL_BINDGEN_ZIG=/opt/zig/zig.
+#-------------------------------------------------------------------------------
+import concurrent.futures, hashlib, json, os, shutil, subprocess, sys
+import gen_util as util
+
+enabled = os.environ.get("SOKOL_BINDGEN_VALIDATE", "0") == "1"
+cache_path = os.environ.get("SOKOL_BINDGEN_VALIDATE_CACHE", "validate_cache.json")
+
+# tool name => default executable
+tools = {
+    "zig": "zig",
+    "rustfmt": "rustfmt",
+    "nim": "nim",
+    "odin": "odin",
+    "dmd": "dmd",
+    "v": "v",
+    "python": sys.executable,
+}
+
+# language => validators, each a tool name and its arguments, where {path}
+# is replaced with the generated file and {dir} with its directory. Validators
+# with 'deps' also resolve the imports of the file, so their results depend on
+# the other generated files of the language too. The generated Rust code isn't
+# rustfmt-formatted (that's done in sokol-rust), so rustfmt only checks that
+# it parses. Jai has no standalone checker.
+validators = {
+    "zig": [
+        {"tool": "zig", "args": ["ast-check", "{path}"], "deps": False},
+        {"tool": "zig", "args": ["fmt", "--check", "{path}"], "deps": False},
+    ],
+    "rust": [
+        {"tool": "rustfmt", "args": ["--edition", "2021", "--emit", "stdout", "{path}"], "deps": False},
+    ],
+    "nim": [
+        {"tool": "nim", "args": ["check", "--hints:off", "{path}"], "deps": True},
+    ],
+    "odin": [
+        {"tool": "odin", "args": ["check", "{dir}", "-no-entry-point"], "deps": True},
+    ],
+    "d": [
+        {"tool": "dmd", "args": ["-o-", "-I{dir}/..", "{path}"], "deps": True},
+    ],
+    "v": [
+        {"tool": "v", "args": ["-check-syntax", "{path}"], "deps": False},
+    ],
+    "python": [
+        {"tool": "python", "args": ["-c", "import ast, sys; ast.parse(open(sys.argv[1], 'rb').read(), sys.argv[1])", "{path}"], "deps": False},
+    ],
+}
+
+def tool_path(tool):
+    return shutil.which(os.environ.get(f"SOKOL_BINDGEN_{tool.upper()}", tools[tool]))
+
+def validator_cmd(exe, validator, path):
+    return [exe, *(arg.format(path=path, dir=os.path.dirname(path) or ".") for arg in validator["args"])]
+
+def cache_key(exe, validator, path, lang_paths):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{exe}:{os.stat(exe).st_mtime_ns}:{json.dumps(validator)}".encode("utf-8"))
+    h.update(util.source_hash(path))
+    if validator["deps"]:
+        for lang_path in sorted(lang_paths):
+            h.update(util.source_hash(lang_path))
+    return h.hexdigest()
+
+def load_cache():
+    if cache_path and os.path.isfile(cache_path):
+        with open(cache_path, "r") as f:
+            return json.load(f)
+    return {}
+
+def save_cache(cache):
+    if not cache_path:
+        return
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, "w", newline="\n") as f:
+        f.write(json.dumps(cache))
+    os.replace(tmp_path, cache_path)
+
+def run_validator(cmd):
+    res = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace")
+    return res.returncode, res.stdout
+
+# validate the generated files (path => language), stops with an error if a
+# validator fails
+def validate(generated_files):
+    print("=== Validating generated files:")
+    lang_paths = {}
+    for path, lang in generated_files.items():
+        lang_paths.setdefault(lang, []).append(path)
+    cache = load_cache()
+    jobs = []
+    for lang, paths in lang_paths.items():
+        if not validators.get(lang):
+            print(f"  >> skipping {lang} validation (no validator)")
+            continue
+        for validator in validators[lang]:
+            exe = tool_path(validator["tool"])
+            if exe is None:
+                print(f"  >> skipping {lang} validation ({validator['tool']} not found)")
+                continue
+            for path in paths:
+                jobs.append((path, validator["tool"], validator_cmd(exe, validator, path), cache_key(exe, validator, path, paths)))
+    num_cached = 0
+    failures = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {}
+        for path, tool, cmd, key in jobs:
+            if cache.get(key):
+                num_cached += 1
+            else:
+                futures[executor.submit(run_validator, cmd)] = (path, tool, key)
+        for future in concurrent.futures.as_completed(futures):
+            path, tool, key = futures[future]
+            returncode, output = future.result()
+            if returncode == 0:
+                cache[key] = True
+            else:
+                failures.append((path, tool, output))
+    save_cache(cache)
+    print(f"  {len(jobs)} checks: {len(jobs) - len(failures)} passed ({num_cached} cached), {len(failures)} failed")
+    for path, tool, output in sorted(failures):
+        print(f"  >> {tool} failed on {path}:")
+        print("\n".join(f"     {line}" for line in output.splitlines()[:20]))
+    if failures:
+        sys.exit(f"ERROR: validation of {len(failures)} generated files failed")
+
+# the previously generated files of all backends
+def existing_outputs():
+    import gen_d, gen_jai, gen_nim, gen_odin, gen_python, gen_rust, gen_v, gen_zig
+    backends = {
+        "zig": gen_zig,
+        "rust": gen_rust,
+        "nim": gen_nim,
+        "odin": gen_odin,
+        "d": gen_d,
+        "v": gen_v,
+        "jai": gen_jai,
+        "python": gen_python,
+    }
+    outputs = {}
+    for lang, backend in backends.items():
+        for c_prefix in backend.module_names:
+            path = backend.get_output_path(c_prefix)
+            if os.path.isfile(path):
+                outputs[path] = lang
+    return outputs
+
+if __name__ == "__main__":
+    validate(existing_outputs())
@@ -7,7 +7,7 @@
 #   - otherwise snake_case
 #-------------------------------------------------------------------------------
 import gen_ir
-import os, shutil, sys
+import os, sys
 
 import gen_util as util
 
@@ -42,8 +42,6 @@ c_source_paths = {
 ignores = [
     'sdtx_printf',
     'sdtx_vprintf',
-    'sg_install_trace_hooks',
-    'sg_trace_hooks',
 ]
 
 # functions that need to be exposed as 'raw' C callbacks without a Zig wrapper function
@@ -106,19 +104,30 @@ prim_defaults = {
 }
 
 
+# if True, array fields whose items default to all-zero bits are initialized
+# with std.mem.zeroes() instead of a `[_]T{...} ** N` expression, which is
+# much cheaper for the comptime evaluator (see benchmarks/zig_array_defaults.py)
+zeroes_array_defaults = True
+
 struct_types = []
+struct_fields = {}
 enum_types = []
 enum_items = {}
+enum_zero_default = {}
 out_lines = ''
 
 def reset_globals():
     global struct_types
+    global struct_fields
     global enum_types
     global enum_items
+    global enum_zero_default
     global out_lines
     struct_types = []
+    struct_fields = {}
     enum_types = []
     enum_items = {}
+    enum_zero_default = {}
     out_lines = ''
 
 def l(s):
@@ -257,20 +266,21 @@ def as_zig_arg_type(arg_prefix, arg_type, prefix):
 def is_zig_string(zig_type):
     return zig_type == "[:0]const u8"
 
-# get C-style arguments of a function pointer as string
-def funcptr_args_c(field_type, prefix):
+# get C-style argument types of a function pointer as list
+def funcptr_arg_types_c(field_type, prefix):
     tokens = field_type[field_type.index('(*)')+4:-1].split(',')
-    s = ""
+    arg_types = []
     for token in tokens:
-        arg_type = token.strip()
-        if s != "":
-            s += ", "
-        c_arg = as_c_arg_type(arg_type, prefix)
+        c_arg = as_c_arg_type(token.strip(), prefix)
         if c_arg == "void":
-            return ""
+            return []
         else:
-            s += c_arg
-    return s
+            arg_types.append(c_arg)
+    return arg_types
+
+# get C-style arguments of a function pointer as string
+def funcptr_args_c(field_type, prefix):
+    return ", ".join(funcptr_arg_types_c(field_type, prefix))
 
 # get C-style result of a function pointer as string
 def funcptr_result_c(field_type):
@@ -297,7 +307,8 @@ def funcdecl_args_c(decl, prefix):
         s += as_c_arg_type(param_type, prefix)
     return s
 
-def funcdecl_args_zig(decl, prefix):
+# NOTE: if struct_by_ptr is True, const struct pointer args are passed as *const T
+def funcdecl_args_zig(decl, prefix, struct_by_ptr=False):
     s = ""
     func_name = decl['name']
     for param_decl in decl['params']:
@@ -305,7 +316,10 @@ def funcdecl_args_zig(decl, prefix):
             s += ", "
         param_name = param_decl['name']
         param_type = check_override(f'{func_name}.{param_name}', default=param_decl['type'])
-        s += f"{as_zig_arg_type(f'{param_name}: ', param_type, prefix)}"
+        if struct_by_ptr and is_const_struct_ptr(param_type):
+            s += f"{param_name}: *const {as_zig_struct_type(util.extract_ptr_type(param_type), prefix)}"
+        else:
+            s += f"{as_zig_arg_type(f'{param_name}: ', param_type, prefix)}"
     return s
 
 def funcdecl_result_c(decl, prefix):
@@ -321,13 +335,41 @@ def funcdecl_result_zig(decl, prefix):
     zig_res_type = as_zig_arg_type(None, result_type, prefix)
     return zig_res_type
 
+# true if the default value of a struct field type is all-zero bits
+def is_zero_default(field_type):
+    if is_prim_type(field_type):
+        return type_default_value(field_type) in ['0', '0.0', 'false']
+    elif is_struct_type(field_type):
+        struct_name = check_override(field_type)
+        for field in struct_fields[field_type]:
+            field_name = check_override(field['name'])
+            if not is_zero_default(check_override(f'{struct_name}.{field_name}', default=field['type'])):
+                return False
+        return True
+    elif is_enum_type(field_type):
+        return enum_zero_default[field_type]
+    elif util.is_string_ptr(field_type) or util.is_const_void_ptr(field_type) or util.is_void_ptr(field_type):
+        return True
+    elif is_const_prim_ptr(field_type) or util.is_func_ptr(field_type):
+        return True
+    elif util.is_array_type(field_type):
+        return is_zero_default(util.extract_array_type(field_type))
+    else:
+        return False
+
+def gen_doc_comment(item, indent=''):
+    for line in util.doc_comment_lines(item, '///'):
+        l(f"{indent}{line}")
+
 def gen_struct(decl, prefix):
     struct_name = check_override(decl['name'])
     zig_type = as_zig_struct_type(struct_name, prefix)
+    gen_doc_comment(decl)
     l(f"pub const {zig_type} = extern struct {{")
     for field in decl['fields']:
         field_name = check_override(field['name'])
         field_type = check_override(f'{struct_name}.{field_name}', default=field['type'])
+        gen_doc_comment(field, '    ')
         if is_prim_type(field_type):
             l(f"    {field_name}: {as_zig_prim_type(field_type)} = {type_default_value(field_type)},")
         elif is_struct_type(field_type):
@@ -361,7 +403,13 @@ def gen_struct(decl, prefix):
                     sys.exit(f"ERROR gen_struct is_1d_array_type: {array_type}")
                 t0 = f"[{array_sizes[0]}]{zig_type}"
                 t1 = f"[_]{zig_type}"
-                l(f"    {field_name}: {t0} = {t1}{{{def_val}}} ** {array_sizes[0]},")
+                if zeroes_array_defaults and is_zero_default(array_type):
+                    l(f"    {field_name}: {t0} = @import(\"std\").mem.zeroes({t0}),")
+                else:
+                    l(f"    {field_name}: {t0} = {t1}{{{def_val}}} ** {array_sizes[0]},")
+            elif util.is_const_void_ptr(array_type) and zeroes_array_defaults:
+                t0 = f"[{array_sizes[0]}]?*const anyopaque"
+                l(f"    {field_name}: {t0} = @import(\"std\").mem.zeroes({t0}),")
             elif util.is_const_void_ptr(array_type):
                 l(f"    {field_name}: [{array_sizes[0]}]?*const anyopaque = [_]?*const anyopaque{{null}} ** {array_sizes[0]},")
             else:
@@ -378,63 +426,108 @@ def gen_struct(decl, prefix):
             else:
                 sys.exit(f"ERROR gen_struct is_2d_array_type: {array_type}")
             t0 = f"[{array_sizes[0]}][{array_sizes[1]}]{zig_type}"
-            l(f"    {field_name}: {t0} = [_][{array_sizes[1]}]{zig_type}{{[_]{zig_type}{{{def_val}}} ** {array_sizes[1]}}} ** {array_sizes[0]},")
+            if zeroes_array_defaults and is_zero_default(array_type):
+                l(f"    {field_name}: {t0} = @import(\"std\").mem.zeroes({t0}),")
+            else:
+                l(f"    {field_name}: {t0} = [_][{array_sizes[1]}]{zig_type}{{[_]{zig_type}{{{def_val}}} ** {array_sizes[1]}}} ** {array_sizes[0]},")
         else:
             sys.exit(f"ERROR gen_struct: {field_name}: {field_type};")
     l("};")
+    gen_struct_layout_check(decl, prefix)
+
+# a compile-time check of the struct layout against the C struct, if the IR
+# has layout information (see checkLayout() in gen_helpers())
+def gen_struct_layout_check(decl, prefix):
+    layout = util.struct_layout(decl)
+    if layout is None:
+        return
+    size, align, offsets = layout
+    zig_type = as_zig_struct_type(check_override(decl['name']), prefix)
+    zig_offsets = ", ".join(f".{check_override(name)} = {offset}" for name, offset in offsets.items())
+    l(f"comptime {{")
+    l(f"    checkLayout({zig_type}, {size}, {align}, .{{ {zig_offsets} }});")
+    l(f"}}")
 
 def gen_consts(decl, prefix):
+    # the comment of an anonymous enum describes the whole group of constants
+    for line in util.doc_comment_lines(decl, '//'):
+        l(line)
     for item in decl['items']:
         item_name = check_override(item['name'])
+        gen_doc_comment(item)
         l(f"pub const {util.as_lower_snake_case(item_name, prefix)} = {item['value']};")
 
 def gen_enum(decl, prefix):
     enum_name = check_override(decl['name'])
+    gen_doc_comment(decl)
     l(f"pub const {as_zig_enum_type(enum_name, prefix)} = enum(i32) {{")
     for item in decl['items']:
         item_name = as_enum_item_name(check_override(item['name']))
         if item_name != "FORCE_U32":
+            gen_doc_comment(item, '    ')
             if 'value' in item:
                 l(f"    {item_name} = {item['value']},")
             else:
                 l(f"    {item_name},")
     l("};")
 
+# true if the Zig wrapper would have exactly the same signature as the extern C function
+def is_abi_identical(decl, prefix):
+    func_name = decl['name']
+    for param_decl in decl['params']:
+        param_type = check_override(f"{func_name}.{param_decl['name']}", default=param_decl['type'])
+        if as_c_arg_type(param_type, prefix) != as_zig_arg_type('', param_type, prefix):
+            return False
+    return funcdecl_result_c(decl, prefix) == funcdecl_result_zig(decl, prefix)
+
 def gen_func_c(decl, prefix):
     l(f"pub extern fn {decl['name']}({funcdecl_args_c(decl, prefix)}) {funcdecl_result_c(decl, prefix)};")
 
 def gen_func_zig(decl, prefix):
     c_func_name = decl['name']
     zig_func_name = util.as_lower_camel_case(check_override(decl['name']), prefix)
+    gen_doc_comment(decl)
     if c_func_name in c_callbacks:
         # a simple forwarded C callback function
         l(f"pub const {zig_func_name} = {c_func_name};")
+    elif is_abi_identical(decl, prefix):
+        # no argument conversion needed, alias the extern function instead of wrapping it
+        l(f"pub const {zig_func_name} = {c_func_name};")
     else:
         zig_res_type = funcdecl_result_zig(decl, prefix)
         l(f"pub fn {zig_func_name}({funcdecl_args_zig(decl, prefix)}) {zig_res_type} {{")
-        if is_zig_string(zig_res_type):
-            # special case: convert C string to Zig string slice
-            s = f"    return cStrToZig({c_func_name}("
-        elif zig_res_type != 'void':
-            s = f"    return {c_func_name}("
-        else:
-            s = f"    {c_func_name}("
-        for i, param_decl in enumerate(decl['params']):
-            if i > 0:
-                s += ", "
-            arg_name = param_decl['name']
-            arg_type = param_decl['type']
-            if is_const_struct_ptr(arg_type):
-                s += f"&{arg_name}"
-            elif util.is_string_ptr(arg_type):
-                s += f"@ptrCast({arg_name})"
-            else:
-                s += arg_name
-        if is_zig_string(zig_res_type):
-            s += ")"
-        s += ");"
-        l(s)
+        gen_func_zig_call(decl, zig_res_type, struct_by_ptr=False)
         l("}")
+        if any(is_const_struct_ptr(param_decl['type']) for param_decl in decl['params']):
+            # a variant which takes struct args by pointer, avoids copying large desc structs
+            l(f"pub fn {zig_func_name}Ptr({funcdecl_args_zig(decl, prefix, struct_by_ptr=True)}) {zig_res_type} {{")
+            gen_func_zig_call(decl, zig_res_type, struct_by_ptr=True)
+            l("}")
+
+def gen_func_zig_call(decl, zig_res_type, struct_by_ptr):
+    c_func_name = decl['name']
+    if is_zig_string(zig_res_type):
+        # special case: convert C string to Zig string slice
+        s = f"    return cStrToZig({c_func_name}("
+    elif zig_res_type != 'void':
+        s = f"    return {c_func_name}("
+    else:
+        s = f"    {c_func_name}("
+    for i, param_decl in enumerate(decl['params']):
+        if i > 0:
+            s += ", "
+        arg_name = param_decl['name']
+        arg_type = param_decl['type']
+        if is_const_struct_ptr(arg_type) and not struct_by_ptr:
+            s += f"&{arg_name}"
+        elif util.is_string_ptr(arg_type):
+            s += f"@ptrCast({arg_name})"
+        else:
+            s += arg_name
+    if is_zig_string(zig_res_type):
+        s += ")"
+    s += ");"
+    l(s)
 
 def pre_parse(inp):
     global struct_types
@@ -443,12 +536,16 @@ def pre_parse(inp):
         kind = decl['kind']
         if kind == 'struct':
             struct_types.append(decl['name'])
+            struct_fields[decl['name']] = decl['fields']
         elif kind == 'enum':
             enum_name = decl['name']
             enum_types.append(enum_name)
             enum_items[enum_name] = []
             for item in decl['items']:
                 enum_items[enum_name].append(as_enum_item_name(item['name']))
+            # the default enum item is the first one
+            first_item_value = decl['items'][0].get('value', '0')
+            enum_zero_default[enum_name] = first_item_value.isdigit() and int(first_item_value) == 0
 
 def gen_imports(inp, dep_prefixes):
     l('const builtin = @import("builtin");')
@@ -462,6 +559,22 @@ def gen_helpers(inp):
     l('fn cStrToZig(c_str: [*c]const u8) [:0]const u8 {')
     l('    return @import("std").mem.span(c_str);')
     l('}')
+    if any(util.struct_layout(decl) is not None for decl in inp['decls'] if decl['kind'] == 'struct' and not decl['is_dep']):
+        pointer_size = inp['pointer_size']
+        l(f'// compile-time check of a struct layout against the C struct layout, which')
+        l(f'// was evaluated by clang for a target with {pointer_size}-byte pointers (checked')
+        l(f'// only on such targets)')
+        l('fn checkLayout(comptime T: type, comptime size: usize, comptime alignment: usize, comptime offsets: anytype) void {')
+        l(f'    if (@sizeOf(usize) != {pointer_size}) return;')
+        l('    if (@sizeOf(T) != size or @alignOf(T) != alignment) {')
+        l('        @compileError("size or alignment of " ++ @typeName(T) ++ " doesn\'t match the C struct");')
+        l('    }')
+        l('    inline for (@import("std").meta.fields(@TypeOf(offsets))) |field| {')
+        l('        if (@offsetOf(T, field.name) != @field(offsets, field.name)) {')
+        l('            @compileError("offset of " ++ @typeName(T) ++ "." ++ field.name ++ " doesn\'t match the C struct");')
+        l('        }')
+        l('    }')
+        l('}')
     if inp['prefix'] in ['sg_', 'sdtx_', 'sshape_', 'sfetch_']:
         l('// helper function to convert "anything" to a Range struct')
         l('pub fn asRange(val: anytype) Range {')
@@ -508,15 +621,23 @@ def gen_helpers(inp):
         l('    pub const Error = error{};')
         l('    pub fn writeAll(self: Writer, bytes: []const u8) Error!void {')
         l('        _ = self;')
-        l('        for (bytes) |byte| {')
-        l('            putc(byte);')
+        l('        // forward whole slices to sdtx_putr() instead of one putc() call per byte')
+        l('        var remaining = bytes;')
+        l('        while (remaining.len > 0) {')
+        l('            const len = @min(remaining.len, @as(usize, @intCast(@import("std").math.maxInt(i32))));')
+        l('            sdtx_putr(remaining.ptr, @intCast(len));')
+        l('            remaining = remaining[len..];')
         l('        }')
         l('    }')
         l('    pub fn writeByteNTimes(self: Writer, byte: u8, n: usize) Error!void {')
-        l('        _ = self;')
-        l('        var i: u64 = 0;')
-        l('        while (i < n) : (i += 1) {')
-        l('            putc(byte);')
+        l('        // batch repeated bytes through a small stack buffer')
+        l('        var buf: [128]u8 = undefined;')
+        l('        @memset(&buf, byte);')
+        l('        var remaining = n;')
+        l('        while (remaining > 0) {')
+        l('            const len = @min(remaining, buf.len);')
+        l('            try self.writeAll(buf[0..len]);')
+        l('            remaining -= len;')
         l('        }')
         l('    }')
         l('    pub fn writeBytesNTimes(self: Writer, bytes: []const u8, n: usize) Error!void {')
@@ -532,6 +653,105 @@ def gen_helpers(inp):
         l('    @import("std").fmt.format(writer, fmt, args) catch {};')
         l('}')
         l('')
+    if inp['prefix'] == 'sgl_':
+        gen_vertex_slice_helpers(inp)
+    if inp['prefix'] == 'sg_':
+        gen_frame_stats_helpers(inp)
+
+# a flat array view of FrameStats and a ring buffer collector with rolling
+# averages and percentiles over the last N frames, without allocations
+def gen_frame_stats_helpers(inp):
+    values = util.frame_stats_values(inp)
+    l('// number of values in a flattened FrameStats struct')
+    l(f'pub const frame_stats_num_values = {len(values)};')
+    l('// names of the values in a flattened FrameStats struct')
+    l('pub const frame_stats_names = [frame_stats_num_values][]const u8{')
+    for name, _ in values:
+        l(f'    "{name}",')
+    l('};')
+    l('// flat array view of a FrameStats struct, for instance for exporting')
+    l('pub fn frameStatsFlatten(stats: FrameStats) [frame_stats_num_values]u32 {')
+    l('    return .{')
+    for _, path in values:
+        l(f"        stats.{'.'.join([check_override(field['name']) for field in path])},")
+    l('    };')
+    l('}')
+    l('// records the flattened frame stats of the last num_frames frames,')
+    l('// call push(queryFrameStats()) once per frame')
+    l('pub fn FrameStatsCollector(comptime num_frames: usize) type {')
+    l('    return struct {')
+    l('        const Self = @This();')
+    l('        frames: [num_frames][frame_stats_num_values]u32 = undefined,')
+    l('        num: usize = 0,')
+    l('        pos: usize = 0,')
+    l('')
+    l('        pub fn push(self: *Self, stats: FrameStats) void {')
+    l('            self.frames[self.pos] = frameStatsFlatten(stats);')
+    l('            self.pos = (self.pos + 1) % num_frames;')
+    l('            self.num = @min(self.num + 1, num_frames);')
+    l('        }')
+    l('        // the most recently pushed frame stats')
+    l('        pub fn latest(self: *const Self) ?[frame_stats_num_values]u32 {')
+    l('            if (self.num == 0) return null;')
+    l('            return self.frames[(self.pos + num_frames - 1) % num_frames];')
+    l('        }')
+    l('        // average of a value over the recorded frames')
+    l('        pub fn average(self: *const Self, value_index: usize) f64 {')
+    l('            if (self.num == 0) return 0.0;')
+    l('            var sum: u64 = 0;')
+    l('            for (self.frames[0..self.num]) |frame| {')
+    l('                sum += frame[value_index];')
+    l('            }')
+    l('            return @as(f64, @floatFromInt(sum)) / @as(f64, @floatFromInt(self.num));')
+    l('        }')
+    l('        // nearest-rank percentile (0..100) of a value over the recorded frames')
+    l('        pub fn percentile(self: *const Self, value_index: usize, p: u32) u32 {')
+    l('            if (self.num == 0) return 0;')
+    l('            var values: [num_frames]u32 = undefined;')
+    l('            for (self.frames[0..self.num], 0..) |frame, i| {')
+    l('                values[i] = frame[value_index];')
+    l('            }')
+    l('            @import("std").mem.sort(u32, values[0..self.num], {}, @import("std").sort.asc(u32));')
+    l('            const rank = (@as(usize, @min(p, 100)) * self.num + 99) / 100;')
+    l('            return values[if (rank > 0) rank - 1 else 0];')
+    l('        }')
+    l('    };')
+    l('}')
+    l('')
+
+# a vertex struct and slice-taking bulk variant for each per-vertex sokol_gl function,
+# the loop runs on the Zig side and calls the extern function directly
+def gen_vertex_slice_helpers(inp):
+    prefix = inp['prefix']
+    for decl in util.vertex_funcs(inp):
+        c_func_name = decl['name']
+        vtx_type = util.as_upper_camel_case(c_func_name, prefix)
+        l(f'pub const {vtx_type} = extern struct {{')
+        for param_decl in decl['params']:
+            param_type = param_decl['type']
+            l(f"    {param_decl['name']}: {as_zig_prim_type(param_type)} = {type_default_value(param_type)},")
+        l('};')
+        l(f'pub fn {util.as_lower_camel_case(c_func_name, prefix)}Slice(vertices: []const {vtx_type}) void {{')
+        l('    for (vertices) |vtx| {')
+        args = ', '.join([f"vtx.{param_decl['name']}" for param_decl in decl['params']])
+        l(f'        {c_func_name}({args});')
+        l('    }')
+        l('}')
+    l('')
+
+# the code for a single decl of the module, emitted through the fragment cache
+def gen_decl(decl, prefix):
+    kind = decl['kind']
+    if kind == 'consts':
+        gen_consts(decl, prefix)
+    elif not check_ignore(decl['name']):
+        if kind == 'struct':
+            gen_struct(decl, prefix)
+        elif kind == 'enum':
+            gen_enum(decl, prefix)
+        elif kind == 'func':
+            gen_func_c(decl, prefix)
+            gen_func_zig(decl, prefix)
 
 def gen_module(inp, dep_prefixes):
     l('// machine generated, do not edit')
@@ -540,19 +760,72 @@ def gen_module(inp, dep_prefixes):
     gen_helpers(inp)
     pre_parse(inp)
     prefix = inp['prefix']
+    fragment_cache = util.FragmentCache(sys.modules[__name__], inp, [ignores, overrides, zeroes_array_defaults])
     for decl in inp['decls']:
         if not decl['is_dep']:
-            kind = decl['kind']
-            if kind == 'consts':
-                gen_consts(decl, prefix)
-            elif not check_ignore(decl['name']):
-                if kind == 'struct':
-                    gen_struct(decl, prefix)
-                elif kind == 'enum':
-                    gen_enum(decl, prefix)
-                elif kind == 'func':
-                    gen_func_c(decl, prefix)
-                    gen_func_zig(decl, prefix)
+            fragment_cache.emit(decl, lambda: gen_decl(decl, prefix))
+    fragment_cache.save()
+    if prefix == 'sg_':
+        gen_tracer(inp, prefix)
+
+# a Tracer struct which installs itself into the sg_trace_hooks callback table,
+# one callback per traced function which bumps a counter and chains to the previous hooks
+def gen_tracer(inp, prefix):
+    hooks = [decl for decl in inp['decls'] if decl['kind'] == 'struct' and decl['name'] == 'sg_trace_hooks'][0]
+    hook_fields = [field for field in hooks['fields'] if util.is_func_ptr(field['type'])]
+    l('// A lightweight sokol-gfx call tracer which counts the calls of each traced')
+    l('// function and measures the CPU time spent between beginPass() and endPass().')
+    l('// The previously installed trace hooks are called too. The sokol-gfx')
+    l('// implementation must be compiled with SOKOL_TRACE_HOOKS.')
+    l('pub const Tracer = struct {')
+    l('    pub const Counts = struct {')
+    for field in hook_fields:
+        l(f"        {field['name']}: u32 = 0,")
+    l('    };')
+    l('    counts: Counts = .{},')
+    l('    pass_time_ns: u64 = 0,')
+    l('    pass_start: ?@import("std").time.Instant = null,')
+    l('    prev_hooks: TraceHooks = .{},')
+    l('')
+    l('    // the tracer must stay alive at the same address until uninstall() is called')
+    l('    pub fn install(self: *Tracer) void {')
+    l('        self.prev_hooks = installTraceHooks(.{')
+    l('            .user_data = self,')
+    for field in hook_fields:
+        l(f"            .{field['name']} = {util.as_lower_camel_case('trace_' + field['name'], '')},")
+    l('        });')
+    l('    }')
+    l('    // restores the trace hooks which were installed before the tracer')
+    l('    pub fn uninstall(self: *Tracer) void {')
+    l('        _ = installTraceHooks(self.prev_hooks);')
+    l('    }')
+    l('    // resets the counters and timings, for instance at the start of a frame')
+    l('    pub fn reset(self: *Tracer) void {')
+    l('        self.counts = .{};')
+    l('        self.pass_time_ns = 0;')
+    l('    }')
+    for field in hook_fields:
+        field_name = field['name']
+        arg_types = funcptr_arg_types_c(field['type'], prefix)
+        if arg_types[-1] != '?*anyopaque':
+            sys.exit(f"ERROR gen_tracer(): {field_name} has no user_data arg")
+        arg_names = [f'a{i}' for i in range(len(arg_types) - 1)]
+        args = ", ".join([f'{name}: {arg_type}' for name, arg_type in zip(arg_names, arg_types)] + ['user_data: ?*anyopaque'])
+        l(f"    fn {util.as_lower_camel_case('trace_' + field_name, '')}({args}) callconv(.C) void {{")
+        l('        const self: *Tracer = @ptrCast(@alignCast(user_data));')
+        l(f'        self.counts.{field_name} += 1;')
+        if field_name == 'begin_pass':
+            l('        self.pass_start = @import("std").time.Instant.now() catch null;')
+        elif field_name == 'end_pass':
+            l('        if (self.pass_start) |start| {')
+            l('            if (@import("std").time.Instant.now()) |now| {')
+            l('                self.pass_time_ns += now.since(start);')
+            l('            } else |_| {}')
+            l('            self.pass_start = null;')
+            l('        }')
+        l(f"        if (self.prev_hooks.{field_name}) |prev| prev({', '.join(arg_names + ['self.prev_hooks.user_data'])});")
+        l('    }')
+    l('};')
 
 def prepare():
     print('=== Generating Zig bindings:')
@@ -561,6 +834,10 @@ def prepare():
     if not os.path.isdir('sokol-zig/src/sokol/c'):
         os.makedirs('sokol-zig/src/sokol/c')
 
+# the path of the generated bindings file for a C prefix
+def get_output_path(c_prefix):
+    return f'sokol-zig/src/sokol/{module_names[c_prefix]}.zig'
+
 def gen(c_header_path, c_prefix, dep_c_prefixes):
     if not c_prefix in module_names:
         print(f' >> warning: skipping generation for {c_prefix} prefix...')
@@ -569,9 +846,10 @@ def gen(c_header_path, c_prefix, dep_c_prefixes):
     c_source_path = c_source_paths[c_prefix]
     print(f'  {c_header_path} => {module_name}')
     reset_globals()
-    shutil.copyfile(c_header_path, f'sokol-zig/src/sokol/c/{os.path.basename(c_header_path)}')
+    util.vendor_file(c_header_path, f'sokol-zig/src/sokol/c/{os.path.basename(c_header_path)}')
     ir = gen_ir.gen(c_header_path, c_source_path, module_name, c_prefix, dep_c_prefixes)
     gen_module(ir, dep_c_prefixes)
-    output_path = f"sokol-zig/src/sokol/{ir['module']}.zig"
+    output_path = get_output_path(c_prefix)
     with open(output_path, 'w', newline='\n') as f_outp:
         f_outp.write(out_lines)
+    util.generated_files[output_path] = 'zig'
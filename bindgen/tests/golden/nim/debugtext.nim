@@ -0,0 +1,209 @@
+## machine generated, do not edit
+
+import gfx
+
+type
+  LogItem* {.size:sizeof(int32).} = enum
+    logitemOk,
+    logitemMallocFailed,
+    logitemAddCommitListenerFailed,
+    logitemCommandBufferFull,
+    logitemContextPoolExhausted,
+    logitemCannotDestroyDefaultContext,
+
+type Logger* = object
+  fn*:proc(a1:cstring, a2:uint32, a3:uint32, a4:cstring, a5:uint32, a6:cstring, a7:pointer) {.cdecl.}
+  userData*:pointer
+
+type Context* = object
+  id*:uint32
+
+type Range* = object
+  `addr`*:pointer
+  size*:int
+
+type FontDesc* = object
+  data*:Range
+  firstChar*:uint8
+  lastChar*:uint8
+
+type ContextDesc* = object
+  maxCommands*:int32
+  charBufSize*:int32
+  canvasWidth*:float32
+  canvasHeight*:float32
+  tabWidth*:int32
+  colorFormat*:gfx.PixelFormat
+  depthFormat*:gfx.PixelFormat
+  sampleCount*:int32
+
+type Allocator* = object
+  allocFn*:proc(a1:int, a2:pointer):pointer {.cdecl.}
+  freeFn*:proc(a1:pointer, a2:pointer) {.cdecl.}
+  userData*:pointer
+
+type Desc* = object
+  contextPoolSize*:int32
+  printfBufSize*:int32
+  fonts*:array[8, FontDesc]
+  context*:ContextDesc
+  allocator*:Allocator
+  logger*:Logger
+
+converter toDescfonts*[N:static[int]](items: array[N, FontDesc]): array[8, FontDesc] {.inline.} =
+  static: assert(N <= 8)
+  when N > 0:
+    copyMem(result[0].addr, items[0].unsafeAddr, N * sizeof(FontDesc))
+
+proc c_setup(desc:ptr Desc):void {.cdecl, importc:"sdtx_setup".}
+proc setup*(desc:Desc):void =
+    c_setup(addr(desc))
+
+proc c_shutdown():void {.cdecl, importc:"sdtx_shutdown".}
+proc shutdown*():void =
+    c_shutdown()
+
+proc c_fontKc853():FontDesc {.cdecl, importc:"sdtx_font_kc853".}
+proc fontKc853*():FontDesc =
+    c_fontKc853()
+
+proc c_fontKc854():FontDesc {.cdecl, importc:"sdtx_font_kc854".}
+proc fontKc854*():FontDesc =
+    c_fontKc854()
+
+proc c_fontZ1013():FontDesc {.cdecl, importc:"sdtx_font_z1013".}
+proc fontZ1013*():FontDesc =
+    c_fontZ1013()
+
+proc c_fontCpc():FontDesc {.cdecl, importc:"sdtx_font_cpc".}
+proc fontCpc*():FontDesc =
+    c_fontCpc()
+
+proc c_fontC64():FontDesc {.cdecl, importc:"sdtx_font_c64".}
+proc fontC64*():FontDesc =
+    c_fontC64()
+
+proc c_fontOric():FontDesc {.cdecl, importc:"sdtx_font_oric".}
+proc fontOric*():FontDesc =
+    c_fontOric()
+
+proc c_makeContext(desc:ptr ContextDesc):Context {.cdecl, importc:"sdtx_make_context".}
+proc makeContext*(desc:ContextDesc):Context =
+    c_makeContext(addr(desc))
+
+proc c_destroyContext(ctx:Context):void {.cdecl, importc:"sdtx_destroy_context".}
+proc destroyContext*(ctx:Context):void =
+    c_destroyContext(ctx)
+
+proc c_setContext(ctx:Context):void {.cdecl, importc:"sdtx_set_context".}
+proc setContext*(ctx:Context):void =
+    c_setContext(ctx)
+
+proc c_getContext():Context {.cdecl, importc:"sdtx_get_context".}
+proc getContext*():Context =
+    c_getContext()
+
+proc c_defaultContext():Context {.cdecl, importc:"sdtx_default_context".}
+proc defaultContext*():Context =
+    c_defaultContext()
+
+proc c_draw():void {.cdecl, importc:"sdtx_draw".}
+proc draw*():void =
+    c_draw()
+
+proc c_contextDraw(ctx:Context):void {.cdecl, importc:"sdtx_context_draw".}
+proc contextDraw*(ctx:Context):void =
+    c_contextDraw(ctx)
+
+proc c_drawLayer(layerId:int32):void {.cdecl, importc:"sdtx_draw_layer".}
+proc drawLayer*(layerId:int32):void =
+    c_drawLayer(layer_id)
+
+proc c_contextDrawLayer(ctx:Context, layerId:int32):void {.cdecl, importc:"sdtx_context_draw_layer".}
+proc contextDrawLayer*(ctx:Context, layerId:int32):void =
+    c_contextDrawLayer(ctx, layer_id)
+
+proc c_layer(layerId:int32):void {.cdecl, importc:"sdtx_layer".}
+proc layer*(layerId:int32):void =
+    c_layer(layer_id)
+
+proc c_font(fontIndex:int32):void {.cdecl, importc:"sdtx_font".}
+proc font*(fontIndex:int32):void =
+    c_font(font_index)
+
+proc c_canvas(w:float32, h:float32):void {.cdecl, importc:"sdtx_canvas".}
+proc canvas*(w:float32, h:float32):void =
+    c_canvas(w, h)
+
+proc c_origin(x:float32, y:float32):void {.cdecl, importc:"sdtx_origin".}
+proc origin*(x:float32, y:float32):void =
+    c_origin(x, y)
+
+proc c_home():void {.cdecl, importc:"sdtx_home".}
+proc home*():void =
+    c_home()
+
+proc c_pos(x:float32, y:float32):void {.cdecl, importc:"sdtx_pos".}
+proc pos*(x:float32, y:float32):void =
+    c_pos(x, y)
+
+proc c_posX(x:float32):void {.cdecl, importc:"sdtx_pos_x".}
+proc posX*(x:float32):void =
+    c_posX(x)
+
+proc c_posY(y:float32):void {.cdecl, importc:"sdtx_pos_y".}
+proc posY*(y:float32):void =
+    c_posY(y)
+
+proc c_move(dx:float32, dy:float32):void {.cdecl, importc:"sdtx_move".}
+proc move*(dx:float32, dy:float32):void =
+    c_move(dx, dy)
+
+proc c_moveX(dx:float32):void {.cdecl, importc:"sdtx_move_x".}
+proc moveX*(dx:float32):void =
+    c_moveX(dx)
+
+proc c_moveY(dy:float32):void {.cdecl, importc:"sdtx_move_y".}
+proc moveY*(dy:float32):void =
+    c_moveY(dy)
+
+proc c_crlf():void {.cdecl, importc:"sdtx_crlf".}
+proc crlf*():void =
+    c_crlf()
+
+proc c_color3b(r:uint8, g:uint8, b:uint8):void {.cdecl, importc:"sdtx_color3b".}
+proc color3b*(r:uint8, g:uint8, b:uint8):void =
+    c_color3b(r, g, b)
+
+proc c_color3f(r:float32, g:float32, b:float32):void {.cdecl, importc:"sdtx_color3f".}
+proc color3f*(r:float32, g:float32, b:float32):void =
+    c_color3f(r, g, b)
+
+proc c_color4b(r:uint8, g:uint8, b:uint8, a:uint8):void {.cdecl, importc:"sdtx_color4b".}
+proc color4b*(r:uint8, g:uint8, b:uint8, a:uint8):void =
+    c_color4b(r, g, b, a)
+
+proc c_color4f(r:float32, g:float32, b:float32, a:float32):void {.cdecl, importc:"sdtx_color4f".}
+proc color4f*(r:float32, g:float32, b:float32, a:float32):void =
+    c_color4f(r, g, b, a)
+
+proc c_color1i(rgba:uint32):void {.cdecl, importc:"sdtx_color1i".}
+proc color1i*(rgba:uint32):void =
+    c_color1i(rgba)
+
+proc c_putc(c:char):void {.cdecl, importc:"sdtx_putc".}
+proc putc*(c:char):void =
+    c_putc(c)
+
+proc c_puts(str:cstring):void {.cdecl, importc:"sdtx_puts".}
+proc puts*(str:cstring):void =
+    c_puts(str)
+
+proc c_putr(str:cstring, len:int32):void {.cdecl, importc:"sdtx_putr".}
+proc putr*(str:cstring, len:int32):void =
+    c_putr(str, len)
+
+{.passc:"-DSOKOL_NIM_IMPL".}
+when defined(release):
+  {.passc:"-DNDEBUG".}
+{.compile:"c/sokol_debugtext.c".}
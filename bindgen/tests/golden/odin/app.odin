@@ -0,0 +1,783 @@
+// machine generated, do not edit
+
+package sokol_app
+
+// helper functions to get a Range pointing into a slice (e.g. `as_range(vertices[:])`)
+// or to a single value (e.g. `as_range(&uniforms)`), without copying
+slice_as_range :: proc "contextless" (data: []$T) -> Range {
+    return { ptr = raw_data(data), size = c.size_t(len(data) * size_of(T)) }
+}
+value_as_range :: proc "contextless" (value: ^$T) -> Range {
+    return { ptr = value, size = size_of(T) }
+}
+as_range :: proc{slice_as_range, value_as_range}
+
+import "core:c"
+
+SOKOL_DEBUG :: #config(SOKOL_DEBUG, ODIN_DEBUG)
+
+DEBUG :: #config(SOKOL_APP_DEBUG, SOKOL_DEBUG)
+USE_GL :: #config(SOKOL_USE_GL, false)
+USE_DLL :: #config(SOKOL_DLL, false)
+
+when ODIN_OS == .Windows {
+    when USE_DLL {
+        when USE_GL {
+            when DEBUG { foreign import sokol_app_clib { "../sokol_dll_windows_x64_gl_debug.lib" } }
+            else       { foreign import sokol_app_clib { "../sokol_dll_windows_x64_gl_release.lib" } }
+        } else {
+            when DEBUG { foreign import sokol_app_clib { "../sokol_dll_windows_x64_d3d11_debug.lib" } }
+            else       { foreign import sokol_app_clib { "../sokol_dll_windows_x64_d3d11_release.lib" } }
+        }
+    } else {
+        when USE_GL {
+            when DEBUG { foreign import sokol_app_clib { "sokol_app_windows_x64_gl_debug.lib" } }
+            else       { foreign import sokol_app_clib { "sokol_app_windows_x64_gl_release.lib" } }
+        } else {
+            when DEBUG { foreign import sokol_app_clib { "sokol_app_windows_x64_d3d11_debug.lib" } }
+            else       { foreign import sokol_app_clib { "sokol_app_windows_x64_d3d11_release.lib" } }
+        }
+    }
+} else when ODIN_OS == .Darwin {
+    when USE_DLL {
+             when  USE_GL && ODIN_ARCH == .arm64 &&  DEBUG { foreign import sokol_app_clib { "../dylib/sokol_dylib_macos_arm64_gl_debug.dylib" } }
+        else when  USE_GL && ODIN_ARCH == .arm64 && !DEBUG { foreign import sokol_app_clib { "../dylib/sokol_dylib_macos_arm64_gl_release.dylib" } }
+        else when  USE_GL && ODIN_ARCH == .amd64 &&  DEBUG { foreign import sokol_app_clib { "../dylib/sokol_dylib_macos_x64_gl_debug.dylib" } }
+        else when  USE_GL && ODIN_ARCH == .amd64 && !DEBUG { foreign import sokol_app_clib { "../dylib/sokol_dylib_macos_x64_gl_release.dylib" } }
+        else when !USE_GL && ODIN_ARCH == .arm64 &&  DEBUG { foreign import sokol_app_clib { "../dylib/sokol_dylib_macos_arm64_metal_debug.dylib" } }
+        else when !USE_GL && ODIN_ARCH == .arm64 && !DEBUG { foreign import sokol_app_clib { "../dylib/sokol_dylib_macos_arm64_metal_release.dylib" } }
+        else when !USE_GL && ODIN_ARCH == .amd64 &&  DEBUG { foreign import sokol_app_clib { "../dylib/sokol_dylib_macos_x64_metal_debug.dylib" } }
+        else when !USE_GL && ODIN_ARCH == .amd64 && !DEBUG { foreign import sokol_app_clib { "../dylib/sokol_dylib_macos_x64_metal_release.dylib" } }
+    } else {
+        when USE_GL {
+            when ODIN_ARCH == .arm64 {
+                when DEBUG { foreign import sokol_app_clib { "sokol_app_macos_arm64_gl_debug.a", "system:Cocoa.framework","system:QuartzCore.framework","system:OpenGL.framework" } }
+                else       { foreign import sokol_app_clib { "sokol_app_macos_arm64_gl_release.a", "system:Cocoa.framework","system:QuartzCore.framework","system:OpenGL.framework" } }
+            } else {
+                when DEBUG { foreign import sokol_app_clib { "sokol_app_macos_x64_gl_debug.a", "system:Cocoa.framework","system:QuartzCore.framework","system:OpenGL.framework" } }
+                else       { foreign import sokol_app_clib { "sokol_app_macos_x64_gl_release.a", "system:Cocoa.framework","system:QuartzCore.framework","system:OpenGL.framework" } }
+            }
+        } else {
+            when ODIN_ARCH == .arm64 {
+                when DEBUG { foreign import sokol_app_clib { "sokol_app_macos_arm64_metal_debug.a", "system:Cocoa.framework","system:QuartzCore.framework","system:Metal.framework","system:MetalKit.framework" } }
+                else       { foreign import sokol_app_clib { "sokol_app_macos_arm64_metal_release.a", "system:Cocoa.framework","system:QuartzCore.framework","system:Metal.framework","system:MetalKit.framework" } }
+            } else {
+                when DEBUG { foreign import sokol_app_clib { "sokol_app_macos_x64_metal_debug.a", "system:Cocoa.framework","system:QuartzCore.framework","system:Metal.framework","system:MetalKit.framework" } }
+                else       { foreign import sokol_app_clib { "sokol_app_macos_x64_metal_release.a", "system:Cocoa.framework","system:QuartzCore.framework","system:Metal.framework","system:MetalKit.framework" } }
+            }
+        }
+    }
+} else when ODIN_OS == .Linux {
+    when DEBUG { foreign import sokol_app_clib { "sokol_app_linux_x64_gl_debug.a", "system:X11", "system:Xi", "system:Xcursor", "system:GL", "system:dl", "system:pthread" } }
+    else       { foreign import sokol_app_clib { "sokol_app_linux_x64_gl_release.a", "system:X11", "system:Xi", "system:Xcursor", "system:GL", "system:dl", "system:pthread" } }
+} else {
+    #panic("This OS is currently not supported")
+}
+
+@(default_calling_convention="c", link_prefix="sapp_")
+foreign sokol_app_clib {
+    // returns true after sokol-app has been initialized
+    isvalid :: proc() -> bool ---
+    // returns the current framebuffer width in pixels
+    width :: proc() -> c.int ---
+    // same as sapp_width(), but returns float
+    widthf :: proc() -> f32 ---
+    // returns the current framebuffer height in pixels
+    height :: proc() -> c.int ---
+    // same as sapp_height(), but returns float
+    heightf :: proc() -> f32 ---
+    // get default framebuffer color pixel format
+    color_format :: proc() -> c.int ---
+    // get default framebuffer depth pixel format
+    depth_format :: proc() -> c.int ---
+    // get default framebuffer sample count
+    sample_count :: proc() -> c.int ---
+    // returns true when high_dpi was requested and actually running in a high-dpi scenario
+    high_dpi :: proc() -> bool ---
+    // returns the dpi scaling factor (window pixels to framebuffer pixels)
+    dpi_scale :: proc() -> f32 ---
+    // show or hide the mobile device onscreen keyboard
+    show_keyboard :: proc(show: bool)  ---
+    // return true if the mobile device onscreen keyboard is currently shown
+    keyboard_shown :: proc() -> bool ---
+    // query fullscreen mode
+    is_fullscreen :: proc() -> bool ---
+    // toggle fullscreen mode
+    toggle_fullscreen :: proc()  ---
+    // show or hide the mouse cursor
+    show_mouse :: proc(show: bool)  ---
+    // show or hide the mouse cursor
+    mouse_shown :: proc() -> bool ---
+    // enable/disable mouse-pointer-lock mode
+    lock_mouse :: proc(lock: bool)  ---
+    // return true if in mouse-pointer-lock mode (this may toggle a few frames later)
+    mouse_locked :: proc() -> bool ---
+    // set mouse cursor type
+    set_mouse_cursor :: proc(cursor: Mouse_Cursor)  ---
+    // get current mouse cursor type
+    get_mouse_cursor :: proc() -> Mouse_Cursor ---
+    // return the userdata pointer optionally provided in sapp_desc
+    userdata :: proc() -> rawptr ---
+    // return a copy of the sapp_desc structure
+    query_desc :: proc() -> Desc ---
+    // initiate a "soft quit" (sends SAPP_EVENTTYPE_QUIT_REQUESTED)
+    request_quit :: proc()  ---
+    // cancel a pending quit (when SAPP_EVENTTYPE_QUIT_REQUESTED has been received)
+    cancel_quit :: proc()  ---
+    // initiate a "hard quit" (quit application without sending SAPP_EVENTTYPE_QUIT_REQUESTED)
+    quit :: proc()  ---
+    // call from inside event callback to consume the current event (don't forward to platform)
+    consume_event :: proc()  ---
+    // get the current frame counter (for comparison with sapp_event.frame_count)
+    frame_count :: proc() -> u64 ---
+    // get an averaged/smoothed frame duration in seconds
+    frame_duration :: proc() -> f64 ---
+    // write string into clipboard
+    set_clipboard_string :: proc(str: cstring)  ---
+    // read string from clipboard (usually during SAPP_EVENTTYPE_CLIPBOARD_PASTED)
+    get_clipboard_string :: proc() -> cstring ---
+    // set the window title (only on desktop platforms)
+    set_window_title :: proc(str: cstring)  ---
+    // set the window icon (only on Windows and Linux)
+    set_icon :: proc(#by_ptr icon_desc: Icon_Desc)  ---
+    // gets the total number of dropped files (after an SAPP_EVENTTYPE_FILES_DROPPED event)
+    get_num_dropped_files :: proc() -> c.int ---
+    // gets the dropped file paths
+    get_dropped_file_path :: proc(#any_int index: c.int) -> cstring ---
+    // special run-function for SOKOL_NO_ENTRY (in standard mode this is an empty stub)
+    run :: proc(#by_ptr desc: Desc)  ---
+    // EGL: get EGLDisplay object
+    egl_get_display :: proc() -> rawptr ---
+    // EGL: get EGLContext object
+    egl_get_context :: proc() -> rawptr ---
+    // HTML5: enable or disable the hardwired "Leave Site?" dialog box
+    html5_ask_leave_site :: proc(ask: bool)  ---
+    // HTML5: get byte size of a dropped file
+    html5_get_dropped_file_size :: proc(#any_int index: c.int) -> u32 ---
+    // HTML5: asynchronously load the content of a dropped file
+    html5_fetch_dropped_file :: proc(#by_ptr request: Html5_Fetch_Request)  ---
+    // Metal: get bridged pointer to Metal device object
+    metal_get_device :: proc() -> rawptr ---
+    // Metal: get bridged pointer to MTKView's current drawable of type CAMetalDrawable
+    metal_get_current_drawable :: proc() -> rawptr ---
+    // Metal: get bridged pointer to MTKView's depth-stencil texture of type MTLTexture
+    metal_get_depth_stencil_texture :: proc() -> rawptr ---
+    // Metal: get bridged pointer to MTKView's msaa-color-texture of type MTLTexture (may be null)
+    metal_get_msaa_color_texture :: proc() -> rawptr ---
+    // macOS: get bridged pointer to macOS NSWindow
+    macos_get_window :: proc() -> rawptr ---
+    // iOS: get bridged pointer to iOS UIWindow
+    ios_get_window :: proc() -> rawptr ---
+    // D3D11: get pointer to ID3D11Device object
+    d3d11_get_device :: proc() -> rawptr ---
+    // D3D11: get pointer to ID3D11DeviceContext object
+    d3d11_get_device_context :: proc() -> rawptr ---
+    // D3D11: get pointer to IDXGISwapChain object
+    d3d11_get_swap_chain :: proc() -> rawptr ---
+    // D3D11: get pointer to ID3D11RenderTargetView object for rendering
+    d3d11_get_render_view :: proc() -> rawptr ---
+    // D3D11: get pointer ID3D11RenderTargetView object for msaa-resolve (may return null)
+    d3d11_get_resolve_view :: proc() -> rawptr ---
+    // D3D11: get pointer ID3D11DepthStencilView
+    d3d11_get_depth_stencil_view :: proc() -> rawptr ---
+    // Win32: get the HWND window handle
+    win32_get_hwnd :: proc() -> rawptr ---
+    // WebGPU: get WGPUDevice handle
+    wgpu_get_device :: proc() -> rawptr ---
+    // WebGPU: get swapchain's WGPUTextureView handle for rendering
+    wgpu_get_render_view :: proc() -> rawptr ---
+    // WebGPU: get swapchain's MSAA-resolve WGPUTextureView (may return null)
+    wgpu_get_resolve_view :: proc() -> rawptr ---
+    // WebGPU: get swapchain's WGPUTextureView for the depth-stencil surface
+    wgpu_get_depth_stencil_view :: proc() -> rawptr ---
+    // GL: get framebuffer object
+    gl_get_framebuffer :: proc() -> u32 ---
+    // GL: get major version (only valid for desktop GL)
+    gl_get_major_version :: proc() -> c.int ---
+    // GL: get minor version (only valid for desktop GL)
+    gl_get_minor_version :: proc() -> c.int ---
+    // Android: get native activity handle
+    android_get_native_activity :: proc() -> rawptr ---
+}
+
+// misc constants
+MAX_TOUCHPOINTS :: 8
+MAX_MOUSEBUTTONS :: 3
+MAX_KEYCODES :: 512
+MAX_ICONIMAGES :: 8
+
+// sapp_event_type
+//
+// The type of event that's passed to the event handler callback
+// in the sapp_event.type field. These are not just "traditional"
+// input events, but also notify the application about state changes
+// or other user-invoked actions.
+Event_Type :: enum i32 {
+    INVALID,
+    KEY_DOWN,
+    KEY_UP,
+    CHAR,
+    MOUSE_DOWN,
+    MOUSE_UP,
+    MOUSE_SCROLL,
+    MOUSE_MOVE,
+    MOUSE_ENTER,
+    MOUSE_LEAVE,
+    TOUCHES_BEGAN,
+    TOUCHES_MOVED,
+    TOUCHES_ENDED,
+    TOUCHES_CANCELLED,
+    RESIZED,
+    ICONIFIED,
+    RESTORED,
+    FOCUSED,
+    UNFOCUSED,
+    SUSPENDED,
+    RESUMED,
+    QUIT_REQUESTED,
+    CLIPBOARD_PASTED,
+    FILES_DROPPED,
+}
+
+// sapp_keycode
+//
+// The 'virtual keycode' of a KEY_DOWN or KEY_UP event in the
+// struct field sapp_event.key_code.
+//
+// Note that the keycode values are identical with GLFW.
+Keycode :: enum i32 {
+    INVALID = 0,
+    SPACE = 32,
+    APOSTROPHE = 39,
+    COMMA = 44,
+    MINUS = 45,
+    PERIOD = 46,
+    SLASH = 47,
+    _0 = 48,
+    _1 = 49,
+    _2 = 50,
+    _3 = 51,
+    _4 = 52,
+    _5 = 53,
+    _6 = 54,
+    _7 = 55,
+    _8 = 56,
+    _9 = 57,
+    SEMICOLON = 59,
+    EQUAL = 61,
+    A = 65,
+    B = 66,
+    C = 67,
+    D = 68,
+    E = 69,
+    F = 70,
+    G = 71,
+    H = 72,
+    I = 73,
+    J = 74,
+    K = 75,
+    L = 76,
+    M = 77,
+    N = 78,
+    O = 79,
+    P = 80,
+    Q = 81,
+    R = 82,
+    S = 83,
+    T = 84,
+    U = 85,
+    V = 86,
+    W = 87,
+    X = 88,
+    Y = 89,
+    Z = 90,
+    LEFT_BRACKET = 91,
+    BACKSLASH = 92,
+    RIGHT_BRACKET = 93,
+    GRAVE_ACCENT = 96,
+    WORLD_1 = 161,
+    WORLD_2 = 162,
+    ESCAPE = 256,
+    ENTER = 257,
+    TAB = 258,
+    BACKSPACE = 259,
+    INSERT = 260,
+    DELETE = 261,
+    RIGHT = 262,
+    LEFT = 263,
+    DOWN = 264,
+    UP = 265,
+    PAGE_UP = 266,
+    PAGE_DOWN = 267,
+    HOME = 268,
+    END = 269,
+    CAPS_LOCK = 280,
+    SCROLL_LOCK = 281,
+    NUM_LOCK = 282,
+    PRINT_SCREEN = 283,
+    PAUSE = 284,
+    F1 = 290,
+    F2 = 291,
+    F3 = 292,
+    F4 = 293,
+    F5 = 294,
+    F6 = 295,
+    F7 = 296,
+    F8 = 297,
+    F9 = 298,
+    F10 = 299,
+    F11 = 300,
+    F12 = 301,
+    F13 = 302,
+    F14 = 303,
+    F15 = 304,
+    F16 = 305,
+    F17 = 306,
+    F18 = 307,
+    F19 = 308,
+    F20 = 309,
+    F21 = 310,
+    F22 = 311,
+    F23 = 312,
+    F24 = 313,
+    F25 = 314,
+    KP_0 = 320,
+    KP_1 = 321,
+    KP_2 = 322,
+    KP_3 = 323,
+    KP_4 = 324,
+    KP_5 = 325,
+    KP_6 = 326,
+    KP_7 = 327,
+    KP_8 = 328,
+    KP_9 = 329,
+    KP_DECIMAL = 330,
+    KP_DIVIDE = 331,
+    KP_MULTIPLY = 332,
+    KP_SUBTRACT = 333,
+    KP_ADD = 334,
+    KP_ENTER = 335,
+    KP_EQUAL = 336,
+    LEFT_SHIFT = 340,
+    LEFT_CONTROL = 341,
+    LEFT_ALT = 342,
+    LEFT_SUPER = 343,
+    RIGHT_SHIFT = 344,
+    RIGHT_CONTROL = 345,
+    RIGHT_ALT = 346,
+    RIGHT_SUPER = 347,
+    MENU = 348,
+}
+
+// Android specific 'tool type' enum for touch events. This lets the
+// application check what type of input device was used for
+// touch events.
+//
+// NOTE: the values must remain in sync with the corresponding
+// Android SDK type, so don't change those.
+//
+// See https://developer.android.com/reference/android/view/MotionEvent#TOOL_TYPE_UNKNOWN
+Android_Tooltype :: enum i32 {
+    // TOOL_TYPE_UNKNOWN
+    UNKNOWN = 0,
+    // TOOL_TYPE_FINGER
+    FINGER = 1,
+    // TOOL_TYPE_STYLUS
+    STYLUS = 2,
+    // TOOL_TYPE_MOUSE
+    MOUSE = 3,
+}
+
+// sapp_touchpoint
+//
+// Describes a single touchpoint in a multitouch event (TOUCHES_BEGAN,
+// TOUCHES_MOVED, TOUCHES_ENDED).
+//
+// Touch points are stored in the nested array sapp_event.touches[],
+// and the number of touches is stored in sapp_event.num_touches.
+Touchpoint :: struct {
+    identifier : c.uintptr_t,
+    pos_x : f32,
+    pos_y : f32,
+    // only valid on Android
+    android_tooltype : Android_Tooltype,
+    changed : bool,
+}
+
+// sapp_mousebutton
+//
+// The currently pressed mouse button in the events MOUSE_DOWN
+// and MOUSE_UP, stored in the struct field sapp_event.mouse_button.
+Mousebutton :: enum i32 {
+    LEFT = 0,
+    RIGHT = 1,
+    MIDDLE = 2,
+    INVALID = 256,
+}
+
+// These are currently pressed modifier keys (and mouse buttons) which are
+// passed in the event struct field sapp_event.modifiers.
+// left or right shift key
+MODIFIER_SHIFT :: 1
+// left or right control key
+MODIFIER_CTRL :: 2
+// left or right alt key
+MODIFIER_ALT :: 4
+// left or right 'super' key
+MODIFIER_SUPER :: 8
+// left mouse button
+MODIFIER_LMB :: 256
+// right mouse button
+MODIFIER_RMB :: 512
+// middle mouse button
+MODIFIER_MMB :: 1024
+
+// sapp_event
+//
+// This is an all-in-one event struct passed to the event handler
+// user callback function. Note that it depends on the event
+// type what struct fields actually contain useful values, so you
+// should first check the event type before reading other struct
+// fields.
+Event :: struct {
+    // current frame counter, always valid, useful for checking if two events were issued in the same frame
+    frame_count : u64,
+    // the event type, always valid
+    type : Event_Type,
+    // the virtual key code, only valid in KEY_UP, KEY_DOWN
+    key_code : Keycode,
+    // the UTF-32 character code, only valid in CHAR events
+    char_code : u32,
+    // true if this is a key-repeat event, valid in KEY_UP, KEY_DOWN and CHAR
+    key_repeat : bool,
+    // current modifier keys, valid in all key-, char- and mouse-events
+    modifiers : u32,
+    // mouse button that was pressed or released, valid in MOUSE_DOWN, MOUSE_UP
+    mouse_button : Mousebutton,
+    // current horizontal mouse position in pixels, always valid except during mouse lock
+    mouse_x : f32,
+    // current vertical mouse position in pixels, always valid except during mouse lock
+    mouse_y : f32,
+    // relative horizontal mouse movement since last frame, always valid
+    mouse_dx : f32,
+    // relative vertical mouse movement since last frame, always valid
+    mouse_dy : f32,
+    // horizontal mouse wheel scroll distance, valid in MOUSE_SCROLL events
+    scroll_x : f32,
+    // vertical mouse wheel scroll distance, valid in MOUSE_SCROLL events
+    scroll_y : f32,
+    // number of valid items in the touches[] array
+    num_touches : c.int,
+    // current touch points, valid in TOUCHES_BEGIN, TOUCHES_MOVED, TOUCHES_ENDED
+    touches : [8]Touchpoint,
+    // current window- and framebuffer sizes in pixels, always valid
+    window_width : c.int,
+    window_height : c.int,
+    // = window_width * dpi_scale
+    framebuffer_width : c.int,
+    // = window_height * dpi_scale
+    framebuffer_height : c.int,
+}
+
+// sg_range
+//
+// A general pointer/size-pair struct and constructor macros for passing binary blobs
+// into sokol_app.h.
+Range :: struct {
+    ptr : rawptr,
+    size : c.size_t,
+}
+
+// sapp_image_desc
+//
+// This is used to describe image data to sokol_app.h (at first, window
+// icons, later maybe cursor images).
+//
+// Note that the actual image pixel format depends on the use case:
+//
+// - window icon pixels are RGBA8
+Image_Desc :: struct {
+    width : c.int,
+    height : c.int,
+    pixels : Range,
+}
+
+// sapp_icon_desc
+//
+// An icon description structure for use in sapp_desc.icon and
+// sapp_set_icon().
+//
+// When setting a custom image, the application can provide a number of
+// candidates differing in size, and sokol_app.h will pick the image(s)
+// closest to the size expected by the platform's window system.
+//
+// To set sokol-app's default icon, set .sokol_default to true.
+//
+// Otherwise provide candidate images of different sizes in the
+// images[] array.
+//
+// If both the sokol_default flag is set to true, any image candidates
+// will be ignored and the sokol_app.h default icon will be set.
+Icon_Desc :: struct {
+    sokol_default : bool,
+    images : [8]Image_Desc,
+}
+
+// sapp_allocator
+//
+// Used in sapp_desc to provide custom memory-alloc and -free functions
+// to sokol_app.h. If memory management should be overridden, both the
+// alloc_fn and free_fn function must be provided (e.g. it's not valid to
+// override one function but not the other).
+Allocator :: struct {
+    alloc_fn : proc "c" (a0: c.size_t, a1: rawptr) -> rawptr,
+    free_fn : proc "c" (a0: rawptr, a1: rawptr),
+    user_data : rawptr,
+}
+
+Log_Item :: enum i32 {
+    OK,
+    MALLOC_FAILED,
+    MACOS_INVALID_NSOPENGL_PROFILE,
+    WIN32_LOAD_OPENGL32_DLL_FAILED,
+    WIN32_CREATE_HELPER_WINDOW_FAILED,
+    WIN32_HELPER_WINDOW_GETDC_FAILED,
+    WIN32_DUMMY_CONTEXT_SET_PIXELFORMAT_FAILED,
+    WIN32_CREATE_DUMMY_CONTEXT_FAILED,
+    WIN32_DUMMY_CONTEXT_MAKE_CURRENT_FAILED,
+    WIN32_GET_PIXELFORMAT_ATTRIB_FAILED,
+    WIN32_WGL_FIND_PIXELFORMAT_FAILED,
+    WIN32_WGL_DESCRIBE_PIXELFORMAT_FAILED,
+    WIN32_WGL_SET_PIXELFORMAT_FAILED,
+    WIN32_WGL_ARB_CREATE_CONTEXT_REQUIRED,
+    WIN32_WGL_ARB_CREATE_CONTEXT_PROFILE_REQUIRED,
+    WIN32_WGL_OPENGL_VERSION_NOT_SUPPORTED,
+    WIN32_WGL_OPENGL_PROFILE_NOT_SUPPORTED,
+    WIN32_WGL_INCOMPATIBLE_DEVICE_CONTEXT,
+    WIN32_WGL_CREATE_CONTEXT_ATTRIBS_FAILED_OTHER,
+    WIN32_D3D11_CREATE_DEVICE_AND_SWAPCHAIN_WITH_DEBUG_FAILED,
+    WIN32_D3D11_GET_IDXGIFACTORY_FAILED,
+    WIN32_D3D11_GET_IDXGIADAPTER_FAILED,
+    WIN32_D3D11_QUERY_INTERFACE_IDXGIDEVICE1_FAILED,
+    WIN32_REGISTER_RAW_INPUT_DEVICES_FAILED_MOUSE_LOCK,
+    WIN32_REGISTER_RAW_INPUT_DEVICES_FAILED_MOUSE_UNLOCK,
+    WIN32_GET_RAW_INPUT_DATA_FAILED,
+    LINUX_GLX_LOAD_LIBGL_FAILED,
+    LINUX_GLX_LOAD_ENTRY_POINTS_FAILED,
+    LINUX_GLX_EXTENSION_NOT_FOUND,
+    LINUX_GLX_QUERY_VERSION_FAILED,
+    LINUX_GLX_VERSION_TOO_LOW,
+    LINUX_GLX_NO_GLXFBCONFIGS,
+    LINUX_GLX_NO_SUITABLE_GLXFBCONFIG,
+    LINUX_GLX_GET_VISUAL_FROM_FBCONFIG_FAILED,
+    LINUX_GLX_REQUIRED_EXTENSIONS_MISSING,
+    LINUX_GLX_CREATE_CONTEXT_FAILED,
+    LINUX_GLX_CREATE_WINDOW_FAILED,
+    LINUX_X11_CREATE_WINDOW_FAILED,
+    LINUX_EGL_BIND_OPENGL_API_FAILED,
+    LINUX_EGL_BIND_OPENGL_ES_API_FAILED,
+    LINUX_EGL_GET_DISPLAY_FAILED,
+    LINUX_EGL_INITIALIZE_FAILED,
+    LINUX_EGL_NO_CONFIGS,
+    LINUX_EGL_NO_NATIVE_VISUAL,
+    LINUX_EGL_GET_VISUAL_INFO_FAILED,
+    LINUX_EGL_CREATE_WINDOW_SURFACE_FAILED,
+    LINUX_EGL_CREATE_CONTEXT_FAILED,
+    LINUX_EGL_MAKE_CURRENT_FAILED,
+    LINUX_X11_OPEN_DISPLAY_FAILED,
+    LINUX_X11_QUERY_SYSTEM_DPI_FAILED,
+    LINUX_X11_DROPPED_FILE_URI_WRONG_SCHEME,
+    LINUX_X11_FAILED_TO_BECOME_OWNER_OF_CLIPBOARD,
+    ANDROID_UNSUPPORTED_INPUT_EVENT_INPUT_CB,
+    ANDROID_UNSUPPORTED_INPUT_EVENT_MAIN_CB,
+    ANDROID_READ_MSG_FAILED,
+    ANDROID_WRITE_MSG_FAILED,
+    ANDROID_MSG_CREATE,
+    ANDROID_MSG_RESUME,
+    ANDROID_MSG_PAUSE,
+    ANDROID_MSG_FOCUS,
+    ANDROID_MSG_NO_FOCUS,
+    ANDROID_MSG_SET_NATIVE_WINDOW,
+    ANDROID_MSG_SET_INPUT_QUEUE,
+    ANDROID_MSG_DESTROY,
+    ANDROID_UNKNOWN_MSG,
+    ANDROID_LOOP_THREAD_STARTED,
+    ANDROID_LOOP_THREAD_DONE,
+    ANDROID_NATIVE_ACTIVITY_ONSTART,
+    ANDROID_NATIVE_ACTIVITY_ONRESUME,
+    ANDROID_NATIVE_ACTIVITY_ONSAVEINSTANCESTATE,
+    ANDROID_NATIVE_ACTIVITY_ONWINDOWFOCUSCHANGED,
+    ANDROID_NATIVE_ACTIVITY_ONPAUSE,
+    ANDROID_NATIVE_ACTIVITY_ONSTOP,
+    ANDROID_NATIVE_ACTIVITY_ONNATIVEWINDOWCREATED,
+    ANDROID_NATIVE_ACTIVITY_ONNATIVEWINDOWDESTROYED,
+    ANDROID_NATIVE_ACTIVITY_ONINPUTQUEUECREATED,
+    ANDROID_NATIVE_ACTIVITY_ONINPUTQUEUEDESTROYED,
+    ANDROID_NATIVE_ACTIVITY_ONCONFIGURATIONCHANGED,
+    ANDROID_NATIVE_ACTIVITY_ONLOWMEMORY,
+    ANDROID_NATIVE_ACTIVITY_ONDESTROY,
+    ANDROID_NATIVE_ACTIVITY_DONE,
+    ANDROID_NATIVE_ACTIVITY_ONCREATE,
+    ANDROID_CREATE_THREAD_PIPE_FAILED,
+    ANDROID_NATIVE_ACTIVITY_CREATE_SUCCESS,
+    WGPU_SWAPCHAIN_CREATE_SURFACE_FAILED,
+    WGPU_SWAPCHAIN_CREATE_SWAPCHAIN_FAILED,
+    WGPU_SWAPCHAIN_CREATE_DEPTH_STENCIL_TEXTURE_FAILED,
+    WGPU_SWAPCHAIN_CREATE_DEPTH_STENCIL_VIEW_FAILED,
+    WGPU_SWAPCHAIN_CREATE_MSAA_TEXTURE_FAILED,
+    WGPU_SWAPCHAIN_CREATE_MSAA_VIEW_FAILED,
+    WGPU_REQUEST_DEVICE_STATUS_ERROR,
+    WGPU_REQUEST_DEVICE_STATUS_UNKNOWN,
+    WGPU_REQUEST_ADAPTER_STATUS_UNAVAILABLE,
+    WGPU_REQUEST_ADAPTER_STATUS_ERROR,
+    WGPU_REQUEST_ADAPTER_STATUS_UNKNOWN,
+    WGPU_CREATE_INSTANCE_FAILED,
+    IMAGE_DATA_SIZE_MISMATCH,
+    DROPPED_FILE_PATH_TOO_LONG,
+    CLIPBOARD_STRING_TOO_BIG,
+}
+
+// sapp_logger
+//
+// Used in sapp_desc to provide a logging function. Please be aware that
+// without logging function, sokol-app will be completely silent, e.g. it will
+// not report errors or warnings. For maximum error verbosity, compile in
+// debug mode (e.g. NDEBUG *not* defined) and install a logger (for instance
+// the standard logging function from sokol_log.h).
+Logger :: struct {
+    func : proc "c" (a0: cstring, a1: u32, a2: u32, a3: cstring, a4: u32, a5: cstring, a6: rawptr),
+    user_data : rawptr,
+}
+
+Desc :: struct {
+    // these are the user-provided callbacks without user data
+    init_cb : proc "c" (),
+    frame_cb : proc "c" (),
+    cleanup_cb : proc "c" (),
+    event_cb : proc "c" (a0: ^Event),
+    // these are the user-provided callbacks with user data
+    user_data : rawptr,
+    init_userdata_cb : proc "c" (a0: rawptr),
+    frame_userdata_cb : proc "c" (a0: rawptr),
+    cleanup_userdata_cb : proc "c" (a0: rawptr),
+    event_userdata_cb : proc "c" (a0: ^Event, a1: rawptr),
+    // the preferred width of the window / canvas
+    width : c.int,
+    // the preferred height of the window / canvas
+    height : c.int,
+    // MSAA sample count
+    sample_count : c.int,
+    // the preferred swap interval (ignored on some platforms)
+    swap_interval : c.int,
+    // whether the rendering canvas is full-resolution on HighDPI displays
+    high_dpi : bool,
+    // whether the window should be created in fullscreen mode
+    fullscreen : bool,
+    // whether the framebuffer should have an alpha channel (ignored on some platforms)
+    alpha : bool,
+    // the window title as UTF-8 encoded string
+    window_title : cstring,
+    // enable clipboard access, default is false
+    enable_clipboard : bool,
+    // max size of clipboard content in bytes
+    clipboard_size : c.int,
+    // enable file dropping (drag'n'drop), default is false
+    enable_dragndrop : bool,
+    // max number of dropped files to process (default: 1)
+    max_dropped_files : c.int,
+    // max length in bytes of a dropped UTF-8 file path (default: 2048)
+    max_dropped_file_path_length : c.int,
+    // the initial window icon to set
+    icon : Icon_Desc,
+    // optional memory allocation overrides (default: malloc/free)
+    allocator : Allocator,
+    // logging callback override (default: NO LOGGING!)
+    logger : Logger,
+    // override GL major and minor version (the default GL version is 4.1 on macOS, 4.3 elsewhere)
+    gl_major_version : c.int,
+    gl_minor_version : c.int,
+    // if true, set the output console codepage to UTF-8
+    win32_console_utf8 : bool,
+    // if true, attach stdout/stderr to a new console window
+    win32_console_create : bool,
+    // if true, attach stdout/stderr to parent process
+    win32_console_attach : bool,
+    // css selector of the HTML5 canvas element, default is "#canvas"
+    html5_canvas_selector : cstring,
+    // if true, the HTML5 canvas size is set to sapp_desc.width/height, otherwise canvas size is tracked
+    html5_canvas_resize : bool,
+    // HTML5 only: whether to preserve default framebuffer content between frames
+    html5_preserve_drawing_buffer : bool,
+    // HTML5 only: whether the rendered pixels use premultiplied alpha convention
+    html5_premultiplied_alpha : bool,
+    // initial state of the internal html5_ask_leave_site flag (see sapp_html5_ask_leave_site())
+    html5_ask_leave_site : bool,
+    // if true, mouse events will bubble up to the web page
+    html5_bubble_mouse_events : bool,
+    // same for touch events
+    html5_bubble_touch_events : bool,
+    // same for wheel events
+    html5_bubble_wheel_events : bool,
+    // if true, bubble up *all* key events to browser, not just key events that represent characters
+    html5_bubble_key_events : bool,
+    // if true, bubble up character events to browser
+    html5_bubble_char_events : bool,
+    // if true, use emscripten_set_main_loop() instead of emscripten_request_animation_frame_loop()
+    html5_use_emsc_set_main_loop : bool,
+    // this will be passed as the simulate_infinite_loop arg to emscripten_set_main_loop()
+    html5_emsc_set_main_loop_simulate_infinite_loop : bool,
+    // if true, showing the iOS keyboard shrinks the canvas
+    ios_keyboard_resizes_canvas : bool,
+}
+
+// HTML5 specific: request and response structs for
+//   asynchronously loading dropped-file content.
+Html5_Fetch_Error :: enum i32 {
+    FETCH_ERROR_NO_ERROR,
+    FETCH_ERROR_BUFFER_TOO_SMALL,
+    FETCH_ERROR_OTHER,
+}
+
+Html5_Fetch_Response :: struct {
+    // true if the loading operation has succeeded
+    succeeded : bool,
+    error_code : Html5_Fetch_Error,
+    // index of the dropped file (0..sapp_get_num_dropped_filed()-1)
+    file_index : c.int,
+    // pointer and size of the fetched data (data.ptr == buffer.ptr, data.size <= buffer.size)
+    data : Range,
+    // the user-provided buffer ptr/size pair (buffer.ptr == data.ptr, buffer.size >= data.size)
+    buffer : Range,
+    // user-provided user data pointer
+    user_data : rawptr,
+}
+
+Html5_Fetch_Request :: struct {
+    // 0..sapp_get_num_dropped_files()-1
+    dropped_file_index : c.int,
+    // response callback function pointer (required)
+    callback : proc "c" (a0: ^Html5_Fetch_Response),
+    // ptr/size of a memory buffer to load the data into
+    buffer : Range,
+    // optional userdata pointer
+    user_data : rawptr,
+}
+
+// sapp_mouse_cursor
+//
+// Predefined cursor image definitions, set with sapp_set_mouse_cursor(sapp_mouse_cursor cursor)
+Mouse_Cursor :: enum i32 {
+    // equivalent with system default cursor
+    DEFAULT = 0,
+    ARROW,
+    IBEAM,
+    CROSSHAIR,
+    POINTING_HAND,
+    RESIZE_EW,
+    RESIZE_NS,
+    RESIZE_NWSE,
+    RESIZE_NESW,
+    RESIZE_ALL,
+    NOT_ALLOWED,
+}
+
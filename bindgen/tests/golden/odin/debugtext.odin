@@ -0,0 +1,235 @@
+// machine generated, do not edit
+
+package sokol_debugtext
+import sg "../gfx"
+
+// helper functions to get a Range pointing into a slice (e.g. `as_range(vertices[:])`)
+// or to a single value (e.g. `as_range(&uniforms)`), without copying
+slice_as_range :: proc "contextless" (data: []$T) -> Range {
+    return { ptr = raw_data(data), size = c.size_t(len(data) * size_of(T)) }
+}
+value_as_range :: proc "contextless" (value: ^$T) -> Range {
+    return { ptr = value, size = size_of(T) }
+}
+as_range :: proc{slice_as_range, value_as_range}
+
+import "core:fmt"
+import "core:strings"
+printf :: proc(s: string, args: ..any) {
+    fstr := fmt.tprintf(s, ..args)
+    putr(strings.unsafe_string_to_cstring(fstr), len(fstr))
+}
+import "core:c"
+
+SOKOL_DEBUG :: #config(SOKOL_DEBUG, ODIN_DEBUG)
+
+DEBUG :: #config(SOKOL_DEBUGTEXT_DEBUG, SOKOL_DEBUG)
+USE_GL :: #config(SOKOL_USE_GL, false)
+USE_DLL :: #config(SOKOL_DLL, false)
+
+when ODIN_OS == .Windows {
+    when USE_DLL {
+        when USE_GL {
+            when DEBUG { foreign import sokol_debugtext_clib { "../sokol_dll_windows_x64_gl_debug.lib" } }
+            else       { foreign import sokol_debugtext_clib { "../sokol_dll_windows_x64_gl_release.lib" } }
+        } else {
+            when DEBUG { foreign import sokol_debugtext_clib { "../sokol_dll_windows_x64_d3d11_debug.lib" } }
+            else       { foreign import sokol_debugtext_clib { "../sokol_dll_windows_x64_d3d11_release.lib" } }
+        }
+    } else {
+        when USE_GL {
+            when DEBUG { foreign import sokol_debugtext_clib { "sokol_debugtext_windows_x64_gl_debug.lib" } }
+            else       { foreign import sokol_debugtext_clib { "sokol_debugtext_windows_x64_gl_release.lib" } }
+        } else {
+            when DEBUG { foreign import sokol_debugtext_clib { "sokol_debugtext_windows_x64_d3d11_debug.lib" } }
+            else       { foreign import sokol_debugtext_clib { "sokol_debugtext_windows_x64_d3d11_release.lib" } }
+        }
+    }
+} else when ODIN_OS == .Darwin {
+    when USE_DLL {
+             when  USE_GL && ODIN_ARCH == .arm64 &&  DEBUG { foreign import sokol_debugtext_clib { "../dylib/sokol_dylib_macos_arm64_gl_debug.dylib" } }
+        else when  USE_GL && ODIN_ARCH == .arm64 && !DEBUG { foreign import sokol_debugtext_clib { "../dylib/sokol_dylib_macos_arm64_gl_release.dylib" } }
+        else when  USE_GL && ODIN_ARCH == .amd64 &&  DEBUG { foreign import sokol_debugtext_clib { "../dylib/sokol_dylib_macos_x64_gl_debug.dylib" } }
+        else when  USE_GL && ODIN_ARCH == .amd64 && !DEBUG { foreign import sokol_debugtext_clib { "../dylib/sokol_dylib_macos_x64_gl_release.dylib" } }
+        else when !USE_GL && ODIN_ARCH == .arm64 &&  DEBUG { foreign import sokol_debugtext_clib { "../dylib/sokol_dylib_macos_arm64_metal_debug.dylib" } }
+        else when !USE_GL && ODIN_ARCH == .arm64 && !DEBUG { foreign import sokol_debugtext_clib { "../dylib/sokol_dylib_macos_arm64_metal_release.dylib" } }
+        else when !USE_GL && ODIN_ARCH == .amd64 &&  DEBUG { foreign import sokol_debugtext_clib { "../dylib/sokol_dylib_macos_x64_metal_debug.dylib" } }
+        else when !USE_GL && ODIN_ARCH == .amd64 && !DEBUG { foreign import sokol_debugtext_clib { "../dylib/sokol_dylib_macos_x64_metal_release.dylib" } }
+    } else {
+        when USE_GL {
+            when ODIN_ARCH == .arm64 {
+                when DEBUG { foreign import sokol_debugtext_clib { "sokol_debugtext_macos_arm64_gl_debug.a" } }
+                else       { foreign import sokol_debugtext_clib { "sokol_debugtext_macos_arm64_gl_release.a" } }
+            } else {
+                when DEBUG { foreign import sokol_debugtext_clib { "sokol_debugtext_macos_x64_gl_debug.a" } }
+                else       { foreign import sokol_debugtext_clib { "sokol_debugtext_macos_x64_gl_release.a" } }
+            }
+        } else {
+            when ODIN_ARCH == .arm64 {
+                when DEBUG { foreign import sokol_debugtext_clib { "sokol_debugtext_macos_arm64_metal_debug.a" } }
+                else       { foreign import sokol_debugtext_clib { "sokol_debugtext_macos_arm64_metal_release.a" } }
+            } else {
+                when DEBUG { foreign import sokol_debugtext_clib { "sokol_debugtext_macos_x64_metal_debug.a" } }
+                else       { foreign import sokol_debugtext_clib { "sokol_debugtext_macos_x64_metal_release.a" } }
+            }
+        }
+    }
+} else when ODIN_OS == .Linux {
+    when DEBUG { foreign import sokol_debugtext_clib { "sokol_debugtext_linux_x64_gl_debug.a" } }
+    else       { foreign import sokol_debugtext_clib { "sokol_debugtext_linux_x64_gl_release.a" } }
+} else {
+    #panic("This OS is currently not supported")
+}
+
+@(default_calling_convention="c", link_prefix="sdtx_")
+foreign sokol_debugtext_clib {
+    setup :: proc(#by_ptr desc: Desc)  ---
+    shutdown :: proc()  ---
+    font_kc853 :: proc() -> Font_Desc ---
+    font_kc854 :: proc() -> Font_Desc ---
+    font_z1013 :: proc() -> Font_Desc ---
+    font_cpc :: proc() -> Font_Desc ---
+    font_c64 :: proc() -> Font_Desc ---
+    font_oric :: proc() -> Font_Desc ---
+    make_context :: proc(#by_ptr desc: Context_Desc) -> Context ---
+    destroy_context :: proc(ctx: Context)  ---
+    set_context :: proc(ctx: Context)  ---
+    get_context :: proc() -> Context ---
+    default_context :: proc() -> Context ---
+    draw :: proc()  ---
+    context_draw :: proc(ctx: Context)  ---
+    draw_layer :: proc(#any_int layer_id: c.int)  ---
+    context_draw_layer :: proc(ctx: Context, #any_int layer_id: c.int)  ---
+    // switch render layer
+    layer :: proc(#any_int layer_id: c.int)  ---
+    // switch to a different font
+    font :: proc(#any_int font_index: c.int)  ---
+    // set a new virtual canvas size in screen pixels
+    canvas :: proc(w: f32, h: f32)  ---
+    // set a new origin in character grid coordinates
+    origin :: proc(x: f32, y: f32)  ---
+    home :: proc()  ---
+    pos :: proc(x: f32, y: f32)  ---
+    pos_x :: proc(x: f32)  ---
+    pos_y :: proc(y: f32)  ---
+    move :: proc(dx: f32, dy: f32)  ---
+    move_x :: proc(dx: f32)  ---
+    move_y :: proc(dy: f32)  ---
+    crlf :: proc()  ---
+    color3b :: proc(r: u8, g: u8, b: u8)  ---
+    color3f :: proc(r: f32, g: f32, b: f32)  ---
+    color4b :: proc(r: u8, g: u8, b: u8, a: u8)  ---
+    color4f :: proc(r: f32, g: f32, b: f32, a: f32)  ---
+    color1i :: proc(rgba: u32)  ---
+    putc :: proc(c: u8)  ---
+    puts :: proc(str: cstring)  ---
+    putr :: proc(str: cstring, #any_int len: c.int)  ---
+}
+
+Log_Item :: enum i32 {
+    OK,
+    MALLOC_FAILED,
+    ADD_COMMIT_LISTENER_FAILED,
+    COMMAND_BUFFER_FULL,
+    CONTEXT_POOL_EXHAUSTED,
+    CANNOT_DESTROY_DEFAULT_CONTEXT,
+}
+
+// sdtx_logger_t
+//
+// Used in sdtx_desc_t to provide a custom logging and error reporting
+// callback to sokol-debugtext.
+Logger :: struct {
+    func : proc "c" (a0: cstring, a1: u32, a2: u32, a3: cstring, a4: u32, a5: cstring, a6: rawptr),
+    user_data : rawptr,
+}
+
+// a rendering context handle
+Context :: struct {
+    id : u32,
+}
+
+// sdtx_range is a pointer-size-pair struct used to pass memory
+// blobs into sokol-debugtext. When initialized from a value type
+// (array or struct), use the SDTX_RANGE() macro to build
+// an sdtx_range struct.
+Range :: struct {
+    ptr : rawptr,
+    size : c.size_t,
+}
+
+Font_Desc :: struct {
+    // pointer to and size of font pixel data
+    data : Range,
+    // first character index in font pixel data
+    first_char : u8,
+    // last character index in font pixel data, inclusive (default: 255)
+    last_char : u8,
+}
+
+// sdtx_context_desc_t
+//
+// Describes the initialization parameters of a rendering context. Creating
+// additional rendering contexts is useful if you want to render in
+// different sokol-gfx rendering passes, or when rendering several layers
+// of text.
+Context_Desc :: struct {
+    // max number of draw commands, each layer transition counts as a command, default: 4096
+    max_commands : c.int,
+    // max number of characters rendered in one frame, default: 4096
+    char_buf_size : c.int,
+    // the initial virtual canvas width, default: 640
+    canvas_width : f32,
+    // the initial virtual canvas height, default: 400
+    canvas_height : f32,
+    // tab width in number of characters, default: 4
+    tab_width : c.int,
+    // color pixel format of target render pass
+    color_format : sg.Pixel_Format,
+    // depth pixel format of target render pass
+    depth_format : sg.Pixel_Format,
+    // MSAA sample count of target render pass
+    sample_count : c.int,
+}
+
+// sdtx_allocator_t
+//
+// Used in sdtx_desc_t to provide custom memory-alloc and -free functions
+// to sokol_debugtext.h. If memory management should be overridden, both the
+// alloc_fn and free_fn function must be provided (e.g. it's not valid to
+// override one function but not the other).
+Allocator :: struct {
+    alloc_fn : proc "c" (a0: c.size_t, a1: rawptr) -> rawptr,
+    free_fn : proc "c" (a0: rawptr, a1: rawptr),
+    user_data : rawptr,
+}
+
+// sdtx_desc_t
+//
+// Describes the sokol-debugtext API initialization parameters. Passed
+// to the sdtx_setup() function.
+//
+// NOTE: to populate the fonts item array with builtin fonts, use any
+// of the following functions:
+//
+//     sdtx_font_kc853()
+//     sdtx_font_kc854()
+//     sdtx_font_z1013()
+//     sdtx_font_cpc()
+//     sdtx_font_c64()
+//     sdtx_font_oric()
+Desc :: struct {
+    // max number of rendering contexts that can be created, default: 8
+    context_pool_size : c.int,
+    // size of internal buffer for snprintf(), default: 4096
+    printf_buf_size : c.int,
+    // up to 8 fonts descriptions
+    fonts : [8]Font_Desc,
+    // the default context creation parameters
+    ctx : Context_Desc,
+    // optional memory allocation overrides (default: malloc/free)
+    allocator : Allocator,
+    // optional log override function (default: NO LOGGING)
+    logger : Logger,
+}
+
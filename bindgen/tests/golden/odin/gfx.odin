@@ -0,0 +1,3015 @@
+// machine generated, do not edit
+
+package sokol_gfx
+
+// helper functions to get a Range pointing into a slice (e.g. `as_range(vertices[:])`)
+// or to a single value (e.g. `as_range(&uniforms)`), without copying
+slice_as_range :: proc "contextless" (data: []$T) -> Range {
+    return { ptr = raw_data(data), size = c.size_t(len(data) * size_of(T)) }
+}
+value_as_range :: proc "contextless" (value: ^$T) -> Range {
+    return { ptr = value, size = size_of(T) }
+}
+as_range :: proc{slice_as_range, value_as_range}
+
+FRAME_STATS_NUM_VALUES :: 85
+FRAME_STATS_NAMES := [FRAME_STATS_NUM_VALUES]string {
+    "frame_index",
+    "num_passes",
+    "num_apply_viewport",
+    "num_apply_scissor_rect",
+    "num_apply_pipeline",
+    "num_apply_bindings",
+    "num_apply_uniforms",
+    "num_draw",
+    "num_update_buffer",
+    "num_append_buffer",
+    "num_update_image",
+    "size_apply_uniforms",
+    "size_update_buffer",
+    "size_append_buffer",
+    "size_update_image",
+    "gl.num_bind_buffer",
+    "gl.num_active_texture",
+    "gl.num_bind_texture",
+    "gl.num_bind_sampler",
+    "gl.num_use_program",
+    "gl.num_render_state",
+    "gl.num_vertex_attrib_pointer",
+    "gl.num_vertex_attrib_divisor",
+    "gl.num_enable_vertex_attrib_array",
+    "gl.num_disable_vertex_attrib_array",
+    "gl.num_uniform",
+    "d3d11.pass.num_om_set_render_targets",
+    "d3d11.pass.num_clear_render_target_view",
+    "d3d11.pass.num_clear_depth_stencil_view",
+    "d3d11.pass.num_resolve_subresource",
+    "d3d11.pipeline.num_rs_set_state",
+    "d3d11.pipeline.num_om_set_depth_stencil_state",
+    "d3d11.pipeline.num_om_set_blend_state",
+    "d3d11.pipeline.num_ia_set_primitive_topology",
+    "d3d11.pipeline.num_ia_set_input_layout",
+    "d3d11.pipeline.num_vs_set_shader",
+    "d3d11.pipeline.num_vs_set_constant_buffers",
+    "d3d11.pipeline.num_ps_set_shader",
+    "d3d11.pipeline.num_ps_set_constant_buffers",
+    "d3d11.bindings.num_ia_set_vertex_buffers",
+    "d3d11.bindings.num_ia_set_index_buffer",
+    "d3d11.bindings.num_vs_set_shader_resources",
+    "d3d11.bindings.num_ps_set_shader_resources",
+    "d3d11.bindings.num_vs_set_samplers",
+    "d3d11.bindings.num_ps_set_samplers",
+    "d3d11.uniforms.num_update_subresource",
+    "d3d11.draw.num_draw_indexed_instanced",
+    "d3d11.draw.num_draw_indexed",
+    "d3d11.draw.num_draw_instanced",
+    "d3d11.draw.num_draw",
+    "d3d11.num_map",
+    "d3d11.num_unmap",
+    "metal.idpool.num_added",
+    "metal.idpool.num_released",
+    "metal.idpool.num_garbage_collected",
+    "metal.pipeline.num_set_blend_color",
+    "metal.pipeline.num_set_cull_mode",
+    "metal.pipeline.num_set_front_facing_winding",
+    "metal.pipeline.num_set_stencil_reference_value",
+    "metal.pipeline.num_set_depth_bias",
+    "metal.pipeline.num_set_render_pipeline_state",
+    "metal.pipeline.num_set_depth_stencil_state",
+    "metal.bindings.num_set_vertex_buffer",
+    "metal.bindings.num_set_vertex_texture",
+    "metal.bindings.num_set_vertex_sampler_state",
+    "metal.bindings.num_set_fragment_buffer",
+    "metal.bindings.num_set_fragment_texture",
+    "metal.bindings.num_set_fragment_sampler_state",
+    "metal.uniforms.num_set_vertex_buffer_offset",
+    "metal.uniforms.num_set_fragment_buffer_offset",
+    "wgpu.uniforms.num_set_bindgroup",
+    "wgpu.uniforms.size_write_buffer",
+    "wgpu.bindings.num_set_vertex_buffer",
+    "wgpu.bindings.num_skip_redundant_vertex_buffer",
+    "wgpu.bindings.num_set_index_buffer",
+    "wgpu.bindings.num_skip_redundant_index_buffer",
+    "wgpu.bindings.num_create_bindgroup",
+    "wgpu.bindings.num_discard_bindgroup",
+    "wgpu.bindings.num_set_bindgroup",
+    "wgpu.bindings.num_skip_redundant_bindgroup",
+    "wgpu.bindings.num_bindgroup_cache_hits",
+    "wgpu.bindings.num_bindgroup_cache_misses",
+    "wgpu.bindings.num_bindgroup_cache_collisions",
+    "wgpu.bindings.num_bindgroup_cache_invalidates",
+    "wgpu.bindings.num_bindgroup_cache_hash_vs_key_mismatch",
+}
+// flat array view of a Frame_Stats struct, for instance for exporting
+frame_stats_flatten :: proc(stats: Frame_Stats) -> [FRAME_STATS_NUM_VALUES]u32 {
+    return {
+        stats.frame_index,
+        stats.num_passes,
+        stats.num_apply_viewport,
+        stats.num_apply_scissor_rect,
+        stats.num_apply_pipeline,
+        stats.num_apply_bindings,
+        stats.num_apply_uniforms,
+        stats.num_draw,
+        stats.num_update_buffer,
+        stats.num_append_buffer,
+        stats.num_update_image,
+        stats.size_apply_uniforms,
+        stats.size_update_buffer,
+        stats.size_append_buffer,
+        stats.size_update_image,
+        stats.gl.num_bind_buffer,
+        stats.gl.num_active_texture,
+        stats.gl.num_bind_texture,
+        stats.gl.num_bind_sampler,
+        stats.gl.num_use_program,
+        stats.gl.num_render_state,
+        stats.gl.num_vertex_attrib_pointer,
+        stats.gl.num_vertex_attrib_divisor,
+        stats.gl.num_enable_vertex_attrib_array,
+        stats.gl.num_disable_vertex_attrib_array,
+        stats.gl.num_uniform,
+        stats.d3d11.pass.num_om_set_render_targets,
+        stats.d3d11.pass.num_clear_render_target_view,
+        stats.d3d11.pass.num_clear_depth_stencil_view,
+        stats.d3d11.pass.num_resolve_subresource,
+        stats.d3d11.pipeline.num_rs_set_state,
+        stats.d3d11.pipeline.num_om_set_depth_stencil_state,
+        stats.d3d11.pipeline.num_om_set_blend_state,
+        stats.d3d11.pipeline.num_ia_set_primitive_topology,
+        stats.d3d11.pipeline.num_ia_set_input_layout,
+        stats.d3d11.pipeline.num_vs_set_shader,
+        stats.d3d11.pipeline.num_vs_set_constant_buffers,
+        stats.d3d11.pipeline.num_ps_set_shader,
+        stats.d3d11.pipeline.num_ps_set_constant_buffers,
+        stats.d3d11.bindings.num_ia_set_vertex_buffers,
+        stats.d3d11.bindings.num_ia_set_index_buffer,
+        stats.d3d11.bindings.num_vs_set_shader_resources,
+        stats.d3d11.bindings.num_ps_set_shader_resources,
+        stats.d3d11.bindings.num_vs_set_samplers,
+        stats.d3d11.bindings.num_ps_set_samplers,
+        stats.d3d11.uniforms.num_update_subresource,
+        stats.d3d11.draw.num_draw_indexed_instanced,
+        stats.d3d11.draw.num_draw_indexed,
+        stats.d3d11.draw.num_draw_instanced,
+        stats.d3d11.draw.num_draw,
+        stats.d3d11.num_map,
+        stats.d3d11.num_unmap,
+        stats.metal.idpool.num_added,
+        stats.metal.idpool.num_released,
+        stats.metal.idpool.num_garbage_collected,
+        stats.metal.pipeline.num_set_blend_color,
+        stats.metal.pipeline.num_set_cull_mode,
+        stats.metal.pipeline.num_set_front_facing_winding,
+        stats.metal.pipeline.num_set_stencil_reference_value,
+        stats.metal.pipeline.num_set_depth_bias,
+        stats.metal.pipeline.num_set_render_pipeline_state,
+        stats.metal.pipeline.num_set_depth_stencil_state,
+        stats.metal.bindings.num_set_vertex_buffer,
+        stats.metal.bindings.num_set_vertex_texture,
+        stats.metal.bindings.num_set_vertex_sampler_state,
+        stats.metal.bindings.num_set_fragment_buffer,
+        stats.metal.bindings.num_set_fragment_texture,
+        stats.metal.bindings.num_set_fragment_sampler_state,
+        stats.metal.uniforms.num_set_vertex_buffer_offset,
+        stats.metal.uniforms.num_set_fragment_buffer_offset,
+        stats.wgpu.uniforms.num_set_bindgroup,
+        stats.wgpu.uniforms.size_write_buffer,
+        stats.wgpu.bindings.num_set_vertex_buffer,
+        stats.wgpu.bindings.num_skip_redundant_vertex_buffer,
+        stats.wgpu.bindings.num_set_index_buffer,
+        stats.wgpu.bindings.num_skip_redundant_index_buffer,
+        stats.wgpu.bindings.num_create_bindgroup,
+        stats.wgpu.bindings.num_discard_bindgroup,
+        stats.wgpu.bindings.num_set_bindgroup,
+        stats.wgpu.bindings.num_skip_redundant_bindgroup,
+        stats.wgpu.bindings.num_bindgroup_cache_hits,
+        stats.wgpu.bindings.num_bindgroup_cache_misses,
+        stats.wgpu.bindings.num_bindgroup_cache_collisions,
+        stats.wgpu.bindings.num_bindgroup_cache_invalidates,
+        stats.wgpu.bindings.num_bindgroup_cache_hash_vs_key_mismatch,
+    }
+}
+// records the flattened frame stats of the last N frames,
+// call frame_stats_collector_push(&c, query_frame_stats()) once per frame
+Frame_Stats_Collector :: struct($N: int) {
+    frames: [N][FRAME_STATS_NUM_VALUES]u32,
+    num: int,
+    pos: int,
+}
+frame_stats_collector_push :: proc(c: ^Frame_Stats_Collector($N), stats: Frame_Stats) {
+    c.frames[c.pos] = frame_stats_flatten(stats)
+    c.pos = (c.pos + 1) % N
+    c.num = min(c.num + 1, N)
+}
+// the most recently pushed frame stats, c.num must be > 0
+frame_stats_collector_latest :: proc(c: ^Frame_Stats_Collector($N)) -> [FRAME_STATS_NUM_VALUES]u32 {
+    assert(c.num > 0)
+    return c.frames[(c.pos + N - 1) % N]
+}
+// average of a value over the recorded frames
+frame_stats_collector_average :: proc(c: ^Frame_Stats_Collector($N), value_index: int) -> f64 {
+    if c.num == 0 {
+        return 0
+    }
+    sum: u64 = 0
+    for i in 0..<c.num {
+        sum += u64(c.frames[i][value_index])
+    }
+    return f64(sum) / f64(c.num)
+}
+// nearest-rank percentile (0..100) of a value over the recorded frames
+frame_stats_collector_percentile :: proc(c: ^Frame_Stats_Collector($N), value_index: int, p: int) -> u32 {
+    if c.num == 0 {
+        return 0
+    }
+    // insertion sort into a stack buffer, avoids allocating
+    values: [N]u32
+    for i in 0..<c.num {
+        value := c.frames[i][value_index]
+        j := i
+        for j > 0 && values[j - 1] > value {
+            values[j] = values[j - 1]
+            j -= 1
+        }
+        values[j] = value
+    }
+    rank := (min(p, 100) * c.num + 99) / 100
+    return values[max(rank - 1, 0)]
+}
+import "core:c"
+
+SOKOL_DEBUG :: #config(SOKOL_DEBUG, ODIN_DEBUG)
+
+DEBUG :: #config(SOKOL_GFX_DEBUG, SOKOL_DEBUG)
+USE_GL :: #config(SOKOL_USE_GL, false)
+USE_DLL :: #config(SOKOL_DLL, false)
+
+when ODIN_OS == .Windows {
+    when USE_DLL {
+        when USE_GL {
+            when DEBUG { foreign import sokol_gfx_clib { "../sokol_dll_windows_x64_gl_debug.lib" } }
+            else       { foreign import sokol_gfx_clib { "../sokol_dll_windows_x64_gl_release.lib" } }
+        } else {
+            when DEBUG { foreign import sokol_gfx_clib { "../sokol_dll_windows_x64_d3d11_debug.lib" } }
+            else       { foreign import sokol_gfx_clib { "../sokol_dll_windows_x64_d3d11_release.lib" } }
+        }
+    } else {
+        when USE_GL {
+            when DEBUG { foreign import sokol_gfx_clib { "sokol_gfx_windows_x64_gl_debug.lib" } }
+            else       { foreign import sokol_gfx_clib { "sokol_gfx_windows_x64_gl_release.lib" } }
+        } else {
+            when DEBUG { foreign import sokol_gfx_clib { "sokol_gfx_windows_x64_d3d11_debug.lib" } }
+            else       { foreign import sokol_gfx_clib { "sokol_gfx_windows_x64_d3d11_release.lib" } }
+        }
+    }
+} else when ODIN_OS == .Darwin {
+    when USE_DLL {
+             when  USE_GL && ODIN_ARCH == .arm64 &&  DEBUG { foreign import sokol_gfx_clib { "../dylib/sokol_dylib_macos_arm64_gl_debug.dylib" } }
+        else when  USE_GL && ODIN_ARCH == .arm64 && !DEBUG { foreign import sokol_gfx_clib { "../dylib/sokol_dylib_macos_arm64_gl_release.dylib" } }
+        else when  USE_GL && ODIN_ARCH == .amd64 &&  DEBUG { foreign import sokol_gfx_clib { "../dylib/sokol_dylib_macos_x64_gl_debug.dylib" } }
+        else when  USE_GL && ODIN_ARCH == .amd64 && !DEBUG { foreign import sokol_gfx_clib { "../dylib/sokol_dylib_macos_x64_gl_release.dylib" } }
+        else when !USE_GL && ODIN_ARCH == .arm64 &&  DEBUG { foreign import sokol_gfx_clib { "../dylib/sokol_dylib_macos_arm64_metal_debug.dylib" } }
+        else when !USE_GL && ODIN_ARCH == .arm64 && !DEBUG { foreign import sokol_gfx_clib { "../dylib/sokol_dylib_macos_arm64_metal_release.dylib" } }
+        else when !USE_GL && ODIN_ARCH == .amd64 &&  DEBUG { foreign import sokol_gfx_clib { "../dylib/sokol_dylib_macos_x64_metal_debug.dylib" } }
+        else when !USE_GL && ODIN_ARCH == .amd64 && !DEBUG { foreign import sokol_gfx_clib { "../dylib/sokol_dylib_macos_x64_metal_release.dylib" } }
+    } else {
+        when USE_GL {
+            when ODIN_ARCH == .arm64 {
+                when DEBUG { foreign import sokol_gfx_clib { "sokol_gfx_macos_arm64_gl_debug.a", "system:Cocoa.framework","system:QuartzCore.framework","system:OpenGL.framework" } }
+                else       { foreign import sokol_gfx_clib { "sokol_gfx_macos_arm64_gl_release.a", "system:Cocoa.framework","system:QuartzCore.framework","system:OpenGL.framework" } }
+            } else {
+                when DEBUG { foreign import sokol_gfx_clib { "sokol_gfx_macos_x64_gl_debug.a", "system:Cocoa.framework","system:QuartzCore.framework","system:OpenGL.framework" } }
+                else       { foreign import sokol_gfx_clib { "sokol_gfx_macos_x64_gl_release.a", "system:Cocoa.framework","system:QuartzCore.framework","system:OpenGL.framework" } }
+            }
+        } else {
+            when ODIN_ARCH == .arm64 {
+                when DEBUG { foreign import sokol_gfx_clib { "sokol_gfx_macos_arm64_metal_debug.a", "system:Cocoa.framework","system:QuartzCore.framework","system:Metal.framework","system:MetalKit.framework" } }
+                else       { foreign import sokol_gfx_clib { "sokol_gfx_macos_arm64_metal_release.a", "system:Cocoa.framework","system:QuartzCore.framework","system:Metal.framework","system:MetalKit.framework" } }
+            } else {
+                when DEBUG { foreign import sokol_gfx_clib { "sokol_gfx_macos_x64_metal_debug.a", "system:Cocoa.framework","system:QuartzCore.framework","system:Metal.framework","system:MetalKit.framework" } }
+                else       { foreign import sokol_gfx_clib { "sokol_gfx_macos_x64_metal_release.a", "system:Cocoa.framework","system:QuartzCore.framework","system:Metal.framework","system:MetalKit.framework" } }
+            }
+        }
+    }
+} else when ODIN_OS == .Linux {
+    when DEBUG { foreign import sokol_gfx_clib { "sokol_gfx_linux_x64_gl_debug.a", "system:GL", "system:dl", "system:pthread" } }
+    else       { foreign import sokol_gfx_clib { "sokol_gfx_linux_x64_gl_release.a", "system:GL", "system:dl", "system:pthread" } }
+} else {
+    #panic("This OS is currently not supported")
+}
+
+@(default_calling_convention="c", link_prefix="sg_")
+foreign sokol_gfx_clib {
+    setup :: proc(#by_ptr desc: Desc)  ---
+    shutdown :: proc()  ---
+    isvalid :: proc() -> bool ---
+    reset_state_cache :: proc()  ---
+    push_debug_group :: proc(name: cstring)  ---
+    pop_debug_group :: proc()  ---
+    add_commit_listener :: proc(listener: Commit_Listener) -> bool ---
+    remove_commit_listener :: proc(listener: Commit_Listener) -> bool ---
+    make_buffer :: proc(#by_ptr desc: Buffer_Desc) -> Buffer ---
+    make_image :: proc(#by_ptr desc: Image_Desc) -> Image ---
+    make_sampler :: proc(#by_ptr desc: Sampler_Desc) -> Sampler ---
+    make_shader :: proc(#by_ptr desc: Shader_Desc) -> Shader ---
+    make_pipeline :: proc(#by_ptr desc: Pipeline_Desc) -> Pipeline ---
+    make_attachments :: proc(#by_ptr desc: Attachments_Desc) -> Attachments ---
+    destroy_buffer :: proc(buf: Buffer)  ---
+    destroy_image :: proc(img: Image)  ---
+    destroy_sampler :: proc(smp: Sampler)  ---
+    destroy_shader :: proc(shd: Shader)  ---
+    destroy_pipeline :: proc(pip: Pipeline)  ---
+    destroy_attachments :: proc(atts: Attachments)  ---
+    update_buffer :: proc(buf: Buffer, #by_ptr data: Range)  ---
+    update_image :: proc(img: Image, #by_ptr data: Image_Data)  ---
+    append_buffer :: proc(buf: Buffer, #by_ptr data: Range) -> c.int ---
+    query_buffer_overflow :: proc(buf: Buffer) -> bool ---
+    query_buffer_will_overflow :: proc(buf: Buffer, size: c.size_t) -> bool ---
+    begin_pass :: proc(#by_ptr pass: Pass)  ---
+    apply_viewport :: proc(#any_int x: c.int, #any_int y: c.int, #any_int width: c.int, #any_int height: c.int, origin_top_left: bool)  ---
+    apply_viewportf :: proc(x: f32, y: f32, width: f32, height: f32, origin_top_left: bool)  ---
+    apply_scissor_rect :: proc(#any_int x: c.int, #any_int y: c.int, #any_int width: c.int, #any_int height: c.int, origin_top_left: bool)  ---
+    apply_scissor_rectf :: proc(x: f32, y: f32, width: f32, height: f32, origin_top_left: bool)  ---
+    apply_pipeline :: proc(pip: Pipeline)  ---
+    apply_bindings :: proc(#by_ptr bindings: Bindings)  ---
+    apply_uniforms :: proc(#any_int ub_slot: c.int, #by_ptr data: Range)  ---
+    draw :: proc(#any_int base_element: c.int, #any_int num_elements: c.int, #any_int num_instances: c.int)  ---
+    end_pass :: proc()  ---
+    commit :: proc()  ---
+    query_desc :: proc() -> Desc ---
+    query_backend :: proc() -> Backend ---
+    query_features :: proc() -> Features ---
+    query_limits :: proc() -> Limits ---
+    query_pixelformat :: proc(fmt: Pixel_Format) -> Pixelformat_Info ---
+    query_row_pitch :: proc(fmt: Pixel_Format, #any_int width: c.int, #any_int row_align_bytes: c.int) -> c.int ---
+    query_surface_pitch :: proc(fmt: Pixel_Format, #any_int width: c.int, #any_int height: c.int, #any_int row_align_bytes: c.int) -> c.int ---
+    query_buffer_state :: proc(buf: Buffer) -> Resource_State ---
+    query_image_state :: proc(img: Image) -> Resource_State ---
+    query_sampler_state :: proc(smp: Sampler) -> Resource_State ---
+    query_shader_state :: proc(shd: Shader) -> Resource_State ---
+    query_pipeline_state :: proc(pip: Pipeline) -> Resource_State ---
+    query_attachments_state :: proc(atts: Attachments) -> Resource_State ---
+    query_buffer_info :: proc(buf: Buffer) -> Buffer_Info ---
+    query_image_info :: proc(img: Image) -> Image_Info ---
+    query_sampler_info :: proc(smp: Sampler) -> Sampler_Info ---
+    query_shader_info :: proc(shd: Shader) -> Shader_Info ---
+    query_pipeline_info :: proc(pip: Pipeline) -> Pipeline_Info ---
+    query_attachments_info :: proc(atts: Attachments) -> Attachments_Info ---
+    query_buffer_desc :: proc(buf: Buffer) -> Buffer_Desc ---
+    query_image_desc :: proc(img: Image) -> Image_Desc ---
+    query_sampler_desc :: proc(smp: Sampler) -> Sampler_Desc ---
+    query_shader_desc :: proc(shd: Shader) -> Shader_Desc ---
+    query_pipeline_desc :: proc(pip: Pipeline) -> Pipeline_Desc ---
+    query_attachments_desc :: proc(atts: Attachments) -> Attachments_Desc ---
+    query_buffer_defaults :: proc(#by_ptr desc: Buffer_Desc) -> Buffer_Desc ---
+    query_image_defaults :: proc(#by_ptr desc: Image_Desc) -> Image_Desc ---
+    query_sampler_defaults :: proc(#by_ptr desc: Sampler_Desc) -> Sampler_Desc ---
+    query_shader_defaults :: proc(#by_ptr desc: Shader_Desc) -> Shader_Desc ---
+    query_pipeline_defaults :: proc(#by_ptr desc: Pipeline_Desc) -> Pipeline_Desc ---
+    query_attachments_defaults :: proc(#by_ptr desc: Attachments_Desc) -> Attachments_Desc ---
+    query_buffer_size :: proc(buf: Buffer) -> c.size_t ---
+    query_buffer_type :: proc(buf: Buffer) -> Buffer_Type ---
+    query_buffer_usage :: proc(buf: Buffer) -> Usage ---
+    query_image_type :: proc(img: Image) -> Image_Type ---
+    query_image_width :: proc(img: Image) -> c.int ---
+    query_image_height :: proc(img: Image) -> c.int ---
+    query_image_num_slices :: proc(img: Image) -> c.int ---
+    query_image_num_mipmaps :: proc(img: Image) -> c.int ---
+    query_image_pixelformat :: proc(img: Image) -> Pixel_Format ---
+    query_image_usage :: proc(img: Image) -> Usage ---
+    query_image_sample_count :: proc(img: Image) -> c.int ---
+    alloc_buffer :: proc() -> Buffer ---
+    alloc_image :: proc() -> Image ---
+    alloc_sampler :: proc() -> Sampler ---
+    alloc_shader :: proc() -> Shader ---
+    alloc_pipeline :: proc() -> Pipeline ---
+    alloc_attachments :: proc() -> Attachments ---
+    dealloc_buffer :: proc(buf: Buffer)  ---
+    dealloc_image :: proc(img: Image)  ---
+    dealloc_sampler :: proc(smp: Sampler)  ---
+    dealloc_shader :: proc(shd: Shader)  ---
+    dealloc_pipeline :: proc(pip: Pipeline)  ---
+    dealloc_attachments :: proc(attachments: Attachments)  ---
+    init_buffer :: proc(buf: Buffer, #by_ptr desc: Buffer_Desc)  ---
+    init_image :: proc(img: Image, #by_ptr desc: Image_Desc)  ---
+    init_sampler :: proc(smg: Sampler, #by_ptr desc: Sampler_Desc)  ---
+    init_shader :: proc(shd: Shader, #by_ptr desc: Shader_Desc)  ---
+    init_pipeline :: proc(pip: Pipeline, #by_ptr desc: Pipeline_Desc)  ---
+    init_attachments :: proc(attachments: Attachments, #by_ptr desc: Attachments_Desc)  ---
+    uninit_buffer :: proc(buf: Buffer)  ---
+    uninit_image :: proc(img: Image)  ---
+    uninit_sampler :: proc(smp: Sampler)  ---
+    uninit_shader :: proc(shd: Shader)  ---
+    uninit_pipeline :: proc(pip: Pipeline)  ---
+    uninit_attachments :: proc(atts: Attachments)  ---
+    fail_buffer :: proc(buf: Buffer)  ---
+    fail_image :: proc(img: Image)  ---
+    fail_sampler :: proc(smp: Sampler)  ---
+    fail_shader :: proc(shd: Shader)  ---
+    fail_pipeline :: proc(pip: Pipeline)  ---
+    fail_attachments :: proc(atts: Attachments)  ---
+    enable_frame_stats :: proc()  ---
+    disable_frame_stats :: proc()  ---
+    frame_stats_enabled :: proc() -> bool ---
+    query_frame_stats :: proc() -> Frame_Stats ---
+    // D3D11: return ID3D11Device
+    d3d11_device :: proc() -> rawptr ---
+    // D3D11: return ID3D11DeviceContext
+    d3d11_device_context :: proc() -> rawptr ---
+    // D3D11: get internal buffer resource objects
+    d3d11_query_buffer_info :: proc(buf: Buffer) -> D3d11_Buffer_Info ---
+    // D3D11: get internal image resource objects
+    d3d11_query_image_info :: proc(img: Image) -> D3d11_Image_Info ---
+    // D3D11: get internal sampler resource objects
+    d3d11_query_sampler_info :: proc(smp: Sampler) -> D3d11_Sampler_Info ---
+    // D3D11: get internal shader resource objects
+    d3d11_query_shader_info :: proc(shd: Shader) -> D3d11_Shader_Info ---
+    // D3D11: get internal pipeline resource objects
+    d3d11_query_pipeline_info :: proc(pip: Pipeline) -> D3d11_Pipeline_Info ---
+    // D3D11: get internal pass resource objects
+    d3d11_query_attachments_info :: proc(atts: Attachments) -> D3d11_Attachments_Info ---
+    // Metal: return __bridge-casted MTLDevice
+    mtl_device :: proc() -> rawptr ---
+    // Metal: return __bridge-casted MTLRenderCommandEncoder in current pass (or zero if outside pass)
+    mtl_render_command_encoder :: proc() -> rawptr ---
+    // Metal: get internal __bridge-casted buffer resource objects
+    mtl_query_buffer_info :: proc(buf: Buffer) -> Mtl_Buffer_Info ---
+    // Metal: get internal __bridge-casted image resource objects
+    mtl_query_image_info :: proc(img: Image) -> Mtl_Image_Info ---
+    // Metal: get internal __bridge-casted sampler resource objects
+    mtl_query_sampler_info :: proc(smp: Sampler) -> Mtl_Sampler_Info ---
+    // Metal: get internal __bridge-casted shader resource objects
+    mtl_query_shader_info :: proc(shd: Shader) -> Mtl_Shader_Info ---
+    // Metal: get internal __bridge-casted pipeline resource objects
+    mtl_query_pipeline_info :: proc(pip: Pipeline) -> Mtl_Pipeline_Info ---
+    // WebGPU: return WGPUDevice object
+    wgpu_device :: proc() -> rawptr ---
+    // WebGPU: return WGPUQueue object
+    wgpu_queue :: proc() -> rawptr ---
+    // WebGPU: return this frame's WGPUCommandEncoder
+    wgpu_command_encoder :: proc() -> rawptr ---
+    // WebGPU: return WGPURenderPassEncoder of current pass
+    wgpu_render_pass_encoder :: proc() -> rawptr ---
+    // WebGPU: get internal buffer resource objects
+    wgpu_query_buffer_info :: proc(buf: Buffer) -> Wgpu_Buffer_Info ---
+    // WebGPU: get internal image resource objects
+    wgpu_query_image_info :: proc(img: Image) -> Wgpu_Image_Info ---
+    // WebGPU: get internal sampler resource objects
+    wgpu_query_sampler_info :: proc(smp: Sampler) -> Wgpu_Sampler_Info ---
+    // WebGPU: get internal shader resource objects
+    wgpu_query_shader_info :: proc(shd: Shader) -> Wgpu_Shader_Info ---
+    // WebGPU: get internal pipeline resource objects
+    wgpu_query_pipeline_info :: proc(pip: Pipeline) -> Wgpu_Pipeline_Info ---
+    // WebGPU: get internal pass resource objects
+    wgpu_query_attachments_info :: proc(atts: Attachments) -> Wgpu_Attachments_Info ---
+    // GL: get internal buffer resource objects
+    gl_query_buffer_info :: proc(buf: Buffer) -> Gl_Buffer_Info ---
+    // GL: get internal image resource objects
+    gl_query_image_info :: proc(img: Image) -> Gl_Image_Info ---
+    // GL: get internal sampler resource objects
+    gl_query_sampler_info :: proc(smp: Sampler) -> Gl_Sampler_Info ---
+    // GL: get internal shader resource objects
+    gl_query_shader_info :: proc(shd: Shader) -> Gl_Shader_Info ---
+    // GL: get internal pass resource objects
+    gl_query_attachments_info :: proc(atts: Attachments) -> Gl_Attachments_Info ---
+}
+
+Buffer :: struct {
+    id : u32,
+}
+
+Image :: struct {
+    id : u32,
+}
+
+Sampler :: struct {
+    id : u32,
+}
+
+Shader :: struct {
+    id : u32,
+}
+
+Pipeline :: struct {
+    id : u32,
+}
+
+Attachments :: struct {
+    id : u32,
+}
+
+// sg_range is a pointer-size-pair struct used to pass memory blobs into
+// sokol-gfx. When initialized from a value type (array or struct), you can
+// use the SG_RANGE() macro to build an sg_range struct. For functions which
+// take either a sg_range pointer, or a (C++) sg_range reference, use the
+// SG_RANGE_REF macro as a solution which compiles both in C and C++.
+Range :: struct {
+    ptr : rawptr,
+    size : c.size_t,
+}
+
+// various compile-time constants in the public API
+INVALID_ID :: 0
+NUM_INFLIGHT_FRAMES :: 2
+MAX_COLOR_ATTACHMENTS :: 4
+MAX_UNIFORMBLOCK_MEMBERS :: 16
+MAX_VERTEX_ATTRIBUTES :: 16
+MAX_MIPMAPS :: 16
+MAX_TEXTUREARRAY_LAYERS :: 128
+MAX_UNIFORMBLOCK_BINDSLOTS :: 8
+MAX_VERTEXBUFFER_BINDSLOTS :: 8
+MAX_IMAGE_BINDSLOTS :: 16
+MAX_SAMPLER_BINDSLOTS :: 16
+MAX_STORAGEBUFFER_BINDSLOTS :: 8
+MAX_IMAGE_SAMPLER_PAIRS :: 16
+
+// sg_color
+//
+// An RGBA color value.
+Color :: struct {
+    r : f32,
+    g : f32,
+    b : f32,
+    a : f32,
+}
+
+// sg_backend
+//
+// The active 3D-API backend, use the function sg_query_backend()
+// to get the currently active backend.
+Backend :: enum i32 {
+    GLCORE,
+    GLES3,
+    D3D11,
+    METAL_IOS,
+    METAL_MACOS,
+    METAL_SIMULATOR,
+    WGPU,
+    DUMMY,
+}
+
+// sg_pixel_format
+//
+// sokol_gfx.h basically uses the same pixel formats as WebGPU, since these
+// are supported on most newer GPUs.
+//
+// A pixelformat name consist of three parts:
+//
+//     - components (R, RG, RGB or RGBA)
+//     - bit width per component (8, 16 or 32)
+//     - component data type:
+//         - unsigned normalized (no postfix)
+//         - signed normalized (SN postfix)
+//         - unsigned integer (UI postfix)
+//         - signed integer (SI postfix)
+//         - float (F postfix)
+//
+// Not all pixel formats can be used for everything, call sg_query_pixelformat()
+// to inspect the capabilities of a given pixelformat. The function returns
+// an sg_pixelformat_info struct with the following members:
+//
+//     - sample: the pixelformat can be sampled as texture at least with
+//               nearest filtering
+//     - filter: the pixelformat can be sampled as texture with linear
+//               filtering
+//     - render: the pixelformat can be used as render-pass attachment
+//     - blend:  blending is supported when used as render-pass attachment
+//     - msaa:   multisample-antialiasing is supported when used
+//               as render-pass attachment
+//     - depth:  the pixelformat can be used for depth-stencil attachments
+//     - compressed: this is a block-compressed format
+//     - bytes_per_pixel: the numbers of bytes in a pixel (0 for compressed formats)
+//
+// The default pixel format for texture images is SG_PIXELFORMAT_RGBA8.
+//
+// The default pixel format for render target images is platform-dependent
+// and taken from the sg_environment struct passed into sg_setup(). Typically
+// the default formats are:
+//
+//     - for the Metal, D3D11 and WebGPU backends: SG_PIXELFORMAT_BGRA8
+//     - for GL backends: SG_PIXELFORMAT_RGBA8
+Pixel_Format :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    NONE,
+    R8,
+    R8SN,
+    R8UI,
+    R8SI,
+    R16,
+    R16SN,
+    R16UI,
+    R16SI,
+    R16F,
+    RG8,
+    RG8SN,
+    RG8UI,
+    RG8SI,
+    R32UI,
+    R32SI,
+    R32F,
+    RG16,
+    RG16SN,
+    RG16UI,
+    RG16SI,
+    RG16F,
+    RGBA8,
+    SRGB8A8,
+    RGBA8SN,
+    RGBA8UI,
+    RGBA8SI,
+    BGRA8,
+    RGB10A2,
+    RG11B10F,
+    RGB9E5,
+    RG32UI,
+    RG32SI,
+    RG32F,
+    RGBA16,
+    RGBA16SN,
+    RGBA16UI,
+    RGBA16SI,
+    RGBA16F,
+    RGBA32UI,
+    RGBA32SI,
+    RGBA32F,
+    DEPTH,
+    DEPTH_STENCIL,
+    BC1_RGBA,
+    BC2_RGBA,
+    BC3_RGBA,
+    BC3_SRGBA,
+    BC4_R,
+    BC4_RSN,
+    BC5_RG,
+    BC5_RGSN,
+    BC6H_RGBF,
+    BC6H_RGBUF,
+    BC7_RGBA,
+    BC7_SRGBA,
+    // FIXME: deprecated
+    PVRTC_RGB_2BPP,
+    // FIXME: deprecated
+    PVRTC_RGB_4BPP,
+    // FIXME: deprecated
+    PVRTC_RGBA_2BPP,
+    // FIXME: deprecated
+    PVRTC_RGBA_4BPP,
+    ETC2_RGB8,
+    ETC2_SRGB8,
+    ETC2_RGB8A1,
+    ETC2_RGBA8,
+    ETC2_SRGB8A8,
+    EAC_R11,
+    EAC_R11SN,
+    EAC_RG11,
+    EAC_RG11SN,
+    ASTC_4x4_RGBA,
+    ASTC_4x4_SRGBA,
+}
+
+// Runtime information about a pixel format, returned by sg_query_pixelformat().
+Pixelformat_Info :: struct {
+    // pixel format can be sampled in shaders at least with nearest filtering
+    sample : bool,
+    // pixel format can be sampled with linear filtering
+    filter : bool,
+    // pixel format can be used as render-pass attachment
+    render : bool,
+    // pixel format supports alpha-blending when used as render-pass attachment
+    blend : bool,
+    // pixel format supports MSAA when used as render-pass attachment
+    msaa : bool,
+    // pixel format is a depth format
+    depth : bool,
+    // true if this is a hardware-compressed format
+    compressed : bool,
+    // NOTE: this is 0 for compressed formats, use sg_query_row_pitch() / sg_query_surface_pitch() as alternative
+    bytes_per_pixel : c.int,
+}
+
+// Runtime information about available optional features, returned by sg_query_features()
+Features :: struct {
+    // framebuffer- and texture-origin is in top left corner
+    origin_top_left : bool,
+    // border color and clamp-to-border uv-wrap mode is supported
+    image_clamp_to_border : bool,
+    // multiple-render-target rendering can use per-render-target blend state
+    mrt_independent_blend_state : bool,
+    // multiple-render-target rendering can use per-render-target color write masks
+    mrt_independent_write_mask : bool,
+    // storage buffers are supported
+    storage_buffer : bool,
+    // if true, multisampled images can be bound as texture resources
+    msaa_image_bindings : bool,
+}
+
+// Runtime information about resource limits, returned by sg_query_limit()
+Limits :: struct {
+    // max width/height of SG_IMAGETYPE_2D images
+    max_image_size_2d : c.int,
+    // max width/height of SG_IMAGETYPE_CUBE images
+    max_image_size_cube : c.int,
+    // max width/height/depth of SG_IMAGETYPE_3D images
+    max_image_size_3d : c.int,
+    // max width/height of SG_IMAGETYPE_ARRAY images
+    max_image_size_array : c.int,
+    // max number of layers in SG_IMAGETYPE_ARRAY images
+    max_image_array_layers : c.int,
+    // max number of vertex attributes, clamped to SG_MAX_VERTEX_ATTRIBUTES
+    max_vertex_attrs : c.int,
+    // <= GL_MAX_VERTEX_UNIFORM_COMPONENTS (only on GL backends)
+    gl_max_vertex_uniform_components : c.int,
+    // <= GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS (only on GL backends)
+    gl_max_combined_texture_image_units : c.int,
+}
+
+// sg_resource_state
+//
+// The current state of a resource in its resource pool.
+// Resources start in the INITIAL state, which means the
+// pool slot is unoccupied and can be allocated. When a resource is
+// created, first an id is allocated, and the resource pool slot
+// is set to state ALLOC. After allocation, the resource is
+// initialized, which may result in the VALID or FAILED state. The
+// reason why allocation and initialization are separate is because
+// some resource types (e.g. buffers and images) might be asynchronously
+// initialized by the user application. If a resource which is not
+// in the VALID state is attempted to be used for rendering, rendering
+// operations will silently be dropped.
+//
+// The special INVALID state is returned in sg_query_xxx_state() if no
+// resource object exists for the provided resource id.
+Resource_State :: enum i32 {
+    INITIAL,
+    ALLOC,
+    VALID,
+    FAILED,
+    INVALID,
+}
+
+// sg_usage
+//
+// A resource usage hint describing the update strategy of
+// buffers and images. This is used in the sg_buffer_desc.usage
+// and sg_image_desc.usage members when creating buffers
+// and images:
+//
+// SG_USAGE_IMMUTABLE:     the resource will never be updated with
+//                         new data, instead the content of the
+//                         resource must be provided on creation
+// SG_USAGE_DYNAMIC:       the resource will be updated infrequently
+//                         with new data (this could range from "once
+//                         after creation", to "quite often but not
+//                         every frame")
+// SG_USAGE_STREAM:        the resource will be updated each frame
+//                         with new content
+//
+// The rendering backends use this hint to prevent that the
+// CPU needs to wait for the GPU when attempting to update
+// a resource that might be currently accessed by the GPU.
+//
+// Resource content is updated with the functions sg_update_buffer() or
+// sg_append_buffer() for buffer objects, and sg_update_image() for image
+// objects. For the sg_update_*() functions, only one update is allowed per
+// frame and resource object, while sg_append_buffer() can be called
+// multiple times per frame on the same buffer. The application must update
+// all data required for rendering (this means that the update data can be
+// smaller than the resource size, if only a part of the overall resource
+// size is used for rendering, you only need to make sure that the data that
+// *is* used is valid).
+//
+// The default usage is SG_USAGE_IMMUTABLE.
+Usage :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    IMMUTABLE,
+    DYNAMIC,
+    STREAM,
+}
+
+// sg_buffer_type
+//
+// Indicates whether a buffer will be bound as vertex-,
+// index- or storage-buffer.
+//
+// Used in the sg_buffer_desc.type member when creating a buffer.
+//
+// The default value is SG_BUFFERTYPE_VERTEXBUFFER.
+Buffer_Type :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    VERTEXBUFFER,
+    INDEXBUFFER,
+    STORAGEBUFFER,
+}
+
+// sg_index_type
+//
+// Indicates whether indexed rendering (fetching vertex-indices from an
+// index buffer) is used, and if yes, the index data type (16- or 32-bits).
+//
+// This is used in the sg_pipeline_desc.index_type member when creating a
+// pipeline object.
+//
+// The default index type is SG_INDEXTYPE_NONE.
+Index_Type :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    NONE,
+    UINT16,
+    UINT32,
+}
+
+// sg_image_type
+//
+// Indicates the basic type of an image object (2D-texture, cubemap,
+// 3D-texture or 2D-array-texture). Used in the sg_image_desc.type member when
+// creating an image, and in sg_shader_image_desc to describe a sampled texture
+// in the shader (both must match and will be checked in the validation layer
+// when calling sg_apply_bindings).
+//
+// The default image type when creating an image is SG_IMAGETYPE_2D.
+Image_Type :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    _2D,
+    CUBE,
+    _3D,
+    ARRAY,
+}
+
+// sg_image_sample_type
+//
+// The basic data type of a texture sample as expected by a shader.
+// Must be provided in sg_shader_image and used by the validation
+// layer in sg_apply_bindings() to check if the provided image object
+// is compatible with what the shader expects. Apart from the sokol-gfx
+// validation layer, WebGPU is the only backend API which actually requires
+// matching texture and sampler type to be provided upfront for validation
+// (other 3D APIs treat texture/sampler type mismatches as undefined behaviour).
+//
+// NOTE that the following texture pixel formats require the use
+// of SG_IMAGESAMPLETYPE_UNFILTERABLE_FLOAT, combined with a sampler
+// of type SG_SAMPLERTYPE_NONFILTERING:
+//
+// - SG_PIXELFORMAT_R32F
+// - SG_PIXELFORMAT_RG32F
+// - SG_PIXELFORMAT_RGBA32F
+//
+// (when using sokol-shdc, also check out the meta tags `@image_sample_type`
+// and `@sampler_type`)
+Image_Sample_Type :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    FLOAT,
+    DEPTH,
+    SINT,
+    UINT,
+    UNFILTERABLE_FLOAT,
+}
+
+// sg_sampler_type
+//
+// The basic type of a texture sampler (sampling vs comparison) as
+// defined in a shader. Must be provided in sg_shader_sampler_desc.
+//
+// sg_image_sample_type and sg_sampler_type for a texture/sampler
+// pair must be compatible with each other, specifically only
+// the following pairs are allowed:
+//
+// - SG_IMAGESAMPLETYPE_FLOAT => (SG_SAMPLERTYPE_FILTERING or SG_SAMPLERTYPE_NONFILTERING)
+// - SG_IMAGESAMPLETYPE_UNFILTERABLE_FLOAT => SG_SAMPLERTYPE_NONFILTERING
+// - SG_IMAGESAMPLETYPE_SINT => SG_SAMPLERTYPE_NONFILTERING
+// - SG_IMAGESAMPLETYPE_UINT => SG_SAMPLERTYPE_NONFILTERING
+// - SG_IMAGESAMPLETYPE_DEPTH => SG_SAMPLERTYPE_COMPARISON
+Sampler_Type :: enum i32 {
+    DEFAULT,
+    FILTERING,
+    NONFILTERING,
+    COMPARISON,
+}
+
+// sg_cube_face
+//
+// The cubemap faces. Use these as indices in the sg_image_desc.content
+// array.
+Cube_Face :: enum i32 {
+    POS_X,
+    NEG_X,
+    POS_Y,
+    NEG_Y,
+    POS_Z,
+    NEG_Z,
+}
+
+// sg_primitive_type
+//
+// This is the common subset of 3D primitive types supported across all 3D
+// APIs. This is used in the sg_pipeline_desc.primitive_type member when
+// creating a pipeline object.
+//
+// The default primitive type is SG_PRIMITIVETYPE_TRIANGLES.
+Primitive_Type :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    POINTS,
+    LINES,
+    LINE_STRIP,
+    TRIANGLES,
+    TRIANGLE_STRIP,
+}
+
+// sg_filter
+//
+// The filtering mode when sampling a texture image. This is
+// used in the sg_sampler_desc.min_filter, sg_sampler_desc.mag_filter
+// and sg_sampler_desc.mipmap_filter members when creating a sampler object.
+//
+// For the default is SG_FILTER_NEAREST.
+Filter :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    NEAREST,
+    LINEAR,
+}
+
+// sg_wrap
+//
+// The texture coordinates wrapping mode when sampling a texture
+// image. This is used in the sg_image_desc.wrap_u, .wrap_v
+// and .wrap_w members when creating an image.
+//
+// The default wrap mode is SG_WRAP_REPEAT.
+//
+// NOTE: SG_WRAP_CLAMP_TO_BORDER is not supported on all backends
+// and platforms. To check for support, call sg_query_features()
+// and check the "clamp_to_border" boolean in the returned
+// sg_features struct.
+//
+// Platforms which don't support SG_WRAP_CLAMP_TO_BORDER will silently fall back
+// to SG_WRAP_CLAMP_TO_EDGE without a validation error.
+Wrap :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    REPEAT,
+    CLAMP_TO_EDGE,
+    CLAMP_TO_BORDER,
+    MIRRORED_REPEAT,
+}
+
+// sg_border_color
+//
+// The border color to use when sampling a texture, and the UV wrap
+// mode is SG_WRAP_CLAMP_TO_BORDER.
+//
+// The default border color is SG_BORDERCOLOR_OPAQUE_BLACK
+Border_Color :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    TRANSPARENT_BLACK,
+    OPAQUE_BLACK,
+    OPAQUE_WHITE,
+}
+
+// sg_vertex_format
+//
+// The data type of a vertex component. This is used to describe
+// the layout of vertex data when creating a pipeline object.
+Vertex_Format :: enum i32 {
+    INVALID,
+    FLOAT,
+    FLOAT2,
+    FLOAT3,
+    FLOAT4,
+    BYTE4,
+    BYTE4N,
+    UBYTE4,
+    UBYTE4N,
+    SHORT2,
+    SHORT2N,
+    USHORT2N,
+    SHORT4,
+    SHORT4N,
+    USHORT4N,
+    UINT10_N2,
+    HALF2,
+    HALF4,
+}
+
+// sg_vertex_step
+//
+// Defines whether the input pointer of a vertex input stream is advanced
+// 'per vertex' or 'per instance'. The default step-func is
+// SG_VERTEXSTEP_PER_VERTEX. SG_VERTEXSTEP_PER_INSTANCE is used with
+// instanced-rendering.
+//
+// The vertex-step is part of the vertex-layout definition
+// when creating pipeline objects.
+Vertex_Step :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    PER_VERTEX,
+    PER_INSTANCE,
+}
+
+// sg_uniform_type
+//
+// The data type of a uniform block member. This is used to
+// describe the internal layout of uniform blocks when creating
+// a shader object. This is only required for the GL backend, all
+// other backends will ignore the interior layout of uniform blocks.
+Uniform_Type :: enum i32 {
+    INVALID,
+    FLOAT,
+    FLOAT2,
+    FLOAT3,
+    FLOAT4,
+    INT,
+    INT2,
+    INT3,
+    INT4,
+    MAT4,
+}
+
+// sg_uniform_layout
+//
+// A hint for the interior memory layout of uniform blocks. This is
+// only relevant for the GL backend where the internal layout
+// of uniform blocks must be known to sokol-gfx. For all other backends the
+// internal memory layout of uniform blocks doesn't matter, sokol-gfx
+// will just pass uniform data as a single memory blob to the
+// 3D backend.
+//
+// SG_UNIFORMLAYOUT_NATIVE (default)
+//     Native layout means that a 'backend-native' memory layout
+//     is used. For the GL backend this means that uniforms
+//     are packed tightly in memory (e.g. there are no padding
+//     bytes).
+//
+// SG_UNIFORMLAYOUT_STD140
+//     The memory layout is a subset of std140. Arrays are only
+//     allowed for the FLOAT4, INT4 and MAT4. Alignment is as
+//     is as follows:
+//
+//         FLOAT, INT:         4 byte alignment
+//         FLOAT2, INT2:       8 byte alignment
+//         FLOAT3, INT3:       16 byte alignment(!)
+//         FLOAT4, INT4:       16 byte alignment
+//         MAT4:               16 byte alignment
+//         FLOAT4[], INT4[]:   16 byte alignment
+//
+//     The overall size of the uniform block must be a multiple
+//     of 16.
+//
+// For more information search for 'UNIFORM DATA LAYOUT' in the documentation block
+// at the start of the header.
+Uniform_Layout :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    // default: layout depends on currently active backend
+    NATIVE,
+    // std140: memory layout according to std140
+    STD140,
+}
+
+// sg_cull_mode
+//
+// The face-culling mode, this is used in the
+// sg_pipeline_desc.cull_mode member when creating a
+// pipeline object.
+//
+// The default cull mode is SG_CULLMODE_NONE
+Cull_Mode :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    NONE,
+    FRONT,
+    BACK,
+}
+
+// sg_face_winding
+//
+// The vertex-winding rule that determines a front-facing primitive. This
+// is used in the member sg_pipeline_desc.face_winding
+// when creating a pipeline object.
+//
+// The default winding is SG_FACEWINDING_CW (clockwise)
+Face_Winding :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    CCW,
+    CW,
+}
+
+// sg_compare_func
+//
+// The compare-function for configuring depth- and stencil-ref tests
+// in pipeline objects, and for texture samplers which perform a comparison
+// instead of regular sampling operation.
+//
+// Used in the following structs:
+//
+// sg_pipeline_desc
+//     .depth
+//         .compare
+//     .stencil
+//         .front.compare
+//         .back.compar
+//
+// sg_sampler_desc
+//     .compare
+//
+// The default compare func for depth- and stencil-tests is
+// SG_COMPAREFUNC_ALWAYS.
+//
+// The default compare func for samplers is SG_COMPAREFUNC_NEVER.
+Compare_Func :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    NEVER,
+    LESS,
+    EQUAL,
+    LESS_EQUAL,
+    GREATER,
+    NOT_EQUAL,
+    GREATER_EQUAL,
+    ALWAYS,
+}
+
+// sg_stencil_op
+//
+// The operation performed on a currently stored stencil-value when a
+// comparison test passes or fails. This is used when creating a pipeline
+// object in the following sg_pipeline_desc struct items:
+//
+// sg_pipeline_desc
+//     .stencil
+//         .front
+//             .fail_op
+//             .depth_fail_op
+//             .pass_op
+//         .back
+//             .fail_op
+//             .depth_fail_op
+//             .pass_op
+//
+// The default value is SG_STENCILOP_KEEP.
+Stencil_Op :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    KEEP,
+    ZERO,
+    REPLACE,
+    INCR_CLAMP,
+    DECR_CLAMP,
+    INVERT,
+    INCR_WRAP,
+    DECR_WRAP,
+}
+
+// sg_blend_factor
+//
+// The source and destination factors in blending operations.
+// This is used in the following members when creating a pipeline object:
+//
+// sg_pipeline_desc
+//     .colors[i]
+//         .blend
+//             .src_factor_rgb
+//             .dst_factor_rgb
+//             .src_factor_alpha
+//             .dst_factor_alpha
+//
+// The default value is SG_BLENDFACTOR_ONE for source
+// factors, and SG_BLENDFACTOR_ZERO for destination factors.
+Blend_Factor :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    ZERO,
+    ONE,
+    SRC_COLOR,
+    ONE_MINUS_SRC_COLOR,
+    SRC_ALPHA,
+    ONE_MINUS_SRC_ALPHA,
+    DST_COLOR,
+    ONE_MINUS_DST_COLOR,
+    DST_ALPHA,
+    ONE_MINUS_DST_ALPHA,
+    SRC_ALPHA_SATURATED,
+    BLEND_COLOR,
+    ONE_MINUS_BLEND_COLOR,
+    BLEND_ALPHA,
+    ONE_MINUS_BLEND_ALPHA,
+}
+
+// sg_blend_op
+//
+// Describes how the source and destination values are combined in the
+// fragment blending operation. It is used in the following struct items
+// when creating a pipeline object:
+//
+// sg_pipeline_desc
+//     .colors[i]
+//         .blend
+//             .op_rgb
+//             .op_alpha
+//
+// The default value is SG_BLENDOP_ADD.
+Blend_Op :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT,
+    ADD,
+    SUBTRACT,
+    REVERSE_SUBTRACT,
+}
+
+// sg_color_mask
+//
+// Selects the active color channels when writing a fragment color to the
+// framebuffer. This is used in the members
+// sg_pipeline_desc.colors[i].write_mask when creating a pipeline object.
+//
+// The default colormask is SG_COLORMASK_RGBA (write all colors channels)
+//
+// NOTE: since the color mask value 0 is reserved for the default value
+// (SG_COLORMASK_RGBA), use SG_COLORMASK_NONE if all color channels
+// should be disabled.
+Color_Mask :: enum i32 {
+    // value 0 reserved for default-init
+    DEFAULT = 0,
+    // special value for 'all channels disabled
+    NONE = 16,
+    R = 1,
+    G = 2,
+    RG = 3,
+    B = 4,
+    RB = 5,
+    GB = 6,
+    RGB = 7,
+    A = 8,
+    RA = 9,
+    GA = 10,
+    RGA = 11,
+    BA = 12,
+    RBA = 13,
+    GBA = 14,
+    RGBA = 15,
+}
+
+// sg_load_action
+//
+// Defines the load action that should be performed at the start of a render pass:
+//
+// SG_LOADACTION_CLEAR:        clear the render target
+// SG_LOADACTION_LOAD:         load the previous content of the render target
+// SG_LOADACTION_DONTCARE:     leave the render target in an undefined state
+//
+// This is used in the sg_pass_action structure.
+//
+// The default load action for all pass attachments is SG_LOADACTION_CLEAR,
+// with the values rgba = { 0.5f, 0.5f, 0.5f, 1.0f }, depth=1.0f and stencil=0.
+//
+// If you want to override the default behaviour, it is important to not
+// only set the clear color, but the 'action' field as well (as long as this
+// is _SG_LOADACTION_DEFAULT, the value fields will be ignored).
+Load_Action :: enum i32 {
+    DEFAULT,
+    CLEAR,
+    LOAD,
+    DONTCARE,
+}
+
+// sg_store_action
+//
+// Defines the store action that should be performed at the end of a render pass:
+//
+// SG_STOREACTION_STORE:       store the rendered content to the color attachment image
+// SG_STOREACTION_DONTCARE:    allows the GPU to discard the rendered content
+Store_Action :: enum i32 {
+    DEFAULT,
+    STORE,
+    DONTCARE,
+}
+
+// sg_pass_action
+//
+// The sg_pass_action struct defines the actions to be performed
+// at the start and end of a render pass.
+//
+// - at the start of the pass: whether the render attachments should be cleared,
+//   loaded with their previous content, or start in an undefined state
+// - for clear operations: the clear value (color, depth, or stencil values)
+// - at the end of the pass: whether the rendering result should be
+//   stored back into the render attachment or discarded
+Color_Attachment_Action :: struct {
+    // default: SG_LOADACTION_CLEAR
+    load_action : Load_Action,
+    // default: SG_STOREACTION_STORE
+    store_action : Store_Action,
+    // default: { 0.5f, 0.5f, 0.5f, 1.0f }
+    clear_value : Color,
+}
+
+Depth_Attachment_Action :: struct {
+    // default: SG_LOADACTION_CLEAR
+    load_action : Load_Action,
+    // default: SG_STOREACTION_DONTCARE
+    store_action : Store_Action,
+    // default: 1.0
+    clear_value : f32,
+}
+
+Stencil_Attachment_Action :: struct {
+    // default: SG_LOADACTION_CLEAR
+    load_action : Load_Action,
+    // default: SG_STOREACTION_DONTCARE
+    store_action : Store_Action,
+    // default: 0
+    clear_value : u8,
+}
+
+Pass_Action :: struct {
+    colors : [4]Color_Attachment_Action,
+    depth : Depth_Attachment_Action,
+    stencil : Stencil_Attachment_Action,
+}
+
+// sg_swapchain
+//
+// Used in sg_begin_pass() to provide details about an external swapchain
+// (pixel formats, sample count and backend-API specific render surface objects).
+//
+// The following information must be provided:
+//
+// - the width and height of the swapchain surfaces in number of pixels,
+// - the pixel format of the render- and optional msaa-resolve-surface
+// - the pixel format of the optional depth- or depth-stencil-surface
+// - the MSAA sample count for the render and depth-stencil surface
+//
+// If the pixel formats and MSAA sample counts are left zero-initialized,
+// their defaults are taken from the sg_environment struct provided in the
+// sg_setup() call.
+//
+// The width and height *must* be > 0.
+//
+// Additionally the following backend API specific objects must be passed in
+// as 'type erased' void pointers:
+//
+// GL:
+//     - on all GL backends, a GL framebuffer object must be provided. This
+//       can be zero for the default framebuffer.
+//
+// D3D11:
+//     - an ID3D11RenderTargetView for the rendering surface, without
+//       MSAA rendering this surface will also be displayed
+//     - an optional ID3D11DepthStencilView for the depth- or depth/stencil
+//       buffer surface
+//     - when MSAA rendering is used, another ID3D11RenderTargetView
+//       which serves as MSAA resolve target and will be displayed
+//
+// WebGPU (same as D3D11, except different types)
+//     - a WGPUTextureView for the rendering surface, without
+//       MSAA rendering this surface will also be displayed
+//     - an optional WGPUTextureView for the depth- or depth/stencil
+//       buffer surface
+//     - when MSAA rendering is used, another WGPUTextureView
+//       which serves as MSAA resolve target and will be displayed
+//
+// Metal (NOTE that the roles of provided surfaces is slightly different
+// than on D3D11 or WebGPU in case of MSAA vs non-MSAA rendering):
+//
+//     - A current CAMetalDrawable (NOT an MTLDrawable!) which will be presented.
+//       This will either be rendered to directly (if no MSAA is used), or serve
+//       as MSAA-resolve target.
+//     - an optional MTLTexture for the depth- or depth-stencil buffer
+//     - an optional multisampled MTLTexture which serves as intermediate
+//       rendering surface which will then be resolved into the
+//       CAMetalDrawable.
+//
+// NOTE that for Metal you must use an ObjC __bridge cast to
+// properly tunnel the ObjC object id through a C void*, e.g.:
+//
+//     swapchain.metal.current_drawable = (__bridge const void*) [mtkView currentDrawable];
+//
+// On all other backends you shouldn't need to mess with the reference count.
+//
+// It's a good practice to write a helper function which returns an initialized
+// sg_swapchain structs, which can then be plugged directly into
+// sg_pass.swapchain. Look at the function sglue_swapchain() in the sokol_glue.h
+// as an example.
+Metal_Swapchain :: struct {
+    // CAMetalDrawable (NOT MTLDrawable!!!)
+    current_drawable : rawptr,
+    // MTLTexture
+    depth_stencil_texture : rawptr,
+    // MTLTexture
+    msaa_color_texture : rawptr,
+}
+
+D3d11_Swapchain :: struct {
+    // ID3D11RenderTargetView
+    render_view : rawptr,
+    // ID3D11RenderTargetView
+    resolve_view : rawptr,
+    // ID3D11DepthStencilView
+    depth_stencil_view : rawptr,
+}
+
+Wgpu_Swapchain :: struct {
+    // WGPUTextureView
+    render_view : rawptr,
+    // WGPUTextureView
+    resolve_view : rawptr,
+    // WGPUTextureView
+    depth_stencil_view : rawptr,
+}
+
+Gl_Swapchain :: struct {
+    // GL framebuffer object
+    framebuffer : u32,
+}
+
+Swapchain :: struct {
+    width : c.int,
+    height : c.int,
+    sample_count : c.int,
+    color_format : Pixel_Format,
+    depth_format : Pixel_Format,
+    metal : Metal_Swapchain,
+    d3d11 : D3d11_Swapchain,
+    wgpu : Wgpu_Swapchain,
+    gl : Gl_Swapchain,
+}
+
+// sg_pass
+//
+// The sg_pass structure is passed as argument into the sg_begin_pass()
+// function.
+//
+// For an offscreen rendering pass, an sg_pass_action struct and sg_attachments
+// object must be provided, and for swapchain passes, an sg_pass_action and
+// an sg_swapchain struct. It is an error to provide both an sg_attachments
+// handle and an initialized sg_swapchain struct in the same sg_begin_pass().
+//
+// An sg_begin_pass() call for an offscreen pass would look like this (where
+// `attachments` is an sg_attachments handle):
+//
+//     sg_begin_pass(&(sg_pass){
+//         .action = { ... },
+//         .attachments = attachments,
+//     });
+//
+// ...and a swapchain render pass would look like this (using the sokol_glue.h
+// helper function sglue_swapchain() which gets the swapchain properties from
+// sokol_app.h):
+//
+//     sg_begin_pass(&(sg_pass){
+//         .action = { ... },
+//         .swapchain = sglue_swapchain(),
+//     });
+//
+// You can also omit the .action object to get default pass action behaviour
+// (clear to color=grey, depth=1 and stencil=0).
+Pass :: struct {
+    _ : u32,
+    action : Pass_Action,
+    attachments : Attachments,
+    swapchain : Swapchain,
+    label : cstring,
+    _ : u32,
+}
+
+// sg_bindings
+//
+// The sg_bindings structure defines the buffers, images and
+// samplers resource bindings for the next draw call.
+//
+// To update the resource bindings, call sg_apply_bindings() with
+// a pointer to a populated sg_bindings struct. Note that
+// sg_apply_bindings() must be called after sg_apply_pipeline()
+// and that bindings are not preserved across sg_apply_pipeline()
+// calls, even when the new pipeline uses the same 'bindings layout'.
+//
+// A resource binding struct contains:
+//
+// - 1..N vertex buffers
+// - 0..N vertex buffer offsets
+// - 0..1 index buffers
+// - 0..1 index buffer offsets
+// - 0..N images
+// - 0..N samplers
+// - 0..N storage buffers
+//
+// Where 'N' is defined in the following constants:
+//
+// - SG_MAX_VERTEXBUFFER_BINDSLOTS
+// - SG_MAX_IMAGE_BINDLOTS
+// - SG_MAX_SAMPLER_BINDSLOTS
+// - SG_MAX_STORAGEBUFFER_BINDGLOTS
+//
+// When using sokol-shdc for shader authoring, the `layout(binding=N)`
+// annotation in the shader code directly maps to the slot index for that
+// resource type in the bindings struct, for instance the following vertex-
+// and fragment-shader interface for sokol-shdc:
+//
+//     @vs vs
+//     layout(binding=0) uniform vs_params { ... };
+//     layout(binding=0) readonly buffer ssbo { ... };
+//     layout(binding=0) uniform texture2D vs_tex;
+//     layout(binding=0) uniform sampler vs_smp;
+//     ...
+//     @end
+//
+//     @fs fs
+//     layout(binding=1) uniform fs_params { ... };
+//     layout(binding=1) uniform texture2D fs_tex;
+//     layout(binding=1) uniform sampler fs_smp;
+//     ...
+//     @end
+//
+// ...would map to the following sg_bindings struct:
+//
+//     const sg_bindings bnd = {
+//         .vertex_buffers[0] = ...,
+//         .images[0] = vs_tex,
+//         .images[1] = fs_tex,
+//         .samplers[0] = vs_smp,
+//         .samplers[1] = fs_smp,
+//         .storage_buffers[0] = ssbo,
+//     };
+//
+// ...alternatively you can use code-generated slot indices:
+//
+//     const sg_bindings bnd = {
+//         .vertex_buffers[0] = ...,
+//         .images[IMG_vs_tex] = vs_tex,
+//         .images[IMG_fs_tex] = fs_tex,
+//         .samplers[SMP_vs_smp] = vs_smp,
+//         .samplers[SMP_fs_smp] = fs_smp,
+//         .storage_buffers[SBUF_ssbo] = ssbo,
+//     };
+//
+// Resource bindslots for a specific shader/pipeline may have gaps, and an
+// sg_bindings struct may have populated bind slots which are not used by a
+// specific shader. This allows to use the same sg_bindings struct across
+// different shader variants.
+//
+// When not using sokol-shdc, the bindslot indices in the sg_bindings
+// struct need to match the per-resource reflection info slot indices
+// in the sg_shader_desc struct (for details about that see the
+// sg_shader_desc struct documentation).
+//
+// The optional buffer offsets can be used to put different unrelated
+// chunks of vertex- and/or index-data into the same buffer objects.
+Bindings :: struct {
+    _ : u32,
+    vertex_buffers : [8]Buffer,
+    vertex_buffer_offsets : [8]c.int,
+    index_buffer : Buffer,
+    index_buffer_offset : c.int,
+    images : [16]Image,
+    samplers : [16]Sampler,
+    storage_buffers : [8]Buffer,
+    _ : u32,
+}
+
+// sg_buffer_desc
+//
+// Creation parameters for sg_buffer objects, used in the
+// sg_make_buffer() call.
+//
+// The default configuration is:
+//
+// .size:      0       (*must* be >0 for buffers without data)
+// .type:      SG_BUFFERTYPE_VERTEXBUFFER
+// .usage:     SG_USAGE_IMMUTABLE
+// .data.ptr   0       (*must* be valid for immutable buffers)
+// .data.size  0       (*must* be > 0 for immutable buffers)
+// .label      0       (optional string label)
+//
+// For immutable buffers which are initialized with initial data,
+// keep the .size item zero-initialized, and set the size together with the
+// pointer to the initial data in the .data item.
+//
+// For mutable buffers without initial data, keep the .data item
+// zero-initialized, and set the buffer size in the .size item instead.
+//
+// You can also set both size values, but currently both size values must
+// be identical (this may change in the future when the dynamic resource
+// management may become more flexible).
+//
+// ADVANCED TOPIC: Injecting native 3D-API buffers:
+//
+// The following struct members allow to inject your own GL, Metal
+// or D3D11 buffers into sokol_gfx:
+//
+// .gl_buffers[SG_NUM_INFLIGHT_FRAMES]
+// .mtl_buffers[SG_NUM_INFLIGHT_FRAMES]
+// .d3d11_buffer
+//
+// You must still provide all other struct items except the .data item, and
+// these must match the creation parameters of the native buffers you
+// provide. For SG_USAGE_IMMUTABLE, only provide a single native 3D-API
+// buffer, otherwise you need to provide SG_NUM_INFLIGHT_FRAMES buffers
+// (only for GL and Metal, not D3D11). Providing multiple buffers for GL and
+// Metal is necessary because sokol_gfx will rotate through them when
+// calling sg_update_buffer() to prevent lock-stalls.
+//
+// Note that it is expected that immutable injected buffer have already been
+// initialized with content, and the .content member must be 0!
+//
+// Also you need to call sg_reset_state_cache() after calling native 3D-API
+// functions, and before calling any sokol_gfx function.
+Buffer_Desc :: struct {
+    _ : u32,
+    size : c.size_t,
+    type : Buffer_Type,
+    usage : Usage,
+    data : Range,
+    label : cstring,
+    gl_buffers : [2]u32,
+    mtl_buffers : [2]rawptr,
+    d3d11_buffer : rawptr,
+    wgpu_buffer : rawptr,
+    _ : u32,
+}
+
+// sg_image_data
+//
+// Defines the content of an image through a 2D array of sg_range structs.
+// The first array dimension is the cubemap face, and the second array
+// dimension the mipmap level.
+Image_Data :: struct {
+    subimage : [6][16]Range,
+}
+
+// sg_image_desc
+//
+// Creation parameters for sg_image objects, used in the sg_make_image() call.
+//
+// The default configuration is:
+//
+// .type:              SG_IMAGETYPE_2D
+// .render_target:     false
+// .width              0 (must be set to >0)
+// .height             0 (must be set to >0)
+// .num_slices         1 (3D textures: depth; array textures: number of layers)
+// .num_mipmaps:       1
+// .usage:             SG_USAGE_IMMUTABLE
+// .pixel_format:      SG_PIXELFORMAT_RGBA8 for textures, or sg_desc.environment.defaults.color_format for render targets
+// .sample_count:      1 for textures, or sg_desc.environment.defaults.sample_count for render targets
+// .data               an sg_image_data struct to define the initial content
+// .label              0 (optional string label for trace hooks)
+//
+// Q: Why is the default sample_count for render targets identical with the
+// "default sample count" from sg_desc.environment.defaults.sample_count?
+//
+// A: So that it matches the default sample count in pipeline objects. Even
+// though it is a bit strange/confusing that offscreen render targets by default
+// get the same sample count as 'default swapchains', but it's better that
+// an offscreen render target created with default parameters matches
+// a pipeline object created with default parameters.
+//
+// NOTE:
+//
+// Images with usage SG_USAGE_IMMUTABLE must be fully initialized by
+// providing a valid .data member which points to initialization data.
+//
+// ADVANCED TOPIC: Injecting native 3D-API textures:
+//
+// The following struct members allow to inject your own GL, Metal or D3D11
+// textures into sokol_gfx:
+//
+// .gl_textures[SG_NUM_INFLIGHT_FRAMES]
+// .mtl_textures[SG_NUM_INFLIGHT_FRAMES]
+// .d3d11_texture
+// .d3d11_shader_resource_view
+// .wgpu_texture
+// .wgpu_texture_view
+//
+// For GL, you can also specify the texture target or leave it empty to use
+// the default texture target for the image type (GL_TEXTURE_2D for
+// SG_IMAGETYPE_2D etc)
+//
+// For D3D11 and WebGPU, either only provide a texture, or both a texture and
+// shader-resource-view / texture-view object. If you want to use access the
+// injected texture in a shader you *must* provide a shader-resource-view.
+//
+// The same rules apply as for injecting native buffers (see sg_buffer_desc
+// documentation for more details).
+Image_Desc :: struct {
+    _ : u32,
+    type : Image_Type,
+    render_target : bool,
+    width : c.int,
+    height : c.int,
+    num_slices : c.int,
+    num_mipmaps : c.int,
+    usage : Usage,
+    pixel_format : Pixel_Format,
+    sample_count : c.int,
+    data : Image_Data,
+    label : cstring,
+    gl_textures : [2]u32,
+    gl_texture_target : u32,
+    mtl_textures : [2]rawptr,
+    d3d11_texture : rawptr,
+    d3d11_shader_resource_view : rawptr,
+    wgpu_texture : rawptr,
+    wgpu_texture_view : rawptr,
+    _ : u32,
+}
+
+// sg_sampler_desc
+//
+// Creation parameters for sg_sampler objects, used in the sg_make_sampler() call
+//
+// .min_filter:        SG_FILTER_NEAREST
+// .mag_filter:        SG_FILTER_NEAREST
+// .mipmap_filter      SG_FILTER_NEAREST
+// .wrap_u:            SG_WRAP_REPEAT
+// .wrap_v:            SG_WRAP_REPEAT
+// .wrap_w:            SG_WRAP_REPEAT (only SG_IMAGETYPE_3D)
+// .min_lod            0.0f
+// .max_lod            FLT_MAX
+// .border_color       SG_BORDERCOLOR_OPAQUE_BLACK
+// .compare            SG_COMPAREFUNC_NEVER
+// .max_anisotropy     1 (must be 1..16)
+Sampler_Desc :: struct {
+    _ : u32,
+    min_filter : Filter,
+    mag_filter : Filter,
+    mipmap_filter : Filter,
+    wrap_u : Wrap,
+    wrap_v : Wrap,
+    wrap_w : Wrap,
+    min_lod : f32,
+    max_lod : f32,
+    border_color : Border_Color,
+    compare : Compare_Func,
+    max_anisotropy : u32,
+    label : cstring,
+    gl_sampler : u32,
+    mtl_sampler : rawptr,
+    d3d11_sampler : rawptr,
+    wgpu_sampler : rawptr,
+    _ : u32,
+}
+
+// sg_shader_desc
+//
+// Used as parameter of sg_make_shader() to create a shader object which
+// communicates shader source or bytecode and shader interface
+// reflection information to sokol-gfx.
+//
+// If you use sokol-shdc you can ignore the following information since
+// the sg_shader_desc struct will be code generated.
+//
+// Otherwise you need to provide the following information to the
+// sg_make_shader() call:
+//
+// - a vertex- and fragment-shader function:
+//     - the shader source or bytecode
+//     - an optional entry point name
+//     - for D3D11: an optional compile target when source code is provided
+//       (the defaults are "vs_4_0" and "ps_4_0")
+//
+// - vertex attributes required by some backends:
+//     - for the GL backend: optional vertex attribute names
+//       used for name lookup
+//     - for the D3D11 backend: semantic names and indices
+//
+// - reflection information for each uniform block used by the shader:
+//     - the shader stage the uniform block appears in (SG_SHADERSTAGE_*)
+//     - the size in bytes of the uniform block
+//     - backend-specific bindslots:
+//         - HLSL: the constant buffer register `register(b0..7)`
+//         - MSL: the buffer attribute `[[buffer(0..7)]]`
+//         - WGSL: the binding in `@group(0) @binding(0..15)`
+//     - GLSL only: a description of the uniform block interior
+//         - the memory layout standard (SG_UNIFORMLAYOUT_*)
+//         - for each member in the uniform block:
+//             - the member type (SG_UNIFORM_*)
+//             - if the member is an array, the array count
+//             - the member name
+//
+// - reflection information for each texture used by the shader:
+//     - the shader stage the texture appears in (SG_SHADERSTAGE_*)
+//     - the image type (SG_IMAGETYPE_*)
+//     - the image-sample type (SG_IMAGESAMPLETYPE_*)
+//     - whether the texture is multisampled
+//     - backend specific bindslots:
+//         - HLSL: the texture register `register(t0..23)`
+//         - MSL: the texture attribute `[[texture(0..15)]]`
+//         - WGSL: the binding in `@group(1) @binding(0..127)`
+//
+// - reflection information for each sampler used by the shader:
+//     - the shader stage the sampler appears in (SG_SHADERSTAGE_*)
+//     - the sampler type (SG_SAMPLERTYPE_*)
+//     - backend specific bindslots:
+//         - HLSL: the sampler register `register(s0..15)`
+//         - MSL: the sampler attribute `[[sampler(0..15)]]`
+//         - WGSL: the binding in `@group(0) @binding(0..127)`
+//
+// - reflection information for each storage buffer used by the shader:
+//     - the shader stage the storage buffer appears in (SG_SHADERSTAGE_*)
+//     - whether the storage buffer is readonly (currently this must
+//       always be true)
+//     - backend specific bindslots:
+//         - HLSL: the texture(sic) register `register(t0..23)`
+//         - MSL: the buffer attribute `[[buffer(8..15)]]`
+//         - WGSL: the binding in `@group(1) @binding(0..127)`
+//         - GL: the binding in `layout(binding=0..16)`
+//
+// - reflection information for each combined image-sampler object
+//   used by the shader:
+//     - the shader stage (SG_SHADERSTAGE_*)
+//     - the texture's array index in the sg_shader_desc.images[] array
+//     - the sampler's array index in the sg_shader_desc.samplers[] array
+//     - GLSL only: the name of the combined image-sampler object
+//
+// The number and order of items in the sg_shader_desc.attrs[]
+// array corresponds to the items in sg_pipeline_desc.layout.attrs.
+//
+//     - sg_shader_desc.attrs[N] => sg_pipeline_desc.layout.attrs[N]
+//
+// NOTE that vertex attribute indices currently cannot have gaps.
+//
+// The items index in the sg_shader_desc.uniform_blocks[] array corresponds
+// to the ub_slot arg in sg_apply_uniforms():
+//
+//     - sg_shader_desc.uniform_blocks[N] => sg_apply_uniforms(N, ...)
+//
+// The items in the shader_desc images, samplers and storage_buffers
+// arrays correspond to the same array items in the sg_bindings struct:
+//
+//     - sg_shader_desc.images[N] => sg_bindings.images[N]
+//     - sg_shader_desc.samplers[N] => sg_bindings.samplers[N]
+//     - sg_shader_desc.storage_buffers[N] => sg_bindings.storage_buffers[N]
+//
+// For all GL backends, shader source-code must be provided. For D3D11 and Metal,
+// either shader source-code or byte-code can be provided.
+//
+// NOTE that the uniform block, image, sampler and storage_buffer arrays
+// can have gaps. This allows to use the same sg_bindings struct for
+// different related shader variants.
+//
+// For D3D11, if source code is provided, the d3dcompiler_47.dll will be loaded
+// on demand. If this fails, shader creation will fail. When compiling HLSL
+// source code, you can provide an optional target string via
+// sg_shader_stage_desc.d3d11_target, the default target is "vs_4_0" for the
+// vertex shader stage and "ps_4_0" for the pixel shader stage.
+Shader_Stage :: enum i32 {
+    NONE,
+    VERTEX,
+    FRAGMENT,
+}
+
+Shader_Function :: struct {
+    source : cstring,
+    bytecode : Range,
+    entry : cstring,
+    // default: "vs_4_0" or "ps_4_0"
+    d3d11_target : cstring,
+}
+
+Shader_Vertex_Attr :: struct {
+    // [optional] GLSL attribute name
+    glsl_name : cstring,
+    // HLSL semantic name
+    hlsl_sem_name : cstring,
+    // HLSL semantic index
+    hlsl_sem_index : u8,
+}
+
+Glsl_Shader_Uniform :: struct {
+    type : Uniform_Type,
+    // 0 or 1 for scalars, >1 for arrays
+    array_count : u16,
+    // glsl name binding is required on GL 4.1 and WebGL2
+    glsl_name : cstring,
+}
+
+Shader_Uniform_Block :: struct {
+    stage : Shader_Stage,
+    size : u32,
+    // HLSL register(bn)
+    hlsl_register_b_n : u8,
+    // MSL [[buffer(n)]]
+    msl_buffer_n : u8,
+    // WGSL @group(0) @binding(n)
+    wgsl_group0_binding_n : u8,
+    layout : Uniform_Layout,
+    glsl_uniforms : [16]Glsl_Shader_Uniform,
+}
+
+Shader_Image :: struct {
+    stage : Shader_Stage,
+    image_type : Image_Type,
+    sample_type : Image_Sample_Type,
+    multisampled : bool,
+    // HLSL register(tn) bind slot
+    hlsl_register_t_n : u8,
+    // MSL [[texture(n)]] bind slot
+    msl_texture_n : u8,
+    // WGSL @group(1) @binding(n) bind slot
+    wgsl_group1_binding_n : u8,
+}
+
+Shader_Sampler :: struct {
+    stage : Shader_Stage,
+    sampler_type : Sampler_Type,
+    // HLSL register(sn) bind slot
+    hlsl_register_s_n : u8,
+    // MSL [[sampler(n)]] bind slot
+    msl_sampler_n : u8,
+    // WGSL @group(1) @binding(n) bind slot
+    wgsl_group1_binding_n : u8,
+}
+
+Shader_Storage_Buffer :: struct {
+    stage : Shader_Stage,
+    readonly : bool,
+    // HLSL register(tn) bind slot
+    hlsl_register_t_n : u8,
+    // MSL [[buffer(n)]] bind slot
+    msl_buffer_n : u8,
+    // WGSL @group(1) @binding(n) bind slot
+    wgsl_group1_binding_n : u8,
+    // GLSL layout(binding=n)
+    glsl_binding_n : u8,
+}
+
+Shader_Image_Sampler_Pair :: struct {
+    stage : Shader_Stage,
+    image_slot : u8,
+    sampler_slot : u8,
+    // glsl name binding required because of GL 4.1 and WebGL2
+    glsl_name : cstring,
+}
+
+Shader_Desc :: struct {
+    _ : u32,
+    vertex_func : Shader_Function,
+    fragment_func : Shader_Function,
+    attrs : [16]Shader_Vertex_Attr,
+    uniform_blocks : [8]Shader_Uniform_Block,
+    storage_buffers : [8]Shader_Storage_Buffer,
+    images : [16]Shader_Image,
+    samplers : [16]Shader_Sampler,
+    image_sampler_pairs : [16]Shader_Image_Sampler_Pair,
+    label : cstring,
+    _ : u32,
+}
+
+// sg_pipeline_desc
+//
+// The sg_pipeline_desc struct defines all creation parameters for an
+// sg_pipeline object, used as argument to the sg_make_pipeline() function:
+//
+// - the vertex layout for all input vertex buffers
+// - a shader object
+// - the 3D primitive type (points, lines, triangles, ...)
+// - the index type (none, 16- or 32-bit)
+// - all the fixed-function-pipeline state (depth-, stencil-, blend-state, etc...)
+//
+// If the vertex data has no gaps between vertex components, you can omit
+// the .layout.buffers[].stride and layout.attrs[].offset items (leave them
+// default-initialized to 0), sokol-gfx will then compute the offsets and
+// strides from the vertex component formats (.layout.attrs[].format).
+// Please note that ALL vertex attribute offsets must be 0 in order for the
+// automatic offset computation to kick in.
+//
+// The default configuration is as follows:
+//
+// .shader:                0 (must be initialized with a valid sg_shader id!)
+// .layout:
+//     .buffers[]:         vertex buffer layouts
+//         .stride:        0 (if no stride is given it will be computed)
+//         .step_func      SG_VERTEXSTEP_PER_VERTEX
+//         .step_rate      1
+//     .attrs[]:           vertex attribute declarations
+//         .buffer_index   0 the vertex buffer bind slot
+//         .offset         0 (offsets can be omitted if the vertex layout has no gaps)
+//         .format         SG_VERTEXFORMAT_INVALID (must be initialized!)
+// .depth:
+//     .pixel_format:      sg_desc.context.depth_format
+//     .compare:           SG_COMPAREFUNC_ALWAYS
+//     .write_enabled:     false
+//     .bias:              0.0f
+//     .bias_slope_scale:  0.0f
+//     .bias_clamp:        0.0f
+// .stencil:
+//     .enabled:           false
+//     .front/back:
+//         .compare:       SG_COMPAREFUNC_ALWAYS
+//         .fail_op:       SG_STENCILOP_KEEP
+//         .depth_fail_op: SG_STENCILOP_KEEP
+//         .pass_op:       SG_STENCILOP_KEEP
+//     .read_mask:         0
+//     .write_mask:        0
+//     .ref:               0
+// .color_count            1
+// .colors[0..color_count]
+//     .pixel_format       sg_desc.context.color_format
+//     .write_mask:        SG_COLORMASK_RGBA
+//     .blend:
+//         .enabled:           false
+//         .src_factor_rgb:    SG_BLENDFACTOR_ONE
+//         .dst_factor_rgb:    SG_BLENDFACTOR_ZERO
+//         .op_rgb:            SG_BLENDOP_ADD
+//         .src_factor_alpha:  SG_BLENDFACTOR_ONE
+//         .dst_factor_alpha:  SG_BLENDFACTOR_ZERO
+//         .op_alpha:          SG_BLENDOP_ADD
+// .primitive_type:            SG_PRIMITIVETYPE_TRIANGLES
+// .index_type:                SG_INDEXTYPE_NONE
+// .cull_mode:                 SG_CULLMODE_NONE
+// .face_winding:              SG_FACEWINDING_CW
+// .sample_count:              sg_desc.context.sample_count
+// .blend_color:               (sg_color) { 0.0f, 0.0f, 0.0f, 0.0f }
+// .alpha_to_coverage_enabled: false
+// .label  0       (optional string label for trace hooks)
+Vertex_Buffer_Layout_State :: struct {
+    stride : c.int,
+    step_func : Vertex_Step,
+    step_rate : c.int,
+}
+
+Vertex_Attr_State :: struct {
+    buffer_index : c.int,
+    offset : c.int,
+    format : Vertex_Format,
+}
+
+Vertex_Layout_State :: struct {
+    buffers : [8]Vertex_Buffer_Layout_State,
+    attrs : [16]Vertex_Attr_State,
+}
+
+Stencil_Face_State :: struct {
+    compare : Compare_Func,
+    fail_op : Stencil_Op,
+    depth_fail_op : Stencil_Op,
+    pass_op : Stencil_Op,
+}
+
+Stencil_State :: struct {
+    enabled : bool,
+    front : Stencil_Face_State,
+    back : Stencil_Face_State,
+    read_mask : u8,
+    write_mask : u8,
+    ref : u8,
+}
+
+Depth_State :: struct {
+    pixel_format : Pixel_Format,
+    compare : Compare_Func,
+    write_enabled : bool,
+    bias : f32,
+    bias_slope_scale : f32,
+    bias_clamp : f32,
+}
+
+Blend_State :: struct {
+    enabled : bool,
+    src_factor_rgb : Blend_Factor,
+    dst_factor_rgb : Blend_Factor,
+    op_rgb : Blend_Op,
+    src_factor_alpha : Blend_Factor,
+    dst_factor_alpha : Blend_Factor,
+    op_alpha : Blend_Op,
+}
+
+Color_Target_State :: struct {
+    pixel_format : Pixel_Format,
+    write_mask : Color_Mask,
+    blend : Blend_State,
+}
+
+Pipeline_Desc :: struct {
+    _ : u32,
+    shader : Shader,
+    layout : Vertex_Layout_State,
+    depth : Depth_State,
+    stencil : Stencil_State,
+    color_count : c.int,
+    colors : [4]Color_Target_State,
+    primitive_type : Primitive_Type,
+    index_type : Index_Type,
+    cull_mode : Cull_Mode,
+    face_winding : Face_Winding,
+    sample_count : c.int,
+    blend_color : Color,
+    alpha_to_coverage_enabled : bool,
+    label : cstring,
+    _ : u32,
+}
+
+// sg_attachments_desc
+//
+// Creation parameters for an sg_attachments object, used as argument to the
+// sg_make_attachments() function.
+//
+// An attachments object bundles 0..4 color attachments, 0..4 msaa-resolve
+// attachments, and none or one depth-stencil attachmente for use
+// in a render pass. At least one color attachment or one depth-stencil
+// attachment must be provided (no color attachment and a depth-stencil
+// attachment is useful for a depth-only render pass).
+//
+// Each attachment definition consists of an image object, and two additional indices
+// describing which subimage the pass will render into: one mipmap index, and if the image
+// is a cubemap, array-texture or 3D-texture, the face-index, array-layer or
+// depth-slice.
+//
+// All attachments must have the same width and height.
+//
+// All color attachments and the depth-stencil attachment must have the
+// same sample count.
+//
+// If a resolve attachment is set, an MSAA-resolve operation from the
+// associated color attachment image into the resolve attachment image will take
+// place in the sg_end_pass() function. In this case, the color attachment
+// must have a (sample_count>1), and the resolve attachment a
+// (sample_count==1). The resolve attachment also must have the same pixel
+// format as the color attachment.
+//
+// NOTE that MSAA depth-stencil attachments cannot be msaa-resolved!
+Attachment_Desc :: struct {
+    image : Image,
+    mip_level : c.int,
+    // cube texture: face; array texture: layer; 3D texture: slice
+    slice : c.int,
+}
+
+Attachments_Desc :: struct {
+    _ : u32,
+    colors : [4]Attachment_Desc,
+    resolves : [4]Attachment_Desc,
+    depth_stencil : Attachment_Desc,
+    label : cstring,
+    _ : u32,
+}
+
+// sg_buffer_info
+// sg_image_info
+// sg_sampler_info
+// sg_shader_info
+// sg_pipeline_info
+// sg_attachments_info
+//
+// These structs contain various internal resource attributes which
+// might be useful for debug-inspection. Please don't rely on the
+// actual content of those structs too much, as they are quite closely
+// tied to sokol_gfx.h internals and may change more frequently than
+// the other public API elements.
+//
+// The *_info structs are used as the return values of the following functions:
+//
+// sg_query_buffer_info()
+// sg_query_image_info()
+// sg_query_sampler_info()
+// sg_query_shader_info()
+// sg_query_pipeline_info()
+// sg_query_pass_info()
+Slot_Info :: struct {
+    // the current state of this resource slot
+    state : Resource_State,
+    // type-neutral resource if (e.g. sg_buffer.id)
+    res_id : u32,
+}
+
+Buffer_Info :: struct {
+    // resource pool slot info
+    slot : Slot_Info,
+    // frame index of last sg_update_buffer()
+    update_frame_index : u32,
+    // frame index of last sg_append_buffer()
+    append_frame_index : u32,
+    // current position in buffer for sg_append_buffer()
+    append_pos : c.int,
+    // is buffer in overflow state (due to sg_append_buffer)
+    append_overflow : bool,
+    // number of renaming-slots for dynamically updated buffers
+    num_slots : c.int,
+    // currently active write-slot for dynamically updated buffers
+    active_slot : c.int,
+}
+
+Image_Info :: struct {
+    // resource pool slot info
+    slot : Slot_Info,
+    // frame index of last sg_update_image()
+    upd_frame_index : u32,
+    // number of renaming-slots for dynamically updated images
+    num_slots : c.int,
+    // currently active write-slot for dynamically updated images
+    active_slot : c.int,
+}
+
+Sampler_Info :: struct {
+    // resource pool slot info
+    slot : Slot_Info,
+}
+
+Shader_Info :: struct {
+    // resource pool slot info
+    slot : Slot_Info,
+}
+
+Pipeline_Info :: struct {
+    // resource pool slot info
+    slot : Slot_Info,
+}
+
+Attachments_Info :: struct {
+    // resource pool slot info
+    slot : Slot_Info,
+}
+
+// sg_frame_stats
+//
+// Allows to track generic and backend-specific stats about a
+// render frame. Obtained by calling sg_query_frame_stats(). The returned
+// struct contains information about the *previous* frame.
+Frame_Stats_Gl :: struct {
+    num_bind_buffer : u32,
+    num_active_texture : u32,
+    num_bind_texture : u32,
+    num_bind_sampler : u32,
+    num_use_program : u32,
+    num_render_state : u32,
+    num_vertex_attrib_pointer : u32,
+    num_vertex_attrib_divisor : u32,
+    num_enable_vertex_attrib_array : u32,
+    num_disable_vertex_attrib_array : u32,
+    num_uniform : u32,
+}
+
+Frame_Stats_D3d11_Pass :: struct {
+    num_om_set_render_targets : u32,
+    num_clear_render_target_view : u32,
+    num_clear_depth_stencil_view : u32,
+    num_resolve_subresource : u32,
+}
+
+Frame_Stats_D3d11_Pipeline :: struct {
+    num_rs_set_state : u32,
+    num_om_set_depth_stencil_state : u32,
+    num_om_set_blend_state : u32,
+    num_ia_set_primitive_topology : u32,
+    num_ia_set_input_layout : u32,
+    num_vs_set_shader : u32,
+    num_vs_set_constant_buffers : u32,
+    num_ps_set_shader : u32,
+    num_ps_set_constant_buffers : u32,
+}
+
+Frame_Stats_D3d11_Bindings :: struct {
+    num_ia_set_vertex_buffers : u32,
+    num_ia_set_index_buffer : u32,
+    num_vs_set_shader_resources : u32,
+    num_ps_set_shader_resources : u32,
+    num_vs_set_samplers : u32,
+    num_ps_set_samplers : u32,
+}
+
+Frame_Stats_D3d11_Uniforms :: struct {
+    num_update_subresource : u32,
+}
+
+Frame_Stats_D3d11_Draw :: struct {
+    num_draw_indexed_instanced : u32,
+    num_draw_indexed : u32,
+    num_draw_instanced : u32,
+    num_draw : u32,
+}
+
+Frame_Stats_D3d11 :: struct {
+    pass : Frame_Stats_D3d11_Pass,
+    pipeline : Frame_Stats_D3d11_Pipeline,
+    bindings : Frame_Stats_D3d11_Bindings,
+    uniforms : Frame_Stats_D3d11_Uniforms,
+    draw : Frame_Stats_D3d11_Draw,
+    num_map : u32,
+    num_unmap : u32,
+}
+
+Frame_Stats_Metal_Idpool :: struct {
+    num_added : u32,
+    num_released : u32,
+    num_garbage_collected : u32,
+}
+
+Frame_Stats_Metal_Pipeline :: struct {
+    num_set_blend_color : u32,
+    num_set_cull_mode : u32,
+    num_set_front_facing_winding : u32,
+    num_set_stencil_reference_value : u32,
+    num_set_depth_bias : u32,
+    num_set_render_pipeline_state : u32,
+    num_set_depth_stencil_state : u32,
+}
+
+Frame_Stats_Metal_Bindings :: struct {
+    num_set_vertex_buffer : u32,
+    num_set_vertex_texture : u32,
+    num_set_vertex_sampler_state : u32,
+    num_set_fragment_buffer : u32,
+    num_set_fragment_texture : u32,
+    num_set_fragment_sampler_state : u32,
+}
+
+Frame_Stats_Metal_Uniforms :: struct {
+    num_set_vertex_buffer_offset : u32,
+    num_set_fragment_buffer_offset : u32,
+}
+
+Frame_Stats_Metal :: struct {
+    idpool : Frame_Stats_Metal_Idpool,
+    pipeline : Frame_Stats_Metal_Pipeline,
+    bindings : Frame_Stats_Metal_Bindings,
+    uniforms : Frame_Stats_Metal_Uniforms,
+}
+
+Frame_Stats_Wgpu_Uniforms :: struct {
+    num_set_bindgroup : u32,
+    size_write_buffer : u32,
+}
+
+Frame_Stats_Wgpu_Bindings :: struct {
+    num_set_vertex_buffer : u32,
+    num_skip_redundant_vertex_buffer : u32,
+    num_set_index_buffer : u32,
+    num_skip_redundant_index_buffer : u32,
+    num_create_bindgroup : u32,
+    num_discard_bindgroup : u32,
+    num_set_bindgroup : u32,
+    num_skip_redundant_bindgroup : u32,
+    num_bindgroup_cache_hits : u32,
+    num_bindgroup_cache_misses : u32,
+    num_bindgroup_cache_collisions : u32,
+    num_bindgroup_cache_invalidates : u32,
+    num_bindgroup_cache_hash_vs_key_mismatch : u32,
+}
+
+Frame_Stats_Wgpu :: struct {
+    uniforms : Frame_Stats_Wgpu_Uniforms,
+    bindings : Frame_Stats_Wgpu_Bindings,
+}
+
+Frame_Stats :: struct {
+    // current frame counter, starts at 0
+    frame_index : u32,
+    num_passes : u32,
+    num_apply_viewport : u32,
+    num_apply_scissor_rect : u32,
+    num_apply_pipeline : u32,
+    num_apply_bindings : u32,
+    num_apply_uniforms : u32,
+    num_draw : u32,
+    num_update_buffer : u32,
+    num_append_buffer : u32,
+    num_update_image : u32,
+    size_apply_uniforms : u32,
+    size_update_buffer : u32,
+    size_append_buffer : u32,
+    size_update_image : u32,
+    gl : Frame_Stats_Gl,
+    d3d11 : Frame_Stats_D3d11,
+    metal : Frame_Stats_Metal,
+    wgpu : Frame_Stats_Wgpu,
+}
+
+Log_Item :: enum i32 {
+    OK,
+    MALLOC_FAILED,
+    GL_TEXTURE_FORMAT_NOT_SUPPORTED,
+    GL_3D_TEXTURES_NOT_SUPPORTED,
+    GL_ARRAY_TEXTURES_NOT_SUPPORTED,
+    GL_SHADER_COMPILATION_FAILED,
+    GL_SHADER_LINKING_FAILED,
+    GL_VERTEX_ATTRIBUTE_NOT_FOUND_IN_SHADER,
+    GL_IMAGE_SAMPLER_NAME_NOT_FOUND_IN_SHADER,
+    GL_FRAMEBUFFER_STATUS_UNDEFINED,
+    GL_FRAMEBUFFER_STATUS_INCOMPLETE_ATTACHMENT,
+    GL_FRAMEBUFFER_STATUS_INCOMPLETE_MISSING_ATTACHMENT,
+    GL_FRAMEBUFFER_STATUS_UNSUPPORTED,
+    GL_FRAMEBUFFER_STATUS_INCOMPLETE_MULTISAMPLE,
+    GL_FRAMEBUFFER_STATUS_UNKNOWN,
+    D3D11_CREATE_BUFFER_FAILED,
+    D3D11_CREATE_BUFFER_SRV_FAILED,
+    D3D11_CREATE_DEPTH_TEXTURE_UNSUPPORTED_PIXEL_FORMAT,
+    D3D11_CREATE_DEPTH_TEXTURE_FAILED,
+    D3D11_CREATE_2D_TEXTURE_UNSUPPORTED_PIXEL_FORMAT,
+    D3D11_CREATE_2D_TEXTURE_FAILED,
+    D3D11_CREATE_2D_SRV_FAILED,
+    D3D11_CREATE_3D_TEXTURE_UNSUPPORTED_PIXEL_FORMAT,
+    D3D11_CREATE_3D_TEXTURE_FAILED,
+    D3D11_CREATE_3D_SRV_FAILED,
+    D3D11_CREATE_MSAA_TEXTURE_FAILED,
+    D3D11_CREATE_SAMPLER_STATE_FAILED,
+    D3D11_LOAD_D3DCOMPILER_47_DLL_FAILED,
+    D3D11_SHADER_COMPILATION_FAILED,
+    D3D11_SHADER_COMPILATION_OUTPUT,
+    D3D11_CREATE_CONSTANT_BUFFER_FAILED,
+    D3D11_CREATE_INPUT_LAYOUT_FAILED,
+    D3D11_CREATE_RASTERIZER_STATE_FAILED,
+    D3D11_CREATE_DEPTH_STENCIL_STATE_FAILED,
+    D3D11_CREATE_BLEND_STATE_FAILED,
+    D3D11_CREATE_RTV_FAILED,
+    D3D11_CREATE_DSV_FAILED,
+    D3D11_MAP_FOR_UPDATE_BUFFER_FAILED,
+    D3D11_MAP_FOR_APPEND_BUFFER_FAILED,
+    D3D11_MAP_FOR_UPDATE_IMAGE_FAILED,
+    METAL_CREATE_BUFFER_FAILED,
+    METAL_TEXTURE_FORMAT_NOT_SUPPORTED,
+    METAL_CREATE_TEXTURE_FAILED,
+    METAL_CREATE_SAMPLER_FAILED,
+    METAL_SHADER_COMPILATION_FAILED,
+    METAL_SHADER_CREATION_FAILED,
+    METAL_SHADER_COMPILATION_OUTPUT,
+    METAL_SHADER_ENTRY_NOT_FOUND,
+    METAL_CREATE_RPS_FAILED,
+    METAL_CREATE_RPS_OUTPUT,
+    METAL_CREATE_DSS_FAILED,
+    WGPU_BINDGROUPS_POOL_EXHAUSTED,
+    WGPU_BINDGROUPSCACHE_SIZE_GREATER_ONE,
+    WGPU_BINDGROUPSCACHE_SIZE_POW2,
+    WGPU_CREATEBINDGROUP_FAILED,
+    WGPU_CREATE_BUFFER_FAILED,
+    WGPU_CREATE_TEXTURE_FAILED,
+    WGPU_CREATE_TEXTURE_VIEW_FAILED,
+    WGPU_CREATE_SAMPLER_FAILED,
+    WGPU_CREATE_SHADER_MODULE_FAILED,
+    WGPU_SHADER_CREATE_BINDGROUP_LAYOUT_FAILED,
+    WGPU_CREATE_PIPELINE_LAYOUT_FAILED,
+    WGPU_CREATE_RENDER_PIPELINE_FAILED,
+    WGPU_ATTACHMENTS_CREATE_TEXTURE_VIEW_FAILED,
+    DRAW_REQUIRED_BINDINGS_OR_UNIFORMS_MISSING,
+    IDENTICAL_COMMIT_LISTENER,
+    COMMIT_LISTENER_ARRAY_FULL,
+    TRACE_HOOKS_NOT_ENABLED,
+    DEALLOC_BUFFER_INVALID_STATE,
+    DEALLOC_IMAGE_INVALID_STATE,
+    DEALLOC_SAMPLER_INVALID_STATE,
+    DEALLOC_SHADER_INVALID_STATE,
+    DEALLOC_PIPELINE_INVALID_STATE,
+    DEALLOC_ATTACHMENTS_INVALID_STATE,
+    INIT_BUFFER_INVALID_STATE,
+    INIT_IMAGE_INVALID_STATE,
+    INIT_SAMPLER_INVALID_STATE,
+    INIT_SHADER_INVALID_STATE,
+    INIT_PIPELINE_INVALID_STATE,
+    INIT_ATTACHMENTS_INVALID_STATE,
+    UNINIT_BUFFER_INVALID_STATE,
+    UNINIT_IMAGE_INVALID_STATE,
+    UNINIT_SAMPLER_INVALID_STATE,
+    UNINIT_SHADER_INVALID_STATE,
+    UNINIT_PIPELINE_INVALID_STATE,
+    UNINIT_ATTACHMENTS_INVALID_STATE,
+    FAIL_BUFFER_INVALID_STATE,
+    FAIL_IMAGE_INVALID_STATE,
+    FAIL_SAMPLER_INVALID_STATE,
+    FAIL_SHADER_INVALID_STATE,
+    FAIL_PIPELINE_INVALID_STATE,
+    FAIL_ATTACHMENTS_INVALID_STATE,
+    BUFFER_POOL_EXHAUSTED,
+    IMAGE_POOL_EXHAUSTED,
+    SAMPLER_POOL_EXHAUSTED,
+    SHADER_POOL_EXHAUSTED,
+    PIPELINE_POOL_EXHAUSTED,
+    PASS_POOL_EXHAUSTED,
+    BEGINPASS_ATTACHMENT_INVALID,
+    DRAW_WITHOUT_BINDINGS,
+    VALIDATE_BUFFERDESC_CANARY,
+    VALIDATE_BUFFERDESC_SIZE,
+    VALIDATE_BUFFERDESC_DATA,
+    VALIDATE_BUFFERDESC_DATA_SIZE,
+    VALIDATE_BUFFERDESC_NO_DATA,
+    VALIDATE_BUFFERDESC_STORAGEBUFFER_SUPPORTED,
+    VALIDATE_BUFFERDESC_STORAGEBUFFER_SIZE_MULTIPLE_4,
+    VALIDATE_IMAGEDATA_NODATA,
+    VALIDATE_IMAGEDATA_DATA_SIZE,
+    VALIDATE_IMAGEDESC_CANARY,
+    VALIDATE_IMAGEDESC_WIDTH,
+    VALIDATE_IMAGEDESC_HEIGHT,
+    VALIDATE_IMAGEDESC_RT_PIXELFORMAT,
+    VALIDATE_IMAGEDESC_NONRT_PIXELFORMAT,
+    VALIDATE_IMAGEDESC_MSAA_BUT_NO_RT,
+    VALIDATE_IMAGEDESC_NO_MSAA_RT_SUPPORT,
+    VALIDATE_IMAGEDESC_MSAA_NUM_MIPMAPS,
+    VALIDATE_IMAGEDESC_MSAA_3D_IMAGE,
+    VALIDATE_IMAGEDESC_MSAA_CUBE_IMAGE,
+    VALIDATE_IMAGEDESC_DEPTH_3D_IMAGE,
+    VALIDATE_IMAGEDESC_RT_IMMUTABLE,
+    VALIDATE_IMAGEDESC_RT_NO_DATA,
+    VALIDATE_IMAGEDESC_INJECTED_NO_DATA,
+    VALIDATE_IMAGEDESC_DYNAMIC_NO_DATA,
+    VALIDATE_IMAGEDESC_COMPRESSED_IMMUTABLE,
+    VALIDATE_SAMPLERDESC_CANARY,
+    VALIDATE_SAMPLERDESC_ANISTROPIC_REQUIRES_LINEAR_FILTERING,
+    VALIDATE_SHADERDESC_CANARY,
+    VALIDATE_SHADERDESC_SOURCE,
+    VALIDATE_SHADERDESC_BYTECODE,
+    VALIDATE_SHADERDESC_SOURCE_OR_BYTECODE,
+    VALIDATE_SHADERDESC_NO_BYTECODE_SIZE,
+    VALIDATE_SHADERDESC_NO_CONT_UB_MEMBERS,
+    VALIDATE_SHADERDESC_UB_SIZE_IS_ZERO,
+    VALIDATE_SHADERDESC_UB_METAL_BUFFER_SLOT_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_UB_METAL_BUFFER_SLOT_COLLISION,
+    VALIDATE_SHADERDESC_UB_HLSL_REGISTER_B_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_UB_HLSL_REGISTER_B_COLLISION,
+    VALIDATE_SHADERDESC_UB_WGSL_GROUP0_BINDING_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_UB_WGSL_GROUP0_BINDING_COLLISION,
+    VALIDATE_SHADERDESC_NO_UB_MEMBERS,
+    VALIDATE_SHADERDESC_UB_UNIFORM_GLSL_NAME,
+    VALIDATE_SHADERDESC_UB_SIZE_MISMATCH,
+    VALIDATE_SHADERDESC_UB_ARRAY_COUNT,
+    VALIDATE_SHADERDESC_UB_STD140_ARRAY_TYPE,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_METAL_BUFFER_SLOT_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_METAL_BUFFER_SLOT_COLLISION,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_HLSL_REGISTER_T_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_HLSL_REGISTER_T_COLLISION,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_GLSL_BINDING_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_GLSL_BINDING_COLLISION,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_WGSL_GROUP1_BINDING_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_WGSL_GROUP1_BINDING_COLLISION,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_READONLY,
+    VALIDATE_SHADERDESC_IMAGE_METAL_TEXTURE_SLOT_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_IMAGE_METAL_TEXTURE_SLOT_COLLISION,
+    VALIDATE_SHADERDESC_IMAGE_HLSL_REGISTER_T_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_IMAGE_HLSL_REGISTER_T_COLLISION,
+    VALIDATE_SHADERDESC_IMAGE_WGSL_GROUP1_BINDING_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_IMAGE_WGSL_GROUP1_BINDING_COLLISION,
+    VALIDATE_SHADERDESC_SAMPLER_METAL_SAMPLER_SLOT_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_SAMPLER_METAL_SAMPLER_SLOT_COLLISION,
+    VALIDATE_SHADERDESC_SAMPLER_HLSL_REGISTER_S_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_SAMPLER_HLSL_REGISTER_S_COLLISION,
+    VALIDATE_SHADERDESC_SAMPLER_WGSL_GROUP1_BINDING_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_SAMPLER_WGSL_GROUP1_BINDING_COLLISION,
+    VALIDATE_SHADERDESC_IMAGE_SAMPLER_PAIR_IMAGE_SLOT_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_IMAGE_SAMPLER_PAIR_SAMPLER_SLOT_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_IMAGE_SAMPLER_PAIR_IMAGE_STAGE_MISMATCH,
+    VALIDATE_SHADERDESC_IMAGE_SAMPLER_PAIR_SAMPLER_STAGE_MISMATCH,
+    VALIDATE_SHADERDESC_IMAGE_SAMPLER_PAIR_GLSL_NAME,
+    VALIDATE_SHADERDESC_NONFILTERING_SAMPLER_REQUIRED,
+    VALIDATE_SHADERDESC_COMPARISON_SAMPLER_REQUIRED,
+    VALIDATE_SHADERDESC_IMAGE_NOT_REFERENCED_BY_IMAGE_SAMPLER_PAIRS,
+    VALIDATE_SHADERDESC_SAMPLER_NOT_REFERENCED_BY_IMAGE_SAMPLER_PAIRS,
+    VALIDATE_SHADERDESC_ATTR_STRING_TOO_LONG,
+    VALIDATE_PIPELINEDESC_CANARY,
+    VALIDATE_PIPELINEDESC_SHADER,
+    VALIDATE_PIPELINEDESC_NO_CONT_ATTRS,
+    VALIDATE_PIPELINEDESC_LAYOUT_STRIDE4,
+    VALIDATE_PIPELINEDESC_ATTR_SEMANTICS,
+    VALIDATE_ATTACHMENTSDESC_CANARY,
+    VALIDATE_ATTACHMENTSDESC_NO_ATTACHMENTS,
+    VALIDATE_ATTACHMENTSDESC_NO_CONT_COLOR_ATTS,
+    VALIDATE_ATTACHMENTSDESC_IMAGE,
+    VALIDATE_ATTACHMENTSDESC_MIPLEVEL,
+    VALIDATE_ATTACHMENTSDESC_FACE,
+    VALIDATE_ATTACHMENTSDESC_LAYER,
+    VALIDATE_ATTACHMENTSDESC_SLICE,
+    VALIDATE_ATTACHMENTSDESC_IMAGE_NO_RT,
+    VALIDATE_ATTACHMENTSDESC_COLOR_INV_PIXELFORMAT,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_INV_PIXELFORMAT,
+    VALIDATE_ATTACHMENTSDESC_IMAGE_SIZES,
+    VALIDATE_ATTACHMENTSDESC_IMAGE_SAMPLE_COUNTS,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_COLOR_IMAGE_MSAA,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_IMAGE,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_SAMPLE_COUNT,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_MIPLEVEL,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_FACE,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_LAYER,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_SLICE,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_IMAGE_NO_RT,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_IMAGE_SIZES,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_IMAGE_FORMAT,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_IMAGE,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_MIPLEVEL,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_FACE,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_LAYER,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_SLICE,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_IMAGE_NO_RT,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_IMAGE_SIZES,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_IMAGE_SAMPLE_COUNT,
+    VALIDATE_BEGINPASS_CANARY,
+    VALIDATE_BEGINPASS_ATTACHMENTS_EXISTS,
+    VALIDATE_BEGINPASS_ATTACHMENTS_VALID,
+    VALIDATE_BEGINPASS_COLOR_ATTACHMENT_IMAGE,
+    VALIDATE_BEGINPASS_RESOLVE_ATTACHMENT_IMAGE,
+    VALIDATE_BEGINPASS_DEPTHSTENCIL_ATTACHMENT_IMAGE,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_WIDTH,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_WIDTH_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_HEIGHT,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_HEIGHT_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_SAMPLECOUNT,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_SAMPLECOUNT_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_COLORFORMAT,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_COLORFORMAT_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_DEPTHFORMAT_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_CURRENTDRAWABLE,
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_CURRENTDRAWABLE_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_DEPTHSTENCILTEXTURE,
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_DEPTHSTENCILTEXTURE_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_MSAACOLORTEXTURE,
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_MSAACOLORTEXTURE_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_RENDERVIEW,
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_RENDERVIEW_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_RESOLVEVIEW,
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_RESOLVEVIEW_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_DEPTHSTENCILVIEW,
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_DEPTHSTENCILVIEW_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_RENDERVIEW,
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_RENDERVIEW_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_RESOLVEVIEW,
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_RESOLVEVIEW_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_DEPTHSTENCILVIEW,
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_DEPTHSTENCILVIEW_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_GL_EXPECT_FRAMEBUFFER_NOTSET,
+    VALIDATE_APIP_PIPELINE_VALID_ID,
+    VALIDATE_APIP_PIPELINE_EXISTS,
+    VALIDATE_APIP_PIPELINE_VALID,
+    VALIDATE_APIP_SHADER_EXISTS,
+    VALIDATE_APIP_SHADER_VALID,
+    VALIDATE_APIP_CURPASS_ATTACHMENTS_EXISTS,
+    VALIDATE_APIP_CURPASS_ATTACHMENTS_VALID,
+    VALIDATE_APIP_ATT_COUNT,
+    VALIDATE_APIP_COLOR_FORMAT,
+    VALIDATE_APIP_DEPTH_FORMAT,
+    VALIDATE_APIP_SAMPLE_COUNT,
+    VALIDATE_ABND_PIPELINE,
+    VALIDATE_ABND_PIPELINE_EXISTS,
+    VALIDATE_ABND_PIPELINE_VALID,
+    VALIDATE_ABND_EXPECTED_VB,
+    VALIDATE_ABND_VB_EXISTS,
+    VALIDATE_ABND_VB_TYPE,
+    VALIDATE_ABND_VB_OVERFLOW,
+    VALIDATE_ABND_NO_IB,
+    VALIDATE_ABND_IB,
+    VALIDATE_ABND_IB_EXISTS,
+    VALIDATE_ABND_IB_TYPE,
+    VALIDATE_ABND_IB_OVERFLOW,
+    VALIDATE_ABND_EXPECTED_IMAGE_BINDING,
+    VALIDATE_ABND_IMG_EXISTS,
+    VALIDATE_ABND_IMAGE_TYPE_MISMATCH,
+    VALIDATE_ABND_EXPECTED_MULTISAMPLED_IMAGE,
+    VALIDATE_ABND_IMAGE_MSAA,
+    VALIDATE_ABND_EXPECTED_FILTERABLE_IMAGE,
+    VALIDATE_ABND_EXPECTED_DEPTH_IMAGE,
+    VALIDATE_ABND_EXPECTED_SAMPLER_BINDING,
+    VALIDATE_ABND_UNEXPECTED_SAMPLER_COMPARE_NEVER,
+    VALIDATE_ABND_EXPECTED_SAMPLER_COMPARE_NEVER,
+    VALIDATE_ABND_EXPECTED_NONFILTERING_SAMPLER,
+    VALIDATE_ABND_SMP_EXISTS,
+    VALIDATE_ABND_EXPECTED_STORAGEBUFFER_BINDING,
+    VALIDATE_ABND_STORAGEBUFFER_EXISTS,
+    VALIDATE_ABND_STORAGEBUFFER_BINDING_BUFFERTYPE,
+    VALIDATE_AUB_NO_PIPELINE,
+    VALIDATE_AUB_NO_UB_AT_SLOT,
+    VALIDATE_AUB_SIZE,
+    VALIDATE_UPDATEBUF_USAGE,
+    VALIDATE_UPDATEBUF_SIZE,
+    VALIDATE_UPDATEBUF_ONCE,
+    VALIDATE_UPDATEBUF_APPEND,
+    VALIDATE_APPENDBUF_USAGE,
+    VALIDATE_APPENDBUF_SIZE,
+    VALIDATE_APPENDBUF_UPDATE,
+    VALIDATE_UPDIMG_USAGE,
+    VALIDATE_UPDIMG_ONCE,
+    VALIDATION_FAILED,
+}
+
+// sg_desc
+//
+// The sg_desc struct contains configuration values for sokol_gfx,
+// it is used as parameter to the sg_setup() call.
+//
+// The default configuration is:
+//
+// .buffer_pool_size       128
+// .image_pool_size        128
+// .sampler_pool_size      64
+// .shader_pool_size       32
+// .pipeline_pool_size     64
+// .pass_pool_size         16
+// .uniform_buffer_size    4 MB (4*1024*1024)
+// .max_commit_listeners   1024
+// .disable_validation     false
+// .mtl_force_managed_storage_mode false
+// .wgpu_disable_bindgroups_cache  false
+// .wgpu_bindgroups_cache_size     1024
+//
+// .allocator.alloc_fn     0 (in this case, malloc() will be called)
+// .allocator.free_fn      0 (in this case, free() will be called)
+// .allocator.user_data    0
+//
+// .environment.defaults.color_format: default value depends on selected backend:
+//     all GL backends:    SG_PIXELFORMAT_RGBA8
+//     Metal and D3D11:    SG_PIXELFORMAT_BGRA8
+//     WebGPU:             *no default* (must be queried from WebGPU swapchain object)
+// .environment.defaults.depth_format: SG_PIXELFORMAT_DEPTH_STENCIL
+// .environment.defaults.sample_count: 1
+//
+// Metal specific:
+//     (NOTE: All Objective-C object references are transferred through
+//     a bridged cast (__bridge const void*) to sokol_gfx, which will use an
+//     unretained bridged cast (__bridge id<xxx>) to retrieve the Objective-C
+//     references back. Since the bridge cast is unretained, the caller
+//     must hold a strong reference to the Objective-C object until sg_setup()
+//     returns.
+//
+//     .mtl_force_managed_storage_mode
+//         when enabled, Metal buffers and texture resources are created in managed storage
+//         mode, otherwise sokol-gfx will decide whether to create buffers and
+//         textures in managed or shared storage mode (this is mainly a debugging option)
+//     .mtl_use_command_buffer_with_retained_references
+//         when true, the sokol-gfx Metal backend will use Metal command buffers which
+//         bump the reference count of resource objects as long as they are inflight,
+//         this is slower than the default command-buffer-with-unretained-references
+//         method, this may be a workaround when confronted with lifetime validation
+//         errors from the Metal validation layer until a proper fix has been implemented
+//     .environment.metal.device
+//         a pointer to the MTLDevice object
+//
+// D3D11 specific:
+//     .environment.d3d11.device
+//         a pointer to the ID3D11Device object, this must have been created
+//         before sg_setup() is called
+//     .environment.d3d11.device_context
+//         a pointer to the ID3D11DeviceContext object
+//     .d3d11_shader_debugging
+//         set this to true to compile shaders which are provided as HLSL source
+//         code with debug information and without optimization, this allows
+//         shader debugging in tools like RenderDoc, to output source code
+//         instead of byte code from sokol-shdc, omit the `--binary` cmdline
+//         option
+//
+// WebGPU specific:
+//     .wgpu_disable_bindgroups_cache
+//         When this is true, the WebGPU backend will create and immediately
+//         release a BindGroup object in the sg_apply_bindings() call, only
+//         use this for debugging purposes.
+//     .wgpu_bindgroups_cache_size
+//         The size of the bindgroups cache for re-using BindGroup objects
+//         between sg_apply_bindings() calls. The smaller the cache size,
+//         the more likely are cache slot collisions which will cause
+//         a BindGroups object to be destroyed and a new one created.
+//         Use the information returned by sg_query_stats() to check
+//         if this is a frequent occurrence, and increase the cache size as
+//         needed (the default is 1024).
+//         NOTE: wgpu_bindgroups_cache_size must be a power-of-2 number!
+//     .environment.wgpu.device
+//         a WGPUDevice handle
+//
+// When using sokol_gfx.h and sokol_app.h together, consider using the
+// helper function sglue_environment() in the sokol_glue.h header to
+// initialize the sg_desc.environment nested struct. sglue_environment() returns
+// a completely initialized sg_environment struct with information
+// provided by sokol_app.h.
+Environment_Defaults :: struct {
+    color_format : Pixel_Format,
+    depth_format : Pixel_Format,
+    sample_count : c.int,
+}
+
+Metal_Environment :: struct {
+    device : rawptr,
+}
+
+D3d11_Environment :: struct {
+    device : rawptr,
+    device_context : rawptr,
+}
+
+Wgpu_Environment :: struct {
+    device : rawptr,
+}
+
+Environment :: struct {
+    defaults : Environment_Defaults,
+    metal : Metal_Environment,
+    d3d11 : D3d11_Environment,
+    wgpu : Wgpu_Environment,
+}
+
+// sg_commit_listener
+//
+// Used with function sg_add_commit_listener() to add a callback
+// which will be called in sg_commit(). This is useful for libraries
+// building on top of sokol-gfx to be notified about when a frame
+// ends (instead of having to guess, or add a manual 'new-frame'
+// function.
+Commit_Listener :: struct {
+    func : proc "c" (a0: rawptr),
+    user_data : rawptr,
+}
+
+// sg_allocator
+//
+// Used in sg_desc to provide custom memory-alloc and -free functions
+// to sokol_gfx.h. If memory management should be overridden, both the
+// alloc_fn and free_fn function must be provided (e.g. it's not valid to
+// override one function but not the other).
+Allocator :: struct {
+    alloc_fn : proc "c" (a0: c.size_t, a1: rawptr) -> rawptr,
+    free_fn : proc "c" (a0: rawptr, a1: rawptr),
+    user_data : rawptr,
+}
+
+// sg_logger
+//
+// Used in sg_desc to provide a logging function. Please be aware
+// that without logging function, sokol-gfx will be completely
+// silent, e.g. it will not report errors, warnings and
+// validation layer messages. For maximum error verbosity,
+// compile in debug mode (e.g. NDEBUG *not* defined) and provide a
+// compatible logger function in the sg_setup() call
+// (for instance the standard logging function from sokol_log.h).
+Logger :: struct {
+    func : proc "c" (a0: cstring, a1: u32, a2: u32, a3: cstring, a4: u32, a5: cstring, a6: rawptr),
+    user_data : rawptr,
+}
+
+Desc :: struct {
+    _ : u32,
+    buffer_pool_size : c.int,
+    image_pool_size : c.int,
+    sampler_pool_size : c.int,
+    shader_pool_size : c.int,
+    pipeline_pool_size : c.int,
+    attachments_pool_size : c.int,
+    uniform_buffer_size : c.int,
+    max_commit_listeners : c.int,
+    // disable validation layer even in debug mode, useful for tests
+    disable_validation : bool,
+    // if true, HLSL shaders are compiled with D3DCOMPILE_DEBUG | D3DCOMPILE_SKIP_OPTIMIZATION
+    d3d11_shader_debugging : bool,
+    // for debugging: use Metal managed storage mode for resources even with UMA
+    mtl_force_managed_storage_mode : bool,
+    // Metal: use a managed MTLCommandBuffer which ref-counts used resources
+    mtl_use_command_buffer_with_retained_references : bool,
+    // set to true to disable the WebGPU backend BindGroup cache
+    wgpu_disable_bindgroups_cache : bool,
+    // number of slots in the WebGPU bindgroup cache (must be 2^N)
+    wgpu_bindgroups_cache_size : c.int,
+    allocator : Allocator,
+    // optional log function override
+    logger : Logger,
+    environment : Environment,
+    _ : u32,
+}
+
+D3d11_Buffer_Info :: struct {
+    // ID3D11Buffer*
+    buf : rawptr,
+}
+
+D3d11_Image_Info :: struct {
+    // ID3D11Texture2D*
+    tex2d : rawptr,
+    // ID3D11Texture3D*
+    tex3d : rawptr,
+    // ID3D11Resource* (either tex2d or tex3d)
+    res : rawptr,
+    // ID3D11ShaderResourceView*
+    srv : rawptr,
+}
+
+D3d11_Sampler_Info :: struct {
+    // ID3D11SamplerState*
+    smp : rawptr,
+}
+
+D3d11_Shader_Info :: struct {
+    // ID3D11Buffer* (constant buffers by bind slot)
+    cbufs : [8]rawptr,
+    // ID3D11VertexShader*
+    vs : rawptr,
+    // ID3D11PixelShader*
+    fs : rawptr,
+}
+
+D3d11_Pipeline_Info :: struct {
+    // ID3D11InputLayout*
+    il : rawptr,
+    // ID3D11RasterizerState*
+    rs : rawptr,
+    // ID3D11DepthStencilState*
+    dss : rawptr,
+    // ID3D11BlendState*
+    bs : rawptr,
+}
+
+D3d11_Attachments_Info :: struct {
+    // ID3D11RenderTargetView
+    color_rtv : [4]rawptr,
+    // ID3D11RenderTargetView
+    resolve_rtv : [4]rawptr,
+    // ID3D11DepthStencilView
+    dsv : rawptr,
+}
+
+Mtl_Buffer_Info :: struct {
+    // id<MTLBuffer>
+    buf : [2]rawptr,
+    active_slot : c.int,
+}
+
+Mtl_Image_Info :: struct {
+    // id<MTLTexture>
+    tex : [2]rawptr,
+    active_slot : c.int,
+}
+
+Mtl_Sampler_Info :: struct {
+    // id<MTLSamplerState>
+    smp : rawptr,
+}
+
+Mtl_Shader_Info :: struct {
+    // id<MTLLibrary>
+    vertex_lib : rawptr,
+    // id<MTLLibrary>
+    fragment_lib : rawptr,
+    // id<MTLFunction>
+    vertex_func : rawptr,
+    // id<MTLFunction>
+    fragment_func : rawptr,
+}
+
+Mtl_Pipeline_Info :: struct {
+    // id<MTLRenderPipelineState>
+    rps : rawptr,
+    // id<MTLDepthStencilState>
+    dss : rawptr,
+}
+
+Wgpu_Buffer_Info :: struct {
+    // WGPUBuffer
+    buf : rawptr,
+}
+
+Wgpu_Image_Info :: struct {
+    // WGPUTexture
+    tex : rawptr,
+    // WGPUTextureView
+    view : rawptr,
+}
+
+Wgpu_Sampler_Info :: struct {
+    // WGPUSampler
+    smp : rawptr,
+}
+
+Wgpu_Shader_Info :: struct {
+    // WGPUShaderModule
+    vs_mod : rawptr,
+    // WGPUShaderModule
+    fs_mod : rawptr,
+    // WGPUBindGroupLayout;
+    bgl : rawptr,
+}
+
+Wgpu_Pipeline_Info :: struct {
+    // WGPURenderPipeline
+    pip : rawptr,
+}
+
+Wgpu_Attachments_Info :: struct {
+    // WGPUTextureView
+    color_view : [4]rawptr,
+    // WGPUTextureView
+    resolve_view : [4]rawptr,
+    // WGPUTextureView
+    ds_view : rawptr,
+}
+
+Gl_Buffer_Info :: struct {
+    buf : [2]u32,
+    active_slot : c.int,
+}
+
+Gl_Image_Info :: struct {
+    tex : [2]u32,
+    tex_target : u32,
+    msaa_render_buffer : u32,
+    active_slot : c.int,
+}
+
+Gl_Sampler_Info :: struct {
+    smp : u32,
+}
+
+Gl_Shader_Info :: struct {
+    prog : u32,
+}
+
+Gl_Attachments_Info :: struct {
+    framebuffer : u32,
+    msaa_resolve_framebuffer : [4]u32,
+}
+
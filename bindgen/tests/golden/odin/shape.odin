@@ -0,0 +1,261 @@
+// machine generated, do not edit
+
+package sokol_shape
+import sg "../gfx"
+
+// helper functions to get a Range pointing into a slice (e.g. `as_range(vertices[:])`)
+// or to a single value (e.g. `as_range(&uniforms)`), without copying
+slice_as_range :: proc "contextless" (data: []$T) -> Range {
+    return { ptr = raw_data(data), size = c.size_t(len(data) * size_of(T)) }
+}
+value_as_range :: proc "contextless" (value: ^$T) -> Range {
+    return { ptr = value, size = size_of(T) }
+}
+as_range :: proc{slice_as_range, value_as_range}
+
+import "core:c"
+
+SOKOL_DEBUG :: #config(SOKOL_DEBUG, ODIN_DEBUG)
+
+DEBUG :: #config(SOKOL_SHAPE_DEBUG, SOKOL_DEBUG)
+USE_GL :: #config(SOKOL_USE_GL, false)
+USE_DLL :: #config(SOKOL_DLL, false)
+
+when ODIN_OS == .Windows {
+    when USE_DLL {
+        when USE_GL {
+            when DEBUG { foreign import sokol_shape_clib { "../sokol_dll_windows_x64_gl_debug.lib" } }
+            else       { foreign import sokol_shape_clib { "../sokol_dll_windows_x64_gl_release.lib" } }
+        } else {
+            when DEBUG { foreign import sokol_shape_clib { "../sokol_dll_windows_x64_d3d11_debug.lib" } }
+            else       { foreign import sokol_shape_clib { "../sokol_dll_windows_x64_d3d11_release.lib" } }
+        }
+    } else {
+        when USE_GL {
+            when DEBUG { foreign import sokol_shape_clib { "sokol_shape_windows_x64_gl_debug.lib" } }
+            else       { foreign import sokol_shape_clib { "sokol_shape_windows_x64_gl_release.lib" } }
+        } else {
+            when DEBUG { foreign import sokol_shape_clib { "sokol_shape_windows_x64_d3d11_debug.lib" } }
+            else       { foreign import sokol_shape_clib { "sokol_shape_windows_x64_d3d11_release.lib" } }
+        }
+    }
+} else when ODIN_OS == .Darwin {
+    when USE_DLL {
+             when  USE_GL && ODIN_ARCH == .arm64 &&  DEBUG { foreign import sokol_shape_clib { "../dylib/sokol_dylib_macos_arm64_gl_debug.dylib" } }
+        else when  USE_GL && ODIN_ARCH == .arm64 && !DEBUG { foreign import sokol_shape_clib { "../dylib/sokol_dylib_macos_arm64_gl_release.dylib" } }
+        else when  USE_GL && ODIN_ARCH == .amd64 &&  DEBUG { foreign import sokol_shape_clib { "../dylib/sokol_dylib_macos_x64_gl_debug.dylib" } }
+        else when  USE_GL && ODIN_ARCH == .amd64 && !DEBUG { foreign import sokol_shape_clib { "../dylib/sokol_dylib_macos_x64_gl_release.dylib" } }
+        else when !USE_GL && ODIN_ARCH == .arm64 &&  DEBUG { foreign import sokol_shape_clib { "../dylib/sokol_dylib_macos_arm64_metal_debug.dylib" } }
+        else when !USE_GL && ODIN_ARCH == .arm64 && !DEBUG { foreign import sokol_shape_clib { "../dylib/sokol_dylib_macos_arm64_metal_release.dylib" } }
+        else when !USE_GL && ODIN_ARCH == .amd64 &&  DEBUG { foreign import sokol_shape_clib { "../dylib/sokol_dylib_macos_x64_metal_debug.dylib" } }
+        else when !USE_GL && ODIN_ARCH == .amd64 && !DEBUG { foreign import sokol_shape_clib { "../dylib/sokol_dylib_macos_x64_metal_release.dylib" } }
+    } else {
+        when USE_GL {
+            when ODIN_ARCH == .arm64 {
+                when DEBUG { foreign import sokol_shape_clib { "sokol_shape_macos_arm64_gl_debug.a" } }
+                else       { foreign import sokol_shape_clib { "sokol_shape_macos_arm64_gl_release.a" } }
+            } else {
+                when DEBUG { foreign import sokol_shape_clib { "sokol_shape_macos_x64_gl_debug.a" } }
+                else       { foreign import sokol_shape_clib { "sokol_shape_macos_x64_gl_release.a" } }
+            }
+        } else {
+            when ODIN_ARCH == .arm64 {
+                when DEBUG { foreign import sokol_shape_clib { "sokol_shape_macos_arm64_metal_debug.a" } }
+                else       { foreign import sokol_shape_clib { "sokol_shape_macos_arm64_metal_release.a" } }
+            } else {
+                when DEBUG { foreign import sokol_shape_clib { "sokol_shape_macos_x64_metal_debug.a" } }
+                else       { foreign import sokol_shape_clib { "sokol_shape_macos_x64_metal_release.a" } }
+            }
+        }
+    }
+} else when ODIN_OS == .Linux {
+    when DEBUG { foreign import sokol_shape_clib { "sokol_shape_linux_x64_gl_debug.a" } }
+    else       { foreign import sokol_shape_clib { "sokol_shape_linux_x64_gl_release.a" } }
+} else {
+    #panic("This OS is currently not supported")
+}
+
+@(default_calling_convention="c", link_prefix="sshape_")
+foreign sokol_shape_clib {
+    build_plane :: proc(#by_ptr buf: Buffer, #by_ptr params: Plane) -> Buffer ---
+    build_box :: proc(#by_ptr buf: Buffer, #by_ptr params: Box) -> Buffer ---
+    build_sphere :: proc(#by_ptr buf: Buffer, #by_ptr params: Sphere) -> Buffer ---
+    build_cylinder :: proc(#by_ptr buf: Buffer, #by_ptr params: Cylinder) -> Buffer ---
+    build_torus :: proc(#by_ptr buf: Buffer, #by_ptr params: Torus) -> Buffer ---
+    plane_sizes :: proc(tiles: u32) -> Sizes ---
+    box_sizes :: proc(tiles: u32) -> Sizes ---
+    sphere_sizes :: proc(slices: u32, stacks: u32) -> Sizes ---
+    cylinder_sizes :: proc(slices: u32, stacks: u32) -> Sizes ---
+    torus_sizes :: proc(sides: u32, rings: u32) -> Sizes ---
+    element_range :: proc(#by_ptr buf: Buffer) -> Element_Range ---
+    vertex_buffer_desc :: proc(#by_ptr buf: Buffer) -> sg.Buffer_Desc ---
+    index_buffer_desc :: proc(#by_ptr buf: Buffer) -> sg.Buffer_Desc ---
+    vertex_buffer_layout_state :: proc() -> sg.Vertex_Buffer_Layout_State ---
+    position_vertex_attr_state :: proc() -> sg.Vertex_Attr_State ---
+    normal_vertex_attr_state :: proc() -> sg.Vertex_Attr_State ---
+    texcoord_vertex_attr_state :: proc() -> sg.Vertex_Attr_State ---
+    color_vertex_attr_state :: proc() -> sg.Vertex_Attr_State ---
+    color_4f :: proc(r: f32, g: f32, b: f32, a: f32) -> u32 ---
+    color_3f :: proc(r: f32, g: f32, b: f32) -> u32 ---
+    color_4b :: proc(r: u8, g: u8, b: u8, a: u8) -> u32 ---
+    color_3b :: proc(r: u8, g: u8, b: u8) -> u32 ---
+    mat4 :: proc(m: ^f32) -> Mat4 ---
+    mat4_transpose :: proc(m: ^f32) -> Mat4 ---
+}
+
+// sshape_range is a pointer-size-pair struct used to pass memory
+// blobs into sokol-shape. When initialized from a value type
+// (array or struct), use the SSHAPE_RANGE() macro to build
+// an sshape_range struct.
+Range :: struct {
+    ptr : rawptr,
+    size : c.size_t,
+}
+
+// a 4x4 matrix wrapper struct
+Mat4 :: struct {
+    m : [4][4]f32,
+}
+
+// vertex layout of the generated geometry
+Vertex :: struct {
+    x : f32,
+    y : f32,
+    z : f32,
+    // packed normal as BYTE4N
+    normal : u32,
+    // packed uv coords as USHORT2N
+    u : u16,
+    // packed uv coords as USHORT2N
+    v : u16,
+    // packed color as UBYTE4N (r,g,b,a);
+    color : u32,
+}
+
+// a range of draw-elements (sg_draw(int base_element, int num_element, ...))
+Element_Range :: struct {
+    base_element : c.int,
+    num_elements : c.int,
+}
+
+// number of elements and byte size of build actions
+Sizes_Item :: struct {
+    // number of elements
+    num : u32,
+    // the same as size in bytes
+    size : u32,
+}
+
+Sizes :: struct {
+    vertices : Sizes_Item,
+    indices : Sizes_Item,
+}
+
+// in/out struct to keep track of mesh-build state
+Buffer_Item :: struct {
+    // pointer/size pair of output buffer
+    buffer : Range,
+    // size in bytes of valid data in buffer
+    data_size : c.size_t,
+    // data offset of the most recent shape
+    shape_offset : c.size_t,
+}
+
+Buffer :: struct {
+    valid : bool,
+    vertices : Buffer_Item,
+    indices : Buffer_Item,
+}
+
+// creation parameters for the different shape types
+Plane :: struct {
+    // default: 1.0
+    width : f32,
+    // default: 1.0
+    depth : f32,
+    // default: 1
+    tiles : u16,
+    // default: white
+    color : u32,
+    // default: false
+    random_colors : bool,
+    // if true merge with previous shape (default: false)
+    merge : bool,
+    // default: identity matrix
+    transform : Mat4,
+}
+
+Box :: struct {
+    // default: 1.0
+    width : f32,
+    // default: 1.0
+    height : f32,
+    // default: 1.0
+    depth : f32,
+    // default: 1
+    tiles : u16,
+    // default: white
+    color : u32,
+    // default: false
+    random_colors : bool,
+    // if true merge with previous shape (default: false)
+    merge : bool,
+    // default: identity matrix
+    transform : Mat4,
+}
+
+Sphere :: struct {
+    // default: 0.5
+    radius : f32,
+    // default: 5
+    slices : u16,
+    // default: 4
+    stacks : u16,
+    // default: white
+    color : u32,
+    // default: false
+    random_colors : bool,
+    // if true merge with previous shape (default: false)
+    merge : bool,
+    // default: identity matrix
+    transform : Mat4,
+}
+
+Cylinder :: struct {
+    // default: 0.5
+    radius : f32,
+    // default: 1.0
+    height : f32,
+    // default: 5
+    slices : u16,
+    // default: 1
+    stacks : u16,
+    // default: white
+    color : u32,
+    // default: false
+    random_colors : bool,
+    // if true merge with previous shape (default: false)
+    merge : bool,
+    // default: identity matrix
+    transform : Mat4,
+}
+
+Torus :: struct {
+    // default: 0.5f
+    radius : f32,
+    // default: 0.2f
+    ring_radius : f32,
+    // default: 5
+    sides : u16,
+    // default: 5
+    rings : u16,
+    // default: white
+    color : u32,
+    // default: false
+    random_colors : bool,
+    // if true merge with previous shape (default: false)
+    merge : bool,
+    // default: identity matrix
+    transform : Mat4,
+}
+
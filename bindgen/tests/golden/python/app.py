@@ -0,0 +1,755 @@
+# machine generated, do not edit
+
+import ctypes, enum
+from . import clib
+
+_lib = clib.load()
+
+# argtypes converter for 'const char *' args, accepts str or bytes
+class _CStrParam:
+    @classmethod
+    def from_param(cls, obj):
+        if isinstance(obj, str):
+            obj = obj.encode("utf-8")
+        return ctypes.c_char_p.from_param(obj)
+
+# errcheck function to convert a C string result to a Python string
+def _c_str_to_python(result, func, args):
+    return result.decode("utf-8") if result is not None else ""
+
+# errcheck function factory to convert a C enum result to an IntEnum
+def _enum_result(enum_type):
+    def errcheck(result, func, args):
+        return enum_type(result)
+    return errcheck
+
+# CPython's Py_buffer struct, used for zero-copy access to buffer-protocol objects
+class _PyBuffer(ctypes.Structure):
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.c_void_p),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.c_void_p),
+        ("strides", ctypes.c_void_p),
+        ("suboffsets", ctypes.c_void_p),
+        ("internal", ctypes.c_void_p),
+    ]
+
+_PyObject_GetBuffer = ctypes.pythonapi["PyObject_GetBuffer"]
+_PyObject_GetBuffer.argtypes = [ctypes.py_object, ctypes.POINTER(_PyBuffer), ctypes.c_int]
+_PyObject_GetBuffer.restype = ctypes.c_int
+_PyBuffer_Release = ctypes.pythonapi["PyBuffer_Release"]
+_PyBuffer_Release.argtypes = [ctypes.POINTER(_PyBuffer)]
+_PyBuffer_Release.restype = None
+
+# owns a buffer export of an object, and releases it when garbage collected
+class _BufferExport:
+    def __init__(self, obj):
+        self.view = _PyBuffer()
+        _PyObject_GetBuffer(obj, ctypes.byref(self.view), 0)
+
+    def __del__(self):
+        # the module globals may already be gone at interpreter shutdown
+        if _PyBuffer_Release is not None and self.view.obj:
+            _PyBuffer_Release(ctypes.byref(self.view))
+
+MAX_TOUCHPOINTS = 8
+MAX_MOUSEBUTTONS = 3
+MAX_KEYCODES = 512
+MAX_ICONIMAGES = 8
+
+class EventType(enum.IntEnum):
+    INVALID = 0
+    KEY_DOWN = 1
+    KEY_UP = 2
+    CHAR = 3
+    MOUSE_DOWN = 4
+    MOUSE_UP = 5
+    MOUSE_SCROLL = 6
+    MOUSE_MOVE = 7
+    MOUSE_ENTER = 8
+    MOUSE_LEAVE = 9
+    TOUCHES_BEGAN = 10
+    TOUCHES_MOVED = 11
+    TOUCHES_ENDED = 12
+    TOUCHES_CANCELLED = 13
+    RESIZED = 14
+    ICONIFIED = 15
+    RESTORED = 16
+    FOCUSED = 17
+    UNFOCUSED = 18
+    SUSPENDED = 19
+    RESUMED = 20
+    QUIT_REQUESTED = 21
+    CLIPBOARD_PASTED = 22
+    FILES_DROPPED = 23
+    NUM = 24
+
+class Keycode(enum.IntEnum):
+    INVALID = 0
+    SPACE = 32
+    APOSTROPHE = 39
+    COMMA = 44
+    MINUS = 45
+    PERIOD = 46
+    SLASH = 47
+    _0 = 48
+    _1 = 49
+    _2 = 50
+    _3 = 51
+    _4 = 52
+    _5 = 53
+    _6 = 54
+    _7 = 55
+    _8 = 56
+    _9 = 57
+    SEMICOLON = 59
+    EQUAL = 61
+    A = 65
+    B = 66
+    C = 67
+    D = 68
+    E = 69
+    F = 70
+    G = 71
+    H = 72
+    I = 73
+    J = 74
+    K = 75
+    L = 76
+    M = 77
+    N = 78
+    O = 79
+    P = 80
+    Q = 81
+    R = 82
+    S = 83
+    T = 84
+    U = 85
+    V = 86
+    W = 87
+    X = 88
+    Y = 89
+    Z = 90
+    LEFT_BRACKET = 91
+    BACKSLASH = 92
+    RIGHT_BRACKET = 93
+    GRAVE_ACCENT = 96
+    WORLD_1 = 161
+    WORLD_2 = 162
+    ESCAPE = 256
+    ENTER = 257
+    TAB = 258
+    BACKSPACE = 259
+    INSERT = 260
+    DELETE = 261
+    RIGHT = 262
+    LEFT = 263
+    DOWN = 264
+    UP = 265
+    PAGE_UP = 266
+    PAGE_DOWN = 267
+    HOME = 268
+    END = 269
+    CAPS_LOCK = 280
+    SCROLL_LOCK = 281
+    NUM_LOCK = 282
+    PRINT_SCREEN = 283
+    PAUSE = 284
+    F1 = 290
+    F2 = 291
+    F3 = 292
+    F4 = 293
+    F5 = 294
+    F6 = 295
+    F7 = 296
+    F8 = 297
+    F9 = 298
+    F10 = 299
+    F11 = 300
+    F12 = 301
+    F13 = 302
+    F14 = 303
+    F15 = 304
+    F16 = 305
+    F17 = 306
+    F18 = 307
+    F19 = 308
+    F20 = 309
+    F21 = 310
+    F22 = 311
+    F23 = 312
+    F24 = 313
+    F25 = 314
+    KP_0 = 320
+    KP_1 = 321
+    KP_2 = 322
+    KP_3 = 323
+    KP_4 = 324
+    KP_5 = 325
+    KP_6 = 326
+    KP_7 = 327
+    KP_8 = 328
+    KP_9 = 329
+    KP_DECIMAL = 330
+    KP_DIVIDE = 331
+    KP_MULTIPLY = 332
+    KP_SUBTRACT = 333
+    KP_ADD = 334
+    KP_ENTER = 335
+    KP_EQUAL = 336
+    LEFT_SHIFT = 340
+    LEFT_CONTROL = 341
+    LEFT_ALT = 342
+    LEFT_SUPER = 343
+    RIGHT_SHIFT = 344
+    RIGHT_CONTROL = 345
+    RIGHT_ALT = 346
+    RIGHT_SUPER = 347
+    MENU = 348
+
+class AndroidTooltype(enum.IntEnum):
+    UNKNOWN = 0
+    FINGER = 1
+    STYLUS = 2
+    MOUSE = 3
+
+class Touchpoint(ctypes.Structure):
+    _fields_ = [
+        ("identifier", ctypes.c_size_t),
+        ("pos_x", ctypes.c_float),
+        ("pos_y", ctypes.c_float),
+        ("android_tooltype", ctypes.c_int),
+        ("changed", ctypes.c_bool),
+    ]
+
+class Mousebutton(enum.IntEnum):
+    LEFT = 0
+    RIGHT = 1
+    MIDDLE = 2
+    INVALID = 256
+
+MODIFIER_SHIFT = 1
+MODIFIER_CTRL = 2
+MODIFIER_ALT = 4
+MODIFIER_SUPER = 8
+MODIFIER_LMB = 256
+MODIFIER_RMB = 512
+MODIFIER_MMB = 1024
+
+class Event(ctypes.Structure):
+    _fields_ = [
+        ("frame_count", ctypes.c_uint64),
+        ("type", ctypes.c_int),
+        ("key_code", ctypes.c_int),
+        ("char_code", ctypes.c_uint32),
+        ("key_repeat", ctypes.c_bool),
+        ("modifiers", ctypes.c_uint32),
+        ("mouse_button", ctypes.c_int),
+        ("mouse_x", ctypes.c_float),
+        ("mouse_y", ctypes.c_float),
+        ("mouse_dx", ctypes.c_float),
+        ("mouse_dy", ctypes.c_float),
+        ("scroll_x", ctypes.c_float),
+        ("scroll_y", ctypes.c_float),
+        ("num_touches", ctypes.c_int),
+        ("touches", (Touchpoint * 8)),
+        ("window_width", ctypes.c_int),
+        ("window_height", ctypes.c_int),
+        ("framebuffer_width", ctypes.c_int),
+        ("framebuffer_height", ctypes.c_int),
+    ]
+
+class Range(ctypes.Structure):
+    _fields_ = [
+        ("ptr", ctypes.c_void_p),
+        ("size", ctypes.c_size_t),
+    ]
+
+# helper function to create a Range over any object supporting the buffer
+# protocol (bytes, bytearray, memoryview, array.array, NumPy arrays, ctypes
+# objects...) without copying. The Range holds the buffer export of the
+# object until it is garbage collected, so that resizable objects like a
+# bytearray can't be resized or reallocated while the Range points to them
+def as_range(data) -> Range:
+    export = _BufferExport(data)
+    # a void pointer which references the buffer export through ctypes' keep-alive
+    # mechanism, this is also carried over when the Range is copied into a struct
+    ptr = ctypes.cast((ctypes.py_object * 1)(export), ctypes.c_void_p)
+    ptr.value = export.view.buf
+    rng = Range()
+    rng.ptr = ptr
+    rng.size = export.view.len
+    return rng
+
+# argtypes converter for 'const sapp_range *' args, accepts a Range or any
+# object supporting the buffer protocol
+class RangeParam:
+    @classmethod
+    def from_param(cls, obj):
+        if not isinstance(obj, Range):
+            obj = as_range(obj)
+        return ctypes.byref(obj)
+
+class ImageDesc(ctypes.Structure):
+    _fields_ = [
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("pixels", Range),
+    ]
+
+class IconDesc(ctypes.Structure):
+    _fields_ = [
+        ("sokol_default", ctypes.c_bool),
+        ("images", (ImageDesc * 8)),
+    ]
+
+class Allocator(ctypes.Structure):
+    _fields_ = [
+        ("alloc_fn", ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p)),
+        ("free_fn", ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_void_p)),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class LogItem(enum.IntEnum):
+    OK = 0
+    MALLOC_FAILED = 1
+    MACOS_INVALID_NSOPENGL_PROFILE = 2
+    WIN32_LOAD_OPENGL32_DLL_FAILED = 3
+    WIN32_CREATE_HELPER_WINDOW_FAILED = 4
+    WIN32_HELPER_WINDOW_GETDC_FAILED = 5
+    WIN32_DUMMY_CONTEXT_SET_PIXELFORMAT_FAILED = 6
+    WIN32_CREATE_DUMMY_CONTEXT_FAILED = 7
+    WIN32_DUMMY_CONTEXT_MAKE_CURRENT_FAILED = 8
+    WIN32_GET_PIXELFORMAT_ATTRIB_FAILED = 9
+    WIN32_WGL_FIND_PIXELFORMAT_FAILED = 10
+    WIN32_WGL_DESCRIBE_PIXELFORMAT_FAILED = 11
+    WIN32_WGL_SET_PIXELFORMAT_FAILED = 12
+    WIN32_WGL_ARB_CREATE_CONTEXT_REQUIRED = 13
+    WIN32_WGL_ARB_CREATE_CONTEXT_PROFILE_REQUIRED = 14
+    WIN32_WGL_OPENGL_VERSION_NOT_SUPPORTED = 15
+    WIN32_WGL_OPENGL_PROFILE_NOT_SUPPORTED = 16
+    WIN32_WGL_INCOMPATIBLE_DEVICE_CONTEXT = 17
+    WIN32_WGL_CREATE_CONTEXT_ATTRIBS_FAILED_OTHER = 18
+    WIN32_D3D11_CREATE_DEVICE_AND_SWAPCHAIN_WITH_DEBUG_FAILED = 19
+    WIN32_D3D11_GET_IDXGIFACTORY_FAILED = 20
+    WIN32_D3D11_GET_IDXGIADAPTER_FAILED = 21
+    WIN32_D3D11_QUERY_INTERFACE_IDXGIDEVICE1_FAILED = 22
+    WIN32_REGISTER_RAW_INPUT_DEVICES_FAILED_MOUSE_LOCK = 23
+    WIN32_REGISTER_RAW_INPUT_DEVICES_FAILED_MOUSE_UNLOCK = 24
+    WIN32_GET_RAW_INPUT_DATA_FAILED = 25
+    LINUX_GLX_LOAD_LIBGL_FAILED = 26
+    LINUX_GLX_LOAD_ENTRY_POINTS_FAILED = 27
+    LINUX_GLX_EXTENSION_NOT_FOUND = 28
+    LINUX_GLX_QUERY_VERSION_FAILED = 29
+    LINUX_GLX_VERSION_TOO_LOW = 30
+    LINUX_GLX_NO_GLXFBCONFIGS = 31
+    LINUX_GLX_NO_SUITABLE_GLXFBCONFIG = 32
+    LINUX_GLX_GET_VISUAL_FROM_FBCONFIG_FAILED = 33
+    LINUX_GLX_REQUIRED_EXTENSIONS_MISSING = 34
+    LINUX_GLX_CREATE_CONTEXT_FAILED = 35
+    LINUX_GLX_CREATE_WINDOW_FAILED = 36
+    LINUX_X11_CREATE_WINDOW_FAILED = 37
+    LINUX_EGL_BIND_OPENGL_API_FAILED = 38
+    LINUX_EGL_BIND_OPENGL_ES_API_FAILED = 39
+    LINUX_EGL_GET_DISPLAY_FAILED = 40
+    LINUX_EGL_INITIALIZE_FAILED = 41
+    LINUX_EGL_NO_CONFIGS = 42
+    LINUX_EGL_NO_NATIVE_VISUAL = 43
+    LINUX_EGL_GET_VISUAL_INFO_FAILED = 44
+    LINUX_EGL_CREATE_WINDOW_SURFACE_FAILED = 45
+    LINUX_EGL_CREATE_CONTEXT_FAILED = 46
+    LINUX_EGL_MAKE_CURRENT_FAILED = 47
+    LINUX_X11_OPEN_DISPLAY_FAILED = 48
+    LINUX_X11_QUERY_SYSTEM_DPI_FAILED = 49
+    LINUX_X11_DROPPED_FILE_URI_WRONG_SCHEME = 50
+    LINUX_X11_FAILED_TO_BECOME_OWNER_OF_CLIPBOARD = 51
+    ANDROID_UNSUPPORTED_INPUT_EVENT_INPUT_CB = 52
+    ANDROID_UNSUPPORTED_INPUT_EVENT_MAIN_CB = 53
+    ANDROID_READ_MSG_FAILED = 54
+    ANDROID_WRITE_MSG_FAILED = 55
+    ANDROID_MSG_CREATE = 56
+    ANDROID_MSG_RESUME = 57
+    ANDROID_MSG_PAUSE = 58
+    ANDROID_MSG_FOCUS = 59
+    ANDROID_MSG_NO_FOCUS = 60
+    ANDROID_MSG_SET_NATIVE_WINDOW = 61
+    ANDROID_MSG_SET_INPUT_QUEUE = 62
+    ANDROID_MSG_DESTROY = 63
+    ANDROID_UNKNOWN_MSG = 64
+    ANDROID_LOOP_THREAD_STARTED = 65
+    ANDROID_LOOP_THREAD_DONE = 66
+    ANDROID_NATIVE_ACTIVITY_ONSTART = 67
+    ANDROID_NATIVE_ACTIVITY_ONRESUME = 68
+    ANDROID_NATIVE_ACTIVITY_ONSAVEINSTANCESTATE = 69
+    ANDROID_NATIVE_ACTIVITY_ONWINDOWFOCUSCHANGED = 70
+    ANDROID_NATIVE_ACTIVITY_ONPAUSE = 71
+    ANDROID_NATIVE_ACTIVITY_ONSTOP = 72
+    ANDROID_NATIVE_ACTIVITY_ONNATIVEWINDOWCREATED = 73
+    ANDROID_NATIVE_ACTIVITY_ONNATIVEWINDOWDESTROYED = 74
+    ANDROID_NATIVE_ACTIVITY_ONINPUTQUEUECREATED = 75
+    ANDROID_NATIVE_ACTIVITY_ONINPUTQUEUEDESTROYED = 76
+    ANDROID_NATIVE_ACTIVITY_ONCONFIGURATIONCHANGED = 77
+    ANDROID_NATIVE_ACTIVITY_ONLOWMEMORY = 78
+    ANDROID_NATIVE_ACTIVITY_ONDESTROY = 79
+    ANDROID_NATIVE_ACTIVITY_DONE = 80
+    ANDROID_NATIVE_ACTIVITY_ONCREATE = 81
+    ANDROID_CREATE_THREAD_PIPE_FAILED = 82
+    ANDROID_NATIVE_ACTIVITY_CREATE_SUCCESS = 83
+    WGPU_SWAPCHAIN_CREATE_SURFACE_FAILED = 84
+    WGPU_SWAPCHAIN_CREATE_SWAPCHAIN_FAILED = 85
+    WGPU_SWAPCHAIN_CREATE_DEPTH_STENCIL_TEXTURE_FAILED = 86
+    WGPU_SWAPCHAIN_CREATE_DEPTH_STENCIL_VIEW_FAILED = 87
+    WGPU_SWAPCHAIN_CREATE_MSAA_TEXTURE_FAILED = 88
+    WGPU_SWAPCHAIN_CREATE_MSAA_VIEW_FAILED = 89
+    WGPU_REQUEST_DEVICE_STATUS_ERROR = 90
+    WGPU_REQUEST_DEVICE_STATUS_UNKNOWN = 91
+    WGPU_REQUEST_ADAPTER_STATUS_UNAVAILABLE = 92
+    WGPU_REQUEST_ADAPTER_STATUS_ERROR = 93
+    WGPU_REQUEST_ADAPTER_STATUS_UNKNOWN = 94
+    WGPU_CREATE_INSTANCE_FAILED = 95
+    IMAGE_DATA_SIZE_MISMATCH = 96
+    DROPPED_FILE_PATH_TOO_LONG = 97
+    CLIPBOARD_STRING_TOO_BIG = 98
+
+class Logger(ctypes.Structure):
+    _fields_ = [
+        ("func", ctypes.CFUNCTYPE(None, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_char_p, ctypes.c_void_p)),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class Desc(ctypes.Structure):
+    _fields_ = [
+        ("init_cb", ctypes.CFUNCTYPE(None)),
+        ("frame_cb", ctypes.CFUNCTYPE(None)),
+        ("cleanup_cb", ctypes.CFUNCTYPE(None)),
+        ("event_cb", ctypes.CFUNCTYPE(None, ctypes.POINTER(Event))),
+        ("user_data", ctypes.c_void_p),
+        ("init_userdata_cb", ctypes.CFUNCTYPE(None, ctypes.c_void_p)),
+        ("frame_userdata_cb", ctypes.CFUNCTYPE(None, ctypes.c_void_p)),
+        ("cleanup_userdata_cb", ctypes.CFUNCTYPE(None, ctypes.c_void_p)),
+        ("event_userdata_cb", ctypes.CFUNCTYPE(None, ctypes.POINTER(Event), ctypes.c_void_p)),
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("sample_count", ctypes.c_int),
+        ("swap_interval", ctypes.c_int),
+        ("high_dpi", ctypes.c_bool),
+        ("fullscreen", ctypes.c_bool),
+        ("alpha", ctypes.c_bool),
+        ("window_title", ctypes.c_char_p),
+        ("enable_clipboard", ctypes.c_bool),
+        ("clipboard_size", ctypes.c_int),
+        ("enable_dragndrop", ctypes.c_bool),
+        ("max_dropped_files", ctypes.c_int),
+        ("max_dropped_file_path_length", ctypes.c_int),
+        ("icon", IconDesc),
+        ("allocator", Allocator),
+        ("logger", Logger),
+        ("gl_major_version", ctypes.c_int),
+        ("gl_minor_version", ctypes.c_int),
+        ("win32_console_utf8", ctypes.c_bool),
+        ("win32_console_create", ctypes.c_bool),
+        ("win32_console_attach", ctypes.c_bool),
+        ("html5_canvas_selector", ctypes.c_char_p),
+        ("html5_canvas_resize", ctypes.c_bool),
+        ("html5_preserve_drawing_buffer", ctypes.c_bool),
+        ("html5_premultiplied_alpha", ctypes.c_bool),
+        ("html5_ask_leave_site", ctypes.c_bool),
+        ("html5_bubble_mouse_events", ctypes.c_bool),
+        ("html5_bubble_touch_events", ctypes.c_bool),
+        ("html5_bubble_wheel_events", ctypes.c_bool),
+        ("html5_bubble_key_events", ctypes.c_bool),
+        ("html5_bubble_char_events", ctypes.c_bool),
+        ("html5_use_emsc_set_main_loop", ctypes.c_bool),
+        ("html5_emsc_set_main_loop_simulate_infinite_loop", ctypes.c_bool),
+        ("ios_keyboard_resizes_canvas", ctypes.c_bool),
+    ]
+
+class Html5FetchError(enum.IntEnum):
+    FETCH_ERROR_NO_ERROR = 0
+    FETCH_ERROR_BUFFER_TOO_SMALL = 1
+    FETCH_ERROR_OTHER = 2
+
+class Html5FetchResponse(ctypes.Structure):
+    _fields_ = [
+        ("succeeded", ctypes.c_bool),
+        ("error_code", ctypes.c_int),
+        ("file_index", ctypes.c_int),
+        ("data", Range),
+        ("buffer", Range),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class Html5FetchRequest(ctypes.Structure):
+    _fields_ = [
+        ("dropped_file_index", ctypes.c_int),
+        ("callback", ctypes.CFUNCTYPE(None, ctypes.POINTER(Html5FetchResponse))),
+        ("buffer", Range),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class MouseCursor(enum.IntEnum):
+    DEFAULT = 0
+    ARROW = 1
+    IBEAM = 2
+    CROSSHAIR = 3
+    POINTING_HAND = 4
+    RESIZE_EW = 5
+    RESIZE_NS = 6
+    RESIZE_NWSE = 7
+    RESIZE_NESW = 8
+    RESIZE_ALL = 9
+    NOT_ALLOWED = 10
+    NUM = 11
+
+isvalid = _lib["sapp_isvalid"]
+isvalid.argtypes = []
+isvalid.restype = ctypes.c_bool
+
+width = _lib["sapp_width"]
+width.argtypes = []
+width.restype = ctypes.c_int
+
+widthf = _lib["sapp_widthf"]
+widthf.argtypes = []
+widthf.restype = ctypes.c_float
+
+height = _lib["sapp_height"]
+height.argtypes = []
+height.restype = ctypes.c_int
+
+heightf = _lib["sapp_heightf"]
+heightf.argtypes = []
+heightf.restype = ctypes.c_float
+
+color_format = _lib["sapp_color_format"]
+color_format.argtypes = []
+color_format.restype = ctypes.c_int
+
+depth_format = _lib["sapp_depth_format"]
+depth_format.argtypes = []
+depth_format.restype = ctypes.c_int
+
+sample_count = _lib["sapp_sample_count"]
+sample_count.argtypes = []
+sample_count.restype = ctypes.c_int
+
+high_dpi = _lib["sapp_high_dpi"]
+high_dpi.argtypes = []
+high_dpi.restype = ctypes.c_bool
+
+dpi_scale = _lib["sapp_dpi_scale"]
+dpi_scale.argtypes = []
+dpi_scale.restype = ctypes.c_float
+
+show_keyboard = _lib["sapp_show_keyboard"]
+show_keyboard.argtypes = [ctypes.c_bool]
+show_keyboard.restype = None
+
+keyboard_shown = _lib["sapp_keyboard_shown"]
+keyboard_shown.argtypes = []
+keyboard_shown.restype = ctypes.c_bool
+
+is_fullscreen = _lib["sapp_is_fullscreen"]
+is_fullscreen.argtypes = []
+is_fullscreen.restype = ctypes.c_bool
+
+toggle_fullscreen = _lib["sapp_toggle_fullscreen"]
+toggle_fullscreen.argtypes = []
+toggle_fullscreen.restype = None
+
+show_mouse = _lib["sapp_show_mouse"]
+show_mouse.argtypes = [ctypes.c_bool]
+show_mouse.restype = None
+
+mouse_shown = _lib["sapp_mouse_shown"]
+mouse_shown.argtypes = []
+mouse_shown.restype = ctypes.c_bool
+
+lock_mouse = _lib["sapp_lock_mouse"]
+lock_mouse.argtypes = [ctypes.c_bool]
+lock_mouse.restype = None
+
+mouse_locked = _lib["sapp_mouse_locked"]
+mouse_locked.argtypes = []
+mouse_locked.restype = ctypes.c_bool
+
+set_mouse_cursor = _lib["sapp_set_mouse_cursor"]
+set_mouse_cursor.argtypes = [ctypes.c_int]
+set_mouse_cursor.restype = None
+
+get_mouse_cursor = _lib["sapp_get_mouse_cursor"]
+get_mouse_cursor.argtypes = []
+get_mouse_cursor.restype = ctypes.c_int
+get_mouse_cursor.errcheck = _enum_result(MouseCursor)
+
+userdata = _lib["sapp_userdata"]
+userdata.argtypes = []
+userdata.restype = ctypes.c_void_p
+
+query_desc = _lib["sapp_query_desc"]
+query_desc.argtypes = []
+query_desc.restype = Desc
+
+request_quit = _lib["sapp_request_quit"]
+request_quit.argtypes = []
+request_quit.restype = None
+
+cancel_quit = _lib["sapp_cancel_quit"]
+cancel_quit.argtypes = []
+cancel_quit.restype = None
+
+quit = _lib["sapp_quit"]
+quit.argtypes = []
+quit.restype = None
+
+consume_event = _lib["sapp_consume_event"]
+consume_event.argtypes = []
+consume_event.restype = None
+
+frame_count = _lib["sapp_frame_count"]
+frame_count.argtypes = []
+frame_count.restype = ctypes.c_uint64
+
+frame_duration = _lib["sapp_frame_duration"]
+frame_duration.argtypes = []
+frame_duration.restype = ctypes.c_double
+
+set_clipboard_string = _lib["sapp_set_clipboard_string"]
+set_clipboard_string.argtypes = [_CStrParam]
+set_clipboard_string.restype = None
+
+get_clipboard_string = _lib["sapp_get_clipboard_string"]
+get_clipboard_string.argtypes = []
+get_clipboard_string.restype = ctypes.c_char_p
+get_clipboard_string.errcheck = _c_str_to_python
+
+set_window_title = _lib["sapp_set_window_title"]
+set_window_title.argtypes = [_CStrParam]
+set_window_title.restype = None
+
+set_icon = _lib["sapp_set_icon"]
+set_icon.argtypes = [ctypes.POINTER(IconDesc)]
+set_icon.restype = None
+
+get_num_dropped_files = _lib["sapp_get_num_dropped_files"]
+get_num_dropped_files.argtypes = []
+get_num_dropped_files.restype = ctypes.c_int
+
+get_dropped_file_path = _lib["sapp_get_dropped_file_path"]
+get_dropped_file_path.argtypes = [ctypes.c_int]
+get_dropped_file_path.restype = ctypes.c_char_p
+get_dropped_file_path.errcheck = _c_str_to_python
+
+run = _lib["sapp_run"]
+run.argtypes = [ctypes.POINTER(Desc)]
+run.restype = None
+
+egl_get_display = _lib["sapp_egl_get_display"]
+egl_get_display.argtypes = []
+egl_get_display.restype = ctypes.c_void_p
+
+egl_get_context = _lib["sapp_egl_get_context"]
+egl_get_context.argtypes = []
+egl_get_context.restype = ctypes.c_void_p
+
+html5_ask_leave_site = _lib["sapp_html5_ask_leave_site"]
+html5_ask_leave_site.argtypes = [ctypes.c_bool]
+html5_ask_leave_site.restype = None
+
+html5_get_dropped_file_size = _lib["sapp_html5_get_dropped_file_size"]
+html5_get_dropped_file_size.argtypes = [ctypes.c_int]
+html5_get_dropped_file_size.restype = ctypes.c_uint32
+
+html5_fetch_dropped_file = _lib["sapp_html5_fetch_dropped_file"]
+html5_fetch_dropped_file.argtypes = [ctypes.POINTER(Html5FetchRequest)]
+html5_fetch_dropped_file.restype = None
+
+metal_get_device = _lib["sapp_metal_get_device"]
+metal_get_device.argtypes = []
+metal_get_device.restype = ctypes.c_void_p
+
+metal_get_current_drawable = _lib["sapp_metal_get_current_drawable"]
+metal_get_current_drawable.argtypes = []
+metal_get_current_drawable.restype = ctypes.c_void_p
+
+metal_get_depth_stencil_texture = _lib["sapp_metal_get_depth_stencil_texture"]
+metal_get_depth_stencil_texture.argtypes = []
+metal_get_depth_stencil_texture.restype = ctypes.c_void_p
+
+metal_get_msaa_color_texture = _lib["sapp_metal_get_msaa_color_texture"]
+metal_get_msaa_color_texture.argtypes = []
+metal_get_msaa_color_texture.restype = ctypes.c_void_p
+
+macos_get_window = _lib["sapp_macos_get_window"]
+macos_get_window.argtypes = []
+macos_get_window.restype = ctypes.c_void_p
+
+ios_get_window = _lib["sapp_ios_get_window"]
+ios_get_window.argtypes = []
+ios_get_window.restype = ctypes.c_void_p
+
+d3d11_get_device = _lib["sapp_d3d11_get_device"]
+d3d11_get_device.argtypes = []
+d3d11_get_device.restype = ctypes.c_void_p
+
+d3d11_get_device_context = _lib["sapp_d3d11_get_device_context"]
+d3d11_get_device_context.argtypes = []
+d3d11_get_device_context.restype = ctypes.c_void_p
+
+d3d11_get_swap_chain = _lib["sapp_d3d11_get_swap_chain"]
+d3d11_get_swap_chain.argtypes = []
+d3d11_get_swap_chain.restype = ctypes.c_void_p
+
+d3d11_get_render_view = _lib["sapp_d3d11_get_render_view"]
+d3d11_get_render_view.argtypes = []
+d3d11_get_render_view.restype = ctypes.c_void_p
+
+d3d11_get_resolve_view = _lib["sapp_d3d11_get_resolve_view"]
+d3d11_get_resolve_view.argtypes = []
+d3d11_get_resolve_view.restype = ctypes.c_void_p
+
+d3d11_get_depth_stencil_view = _lib["sapp_d3d11_get_depth_stencil_view"]
+d3d11_get_depth_stencil_view.argtypes = []
+d3d11_get_depth_stencil_view.restype = ctypes.c_void_p
+
+win32_get_hwnd = _lib["sapp_win32_get_hwnd"]
+win32_get_hwnd.argtypes = []
+win32_get_hwnd.restype = ctypes.c_void_p
+
+wgpu_get_device = _lib["sapp_wgpu_get_device"]
+wgpu_get_device.argtypes = []
+wgpu_get_device.restype = ctypes.c_void_p
+
+wgpu_get_render_view = _lib["sapp_wgpu_get_render_view"]
+wgpu_get_render_view.argtypes = []
+wgpu_get_render_view.restype = ctypes.c_void_p
+
+wgpu_get_resolve_view = _lib["sapp_wgpu_get_resolve_view"]
+wgpu_get_resolve_view.argtypes = []
+wgpu_get_resolve_view.restype = ctypes.c_void_p
+
+wgpu_get_depth_stencil_view = _lib["sapp_wgpu_get_depth_stencil_view"]
+wgpu_get_depth_stencil_view.argtypes = []
+wgpu_get_depth_stencil_view.restype = ctypes.c_void_p
+
+gl_get_framebuffer = _lib["sapp_gl_get_framebuffer"]
+gl_get_framebuffer.argtypes = []
+gl_get_framebuffer.restype = ctypes.c_uint32
+
+gl_get_major_version = _lib["sapp_gl_get_major_version"]
+gl_get_major_version.argtypes = []
+gl_get_major_version.restype = ctypes.c_int
+
+gl_get_minor_version = _lib["sapp_gl_get_minor_version"]
+gl_get_minor_version.argtypes = []
+gl_get_minor_version.restype = ctypes.c_int
+
+android_get_native_activity = _lib["sapp_android_get_native_activity"]
+android_get_native_activity.argtypes = []
+android_get_native_activity.restype = ctypes.c_void_p
+
@@ -0,0 +1,134 @@
+# machine generated, do not edit
+
+import ctypes, enum
+from . import clib
+
+_lib = clib.load()
+
+# argtypes converter for 'const char *' args, accepts str or bytes
+class _CStrParam:
+    @classmethod
+    def from_param(cls, obj):
+        if isinstance(obj, str):
+            obj = obj.encode("utf-8")
+        return ctypes.c_char_p.from_param(obj)
+
+# errcheck function to convert a C string result to a Python string
+def _c_str_to_python(result, func, args):
+    return result.decode("utf-8") if result is not None else ""
+
+# errcheck function factory to convert a C enum result to an IntEnum
+def _enum_result(enum_type):
+    def errcheck(result, func, args):
+        return enum_type(result)
+    return errcheck
+
+class LogItem(enum.IntEnum):
+    OK = 0
+    MALLOC_FAILED = 1
+    ALSA_SND_PCM_OPEN_FAILED = 2
+    ALSA_FLOAT_SAMPLES_NOT_SUPPORTED = 3
+    ALSA_REQUESTED_BUFFER_SIZE_NOT_SUPPORTED = 4
+    ALSA_REQUESTED_CHANNEL_COUNT_NOT_SUPPORTED = 5
+    ALSA_SND_PCM_HW_PARAMS_SET_RATE_NEAR_FAILED = 6
+    ALSA_SND_PCM_HW_PARAMS_FAILED = 7
+    ALSA_PTHREAD_CREATE_FAILED = 8
+    WASAPI_CREATE_EVENT_FAILED = 9
+    WASAPI_CREATE_DEVICE_ENUMERATOR_FAILED = 10
+    WASAPI_GET_DEFAULT_AUDIO_ENDPOINT_FAILED = 11
+    WASAPI_DEVICE_ACTIVATE_FAILED = 12
+    WASAPI_AUDIO_CLIENT_INITIALIZE_FAILED = 13
+    WASAPI_AUDIO_CLIENT_GET_BUFFER_SIZE_FAILED = 14
+    WASAPI_AUDIO_CLIENT_GET_SERVICE_FAILED = 15
+    WASAPI_AUDIO_CLIENT_SET_EVENT_HANDLE_FAILED = 16
+    WASAPI_CREATE_THREAD_FAILED = 17
+    AAUDIO_STREAMBUILDER_OPEN_STREAM_FAILED = 18
+    AAUDIO_PTHREAD_CREATE_FAILED = 19
+    AAUDIO_RESTARTING_STREAM_AFTER_ERROR = 20
+    USING_AAUDIO_BACKEND = 21
+    AAUDIO_CREATE_STREAMBUILDER_FAILED = 22
+    USING_SLES_BACKEND = 23
+    SLES_CREATE_ENGINE_FAILED = 24
+    SLES_ENGINE_GET_ENGINE_INTERFACE_FAILED = 25
+    SLES_CREATE_OUTPUT_MIX_FAILED = 26
+    SLES_MIXER_GET_VOLUME_INTERFACE_FAILED = 27
+    SLES_ENGINE_CREATE_AUDIO_PLAYER_FAILED = 28
+    SLES_PLAYER_GET_PLAY_INTERFACE_FAILED = 29
+    SLES_PLAYER_GET_VOLUME_INTERFACE_FAILED = 30
+    SLES_PLAYER_GET_BUFFERQUEUE_INTERFACE_FAILED = 31
+    COREAUDIO_NEW_OUTPUT_FAILED = 32
+    COREAUDIO_ALLOCATE_BUFFER_FAILED = 33
+    COREAUDIO_START_FAILED = 34
+    BACKEND_BUFFER_SIZE_ISNT_MULTIPLE_OF_PACKET_SIZE = 35
+
+class Logger(ctypes.Structure):
+    _fields_ = [
+        ("func", ctypes.CFUNCTYPE(None, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_char_p, ctypes.c_void_p)),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class Allocator(ctypes.Structure):
+    _fields_ = [
+        ("alloc_fn", ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p)),
+        ("free_fn", ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_void_p)),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class Desc(ctypes.Structure):
+    _fields_ = [
+        ("sample_rate", ctypes.c_int),
+        ("num_channels", ctypes.c_int),
+        ("buffer_frames", ctypes.c_int),
+        ("packet_frames", ctypes.c_int),
+        ("num_packets", ctypes.c_int),
+        ("stream_cb", ctypes.CFUNCTYPE(None, ctypes.POINTER(ctypes.c_float), ctypes.c_int, ctypes.c_int)),
+        ("stream_userdata_cb", ctypes.CFUNCTYPE(None, ctypes.POINTER(ctypes.c_float), ctypes.c_int, ctypes.c_int, ctypes.c_void_p)),
+        ("user_data", ctypes.c_void_p),
+        ("allocator", Allocator),
+        ("logger", Logger),
+    ]
+
+setup = _lib["saudio_setup"]
+setup.argtypes = [ctypes.POINTER(Desc)]
+setup.restype = None
+
+shutdown = _lib["saudio_shutdown"]
+shutdown.argtypes = []
+shutdown.restype = None
+
+isvalid = _lib["saudio_isvalid"]
+isvalid.argtypes = []
+isvalid.restype = ctypes.c_bool
+
+userdata = _lib["saudio_userdata"]
+userdata.argtypes = []
+userdata.restype = ctypes.c_void_p
+
+query_desc = _lib["saudio_query_desc"]
+query_desc.argtypes = []
+query_desc.restype = Desc
+
+sample_rate = _lib["saudio_sample_rate"]
+sample_rate.argtypes = []
+sample_rate.restype = ctypes.c_int
+
+buffer_frames = _lib["saudio_buffer_frames"]
+buffer_frames.argtypes = []
+buffer_frames.restype = ctypes.c_int
+
+channels = _lib["saudio_channels"]
+channels.argtypes = []
+channels.restype = ctypes.c_int
+
+suspended = _lib["saudio_suspended"]
+suspended.argtypes = []
+suspended.restype = ctypes.c_bool
+
+expect = _lib["saudio_expect"]
+expect.argtypes = []
+expect.restype = ctypes.c_int
+
+push = _lib["saudio_push"]
+push.argtypes = [ctypes.POINTER(ctypes.c_float), ctypes.c_int]
+push.restype = ctypes.c_int
+
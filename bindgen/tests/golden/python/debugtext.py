@@ -0,0 +1,294 @@
+# machine generated, do not edit
+
+import ctypes, enum
+from . import clib
+from . import gfx as sg
+
+_lib = clib.load()
+
+# argtypes converter for 'const char *' args, accepts str or bytes
+class _CStrParam:
+    @classmethod
+    def from_param(cls, obj):
+        if isinstance(obj, str):
+            obj = obj.encode("utf-8")
+        return ctypes.c_char_p.from_param(obj)
+
+# errcheck function to convert a C string result to a Python string
+def _c_str_to_python(result, func, args):
+    return result.decode("utf-8") if result is not None else ""
+
+# errcheck function factory to convert a C enum result to an IntEnum
+def _enum_result(enum_type):
+    def errcheck(result, func, args):
+        return enum_type(result)
+    return errcheck
+
+# CPython's Py_buffer struct, used for zero-copy access to buffer-protocol objects
+class _PyBuffer(ctypes.Structure):
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.c_void_p),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.c_void_p),
+        ("strides", ctypes.c_void_p),
+        ("suboffsets", ctypes.c_void_p),
+        ("internal", ctypes.c_void_p),
+    ]
+
+_PyObject_GetBuffer = ctypes.pythonapi["PyObject_GetBuffer"]
+_PyObject_GetBuffer.argtypes = [ctypes.py_object, ctypes.POINTER(_PyBuffer), ctypes.c_int]
+_PyObject_GetBuffer.restype = ctypes.c_int
+_PyBuffer_Release = ctypes.pythonapi["PyBuffer_Release"]
+_PyBuffer_Release.argtypes = [ctypes.POINTER(_PyBuffer)]
+_PyBuffer_Release.restype = None
+
+# owns a buffer export of an object, and releases it when garbage collected
+class _BufferExport:
+    def __init__(self, obj):
+        self.view = _PyBuffer()
+        _PyObject_GetBuffer(obj, ctypes.byref(self.view), 0)
+
+    def __del__(self):
+        # the module globals may already be gone at interpreter shutdown
+        if _PyBuffer_Release is not None and self.view.obj:
+            _PyBuffer_Release(ctypes.byref(self.view))
+
+class LogItem(enum.IntEnum):
+    OK = 0
+    MALLOC_FAILED = 1
+    ADD_COMMIT_LISTENER_FAILED = 2
+    COMMAND_BUFFER_FULL = 3
+    CONTEXT_POOL_EXHAUSTED = 4
+    CANNOT_DESTROY_DEFAULT_CONTEXT = 5
+
+class Logger(ctypes.Structure):
+    _fields_ = [
+        ("func", ctypes.CFUNCTYPE(None, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_char_p, ctypes.c_void_p)),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class Context(ctypes.Structure):
+    _fields_ = [
+        ("id", ctypes.c_uint32),
+    ]
+
+class Range(ctypes.Structure):
+    _fields_ = [
+        ("ptr", ctypes.c_void_p),
+        ("size", ctypes.c_size_t),
+    ]
+
+# helper function to create a Range over any object supporting the buffer
+# protocol (bytes, bytearray, memoryview, array.array, NumPy arrays, ctypes
+# objects...) without copying. The Range holds the buffer export of the
+# object until it is garbage collected, so that resizable objects like a
+# bytearray can't be resized or reallocated while the Range points to them
+def as_range(data) -> Range:
+    export = _BufferExport(data)
+    # a void pointer which references the buffer export through ctypes' keep-alive
+    # mechanism, this is also carried over when the Range is copied into a struct
+    ptr = ctypes.cast((ctypes.py_object * 1)(export), ctypes.c_void_p)
+    ptr.value = export.view.buf
+    rng = Range()
+    rng.ptr = ptr
+    rng.size = export.view.len
+    return rng
+
+# argtypes converter for 'const sdtx_range *' args, accepts a Range or any
+# object supporting the buffer protocol
+class RangeParam:
+    @classmethod
+    def from_param(cls, obj):
+        if not isinstance(obj, Range):
+            obj = as_range(obj)
+        return ctypes.byref(obj)
+
+class FontDesc(ctypes.Structure):
+    _fields_ = [
+        ("data", Range),
+        ("first_char", ctypes.c_uint8),
+        ("last_char", ctypes.c_uint8),
+    ]
+
+class ContextDesc(ctypes.Structure):
+    _fields_ = [
+        ("max_commands", ctypes.c_int),
+        ("char_buf_size", ctypes.c_int),
+        ("canvas_width", ctypes.c_float),
+        ("canvas_height", ctypes.c_float),
+        ("tab_width", ctypes.c_int),
+        ("color_format", ctypes.c_int),
+        ("depth_format", ctypes.c_int),
+        ("sample_count", ctypes.c_int),
+    ]
+
+class Allocator(ctypes.Structure):
+    _fields_ = [
+        ("alloc_fn", ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p)),
+        ("free_fn", ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_void_p)),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class Desc(ctypes.Structure):
+    _fields_ = [
+        ("context_pool_size", ctypes.c_int),
+        ("printf_buf_size", ctypes.c_int),
+        ("fonts", (FontDesc * 8)),
+        ("context", ContextDesc),
+        ("allocator", Allocator),
+        ("logger", Logger),
+    ]
+
+setup = _lib["sdtx_setup"]
+setup.argtypes = [ctypes.POINTER(Desc)]
+setup.restype = None
+
+shutdown = _lib["sdtx_shutdown"]
+shutdown.argtypes = []
+shutdown.restype = None
+
+font_kc853 = _lib["sdtx_font_kc853"]
+font_kc853.argtypes = []
+font_kc853.restype = FontDesc
+
+font_kc854 = _lib["sdtx_font_kc854"]
+font_kc854.argtypes = []
+font_kc854.restype = FontDesc
+
+font_z1013 = _lib["sdtx_font_z1013"]
+font_z1013.argtypes = []
+font_z1013.restype = FontDesc
+
+font_cpc = _lib["sdtx_font_cpc"]
+font_cpc.argtypes = []
+font_cpc.restype = FontDesc
+
+font_c64 = _lib["sdtx_font_c64"]
+font_c64.argtypes = []
+font_c64.restype = FontDesc
+
+font_oric = _lib["sdtx_font_oric"]
+font_oric.argtypes = []
+font_oric.restype = FontDesc
+
+make_context = _lib["sdtx_make_context"]
+make_context.argtypes = [ctypes.POINTER(ContextDesc)]
+make_context.restype = Context
+
+destroy_context = _lib["sdtx_destroy_context"]
+destroy_context.argtypes = [Context]
+destroy_context.restype = None
+
+set_context = _lib["sdtx_set_context"]
+set_context.argtypes = [Context]
+set_context.restype = None
+
+get_context = _lib["sdtx_get_context"]
+get_context.argtypes = []
+get_context.restype = Context
+
+default_context = _lib["sdtx_default_context"]
+default_context.argtypes = []
+default_context.restype = Context
+
+draw = _lib["sdtx_draw"]
+draw.argtypes = []
+draw.restype = None
+
+context_draw = _lib["sdtx_context_draw"]
+context_draw.argtypes = [Context]
+context_draw.restype = None
+
+draw_layer = _lib["sdtx_draw_layer"]
+draw_layer.argtypes = [ctypes.c_int]
+draw_layer.restype = None
+
+context_draw_layer = _lib["sdtx_context_draw_layer"]
+context_draw_layer.argtypes = [Context, ctypes.c_int]
+context_draw_layer.restype = None
+
+layer = _lib["sdtx_layer"]
+layer.argtypes = [ctypes.c_int]
+layer.restype = None
+
+font = _lib["sdtx_font"]
+font.argtypes = [ctypes.c_int]
+font.restype = None
+
+canvas = _lib["sdtx_canvas"]
+canvas.argtypes = [ctypes.c_float, ctypes.c_float]
+canvas.restype = None
+
+origin = _lib["sdtx_origin"]
+origin.argtypes = [ctypes.c_float, ctypes.c_float]
+origin.restype = None
+
+home = _lib["sdtx_home"]
+home.argtypes = []
+home.restype = None
+
+pos = _lib["sdtx_pos"]
+pos.argtypes = [ctypes.c_float, ctypes.c_float]
+pos.restype = None
+
+pos_x = _lib["sdtx_pos_x"]
+pos_x.argtypes = [ctypes.c_float]
+pos_x.restype = None
+
+pos_y = _lib["sdtx_pos_y"]
+pos_y.argtypes = [ctypes.c_float]
+pos_y.restype = None
+
+move = _lib["sdtx_move"]
+move.argtypes = [ctypes.c_float, ctypes.c_float]
+move.restype = None
+
+move_x = _lib["sdtx_move_x"]
+move_x.argtypes = [ctypes.c_float]
+move_x.restype = None
+
+move_y = _lib["sdtx_move_y"]
+move_y.argtypes = [ctypes.c_float]
+move_y.restype = None
+
+crlf = _lib["sdtx_crlf"]
+crlf.argtypes = []
+crlf.restype = None
+
+color3b = _lib["sdtx_color3b"]
+color3b.argtypes = [ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]
+color3b.restype = None
+
+color3f = _lib["sdtx_color3f"]
+color3f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float]
+color3f.restype = None
+
+color4b = _lib["sdtx_color4b"]
+color4b.argtypes = [ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]
+color4b.restype = None
+
+color4f = _lib["sdtx_color4f"]
+color4f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+color4f.restype = None
+
+color1i = _lib["sdtx_color1i"]
+color1i.argtypes = [ctypes.c_uint32]
+color1i.restype = None
+
+putc = _lib["sdtx_putc"]
+putc.argtypes = [ctypes.c_char]
+putc.restype = None
+
+puts = _lib["sdtx_puts"]
+puts.argtypes = [_CStrParam]
+puts.restype = None
+
+putr = _lib["sdtx_putr"]
+putr.argtypes = [_CStrParam, ctypes.c_int]
+putr.restype = None
+
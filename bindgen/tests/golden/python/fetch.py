@@ -0,0 +1,227 @@
+# machine generated, do not edit
+
+import ctypes, enum
+from . import clib
+
+_lib = clib.load()
+
+# argtypes converter for 'const char *' args, accepts str or bytes
+class _CStrParam:
+    @classmethod
+    def from_param(cls, obj):
+        if isinstance(obj, str):
+            obj = obj.encode("utf-8")
+        return ctypes.c_char_p.from_param(obj)
+
+# errcheck function to convert a C string result to a Python string
+def _c_str_to_python(result, func, args):
+    return result.decode("utf-8") if result is not None else ""
+
+# errcheck function factory to convert a C enum result to an IntEnum
+def _enum_result(enum_type):
+    def errcheck(result, func, args):
+        return enum_type(result)
+    return errcheck
+
+# CPython's Py_buffer struct, used for zero-copy access to buffer-protocol objects
+class _PyBuffer(ctypes.Structure):
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.c_void_p),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.c_void_p),
+        ("strides", ctypes.c_void_p),
+        ("suboffsets", ctypes.c_void_p),
+        ("internal", ctypes.c_void_p),
+    ]
+
+_PyObject_GetBuffer = ctypes.pythonapi["PyObject_GetBuffer"]
+_PyObject_GetBuffer.argtypes = [ctypes.py_object, ctypes.POINTER(_PyBuffer), ctypes.c_int]
+_PyObject_GetBuffer.restype = ctypes.c_int
+_PyBuffer_Release = ctypes.pythonapi["PyBuffer_Release"]
+_PyBuffer_Release.argtypes = [ctypes.POINTER(_PyBuffer)]
+_PyBuffer_Release.restype = None
+
+# owns a buffer export of an object, and releases it when garbage collected
+class _BufferExport:
+    def __init__(self, obj):
+        self.view = _PyBuffer()
+        _PyObject_GetBuffer(obj, ctypes.byref(self.view), 0)
+
+    def __del__(self):
+        # the module globals may already be gone at interpreter shutdown
+        if _PyBuffer_Release is not None and self.view.obj:
+            _PyBuffer_Release(ctypes.byref(self.view))
+
+class LogItem(enum.IntEnum):
+    OK = 0
+    MALLOC_FAILED = 1
+    FILE_PATH_UTF8_DECODING_FAILED = 2
+    SEND_QUEUE_FULL = 3
+    REQUEST_CHANNEL_INDEX_TOO_BIG = 4
+    REQUEST_PATH_IS_NULL = 5
+    REQUEST_PATH_TOO_LONG = 6
+    REQUEST_CALLBACK_MISSING = 7
+    REQUEST_CHUNK_SIZE_GREATER_BUFFER_SIZE = 8
+    REQUEST_USERDATA_PTR_IS_SET_BUT_USERDATA_SIZE_IS_NULL = 9
+    REQUEST_USERDATA_PTR_IS_NULL_BUT_USERDATA_SIZE_IS_NOT = 10
+    REQUEST_USERDATA_SIZE_TOO_BIG = 11
+    CLAMPING_NUM_CHANNELS_TO_MAX_CHANNELS = 12
+    REQUEST_POOL_EXHAUSTED = 13
+
+class Logger(ctypes.Structure):
+    _fields_ = [
+        ("func", ctypes.CFUNCTYPE(None, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_char_p, ctypes.c_void_p)),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class Range(ctypes.Structure):
+    _fields_ = [
+        ("ptr", ctypes.c_void_p),
+        ("size", ctypes.c_size_t),
+    ]
+
+# helper function to create a Range over any object supporting the buffer
+# protocol (bytes, bytearray, memoryview, array.array, NumPy arrays, ctypes
+# objects...) without copying. The Range holds the buffer export of the
+# object until it is garbage collected, so that resizable objects like a
+# bytearray can't be resized or reallocated while the Range points to them
+def as_range(data) -> Range:
+    export = _BufferExport(data)
+    # a void pointer which references the buffer export through ctypes' keep-alive
+    # mechanism, this is also carried over when the Range is copied into a struct
+    ptr = ctypes.cast((ctypes.py_object * 1)(export), ctypes.c_void_p)
+    ptr.value = export.view.buf
+    rng = Range()
+    rng.ptr = ptr
+    rng.size = export.view.len
+    return rng
+
+# argtypes converter for 'const sfetch_range_t *' args, accepts a Range or any
+# object supporting the buffer protocol
+class RangeParam:
+    @classmethod
+    def from_param(cls, obj):
+        if not isinstance(obj, Range):
+            obj = as_range(obj)
+        return ctypes.byref(obj)
+
+class Allocator(ctypes.Structure):
+    _fields_ = [
+        ("alloc_fn", ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p)),
+        ("free_fn", ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_void_p)),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class Desc(ctypes.Structure):
+    _fields_ = [
+        ("max_requests", ctypes.c_uint32),
+        ("num_channels", ctypes.c_uint32),
+        ("num_lanes", ctypes.c_uint32),
+        ("allocator", Allocator),
+        ("logger", Logger),
+    ]
+
+class Handle(ctypes.Structure):
+    _fields_ = [
+        ("id", ctypes.c_uint32),
+    ]
+
+class Error(enum.IntEnum):
+    NO_ERROR = 0
+    FILE_NOT_FOUND = 1
+    NO_BUFFER = 2
+    BUFFER_TOO_SMALL = 3
+    UNEXPECTED_EOF = 4
+    INVALID_HTTP_STATUS = 5
+    CANCELLED = 6
+
+class Response(ctypes.Structure):
+    _fields_ = [
+        ("handle", Handle),
+        ("dispatched", ctypes.c_bool),
+        ("fetched", ctypes.c_bool),
+        ("paused", ctypes.c_bool),
+        ("finished", ctypes.c_bool),
+        ("failed", ctypes.c_bool),
+        ("cancelled", ctypes.c_bool),
+        ("error_code", ctypes.c_int),
+        ("channel", ctypes.c_uint32),
+        ("lane", ctypes.c_uint32),
+        ("path", ctypes.c_char_p),
+        ("user_data", ctypes.c_void_p),
+        ("data_offset", ctypes.c_uint32),
+        ("data", Range),
+        ("buffer", Range),
+    ]
+
+class Request(ctypes.Structure):
+    _fields_ = [
+        ("channel", ctypes.c_uint32),
+        ("path", ctypes.c_char_p),
+        ("callback", ctypes.CFUNCTYPE(None, ctypes.POINTER(Response))),
+        ("chunk_size", ctypes.c_uint32),
+        ("buffer", Range),
+        ("user_data", Range),
+    ]
+
+setup = _lib["sfetch_setup"]
+setup.argtypes = [ctypes.POINTER(Desc)]
+setup.restype = None
+
+shutdown = _lib["sfetch_shutdown"]
+shutdown.argtypes = []
+shutdown.restype = None
+
+valid = _lib["sfetch_valid"]
+valid.argtypes = []
+valid.restype = ctypes.c_bool
+
+desc = _lib["sfetch_desc"]
+desc.argtypes = []
+desc.restype = Desc
+
+max_userdata_bytes = _lib["sfetch_max_userdata_bytes"]
+max_userdata_bytes.argtypes = []
+max_userdata_bytes.restype = ctypes.c_int
+
+max_path = _lib["sfetch_max_path"]
+max_path.argtypes = []
+max_path.restype = ctypes.c_int
+
+send = _lib["sfetch_send"]
+send.argtypes = [ctypes.POINTER(Request)]
+send.restype = Handle
+
+handle_valid = _lib["sfetch_handle_valid"]
+handle_valid.argtypes = [Handle]
+handle_valid.restype = ctypes.c_bool
+
+dowork = _lib["sfetch_dowork"]
+dowork.argtypes = []
+dowork.restype = None
+
+bind_buffer = _lib["sfetch_bind_buffer"]
+bind_buffer.argtypes = [Handle, Range]
+bind_buffer.restype = None
+
+unbind_buffer = _lib["sfetch_unbind_buffer"]
+unbind_buffer.argtypes = [Handle]
+unbind_buffer.restype = ctypes.c_void_p
+
+cancel = _lib["sfetch_cancel"]
+cancel.argtypes = [Handle]
+cancel.restype = None
+
+pause = _lib["sfetch_pause"]
+pause.argtypes = [Handle]
+pause.restype = None
+
+continue_fetching = _lib["sfetch_continue"]
+continue_fetching.argtypes = [Handle]
+continue_fetching.restype = None
+
@@ -0,0 +1,2423 @@
+# machine generated, do not edit
+
+import ctypes, enum
+from . import clib
+
+_lib = clib.load()
+
+# argtypes converter for 'const char *' args, accepts str or bytes
+class _CStrParam:
+    @classmethod
+    def from_param(cls, obj):
+        if isinstance(obj, str):
+            obj = obj.encode("utf-8")
+        return ctypes.c_char_p.from_param(obj)
+
+# errcheck function to convert a C string result to a Python string
+def _c_str_to_python(result, func, args):
+    return result.decode("utf-8") if result is not None else ""
+
+# errcheck function factory to convert a C enum result to an IntEnum
+def _enum_result(enum_type):
+    def errcheck(result, func, args):
+        return enum_type(result)
+    return errcheck
+
+# CPython's Py_buffer struct, used for zero-copy access to buffer-protocol objects
+class _PyBuffer(ctypes.Structure):
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.c_void_p),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.c_void_p),
+        ("strides", ctypes.c_void_p),
+        ("suboffsets", ctypes.c_void_p),
+        ("internal", ctypes.c_void_p),
+    ]
+
+_PyObject_GetBuffer = ctypes.pythonapi["PyObject_GetBuffer"]
+_PyObject_GetBuffer.argtypes = [ctypes.py_object, ctypes.POINTER(_PyBuffer), ctypes.c_int]
+_PyObject_GetBuffer.restype = ctypes.c_int
+_PyBuffer_Release = ctypes.pythonapi["PyBuffer_Release"]
+_PyBuffer_Release.argtypes = [ctypes.POINTER(_PyBuffer)]
+_PyBuffer_Release.restype = None
+
+# owns a buffer export of an object, and releases it when garbage collected
+class _BufferExport:
+    def __init__(self, obj):
+        self.view = _PyBuffer()
+        _PyObject_GetBuffer(obj, ctypes.byref(self.view), 0)
+
+    def __del__(self):
+        # the module globals may already be gone at interpreter shutdown
+        if _PyBuffer_Release is not None and self.view.obj:
+            _PyBuffer_Release(ctypes.byref(self.view))
+
+# names of the values in a flattened FrameStats struct
+FRAME_STATS_NAMES = (
+    "frame_index",
+    "num_passes",
+    "num_apply_viewport",
+    "num_apply_scissor_rect",
+    "num_apply_pipeline",
+    "num_apply_bindings",
+    "num_apply_uniforms",
+    "num_draw",
+    "num_update_buffer",
+    "num_append_buffer",
+    "num_update_image",
+    "size_apply_uniforms",
+    "size_update_buffer",
+    "size_append_buffer",
+    "size_update_image",
+    "gl.num_bind_buffer",
+    "gl.num_active_texture",
+    "gl.num_bind_texture",
+    "gl.num_bind_sampler",
+    "gl.num_use_program",
+    "gl.num_render_state",
+    "gl.num_vertex_attrib_pointer",
+    "gl.num_vertex_attrib_divisor",
+    "gl.num_enable_vertex_attrib_array",
+    "gl.num_disable_vertex_attrib_array",
+    "gl.num_uniform",
+    "d3d11.pass.num_om_set_render_targets",
+    "d3d11.pass.num_clear_render_target_view",
+    "d3d11.pass.num_clear_depth_stencil_view",
+    "d3d11.pass.num_resolve_subresource",
+    "d3d11.pipeline.num_rs_set_state",
+    "d3d11.pipeline.num_om_set_depth_stencil_state",
+    "d3d11.pipeline.num_om_set_blend_state",
+    "d3d11.pipeline.num_ia_set_primitive_topology",
+    "d3d11.pipeline.num_ia_set_input_layout",
+    "d3d11.pipeline.num_vs_set_shader",
+    "d3d11.pipeline.num_vs_set_constant_buffers",
+    "d3d11.pipeline.num_ps_set_shader",
+    "d3d11.pipeline.num_ps_set_constant_buffers",
+    "d3d11.bindings.num_ia_set_vertex_buffers",
+    "d3d11.bindings.num_ia_set_index_buffer",
+    "d3d11.bindings.num_vs_set_shader_resources",
+    "d3d11.bindings.num_ps_set_shader_resources",
+    "d3d11.bindings.num_vs_set_samplers",
+    "d3d11.bindings.num_ps_set_samplers",
+    "d3d11.uniforms.num_update_subresource",
+    "d3d11.draw.num_draw_indexed_instanced",
+    "d3d11.draw.num_draw_indexed",
+    "d3d11.draw.num_draw_instanced",
+    "d3d11.draw.num_draw",
+    "d3d11.num_map",
+    "d3d11.num_unmap",
+    "metal.idpool.num_added",
+    "metal.idpool.num_released",
+    "metal.idpool.num_garbage_collected",
+    "metal.pipeline.num_set_blend_color",
+    "metal.pipeline.num_set_cull_mode",
+    "metal.pipeline.num_set_front_facing_winding",
+    "metal.pipeline.num_set_stencil_reference_value",
+    "metal.pipeline.num_set_depth_bias",
+    "metal.pipeline.num_set_render_pipeline_state",
+    "metal.pipeline.num_set_depth_stencil_state",
+    "metal.bindings.num_set_vertex_buffer",
+    "metal.bindings.num_set_vertex_texture",
+    "metal.bindings.num_set_vertex_sampler_state",
+    "metal.bindings.num_set_fragment_buffer",
+    "metal.bindings.num_set_fragment_texture",
+    "metal.bindings.num_set_fragment_sampler_state",
+    "metal.uniforms.num_set_vertex_buffer_offset",
+    "metal.uniforms.num_set_fragment_buffer_offset",
+    "wgpu.uniforms.num_set_bindgroup",
+    "wgpu.uniforms.size_write_buffer",
+    "wgpu.bindings.num_set_vertex_buffer",
+    "wgpu.bindings.num_skip_redundant_vertex_buffer",
+    "wgpu.bindings.num_set_index_buffer",
+    "wgpu.bindings.num_skip_redundant_index_buffer",
+    "wgpu.bindings.num_create_bindgroup",
+    "wgpu.bindings.num_discard_bindgroup",
+    "wgpu.bindings.num_set_bindgroup",
+    "wgpu.bindings.num_skip_redundant_bindgroup",
+    "wgpu.bindings.num_bindgroup_cache_hits",
+    "wgpu.bindings.num_bindgroup_cache_misses",
+    "wgpu.bindings.num_bindgroup_cache_collisions",
+    "wgpu.bindings.num_bindgroup_cache_invalidates",
+    "wgpu.bindings.num_bindgroup_cache_hash_vs_key_mismatch",
+)
+
+
+def frame_stats_flatten(stats):
+    """Flat tuple view of a FrameStats struct, for instance for exporting"""
+    return (
+        stats.frame_index,
+        stats.num_passes,
+        stats.num_apply_viewport,
+        stats.num_apply_scissor_rect,
+        stats.num_apply_pipeline,
+        stats.num_apply_bindings,
+        stats.num_apply_uniforms,
+        stats.num_draw,
+        stats.num_update_buffer,
+        stats.num_append_buffer,
+        stats.num_update_image,
+        stats.size_apply_uniforms,
+        stats.size_update_buffer,
+        stats.size_append_buffer,
+        stats.size_update_image,
+        stats.gl.num_bind_buffer,
+        stats.gl.num_active_texture,
+        stats.gl.num_bind_texture,
+        stats.gl.num_bind_sampler,
+        stats.gl.num_use_program,
+        stats.gl.num_render_state,
+        stats.gl.num_vertex_attrib_pointer,
+        stats.gl.num_vertex_attrib_divisor,
+        stats.gl.num_enable_vertex_attrib_array,
+        stats.gl.num_disable_vertex_attrib_array,
+        stats.gl.num_uniform,
+        stats.d3d11.pass_.num_om_set_render_targets,
+        stats.d3d11.pass_.num_clear_render_target_view,
+        stats.d3d11.pass_.num_clear_depth_stencil_view,
+        stats.d3d11.pass_.num_resolve_subresource,
+        stats.d3d11.pipeline.num_rs_set_state,
+        stats.d3d11.pipeline.num_om_set_depth_stencil_state,
+        stats.d3d11.pipeline.num_om_set_blend_state,
+        stats.d3d11.pipeline.num_ia_set_primitive_topology,
+        stats.d3d11.pipeline.num_ia_set_input_layout,
+        stats.d3d11.pipeline.num_vs_set_shader,
+        stats.d3d11.pipeline.num_vs_set_constant_buffers,
+        stats.d3d11.pipeline.num_ps_set_shader,
+        stats.d3d11.pipeline.num_ps_set_constant_buffers,
+        stats.d3d11.bindings.num_ia_set_vertex_buffers,
+        stats.d3d11.bindings.num_ia_set_index_buffer,
+        stats.d3d11.bindings.num_vs_set_shader_resources,
+        stats.d3d11.bindings.num_ps_set_shader_resources,
+        stats.d3d11.bindings.num_vs_set_samplers,
+        stats.d3d11.bindings.num_ps_set_samplers,
+        stats.d3d11.uniforms.num_update_subresource,
+        stats.d3d11.draw.num_draw_indexed_instanced,
+        stats.d3d11.draw.num_draw_indexed,
+        stats.d3d11.draw.num_draw_instanced,
+        stats.d3d11.draw.num_draw,
+        stats.d3d11.num_map,
+        stats.d3d11.num_unmap,
+        stats.metal.idpool.num_added,
+        stats.metal.idpool.num_released,
+        stats.metal.idpool.num_garbage_collected,
+        stats.metal.pipeline.num_set_blend_color,
+        stats.metal.pipeline.num_set_cull_mode,
+        stats.metal.pipeline.num_set_front_facing_winding,
+        stats.metal.pipeline.num_set_stencil_reference_value,
+        stats.metal.pipeline.num_set_depth_bias,
+        stats.metal.pipeline.num_set_render_pipeline_state,
+        stats.metal.pipeline.num_set_depth_stencil_state,
+        stats.metal.bindings.num_set_vertex_buffer,
+        stats.metal.bindings.num_set_vertex_texture,
+        stats.metal.bindings.num_set_vertex_sampler_state,
+        stats.metal.bindings.num_set_fragment_buffer,
+        stats.metal.bindings.num_set_fragment_texture,
+        stats.metal.bindings.num_set_fragment_sampler_state,
+        stats.metal.uniforms.num_set_vertex_buffer_offset,
+        stats.metal.uniforms.num_set_fragment_buffer_offset,
+        stats.wgpu.uniforms.num_set_bindgroup,
+        stats.wgpu.uniforms.size_write_buffer,
+        stats.wgpu.bindings.num_set_vertex_buffer,
+        stats.wgpu.bindings.num_skip_redundant_vertex_buffer,
+        stats.wgpu.bindings.num_set_index_buffer,
+        stats.wgpu.bindings.num_skip_redundant_index_buffer,
+        stats.wgpu.bindings.num_create_bindgroup,
+        stats.wgpu.bindings.num_discard_bindgroup,
+        stats.wgpu.bindings.num_set_bindgroup,
+        stats.wgpu.bindings.num_skip_redundant_bindgroup,
+        stats.wgpu.bindings.num_bindgroup_cache_hits,
+        stats.wgpu.bindings.num_bindgroup_cache_misses,
+        stats.wgpu.bindings.num_bindgroup_cache_collisions,
+        stats.wgpu.bindings.num_bindgroup_cache_invalidates,
+        stats.wgpu.bindings.num_bindgroup_cache_hash_vs_key_mismatch,
+    )
+
+
+class FrameStatsCollector:
+    """Records the flattened frame stats of the last num_frames frames,
+    call push(query_frame_stats()) once per frame"""
+
+    def __init__(self, num_frames=120):
+        self.num_frames = num_frames
+        self._frames = [None] * num_frames
+        self._num = 0
+        self._pos = 0
+
+    def __len__(self):
+        return self._num
+
+    def push(self, stats):
+        self._frames[self._pos] = frame_stats_flatten(stats)
+        self._pos = (self._pos + 1) % self.num_frames
+        self._num = min(self._num + 1, self.num_frames)
+
+    def latest(self):
+        """The most recently pushed frame stats or None"""
+        if self._num == 0:
+            return None
+        return self._frames[(self._pos - 1) % self.num_frames]
+
+    def average(self, value_index):
+        """Average of a value over the recorded frames"""
+        if self._num == 0:
+            return 0.0
+        return sum(frame[value_index] for frame in self._frames[: self._num]) / self._num
+
+    def percentile(self, value_index, p):
+        """Nearest-rank percentile (0..100) of a value over the recorded frames"""
+        if self._num == 0:
+            return 0
+        values = sorted(frame[value_index] for frame in self._frames[: self._num])
+        rank = (min(p, 100) * self._num + 99) // 100
+        return values[max(rank - 1, 0)]
+
+class Buffer(ctypes.Structure):
+    _fields_ = [
+        ("id", ctypes.c_uint32),
+    ]
+
+class Image(ctypes.Structure):
+    _fields_ = [
+        ("id", ctypes.c_uint32),
+    ]
+
+class Sampler(ctypes.Structure):
+    _fields_ = [
+        ("id", ctypes.c_uint32),
+    ]
+
+class Shader(ctypes.Structure):
+    _fields_ = [
+        ("id", ctypes.c_uint32),
+    ]
+
+class Pipeline(ctypes.Structure):
+    _fields_ = [
+        ("id", ctypes.c_uint32),
+    ]
+
+class Attachments(ctypes.Structure):
+    _fields_ = [
+        ("id", ctypes.c_uint32),
+    ]
+
+class Range(ctypes.Structure):
+    _fields_ = [
+        ("ptr", ctypes.c_void_p),
+        ("size", ctypes.c_size_t),
+    ]
+
+# helper function to create a Range over any object supporting the buffer
+# protocol (bytes, bytearray, memoryview, array.array, NumPy arrays, ctypes
+# objects...) without copying. The Range holds the buffer export of the
+# object until it is garbage collected, so that resizable objects like a
+# bytearray can't be resized or reallocated while the Range points to them
+def as_range(data) -> Range:
+    export = _BufferExport(data)
+    # a void pointer which references the buffer export through ctypes' keep-alive
+    # mechanism, this is also carried over when the Range is copied into a struct
+    ptr = ctypes.cast((ctypes.py_object * 1)(export), ctypes.c_void_p)
+    ptr.value = export.view.buf
+    rng = Range()
+    rng.ptr = ptr
+    rng.size = export.view.len
+    return rng
+
+# argtypes converter for 'const sg_range *' args, accepts a Range or any
+# object supporting the buffer protocol
+class RangeParam:
+    @classmethod
+    def from_param(cls, obj):
+        if not isinstance(obj, Range):
+            obj = as_range(obj)
+        return ctypes.byref(obj)
+
+INVALID_ID = 0
+NUM_INFLIGHT_FRAMES = 2
+MAX_COLOR_ATTACHMENTS = 4
+MAX_UNIFORMBLOCK_MEMBERS = 16
+MAX_VERTEX_ATTRIBUTES = 16
+MAX_MIPMAPS = 16
+MAX_TEXTUREARRAY_LAYERS = 128
+MAX_UNIFORMBLOCK_BINDSLOTS = 8
+MAX_VERTEXBUFFER_BINDSLOTS = 8
+MAX_IMAGE_BINDSLOTS = 16
+MAX_SAMPLER_BINDSLOTS = 16
+MAX_STORAGEBUFFER_BINDSLOTS = 8
+MAX_IMAGE_SAMPLER_PAIRS = 16
+
+class Color(ctypes.Structure):
+    _fields_ = [
+        ("r", ctypes.c_float),
+        ("g", ctypes.c_float),
+        ("b", ctypes.c_float),
+        ("a", ctypes.c_float),
+    ]
+
+class Backend(enum.IntEnum):
+    GLCORE = 0
+    GLES3 = 1
+    D3D11 = 2
+    METAL_IOS = 3
+    METAL_MACOS = 4
+    METAL_SIMULATOR = 5
+    WGPU = 6
+    DUMMY = 7
+
+class PixelFormat(enum.IntEnum):
+    DEFAULT = 0
+    NONE = 1
+    R8 = 2
+    R8SN = 3
+    R8UI = 4
+    R8SI = 5
+    R16 = 6
+    R16SN = 7
+    R16UI = 8
+    R16SI = 9
+    R16F = 10
+    RG8 = 11
+    RG8SN = 12
+    RG8UI = 13
+    RG8SI = 14
+    R32UI = 15
+    R32SI = 16
+    R32F = 17
+    RG16 = 18
+    RG16SN = 19
+    RG16UI = 20
+    RG16SI = 21
+    RG16F = 22
+    RGBA8 = 23
+    SRGB8A8 = 24
+    RGBA8SN = 25
+    RGBA8UI = 26
+    RGBA8SI = 27
+    BGRA8 = 28
+    RGB10A2 = 29
+    RG11B10F = 30
+    RGB9E5 = 31
+    RG32UI = 32
+    RG32SI = 33
+    RG32F = 34
+    RGBA16 = 35
+    RGBA16SN = 36
+    RGBA16UI = 37
+    RGBA16SI = 38
+    RGBA16F = 39
+    RGBA32UI = 40
+    RGBA32SI = 41
+    RGBA32F = 42
+    DEPTH = 43
+    DEPTH_STENCIL = 44
+    BC1_RGBA = 45
+    BC2_RGBA = 46
+    BC3_RGBA = 47
+    BC3_SRGBA = 48
+    BC4_R = 49
+    BC4_RSN = 50
+    BC5_RG = 51
+    BC5_RGSN = 52
+    BC6H_RGBF = 53
+    BC6H_RGBUF = 54
+    BC7_RGBA = 55
+    BC7_SRGBA = 56
+    PVRTC_RGB_2BPP = 57
+    PVRTC_RGB_4BPP = 58
+    PVRTC_RGBA_2BPP = 59
+    PVRTC_RGBA_4BPP = 60
+    ETC2_RGB8 = 61
+    ETC2_SRGB8 = 62
+    ETC2_RGB8A1 = 63
+    ETC2_RGBA8 = 64
+    ETC2_SRGB8A8 = 65
+    EAC_R11 = 66
+    EAC_R11SN = 67
+    EAC_RG11 = 68
+    EAC_RG11SN = 69
+    ASTC_4x4_RGBA = 70
+    ASTC_4x4_SRGBA = 71
+    NUM = 72
+
+class PixelformatInfo(ctypes.Structure):
+    _fields_ = [
+        ("sample", ctypes.c_bool),
+        ("filter", ctypes.c_bool),
+        ("render", ctypes.c_bool),
+        ("blend", ctypes.c_bool),
+        ("msaa", ctypes.c_bool),
+        ("depth", ctypes.c_bool),
+        ("compressed", ctypes.c_bool),
+        ("bytes_per_pixel", ctypes.c_int),
+    ]
+
+class Features(ctypes.Structure):
+    _fields_ = [
+        ("origin_top_left", ctypes.c_bool),
+        ("image_clamp_to_border", ctypes.c_bool),
+        ("mrt_independent_blend_state", ctypes.c_bool),
+        ("mrt_independent_write_mask", ctypes.c_bool),
+        ("storage_buffer", ctypes.c_bool),
+        ("msaa_image_bindings", ctypes.c_bool),
+    ]
+
+class Limits(ctypes.Structure):
+    _fields_ = [
+        ("max_image_size_2d", ctypes.c_int),
+        ("max_image_size_cube", ctypes.c_int),
+        ("max_image_size_3d", ctypes.c_int),
+        ("max_image_size_array", ctypes.c_int),
+        ("max_image_array_layers", ctypes.c_int),
+        ("max_vertex_attrs", ctypes.c_int),
+        ("gl_max_vertex_uniform_components", ctypes.c_int),
+        ("gl_max_combined_texture_image_units", ctypes.c_int),
+    ]
+
+class ResourceState(enum.IntEnum):
+    INITIAL = 0
+    ALLOC = 1
+    VALID = 2
+    FAILED = 3
+    INVALID = 4
+
+class Usage(enum.IntEnum):
+    DEFAULT = 0
+    IMMUTABLE = 1
+    DYNAMIC = 2
+    STREAM = 3
+    NUM = 4
+
+class BufferType(enum.IntEnum):
+    DEFAULT = 0
+    VERTEXBUFFER = 1
+    INDEXBUFFER = 2
+    STORAGEBUFFER = 3
+    NUM = 4
+
+class IndexType(enum.IntEnum):
+    DEFAULT = 0
+    NONE = 1
+    UINT16 = 2
+    UINT32 = 3
+    NUM = 4
+
+class ImageType(enum.IntEnum):
+    DEFAULT = 0
+    _2D = 1
+    CUBE = 2
+    _3D = 3
+    ARRAY = 4
+    NUM = 5
+
+class ImageSampleType(enum.IntEnum):
+    DEFAULT = 0
+    FLOAT = 1
+    DEPTH = 2
+    SINT = 3
+    UINT = 4
+    UNFILTERABLE_FLOAT = 5
+    NUM = 6
+
+class SamplerType(enum.IntEnum):
+    DEFAULT = 0
+    FILTERING = 1
+    NONFILTERING = 2
+    COMPARISON = 3
+    NUM = 4
+
+class CubeFace(enum.IntEnum):
+    POS_X = 0
+    NEG_X = 1
+    POS_Y = 2
+    NEG_Y = 3
+    POS_Z = 4
+    NEG_Z = 5
+    NUM = 6
+
+class PrimitiveType(enum.IntEnum):
+    DEFAULT = 0
+    POINTS = 1
+    LINES = 2
+    LINE_STRIP = 3
+    TRIANGLES = 4
+    TRIANGLE_STRIP = 5
+    NUM = 6
+
+class Filter(enum.IntEnum):
+    DEFAULT = 0
+    NEAREST = 1
+    LINEAR = 2
+    NUM = 3
+
+class Wrap(enum.IntEnum):
+    DEFAULT = 0
+    REPEAT = 1
+    CLAMP_TO_EDGE = 2
+    CLAMP_TO_BORDER = 3
+    MIRRORED_REPEAT = 4
+    NUM = 5
+
+class BorderColor(enum.IntEnum):
+    DEFAULT = 0
+    TRANSPARENT_BLACK = 1
+    OPAQUE_BLACK = 2
+    OPAQUE_WHITE = 3
+    NUM = 4
+
+class VertexFormat(enum.IntEnum):
+    INVALID = 0
+    FLOAT = 1
+    FLOAT2 = 2
+    FLOAT3 = 3
+    FLOAT4 = 4
+    BYTE4 = 5
+    BYTE4N = 6
+    UBYTE4 = 7
+    UBYTE4N = 8
+    SHORT2 = 9
+    SHORT2N = 10
+    USHORT2N = 11
+    SHORT4 = 12
+    SHORT4N = 13
+    USHORT4N = 14
+    UINT10_N2 = 15
+    HALF2 = 16
+    HALF4 = 17
+    NUM = 18
+
+class VertexStep(enum.IntEnum):
+    DEFAULT = 0
+    PER_VERTEX = 1
+    PER_INSTANCE = 2
+    NUM = 3
+
+class UniformType(enum.IntEnum):
+    INVALID = 0
+    FLOAT = 1
+    FLOAT2 = 2
+    FLOAT3 = 3
+    FLOAT4 = 4
+    INT = 5
+    INT2 = 6
+    INT3 = 7
+    INT4 = 8
+    MAT4 = 9
+    NUM = 10
+
+class UniformLayout(enum.IntEnum):
+    DEFAULT = 0
+    NATIVE = 1
+    STD140 = 2
+    NUM = 3
+
+class CullMode(enum.IntEnum):
+    DEFAULT = 0
+    NONE = 1
+    FRONT = 2
+    BACK = 3
+    NUM = 4
+
+class FaceWinding(enum.IntEnum):
+    DEFAULT = 0
+    CCW = 1
+    CW = 2
+    NUM = 3
+
+class CompareFunc(enum.IntEnum):
+    DEFAULT = 0
+    NEVER = 1
+    LESS = 2
+    EQUAL = 3
+    LESS_EQUAL = 4
+    GREATER = 5
+    NOT_EQUAL = 6
+    GREATER_EQUAL = 7
+    ALWAYS = 8
+    NUM = 9
+
+class StencilOp(enum.IntEnum):
+    DEFAULT = 0
+    KEEP = 1
+    ZERO = 2
+    REPLACE = 3
+    INCR_CLAMP = 4
+    DECR_CLAMP = 5
+    INVERT = 6
+    INCR_WRAP = 7
+    DECR_WRAP = 8
+    NUM = 9
+
+class BlendFactor(enum.IntEnum):
+    DEFAULT = 0
+    ZERO = 1
+    ONE = 2
+    SRC_COLOR = 3
+    ONE_MINUS_SRC_COLOR = 4
+    SRC_ALPHA = 5
+    ONE_MINUS_SRC_ALPHA = 6
+    DST_COLOR = 7
+    ONE_MINUS_DST_COLOR = 8
+    DST_ALPHA = 9
+    ONE_MINUS_DST_ALPHA = 10
+    SRC_ALPHA_SATURATED = 11
+    BLEND_COLOR = 12
+    ONE_MINUS_BLEND_COLOR = 13
+    BLEND_ALPHA = 14
+    ONE_MINUS_BLEND_ALPHA = 15
+    NUM = 16
+
+class BlendOp(enum.IntEnum):
+    DEFAULT = 0
+    ADD = 1
+    SUBTRACT = 2
+    REVERSE_SUBTRACT = 3
+    NUM = 4
+
+class ColorMask(enum.IntEnum):
+    DEFAULT = 0
+    NONE = 16
+    R = 1
+    G = 2
+    RG = 3
+    B = 4
+    RB = 5
+    GB = 6
+    RGB = 7
+    A = 8
+    RA = 9
+    GA = 10
+    RGA = 11
+    BA = 12
+    RBA = 13
+    GBA = 14
+    RGBA = 15
+
+class LoadAction(enum.IntEnum):
+    DEFAULT = 0
+    CLEAR = 1
+    LOAD = 2
+    DONTCARE = 3
+
+class StoreAction(enum.IntEnum):
+    DEFAULT = 0
+    STORE = 1
+    DONTCARE = 2
+
+class ColorAttachmentAction(ctypes.Structure):
+    _fields_ = [
+        ("load_action", ctypes.c_int),
+        ("store_action", ctypes.c_int),
+        ("clear_value", Color),
+    ]
+
+class DepthAttachmentAction(ctypes.Structure):
+    _fields_ = [
+        ("load_action", ctypes.c_int),
+        ("store_action", ctypes.c_int),
+        ("clear_value", ctypes.c_float),
+    ]
+
+class StencilAttachmentAction(ctypes.Structure):
+    _fields_ = [
+        ("load_action", ctypes.c_int),
+        ("store_action", ctypes.c_int),
+        ("clear_value", ctypes.c_uint8),
+    ]
+
+class PassAction(ctypes.Structure):
+    _fields_ = [
+        ("colors", (ColorAttachmentAction * 4)),
+        ("depth", DepthAttachmentAction),
+        ("stencil", StencilAttachmentAction),
+    ]
+
+class MetalSwapchain(ctypes.Structure):
+    _fields_ = [
+        ("current_drawable", ctypes.c_void_p),
+        ("depth_stencil_texture", ctypes.c_void_p),
+        ("msaa_color_texture", ctypes.c_void_p),
+    ]
+
+class D3d11Swapchain(ctypes.Structure):
+    _fields_ = [
+        ("render_view", ctypes.c_void_p),
+        ("resolve_view", ctypes.c_void_p),
+        ("depth_stencil_view", ctypes.c_void_p),
+    ]
+
+class WgpuSwapchain(ctypes.Structure):
+    _fields_ = [
+        ("render_view", ctypes.c_void_p),
+        ("resolve_view", ctypes.c_void_p),
+        ("depth_stencil_view", ctypes.c_void_p),
+    ]
+
+class GlSwapchain(ctypes.Structure):
+    _fields_ = [
+        ("framebuffer", ctypes.c_uint32),
+    ]
+
+class Swapchain(ctypes.Structure):
+    _fields_ = [
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("sample_count", ctypes.c_int),
+        ("color_format", ctypes.c_int),
+        ("depth_format", ctypes.c_int),
+        ("metal", MetalSwapchain),
+        ("d3d11", D3d11Swapchain),
+        ("wgpu", WgpuSwapchain),
+        ("gl", GlSwapchain),
+    ]
+
+class Pass(ctypes.Structure):
+    _fields_ = [
+        ("_start_canary", ctypes.c_uint32),
+        ("action", PassAction),
+        ("attachments", Attachments),
+        ("swapchain", Swapchain),
+        ("label", ctypes.c_char_p),
+        ("_end_canary", ctypes.c_uint32),
+    ]
+
+class Bindings(ctypes.Structure):
+    _fields_ = [
+        ("_start_canary", ctypes.c_uint32),
+        ("vertex_buffers", (Buffer * 8)),
+        ("vertex_buffer_offsets", (ctypes.c_int * 8)),
+        ("index_buffer", Buffer),
+        ("index_buffer_offset", ctypes.c_int),
+        ("images", (Image * 16)),
+        ("samplers", (Sampler * 16)),
+        ("storage_buffers", (Buffer * 8)),
+        ("_end_canary", ctypes.c_uint32),
+    ]
+
+class BufferDesc(ctypes.Structure):
+    _fields_ = [
+        ("_start_canary", ctypes.c_uint32),
+        ("size", ctypes.c_size_t),
+        ("type", ctypes.c_int),
+        ("usage", ctypes.c_int),
+        ("data", Range),
+        ("label", ctypes.c_char_p),
+        ("gl_buffers", (ctypes.c_uint32 * 2)),
+        ("mtl_buffers", (ctypes.c_void_p * 2)),
+        ("d3d11_buffer", ctypes.c_void_p),
+        ("wgpu_buffer", ctypes.c_void_p),
+        ("_end_canary", ctypes.c_uint32),
+    ]
+
+class ImageData(ctypes.Structure):
+    _fields_ = [
+        ("subimage", (Range * 16 * 6)),
+    ]
+
+class ImageDesc(ctypes.Structure):
+    _fields_ = [
+        ("_start_canary", ctypes.c_uint32),
+        ("type", ctypes.c_int),
+        ("render_target", ctypes.c_bool),
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("num_slices", ctypes.c_int),
+        ("num_mipmaps", ctypes.c_int),
+        ("usage", ctypes.c_int),
+        ("pixel_format", ctypes.c_int),
+        ("sample_count", ctypes.c_int),
+        ("data", ImageData),
+        ("label", ctypes.c_char_p),
+        ("gl_textures", (ctypes.c_uint32 * 2)),
+        ("gl_texture_target", ctypes.c_uint32),
+        ("mtl_textures", (ctypes.c_void_p * 2)),
+        ("d3d11_texture", ctypes.c_void_p),
+        ("d3d11_shader_resource_view", ctypes.c_void_p),
+        ("wgpu_texture", ctypes.c_void_p),
+        ("wgpu_texture_view", ctypes.c_void_p),
+        ("_end_canary", ctypes.c_uint32),
+    ]
+
+class SamplerDesc(ctypes.Structure):
+    _fields_ = [
+        ("_start_canary", ctypes.c_uint32),
+        ("min_filter", ctypes.c_int),
+        ("mag_filter", ctypes.c_int),
+        ("mipmap_filter", ctypes.c_int),
+        ("wrap_u", ctypes.c_int),
+        ("wrap_v", ctypes.c_int),
+        ("wrap_w", ctypes.c_int),
+        ("min_lod", ctypes.c_float),
+        ("max_lod", ctypes.c_float),
+        ("border_color", ctypes.c_int),
+        ("compare", ctypes.c_int),
+        ("max_anisotropy", ctypes.c_uint32),
+        ("label", ctypes.c_char_p),
+        ("gl_sampler", ctypes.c_uint32),
+        ("mtl_sampler", ctypes.c_void_p),
+        ("d3d11_sampler", ctypes.c_void_p),
+        ("wgpu_sampler", ctypes.c_void_p),
+        ("_end_canary", ctypes.c_uint32),
+    ]
+
+class ShaderStage(enum.IntEnum):
+    NONE = 0
+    VERTEX = 1
+    FRAGMENT = 2
+
+class ShaderFunction(ctypes.Structure):
+    _fields_ = [
+        ("source", ctypes.c_char_p),
+        ("bytecode", Range),
+        ("entry", ctypes.c_char_p),
+        ("d3d11_target", ctypes.c_char_p),
+    ]
+
+class ShaderVertexAttr(ctypes.Structure):
+    _fields_ = [
+        ("glsl_name", ctypes.c_char_p),
+        ("hlsl_sem_name", ctypes.c_char_p),
+        ("hlsl_sem_index", ctypes.c_uint8),
+    ]
+
+class GlslShaderUniform(ctypes.Structure):
+    _fields_ = [
+        ("type", ctypes.c_int),
+        ("array_count", ctypes.c_uint16),
+        ("glsl_name", ctypes.c_char_p),
+    ]
+
+class ShaderUniformBlock(ctypes.Structure):
+    _fields_ = [
+        ("stage", ctypes.c_int),
+        ("size", ctypes.c_uint32),
+        ("hlsl_register_b_n", ctypes.c_uint8),
+        ("msl_buffer_n", ctypes.c_uint8),
+        ("wgsl_group0_binding_n", ctypes.c_uint8),
+        ("layout", ctypes.c_int),
+        ("glsl_uniforms", (GlslShaderUniform * 16)),
+    ]
+
+class ShaderImage(ctypes.Structure):
+    _fields_ = [
+        ("stage", ctypes.c_int),
+        ("image_type", ctypes.c_int),
+        ("sample_type", ctypes.c_int),
+        ("multisampled", ctypes.c_bool),
+        ("hlsl_register_t_n", ctypes.c_uint8),
+        ("msl_texture_n", ctypes.c_uint8),
+        ("wgsl_group1_binding_n", ctypes.c_uint8),
+    ]
+
+class ShaderSampler(ctypes.Structure):
+    _fields_ = [
+        ("stage", ctypes.c_int),
+        ("sampler_type", ctypes.c_int),
+        ("hlsl_register_s_n", ctypes.c_uint8),
+        ("msl_sampler_n", ctypes.c_uint8),
+        ("wgsl_group1_binding_n", ctypes.c_uint8),
+    ]
+
+class ShaderStorageBuffer(ctypes.Structure):
+    _fields_ = [
+        ("stage", ctypes.c_int),
+        ("readonly", ctypes.c_bool),
+        ("hlsl_register_t_n", ctypes.c_uint8),
+        ("msl_buffer_n", ctypes.c_uint8),
+        ("wgsl_group1_binding_n", ctypes.c_uint8),
+        ("glsl_binding_n", ctypes.c_uint8),
+    ]
+
+class ShaderImageSamplerPair(ctypes.Structure):
+    _fields_ = [
+        ("stage", ctypes.c_int),
+        ("image_slot", ctypes.c_uint8),
+        ("sampler_slot", ctypes.c_uint8),
+        ("glsl_name", ctypes.c_char_p),
+    ]
+
+class ShaderDesc(ctypes.Structure):
+    _fields_ = [
+        ("_start_canary", ctypes.c_uint32),
+        ("vertex_func", ShaderFunction),
+        ("fragment_func", ShaderFunction),
+        ("attrs", (ShaderVertexAttr * 16)),
+        ("uniform_blocks", (ShaderUniformBlock * 8)),
+        ("storage_buffers", (ShaderStorageBuffer * 8)),
+        ("images", (ShaderImage * 16)),
+        ("samplers", (ShaderSampler * 16)),
+        ("image_sampler_pairs", (ShaderImageSamplerPair * 16)),
+        ("label", ctypes.c_char_p),
+        ("_end_canary", ctypes.c_uint32),
+    ]
+
+class VertexBufferLayoutState(ctypes.Structure):
+    _fields_ = [
+        ("stride", ctypes.c_int),
+        ("step_func", ctypes.c_int),
+        ("step_rate", ctypes.c_int),
+    ]
+
+class VertexAttrState(ctypes.Structure):
+    _fields_ = [
+        ("buffer_index", ctypes.c_int),
+        ("offset", ctypes.c_int),
+        ("format", ctypes.c_int),
+    ]
+
+class VertexLayoutState(ctypes.Structure):
+    _fields_ = [
+        ("buffers", (VertexBufferLayoutState * 8)),
+        ("attrs", (VertexAttrState * 16)),
+    ]
+
+class StencilFaceState(ctypes.Structure):
+    _fields_ = [
+        ("compare", ctypes.c_int),
+        ("fail_op", ctypes.c_int),
+        ("depth_fail_op", ctypes.c_int),
+        ("pass_op", ctypes.c_int),
+    ]
+
+class StencilState(ctypes.Structure):
+    _fields_ = [
+        ("enabled", ctypes.c_bool),
+        ("front", StencilFaceState),
+        ("back", StencilFaceState),
+        ("read_mask", ctypes.c_uint8),
+        ("write_mask", ctypes.c_uint8),
+        ("ref", ctypes.c_uint8),
+    ]
+
+class DepthState(ctypes.Structure):
+    _fields_ = [
+        ("pixel_format", ctypes.c_int),
+        ("compare", ctypes.c_int),
+        ("write_enabled", ctypes.c_bool),
+        ("bias", ctypes.c_float),
+        ("bias_slope_scale", ctypes.c_float),
+        ("bias_clamp", ctypes.c_float),
+    ]
+
+class BlendState(ctypes.Structure):
+    _fields_ = [
+        ("enabled", ctypes.c_bool),
+        ("src_factor_rgb", ctypes.c_int),
+        ("dst_factor_rgb", ctypes.c_int),
+        ("op_rgb", ctypes.c_int),
+        ("src_factor_alpha", ctypes.c_int),
+        ("dst_factor_alpha", ctypes.c_int),
+        ("op_alpha", ctypes.c_int),
+    ]
+
+class ColorTargetState(ctypes.Structure):
+    _fields_ = [
+        ("pixel_format", ctypes.c_int),
+        ("write_mask", ctypes.c_int),
+        ("blend", BlendState),
+    ]
+
+class PipelineDesc(ctypes.Structure):
+    _fields_ = [
+        ("_start_canary", ctypes.c_uint32),
+        ("shader", Shader),
+        ("layout", VertexLayoutState),
+        ("depth", DepthState),
+        ("stencil", StencilState),
+        ("color_count", ctypes.c_int),
+        ("colors", (ColorTargetState * 4)),
+        ("primitive_type", ctypes.c_int),
+        ("index_type", ctypes.c_int),
+        ("cull_mode", ctypes.c_int),
+        ("face_winding", ctypes.c_int),
+        ("sample_count", ctypes.c_int),
+        ("blend_color", Color),
+        ("alpha_to_coverage_enabled", ctypes.c_bool),
+        ("label", ctypes.c_char_p),
+        ("_end_canary", ctypes.c_uint32),
+    ]
+
+class AttachmentDesc(ctypes.Structure):
+    _fields_ = [
+        ("image", Image),
+        ("mip_level", ctypes.c_int),
+        ("slice", ctypes.c_int),
+    ]
+
+class AttachmentsDesc(ctypes.Structure):
+    _fields_ = [
+        ("_start_canary", ctypes.c_uint32),
+        ("colors", (AttachmentDesc * 4)),
+        ("resolves", (AttachmentDesc * 4)),
+        ("depth_stencil", AttachmentDesc),
+        ("label", ctypes.c_char_p),
+        ("_end_canary", ctypes.c_uint32),
+    ]
+
+class TraceHooks(ctypes.Structure):
+    _fields_ = [
+        ("user_data", ctypes.c_void_p),
+        ("reset_state_cache", ctypes.CFUNCTYPE(None, ctypes.c_void_p)),
+        ("make_buffer", ctypes.CFUNCTYPE(None, ctypes.POINTER(BufferDesc), Buffer, ctypes.c_void_p)),
+        ("make_image", ctypes.CFUNCTYPE(None, ctypes.POINTER(ImageDesc), Image, ctypes.c_void_p)),
+        ("make_sampler", ctypes.CFUNCTYPE(None, ctypes.POINTER(SamplerDesc), Sampler, ctypes.c_void_p)),
+        ("make_shader", ctypes.CFUNCTYPE(None, ctypes.POINTER(ShaderDesc), Shader, ctypes.c_void_p)),
+        ("make_pipeline", ctypes.CFUNCTYPE(None, ctypes.POINTER(PipelineDesc), Pipeline, ctypes.c_void_p)),
+        ("make_attachments", ctypes.CFUNCTYPE(None, ctypes.POINTER(AttachmentsDesc), Attachments, ctypes.c_void_p)),
+        ("destroy_buffer", ctypes.CFUNCTYPE(None, Buffer, ctypes.c_void_p)),
+        ("destroy_image", ctypes.CFUNCTYPE(None, Image, ctypes.c_void_p)),
+        ("destroy_sampler", ctypes.CFUNCTYPE(None, Sampler, ctypes.c_void_p)),
+        ("destroy_shader", ctypes.CFUNCTYPE(None, Shader, ctypes.c_void_p)),
+        ("destroy_pipeline", ctypes.CFUNCTYPE(None, Pipeline, ctypes.c_void_p)),
+        ("destroy_attachments", ctypes.CFUNCTYPE(None, Attachments, ctypes.c_void_p)),
+        ("update_buffer", ctypes.CFUNCTYPE(None, Buffer, ctypes.POINTER(Range), ctypes.c_void_p)),
+        ("update_image", ctypes.CFUNCTYPE(None, Image, ctypes.POINTER(ImageData), ctypes.c_void_p)),
+        ("append_buffer", ctypes.CFUNCTYPE(None, Buffer, ctypes.POINTER(Range), ctypes.c_int, ctypes.c_void_p)),
+        ("begin_pass", ctypes.CFUNCTYPE(None, ctypes.POINTER(Pass), ctypes.c_void_p)),
+        ("apply_viewport", ctypes.CFUNCTYPE(None, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_bool, ctypes.c_void_p)),
+        ("apply_scissor_rect", ctypes.CFUNCTYPE(None, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_bool, ctypes.c_void_p)),
+        ("apply_pipeline", ctypes.CFUNCTYPE(None, Pipeline, ctypes.c_void_p)),
+        ("apply_bindings", ctypes.CFUNCTYPE(None, ctypes.POINTER(Bindings), ctypes.c_void_p)),
+        ("apply_uniforms", ctypes.CFUNCTYPE(None, ctypes.c_int, ctypes.POINTER(Range), ctypes.c_void_p)),
+        ("draw", ctypes.CFUNCTYPE(None, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_void_p)),
+        ("end_pass", ctypes.CFUNCTYPE(None, ctypes.c_void_p)),
+        ("commit", ctypes.CFUNCTYPE(None, ctypes.c_void_p)),
+        ("alloc_buffer", ctypes.CFUNCTYPE(None, Buffer, ctypes.c_void_p)),
+        ("alloc_image", ctypes.CFUNCTYPE(None, Image, ctypes.c_void_p)),
+        ("alloc_sampler", ctypes.CFUNCTYPE(None, Sampler, ctypes.c_void_p)),
+        ("alloc_shader", ctypes.CFUNCTYPE(None, Shader, ctypes.c_void_p)),
+        ("alloc_pipeline", ctypes.CFUNCTYPE(None, Pipeline, ctypes.c_void_p)),
+        ("alloc_attachments", ctypes.CFUNCTYPE(None, Attachments, ctypes.c_void_p)),
+        ("dealloc_buffer", ctypes.CFUNCTYPE(None, Buffer, ctypes.c_void_p)),
+        ("dealloc_image", ctypes.CFUNCTYPE(None, Image, ctypes.c_void_p)),
+        ("dealloc_sampler", ctypes.CFUNCTYPE(None, Sampler, ctypes.c_void_p)),
+        ("dealloc_shader", ctypes.CFUNCTYPE(None, Shader, ctypes.c_void_p)),
+        ("dealloc_pipeline", ctypes.CFUNCTYPE(None, Pipeline, ctypes.c_void_p)),
+        ("dealloc_attachments", ctypes.CFUNCTYPE(None, Attachments, ctypes.c_void_p)),
+        ("init_buffer", ctypes.CFUNCTYPE(None, Buffer, ctypes.POINTER(BufferDesc), ctypes.c_void_p)),
+        ("init_image", ctypes.CFUNCTYPE(None, Image, ctypes.POINTER(ImageDesc), ctypes.c_void_p)),
+        ("init_sampler", ctypes.CFUNCTYPE(None, Sampler, ctypes.POINTER(SamplerDesc), ctypes.c_void_p)),
+        ("init_shader", ctypes.CFUNCTYPE(None, Shader, ctypes.POINTER(ShaderDesc), ctypes.c_void_p)),
+        ("init_pipeline", ctypes.CFUNCTYPE(None, Pipeline, ctypes.POINTER(PipelineDesc), ctypes.c_void_p)),
+        ("init_attachments", ctypes.CFUNCTYPE(None, Attachments, ctypes.POINTER(AttachmentsDesc), ctypes.c_void_p)),
+        ("uninit_buffer", ctypes.CFUNCTYPE(None, Buffer, ctypes.c_void_p)),
+        ("uninit_image", ctypes.CFUNCTYPE(None, Image, ctypes.c_void_p)),
+        ("uninit_sampler", ctypes.CFUNCTYPE(None, Sampler, ctypes.c_void_p)),
+        ("uninit_shader", ctypes.CFUNCTYPE(None, Shader, ctypes.c_void_p)),
+        ("uninit_pipeline", ctypes.CFUNCTYPE(None, Pipeline, ctypes.c_void_p)),
+        ("uninit_attachments", ctypes.CFUNCTYPE(None, Attachments, ctypes.c_void_p)),
+        ("fail_buffer", ctypes.CFUNCTYPE(None, Buffer, ctypes.c_void_p)),
+        ("fail_image", ctypes.CFUNCTYPE(None, Image, ctypes.c_void_p)),
+        ("fail_sampler", ctypes.CFUNCTYPE(None, Sampler, ctypes.c_void_p)),
+        ("fail_shader", ctypes.CFUNCTYPE(None, Shader, ctypes.c_void_p)),
+        ("fail_pipeline", ctypes.CFUNCTYPE(None, Pipeline, ctypes.c_void_p)),
+        ("fail_attachments", ctypes.CFUNCTYPE(None, Attachments, ctypes.c_void_p)),
+        ("push_debug_group", ctypes.CFUNCTYPE(None, ctypes.c_char_p, ctypes.c_void_p)),
+        ("pop_debug_group", ctypes.CFUNCTYPE(None, ctypes.c_void_p)),
+    ]
+
+class SlotInfo(ctypes.Structure):
+    _fields_ = [
+        ("state", ctypes.c_int),
+        ("res_id", ctypes.c_uint32),
+    ]
+
+class BufferInfo(ctypes.Structure):
+    _fields_ = [
+        ("slot", SlotInfo),
+        ("update_frame_index", ctypes.c_uint32),
+        ("append_frame_index", ctypes.c_uint32),
+        ("append_pos", ctypes.c_int),
+        ("append_overflow", ctypes.c_bool),
+        ("num_slots", ctypes.c_int),
+        ("active_slot", ctypes.c_int),
+    ]
+
+class ImageInfo(ctypes.Structure):
+    _fields_ = [
+        ("slot", SlotInfo),
+        ("upd_frame_index", ctypes.c_uint32),
+        ("num_slots", ctypes.c_int),
+        ("active_slot", ctypes.c_int),
+    ]
+
+class SamplerInfo(ctypes.Structure):
+    _fields_ = [
+        ("slot", SlotInfo),
+    ]
+
+class ShaderInfo(ctypes.Structure):
+    _fields_ = [
+        ("slot", SlotInfo),
+    ]
+
+class PipelineInfo(ctypes.Structure):
+    _fields_ = [
+        ("slot", SlotInfo),
+    ]
+
+class AttachmentsInfo(ctypes.Structure):
+    _fields_ = [
+        ("slot", SlotInfo),
+    ]
+
+class FrameStatsGl(ctypes.Structure):
+    _fields_ = [
+        ("num_bind_buffer", ctypes.c_uint32),
+        ("num_active_texture", ctypes.c_uint32),
+        ("num_bind_texture", ctypes.c_uint32),
+        ("num_bind_sampler", ctypes.c_uint32),
+        ("num_use_program", ctypes.c_uint32),
+        ("num_render_state", ctypes.c_uint32),
+        ("num_vertex_attrib_pointer", ctypes.c_uint32),
+        ("num_vertex_attrib_divisor", ctypes.c_uint32),
+        ("num_enable_vertex_attrib_array", ctypes.c_uint32),
+        ("num_disable_vertex_attrib_array", ctypes.c_uint32),
+        ("num_uniform", ctypes.c_uint32),
+    ]
+
+class FrameStatsD3d11Pass(ctypes.Structure):
+    _fields_ = [
+        ("num_om_set_render_targets", ctypes.c_uint32),
+        ("num_clear_render_target_view", ctypes.c_uint32),
+        ("num_clear_depth_stencil_view", ctypes.c_uint32),
+        ("num_resolve_subresource", ctypes.c_uint32),
+    ]
+
+class FrameStatsD3d11Pipeline(ctypes.Structure):
+    _fields_ = [
+        ("num_rs_set_state", ctypes.c_uint32),
+        ("num_om_set_depth_stencil_state", ctypes.c_uint32),
+        ("num_om_set_blend_state", ctypes.c_uint32),
+        ("num_ia_set_primitive_topology", ctypes.c_uint32),
+        ("num_ia_set_input_layout", ctypes.c_uint32),
+        ("num_vs_set_shader", ctypes.c_uint32),
+        ("num_vs_set_constant_buffers", ctypes.c_uint32),
+        ("num_ps_set_shader", ctypes.c_uint32),
+        ("num_ps_set_constant_buffers", ctypes.c_uint32),
+    ]
+
+class FrameStatsD3d11Bindings(ctypes.Structure):
+    _fields_ = [
+        ("num_ia_set_vertex_buffers", ctypes.c_uint32),
+        ("num_ia_set_index_buffer", ctypes.c_uint32),
+        ("num_vs_set_shader_resources", ctypes.c_uint32),
+        ("num_ps_set_shader_resources", ctypes.c_uint32),
+        ("num_vs_set_samplers", ctypes.c_uint32),
+        ("num_ps_set_samplers", ctypes.c_uint32),
+    ]
+
+class FrameStatsD3d11Uniforms(ctypes.Structure):
+    _fields_ = [
+        ("num_update_subresource", ctypes.c_uint32),
+    ]
+
+class FrameStatsD3d11Draw(ctypes.Structure):
+    _fields_ = [
+        ("num_draw_indexed_instanced", ctypes.c_uint32),
+        ("num_draw_indexed", ctypes.c_uint32),
+        ("num_draw_instanced", ctypes.c_uint32),
+        ("num_draw", ctypes.c_uint32),
+    ]
+
+class FrameStatsD3d11(ctypes.Structure):
+    _fields_ = [
+        ("pass_", FrameStatsD3d11Pass),
+        ("pipeline", FrameStatsD3d11Pipeline),
+        ("bindings", FrameStatsD3d11Bindings),
+        ("uniforms", FrameStatsD3d11Uniforms),
+        ("draw", FrameStatsD3d11Draw),
+        ("num_map", ctypes.c_uint32),
+        ("num_unmap", ctypes.c_uint32),
+    ]
+
+class FrameStatsMetalIdpool(ctypes.Structure):
+    _fields_ = [
+        ("num_added", ctypes.c_uint32),
+        ("num_released", ctypes.c_uint32),
+        ("num_garbage_collected", ctypes.c_uint32),
+    ]
+
+class FrameStatsMetalPipeline(ctypes.Structure):
+    _fields_ = [
+        ("num_set_blend_color", ctypes.c_uint32),
+        ("num_set_cull_mode", ctypes.c_uint32),
+        ("num_set_front_facing_winding", ctypes.c_uint32),
+        ("num_set_stencil_reference_value", ctypes.c_uint32),
+        ("num_set_depth_bias", ctypes.c_uint32),
+        ("num_set_render_pipeline_state", ctypes.c_uint32),
+        ("num_set_depth_stencil_state", ctypes.c_uint32),
+    ]
+
+class FrameStatsMetalBindings(ctypes.Structure):
+    _fields_ = [
+        ("num_set_vertex_buffer", ctypes.c_uint32),
+        ("num_set_vertex_texture", ctypes.c_uint32),
+        ("num_set_vertex_sampler_state", ctypes.c_uint32),
+        ("num_set_fragment_buffer", ctypes.c_uint32),
+        ("num_set_fragment_texture", ctypes.c_uint32),
+        ("num_set_fragment_sampler_state", ctypes.c_uint32),
+    ]
+
+class FrameStatsMetalUniforms(ctypes.Structure):
+    _fields_ = [
+        ("num_set_vertex_buffer_offset", ctypes.c_uint32),
+        ("num_set_fragment_buffer_offset", ctypes.c_uint32),
+    ]
+
+class FrameStatsMetal(ctypes.Structure):
+    _fields_ = [
+        ("idpool", FrameStatsMetalIdpool),
+        ("pipeline", FrameStatsMetalPipeline),
+        ("bindings", FrameStatsMetalBindings),
+        ("uniforms", FrameStatsMetalUniforms),
+    ]
+
+class FrameStatsWgpuUniforms(ctypes.Structure):
+    _fields_ = [
+        ("num_set_bindgroup", ctypes.c_uint32),
+        ("size_write_buffer", ctypes.c_uint32),
+    ]
+
+class FrameStatsWgpuBindings(ctypes.Structure):
+    _fields_ = [
+        ("num_set_vertex_buffer", ctypes.c_uint32),
+        ("num_skip_redundant_vertex_buffer", ctypes.c_uint32),
+        ("num_set_index_buffer", ctypes.c_uint32),
+        ("num_skip_redundant_index_buffer", ctypes.c_uint32),
+        ("num_create_bindgroup", ctypes.c_uint32),
+        ("num_discard_bindgroup", ctypes.c_uint32),
+        ("num_set_bindgroup", ctypes.c_uint32),
+        ("num_skip_redundant_bindgroup", ctypes.c_uint32),
+        ("num_bindgroup_cache_hits", ctypes.c_uint32),
+        ("num_bindgroup_cache_misses", ctypes.c_uint32),
+        ("num_bindgroup_cache_collisions", ctypes.c_uint32),
+        ("num_bindgroup_cache_invalidates", ctypes.c_uint32),
+        ("num_bindgroup_cache_hash_vs_key_mismatch", ctypes.c_uint32),
+    ]
+
+class FrameStatsWgpu(ctypes.Structure):
+    _fields_ = [
+        ("uniforms", FrameStatsWgpuUniforms),
+        ("bindings", FrameStatsWgpuBindings),
+    ]
+
+class FrameStats(ctypes.Structure):
+    _fields_ = [
+        ("frame_index", ctypes.c_uint32),
+        ("num_passes", ctypes.c_uint32),
+        ("num_apply_viewport", ctypes.c_uint32),
+        ("num_apply_scissor_rect", ctypes.c_uint32),
+        ("num_apply_pipeline", ctypes.c_uint32),
+        ("num_apply_bindings", ctypes.c_uint32),
+        ("num_apply_uniforms", ctypes.c_uint32),
+        ("num_draw", ctypes.c_uint32),
+        ("num_update_buffer", ctypes.c_uint32),
+        ("num_append_buffer", ctypes.c_uint32),
+        ("num_update_image", ctypes.c_uint32),
+        ("size_apply_uniforms", ctypes.c_uint32),
+        ("size_update_buffer", ctypes.c_uint32),
+        ("size_append_buffer", ctypes.c_uint32),
+        ("size_update_image", ctypes.c_uint32),
+        ("gl", FrameStatsGl),
+        ("d3d11", FrameStatsD3d11),
+        ("metal", FrameStatsMetal),
+        ("wgpu", FrameStatsWgpu),
+    ]
+
+class LogItem(enum.IntEnum):
+    OK = 0
+    MALLOC_FAILED = 1
+    GL_TEXTURE_FORMAT_NOT_SUPPORTED = 2
+    GL_3D_TEXTURES_NOT_SUPPORTED = 3
+    GL_ARRAY_TEXTURES_NOT_SUPPORTED = 4
+    GL_SHADER_COMPILATION_FAILED = 5
+    GL_SHADER_LINKING_FAILED = 6
+    GL_VERTEX_ATTRIBUTE_NOT_FOUND_IN_SHADER = 7
+    GL_IMAGE_SAMPLER_NAME_NOT_FOUND_IN_SHADER = 8
+    GL_FRAMEBUFFER_STATUS_UNDEFINED = 9
+    GL_FRAMEBUFFER_STATUS_INCOMPLETE_ATTACHMENT = 10
+    GL_FRAMEBUFFER_STATUS_INCOMPLETE_MISSING_ATTACHMENT = 11
+    GL_FRAMEBUFFER_STATUS_UNSUPPORTED = 12
+    GL_FRAMEBUFFER_STATUS_INCOMPLETE_MULTISAMPLE = 13
+    GL_FRAMEBUFFER_STATUS_UNKNOWN = 14
+    D3D11_CREATE_BUFFER_FAILED = 15
+    D3D11_CREATE_BUFFER_SRV_FAILED = 16
+    D3D11_CREATE_DEPTH_TEXTURE_UNSUPPORTED_PIXEL_FORMAT = 17
+    D3D11_CREATE_DEPTH_TEXTURE_FAILED = 18
+    D3D11_CREATE_2D_TEXTURE_UNSUPPORTED_PIXEL_FORMAT = 19
+    D3D11_CREATE_2D_TEXTURE_FAILED = 20
+    D3D11_CREATE_2D_SRV_FAILED = 21
+    D3D11_CREATE_3D_TEXTURE_UNSUPPORTED_PIXEL_FORMAT = 22
+    D3D11_CREATE_3D_TEXTURE_FAILED = 23
+    D3D11_CREATE_3D_SRV_FAILED = 24
+    D3D11_CREATE_MSAA_TEXTURE_FAILED = 25
+    D3D11_CREATE_SAMPLER_STATE_FAILED = 26
+    D3D11_LOAD_D3DCOMPILER_47_DLL_FAILED = 27
+    D3D11_SHADER_COMPILATION_FAILED = 28
+    D3D11_SHADER_COMPILATION_OUTPUT = 29
+    D3D11_CREATE_CONSTANT_BUFFER_FAILED = 30
+    D3D11_CREATE_INPUT_LAYOUT_FAILED = 31
+    D3D11_CREATE_RASTERIZER_STATE_FAILED = 32
+    D3D11_CREATE_DEPTH_STENCIL_STATE_FAILED = 33
+    D3D11_CREATE_BLEND_STATE_FAILED = 34
+    D3D11_CREATE_RTV_FAILED = 35
+    D3D11_CREATE_DSV_FAILED = 36
+    D3D11_MAP_FOR_UPDATE_BUFFER_FAILED = 37
+    D3D11_MAP_FOR_APPEND_BUFFER_FAILED = 38
+    D3D11_MAP_FOR_UPDATE_IMAGE_FAILED = 39
+    METAL_CREATE_BUFFER_FAILED = 40
+    METAL_TEXTURE_FORMAT_NOT_SUPPORTED = 41
+    METAL_CREATE_TEXTURE_FAILED = 42
+    METAL_CREATE_SAMPLER_FAILED = 43
+    METAL_SHADER_COMPILATION_FAILED = 44
+    METAL_SHADER_CREATION_FAILED = 45
+    METAL_SHADER_COMPILATION_OUTPUT = 46
+    METAL_SHADER_ENTRY_NOT_FOUND = 47
+    METAL_CREATE_RPS_FAILED = 48
+    METAL_CREATE_RPS_OUTPUT = 49
+    METAL_CREATE_DSS_FAILED = 50
+    WGPU_BINDGROUPS_POOL_EXHAUSTED = 51
+    WGPU_BINDGROUPSCACHE_SIZE_GREATER_ONE = 52
+    WGPU_BINDGROUPSCACHE_SIZE_POW2 = 53
+    WGPU_CREATEBINDGROUP_FAILED = 54
+    WGPU_CREATE_BUFFER_FAILED = 55
+    WGPU_CREATE_TEXTURE_FAILED = 56
+    WGPU_CREATE_TEXTURE_VIEW_FAILED = 57
+    WGPU_CREATE_SAMPLER_FAILED = 58
+    WGPU_CREATE_SHADER_MODULE_FAILED = 59
+    WGPU_SHADER_CREATE_BINDGROUP_LAYOUT_FAILED = 60
+    WGPU_CREATE_PIPELINE_LAYOUT_FAILED = 61
+    WGPU_CREATE_RENDER_PIPELINE_FAILED = 62
+    WGPU_ATTACHMENTS_CREATE_TEXTURE_VIEW_FAILED = 63
+    DRAW_REQUIRED_BINDINGS_OR_UNIFORMS_MISSING = 64
+    IDENTICAL_COMMIT_LISTENER = 65
+    COMMIT_LISTENER_ARRAY_FULL = 66
+    TRACE_HOOKS_NOT_ENABLED = 67
+    DEALLOC_BUFFER_INVALID_STATE = 68
+    DEALLOC_IMAGE_INVALID_STATE = 69
+    DEALLOC_SAMPLER_INVALID_STATE = 70
+    DEALLOC_SHADER_INVALID_STATE = 71
+    DEALLOC_PIPELINE_INVALID_STATE = 72
+    DEALLOC_ATTACHMENTS_INVALID_STATE = 73
+    INIT_BUFFER_INVALID_STATE = 74
+    INIT_IMAGE_INVALID_STATE = 75
+    INIT_SAMPLER_INVALID_STATE = 76
+    INIT_SHADER_INVALID_STATE = 77
+    INIT_PIPELINE_INVALID_STATE = 78
+    INIT_ATTACHMENTS_INVALID_STATE = 79
+    UNINIT_BUFFER_INVALID_STATE = 80
+    UNINIT_IMAGE_INVALID_STATE = 81
+    UNINIT_SAMPLER_INVALID_STATE = 82
+    UNINIT_SHADER_INVALID_STATE = 83
+    UNINIT_PIPELINE_INVALID_STATE = 84
+    UNINIT_ATTACHMENTS_INVALID_STATE = 85
+    FAIL_BUFFER_INVALID_STATE = 86
+    FAIL_IMAGE_INVALID_STATE = 87
+    FAIL_SAMPLER_INVALID_STATE = 88
+    FAIL_SHADER_INVALID_STATE = 89
+    FAIL_PIPELINE_INVALID_STATE = 90
+    FAIL_ATTACHMENTS_INVALID_STATE = 91
+    BUFFER_POOL_EXHAUSTED = 92
+    IMAGE_POOL_EXHAUSTED = 93
+    SAMPLER_POOL_EXHAUSTED = 94
+    SHADER_POOL_EXHAUSTED = 95
+    PIPELINE_POOL_EXHAUSTED = 96
+    PASS_POOL_EXHAUSTED = 97
+    BEGINPASS_ATTACHMENT_INVALID = 98
+    DRAW_WITHOUT_BINDINGS = 99
+    VALIDATE_BUFFERDESC_CANARY = 100
+    VALIDATE_BUFFERDESC_SIZE = 101
+    VALIDATE_BUFFERDESC_DATA = 102
+    VALIDATE_BUFFERDESC_DATA_SIZE = 103
+    VALIDATE_BUFFERDESC_NO_DATA = 104
+    VALIDATE_BUFFERDESC_STORAGEBUFFER_SUPPORTED = 105
+    VALIDATE_BUFFERDESC_STORAGEBUFFER_SIZE_MULTIPLE_4 = 106
+    VALIDATE_IMAGEDATA_NODATA = 107
+    VALIDATE_IMAGEDATA_DATA_SIZE = 108
+    VALIDATE_IMAGEDESC_CANARY = 109
+    VALIDATE_IMAGEDESC_WIDTH = 110
+    VALIDATE_IMAGEDESC_HEIGHT = 111
+    VALIDATE_IMAGEDESC_RT_PIXELFORMAT = 112
+    VALIDATE_IMAGEDESC_NONRT_PIXELFORMAT = 113
+    VALIDATE_IMAGEDESC_MSAA_BUT_NO_RT = 114
+    VALIDATE_IMAGEDESC_NO_MSAA_RT_SUPPORT = 115
+    VALIDATE_IMAGEDESC_MSAA_NUM_MIPMAPS = 116
+    VALIDATE_IMAGEDESC_MSAA_3D_IMAGE = 117
+    VALIDATE_IMAGEDESC_MSAA_CUBE_IMAGE = 118
+    VALIDATE_IMAGEDESC_DEPTH_3D_IMAGE = 119
+    VALIDATE_IMAGEDESC_RT_IMMUTABLE = 120
+    VALIDATE_IMAGEDESC_RT_NO_DATA = 121
+    VALIDATE_IMAGEDESC_INJECTED_NO_DATA = 122
+    VALIDATE_IMAGEDESC_DYNAMIC_NO_DATA = 123
+    VALIDATE_IMAGEDESC_COMPRESSED_IMMUTABLE = 124
+    VALIDATE_SAMPLERDESC_CANARY = 125
+    VALIDATE_SAMPLERDESC_ANISTROPIC_REQUIRES_LINEAR_FILTERING = 126
+    VALIDATE_SHADERDESC_CANARY = 127
+    VALIDATE_SHADERDESC_SOURCE = 128
+    VALIDATE_SHADERDESC_BYTECODE = 129
+    VALIDATE_SHADERDESC_SOURCE_OR_BYTECODE = 130
+    VALIDATE_SHADERDESC_NO_BYTECODE_SIZE = 131
+    VALIDATE_SHADERDESC_NO_CONT_UB_MEMBERS = 132
+    VALIDATE_SHADERDESC_UB_SIZE_IS_ZERO = 133
+    VALIDATE_SHADERDESC_UB_METAL_BUFFER_SLOT_OUT_OF_RANGE = 134
+    VALIDATE_SHADERDESC_UB_METAL_BUFFER_SLOT_COLLISION = 135
+    VALIDATE_SHADERDESC_UB_HLSL_REGISTER_B_OUT_OF_RANGE = 136
+    VALIDATE_SHADERDESC_UB_HLSL_REGISTER_B_COLLISION = 137
+    VALIDATE_SHADERDESC_UB_WGSL_GROUP0_BINDING_OUT_OF_RANGE = 138
+    VALIDATE_SHADERDESC_UB_WGSL_GROUP0_BINDING_COLLISION = 139
+    VALIDATE_SHADERDESC_NO_UB_MEMBERS = 140
+    VALIDATE_SHADERDESC_UB_UNIFORM_GLSL_NAME = 141
+    VALIDATE_SHADERDESC_UB_SIZE_MISMATCH = 142
+    VALIDATE_SHADERDESC_UB_ARRAY_COUNT = 143
+    VALIDATE_SHADERDESC_UB_STD140_ARRAY_TYPE = 144
+    VALIDATE_SHADERDESC_STORAGEBUFFER_METAL_BUFFER_SLOT_OUT_OF_RANGE = 145
+    VALIDATE_SHADERDESC_STORAGEBUFFER_METAL_BUFFER_SLOT_COLLISION = 146
+    VALIDATE_SHADERDESC_STORAGEBUFFER_HLSL_REGISTER_T_OUT_OF_RANGE = 147
+    VALIDATE_SHADERDESC_STORAGEBUFFER_HLSL_REGISTER_T_COLLISION = 148
+    VALIDATE_SHADERDESC_STORAGEBUFFER_GLSL_BINDING_OUT_OF_RANGE = 149
+    VALIDATE_SHADERDESC_STORAGEBUFFER_GLSL_BINDING_COLLISION = 150
+    VALIDATE_SHADERDESC_STORAGEBUFFER_WGSL_GROUP1_BINDING_OUT_OF_RANGE = 151
+    VALIDATE_SHADERDESC_STORAGEBUFFER_WGSL_GROUP1_BINDING_COLLISION = 152
+    VALIDATE_SHADERDESC_STORAGEBUFFER_READONLY = 153
+    VALIDATE_SHADERDESC_IMAGE_METAL_TEXTURE_SLOT_OUT_OF_RANGE = 154
+    VALIDATE_SHADERDESC_IMAGE_METAL_TEXTURE_SLOT_COLLISION = 155
+    VALIDATE_SHADERDESC_IMAGE_HLSL_REGISTER_T_OUT_OF_RANGE = 156
+    VALIDATE_SHADERDESC_IMAGE_HLSL_REGISTER_T_COLLISION = 157
+    VALIDATE_SHADERDESC_IMAGE_WGSL_GROUP1_BINDING_OUT_OF_RANGE = 158
+    VALIDATE_SHADERDESC_IMAGE_WGSL_GROUP1_BINDING_COLLISION = 159
+    VALIDATE_SHADERDESC_SAMPLER_METAL_SAMPLER_SLOT_OUT_OF_RANGE = 160
+    VALIDATE_SHADERDESC_SAMPLER_METAL_SAMPLER_SLOT_COLLISION = 161
+    VALIDATE_SHADERDESC_SAMPLER_HLSL_REGISTER_S_OUT_OF_RANGE = 162
+    VALIDATE_SHADERDESC_SAMPLER_HLSL_REGISTER_S_COLLISION = 163
+    VALIDATE_SHADERDESC_SAMPLER_WGSL_GROUP1_BINDING_OUT_OF_RANGE = 164
+    VALIDATE_SHADERDESC_SAMPLER_WGSL_GROUP1_BINDING_COLLISION = 165
+    VALIDATE_SHADERDESC_IMAGE_SAMPLER_PAIR_IMAGE_SLOT_OUT_OF_RANGE = 166
+    VALIDATE_SHADERDESC_IMAGE_SAMPLER_PAIR_SAMPLER_SLOT_OUT_OF_RANGE = 167
+    VALIDATE_SHADERDESC_IMAGE_SAMPLER_PAIR_IMAGE_STAGE_MISMATCH = 168
+    VALIDATE_SHADERDESC_IMAGE_SAMPLER_PAIR_SAMPLER_STAGE_MISMATCH = 169
+    VALIDATE_SHADERDESC_IMAGE_SAMPLER_PAIR_GLSL_NAME = 170
+    VALIDATE_SHADERDESC_NONFILTERING_SAMPLER_REQUIRED = 171
+    VALIDATE_SHADERDESC_COMPARISON_SAMPLER_REQUIRED = 172
+    VALIDATE_SHADERDESC_IMAGE_NOT_REFERENCED_BY_IMAGE_SAMPLER_PAIRS = 173
+    VALIDATE_SHADERDESC_SAMPLER_NOT_REFERENCED_BY_IMAGE_SAMPLER_PAIRS = 174
+    VALIDATE_SHADERDESC_ATTR_STRING_TOO_LONG = 175
+    VALIDATE_PIPELINEDESC_CANARY = 176
+    VALIDATE_PIPELINEDESC_SHADER = 177
+    VALIDATE_PIPELINEDESC_NO_CONT_ATTRS = 178
+    VALIDATE_PIPELINEDESC_LAYOUT_STRIDE4 = 179
+    VALIDATE_PIPELINEDESC_ATTR_SEMANTICS = 180
+    VALIDATE_ATTACHMENTSDESC_CANARY = 181
+    VALIDATE_ATTACHMENTSDESC_NO_ATTACHMENTS = 182
+    VALIDATE_ATTACHMENTSDESC_NO_CONT_COLOR_ATTS = 183
+    VALIDATE_ATTACHMENTSDESC_IMAGE = 184
+    VALIDATE_ATTACHMENTSDESC_MIPLEVEL = 185
+    VALIDATE_ATTACHMENTSDESC_FACE = 186
+    VALIDATE_ATTACHMENTSDESC_LAYER = 187
+    VALIDATE_ATTACHMENTSDESC_SLICE = 188
+    VALIDATE_ATTACHMENTSDESC_IMAGE_NO_RT = 189
+    VALIDATE_ATTACHMENTSDESC_COLOR_INV_PIXELFORMAT = 190
+    VALIDATE_ATTACHMENTSDESC_DEPTH_INV_PIXELFORMAT = 191
+    VALIDATE_ATTACHMENTSDESC_IMAGE_SIZES = 192
+    VALIDATE_ATTACHMENTSDESC_IMAGE_SAMPLE_COUNTS = 193
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_COLOR_IMAGE_MSAA = 194
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_IMAGE = 195
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_SAMPLE_COUNT = 196
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_MIPLEVEL = 197
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_FACE = 198
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_LAYER = 199
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_SLICE = 200
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_IMAGE_NO_RT = 201
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_IMAGE_SIZES = 202
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_IMAGE_FORMAT = 203
+    VALIDATE_ATTACHMENTSDESC_DEPTH_IMAGE = 204
+    VALIDATE_ATTACHMENTSDESC_DEPTH_MIPLEVEL = 205
+    VALIDATE_ATTACHMENTSDESC_DEPTH_FACE = 206
+    VALIDATE_ATTACHMENTSDESC_DEPTH_LAYER = 207
+    VALIDATE_ATTACHMENTSDESC_DEPTH_SLICE = 208
+    VALIDATE_ATTACHMENTSDESC_DEPTH_IMAGE_NO_RT = 209
+    VALIDATE_ATTACHMENTSDESC_DEPTH_IMAGE_SIZES = 210
+    VALIDATE_ATTACHMENTSDESC_DEPTH_IMAGE_SAMPLE_COUNT = 211
+    VALIDATE_BEGINPASS_CANARY = 212
+    VALIDATE_BEGINPASS_ATTACHMENTS_EXISTS = 213
+    VALIDATE_BEGINPASS_ATTACHMENTS_VALID = 214
+    VALIDATE_BEGINPASS_COLOR_ATTACHMENT_IMAGE = 215
+    VALIDATE_BEGINPASS_RESOLVE_ATTACHMENT_IMAGE = 216
+    VALIDATE_BEGINPASS_DEPTHSTENCIL_ATTACHMENT_IMAGE = 217
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_WIDTH = 218
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_WIDTH_NOTSET = 219
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_HEIGHT = 220
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_HEIGHT_NOTSET = 221
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_SAMPLECOUNT = 222
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_SAMPLECOUNT_NOTSET = 223
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_COLORFORMAT = 224
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_COLORFORMAT_NOTSET = 225
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_DEPTHFORMAT_NOTSET = 226
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_CURRENTDRAWABLE = 227
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_CURRENTDRAWABLE_NOTSET = 228
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_DEPTHSTENCILTEXTURE = 229
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_DEPTHSTENCILTEXTURE_NOTSET = 230
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_MSAACOLORTEXTURE = 231
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_MSAACOLORTEXTURE_NOTSET = 232
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_RENDERVIEW = 233
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_RENDERVIEW_NOTSET = 234
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_RESOLVEVIEW = 235
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_RESOLVEVIEW_NOTSET = 236
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_DEPTHSTENCILVIEW = 237
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_DEPTHSTENCILVIEW_NOTSET = 238
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_RENDERVIEW = 239
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_RENDERVIEW_NOTSET = 240
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_RESOLVEVIEW = 241
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_RESOLVEVIEW_NOTSET = 242
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_DEPTHSTENCILVIEW = 243
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_DEPTHSTENCILVIEW_NOTSET = 244
+    VALIDATE_BEGINPASS_SWAPCHAIN_GL_EXPECT_FRAMEBUFFER_NOTSET = 245
+    VALIDATE_APIP_PIPELINE_VALID_ID = 246
+    VALIDATE_APIP_PIPELINE_EXISTS = 247
+    VALIDATE_APIP_PIPELINE_VALID = 248
+    VALIDATE_APIP_SHADER_EXISTS = 249
+    VALIDATE_APIP_SHADER_VALID = 250
+    VALIDATE_APIP_CURPASS_ATTACHMENTS_EXISTS = 251
+    VALIDATE_APIP_CURPASS_ATTACHMENTS_VALID = 252
+    VALIDATE_APIP_ATT_COUNT = 253
+    VALIDATE_APIP_COLOR_FORMAT = 254
+    VALIDATE_APIP_DEPTH_FORMAT = 255
+    VALIDATE_APIP_SAMPLE_COUNT = 256
+    VALIDATE_ABND_PIPELINE = 257
+    VALIDATE_ABND_PIPELINE_EXISTS = 258
+    VALIDATE_ABND_PIPELINE_VALID = 259
+    VALIDATE_ABND_EXPECTED_VB = 260
+    VALIDATE_ABND_VB_EXISTS = 261
+    VALIDATE_ABND_VB_TYPE = 262
+    VALIDATE_ABND_VB_OVERFLOW = 263
+    VALIDATE_ABND_NO_IB = 264
+    VALIDATE_ABND_IB = 265
+    VALIDATE_ABND_IB_EXISTS = 266
+    VALIDATE_ABND_IB_TYPE = 267
+    VALIDATE_ABND_IB_OVERFLOW = 268
+    VALIDATE_ABND_EXPECTED_IMAGE_BINDING = 269
+    VALIDATE_ABND_IMG_EXISTS = 270
+    VALIDATE_ABND_IMAGE_TYPE_MISMATCH = 271
+    VALIDATE_ABND_EXPECTED_MULTISAMPLED_IMAGE = 272
+    VALIDATE_ABND_IMAGE_MSAA = 273
+    VALIDATE_ABND_EXPECTED_FILTERABLE_IMAGE = 274
+    VALIDATE_ABND_EXPECTED_DEPTH_IMAGE = 275
+    VALIDATE_ABND_EXPECTED_SAMPLER_BINDING = 276
+    VALIDATE_ABND_UNEXPECTED_SAMPLER_COMPARE_NEVER = 277
+    VALIDATE_ABND_EXPECTED_SAMPLER_COMPARE_NEVER = 278
+    VALIDATE_ABND_EXPECTED_NONFILTERING_SAMPLER = 279
+    VALIDATE_ABND_SMP_EXISTS = 280
+    VALIDATE_ABND_EXPECTED_STORAGEBUFFER_BINDING = 281
+    VALIDATE_ABND_STORAGEBUFFER_EXISTS = 282
+    VALIDATE_ABND_STORAGEBUFFER_BINDING_BUFFERTYPE = 283
+    VALIDATE_AUB_NO_PIPELINE = 284
+    VALIDATE_AUB_NO_UB_AT_SLOT = 285
+    VALIDATE_AUB_SIZE = 286
+    VALIDATE_UPDATEBUF_USAGE = 287
+    VALIDATE_UPDATEBUF_SIZE = 288
+    VALIDATE_UPDATEBUF_ONCE = 289
+    VALIDATE_UPDATEBUF_APPEND = 290
+    VALIDATE_APPENDBUF_USAGE = 291
+    VALIDATE_APPENDBUF_SIZE = 292
+    VALIDATE_APPENDBUF_UPDATE = 293
+    VALIDATE_UPDIMG_USAGE = 294
+    VALIDATE_UPDIMG_ONCE = 295
+    VALIDATION_FAILED = 296
+
+class EnvironmentDefaults(ctypes.Structure):
+    _fields_ = [
+        ("color_format", ctypes.c_int),
+        ("depth_format", ctypes.c_int),
+        ("sample_count", ctypes.c_int),
+    ]
+
+class MetalEnvironment(ctypes.Structure):
+    _fields_ = [
+        ("device", ctypes.c_void_p),
+    ]
+
+class D3d11Environment(ctypes.Structure):
+    _fields_ = [
+        ("device", ctypes.c_void_p),
+        ("device_context", ctypes.c_void_p),
+    ]
+
+class WgpuEnvironment(ctypes.Structure):
+    _fields_ = [
+        ("device", ctypes.c_void_p),
+    ]
+
+class Environment(ctypes.Structure):
+    _fields_ = [
+        ("defaults", EnvironmentDefaults),
+        ("metal", MetalEnvironment),
+        ("d3d11", D3d11Environment),
+        ("wgpu", WgpuEnvironment),
+    ]
+
+class CommitListener(ctypes.Structure):
+    _fields_ = [
+        ("func", ctypes.CFUNCTYPE(None, ctypes.c_void_p)),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class Allocator(ctypes.Structure):
+    _fields_ = [
+        ("alloc_fn", ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p)),
+        ("free_fn", ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_void_p)),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class Logger(ctypes.Structure):
+    _fields_ = [
+        ("func", ctypes.CFUNCTYPE(None, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_char_p, ctypes.c_void_p)),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class Desc(ctypes.Structure):
+    _fields_ = [
+        ("_start_canary", ctypes.c_uint32),
+        ("buffer_pool_size", ctypes.c_int),
+        ("image_pool_size", ctypes.c_int),
+        ("sampler_pool_size", ctypes.c_int),
+        ("shader_pool_size", ctypes.c_int),
+        ("pipeline_pool_size", ctypes.c_int),
+        ("attachments_pool_size", ctypes.c_int),
+        ("uniform_buffer_size", ctypes.c_int),
+        ("max_commit_listeners", ctypes.c_int),
+        ("disable_validation", ctypes.c_bool),
+        ("d3d11_shader_debugging", ctypes.c_bool),
+        ("mtl_force_managed_storage_mode", ctypes.c_bool),
+        ("mtl_use_command_buffer_with_retained_references", ctypes.c_bool),
+        ("wgpu_disable_bindgroups_cache", ctypes.c_bool),
+        ("wgpu_bindgroups_cache_size", ctypes.c_int),
+        ("allocator", Allocator),
+        ("logger", Logger),
+        ("environment", Environment),
+        ("_end_canary", ctypes.c_uint32),
+    ]
+
+setup = _lib["sg_setup"]
+setup.argtypes = [ctypes.POINTER(Desc)]
+setup.restype = None
+
+shutdown = _lib["sg_shutdown"]
+shutdown.argtypes = []
+shutdown.restype = None
+
+isvalid = _lib["sg_isvalid"]
+isvalid.argtypes = []
+isvalid.restype = ctypes.c_bool
+
+reset_state_cache = _lib["sg_reset_state_cache"]
+reset_state_cache.argtypes = []
+reset_state_cache.restype = None
+
+install_trace_hooks = _lib["sg_install_trace_hooks"]
+install_trace_hooks.argtypes = [ctypes.POINTER(TraceHooks)]
+install_trace_hooks.restype = TraceHooks
+
+push_debug_group = _lib["sg_push_debug_group"]
+push_debug_group.argtypes = [_CStrParam]
+push_debug_group.restype = None
+
+pop_debug_group = _lib["sg_pop_debug_group"]
+pop_debug_group.argtypes = []
+pop_debug_group.restype = None
+
+add_commit_listener = _lib["sg_add_commit_listener"]
+add_commit_listener.argtypes = [CommitListener]
+add_commit_listener.restype = ctypes.c_bool
+
+remove_commit_listener = _lib["sg_remove_commit_listener"]
+remove_commit_listener.argtypes = [CommitListener]
+remove_commit_listener.restype = ctypes.c_bool
+
+make_buffer = _lib["sg_make_buffer"]
+make_buffer.argtypes = [ctypes.POINTER(BufferDesc)]
+make_buffer.restype = Buffer
+
+make_image = _lib["sg_make_image"]
+make_image.argtypes = [ctypes.POINTER(ImageDesc)]
+make_image.restype = Image
+
+make_sampler = _lib["sg_make_sampler"]
+make_sampler.argtypes = [ctypes.POINTER(SamplerDesc)]
+make_sampler.restype = Sampler
+
+make_shader = _lib["sg_make_shader"]
+make_shader.argtypes = [ctypes.POINTER(ShaderDesc)]
+make_shader.restype = Shader
+
+make_pipeline = _lib["sg_make_pipeline"]
+make_pipeline.argtypes = [ctypes.POINTER(PipelineDesc)]
+make_pipeline.restype = Pipeline
+
+make_attachments = _lib["sg_make_attachments"]
+make_attachments.argtypes = [ctypes.POINTER(AttachmentsDesc)]
+make_attachments.restype = Attachments
+
+destroy_buffer = _lib["sg_destroy_buffer"]
+destroy_buffer.argtypes = [Buffer]
+destroy_buffer.restype = None
+
+destroy_image = _lib["sg_destroy_image"]
+destroy_image.argtypes = [Image]
+destroy_image.restype = None
+
+destroy_sampler = _lib["sg_destroy_sampler"]
+destroy_sampler.argtypes = [Sampler]
+destroy_sampler.restype = None
+
+destroy_shader = _lib["sg_destroy_shader"]
+destroy_shader.argtypes = [Shader]
+destroy_shader.restype = None
+
+destroy_pipeline = _lib["sg_destroy_pipeline"]
+destroy_pipeline.argtypes = [Pipeline]
+destroy_pipeline.restype = None
+
+destroy_attachments = _lib["sg_destroy_attachments"]
+destroy_attachments.argtypes = [Attachments]
+destroy_attachments.restype = None
+
+update_buffer = _lib["sg_update_buffer"]
+update_buffer.argtypes = [Buffer, RangeParam]
+update_buffer.restype = None
+
+update_image = _lib["sg_update_image"]
+update_image.argtypes = [Image, ctypes.POINTER(ImageData)]
+update_image.restype = None
+
+append_buffer = _lib["sg_append_buffer"]
+append_buffer.argtypes = [Buffer, RangeParam]
+append_buffer.restype = ctypes.c_int
+
+query_buffer_overflow = _lib["sg_query_buffer_overflow"]
+query_buffer_overflow.argtypes = [Buffer]
+query_buffer_overflow.restype = ctypes.c_bool
+
+query_buffer_will_overflow = _lib["sg_query_buffer_will_overflow"]
+query_buffer_will_overflow.argtypes = [Buffer, ctypes.c_size_t]
+query_buffer_will_overflow.restype = ctypes.c_bool
+
+begin_pass = _lib["sg_begin_pass"]
+begin_pass.argtypes = [ctypes.POINTER(Pass)]
+begin_pass.restype = None
+
+apply_viewport = _lib["sg_apply_viewport"]
+apply_viewport.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_bool]
+apply_viewport.restype = None
+
+apply_viewportf = _lib["sg_apply_viewportf"]
+apply_viewportf.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_bool]
+apply_viewportf.restype = None
+
+apply_scissor_rect = _lib["sg_apply_scissor_rect"]
+apply_scissor_rect.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_bool]
+apply_scissor_rect.restype = None
+
+apply_scissor_rectf = _lib["sg_apply_scissor_rectf"]
+apply_scissor_rectf.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_bool]
+apply_scissor_rectf.restype = None
+
+apply_pipeline = _lib["sg_apply_pipeline"]
+apply_pipeline.argtypes = [Pipeline]
+apply_pipeline.restype = None
+
+apply_bindings = _lib["sg_apply_bindings"]
+apply_bindings.argtypes = [ctypes.POINTER(Bindings)]
+apply_bindings.restype = None
+
+apply_uniforms = _lib["sg_apply_uniforms"]
+apply_uniforms.argtypes = [ctypes.c_int, RangeParam]
+apply_uniforms.restype = None
+
+draw = _lib["sg_draw"]
+draw.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int]
+draw.restype = None
+
+end_pass = _lib["sg_end_pass"]
+end_pass.argtypes = []
+end_pass.restype = None
+
+commit = _lib["sg_commit"]
+commit.argtypes = []
+commit.restype = None
+
+query_desc = _lib["sg_query_desc"]
+query_desc.argtypes = []
+query_desc.restype = Desc
+
+query_backend = _lib["sg_query_backend"]
+query_backend.argtypes = []
+query_backend.restype = ctypes.c_int
+query_backend.errcheck = _enum_result(Backend)
+
+query_features = _lib["sg_query_features"]
+query_features.argtypes = []
+query_features.restype = Features
+
+query_limits = _lib["sg_query_limits"]
+query_limits.argtypes = []
+query_limits.restype = Limits
+
+query_pixelformat = _lib["sg_query_pixelformat"]
+query_pixelformat.argtypes = [ctypes.c_int]
+query_pixelformat.restype = PixelformatInfo
+
+query_row_pitch = _lib["sg_query_row_pitch"]
+query_row_pitch.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int]
+query_row_pitch.restype = ctypes.c_int
+
+query_surface_pitch = _lib["sg_query_surface_pitch"]
+query_surface_pitch.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int]
+query_surface_pitch.restype = ctypes.c_int
+
+query_buffer_state = _lib["sg_query_buffer_state"]
+query_buffer_state.argtypes = [Buffer]
+query_buffer_state.restype = ctypes.c_int
+query_buffer_state.errcheck = _enum_result(ResourceState)
+
+query_image_state = _lib["sg_query_image_state"]
+query_image_state.argtypes = [Image]
+query_image_state.restype = ctypes.c_int
+query_image_state.errcheck = _enum_result(ResourceState)
+
+query_sampler_state = _lib["sg_query_sampler_state"]
+query_sampler_state.argtypes = [Sampler]
+query_sampler_state.restype = ctypes.c_int
+query_sampler_state.errcheck = _enum_result(ResourceState)
+
+query_shader_state = _lib["sg_query_shader_state"]
+query_shader_state.argtypes = [Shader]
+query_shader_state.restype = ctypes.c_int
+query_shader_state.errcheck = _enum_result(ResourceState)
+
+query_pipeline_state = _lib["sg_query_pipeline_state"]
+query_pipeline_state.argtypes = [Pipeline]
+query_pipeline_state.restype = ctypes.c_int
+query_pipeline_state.errcheck = _enum_result(ResourceState)
+
+query_attachments_state = _lib["sg_query_attachments_state"]
+query_attachments_state.argtypes = [Attachments]
+query_attachments_state.restype = ctypes.c_int
+query_attachments_state.errcheck = _enum_result(ResourceState)
+
+query_buffer_info = _lib["sg_query_buffer_info"]
+query_buffer_info.argtypes = [Buffer]
+query_buffer_info.restype = BufferInfo
+
+query_image_info = _lib["sg_query_image_info"]
+query_image_info.argtypes = [Image]
+query_image_info.restype = ImageInfo
+
+query_sampler_info = _lib["sg_query_sampler_info"]
+query_sampler_info.argtypes = [Sampler]
+query_sampler_info.restype = SamplerInfo
+
+query_shader_info = _lib["sg_query_shader_info"]
+query_shader_info.argtypes = [Shader]
+query_shader_info.restype = ShaderInfo
+
+query_pipeline_info = _lib["sg_query_pipeline_info"]
+query_pipeline_info.argtypes = [Pipeline]
+query_pipeline_info.restype = PipelineInfo
+
+query_attachments_info = _lib["sg_query_attachments_info"]
+query_attachments_info.argtypes = [Attachments]
+query_attachments_info.restype = AttachmentsInfo
+
+query_buffer_desc = _lib["sg_query_buffer_desc"]
+query_buffer_desc.argtypes = [Buffer]
+query_buffer_desc.restype = BufferDesc
+
+query_image_desc = _lib["sg_query_image_desc"]
+query_image_desc.argtypes = [Image]
+query_image_desc.restype = ImageDesc
+
+query_sampler_desc = _lib["sg_query_sampler_desc"]
+query_sampler_desc.argtypes = [Sampler]
+query_sampler_desc.restype = SamplerDesc
+
+query_shader_desc = _lib["sg_query_shader_desc"]
+query_shader_desc.argtypes = [Shader]
+query_shader_desc.restype = ShaderDesc
+
+query_pipeline_desc = _lib["sg_query_pipeline_desc"]
+query_pipeline_desc.argtypes = [Pipeline]
+query_pipeline_desc.restype = PipelineDesc
+
+query_attachments_desc = _lib["sg_query_attachments_desc"]
+query_attachments_desc.argtypes = [Attachments]
+query_attachments_desc.restype = AttachmentsDesc
+
+query_buffer_defaults = _lib["sg_query_buffer_defaults"]
+query_buffer_defaults.argtypes = [ctypes.POINTER(BufferDesc)]
+query_buffer_defaults.restype = BufferDesc
+
+query_image_defaults = _lib["sg_query_image_defaults"]
+query_image_defaults.argtypes = [ctypes.POINTER(ImageDesc)]
+query_image_defaults.restype = ImageDesc
+
+query_sampler_defaults = _lib["sg_query_sampler_defaults"]
+query_sampler_defaults.argtypes = [ctypes.POINTER(SamplerDesc)]
+query_sampler_defaults.restype = SamplerDesc
+
+query_shader_defaults = _lib["sg_query_shader_defaults"]
+query_shader_defaults.argtypes = [ctypes.POINTER(ShaderDesc)]
+query_shader_defaults.restype = ShaderDesc
+
+query_pipeline_defaults = _lib["sg_query_pipeline_defaults"]
+query_pipeline_defaults.argtypes = [ctypes.POINTER(PipelineDesc)]
+query_pipeline_defaults.restype = PipelineDesc
+
+query_attachments_defaults = _lib["sg_query_attachments_defaults"]
+query_attachments_defaults.argtypes = [ctypes.POINTER(AttachmentsDesc)]
+query_attachments_defaults.restype = AttachmentsDesc
+
+query_buffer_size = _lib["sg_query_buffer_size"]
+query_buffer_size.argtypes = [Buffer]
+query_buffer_size.restype = ctypes.c_size_t
+
+query_buffer_type = _lib["sg_query_buffer_type"]
+query_buffer_type.argtypes = [Buffer]
+query_buffer_type.restype = ctypes.c_int
+query_buffer_type.errcheck = _enum_result(BufferType)
+
+query_buffer_usage = _lib["sg_query_buffer_usage"]
+query_buffer_usage.argtypes = [Buffer]
+query_buffer_usage.restype = ctypes.c_int
+query_buffer_usage.errcheck = _enum_result(Usage)
+
+query_image_type = _lib["sg_query_image_type"]
+query_image_type.argtypes = [Image]
+query_image_type.restype = ctypes.c_int
+query_image_type.errcheck = _enum_result(ImageType)
+
+query_image_width = _lib["sg_query_image_width"]
+query_image_width.argtypes = [Image]
+query_image_width.restype = ctypes.c_int
+
+query_image_height = _lib["sg_query_image_height"]
+query_image_height.argtypes = [Image]
+query_image_height.restype = ctypes.c_int
+
+query_image_num_slices = _lib["sg_query_image_num_slices"]
+query_image_num_slices.argtypes = [Image]
+query_image_num_slices.restype = ctypes.c_int
+
+query_image_num_mipmaps = _lib["sg_query_image_num_mipmaps"]
+query_image_num_mipmaps.argtypes = [Image]
+query_image_num_mipmaps.restype = ctypes.c_int
+
+query_image_pixelformat = _lib["sg_query_image_pixelformat"]
+query_image_pixelformat.argtypes = [Image]
+query_image_pixelformat.restype = ctypes.c_int
+query_image_pixelformat.errcheck = _enum_result(PixelFormat)
+
+query_image_usage = _lib["sg_query_image_usage"]
+query_image_usage.argtypes = [Image]
+query_image_usage.restype = ctypes.c_int
+query_image_usage.errcheck = _enum_result(Usage)
+
+query_image_sample_count = _lib["sg_query_image_sample_count"]
+query_image_sample_count.argtypes = [Image]
+query_image_sample_count.restype = ctypes.c_int
+
+alloc_buffer = _lib["sg_alloc_buffer"]
+alloc_buffer.argtypes = []
+alloc_buffer.restype = Buffer
+
+alloc_image = _lib["sg_alloc_image"]
+alloc_image.argtypes = []
+alloc_image.restype = Image
+
+alloc_sampler = _lib["sg_alloc_sampler"]
+alloc_sampler.argtypes = []
+alloc_sampler.restype = Sampler
+
+alloc_shader = _lib["sg_alloc_shader"]
+alloc_shader.argtypes = []
+alloc_shader.restype = Shader
+
+alloc_pipeline = _lib["sg_alloc_pipeline"]
+alloc_pipeline.argtypes = []
+alloc_pipeline.restype = Pipeline
+
+alloc_attachments = _lib["sg_alloc_attachments"]
+alloc_attachments.argtypes = []
+alloc_attachments.restype = Attachments
+
+dealloc_buffer = _lib["sg_dealloc_buffer"]
+dealloc_buffer.argtypes = [Buffer]
+dealloc_buffer.restype = None
+
+dealloc_image = _lib["sg_dealloc_image"]
+dealloc_image.argtypes = [Image]
+dealloc_image.restype = None
+
+dealloc_sampler = _lib["sg_dealloc_sampler"]
+dealloc_sampler.argtypes = [Sampler]
+dealloc_sampler.restype = None
+
+dealloc_shader = _lib["sg_dealloc_shader"]
+dealloc_shader.argtypes = [Shader]
+dealloc_shader.restype = None
+
+dealloc_pipeline = _lib["sg_dealloc_pipeline"]
+dealloc_pipeline.argtypes = [Pipeline]
+dealloc_pipeline.restype = None
+
+dealloc_attachments = _lib["sg_dealloc_attachments"]
+dealloc_attachments.argtypes = [Attachments]
+dealloc_attachments.restype = None
+
+init_buffer = _lib["sg_init_buffer"]
+init_buffer.argtypes = [Buffer, ctypes.POINTER(BufferDesc)]
+init_buffer.restype = None
+
+init_image = _lib["sg_init_image"]
+init_image.argtypes = [Image, ctypes.POINTER(ImageDesc)]
+init_image.restype = None
+
+init_sampler = _lib["sg_init_sampler"]
+init_sampler.argtypes = [Sampler, ctypes.POINTER(SamplerDesc)]
+init_sampler.restype = None
+
+init_shader = _lib["sg_init_shader"]
+init_shader.argtypes = [Shader, ctypes.POINTER(ShaderDesc)]
+init_shader.restype = None
+
+init_pipeline = _lib["sg_init_pipeline"]
+init_pipeline.argtypes = [Pipeline, ctypes.POINTER(PipelineDesc)]
+init_pipeline.restype = None
+
+init_attachments = _lib["sg_init_attachments"]
+init_attachments.argtypes = [Attachments, ctypes.POINTER(AttachmentsDesc)]
+init_attachments.restype = None
+
+uninit_buffer = _lib["sg_uninit_buffer"]
+uninit_buffer.argtypes = [Buffer]
+uninit_buffer.restype = None
+
+uninit_image = _lib["sg_uninit_image"]
+uninit_image.argtypes = [Image]
+uninit_image.restype = None
+
+uninit_sampler = _lib["sg_uninit_sampler"]
+uninit_sampler.argtypes = [Sampler]
+uninit_sampler.restype = None
+
+uninit_shader = _lib["sg_uninit_shader"]
+uninit_shader.argtypes = [Shader]
+uninit_shader.restype = None
+
+uninit_pipeline = _lib["sg_uninit_pipeline"]
+uninit_pipeline.argtypes = [Pipeline]
+uninit_pipeline.restype = None
+
+uninit_attachments = _lib["sg_uninit_attachments"]
+uninit_attachments.argtypes = [Attachments]
+uninit_attachments.restype = None
+
+fail_buffer = _lib["sg_fail_buffer"]
+fail_buffer.argtypes = [Buffer]
+fail_buffer.restype = None
+
+fail_image = _lib["sg_fail_image"]
+fail_image.argtypes = [Image]
+fail_image.restype = None
+
+fail_sampler = _lib["sg_fail_sampler"]
+fail_sampler.argtypes = [Sampler]
+fail_sampler.restype = None
+
+fail_shader = _lib["sg_fail_shader"]
+fail_shader.argtypes = [Shader]
+fail_shader.restype = None
+
+fail_pipeline = _lib["sg_fail_pipeline"]
+fail_pipeline.argtypes = [Pipeline]
+fail_pipeline.restype = None
+
+fail_attachments = _lib["sg_fail_attachments"]
+fail_attachments.argtypes = [Attachments]
+fail_attachments.restype = None
+
+enable_frame_stats = _lib["sg_enable_frame_stats"]
+enable_frame_stats.argtypes = []
+enable_frame_stats.restype = None
+
+disable_frame_stats = _lib["sg_disable_frame_stats"]
+disable_frame_stats.argtypes = []
+disable_frame_stats.restype = None
+
+frame_stats_enabled = _lib["sg_frame_stats_enabled"]
+frame_stats_enabled.argtypes = []
+frame_stats_enabled.restype = ctypes.c_bool
+
+query_frame_stats = _lib["sg_query_frame_stats"]
+query_frame_stats.argtypes = []
+query_frame_stats.restype = FrameStats
+
+class D3d11BufferInfo(ctypes.Structure):
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+    ]
+
+class D3d11ImageInfo(ctypes.Structure):
+    _fields_ = [
+        ("tex2d", ctypes.c_void_p),
+        ("tex3d", ctypes.c_void_p),
+        ("res", ctypes.c_void_p),
+        ("srv", ctypes.c_void_p),
+    ]
+
+class D3d11SamplerInfo(ctypes.Structure):
+    _fields_ = [
+        ("smp", ctypes.c_void_p),
+    ]
+
+class D3d11ShaderInfo(ctypes.Structure):
+    _fields_ = [
+        ("cbufs", (ctypes.c_void_p * 8)),
+        ("vs", ctypes.c_void_p),
+        ("fs", ctypes.c_void_p),
+    ]
+
+class D3d11PipelineInfo(ctypes.Structure):
+    _fields_ = [
+        ("il", ctypes.c_void_p),
+        ("rs", ctypes.c_void_p),
+        ("dss", ctypes.c_void_p),
+        ("bs", ctypes.c_void_p),
+    ]
+
+class D3d11AttachmentsInfo(ctypes.Structure):
+    _fields_ = [
+        ("color_rtv", (ctypes.c_void_p * 4)),
+        ("resolve_rtv", (ctypes.c_void_p * 4)),
+        ("dsv", ctypes.c_void_p),
+    ]
+
+class MtlBufferInfo(ctypes.Structure):
+    _fields_ = [
+        ("buf", (ctypes.c_void_p * 2)),
+        ("active_slot", ctypes.c_int),
+    ]
+
+class MtlImageInfo(ctypes.Structure):
+    _fields_ = [
+        ("tex", (ctypes.c_void_p * 2)),
+        ("active_slot", ctypes.c_int),
+    ]
+
+class MtlSamplerInfo(ctypes.Structure):
+    _fields_ = [
+        ("smp", ctypes.c_void_p),
+    ]
+
+class MtlShaderInfo(ctypes.Structure):
+    _fields_ = [
+        ("vertex_lib", ctypes.c_void_p),
+        ("fragment_lib", ctypes.c_void_p),
+        ("vertex_func", ctypes.c_void_p),
+        ("fragment_func", ctypes.c_void_p),
+    ]
+
+class MtlPipelineInfo(ctypes.Structure):
+    _fields_ = [
+        ("rps", ctypes.c_void_p),
+        ("dss", ctypes.c_void_p),
+    ]
+
+class WgpuBufferInfo(ctypes.Structure):
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+    ]
+
+class WgpuImageInfo(ctypes.Structure):
+    _fields_ = [
+        ("tex", ctypes.c_void_p),
+        ("view", ctypes.c_void_p),
+    ]
+
+class WgpuSamplerInfo(ctypes.Structure):
+    _fields_ = [
+        ("smp", ctypes.c_void_p),
+    ]
+
+class WgpuShaderInfo(ctypes.Structure):
+    _fields_ = [
+        ("vs_mod", ctypes.c_void_p),
+        ("fs_mod", ctypes.c_void_p),
+        ("bgl", ctypes.c_void_p),
+    ]
+
+class WgpuPipelineInfo(ctypes.Structure):
+    _fields_ = [
+        ("pip", ctypes.c_void_p),
+    ]
+
+class WgpuAttachmentsInfo(ctypes.Structure):
+    _fields_ = [
+        ("color_view", (ctypes.c_void_p * 4)),
+        ("resolve_view", (ctypes.c_void_p * 4)),
+        ("ds_view", ctypes.c_void_p),
+    ]
+
+class GlBufferInfo(ctypes.Structure):
+    _fields_ = [
+        ("buf", (ctypes.c_uint32 * 2)),
+        ("active_slot", ctypes.c_int),
+    ]
+
+class GlImageInfo(ctypes.Structure):
+    _fields_ = [
+        ("tex", (ctypes.c_uint32 * 2)),
+        ("tex_target", ctypes.c_uint32),
+        ("msaa_render_buffer", ctypes.c_uint32),
+        ("active_slot", ctypes.c_int),
+    ]
+
+class GlSamplerInfo(ctypes.Structure):
+    _fields_ = [
+        ("smp", ctypes.c_uint32),
+    ]
+
+class GlShaderInfo(ctypes.Structure):
+    _fields_ = [
+        ("prog", ctypes.c_uint32),
+    ]
+
+class GlAttachmentsInfo(ctypes.Structure):
+    _fields_ = [
+        ("framebuffer", ctypes.c_uint32),
+        ("msaa_resolve_framebuffer", (ctypes.c_uint32 * 4)),
+    ]
+
+d3d11_device = _lib["sg_d3d11_device"]
+d3d11_device.argtypes = []
+d3d11_device.restype = ctypes.c_void_p
+
+d3d11_device_context = _lib["sg_d3d11_device_context"]
+d3d11_device_context.argtypes = []
+d3d11_device_context.restype = ctypes.c_void_p
+
+d3d11_query_buffer_info = _lib["sg_d3d11_query_buffer_info"]
+d3d11_query_buffer_info.argtypes = [Buffer]
+d3d11_query_buffer_info.restype = D3d11BufferInfo
+
+d3d11_query_image_info = _lib["sg_d3d11_query_image_info"]
+d3d11_query_image_info.argtypes = [Image]
+d3d11_query_image_info.restype = D3d11ImageInfo
+
+d3d11_query_sampler_info = _lib["sg_d3d11_query_sampler_info"]
+d3d11_query_sampler_info.argtypes = [Sampler]
+d3d11_query_sampler_info.restype = D3d11SamplerInfo
+
+d3d11_query_shader_info = _lib["sg_d3d11_query_shader_info"]
+d3d11_query_shader_info.argtypes = [Shader]
+d3d11_query_shader_info.restype = D3d11ShaderInfo
+
+d3d11_query_pipeline_info = _lib["sg_d3d11_query_pipeline_info"]
+d3d11_query_pipeline_info.argtypes = [Pipeline]
+d3d11_query_pipeline_info.restype = D3d11PipelineInfo
+
+d3d11_query_attachments_info = _lib["sg_d3d11_query_attachments_info"]
+d3d11_query_attachments_info.argtypes = [Attachments]
+d3d11_query_attachments_info.restype = D3d11AttachmentsInfo
+
+mtl_device = _lib["sg_mtl_device"]
+mtl_device.argtypes = []
+mtl_device.restype = ctypes.c_void_p
+
+mtl_render_command_encoder = _lib["sg_mtl_render_command_encoder"]
+mtl_render_command_encoder.argtypes = []
+mtl_render_command_encoder.restype = ctypes.c_void_p
+
+mtl_query_buffer_info = _lib["sg_mtl_query_buffer_info"]
+mtl_query_buffer_info.argtypes = [Buffer]
+mtl_query_buffer_info.restype = MtlBufferInfo
+
+mtl_query_image_info = _lib["sg_mtl_query_image_info"]
+mtl_query_image_info.argtypes = [Image]
+mtl_query_image_info.restype = MtlImageInfo
+
+mtl_query_sampler_info = _lib["sg_mtl_query_sampler_info"]
+mtl_query_sampler_info.argtypes = [Sampler]
+mtl_query_sampler_info.restype = MtlSamplerInfo
+
+mtl_query_shader_info = _lib["sg_mtl_query_shader_info"]
+mtl_query_shader_info.argtypes = [Shader]
+mtl_query_shader_info.restype = MtlShaderInfo
+
+mtl_query_pipeline_info = _lib["sg_mtl_query_pipeline_info"]
+mtl_query_pipeline_info.argtypes = [Pipeline]
+mtl_query_pipeline_info.restype = MtlPipelineInfo
+
+wgpu_device = _lib["sg_wgpu_device"]
+wgpu_device.argtypes = []
+wgpu_device.restype = ctypes.c_void_p
+
+wgpu_queue = _lib["sg_wgpu_queue"]
+wgpu_queue.argtypes = []
+wgpu_queue.restype = ctypes.c_void_p
+
+wgpu_command_encoder = _lib["sg_wgpu_command_encoder"]
+wgpu_command_encoder.argtypes = []
+wgpu_command_encoder.restype = ctypes.c_void_p
+
+wgpu_render_pass_encoder = _lib["sg_wgpu_render_pass_encoder"]
+wgpu_render_pass_encoder.argtypes = []
+wgpu_render_pass_encoder.restype = ctypes.c_void_p
+
+wgpu_query_buffer_info = _lib["sg_wgpu_query_buffer_info"]
+wgpu_query_buffer_info.argtypes = [Buffer]
+wgpu_query_buffer_info.restype = WgpuBufferInfo
+
+wgpu_query_image_info = _lib["sg_wgpu_query_image_info"]
+wgpu_query_image_info.argtypes = [Image]
+wgpu_query_image_info.restype = WgpuImageInfo
+
+wgpu_query_sampler_info = _lib["sg_wgpu_query_sampler_info"]
+wgpu_query_sampler_info.argtypes = [Sampler]
+wgpu_query_sampler_info.restype = WgpuSamplerInfo
+
+wgpu_query_shader_info = _lib["sg_wgpu_query_shader_info"]
+wgpu_query_shader_info.argtypes = [Shader]
+wgpu_query_shader_info.restype = WgpuShaderInfo
+
+wgpu_query_pipeline_info = _lib["sg_wgpu_query_pipeline_info"]
+wgpu_query_pipeline_info.argtypes = [Pipeline]
+wgpu_query_pipeline_info.restype = WgpuPipelineInfo
+
+wgpu_query_attachments_info = _lib["sg_wgpu_query_attachments_info"]
+wgpu_query_attachments_info.argtypes = [Attachments]
+wgpu_query_attachments_info.restype = WgpuAttachmentsInfo
+
+gl_query_buffer_info = _lib["sg_gl_query_buffer_info"]
+gl_query_buffer_info.argtypes = [Buffer]
+gl_query_buffer_info.restype = GlBufferInfo
+
+gl_query_image_info = _lib["sg_gl_query_image_info"]
+gl_query_image_info.argtypes = [Image]
+gl_query_image_info.restype = GlImageInfo
+
+gl_query_sampler_info = _lib["sg_gl_query_sampler_info"]
+gl_query_sampler_info.argtypes = [Sampler]
+gl_query_sampler_info.restype = GlSamplerInfo
+
+gl_query_shader_info = _lib["sg_gl_query_shader_info"]
+gl_query_shader_info.argtypes = [Shader]
+gl_query_shader_info.restype = GlShaderInfo
+
+gl_query_attachments_info = _lib["sg_gl_query_attachments_info"]
+gl_query_attachments_info.argtypes = [Attachments]
+gl_query_attachments_info.restype = GlAttachmentsInfo
+
@@ -0,0 +1,444 @@
+# machine generated, do not edit
+
+import ctypes, enum
+from . import clib
+from . import gfx as sg
+
+_lib = clib.load()
+
+# argtypes converter for 'const char *' args, accepts str or bytes
+class _CStrParam:
+    @classmethod
+    def from_param(cls, obj):
+        if isinstance(obj, str):
+            obj = obj.encode("utf-8")
+        return ctypes.c_char_p.from_param(obj)
+
+# errcheck function to convert a C string result to a Python string
+def _c_str_to_python(result, func, args):
+    return result.decode("utf-8") if result is not None else ""
+
+# errcheck function factory to convert a C enum result to an IntEnum
+def _enum_result(enum_type):
+    def errcheck(result, func, args):
+        return enum_type(result)
+    return errcheck
+
+class LogItem(enum.IntEnum):
+    OK = 0
+    MALLOC_FAILED = 1
+    MAKE_PIPELINE_FAILED = 2
+    PIPELINE_POOL_EXHAUSTED = 3
+    ADD_COMMIT_LISTENER_FAILED = 4
+    CONTEXT_POOL_EXHAUSTED = 5
+    CANNOT_DESTROY_DEFAULT_CONTEXT = 6
+
+class Logger(ctypes.Structure):
+    _fields_ = [
+        ("func", ctypes.CFUNCTYPE(None, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_char_p, ctypes.c_void_p)),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class Pipeline(ctypes.Structure):
+    _fields_ = [
+        ("id", ctypes.c_uint32),
+    ]
+
+class Context(ctypes.Structure):
+    _fields_ = [
+        ("id", ctypes.c_uint32),
+    ]
+
+class Error(ctypes.Structure):
+    _fields_ = [
+        ("any", ctypes.c_bool),
+        ("vertices_full", ctypes.c_bool),
+        ("uniforms_full", ctypes.c_bool),
+        ("commands_full", ctypes.c_bool),
+        ("stack_overflow", ctypes.c_bool),
+        ("stack_underflow", ctypes.c_bool),
+        ("no_context", ctypes.c_bool),
+    ]
+
+class ContextDesc(ctypes.Structure):
+    _fields_ = [
+        ("max_vertices", ctypes.c_int),
+        ("max_commands", ctypes.c_int),
+        ("color_format", ctypes.c_int),
+        ("depth_format", ctypes.c_int),
+        ("sample_count", ctypes.c_int),
+    ]
+
+class Allocator(ctypes.Structure):
+    _fields_ = [
+        ("alloc_fn", ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p)),
+        ("free_fn", ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_void_p)),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class Desc(ctypes.Structure):
+    _fields_ = [
+        ("max_vertices", ctypes.c_int),
+        ("max_commands", ctypes.c_int),
+        ("context_pool_size", ctypes.c_int),
+        ("pipeline_pool_size", ctypes.c_int),
+        ("color_format", ctypes.c_int),
+        ("depth_format", ctypes.c_int),
+        ("sample_count", ctypes.c_int),
+        ("face_winding", ctypes.c_int),
+        ("allocator", Allocator),
+        ("logger", Logger),
+    ]
+
+setup = _lib["sgl_setup"]
+setup.argtypes = [ctypes.POINTER(Desc)]
+setup.restype = None
+
+shutdown = _lib["sgl_shutdown"]
+shutdown.argtypes = []
+shutdown.restype = None
+
+as_radians = _lib["sgl_rad"]
+as_radians.argtypes = [ctypes.c_float]
+as_radians.restype = ctypes.c_float
+
+as_degrees = _lib["sgl_deg"]
+as_degrees.argtypes = [ctypes.c_float]
+as_degrees.restype = ctypes.c_float
+
+get_error = _lib["sgl_error"]
+get_error.argtypes = []
+get_error.restype = Error
+
+context_error = _lib["sgl_context_error"]
+context_error.argtypes = [Context]
+context_error.restype = Error
+
+make_context = _lib["sgl_make_context"]
+make_context.argtypes = [ctypes.POINTER(ContextDesc)]
+make_context.restype = Context
+
+destroy_context = _lib["sgl_destroy_context"]
+destroy_context.argtypes = [Context]
+destroy_context.restype = None
+
+set_context = _lib["sgl_set_context"]
+set_context.argtypes = [Context]
+set_context.restype = None
+
+get_context = _lib["sgl_get_context"]
+get_context.argtypes = []
+get_context.restype = Context
+
+default_context = _lib["sgl_default_context"]
+default_context.argtypes = []
+default_context.restype = Context
+
+num_vertices = _lib["sgl_num_vertices"]
+num_vertices.argtypes = []
+num_vertices.restype = ctypes.c_int
+
+num_commands = _lib["sgl_num_commands"]
+num_commands.argtypes = []
+num_commands.restype = ctypes.c_int
+
+draw = _lib["sgl_draw"]
+draw.argtypes = []
+draw.restype = None
+
+context_draw = _lib["sgl_context_draw"]
+context_draw.argtypes = [Context]
+context_draw.restype = None
+
+draw_layer = _lib["sgl_draw_layer"]
+draw_layer.argtypes = [ctypes.c_int]
+draw_layer.restype = None
+
+context_draw_layer = _lib["sgl_context_draw_layer"]
+context_draw_layer.argtypes = [Context, ctypes.c_int]
+context_draw_layer.restype = None
+
+make_pipeline = _lib["sgl_make_pipeline"]
+make_pipeline.argtypes = [ctypes.POINTER(sg.PipelineDesc)]
+make_pipeline.restype = Pipeline
+
+context_make_pipeline = _lib["sgl_context_make_pipeline"]
+context_make_pipeline.argtypes = [Context, ctypes.POINTER(sg.PipelineDesc)]
+context_make_pipeline.restype = Pipeline
+
+destroy_pipeline = _lib["sgl_destroy_pipeline"]
+destroy_pipeline.argtypes = [Pipeline]
+destroy_pipeline.restype = None
+
+defaults = _lib["sgl_defaults"]
+defaults.argtypes = []
+defaults.restype = None
+
+viewport = _lib["sgl_viewport"]
+viewport.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_bool]
+viewport.restype = None
+
+viewportf = _lib["sgl_viewportf"]
+viewportf.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_bool]
+viewportf.restype = None
+
+scissor_rect = _lib["sgl_scissor_rect"]
+scissor_rect.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_bool]
+scissor_rect.restype = None
+
+scissor_rectf = _lib["sgl_scissor_rectf"]
+scissor_rectf.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_bool]
+scissor_rectf.restype = None
+
+enable_texture = _lib["sgl_enable_texture"]
+enable_texture.argtypes = []
+enable_texture.restype = None
+
+disable_texture = _lib["sgl_disable_texture"]
+disable_texture.argtypes = []
+disable_texture.restype = None
+
+texture = _lib["sgl_texture"]
+texture.argtypes = [sg.Image, sg.Sampler]
+texture.restype = None
+
+layer = _lib["sgl_layer"]
+layer.argtypes = [ctypes.c_int]
+layer.restype = None
+
+load_default_pipeline = _lib["sgl_load_default_pipeline"]
+load_default_pipeline.argtypes = []
+load_default_pipeline.restype = None
+
+load_pipeline = _lib["sgl_load_pipeline"]
+load_pipeline.argtypes = [Pipeline]
+load_pipeline.restype = None
+
+push_pipeline = _lib["sgl_push_pipeline"]
+push_pipeline.argtypes = []
+push_pipeline.restype = None
+
+pop_pipeline = _lib["sgl_pop_pipeline"]
+pop_pipeline.argtypes = []
+pop_pipeline.restype = None
+
+matrix_mode_modelview = _lib["sgl_matrix_mode_modelview"]
+matrix_mode_modelview.argtypes = []
+matrix_mode_modelview.restype = None
+
+matrix_mode_projection = _lib["sgl_matrix_mode_projection"]
+matrix_mode_projection.argtypes = []
+matrix_mode_projection.restype = None
+
+matrix_mode_texture = _lib["sgl_matrix_mode_texture"]
+matrix_mode_texture.argtypes = []
+matrix_mode_texture.restype = None
+
+load_identity = _lib["sgl_load_identity"]
+load_identity.argtypes = []
+load_identity.restype = None
+
+load_matrix = _lib["sgl_load_matrix"]
+load_matrix.argtypes = [ctypes.POINTER(ctypes.c_float)]
+load_matrix.restype = None
+
+load_transpose_matrix = _lib["sgl_load_transpose_matrix"]
+load_transpose_matrix.argtypes = [ctypes.POINTER(ctypes.c_float)]
+load_transpose_matrix.restype = None
+
+mult_matrix = _lib["sgl_mult_matrix"]
+mult_matrix.argtypes = [ctypes.POINTER(ctypes.c_float)]
+mult_matrix.restype = None
+
+mult_transpose_matrix = _lib["sgl_mult_transpose_matrix"]
+mult_transpose_matrix.argtypes = [ctypes.POINTER(ctypes.c_float)]
+mult_transpose_matrix.restype = None
+
+rotate = _lib["sgl_rotate"]
+rotate.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+rotate.restype = None
+
+scale = _lib["sgl_scale"]
+scale.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float]
+scale.restype = None
+
+translate = _lib["sgl_translate"]
+translate.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float]
+translate.restype = None
+
+frustum = _lib["sgl_frustum"]
+frustum.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+frustum.restype = None
+
+ortho = _lib["sgl_ortho"]
+ortho.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+ortho.restype = None
+
+perspective = _lib["sgl_perspective"]
+perspective.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+perspective.restype = None
+
+lookat = _lib["sgl_lookat"]
+lookat.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+lookat.restype = None
+
+push_matrix = _lib["sgl_push_matrix"]
+push_matrix.argtypes = []
+push_matrix.restype = None
+
+pop_matrix = _lib["sgl_pop_matrix"]
+pop_matrix.argtypes = []
+pop_matrix.restype = None
+
+t2f = _lib["sgl_t2f"]
+t2f.argtypes = [ctypes.c_float, ctypes.c_float]
+t2f.restype = None
+
+c3f = _lib["sgl_c3f"]
+c3f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float]
+c3f.restype = None
+
+c4f = _lib["sgl_c4f"]
+c4f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+c4f.restype = None
+
+c3b = _lib["sgl_c3b"]
+c3b.argtypes = [ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]
+c3b.restype = None
+
+c4b = _lib["sgl_c4b"]
+c4b.argtypes = [ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]
+c4b.restype = None
+
+c1i = _lib["sgl_c1i"]
+c1i.argtypes = [ctypes.c_uint32]
+c1i.restype = None
+
+point_size = _lib["sgl_point_size"]
+point_size.argtypes = [ctypes.c_float]
+point_size.restype = None
+
+begin_points = _lib["sgl_begin_points"]
+begin_points.argtypes = []
+begin_points.restype = None
+
+begin_lines = _lib["sgl_begin_lines"]
+begin_lines.argtypes = []
+begin_lines.restype = None
+
+begin_line_strip = _lib["sgl_begin_line_strip"]
+begin_line_strip.argtypes = []
+begin_line_strip.restype = None
+
+begin_triangles = _lib["sgl_begin_triangles"]
+begin_triangles.argtypes = []
+begin_triangles.restype = None
+
+begin_triangle_strip = _lib["sgl_begin_triangle_strip"]
+begin_triangle_strip.argtypes = []
+begin_triangle_strip.restype = None
+
+begin_quads = _lib["sgl_begin_quads"]
+begin_quads.argtypes = []
+begin_quads.restype = None
+
+v2f = _lib["sgl_v2f"]
+v2f.argtypes = [ctypes.c_float, ctypes.c_float]
+v2f.restype = None
+
+v3f = _lib["sgl_v3f"]
+v3f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float]
+v3f.restype = None
+
+v2f_t2f = _lib["sgl_v2f_t2f"]
+v2f_t2f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+v2f_t2f.restype = None
+
+v3f_t2f = _lib["sgl_v3f_t2f"]
+v3f_t2f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+v3f_t2f.restype = None
+
+v2f_c3f = _lib["sgl_v2f_c3f"]
+v2f_c3f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+v2f_c3f.restype = None
+
+v2f_c3b = _lib["sgl_v2f_c3b"]
+v2f_c3b.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]
+v2f_c3b.restype = None
+
+v2f_c4f = _lib["sgl_v2f_c4f"]
+v2f_c4f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+v2f_c4f.restype = None
+
+v2f_c4b = _lib["sgl_v2f_c4b"]
+v2f_c4b.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]
+v2f_c4b.restype = None
+
+v2f_c1i = _lib["sgl_v2f_c1i"]
+v2f_c1i.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_uint32]
+v2f_c1i.restype = None
+
+v3f_c3f = _lib["sgl_v3f_c3f"]
+v3f_c3f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+v3f_c3f.restype = None
+
+v3f_c3b = _lib["sgl_v3f_c3b"]
+v3f_c3b.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]
+v3f_c3b.restype = None
+
+v3f_c4f = _lib["sgl_v3f_c4f"]
+v3f_c4f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+v3f_c4f.restype = None
+
+v3f_c4b = _lib["sgl_v3f_c4b"]
+v3f_c4b.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]
+v3f_c4b.restype = None
+
+v3f_c1i = _lib["sgl_v3f_c1i"]
+v3f_c1i.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_uint32]
+v3f_c1i.restype = None
+
+v2f_t2f_c3f = _lib["sgl_v2f_t2f_c3f"]
+v2f_t2f_c3f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+v2f_t2f_c3f.restype = None
+
+v2f_t2f_c3b = _lib["sgl_v2f_t2f_c3b"]
+v2f_t2f_c3b.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]
+v2f_t2f_c3b.restype = None
+
+v2f_t2f_c4f = _lib["sgl_v2f_t2f_c4f"]
+v2f_t2f_c4f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+v2f_t2f_c4f.restype = None
+
+v2f_t2f_c4b = _lib["sgl_v2f_t2f_c4b"]
+v2f_t2f_c4b.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]
+v2f_t2f_c4b.restype = None
+
+v2f_t2f_c1i = _lib["sgl_v2f_t2f_c1i"]
+v2f_t2f_c1i.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_uint32]
+v2f_t2f_c1i.restype = None
+
+v3f_t2f_c3f = _lib["sgl_v3f_t2f_c3f"]
+v3f_t2f_c3f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+v3f_t2f_c3f.restype = None
+
+v3f_t2f_c3b = _lib["sgl_v3f_t2f_c3b"]
+v3f_t2f_c3b.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]
+v3f_t2f_c3b.restype = None
+
+v3f_t2f_c4f = _lib["sgl_v3f_t2f_c4f"]
+v3f_t2f_c4f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+v3f_t2f_c4f.restype = None
+
+v3f_t2f_c4b = _lib["sgl_v3f_t2f_c4b"]
+v3f_t2f_c4b.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]
+v3f_t2f_c4b.restype = None
+
+v3f_t2f_c1i = _lib["sgl_v3f_t2f_c1i"]
+v3f_t2f_c1i.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_uint32]
+v3f_t2f_c1i.restype = None
+
+end = _lib["sgl_end"]
+end.argtypes = []
+end.restype = None
+
@@ -0,0 +1,34 @@
+# machine generated, do not edit
+
+import ctypes, enum
+from . import clib
+from . import gfx as sg
+
+_lib = clib.load()
+
+# argtypes converter for 'const char *' args, accepts str or bytes
+class _CStrParam:
+    @classmethod
+    def from_param(cls, obj):
+        if isinstance(obj, str):
+            obj = obj.encode("utf-8")
+        return ctypes.c_char_p.from_param(obj)
+
+# errcheck function to convert a C string result to a Python string
+def _c_str_to_python(result, func, args):
+    return result.decode("utf-8") if result is not None else ""
+
+# errcheck function factory to convert a C enum result to an IntEnum
+def _enum_result(enum_type):
+    def errcheck(result, func, args):
+        return enum_type(result)
+    return errcheck
+
+environment = _lib["sglue_environment"]
+environment.argtypes = []
+environment.restype = sg.Environment
+
+swapchain = _lib["sglue_swapchain"]
+swapchain.argtypes = []
+swapchain.restype = sg.Swapchain
+
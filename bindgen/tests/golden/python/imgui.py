@@ -0,0 +1,158 @@
+# machine generated, do not edit
+
+import ctypes, enum
+from . import clib
+from . import gfx as sg
+from . import app as sapp
+
+_lib = clib.load()
+
+# argtypes converter for 'const char *' args, accepts str or bytes
+class _CStrParam:
+    @classmethod
+    def from_param(cls, obj):
+        if isinstance(obj, str):
+            obj = obj.encode("utf-8")
+        return ctypes.c_char_p.from_param(obj)
+
+# errcheck function to convert a C string result to a Python string
+def _c_str_to_python(result, func, args):
+    return result.decode("utf-8") if result is not None else ""
+
+# errcheck function factory to convert a C enum result to an IntEnum
+def _enum_result(enum_type):
+    def errcheck(result, func, args):
+        return enum_type(result)
+    return errcheck
+
+class LogItem(enum.IntEnum):
+    OK = 0
+    MALLOC_FAILED = 1
+
+class Allocator(ctypes.Structure):
+    _fields_ = [
+        ("alloc_fn", ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p)),
+        ("free_fn", ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_void_p)),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class Logger(ctypes.Structure):
+    _fields_ = [
+        ("func", ctypes.CFUNCTYPE(None, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_char_p, ctypes.c_void_p)),
+        ("user_data", ctypes.c_void_p),
+    ]
+
+class Desc(ctypes.Structure):
+    _fields_ = [
+        ("max_vertices", ctypes.c_int),
+        ("color_format", ctypes.c_int),
+        ("depth_format", ctypes.c_int),
+        ("sample_count", ctypes.c_int),
+        ("ini_filename", ctypes.c_char_p),
+        ("no_default_font", ctypes.c_bool),
+        ("disable_paste_override", ctypes.c_bool),
+        ("disable_set_mouse_cursor", ctypes.c_bool),
+        ("disable_windows_resize_from_edges", ctypes.c_bool),
+        ("write_alpha_channel", ctypes.c_bool),
+        ("allocator", Allocator),
+        ("logger", Logger),
+    ]
+
+class FrameDesc(ctypes.Structure):
+    _fields_ = [
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("delta_time", ctypes.c_double),
+        ("dpi_scale", ctypes.c_float),
+    ]
+
+class FontTexDesc(ctypes.Structure):
+    _fields_ = [
+        ("min_filter", ctypes.c_int),
+        ("mag_filter", ctypes.c_int),
+    ]
+
+setup = _lib["simgui_setup"]
+setup.argtypes = [ctypes.POINTER(Desc)]
+setup.restype = None
+
+new_frame = _lib["simgui_new_frame"]
+new_frame.argtypes = [ctypes.POINTER(FrameDesc)]
+new_frame.restype = None
+
+render = _lib["simgui_render"]
+render.argtypes = []
+render.restype = None
+
+imtextureid = _lib["simgui_imtextureid"]
+imtextureid.argtypes = [sg.Image]
+imtextureid.restype = ctypes.c_uint64
+
+imtextureid_with_sampler = _lib["simgui_imtextureid_with_sampler"]
+imtextureid_with_sampler.argtypes = [sg.Image, sg.Sampler]
+imtextureid_with_sampler.restype = ctypes.c_uint64
+
+image_from_imtextureid = _lib["simgui_image_from_imtextureid"]
+image_from_imtextureid.argtypes = [ctypes.c_uint64]
+image_from_imtextureid.restype = sg.Image
+
+sampler_from_imtextureid = _lib["simgui_sampler_from_imtextureid"]
+sampler_from_imtextureid.argtypes = [ctypes.c_uint64]
+sampler_from_imtextureid.restype = sg.Sampler
+
+add_focus_event = _lib["simgui_add_focus_event"]
+add_focus_event.argtypes = [ctypes.c_bool]
+add_focus_event.restype = None
+
+add_mouse_pos_event = _lib["simgui_add_mouse_pos_event"]
+add_mouse_pos_event.argtypes = [ctypes.c_float, ctypes.c_float]
+add_mouse_pos_event.restype = None
+
+add_touch_pos_event = _lib["simgui_add_touch_pos_event"]
+add_touch_pos_event.argtypes = [ctypes.c_float, ctypes.c_float]
+add_touch_pos_event.restype = None
+
+add_mouse_button_event = _lib["simgui_add_mouse_button_event"]
+add_mouse_button_event.argtypes = [ctypes.c_int, ctypes.c_bool]
+add_mouse_button_event.restype = None
+
+add_mouse_wheel_event = _lib["simgui_add_mouse_wheel_event"]
+add_mouse_wheel_event.argtypes = [ctypes.c_float, ctypes.c_float]
+add_mouse_wheel_event.restype = None
+
+add_key_event = _lib["simgui_add_key_event"]
+add_key_event.argtypes = [ctypes.c_int, ctypes.c_bool]
+add_key_event.restype = None
+
+add_input_character = _lib["simgui_add_input_character"]
+add_input_character.argtypes = [ctypes.c_uint32]
+add_input_character.restype = None
+
+add_input_characters_utf8 = _lib["simgui_add_input_characters_utf8"]
+add_input_characters_utf8.argtypes = [_CStrParam]
+add_input_characters_utf8.restype = None
+
+add_touch_button_event = _lib["simgui_add_touch_button_event"]
+add_touch_button_event.argtypes = [ctypes.c_int, ctypes.c_bool]
+add_touch_button_event.restype = None
+
+handle_event = _lib["simgui_handle_event"]
+handle_event.argtypes = [ctypes.POINTER(sapp.Event)]
+handle_event.restype = ctypes.c_bool
+
+map_keycode = _lib["simgui_map_keycode"]
+map_keycode.argtypes = [ctypes.c_int]
+map_keycode.restype = ctypes.c_int
+
+shutdown = _lib["simgui_shutdown"]
+shutdown.argtypes = []
+shutdown.restype = None
+
+create_fonts_texture = _lib["simgui_create_fonts_texture"]
+create_fonts_texture.argtypes = [ctypes.POINTER(FontTexDesc)]
+create_fonts_texture.restype = None
+
+destroy_fonts_texture = _lib["simgui_destroy_fonts_texture"]
+destroy_fonts_texture.argtypes = []
+destroy_fonts_texture.restype = None
+
@@ -0,0 +1,293 @@
+# machine generated, do not edit
+
+import ctypes, enum
+from . import clib
+from . import gfx as sg
+
+_lib = clib.load()
+
+# argtypes converter for 'const char *' args, accepts str or bytes
+class _CStrParam:
+    @classmethod
+    def from_param(cls, obj):
+        if isinstance(obj, str):
+            obj = obj.encode("utf-8")
+        return ctypes.c_char_p.from_param(obj)
+
+# errcheck function to convert a C string result to a Python string
+def _c_str_to_python(result, func, args):
+    return result.decode("utf-8") if result is not None else ""
+
+# errcheck function factory to convert a C enum result to an IntEnum
+def _enum_result(enum_type):
+    def errcheck(result, func, args):
+        return enum_type(result)
+    return errcheck
+
+# CPython's Py_buffer struct, used for zero-copy access to buffer-protocol objects
+class _PyBuffer(ctypes.Structure):
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.c_void_p),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.c_void_p),
+        ("strides", ctypes.c_void_p),
+        ("suboffsets", ctypes.c_void_p),
+        ("internal", ctypes.c_void_p),
+    ]
+
+_PyObject_GetBuffer = ctypes.pythonapi["PyObject_GetBuffer"]
+_PyObject_GetBuffer.argtypes = [ctypes.py_object, ctypes.POINTER(_PyBuffer), ctypes.c_int]
+_PyObject_GetBuffer.restype = ctypes.c_int
+_PyBuffer_Release = ctypes.pythonapi["PyBuffer_Release"]
+_PyBuffer_Release.argtypes = [ctypes.POINTER(_PyBuffer)]
+_PyBuffer_Release.restype = None
+
+# owns a buffer export of an object, and releases it when garbage collected
+class _BufferExport:
+    def __init__(self, obj):
+        self.view = _PyBuffer()
+        _PyObject_GetBuffer(obj, ctypes.byref(self.view), 0)
+
+    def __del__(self):
+        # the module globals may already be gone at interpreter shutdown
+        if _PyBuffer_Release is not None and self.view.obj:
+            _PyBuffer_Release(ctypes.byref(self.view))
+
+class Range(ctypes.Structure):
+    _fields_ = [
+        ("ptr", ctypes.c_void_p),
+        ("size", ctypes.c_size_t),
+    ]
+
+# helper function to create a Range over any object supporting the buffer
+# protocol (bytes, bytearray, memoryview, array.array, NumPy arrays, ctypes
+# objects...) without copying. The Range holds the buffer export of the
+# object until it is garbage collected, so that resizable objects like a
+# bytearray can't be resized or reallocated while the Range points to them
+def as_range(data) -> Range:
+    export = _BufferExport(data)
+    # a void pointer which references the buffer export through ctypes' keep-alive
+    # mechanism, this is also carried over when the Range is copied into a struct
+    ptr = ctypes.cast((ctypes.py_object * 1)(export), ctypes.c_void_p)
+    ptr.value = export.view.buf
+    rng = Range()
+    rng.ptr = ptr
+    rng.size = export.view.len
+    return rng
+
+# argtypes converter for 'const sshape_range *' args, accepts a Range or any
+# object supporting the buffer protocol
+class RangeParam:
+    @classmethod
+    def from_param(cls, obj):
+        if not isinstance(obj, Range):
+            obj = as_range(obj)
+        return ctypes.byref(obj)
+
+class Mat4(ctypes.Structure):
+    _fields_ = [
+        ("m", (ctypes.c_float * 4 * 4)),
+    ]
+
+class Vertex(ctypes.Structure):
+    _fields_ = [
+        ("x", ctypes.c_float),
+        ("y", ctypes.c_float),
+        ("z", ctypes.c_float),
+        ("normal", ctypes.c_uint32),
+        ("u", ctypes.c_uint16),
+        ("v", ctypes.c_uint16),
+        ("color", ctypes.c_uint32),
+    ]
+
+class ElementRange(ctypes.Structure):
+    _fields_ = [
+        ("base_element", ctypes.c_int),
+        ("num_elements", ctypes.c_int),
+    ]
+
+class SizesItem(ctypes.Structure):
+    _fields_ = [
+        ("num", ctypes.c_uint32),
+        ("size", ctypes.c_uint32),
+    ]
+
+class Sizes(ctypes.Structure):
+    _fields_ = [
+        ("vertices", SizesItem),
+        ("indices", SizesItem),
+    ]
+
+class BufferItem(ctypes.Structure):
+    _fields_ = [
+        ("buffer", Range),
+        ("data_size", ctypes.c_size_t),
+        ("shape_offset", ctypes.c_size_t),
+    ]
+
+class Buffer(ctypes.Structure):
+    _fields_ = [
+        ("valid", ctypes.c_bool),
+        ("vertices", BufferItem),
+        ("indices", BufferItem),
+    ]
+
+class Plane(ctypes.Structure):
+    _fields_ = [
+        ("width", ctypes.c_float),
+        ("depth", ctypes.c_float),
+        ("tiles", ctypes.c_uint16),
+        ("color", ctypes.c_uint32),
+        ("random_colors", ctypes.c_bool),
+        ("merge", ctypes.c_bool),
+        ("transform", Mat4),
+    ]
+
+class Box(ctypes.Structure):
+    _fields_ = [
+        ("width", ctypes.c_float),
+        ("height", ctypes.c_float),
+        ("depth", ctypes.c_float),
+        ("tiles", ctypes.c_uint16),
+        ("color", ctypes.c_uint32),
+        ("random_colors", ctypes.c_bool),
+        ("merge", ctypes.c_bool),
+        ("transform", Mat4),
+    ]
+
+class Sphere(ctypes.Structure):
+    _fields_ = [
+        ("radius", ctypes.c_float),
+        ("slices", ctypes.c_uint16),
+        ("stacks", ctypes.c_uint16),
+        ("color", ctypes.c_uint32),
+        ("random_colors", ctypes.c_bool),
+        ("merge", ctypes.c_bool),
+        ("transform", Mat4),
+    ]
+
+class Cylinder(ctypes.Structure):
+    _fields_ = [
+        ("radius", ctypes.c_float),
+        ("height", ctypes.c_float),
+        ("slices", ctypes.c_uint16),
+        ("stacks", ctypes.c_uint16),
+        ("color", ctypes.c_uint32),
+        ("random_colors", ctypes.c_bool),
+        ("merge", ctypes.c_bool),
+        ("transform", Mat4),
+    ]
+
+class Torus(ctypes.Structure):
+    _fields_ = [
+        ("radius", ctypes.c_float),
+        ("ring_radius", ctypes.c_float),
+        ("sides", ctypes.c_uint16),
+        ("rings", ctypes.c_uint16),
+        ("color", ctypes.c_uint32),
+        ("random_colors", ctypes.c_bool),
+        ("merge", ctypes.c_bool),
+        ("transform", Mat4),
+    ]
+
+build_plane = _lib["sshape_build_plane"]
+build_plane.argtypes = [ctypes.POINTER(Buffer), ctypes.POINTER(Plane)]
+build_plane.restype = Buffer
+
+build_box = _lib["sshape_build_box"]
+build_box.argtypes = [ctypes.POINTER(Buffer), ctypes.POINTER(Box)]
+build_box.restype = Buffer
+
+build_sphere = _lib["sshape_build_sphere"]
+build_sphere.argtypes = [ctypes.POINTER(Buffer), ctypes.POINTER(Sphere)]
+build_sphere.restype = Buffer
+
+build_cylinder = _lib["sshape_build_cylinder"]
+build_cylinder.argtypes = [ctypes.POINTER(Buffer), ctypes.POINTER(Cylinder)]
+build_cylinder.restype = Buffer
+
+build_torus = _lib["sshape_build_torus"]
+build_torus.argtypes = [ctypes.POINTER(Buffer), ctypes.POINTER(Torus)]
+build_torus.restype = Buffer
+
+plane_sizes = _lib["sshape_plane_sizes"]
+plane_sizes.argtypes = [ctypes.c_uint32]
+plane_sizes.restype = Sizes
+
+box_sizes = _lib["sshape_box_sizes"]
+box_sizes.argtypes = [ctypes.c_uint32]
+box_sizes.restype = Sizes
+
+sphere_sizes = _lib["sshape_sphere_sizes"]
+sphere_sizes.argtypes = [ctypes.c_uint32, ctypes.c_uint32]
+sphere_sizes.restype = Sizes
+
+cylinder_sizes = _lib["sshape_cylinder_sizes"]
+cylinder_sizes.argtypes = [ctypes.c_uint32, ctypes.c_uint32]
+cylinder_sizes.restype = Sizes
+
+torus_sizes = _lib["sshape_torus_sizes"]
+torus_sizes.argtypes = [ctypes.c_uint32, ctypes.c_uint32]
+torus_sizes.restype = Sizes
+
+element_range = _lib["sshape_element_range"]
+element_range.argtypes = [ctypes.POINTER(Buffer)]
+element_range.restype = ElementRange
+
+vertex_buffer_desc = _lib["sshape_vertex_buffer_desc"]
+vertex_buffer_desc.argtypes = [ctypes.POINTER(Buffer)]
+vertex_buffer_desc.restype = sg.BufferDesc
+
+index_buffer_desc = _lib["sshape_index_buffer_desc"]
+index_buffer_desc.argtypes = [ctypes.POINTER(Buffer)]
+index_buffer_desc.restype = sg.BufferDesc
+
+vertex_buffer_layout_state = _lib["sshape_vertex_buffer_layout_state"]
+vertex_buffer_layout_state.argtypes = []
+vertex_buffer_layout_state.restype = sg.VertexBufferLayoutState
+
+position_vertex_attr_state = _lib["sshape_position_vertex_attr_state"]
+position_vertex_attr_state.argtypes = []
+position_vertex_attr_state.restype = sg.VertexAttrState
+
+normal_vertex_attr_state = _lib["sshape_normal_vertex_attr_state"]
+normal_vertex_attr_state.argtypes = []
+normal_vertex_attr_state.restype = sg.VertexAttrState
+
+texcoord_vertex_attr_state = _lib["sshape_texcoord_vertex_attr_state"]
+texcoord_vertex_attr_state.argtypes = []
+texcoord_vertex_attr_state.restype = sg.VertexAttrState
+
+color_vertex_attr_state = _lib["sshape_color_vertex_attr_state"]
+color_vertex_attr_state.argtypes = []
+color_vertex_attr_state.restype = sg.VertexAttrState
+
+color_4f = _lib["sshape_color_4f"]
+color_4f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
+color_4f.restype = ctypes.c_uint32
+
+color_3f = _lib["sshape_color_3f"]
+color_3f.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float]
+color_3f.restype = ctypes.c_uint32
+
+color_4b = _lib["sshape_color_4b"]
+color_4b.argtypes = [ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]
+color_4b.restype = ctypes.c_uint32
+
+color_3b = _lib["sshape_color_3b"]
+color_3b.argtypes = [ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]
+color_3b.restype = ctypes.c_uint32
+
+mat4 = _lib["sshape_mat4"]
+mat4.argtypes = [ctypes.POINTER(ctypes.c_float)]
+mat4.restype = Mat4
+
+mat4_transpose = _lib["sshape_mat4_transpose"]
+mat4_transpose.argtypes = [ctypes.POINTER(ctypes.c_float)]
+mat4_transpose.restype = Mat4
+
@@ -0,0 +1,65 @@
+# machine generated, do not edit
+
+import ctypes, enum
+from . import clib
+
+_lib = clib.load()
+
+# argtypes converter for 'const char *' args, accepts str or bytes
+class _CStrParam:
+    @classmethod
+    def from_param(cls, obj):
+        if isinstance(obj, str):
+            obj = obj.encode("utf-8")
+        return ctypes.c_char_p.from_param(obj)
+
+# errcheck function to convert a C string result to a Python string
+def _c_str_to_python(result, func, args):
+    return result.decode("utf-8") if result is not None else ""
+
+# errcheck function factory to convert a C enum result to an IntEnum
+def _enum_result(enum_type):
+    def errcheck(result, func, args):
+        return enum_type(result)
+    return errcheck
+
+setup = _lib["stm_setup"]
+setup.argtypes = []
+setup.restype = None
+
+now = _lib["stm_now"]
+now.argtypes = []
+now.restype = ctypes.c_uint64
+
+diff = _lib["stm_diff"]
+diff.argtypes = [ctypes.c_uint64, ctypes.c_uint64]
+diff.restype = ctypes.c_uint64
+
+since = _lib["stm_since"]
+since.argtypes = [ctypes.c_uint64]
+since.restype = ctypes.c_uint64
+
+laptime = _lib["stm_laptime"]
+laptime.argtypes = [ctypes.POINTER(ctypes.c_uint64)]
+laptime.restype = ctypes.c_uint64
+
+round_to_common_refresh_rate = _lib["stm_round_to_common_refresh_rate"]
+round_to_common_refresh_rate.argtypes = [ctypes.c_uint64]
+round_to_common_refresh_rate.restype = ctypes.c_uint64
+
+sec = _lib["stm_sec"]
+sec.argtypes = [ctypes.c_uint64]
+sec.restype = ctypes.c_double
+
+ms = _lib["stm_ms"]
+ms.argtypes = [ctypes.c_uint64]
+ms.restype = ctypes.c_double
+
+us = _lib["stm_us"]
+us.argtypes = [ctypes.c_uint64]
+us.restype = ctypes.c_double
+
+ns = _lib["stm_ns"]
+ns.argtypes = [ctypes.c_uint64]
+ns.restype = ctypes.c_double
+
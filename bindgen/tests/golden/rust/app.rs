@@ -0,0 +1,1467 @@
+// machine generated, do not edit
+
+#![allow(dead_code)]
+#![allow(unused_imports)]
+
+
+/// Helper function to convert a C string to a Rust string slice
+#[inline]
+fn c_char_ptr_to_rust_str(c_char_ptr: *const core::ffi::c_char) -> &'static str {
+    let c_str = unsafe { core::ffi::CStr::from_ptr(c_char_ptr) };
+    c_str.to_str().expect("c_char_ptr contained invalid Utf8 Data")
+}
+
+/// Helper function to convert a C string to a CStr, skips the UTF-8 validation
+#[inline]
+fn c_char_ptr_to_c_str(c_char_ptr: *const core::ffi::c_char) -> &'static core::ffi::CStr {
+    unsafe { core::ffi::CStr::from_ptr(c_char_ptr) }
+}
+
+/// Helper function to convert a C string to a Rust string slice without UTF-8 validation,
+/// the caller must guarantee that the C string is valid UTF-8
+#[inline]
+unsafe fn c_char_ptr_to_rust_str_unchecked(c_char_ptr: *const core::ffi::c_char) -> &'static str {
+    core::str::from_utf8_unchecked(core::ffi::CStr::from_ptr(c_char_ptr).to_bytes())
+}
+
+/// Helper function to pass a Rust string slice to C as a zero-terminated string,
+/// short strings are copied into a stack buffer instead of allocating a CString
+#[inline]
+fn with_c_str<R>(s: &str, f: impl FnOnce(*const core::ffi::c_char) -> R) -> R {
+    const STACK_BUF_SIZE: usize = 256;
+    let bytes = s.as_bytes();
+    if bytes.len() < STACK_BUF_SIZE && !bytes.contains(&0) {
+        let mut buf = [0u8; STACK_BUF_SIZE];
+        buf[..bytes.len()].copy_from_slice(bytes);
+        f(buf.as_ptr() as *const core::ffi::c_char)
+    } else {
+        let c_string = std::ffi::CString::new(s).unwrap();
+        f(c_string.as_ptr())
+    }
+}
+
+/// Helper function to cast a Rust slice into a sokol Range
+pub fn slice_as_range<T>(data: &[T]) -> Range {
+    Range { size: std::mem::size_of_val(data), ptr: data.as_ptr() as *const _ }
+}
+/// Helper function to cast a Rust reference into a sokol Range
+pub fn value_as_range<T>(value: &T) -> Range {
+    Range { size: std::mem::size_of::<T>(), ptr: value as *const T as *const _ }
+}
+
+impl<T> From<&[T]> for Range {
+    #[inline]
+    fn from(data: &[T]) -> Self {
+        slice_as_range(data)
+    }
+}
+impl<T> From<&T> for Range {
+    #[inline]
+    fn from(value: &T) -> Self {
+        value_as_range(value)
+    }
+}
+
+// misc constants
+pub const MAX_TOUCHPOINTS: usize = 8;
+pub const MAX_MOUSEBUTTONS: usize = 3;
+pub const MAX_KEYCODES: usize = 512;
+pub const MAX_ICONIMAGES: usize = 8;
+/// sapp_event_type
+///
+/// The type of event that's passed to the event handler callback
+/// in the sapp_event.type field. These are not just "traditional"
+/// input events, but also notify the application about state changes
+/// or other user-invoked actions.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum EventType {
+    Invalid,
+    KeyDown,
+    KeyUp,
+    Char,
+    MouseDown,
+    MouseUp,
+    MouseScroll,
+    MouseMove,
+    MouseEnter,
+    MouseLeave,
+    TouchesBegan,
+    TouchesMoved,
+    TouchesEnded,
+    TouchesCancelled,
+    Resized,
+    Iconified,
+    Restored,
+    Focused,
+    Unfocused,
+    Suspended,
+    Resumed,
+    QuitRequested,
+    ClipboardPasted,
+    FilesDropped,
+    Num,
+}
+impl EventType {
+    pub const fn new() -> Self {
+        Self::Invalid
+    }
+}
+impl Default for EventType {
+    fn default() -> Self {
+        Self::Invalid
+    }
+}
+/// sapp_keycode
+///
+/// The 'virtual keycode' of a KEY_DOWN or KEY_UP event in the
+/// struct field sapp_event.key_code.
+///
+/// Note that the keycode values are identical with GLFW.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(i32)]
+pub enum Keycode {
+    Invalid = 0,
+    Space = 32,
+    Apostrophe = 39,
+    Comma = 44,
+    Minus = 45,
+    Period = 46,
+    Slash = 47,
+    Num0 = 48,
+    Num1 = 49,
+    Num2 = 50,
+    Num3 = 51,
+    Num4 = 52,
+    Num5 = 53,
+    Num6 = 54,
+    Num7 = 55,
+    Num8 = 56,
+    Num9 = 57,
+    Semicolon = 59,
+    Equal = 61,
+    A = 65,
+    B = 66,
+    C = 67,
+    D = 68,
+    E = 69,
+    F = 70,
+    G = 71,
+    H = 72,
+    I = 73,
+    J = 74,
+    K = 75,
+    L = 76,
+    M = 77,
+    N = 78,
+    O = 79,
+    P = 80,
+    Q = 81,
+    R = 82,
+    S = 83,
+    T = 84,
+    U = 85,
+    V = 86,
+    W = 87,
+    X = 88,
+    Y = 89,
+    Z = 90,
+    LeftBracket = 91,
+    Backslash = 92,
+    RightBracket = 93,
+    GraveAccent = 96,
+    World1 = 161,
+    World2 = 162,
+    Escape = 256,
+    Enter = 257,
+    Tab = 258,
+    Backspace = 259,
+    Insert = 260,
+    Delete = 261,
+    Right = 262,
+    Left = 263,
+    Down = 264,
+    Up = 265,
+    PageUp = 266,
+    PageDown = 267,
+    Home = 268,
+    End = 269,
+    CapsLock = 280,
+    ScrollLock = 281,
+    NumLock = 282,
+    PrintScreen = 283,
+    Pause = 284,
+    F1 = 290,
+    F2 = 291,
+    F3 = 292,
+    F4 = 293,
+    F5 = 294,
+    F6 = 295,
+    F7 = 296,
+    F8 = 297,
+    F9 = 298,
+    F10 = 299,
+    F11 = 300,
+    F12 = 301,
+    F13 = 302,
+    F14 = 303,
+    F15 = 304,
+    F16 = 305,
+    F17 = 306,
+    F18 = 307,
+    F19 = 308,
+    F20 = 309,
+    F21 = 310,
+    F22 = 311,
+    F23 = 312,
+    F24 = 313,
+    F25 = 314,
+    Kp0 = 320,
+    Kp1 = 321,
+    Kp2 = 322,
+    Kp3 = 323,
+    Kp4 = 324,
+    Kp5 = 325,
+    Kp6 = 326,
+    Kp7 = 327,
+    Kp8 = 328,
+    Kp9 = 329,
+    KpDecimal = 330,
+    KpDivide = 331,
+    KpMultiply = 332,
+    KpSubtract = 333,
+    KpAdd = 334,
+    KpEnter = 335,
+    KpEqual = 336,
+    LeftShift = 340,
+    LeftControl = 341,
+    LeftAlt = 342,
+    LeftSuper = 343,
+    RightShift = 344,
+    RightControl = 345,
+    RightAlt = 346,
+    RightSuper = 347,
+    Menu = 348,
+}
+impl Keycode {
+    pub const fn new() -> Self {
+        Self::Invalid
+    }
+}
+impl Default for Keycode {
+    fn default() -> Self {
+        Self::Invalid
+    }
+}
+/// Android specific 'tool type' enum for touch events. This lets the
+/// application check what type of input device was used for
+/// touch events.
+///
+/// NOTE: the values must remain in sync with the corresponding
+/// Android SDK type, so don't change those.
+///
+/// See <https://developer.android.com/reference/android/view/MotionEvent#TOOL_TYPE_UNKNOWN>
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(i32)]
+pub enum AndroidTooltype {
+    /// TOOL_TYPE_UNKNOWN
+    Unknown = 0,
+    /// TOOL_TYPE_FINGER
+    Finger = 1,
+    /// TOOL_TYPE_STYLUS
+    Stylus = 2,
+    /// TOOL_TYPE_MOUSE
+    Mouse = 3,
+}
+impl AndroidTooltype {
+    pub const fn new() -> Self {
+        Self::Unknown
+    }
+}
+impl Default for AndroidTooltype {
+    fn default() -> Self {
+        Self::Unknown
+    }
+}
+/// sapp_touchpoint
+///
+/// Describes a single touchpoint in a multitouch event (TOUCHES_BEGAN,
+/// TOUCHES_MOVED, TOUCHES_ENDED).
+///
+/// Touch points are stored in the nested array sapp_event.touches\[\],
+/// and the number of touches is stored in sapp_event.num_touches.
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Touchpoint {
+    pub identifier: usize,
+    pub pos_x: f32,
+    pub pos_y: f32,
+    /// only valid on Android
+    pub android_tooltype: AndroidTooltype,
+    pub changed: bool,
+}
+impl Touchpoint {
+    pub const fn new() -> Self {
+        Self {
+            identifier: 0,
+            pos_x: 0.0,
+            pos_y: 0.0,
+            android_tooltype: AndroidTooltype::new(),
+            changed: false,
+        }
+    }
+}
+impl Default for Touchpoint {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sapp_mousebutton
+///
+/// The currently pressed mouse button in the events MOUSE_DOWN
+/// and MOUSE_UP, stored in the struct field sapp_event.mouse_button.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(i32)]
+pub enum Mousebutton {
+    Left = 0,
+    Right = 1,
+    Middle = 2,
+    Invalid = 256,
+}
+impl Mousebutton {
+    pub const fn new() -> Self {
+        Self::Left
+    }
+}
+impl Default for Mousebutton {
+    fn default() -> Self {
+        Self::Left
+    }
+}
+// These are currently pressed modifier keys (and mouse buttons) which are
+// passed in the event struct field sapp_event.modifiers.
+/// left or right shift key
+pub const MODIFIER_SHIFT: u32 = 1;
+/// left or right control key
+pub const MODIFIER_CTRL: u32 = 2;
+/// left or right alt key
+pub const MODIFIER_ALT: u32 = 4;
+/// left or right 'super' key
+pub const MODIFIER_SUPER: u32 = 8;
+/// left mouse button
+pub const MODIFIER_LMB: u32 = 256;
+/// right mouse button
+pub const MODIFIER_RMB: u32 = 512;
+/// middle mouse button
+pub const MODIFIER_MMB: u32 = 1024;
+/// sapp_event
+///
+/// This is an all-in-one event struct passed to the event handler
+/// user callback function. Note that it depends on the event
+/// type what struct fields actually contain useful values, so you
+/// should first check the event type before reading other struct
+/// fields.
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Event {
+    /// current frame counter, always valid, useful for checking if two events were issued in the same frame
+    pub frame_count: u64,
+    /// the event type, always valid
+    pub _type: EventType,
+    /// the virtual key code, only valid in KEY_UP, KEY_DOWN
+    pub key_code: Keycode,
+    /// the UTF-32 character code, only valid in CHAR events
+    pub char_code: u32,
+    /// true if this is a key-repeat event, valid in KEY_UP, KEY_DOWN and CHAR
+    pub key_repeat: bool,
+    /// current modifier keys, valid in all key-, char- and mouse-events
+    pub modifiers: u32,
+    /// mouse button that was pressed or released, valid in MOUSE_DOWN, MOUSE_UP
+    pub mouse_button: Mousebutton,
+    /// current horizontal mouse position in pixels, always valid except during mouse lock
+    pub mouse_x: f32,
+    /// current vertical mouse position in pixels, always valid except during mouse lock
+    pub mouse_y: f32,
+    /// relative horizontal mouse movement since last frame, always valid
+    pub mouse_dx: f32,
+    /// relative vertical mouse movement since last frame, always valid
+    pub mouse_dy: f32,
+    /// horizontal mouse wheel scroll distance, valid in MOUSE_SCROLL events
+    pub scroll_x: f32,
+    /// vertical mouse wheel scroll distance, valid in MOUSE_SCROLL events
+    pub scroll_y: f32,
+    /// number of valid items in the touches\[\] array
+    pub num_touches: i32,
+    /// current touch points, valid in TOUCHES_BEGIN, TOUCHES_MOVED, TOUCHES_ENDED
+    pub touches: [Touchpoint; 8],
+    /// current window- and framebuffer sizes in pixels, always valid
+    pub window_width: i32,
+    pub window_height: i32,
+    /// = window_width * dpi_scale
+    pub framebuffer_width: i32,
+    /// = window_height * dpi_scale
+    pub framebuffer_height: i32,
+}
+impl Event {
+    pub const fn new() -> Self {
+        Self {
+            frame_count: 0,
+            _type: EventType::new(),
+            key_code: Keycode::new(),
+            char_code: 0,
+            key_repeat: false,
+            modifiers: 0,
+            mouse_button: Mousebutton::new(),
+            mouse_x: 0.0,
+            mouse_y: 0.0,
+            mouse_dx: 0.0,
+            mouse_dy: 0.0,
+            scroll_x: 0.0,
+            scroll_y: 0.0,
+            num_touches: 0,
+            touches: [Touchpoint::new(); 8],
+            window_width: 0,
+            window_height: 0,
+            framebuffer_width: 0,
+            framebuffer_height: 0,
+        }
+    }
+}
+impl Default for Event {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sg_range
+///
+/// A general pointer/size-pair struct and constructor macros for passing binary blobs
+/// into sokol_app.h.
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Range {
+    pub ptr: *const core::ffi::c_void,
+    pub size: usize,
+}
+impl Range {
+    pub const fn new() -> Self {
+        Self {
+            ptr: core::ptr::null(),
+            size: 0,
+        }
+    }
+}
+impl Default for Range {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sapp_image_desc
+///
+/// This is used to describe image data to sokol_app.h (at first, window
+/// icons, later maybe cursor images).
+///
+/// Note that the actual image pixel format depends on the use case:
+///
+/// - window icon pixels are RGBA8
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct ImageDesc {
+    pub width: i32,
+    pub height: i32,
+    pub pixels: Range,
+}
+impl ImageDesc {
+    pub const fn new() -> Self {
+        Self {
+            width: 0,
+            height: 0,
+            pixels: Range::new(),
+        }
+    }
+}
+impl Default for ImageDesc {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sapp_icon_desc
+///
+/// An icon description structure for use in sapp_desc.icon and
+/// sapp_set_icon().
+///
+/// When setting a custom image, the application can provide a number of
+/// candidates differing in size, and sokol_app.h will pick the image(s)
+/// closest to the size expected by the platform's window system.
+///
+/// To set sokol-app's default icon, set .sokol_default to true.
+///
+/// Otherwise provide candidate images of different sizes in the
+/// images\[\] array.
+///
+/// If both the sokol_default flag is set to true, any image candidates
+/// will be ignored and the sokol_app.h default icon will be set.
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct IconDesc {
+    pub sokol_default: bool,
+    pub images: [ImageDesc; 8],
+}
+impl IconDesc {
+    pub const fn new() -> Self {
+        Self {
+            sokol_default: false,
+            images: [ImageDesc::new(); 8],
+        }
+    }
+}
+impl Default for IconDesc {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sapp_allocator
+///
+/// Used in sapp_desc to provide custom memory-alloc and -free functions
+/// to sokol_app.h. If memory management should be overridden, both the
+/// alloc_fn and free_fn function must be provided (e.g. it's not valid to
+/// override one function but not the other).
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Allocator {
+    pub alloc_fn: Option<extern "C" fn(usize, *mut core::ffi::c_void) -> *mut core::ffi::c_void>,
+    pub free_fn: Option<extern "C" fn(*mut core::ffi::c_void, *mut core::ffi::c_void)>,
+    pub user_data: *mut core::ffi::c_void,
+}
+impl Allocator {
+    pub const fn new() -> Self {
+        Self {
+            alloc_fn: None,
+            free_fn: None,
+            user_data: core::ptr::null_mut(),
+        }
+    }
+}
+impl Default for Allocator {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(i32)]
+pub enum LogItem {
+    Ok,
+    MallocFailed,
+    MacosInvalidNsopenglProfile,
+    Win32LoadOpengl32DllFailed,
+    Win32CreateHelperWindowFailed,
+    Win32HelperWindowGetdcFailed,
+    Win32DummyContextSetPixelformatFailed,
+    Win32CreateDummyContextFailed,
+    Win32DummyContextMakeCurrentFailed,
+    Win32GetPixelformatAttribFailed,
+    Win32WglFindPixelformatFailed,
+    Win32WglDescribePixelformatFailed,
+    Win32WglSetPixelformatFailed,
+    Win32WglArbCreateContextRequired,
+    Win32WglArbCreateContextProfileRequired,
+    Win32WglOpenglVersionNotSupported,
+    Win32WglOpenglProfileNotSupported,
+    Win32WglIncompatibleDeviceContext,
+    Win32WglCreateContextAttribsFailedOther,
+    Win32D3d11CreateDeviceAndSwapchainWithDebugFailed,
+    Win32D3d11GetIdxgifactoryFailed,
+    Win32D3d11GetIdxgiadapterFailed,
+    Win32D3d11QueryInterfaceIdxgidevice1Failed,
+    Win32RegisterRawInputDevicesFailedMouseLock,
+    Win32RegisterRawInputDevicesFailedMouseUnlock,
+    Win32GetRawInputDataFailed,
+    LinuxGlxLoadLibglFailed,
+    LinuxGlxLoadEntryPointsFailed,
+    LinuxGlxExtensionNotFound,
+    LinuxGlxQueryVersionFailed,
+    LinuxGlxVersionTooLow,
+    LinuxGlxNoGlxfbconfigs,
+    LinuxGlxNoSuitableGlxfbconfig,
+    LinuxGlxGetVisualFromFbconfigFailed,
+    LinuxGlxRequiredExtensionsMissing,
+    LinuxGlxCreateContextFailed,
+    LinuxGlxCreateWindowFailed,
+    LinuxX11CreateWindowFailed,
+    LinuxEglBindOpenglApiFailed,
+    LinuxEglBindOpenglEsApiFailed,
+    LinuxEglGetDisplayFailed,
+    LinuxEglInitializeFailed,
+    LinuxEglNoConfigs,
+    LinuxEglNoNativeVisual,
+    LinuxEglGetVisualInfoFailed,
+    LinuxEglCreateWindowSurfaceFailed,
+    LinuxEglCreateContextFailed,
+    LinuxEglMakeCurrentFailed,
+    LinuxX11OpenDisplayFailed,
+    LinuxX11QuerySystemDpiFailed,
+    LinuxX11DroppedFileUriWrongScheme,
+    LinuxX11FailedToBecomeOwnerOfClipboard,
+    AndroidUnsupportedInputEventInputCb,
+    AndroidUnsupportedInputEventMainCb,
+    AndroidReadMsgFailed,
+    AndroidWriteMsgFailed,
+    AndroidMsgCreate,
+    AndroidMsgResume,
+    AndroidMsgPause,
+    AndroidMsgFocus,
+    AndroidMsgNoFocus,
+    AndroidMsgSetNativeWindow,
+    AndroidMsgSetInputQueue,
+    AndroidMsgDestroy,
+    AndroidUnknownMsg,
+    AndroidLoopThreadStarted,
+    AndroidLoopThreadDone,
+    AndroidNativeActivityOnstart,
+    AndroidNativeActivityOnresume,
+    AndroidNativeActivityOnsaveinstancestate,
+    AndroidNativeActivityOnwindowfocuschanged,
+    AndroidNativeActivityOnpause,
+    AndroidNativeActivityOnstop,
+    AndroidNativeActivityOnnativewindowcreated,
+    AndroidNativeActivityOnnativewindowdestroyed,
+    AndroidNativeActivityOninputqueuecreated,
+    AndroidNativeActivityOninputqueuedestroyed,
+    AndroidNativeActivityOnconfigurationchanged,
+    AndroidNativeActivityOnlowmemory,
+    AndroidNativeActivityOndestroy,
+    AndroidNativeActivityDone,
+    AndroidNativeActivityOncreate,
+    AndroidCreateThreadPipeFailed,
+    AndroidNativeActivityCreateSuccess,
+    WgpuSwapchainCreateSurfaceFailed,
+    WgpuSwapchainCreateSwapchainFailed,
+    WgpuSwapchainCreateDepthStencilTextureFailed,
+    WgpuSwapchainCreateDepthStencilViewFailed,
+    WgpuSwapchainCreateMsaaTextureFailed,
+    WgpuSwapchainCreateMsaaViewFailed,
+    WgpuRequestDeviceStatusError,
+    WgpuRequestDeviceStatusUnknown,
+    WgpuRequestAdapterStatusUnavailable,
+    WgpuRequestAdapterStatusError,
+    WgpuRequestAdapterStatusUnknown,
+    WgpuCreateInstanceFailed,
+    ImageDataSizeMismatch,
+    DroppedFilePathTooLong,
+    ClipboardStringTooBig,
+}
+impl LogItem {
+    pub const fn new() -> Self {
+        Self::Ok
+    }
+}
+impl Default for LogItem {
+    fn default() -> Self {
+        Self::Ok
+    }
+}
+/// sapp_logger
+///
+/// Used in sapp_desc to provide a logging function. Please be aware that
+/// without logging function, sokol-app will be completely silent, e.g. it will
+/// not report errors or warnings. For maximum error verbosity, compile in
+/// debug mode (e.g. NDEBUG *not* defined) and install a logger (for instance
+/// the standard logging function from sokol_log.h).
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Logger {
+    pub func: Option<extern "C" fn(*const core::ffi::c_char, u32, u32, *const core::ffi::c_char, u32, *const core::ffi::c_char, *mut core::ffi::c_void)>,
+    pub user_data: *mut core::ffi::c_void,
+}
+impl Logger {
+    pub const fn new() -> Self {
+        Self {
+            func: None,
+            user_data: core::ptr::null_mut(),
+        }
+    }
+}
+impl Default for Logger {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Desc {
+    /// these are the user-provided callbacks without user data
+    pub init_cb: Option<extern "C" fn()>,
+    pub frame_cb: Option<extern "C" fn()>,
+    pub cleanup_cb: Option<extern "C" fn()>,
+    pub event_cb: Option<extern "C" fn(*const Event)>,
+    /// these are the user-provided callbacks with user data
+    pub user_data: *mut core::ffi::c_void,
+    pub init_userdata_cb: Option<extern "C" fn(*mut core::ffi::c_void)>,
+    pub frame_userdata_cb: Option<extern "C" fn(*mut core::ffi::c_void)>,
+    pub cleanup_userdata_cb: Option<extern "C" fn(*mut core::ffi::c_void)>,
+    pub event_userdata_cb: Option<extern "C" fn(*const Event, *mut core::ffi::c_void)>,
+    /// the preferred width of the window / canvas
+    pub width: i32,
+    /// the preferred height of the window / canvas
+    pub height: i32,
+    /// MSAA sample count
+    pub sample_count: i32,
+    /// the preferred swap interval (ignored on some platforms)
+    pub swap_interval: i32,
+    /// whether the rendering canvas is full-resolution on HighDPI displays
+    pub high_dpi: bool,
+    /// whether the window should be created in fullscreen mode
+    pub fullscreen: bool,
+    /// whether the framebuffer should have an alpha channel (ignored on some platforms)
+    pub alpha: bool,
+    /// the window title as UTF-8 encoded string
+    pub window_title: *const core::ffi::c_char,
+    /// enable clipboard access, default is false
+    pub enable_clipboard: bool,
+    /// max size of clipboard content in bytes
+    pub clipboard_size: i32,
+    /// enable file dropping (drag'n'drop), default is false
+    pub enable_dragndrop: bool,
+    /// max number of dropped files to process (default: 1)
+    pub max_dropped_files: i32,
+    /// max length in bytes of a dropped UTF-8 file path (default: 2048)
+    pub max_dropped_file_path_length: i32,
+    /// the initial window icon to set
+    pub icon: IconDesc,
+    /// optional memory allocation overrides (default: malloc/free)
+    pub allocator: Allocator,
+    /// logging callback override (default: NO LOGGING!)
+    pub logger: Logger,
+    /// override GL major and minor version (the default GL version is 4.1 on macOS, 4.3 elsewhere)
+    pub gl_major_version: i32,
+    pub gl_minor_version: i32,
+    /// if true, set the output console codepage to UTF-8
+    pub win32_console_utf8: bool,
+    /// if true, attach stdout/stderr to a new console window
+    pub win32_console_create: bool,
+    /// if true, attach stdout/stderr to parent process
+    pub win32_console_attach: bool,
+    /// css selector of the HTML5 canvas element, default is "#canvas"
+    pub html5_canvas_selector: *const core::ffi::c_char,
+    /// if true, the HTML5 canvas size is set to sapp_desc.width/height, otherwise canvas size is tracked
+    pub html5_canvas_resize: bool,
+    /// HTML5 only: whether to preserve default framebuffer content between frames
+    pub html5_preserve_drawing_buffer: bool,
+    /// HTML5 only: whether the rendered pixels use premultiplied alpha convention
+    pub html5_premultiplied_alpha: bool,
+    /// initial state of the internal html5_ask_leave_site flag (see sapp_html5_ask_leave_site())
+    pub html5_ask_leave_site: bool,
+    /// if true, mouse events will bubble up to the web page
+    pub html5_bubble_mouse_events: bool,
+    /// same for touch events
+    pub html5_bubble_touch_events: bool,
+    /// same for wheel events
+    pub html5_bubble_wheel_events: bool,
+    /// if true, bubble up *all* key events to browser, not just key events that represent characters
+    pub html5_bubble_key_events: bool,
+    /// if true, bubble up character events to browser
+    pub html5_bubble_char_events: bool,
+    /// if true, use emscripten_set_main_loop() instead of emscripten_request_animation_frame_loop()
+    pub html5_use_emsc_set_main_loop: bool,
+    /// this will be passed as the simulate_infinite_loop arg to emscripten_set_main_loop()
+    pub html5_emsc_set_main_loop_simulate_infinite_loop: bool,
+    /// if true, showing the iOS keyboard shrinks the canvas
+    pub ios_keyboard_resizes_canvas: bool,
+}
+impl Desc {
+    pub const fn new() -> Self {
+        Self {
+            init_cb: None,
+            frame_cb: None,
+            cleanup_cb: None,
+            event_cb: None,
+            user_data: core::ptr::null_mut(),
+            init_userdata_cb: None,
+            frame_userdata_cb: None,
+            cleanup_userdata_cb: None,
+            event_userdata_cb: None,
+            width: 0,
+            height: 0,
+            sample_count: 0,
+            swap_interval: 0,
+            high_dpi: false,
+            fullscreen: false,
+            alpha: false,
+            window_title: core::ptr::null(),
+            enable_clipboard: false,
+            clipboard_size: 0,
+            enable_dragndrop: false,
+            max_dropped_files: 0,
+            max_dropped_file_path_length: 0,
+            icon: IconDesc::new(),
+            allocator: Allocator::new(),
+            logger: Logger::new(),
+            gl_major_version: 0,
+            gl_minor_version: 0,
+            win32_console_utf8: false,
+            win32_console_create: false,
+            win32_console_attach: false,
+            html5_canvas_selector: core::ptr::null(),
+            html5_canvas_resize: false,
+            html5_preserve_drawing_buffer: false,
+            html5_premultiplied_alpha: false,
+            html5_ask_leave_site: false,
+            html5_bubble_mouse_events: false,
+            html5_bubble_touch_events: false,
+            html5_bubble_wheel_events: false,
+            html5_bubble_key_events: false,
+            html5_bubble_char_events: false,
+            html5_use_emsc_set_main_loop: false,
+            html5_emsc_set_main_loop_simulate_infinite_loop: false,
+            ios_keyboard_resizes_canvas: false,
+        }
+    }
+}
+impl Default for Desc {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// HTML5 specific: request and response structs for
+///   asynchronously loading dropped-file content.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(i32)]
+pub enum Html5FetchError {
+    FetchErrorNoError,
+    FetchErrorBufferTooSmall,
+    FetchErrorOther,
+}
+impl Html5FetchError {
+    pub const fn new() -> Self {
+        Self::FetchErrorNoError
+    }
+}
+impl Default for Html5FetchError {
+    fn default() -> Self {
+        Self::FetchErrorNoError
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Html5FetchResponse {
+    /// true if the loading operation has succeeded
+    pub succeeded: bool,
+    pub error_code: Html5FetchError,
+    /// index of the dropped file (0..sapp_get_num_dropped_filed()-1)
+    pub file_index: i32,
+    /// pointer and size of the fetched data (data.ptr == buffer.ptr, data.size \<= buffer.size)
+    pub data: Range,
+    /// the user-provided buffer ptr/size pair (buffer.ptr == data.ptr, buffer.size \>= data.size)
+    pub buffer: Range,
+    /// user-provided user data pointer
+    pub user_data: *mut core::ffi::c_void,
+}
+impl Html5FetchResponse {
+    pub const fn new() -> Self {
+        Self {
+            succeeded: false,
+            error_code: Html5FetchError::new(),
+            file_index: 0,
+            data: Range::new(),
+            buffer: Range::new(),
+            user_data: core::ptr::null_mut(),
+        }
+    }
+}
+impl Default for Html5FetchResponse {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Html5FetchRequest {
+    /// 0..sapp_get_num_dropped_files()-1
+    pub dropped_file_index: i32,
+    /// response callback function pointer (required)
+    pub callback: Option<extern "C" fn(*const Html5FetchResponse)>,
+    /// ptr/size of a memory buffer to load the data into
+    pub buffer: Range,
+    /// optional userdata pointer
+    pub user_data: *mut core::ffi::c_void,
+}
+impl Html5FetchRequest {
+    pub const fn new() -> Self {
+        Self {
+            dropped_file_index: 0,
+            callback: None,
+            buffer: Range::new(),
+            user_data: core::ptr::null_mut(),
+        }
+    }
+}
+impl Default for Html5FetchRequest {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sapp_mouse_cursor
+///
+/// Predefined cursor image definitions, set with sapp_set_mouse_cursor(sapp_mouse_cursor cursor)
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(i32)]
+pub enum MouseCursor {
+    /// equivalent with system default cursor
+    Default = 0,
+    Arrow,
+    Ibeam,
+    Crosshair,
+    PointingHand,
+    ResizeEw,
+    ResizeNs,
+    ResizeNwse,
+    ResizeNesw,
+    ResizeAll,
+    NotAllowed,
+    Num,
+}
+impl MouseCursor {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for MouseCursor {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+pub mod ffi {
+    #![allow(unused_imports)]
+    use super::*;
+    extern "C" {
+        pub fn sapp_isvalid() -> bool;
+        pub fn sapp_width() -> i32;
+        pub fn sapp_widthf() -> f32;
+        pub fn sapp_height() -> i32;
+        pub fn sapp_heightf() -> f32;
+        pub fn sapp_color_format() -> i32;
+        pub fn sapp_depth_format() -> i32;
+        pub fn sapp_sample_count() -> i32;
+        pub fn sapp_high_dpi() -> bool;
+        pub fn sapp_dpi_scale() -> f32;
+        pub fn sapp_show_keyboard(show: bool);
+        pub fn sapp_keyboard_shown() -> bool;
+        pub fn sapp_is_fullscreen() -> bool;
+        pub fn sapp_toggle_fullscreen();
+        pub fn sapp_show_mouse(show: bool);
+        pub fn sapp_mouse_shown() -> bool;
+        pub fn sapp_lock_mouse(lock: bool);
+        pub fn sapp_mouse_locked() -> bool;
+        pub fn sapp_set_mouse_cursor(cursor: MouseCursor);
+        pub fn sapp_get_mouse_cursor() -> MouseCursor;
+        pub fn sapp_userdata() -> *mut core::ffi::c_void;
+        pub fn sapp_query_desc() -> Desc;
+        pub fn sapp_request_quit();
+        pub fn sapp_cancel_quit();
+        pub fn sapp_quit();
+        pub fn sapp_consume_event();
+        pub fn sapp_frame_count() -> u64;
+        pub fn sapp_frame_duration() -> f64;
+        pub fn sapp_set_clipboard_string(str: *const core::ffi::c_char);
+        pub fn sapp_get_clipboard_string() -> *const core::ffi::c_char;
+        pub fn sapp_set_window_title(str: *const core::ffi::c_char);
+        pub fn sapp_set_icon(icon_desc: *const IconDesc);
+        pub fn sapp_get_num_dropped_files() -> i32;
+        pub fn sapp_get_dropped_file_path(index: i32) -> *const core::ffi::c_char;
+        pub fn sapp_run(desc: *const Desc);
+        pub fn sapp_egl_get_display() -> *const core::ffi::c_void;
+        pub fn sapp_egl_get_context() -> *const core::ffi::c_void;
+        pub fn sapp_html5_ask_leave_site(ask: bool);
+        pub fn sapp_html5_get_dropped_file_size(index: i32) -> u32;
+        pub fn sapp_html5_fetch_dropped_file(request: *const Html5FetchRequest);
+        pub fn sapp_metal_get_device() -> *const core::ffi::c_void;
+        pub fn sapp_metal_get_current_drawable() -> *const core::ffi::c_void;
+        pub fn sapp_metal_get_depth_stencil_texture() -> *const core::ffi::c_void;
+        pub fn sapp_metal_get_msaa_color_texture() -> *const core::ffi::c_void;
+        pub fn sapp_macos_get_window() -> *const core::ffi::c_void;
+        pub fn sapp_ios_get_window() -> *const core::ffi::c_void;
+        pub fn sapp_d3d11_get_device() -> *const core::ffi::c_void;
+        pub fn sapp_d3d11_get_device_context() -> *const core::ffi::c_void;
+        pub fn sapp_d3d11_get_swap_chain() -> *const core::ffi::c_void;
+        pub fn sapp_d3d11_get_render_view() -> *const core::ffi::c_void;
+        pub fn sapp_d3d11_get_resolve_view() -> *const core::ffi::c_void;
+        pub fn sapp_d3d11_get_depth_stencil_view() -> *const core::ffi::c_void;
+        pub fn sapp_win32_get_hwnd() -> *const core::ffi::c_void;
+        pub fn sapp_wgpu_get_device() -> *const core::ffi::c_void;
+        pub fn sapp_wgpu_get_render_view() -> *const core::ffi::c_void;
+        pub fn sapp_wgpu_get_resolve_view() -> *const core::ffi::c_void;
+        pub fn sapp_wgpu_get_depth_stencil_view() -> *const core::ffi::c_void;
+        pub fn sapp_gl_get_framebuffer() -> u32;
+        pub fn sapp_gl_get_major_version() -> i32;
+        pub fn sapp_gl_get_minor_version() -> i32;
+        pub fn sapp_android_get_native_activity() -> *const core::ffi::c_void;
+    }
+}
+/// returns true after sokol-app has been initialized
+#[inline]
+pub fn isvalid() -> bool {
+    unsafe {
+        ffi::sapp_isvalid()
+    }
+}
+/// returns the current framebuffer width in pixels
+#[inline]
+pub fn width() -> i32 {
+    unsafe {
+        ffi::sapp_width()
+    }
+}
+/// same as sapp_width(), but returns float
+#[inline]
+pub fn widthf() -> f32 {
+    unsafe {
+        ffi::sapp_widthf()
+    }
+}
+/// returns the current framebuffer height in pixels
+#[inline]
+pub fn height() -> i32 {
+    unsafe {
+        ffi::sapp_height()
+    }
+}
+/// same as sapp_height(), but returns float
+#[inline]
+pub fn heightf() -> f32 {
+    unsafe {
+        ffi::sapp_heightf()
+    }
+}
+/// get default framebuffer color pixel format
+#[inline]
+pub fn color_format() -> i32 {
+    unsafe {
+        ffi::sapp_color_format()
+    }
+}
+/// get default framebuffer depth pixel format
+#[inline]
+pub fn depth_format() -> i32 {
+    unsafe {
+        ffi::sapp_depth_format()
+    }
+}
+/// get default framebuffer sample count
+#[inline]
+pub fn sample_count() -> i32 {
+    unsafe {
+        ffi::sapp_sample_count()
+    }
+}
+/// returns true when high_dpi was requested and actually running in a high-dpi scenario
+#[inline]
+pub fn high_dpi() -> bool {
+    unsafe {
+        ffi::sapp_high_dpi()
+    }
+}
+/// returns the dpi scaling factor (window pixels to framebuffer pixels)
+#[inline]
+pub fn dpi_scale() -> f32 {
+    unsafe {
+        ffi::sapp_dpi_scale()
+    }
+}
+/// show or hide the mobile device onscreen keyboard
+#[inline]
+pub fn show_keyboard(show: bool) {
+    unsafe {
+        ffi::sapp_show_keyboard(show)
+    }
+}
+/// return true if the mobile device onscreen keyboard is currently shown
+#[inline]
+pub fn keyboard_shown() -> bool {
+    unsafe {
+        ffi::sapp_keyboard_shown()
+    }
+}
+/// query fullscreen mode
+#[inline]
+pub fn is_fullscreen() -> bool {
+    unsafe {
+        ffi::sapp_is_fullscreen()
+    }
+}
+/// toggle fullscreen mode
+#[inline]
+pub fn toggle_fullscreen() {
+    unsafe {
+        ffi::sapp_toggle_fullscreen()
+    }
+}
+/// show or hide the mouse cursor
+#[inline]
+pub fn show_mouse(show: bool) {
+    unsafe {
+        ffi::sapp_show_mouse(show)
+    }
+}
+/// show or hide the mouse cursor
+#[inline]
+pub fn mouse_shown() -> bool {
+    unsafe {
+        ffi::sapp_mouse_shown()
+    }
+}
+/// enable/disable mouse-pointer-lock mode
+#[inline]
+pub fn lock_mouse(lock: bool) {
+    unsafe {
+        ffi::sapp_lock_mouse(lock)
+    }
+}
+/// return true if in mouse-pointer-lock mode (this may toggle a few frames later)
+#[inline]
+pub fn mouse_locked() -> bool {
+    unsafe {
+        ffi::sapp_mouse_locked()
+    }
+}
+/// set mouse cursor type
+#[inline]
+pub fn set_mouse_cursor(cursor: MouseCursor) {
+    unsafe {
+        ffi::sapp_set_mouse_cursor(cursor)
+    }
+}
+/// get current mouse cursor type
+#[inline]
+pub fn get_mouse_cursor() -> MouseCursor {
+    unsafe {
+        ffi::sapp_get_mouse_cursor()
+    }
+}
+/// return the userdata pointer optionally provided in sapp_desc
+#[inline]
+pub fn userdata() -> *mut core::ffi::c_void {
+    unsafe {
+        ffi::sapp_userdata()
+    }
+}
+/// return a copy of the sapp_desc structure
+#[inline]
+pub fn query_desc() -> Desc {
+    unsafe {
+        ffi::sapp_query_desc()
+    }
+}
+/// initiate a "soft quit" (sends SAPP_EVENTTYPE_QUIT_REQUESTED)
+#[inline]
+pub fn request_quit() {
+    unsafe {
+        ffi::sapp_request_quit()
+    }
+}
+/// cancel a pending quit (when SAPP_EVENTTYPE_QUIT_REQUESTED has been received)
+#[inline]
+pub fn cancel_quit() {
+    unsafe {
+        ffi::sapp_cancel_quit()
+    }
+}
+/// initiate a "hard quit" (quit application without sending SAPP_EVENTTYPE_QUIT_REQUESTED)
+#[inline]
+pub fn quit() {
+    unsafe {
+        ffi::sapp_quit()
+    }
+}
+/// call from inside event callback to consume the current event (don't forward to platform)
+#[inline]
+pub fn consume_event() {
+    unsafe {
+        ffi::sapp_consume_event()
+    }
+}
+/// get the current frame counter (for comparison with sapp_event.frame_count)
+#[inline]
+pub fn frame_count() -> u64 {
+    unsafe {
+        ffi::sapp_frame_count()
+    }
+}
+/// get an averaged/smoothed frame duration in seconds
+#[inline]
+pub fn frame_duration() -> f64 {
+    unsafe {
+        ffi::sapp_frame_duration()
+    }
+}
+/// write string into clipboard
+#[inline]
+pub fn set_clipboard_string(str: &str) {
+    with_c_str(str, |tmp_0| unsafe {
+        ffi::sapp_set_clipboard_string(tmp_0)
+    })
+}
+#[inline]
+pub fn set_clipboard_string_cstr(str: &core::ffi::CStr) {
+    unsafe {
+        ffi::sapp_set_clipboard_string(str.as_ptr())
+    }
+}
+/// read string from clipboard (usually during SAPP_EVENTTYPE_CLIPBOARD_PASTED)
+#[inline]
+pub fn get_clipboard_string() -> &'static str {
+    unsafe {
+        c_char_ptr_to_rust_str(ffi::sapp_get_clipboard_string())
+    }
+}
+#[inline]
+pub fn get_clipboard_string_as_cstr() -> &'static core::ffi::CStr {
+    unsafe {
+        c_char_ptr_to_c_str(ffi::sapp_get_clipboard_string())
+    }
+}
+/// # Safety
+///
+/// The returned C string must be valid UTF-8, this isn't checked.
+#[inline]
+pub unsafe fn get_clipboard_string_unchecked() -> &'static str {
+    unsafe {
+        c_char_ptr_to_rust_str_unchecked(ffi::sapp_get_clipboard_string())
+    }
+}
+/// set the window title (only on desktop platforms)
+#[inline]
+pub fn set_window_title(str: &str) {
+    with_c_str(str, |tmp_0| unsafe {
+        ffi::sapp_set_window_title(tmp_0)
+    })
+}
+#[inline]
+pub fn set_window_title_cstr(str: &core::ffi::CStr) {
+    unsafe {
+        ffi::sapp_set_window_title(str.as_ptr())
+    }
+}
+/// set the window icon (only on Windows and Linux)
+#[inline]
+pub fn set_icon(icon_desc: &IconDesc) {
+    unsafe {
+        ffi::sapp_set_icon(icon_desc)
+    }
+}
+/// gets the total number of dropped files (after an SAPP_EVENTTYPE_FILES_DROPPED event)
+#[inline]
+pub fn get_num_dropped_files() -> i32 {
+    unsafe {
+        ffi::sapp_get_num_dropped_files()
+    }
+}
+/// gets the dropped file paths
+#[inline]
+pub fn get_dropped_file_path(index: i32) -> &'static str {
+    unsafe {
+        c_char_ptr_to_rust_str(ffi::sapp_get_dropped_file_path(index))
+    }
+}
+#[inline]
+pub fn get_dropped_file_path_as_cstr(index: i32) -> &'static core::ffi::CStr {
+    unsafe {
+        c_char_ptr_to_c_str(ffi::sapp_get_dropped_file_path(index))
+    }
+}
+/// # Safety
+///
+/// The returned C string must be valid UTF-8, this isn't checked.
+#[inline]
+pub unsafe fn get_dropped_file_path_unchecked(index: i32) -> &'static str {
+    unsafe {
+        c_char_ptr_to_rust_str_unchecked(ffi::sapp_get_dropped_file_path(index))
+    }
+}
+/// special run-function for SOKOL_NO_ENTRY (in standard mode this is an empty stub)
+#[inline]
+pub fn run(desc: &Desc) {
+    unsafe {
+        ffi::sapp_run(desc)
+    }
+}
+/// EGL: get EGLDisplay object
+#[inline]
+pub fn egl_get_display() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_egl_get_display()
+    }
+}
+/// EGL: get EGLContext object
+#[inline]
+pub fn egl_get_context() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_egl_get_context()
+    }
+}
+/// HTML5: enable or disable the hardwired "Leave Site?" dialog box
+#[inline]
+pub fn html5_ask_leave_site(ask: bool) {
+    unsafe {
+        ffi::sapp_html5_ask_leave_site(ask)
+    }
+}
+/// HTML5: get byte size of a dropped file
+#[inline]
+pub fn html5_get_dropped_file_size(index: i32) -> u32 {
+    unsafe {
+        ffi::sapp_html5_get_dropped_file_size(index)
+    }
+}
+/// HTML5: asynchronously load the content of a dropped file
+#[inline]
+pub fn html5_fetch_dropped_file(request: &Html5FetchRequest) {
+    unsafe {
+        ffi::sapp_html5_fetch_dropped_file(request)
+    }
+}
+/// Metal: get bridged pointer to Metal device object
+#[inline]
+pub fn metal_get_device() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_metal_get_device()
+    }
+}
+/// Metal: get bridged pointer to MTKView's current drawable of type CAMetalDrawable
+#[inline]
+pub fn metal_get_current_drawable() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_metal_get_current_drawable()
+    }
+}
+/// Metal: get bridged pointer to MTKView's depth-stencil texture of type MTLTexture
+#[inline]
+pub fn metal_get_depth_stencil_texture() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_metal_get_depth_stencil_texture()
+    }
+}
+/// Metal: get bridged pointer to MTKView's msaa-color-texture of type MTLTexture (may be null)
+#[inline]
+pub fn metal_get_msaa_color_texture() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_metal_get_msaa_color_texture()
+    }
+}
+/// macOS: get bridged pointer to macOS NSWindow
+#[inline]
+pub fn macos_get_window() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_macos_get_window()
+    }
+}
+/// iOS: get bridged pointer to iOS UIWindow
+#[inline]
+pub fn ios_get_window() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_ios_get_window()
+    }
+}
+/// D3D11: get pointer to ID3D11Device object
+#[inline]
+pub fn d3d11_get_device() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_d3d11_get_device()
+    }
+}
+/// D3D11: get pointer to ID3D11DeviceContext object
+#[inline]
+pub fn d3d11_get_device_context() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_d3d11_get_device_context()
+    }
+}
+/// D3D11: get pointer to IDXGISwapChain object
+#[inline]
+pub fn d3d11_get_swap_chain() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_d3d11_get_swap_chain()
+    }
+}
+/// D3D11: get pointer to ID3D11RenderTargetView object for rendering
+#[inline]
+pub fn d3d11_get_render_view() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_d3d11_get_render_view()
+    }
+}
+/// D3D11: get pointer ID3D11RenderTargetView object for msaa-resolve (may return null)
+#[inline]
+pub fn d3d11_get_resolve_view() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_d3d11_get_resolve_view()
+    }
+}
+/// D3D11: get pointer ID3D11DepthStencilView
+#[inline]
+pub fn d3d11_get_depth_stencil_view() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_d3d11_get_depth_stencil_view()
+    }
+}
+/// Win32: get the HWND window handle
+#[inline]
+pub fn win32_get_hwnd() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_win32_get_hwnd()
+    }
+}
+/// WebGPU: get WGPUDevice handle
+#[inline]
+pub fn wgpu_get_device() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_wgpu_get_device()
+    }
+}
+/// WebGPU: get swapchain's WGPUTextureView handle for rendering
+#[inline]
+pub fn wgpu_get_render_view() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_wgpu_get_render_view()
+    }
+}
+/// WebGPU: get swapchain's MSAA-resolve WGPUTextureView (may return null)
+#[inline]
+pub fn wgpu_get_resolve_view() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_wgpu_get_resolve_view()
+    }
+}
+/// WebGPU: get swapchain's WGPUTextureView for the depth-stencil surface
+#[inline]
+pub fn wgpu_get_depth_stencil_view() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_wgpu_get_depth_stencil_view()
+    }
+}
+/// GL: get framebuffer object
+#[inline]
+pub fn gl_get_framebuffer() -> u32 {
+    unsafe {
+        ffi::sapp_gl_get_framebuffer()
+    }
+}
+/// GL: get major version (only valid for desktop GL)
+#[inline]
+pub fn gl_get_major_version() -> i32 {
+    unsafe {
+        ffi::sapp_gl_get_major_version()
+    }
+}
+/// GL: get minor version (only valid for desktop GL)
+#[inline]
+pub fn gl_get_minor_version() -> i32 {
+    unsafe {
+        ffi::sapp_gl_get_minor_version()
+    }
+}
+/// Android: get native activity handle
+#[inline]
+pub fn android_get_native_activity() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sapp_android_get_native_activity()
+    }
+}
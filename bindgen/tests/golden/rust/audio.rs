@@ -0,0 +1,281 @@
+// machine generated, do not edit
+
+#![allow(dead_code)]
+#![allow(unused_imports)]
+
+
+/// Helper function to convert a C string to a Rust string slice
+#[inline]
+fn c_char_ptr_to_rust_str(c_char_ptr: *const core::ffi::c_char) -> &'static str {
+    let c_str = unsafe { core::ffi::CStr::from_ptr(c_char_ptr) };
+    c_str.to_str().expect("c_char_ptr contained invalid Utf8 Data")
+}
+
+/// Helper function to convert a C string to a CStr, skips the UTF-8 validation
+#[inline]
+fn c_char_ptr_to_c_str(c_char_ptr: *const core::ffi::c_char) -> &'static core::ffi::CStr {
+    unsafe { core::ffi::CStr::from_ptr(c_char_ptr) }
+}
+
+/// Helper function to convert a C string to a Rust string slice without UTF-8 validation,
+/// the caller must guarantee that the C string is valid UTF-8
+#[inline]
+unsafe fn c_char_ptr_to_rust_str_unchecked(c_char_ptr: *const core::ffi::c_char) -> &'static str {
+    core::str::from_utf8_unchecked(core::ffi::CStr::from_ptr(c_char_ptr).to_bytes())
+}
+
+/// Helper function to pass a Rust string slice to C as a zero-terminated string,
+/// short strings are copied into a stack buffer instead of allocating a CString
+#[inline]
+fn with_c_str<R>(s: &str, f: impl FnOnce(*const core::ffi::c_char) -> R) -> R {
+    const STACK_BUF_SIZE: usize = 256;
+    let bytes = s.as_bytes();
+    if bytes.len() < STACK_BUF_SIZE && !bytes.contains(&0) {
+        let mut buf = [0u8; STACK_BUF_SIZE];
+        buf[..bytes.len()].copy_from_slice(bytes);
+        f(buf.as_ptr() as *const core::ffi::c_char)
+    } else {
+        let c_string = std::ffi::CString::new(s).unwrap();
+        f(c_string.as_ptr())
+    }
+}
+
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(i32)]
+pub enum LogItem {
+    Ok,
+    MallocFailed,
+    AlsaSndPcmOpenFailed,
+    AlsaFloatSamplesNotSupported,
+    AlsaRequestedBufferSizeNotSupported,
+    AlsaRequestedChannelCountNotSupported,
+    AlsaSndPcmHwParamsSetRateNearFailed,
+    AlsaSndPcmHwParamsFailed,
+    AlsaPthreadCreateFailed,
+    WasapiCreateEventFailed,
+    WasapiCreateDeviceEnumeratorFailed,
+    WasapiGetDefaultAudioEndpointFailed,
+    WasapiDeviceActivateFailed,
+    WasapiAudioClientInitializeFailed,
+    WasapiAudioClientGetBufferSizeFailed,
+    WasapiAudioClientGetServiceFailed,
+    WasapiAudioClientSetEventHandleFailed,
+    WasapiCreateThreadFailed,
+    AaudioStreambuilderOpenStreamFailed,
+    AaudioPthreadCreateFailed,
+    AaudioRestartingStreamAfterError,
+    UsingAaudioBackend,
+    AaudioCreateStreambuilderFailed,
+    UsingSlesBackend,
+    SlesCreateEngineFailed,
+    SlesEngineGetEngineInterfaceFailed,
+    SlesCreateOutputMixFailed,
+    SlesMixerGetVolumeInterfaceFailed,
+    SlesEngineCreateAudioPlayerFailed,
+    SlesPlayerGetPlayInterfaceFailed,
+    SlesPlayerGetVolumeInterfaceFailed,
+    SlesPlayerGetBufferqueueInterfaceFailed,
+    CoreaudioNewOutputFailed,
+    CoreaudioAllocateBufferFailed,
+    CoreaudioStartFailed,
+    BackendBufferSizeIsntMultipleOfPacketSize,
+}
+impl LogItem {
+    pub const fn new() -> Self {
+        Self::Ok
+    }
+}
+impl Default for LogItem {
+    fn default() -> Self {
+        Self::Ok
+    }
+}
+/// saudio_logger
+///
+/// Used in saudio_desc to provide a custom logging and error reporting
+/// callback to sokol-audio.
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Logger {
+    pub func: Option<extern "C" fn(*const core::ffi::c_char, u32, u32, *const core::ffi::c_char, u32, *const core::ffi::c_char, *mut core::ffi::c_void)>,
+    pub user_data: *mut core::ffi::c_void,
+}
+impl Logger {
+    pub const fn new() -> Self {
+        Self {
+            func: None,
+            user_data: core::ptr::null_mut(),
+        }
+    }
+}
+impl Default for Logger {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// saudio_allocator
+///
+/// Used in saudio_desc to provide custom memory-alloc and -free functions
+/// to sokol_audio.h. If memory management should be overridden, both the
+/// alloc_fn and free_fn function must be provided (e.g. it's not valid to
+/// override one function but not the other).
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Allocator {
+    pub alloc_fn: Option<extern "C" fn(usize, *mut core::ffi::c_void) -> *mut core::ffi::c_void>,
+    pub free_fn: Option<extern "C" fn(*mut core::ffi::c_void, *mut core::ffi::c_void)>,
+    pub user_data: *mut core::ffi::c_void,
+}
+impl Allocator {
+    pub const fn new() -> Self {
+        Self {
+            alloc_fn: None,
+            free_fn: None,
+            user_data: core::ptr::null_mut(),
+        }
+    }
+}
+impl Default for Allocator {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Desc {
+    /// requested sample rate
+    pub sample_rate: i32,
+    /// number of channels, default: 1 (mono)
+    pub num_channels: i32,
+    /// number of frames in streaming buffer
+    pub buffer_frames: i32,
+    /// number of frames in a packet
+    pub packet_frames: i32,
+    /// number of packets in packet queue
+    pub num_packets: i32,
+    /// optional streaming callback (no user data)
+    pub stream_cb: Option<extern "C" fn(*mut f32, i32, i32)>,
+    /// ... and with user data
+    pub stream_userdata_cb: Option<extern "C" fn(*mut f32, i32, i32, *mut core::ffi::c_void)>,
+    /// optional user data argument for stream_userdata_cb
+    pub user_data: *mut core::ffi::c_void,
+    /// optional allocation override functions
+    pub allocator: Allocator,
+    /// optional logging function (default: NO LOGGING!)
+    pub logger: Logger,
+}
+impl Desc {
+    pub const fn new() -> Self {
+        Self {
+            sample_rate: 0,
+            num_channels: 0,
+            buffer_frames: 0,
+            packet_frames: 0,
+            num_packets: 0,
+            stream_cb: None,
+            stream_userdata_cb: None,
+            user_data: core::ptr::null_mut(),
+            allocator: Allocator::new(),
+            logger: Logger::new(),
+        }
+    }
+}
+impl Default for Desc {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+pub mod ffi {
+    #![allow(unused_imports)]
+    use super::*;
+    extern "C" {
+        pub fn saudio_setup(desc: *const Desc);
+        pub fn saudio_shutdown();
+        pub fn saudio_isvalid() -> bool;
+        pub fn saudio_userdata() -> *mut core::ffi::c_void;
+        pub fn saudio_query_desc() -> Desc;
+        pub fn saudio_sample_rate() -> i32;
+        pub fn saudio_buffer_frames() -> i32;
+        pub fn saudio_channels() -> i32;
+        pub fn saudio_suspended() -> bool;
+        pub fn saudio_expect() -> i32;
+        pub fn saudio_push(frames: *const f32, num_frames: i32) -> i32;
+    }
+}
+/// setup sokol-audio
+#[inline]
+pub fn setup(desc: &Desc) {
+    unsafe {
+        ffi::saudio_setup(desc)
+    }
+}
+/// shutdown sokol-audio
+#[inline]
+pub fn shutdown() {
+    unsafe {
+        ffi::saudio_shutdown()
+    }
+}
+/// true after setup if audio backend was successfully initialized
+#[inline]
+pub fn isvalid() -> bool {
+    unsafe {
+        ffi::saudio_isvalid()
+    }
+}
+/// return the saudio_desc.user_data pointer
+#[inline]
+pub fn userdata() -> *mut core::ffi::c_void {
+    unsafe {
+        ffi::saudio_userdata()
+    }
+}
+/// return a copy of the original saudio_desc struct
+#[inline]
+pub fn query_desc() -> Desc {
+    unsafe {
+        ffi::saudio_query_desc()
+    }
+}
+/// actual sample rate
+#[inline]
+pub fn sample_rate() -> i32 {
+    unsafe {
+        ffi::saudio_sample_rate()
+    }
+}
+/// return actual backend buffer size in number of frames
+#[inline]
+pub fn buffer_frames() -> i32 {
+    unsafe {
+        ffi::saudio_buffer_frames()
+    }
+}
+/// actual number of channels
+#[inline]
+pub fn channels() -> i32 {
+    unsafe {
+        ffi::saudio_channels()
+    }
+}
+/// return true if audio context is currently suspended (only in WebAudio backend, all other backends return false)
+#[inline]
+pub fn suspended() -> bool {
+    unsafe {
+        ffi::saudio_suspended()
+    }
+}
+/// get current number of frames to fill packet queue
+#[inline]
+pub fn expect() -> i32 {
+    unsafe {
+        ffi::saudio_expect()
+    }
+}
+/// push sample frames from main thread, returns number of frames actually pushed
+#[inline]
+pub fn push(frames: &f32, num_frames: i32) -> i32 {
+    unsafe {
+        ffi::saudio_push(frames, num_frames)
+    }
+}
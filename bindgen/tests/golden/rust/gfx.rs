@@ -0,0 +1,6659 @@
+// machine generated, do not edit
+
+#![allow(dead_code)]
+#![allow(unused_imports)]
+
+
+/// Helper function to convert a C string to a Rust string slice
+#[inline]
+fn c_char_ptr_to_rust_str(c_char_ptr: *const core::ffi::c_char) -> &'static str {
+    let c_str = unsafe { core::ffi::CStr::from_ptr(c_char_ptr) };
+    c_str.to_str().expect("c_char_ptr contained invalid Utf8 Data")
+}
+
+/// Helper function to convert a C string to a CStr, skips the UTF-8 validation
+#[inline]
+fn c_char_ptr_to_c_str(c_char_ptr: *const core::ffi::c_char) -> &'static core::ffi::CStr {
+    unsafe { core::ffi::CStr::from_ptr(c_char_ptr) }
+}
+
+/// Helper function to convert a C string to a Rust string slice without UTF-8 validation,
+/// the caller must guarantee that the C string is valid UTF-8
+#[inline]
+unsafe fn c_char_ptr_to_rust_str_unchecked(c_char_ptr: *const core::ffi::c_char) -> &'static str {
+    core::str::from_utf8_unchecked(core::ffi::CStr::from_ptr(c_char_ptr).to_bytes())
+}
+
+/// Helper function to pass a Rust string slice to C as a zero-terminated string,
+/// short strings are copied into a stack buffer instead of allocating a CString
+#[inline]
+fn with_c_str<R>(s: &str, f: impl FnOnce(*const core::ffi::c_char) -> R) -> R {
+    const STACK_BUF_SIZE: usize = 256;
+    let bytes = s.as_bytes();
+    if bytes.len() < STACK_BUF_SIZE && !bytes.contains(&0) {
+        let mut buf = [0u8; STACK_BUF_SIZE];
+        buf[..bytes.len()].copy_from_slice(bytes);
+        f(buf.as_ptr() as *const core::ffi::c_char)
+    } else {
+        let c_string = std::ffi::CString::new(s).unwrap();
+        f(c_string.as_ptr())
+    }
+}
+
+/// Helper function to cast a Rust slice into a sokol Range
+pub fn slice_as_range<T>(data: &[T]) -> Range {
+    Range { size: std::mem::size_of_val(data), ptr: data.as_ptr() as *const _ }
+}
+/// Helper function to cast a Rust reference into a sokol Range
+pub fn value_as_range<T>(value: &T) -> Range {
+    Range { size: std::mem::size_of::<T>(), ptr: value as *const T as *const _ }
+}
+
+impl<T> From<&[T]> for Range {
+    #[inline]
+    fn from(data: &[T]) -> Self {
+        slice_as_range(data)
+    }
+}
+impl<T> From<&T> for Range {
+    #[inline]
+    fn from(value: &T) -> Self {
+        value_as_range(value)
+    }
+}
+
+/// Number of values in a flattened `FrameStats` struct
+pub const FRAME_STATS_NUM_VALUES: usize = 85;
+/// Names of the values in a flattened `FrameStats` struct
+pub const FRAME_STATS_NAMES: [&str; FRAME_STATS_NUM_VALUES] = [
+    "frame_index",
+    "num_passes",
+    "num_apply_viewport",
+    "num_apply_scissor_rect",
+    "num_apply_pipeline",
+    "num_apply_bindings",
+    "num_apply_uniforms",
+    "num_draw",
+    "num_update_buffer",
+    "num_append_buffer",
+    "num_update_image",
+    "size_apply_uniforms",
+    "size_update_buffer",
+    "size_append_buffer",
+    "size_update_image",
+    "gl.num_bind_buffer",
+    "gl.num_active_texture",
+    "gl.num_bind_texture",
+    "gl.num_bind_sampler",
+    "gl.num_use_program",
+    "gl.num_render_state",
+    "gl.num_vertex_attrib_pointer",
+    "gl.num_vertex_attrib_divisor",
+    "gl.num_enable_vertex_attrib_array",
+    "gl.num_disable_vertex_attrib_array",
+    "gl.num_uniform",
+    "d3d11.pass.num_om_set_render_targets",
+    "d3d11.pass.num_clear_render_target_view",
+    "d3d11.pass.num_clear_depth_stencil_view",
+    "d3d11.pass.num_resolve_subresource",
+    "d3d11.pipeline.num_rs_set_state",
+    "d3d11.pipeline.num_om_set_depth_stencil_state",
+    "d3d11.pipeline.num_om_set_blend_state",
+    "d3d11.pipeline.num_ia_set_primitive_topology",
+    "d3d11.pipeline.num_ia_set_input_layout",
+    "d3d11.pipeline.num_vs_set_shader",
+    "d3d11.pipeline.num_vs_set_constant_buffers",
+    "d3d11.pipeline.num_ps_set_shader",
+    "d3d11.pipeline.num_ps_set_constant_buffers",
+    "d3d11.bindings.num_ia_set_vertex_buffers",
+    "d3d11.bindings.num_ia_set_index_buffer",
+    "d3d11.bindings.num_vs_set_shader_resources",
+    "d3d11.bindings.num_ps_set_shader_resources",
+    "d3d11.bindings.num_vs_set_samplers",
+    "d3d11.bindings.num_ps_set_samplers",
+    "d3d11.uniforms.num_update_subresource",
+    "d3d11.draw.num_draw_indexed_instanced",
+    "d3d11.draw.num_draw_indexed",
+    "d3d11.draw.num_draw_instanced",
+    "d3d11.draw.num_draw",
+    "d3d11.num_map",
+    "d3d11.num_unmap",
+    "metal.idpool.num_added",
+    "metal.idpool.num_released",
+    "metal.idpool.num_garbage_collected",
+    "metal.pipeline.num_set_blend_color",
+    "metal.pipeline.num_set_cull_mode",
+    "metal.pipeline.num_set_front_facing_winding",
+    "metal.pipeline.num_set_stencil_reference_value",
+    "metal.pipeline.num_set_depth_bias",
+    "metal.pipeline.num_set_render_pipeline_state",
+    "metal.pipeline.num_set_depth_stencil_state",
+    "metal.bindings.num_set_vertex_buffer",
+    "metal.bindings.num_set_vertex_texture",
+    "metal.bindings.num_set_vertex_sampler_state",
+    "metal.bindings.num_set_fragment_buffer",
+    "metal.bindings.num_set_fragment_texture",
+    "metal.bindings.num_set_fragment_sampler_state",
+    "metal.uniforms.num_set_vertex_buffer_offset",
+    "metal.uniforms.num_set_fragment_buffer_offset",
+    "wgpu.uniforms.num_set_bindgroup",
+    "wgpu.uniforms.size_write_buffer",
+    "wgpu.bindings.num_set_vertex_buffer",
+    "wgpu.bindings.num_skip_redundant_vertex_buffer",
+    "wgpu.bindings.num_set_index_buffer",
+    "wgpu.bindings.num_skip_redundant_index_buffer",
+    "wgpu.bindings.num_create_bindgroup",
+    "wgpu.bindings.num_discard_bindgroup",
+    "wgpu.bindings.num_set_bindgroup",
+    "wgpu.bindings.num_skip_redundant_bindgroup",
+    "wgpu.bindings.num_bindgroup_cache_hits",
+    "wgpu.bindings.num_bindgroup_cache_misses",
+    "wgpu.bindings.num_bindgroup_cache_collisions",
+    "wgpu.bindings.num_bindgroup_cache_invalidates",
+    "wgpu.bindings.num_bindgroup_cache_hash_vs_key_mismatch",
+];
+/// Flat array view of a `FrameStats` struct, for instance for exporting
+pub fn frame_stats_flatten(stats: &FrameStats) -> [u32; FRAME_STATS_NUM_VALUES] {
+    [
+        stats.frame_index,
+        stats.num_passes,
+        stats.num_apply_viewport,
+        stats.num_apply_scissor_rect,
+        stats.num_apply_pipeline,
+        stats.num_apply_bindings,
+        stats.num_apply_uniforms,
+        stats.num_draw,
+        stats.num_update_buffer,
+        stats.num_append_buffer,
+        stats.num_update_image,
+        stats.size_apply_uniforms,
+        stats.size_update_buffer,
+        stats.size_append_buffer,
+        stats.size_update_image,
+        stats.gl.num_bind_buffer,
+        stats.gl.num_active_texture,
+        stats.gl.num_bind_texture,
+        stats.gl.num_bind_sampler,
+        stats.gl.num_use_program,
+        stats.gl.num_render_state,
+        stats.gl.num_vertex_attrib_pointer,
+        stats.gl.num_vertex_attrib_divisor,
+        stats.gl.num_enable_vertex_attrib_array,
+        stats.gl.num_disable_vertex_attrib_array,
+        stats.gl.num_uniform,
+        stats.d3d11.pass.num_om_set_render_targets,
+        stats.d3d11.pass.num_clear_render_target_view,
+        stats.d3d11.pass.num_clear_depth_stencil_view,
+        stats.d3d11.pass.num_resolve_subresource,
+        stats.d3d11.pipeline.num_rs_set_state,
+        stats.d3d11.pipeline.num_om_set_depth_stencil_state,
+        stats.d3d11.pipeline.num_om_set_blend_state,
+        stats.d3d11.pipeline.num_ia_set_primitive_topology,
+        stats.d3d11.pipeline.num_ia_set_input_layout,
+        stats.d3d11.pipeline.num_vs_set_shader,
+        stats.d3d11.pipeline.num_vs_set_constant_buffers,
+        stats.d3d11.pipeline.num_ps_set_shader,
+        stats.d3d11.pipeline.num_ps_set_constant_buffers,
+        stats.d3d11.bindings.num_ia_set_vertex_buffers,
+        stats.d3d11.bindings.num_ia_set_index_buffer,
+        stats.d3d11.bindings.num_vs_set_shader_resources,
+        stats.d3d11.bindings.num_ps_set_shader_resources,
+        stats.d3d11.bindings.num_vs_set_samplers,
+        stats.d3d11.bindings.num_ps_set_samplers,
+        stats.d3d11.uniforms.num_update_subresource,
+        stats.d3d11.draw.num_draw_indexed_instanced,
+        stats.d3d11.draw.num_draw_indexed,
+        stats.d3d11.draw.num_draw_instanced,
+        stats.d3d11.draw.num_draw,
+        stats.d3d11.num_map,
+        stats.d3d11.num_unmap,
+        stats.metal.idpool.num_added,
+        stats.metal.idpool.num_released,
+        stats.metal.idpool.num_garbage_collected,
+        stats.metal.pipeline.num_set_blend_color,
+        stats.metal.pipeline.num_set_cull_mode,
+        stats.metal.pipeline.num_set_front_facing_winding,
+        stats.metal.pipeline.num_set_stencil_reference_value,
+        stats.metal.pipeline.num_set_depth_bias,
+        stats.metal.pipeline.num_set_render_pipeline_state,
+        stats.metal.pipeline.num_set_depth_stencil_state,
+        stats.metal.bindings.num_set_vertex_buffer,
+        stats.metal.bindings.num_set_vertex_texture,
+        stats.metal.bindings.num_set_vertex_sampler_state,
+        stats.metal.bindings.num_set_fragment_buffer,
+        stats.metal.bindings.num_set_fragment_texture,
+        stats.metal.bindings.num_set_fragment_sampler_state,
+        stats.metal.uniforms.num_set_vertex_buffer_offset,
+        stats.metal.uniforms.num_set_fragment_buffer_offset,
+        stats.wgpu.uniforms.num_set_bindgroup,
+        stats.wgpu.uniforms.size_write_buffer,
+        stats.wgpu.bindings.num_set_vertex_buffer,
+        stats.wgpu.bindings.num_skip_redundant_vertex_buffer,
+        stats.wgpu.bindings.num_set_index_buffer,
+        stats.wgpu.bindings.num_skip_redundant_index_buffer,
+        stats.wgpu.bindings.num_create_bindgroup,
+        stats.wgpu.bindings.num_discard_bindgroup,
+        stats.wgpu.bindings.num_set_bindgroup,
+        stats.wgpu.bindings.num_skip_redundant_bindgroup,
+        stats.wgpu.bindings.num_bindgroup_cache_hits,
+        stats.wgpu.bindings.num_bindgroup_cache_misses,
+        stats.wgpu.bindings.num_bindgroup_cache_collisions,
+        stats.wgpu.bindings.num_bindgroup_cache_invalidates,
+        stats.wgpu.bindings.num_bindgroup_cache_hash_vs_key_mismatch,
+    ]
+}
+
+/// Records the flattened frame stats of the last `N` frames,
+/// call `push(&query_frame_stats())` once per frame
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStatsCollector<const N: usize> {
+    frames: [[u32; FRAME_STATS_NUM_VALUES]; N],
+    num: usize,
+    pos: usize,
+}
+impl<const N: usize> Default for FrameStatsCollector<N> {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+impl<const N: usize> FrameStatsCollector<N> {
+    pub const fn new() -> Self {
+        Self { frames: [[0; FRAME_STATS_NUM_VALUES]; N], num: 0, pos: 0 }
+    }
+    pub fn push(&mut self, stats: &FrameStats) {
+        self.frames[self.pos] = frame_stats_flatten(stats);
+        self.pos = (self.pos + 1) % N;
+        self.num = (self.num + 1).min(N);
+    }
+    /// Number of recorded frames
+    pub fn len(&self) -> usize {
+        self.num
+    }
+    pub fn is_empty(&self) -> bool {
+        self.num == 0
+    }
+    /// The most recently pushed frame stats
+    pub fn latest(&self) -> Option<&[u32; FRAME_STATS_NUM_VALUES]> {
+        if self.num == 0 {
+            return None;
+        }
+        Some(&self.frames[(self.pos + N - 1) % N])
+    }
+    /// Average of a value over the recorded frames
+    pub fn average(&self, value_index: usize) -> f64 {
+        if self.num == 0 {
+            return 0.0;
+        }
+        let sum: u64 = self.frames[..self.num].iter().map(|frame| frame[value_index] as u64).sum();
+        sum as f64 / self.num as f64
+    }
+    /// Nearest-rank percentile (0..100) of a value over the recorded frames
+    pub fn percentile(&self, value_index: usize, p: u32) -> u32 {
+        if self.num == 0 {
+            return 0;
+        }
+        let mut values = [0u32; N];
+        for (value, frame) in values.iter_mut().zip(&self.frames[..self.num]) {
+            *value = frame[value_index];
+        }
+        let values = &mut values[..self.num];
+        values.sort_unstable();
+        let rank = (p.min(100) as usize * self.num + 99) / 100;
+        values[rank.saturating_sub(1)]
+    }
+}
+
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Buffer {
+    pub id: u32,
+}
+impl Buffer {
+    pub const fn new() -> Self {
+        Self {
+            id: 0,
+        }
+    }
+}
+impl Default for Buffer {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Image {
+    pub id: u32,
+}
+impl Image {
+    pub const fn new() -> Self {
+        Self {
+            id: 0,
+        }
+    }
+}
+impl Default for Image {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Sampler {
+    pub id: u32,
+}
+impl Sampler {
+    pub const fn new() -> Self {
+        Self {
+            id: 0,
+        }
+    }
+}
+impl Default for Sampler {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Shader {
+    pub id: u32,
+}
+impl Shader {
+    pub const fn new() -> Self {
+        Self {
+            id: 0,
+        }
+    }
+}
+impl Default for Shader {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Pipeline {
+    pub id: u32,
+}
+impl Pipeline {
+    pub const fn new() -> Self {
+        Self {
+            id: 0,
+        }
+    }
+}
+impl Default for Pipeline {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Attachments {
+    pub id: u32,
+}
+impl Attachments {
+    pub const fn new() -> Self {
+        Self {
+            id: 0,
+        }
+    }
+}
+impl Default for Attachments {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sg_range is a pointer-size-pair struct used to pass memory blobs into
+/// sokol-gfx. When initialized from a value type (array or struct), you can
+/// use the SG_RANGE() macro to build an sg_range struct. For functions which
+/// take either a sg_range pointer, or a (C++) sg_range reference, use the
+/// SG_RANGE_REF macro as a solution which compiles both in C and C++.
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Range {
+    pub ptr: *const core::ffi::c_void,
+    pub size: usize,
+}
+impl Range {
+    pub const fn new() -> Self {
+        Self {
+            ptr: core::ptr::null(),
+            size: 0,
+        }
+    }
+}
+impl Default for Range {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+// various compile-time constants in the public API
+pub const INVALID_ID: u32 = 0;
+pub const NUM_INFLIGHT_FRAMES: usize = 2;
+pub const MAX_COLOR_ATTACHMENTS: usize = 4;
+pub const MAX_UNIFORMBLOCK_MEMBERS: usize = 16;
+pub const MAX_VERTEX_ATTRIBUTES: usize = 16;
+pub const MAX_MIPMAPS: usize = 16;
+pub const MAX_TEXTUREARRAY_LAYERS: usize = 128;
+pub const MAX_UNIFORMBLOCK_BINDSLOTS: usize = 8;
+pub const MAX_VERTEXBUFFER_BINDSLOTS: usize = 8;
+pub const MAX_IMAGE_BINDSLOTS: usize = 16;
+pub const MAX_SAMPLER_BINDSLOTS: usize = 16;
+pub const MAX_STORAGEBUFFER_BINDSLOTS: usize = 8;
+pub const MAX_IMAGE_SAMPLER_PAIRS: usize = 16;
+/// sg_color
+///
+/// An RGBA color value.
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Color {
+    pub r: f32,
+    pub g: f32,
+    pub b: f32,
+    pub a: f32,
+}
+impl Color {
+    pub const fn new() -> Self {
+        Self {
+            r: 0.0,
+            g: 0.0,
+            b: 0.0,
+            a: 0.0,
+        }
+    }
+}
+impl Default for Color {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sg_backend
+///
+/// The active 3D-API backend, use the function sg_query_backend()
+/// to get the currently active backend.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(i32)]
+pub enum Backend {
+    Glcore,
+    Gles3,
+    D3d11,
+    MetalIos,
+    MetalMacos,
+    MetalSimulator,
+    Wgpu,
+    Dummy,
+}
+impl Backend {
+    pub const fn new() -> Self {
+        Self::Glcore
+    }
+}
+impl Default for Backend {
+    fn default() -> Self {
+        Self::Glcore
+    }
+}
+/// ```text
+/// sg_pixel_format
+///
+/// sokol_gfx.h basically uses the same pixel formats as WebGPU, since these
+/// are supported on most newer GPUs.
+///
+/// A pixelformat name consist of three parts:
+///
+///     - components (R, RG, RGB or RGBA)
+///     - bit width per component (8, 16 or 32)
+///     - component data type:
+///         - unsigned normalized (no postfix)
+///         - signed normalized (SN postfix)
+///         - unsigned integer (UI postfix)
+///         - signed integer (SI postfix)
+///         - float (F postfix)
+///
+/// Not all pixel formats can be used for everything, call sg_query_pixelformat()
+/// to inspect the capabilities of a given pixelformat. The function returns
+/// an sg_pixelformat_info struct with the following members:
+///
+///     - sample: the pixelformat can be sampled as texture at least with
+///               nearest filtering
+///     - filter: the pixelformat can be sampled as texture with linear
+///               filtering
+///     - render: the pixelformat can be used as render-pass attachment
+///     - blend:  blending is supported when used as render-pass attachment
+///     - msaa:   multisample-antialiasing is supported when used
+///               as render-pass attachment
+///     - depth:  the pixelformat can be used for depth-stencil attachments
+///     - compressed: this is a block-compressed format
+///     - bytes_per_pixel: the numbers of bytes in a pixel (0 for compressed formats)
+///
+/// The default pixel format for texture images is SG_PIXELFORMAT_RGBA8.
+///
+/// The default pixel format for render target images is platform-dependent
+/// and taken from the sg_environment struct passed into sg_setup(). Typically
+/// the default formats are:
+///
+///     - for the Metal, D3D11 and WebGPU backends: SG_PIXELFORMAT_BGRA8
+///     - for GL backends: SG_PIXELFORMAT_RGBA8
+/// ```
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum PixelFormat {
+    /// value 0 reserved for default-init
+    Default,
+    None,
+    R8,
+    R8sn,
+    R8ui,
+    R8si,
+    R16,
+    R16sn,
+    R16ui,
+    R16si,
+    R16f,
+    Rg8,
+    Rg8sn,
+    Rg8ui,
+    Rg8si,
+    R32ui,
+    R32si,
+    R32f,
+    Rg16,
+    Rg16sn,
+    Rg16ui,
+    Rg16si,
+    Rg16f,
+    Rgba8,
+    Srgb8a8,
+    Rgba8sn,
+    Rgba8ui,
+    Rgba8si,
+    Bgra8,
+    Rgb10a2,
+    Rg11b10f,
+    Rgb9e5,
+    Rg32ui,
+    Rg32si,
+    Rg32f,
+    Rgba16,
+    Rgba16sn,
+    Rgba16ui,
+    Rgba16si,
+    Rgba16f,
+    Rgba32ui,
+    Rgba32si,
+    Rgba32f,
+    Depth,
+    DepthStencil,
+    Bc1Rgba,
+    Bc2Rgba,
+    Bc3Rgba,
+    Bc3Srgba,
+    Bc4R,
+    Bc4Rsn,
+    Bc5Rg,
+    Bc5Rgsn,
+    Bc6hRgbf,
+    Bc6hRgbuf,
+    Bc7Rgba,
+    Bc7Srgba,
+    /// FIXME: deprecated
+    PvrtcRgb2bpp,
+    /// FIXME: deprecated
+    PvrtcRgb4bpp,
+    /// FIXME: deprecated
+    PvrtcRgba2bpp,
+    /// FIXME: deprecated
+    PvrtcRgba4bpp,
+    Etc2Rgb8,
+    Etc2Srgb8,
+    Etc2Rgb8a1,
+    Etc2Rgba8,
+    Etc2Srgb8a8,
+    EacR11,
+    EacR11sn,
+    EacRg11,
+    EacRg11sn,
+    Astc4x4Rgba,
+    Astc4x4Srgba,
+    Num,
+}
+impl PixelFormat {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for PixelFormat {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// Runtime information about a pixel format, returned by sg_query_pixelformat().
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct PixelformatInfo {
+    /// pixel format can be sampled in shaders at least with nearest filtering
+    pub sample: bool,
+    /// pixel format can be sampled with linear filtering
+    pub filter: bool,
+    /// pixel format can be used as render-pass attachment
+    pub render: bool,
+    /// pixel format supports alpha-blending when used as render-pass attachment
+    pub blend: bool,
+    /// pixel format supports MSAA when used as render-pass attachment
+    pub msaa: bool,
+    /// pixel format is a depth format
+    pub depth: bool,
+    /// true if this is a hardware-compressed format
+    pub compressed: bool,
+    /// NOTE: this is 0 for compressed formats, use sg_query_row_pitch() / sg_query_surface_pitch() as alternative
+    pub bytes_per_pixel: i32,
+}
+impl PixelformatInfo {
+    pub const fn new() -> Self {
+        Self {
+            sample: false,
+            filter: false,
+            render: false,
+            blend: false,
+            msaa: false,
+            depth: false,
+            compressed: false,
+            bytes_per_pixel: 0,
+        }
+    }
+}
+impl Default for PixelformatInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// Runtime information about available optional features, returned by sg_query_features()
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Features {
+    /// framebuffer- and texture-origin is in top left corner
+    pub origin_top_left: bool,
+    /// border color and clamp-to-border uv-wrap mode is supported
+    pub image_clamp_to_border: bool,
+    /// multiple-render-target rendering can use per-render-target blend state
+    pub mrt_independent_blend_state: bool,
+    /// multiple-render-target rendering can use per-render-target color write masks
+    pub mrt_independent_write_mask: bool,
+    /// storage buffers are supported
+    pub storage_buffer: bool,
+    /// if true, multisampled images can be bound as texture resources
+    pub msaa_image_bindings: bool,
+}
+impl Features {
+    pub const fn new() -> Self {
+        Self {
+            origin_top_left: false,
+            image_clamp_to_border: false,
+            mrt_independent_blend_state: false,
+            mrt_independent_write_mask: false,
+            storage_buffer: false,
+            msaa_image_bindings: false,
+        }
+    }
+}
+impl Default for Features {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// Runtime information about resource limits, returned by sg_query_limit()
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Limits {
+    /// max width/height of SG_IMAGETYPE_2D images
+    pub max_image_size_2d: i32,
+    /// max width/height of SG_IMAGETYPE_CUBE images
+    pub max_image_size_cube: i32,
+    /// max width/height/depth of SG_IMAGETYPE_3D images
+    pub max_image_size_3d: i32,
+    /// max width/height of SG_IMAGETYPE_ARRAY images
+    pub max_image_size_array: i32,
+    /// max number of layers in SG_IMAGETYPE_ARRAY images
+    pub max_image_array_layers: i32,
+    /// max number of vertex attributes, clamped to SG_MAX_VERTEX_ATTRIBUTES
+    pub max_vertex_attrs: i32,
+    /// \<= GL_MAX_VERTEX_UNIFORM_COMPONENTS (only on GL backends)
+    pub gl_max_vertex_uniform_components: i32,
+    /// \<= GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS (only on GL backends)
+    pub gl_max_combined_texture_image_units: i32,
+}
+impl Limits {
+    pub const fn new() -> Self {
+        Self {
+            max_image_size_2d: 0,
+            max_image_size_cube: 0,
+            max_image_size_3d: 0,
+            max_image_size_array: 0,
+            max_image_array_layers: 0,
+            max_vertex_attrs: 0,
+            gl_max_vertex_uniform_components: 0,
+            gl_max_combined_texture_image_units: 0,
+        }
+    }
+}
+impl Default for Limits {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sg_resource_state
+///
+/// The current state of a resource in its resource pool.
+/// Resources start in the INITIAL state, which means the
+/// pool slot is unoccupied and can be allocated. When a resource is
+/// created, first an id is allocated, and the resource pool slot
+/// is set to state ALLOC. After allocation, the resource is
+/// initialized, which may result in the VALID or FAILED state. The
+/// reason why allocation and initialization are separate is because
+/// some resource types (e.g. buffers and images) might be asynchronously
+/// initialized by the user application. If a resource which is not
+/// in the VALID state is attempted to be used for rendering, rendering
+/// operations will silently be dropped.
+///
+/// The special INVALID state is returned in sg_query_xxx_state() if no
+/// resource object exists for the provided resource id.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum ResourceState {
+    Initial,
+    Alloc,
+    Valid,
+    Failed,
+    Invalid,
+}
+impl ResourceState {
+    pub const fn new() -> Self {
+        Self::Initial
+    }
+}
+impl Default for ResourceState {
+    fn default() -> Self {
+        Self::Initial
+    }
+}
+/// ```text
+/// sg_usage
+///
+/// A resource usage hint describing the update strategy of
+/// buffers and images. This is used in the sg_buffer_desc.usage
+/// and sg_image_desc.usage members when creating buffers
+/// and images:
+///
+/// SG_USAGE_IMMUTABLE:     the resource will never be updated with
+///                         new data, instead the content of the
+///                         resource must be provided on creation
+/// SG_USAGE_DYNAMIC:       the resource will be updated infrequently
+///                         with new data (this could range from "once
+///                         after creation", to "quite often but not
+///                         every frame")
+/// SG_USAGE_STREAM:        the resource will be updated each frame
+///                         with new content
+///
+/// The rendering backends use this hint to prevent that the
+/// CPU needs to wait for the GPU when attempting to update
+/// a resource that might be currently accessed by the GPU.
+///
+/// Resource content is updated with the functions sg_update_buffer() or
+/// sg_append_buffer() for buffer objects, and sg_update_image() for image
+/// objects. For the sg_update_*() functions, only one update is allowed per
+/// frame and resource object, while sg_append_buffer() can be called
+/// multiple times per frame on the same buffer. The application must update
+/// all data required for rendering (this means that the update data can be
+/// smaller than the resource size, if only a part of the overall resource
+/// size is used for rendering, you only need to make sure that the data that
+/// *is* used is valid).
+///
+/// The default usage is SG_USAGE_IMMUTABLE.
+/// ```
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum Usage {
+    /// value 0 reserved for default-init
+    Default,
+    Immutable,
+    Dynamic,
+    Stream,
+    Num,
+}
+impl Usage {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for Usage {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_buffer_type
+///
+/// Indicates whether a buffer will be bound as vertex-,
+/// index- or storage-buffer.
+///
+/// Used in the sg_buffer_desc.type member when creating a buffer.
+///
+/// The default value is SG_BUFFERTYPE_VERTEXBUFFER.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum BufferType {
+    /// value 0 reserved for default-init
+    Default,
+    Vertexbuffer,
+    Indexbuffer,
+    Storagebuffer,
+    Num,
+}
+impl BufferType {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for BufferType {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_index_type
+///
+/// Indicates whether indexed rendering (fetching vertex-indices from an
+/// index buffer) is used, and if yes, the index data type (16- or 32-bits).
+///
+/// This is used in the sg_pipeline_desc.index_type member when creating a
+/// pipeline object.
+///
+/// The default index type is SG_INDEXTYPE_NONE.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum IndexType {
+    /// value 0 reserved for default-init
+    Default,
+    None,
+    Uint16,
+    Uint32,
+    Num,
+}
+impl IndexType {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for IndexType {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_image_type
+///
+/// Indicates the basic type of an image object (2D-texture, cubemap,
+/// 3D-texture or 2D-array-texture). Used in the sg_image_desc.type member when
+/// creating an image, and in sg_shader_image_desc to describe a sampled texture
+/// in the shader (both must match and will be checked in the validation layer
+/// when calling sg_apply_bindings).
+///
+/// The default image type when creating an image is SG_IMAGETYPE_2D.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum ImageType {
+    /// value 0 reserved for default-init
+    Default,
+    Dim2,
+    Cube,
+    Dim3,
+    Array,
+    Num,
+}
+impl ImageType {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for ImageType {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_image_sample_type
+///
+/// The basic data type of a texture sample as expected by a shader.
+/// Must be provided in sg_shader_image and used by the validation
+/// layer in sg_apply_bindings() to check if the provided image object
+/// is compatible with what the shader expects. Apart from the sokol-gfx
+/// validation layer, WebGPU is the only backend API which actually requires
+/// matching texture and sampler type to be provided upfront for validation
+/// (other 3D APIs treat texture/sampler type mismatches as undefined behaviour).
+///
+/// NOTE that the following texture pixel formats require the use
+/// of SG_IMAGESAMPLETYPE_UNFILTERABLE_FLOAT, combined with a sampler
+/// of type SG_SAMPLERTYPE_NONFILTERING:
+///
+/// - SG_PIXELFORMAT_R32F
+/// - SG_PIXELFORMAT_RG32F
+/// - SG_PIXELFORMAT_RGBA32F
+///
+/// (when using sokol-shdc, also check out the meta tags `@image_sample_type`
+/// and `@sampler_type`)
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum ImageSampleType {
+    /// value 0 reserved for default-init
+    Default,
+    Float,
+    Depth,
+    Sint,
+    Uint,
+    UnfilterableFloat,
+    Num,
+}
+impl ImageSampleType {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for ImageSampleType {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_sampler_type
+///
+/// The basic type of a texture sampler (sampling vs comparison) as
+/// defined in a shader. Must be provided in sg_shader_sampler_desc.
+///
+/// sg_image_sample_type and sg_sampler_type for a texture/sampler
+/// pair must be compatible with each other, specifically only
+/// the following pairs are allowed:
+///
+/// - SG_IMAGESAMPLETYPE_FLOAT =\> (SG_SAMPLERTYPE_FILTERING or SG_SAMPLERTYPE_NONFILTERING)
+/// - SG_IMAGESAMPLETYPE_UNFILTERABLE_FLOAT =\> SG_SAMPLERTYPE_NONFILTERING
+/// - SG_IMAGESAMPLETYPE_SINT =\> SG_SAMPLERTYPE_NONFILTERING
+/// - SG_IMAGESAMPLETYPE_UINT =\> SG_SAMPLERTYPE_NONFILTERING
+/// - SG_IMAGESAMPLETYPE_DEPTH =\> SG_SAMPLERTYPE_COMPARISON
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum SamplerType {
+    Default,
+    Filtering,
+    Nonfiltering,
+    Comparison,
+    Num,
+}
+impl SamplerType {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for SamplerType {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_cube_face
+///
+/// The cubemap faces. Use these as indices in the sg_image_desc.content
+/// array.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum CubeFace {
+    PosX,
+    NegX,
+    PosY,
+    NegY,
+    PosZ,
+    NegZ,
+    Num,
+}
+impl CubeFace {
+    pub const fn new() -> Self {
+        Self::PosX
+    }
+}
+impl Default for CubeFace {
+    fn default() -> Self {
+        Self::PosX
+    }
+}
+/// sg_primitive_type
+///
+/// This is the common subset of 3D primitive types supported across all 3D
+/// APIs. This is used in the sg_pipeline_desc.primitive_type member when
+/// creating a pipeline object.
+///
+/// The default primitive type is SG_PRIMITIVETYPE_TRIANGLES.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum PrimitiveType {
+    /// value 0 reserved for default-init
+    Default,
+    Points,
+    Lines,
+    LineStrip,
+    Triangles,
+    TriangleStrip,
+    Num,
+}
+impl PrimitiveType {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for PrimitiveType {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_filter
+///
+/// The filtering mode when sampling a texture image. This is
+/// used in the sg_sampler_desc.min_filter, sg_sampler_desc.mag_filter
+/// and sg_sampler_desc.mipmap_filter members when creating a sampler object.
+///
+/// For the default is SG_FILTER_NEAREST.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum Filter {
+    /// value 0 reserved for default-init
+    Default,
+    Nearest,
+    Linear,
+    Num,
+}
+impl Filter {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for Filter {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_wrap
+///
+/// The texture coordinates wrapping mode when sampling a texture
+/// image. This is used in the sg_image_desc.wrap_u, .wrap_v
+/// and .wrap_w members when creating an image.
+///
+/// The default wrap mode is SG_WRAP_REPEAT.
+///
+/// NOTE: SG_WRAP_CLAMP_TO_BORDER is not supported on all backends
+/// and platforms. To check for support, call sg_query_features()
+/// and check the "clamp_to_border" boolean in the returned
+/// sg_features struct.
+///
+/// Platforms which don't support SG_WRAP_CLAMP_TO_BORDER will silently fall back
+/// to SG_WRAP_CLAMP_TO_EDGE without a validation error.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum Wrap {
+    /// value 0 reserved for default-init
+    Default,
+    Repeat,
+    ClampToEdge,
+    ClampToBorder,
+    MirroredRepeat,
+    Num,
+}
+impl Wrap {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for Wrap {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_border_color
+///
+/// The border color to use when sampling a texture, and the UV wrap
+/// mode is SG_WRAP_CLAMP_TO_BORDER.
+///
+/// The default border color is SG_BORDERCOLOR_OPAQUE_BLACK
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum BorderColor {
+    /// value 0 reserved for default-init
+    Default,
+    TransparentBlack,
+    OpaqueBlack,
+    OpaqueWhite,
+    Num,
+}
+impl BorderColor {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for BorderColor {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_vertex_format
+///
+/// The data type of a vertex component. This is used to describe
+/// the layout of vertex data when creating a pipeline object.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum VertexFormat {
+    Invalid,
+    Float,
+    Float2,
+    Float3,
+    Float4,
+    Byte4,
+    Byte4n,
+    Ubyte4,
+    Ubyte4n,
+    Short2,
+    Short2n,
+    Ushort2n,
+    Short4,
+    Short4n,
+    Ushort4n,
+    Uint10N2,
+    Half2,
+    Half4,
+    Num,
+}
+impl VertexFormat {
+    pub const fn new() -> Self {
+        Self::Invalid
+    }
+}
+impl Default for VertexFormat {
+    fn default() -> Self {
+        Self::Invalid
+    }
+}
+/// sg_vertex_step
+///
+/// Defines whether the input pointer of a vertex input stream is advanced
+/// 'per vertex' or 'per instance'. The default step-func is
+/// SG_VERTEXSTEP_PER_VERTEX. SG_VERTEXSTEP_PER_INSTANCE is used with
+/// instanced-rendering.
+///
+/// The vertex-step is part of the vertex-layout definition
+/// when creating pipeline objects.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum VertexStep {
+    /// value 0 reserved for default-init
+    Default,
+    PerVertex,
+    PerInstance,
+    Num,
+}
+impl VertexStep {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for VertexStep {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_uniform_type
+///
+/// The data type of a uniform block member. This is used to
+/// describe the internal layout of uniform blocks when creating
+/// a shader object. This is only required for the GL backend, all
+/// other backends will ignore the interior layout of uniform blocks.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum UniformType {
+    Invalid,
+    Float,
+    Float2,
+    Float3,
+    Float4,
+    Int,
+    Int2,
+    Int3,
+    Int4,
+    Mat4,
+    Num,
+}
+impl UniformType {
+    pub const fn new() -> Self {
+        Self::Invalid
+    }
+}
+impl Default for UniformType {
+    fn default() -> Self {
+        Self::Invalid
+    }
+}
+/// ```text
+/// sg_uniform_layout
+///
+/// A hint for the interior memory layout of uniform blocks. This is
+/// only relevant for the GL backend where the internal layout
+/// of uniform blocks must be known to sokol-gfx. For all other backends the
+/// internal memory layout of uniform blocks doesn't matter, sokol-gfx
+/// will just pass uniform data as a single memory blob to the
+/// 3D backend.
+///
+/// SG_UNIFORMLAYOUT_NATIVE (default)
+///     Native layout means that a 'backend-native' memory layout
+///     is used. For the GL backend this means that uniforms
+///     are packed tightly in memory (e.g. there are no padding
+///     bytes).
+///
+/// SG_UNIFORMLAYOUT_STD140
+///     The memory layout is a subset of std140. Arrays are only
+///     allowed for the FLOAT4, INT4 and MAT4. Alignment is as
+///     is as follows:
+///
+///         FLOAT, INT:         4 byte alignment
+///         FLOAT2, INT2:       8 byte alignment
+///         FLOAT3, INT3:       16 byte alignment(!)
+///         FLOAT4, INT4:       16 byte alignment
+///         MAT4:               16 byte alignment
+///         FLOAT4[], INT4[]:   16 byte alignment
+///
+///     The overall size of the uniform block must be a multiple
+///     of 16.
+///
+/// For more information search for 'UNIFORM DATA LAYOUT' in the documentation block
+/// at the start of the header.
+/// ```
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum UniformLayout {
+    /// value 0 reserved for default-init
+    Default,
+    /// default: layout depends on currently active backend
+    Native,
+    /// std140: memory layout according to std140
+    Std140,
+    Num,
+}
+impl UniformLayout {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for UniformLayout {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_cull_mode
+///
+/// The face-culling mode, this is used in the
+/// sg_pipeline_desc.cull_mode member when creating a
+/// pipeline object.
+///
+/// The default cull mode is SG_CULLMODE_NONE
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum CullMode {
+    /// value 0 reserved for default-init
+    Default,
+    None,
+    Front,
+    Back,
+    Num,
+}
+impl CullMode {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for CullMode {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_face_winding
+///
+/// The vertex-winding rule that determines a front-facing primitive. This
+/// is used in the member sg_pipeline_desc.face_winding
+/// when creating a pipeline object.
+///
+/// The default winding is SG_FACEWINDING_CW (clockwise)
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum FaceWinding {
+    /// value 0 reserved for default-init
+    Default,
+    Ccw,
+    Cw,
+    Num,
+}
+impl FaceWinding {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for FaceWinding {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// ```text
+/// sg_compare_func
+///
+/// The compare-function for configuring depth- and stencil-ref tests
+/// in pipeline objects, and for texture samplers which perform a comparison
+/// instead of regular sampling operation.
+///
+/// Used in the following structs:
+///
+/// sg_pipeline_desc
+///     .depth
+///         .compare
+///     .stencil
+///         .front.compare
+///         .back.compar
+///
+/// sg_sampler_desc
+///     .compare
+///
+/// The default compare func for depth- and stencil-tests is
+/// SG_COMPAREFUNC_ALWAYS.
+///
+/// The default compare func for samplers is SG_COMPAREFUNC_NEVER.
+/// ```
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum CompareFunc {
+    /// value 0 reserved for default-init
+    Default,
+    Never,
+    Less,
+    Equal,
+    LessEqual,
+    Greater,
+    NotEqual,
+    GreaterEqual,
+    Always,
+    Num,
+}
+impl CompareFunc {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for CompareFunc {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// ```text
+/// sg_stencil_op
+///
+/// The operation performed on a currently stored stencil-value when a
+/// comparison test passes or fails. This is used when creating a pipeline
+/// object in the following sg_pipeline_desc struct items:
+///
+/// sg_pipeline_desc
+///     .stencil
+///         .front
+///             .fail_op
+///             .depth_fail_op
+///             .pass_op
+///         .back
+///             .fail_op
+///             .depth_fail_op
+///             .pass_op
+///
+/// The default value is SG_STENCILOP_KEEP.
+/// ```
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum StencilOp {
+    /// value 0 reserved for default-init
+    Default,
+    Keep,
+    Zero,
+    Replace,
+    IncrClamp,
+    DecrClamp,
+    Invert,
+    IncrWrap,
+    DecrWrap,
+    Num,
+}
+impl StencilOp {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for StencilOp {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// ```text
+/// sg_blend_factor
+///
+/// The source and destination factors in blending operations.
+/// This is used in the following members when creating a pipeline object:
+///
+/// sg_pipeline_desc
+///     .colors[i]
+///         .blend
+///             .src_factor_rgb
+///             .dst_factor_rgb
+///             .src_factor_alpha
+///             .dst_factor_alpha
+///
+/// The default value is SG_BLENDFACTOR_ONE for source
+/// factors, and SG_BLENDFACTOR_ZERO for destination factors.
+/// ```
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum BlendFactor {
+    /// value 0 reserved for default-init
+    Default,
+    Zero,
+    One,
+    SrcColor,
+    OneMinusSrcColor,
+    SrcAlpha,
+    OneMinusSrcAlpha,
+    DstColor,
+    OneMinusDstColor,
+    DstAlpha,
+    OneMinusDstAlpha,
+    SrcAlphaSaturated,
+    BlendColor,
+    OneMinusBlendColor,
+    BlendAlpha,
+    OneMinusBlendAlpha,
+    Num,
+}
+impl BlendFactor {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for BlendFactor {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// ```text
+/// sg_blend_op
+///
+/// Describes how the source and destination values are combined in the
+/// fragment blending operation. It is used in the following struct items
+/// when creating a pipeline object:
+///
+/// sg_pipeline_desc
+///     .colors[i]
+///         .blend
+///             .op_rgb
+///             .op_alpha
+///
+/// The default value is SG_BLENDOP_ADD.
+/// ```
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum BlendOp {
+    /// value 0 reserved for default-init
+    Default,
+    Add,
+    Subtract,
+    ReverseSubtract,
+    Num,
+}
+impl BlendOp {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for BlendOp {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_color_mask
+///
+/// Selects the active color channels when writing a fragment color to the
+/// framebuffer. This is used in the members
+/// sg_pipeline_desc.colors\[i\].write_mask when creating a pipeline object.
+///
+/// The default colormask is SG_COLORMASK_RGBA (write all colors channels)
+///
+/// NOTE: since the color mask value 0 is reserved for the default value
+/// (SG_COLORMASK_RGBA), use SG_COLORMASK_NONE if all color channels
+/// should be disabled.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum ColorMask {
+    /// value 0 reserved for default-init
+    Default = 0,
+    /// special value for 'all channels disabled
+    None = 16,
+    R = 1,
+    G = 2,
+    Rg = 3,
+    B = 4,
+    Rb = 5,
+    Gb = 6,
+    Rgb = 7,
+    A = 8,
+    Ra = 9,
+    Ga = 10,
+    Rga = 11,
+    Ba = 12,
+    Rba = 13,
+    Gba = 14,
+    Rgba = 15,
+}
+impl ColorMask {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for ColorMask {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_load_action
+///
+/// Defines the load action that should be performed at the start of a render pass:
+///
+/// SG_LOADACTION_CLEAR:        clear the render target
+/// SG_LOADACTION_LOAD:         load the previous content of the render target
+/// SG_LOADACTION_DONTCARE:     leave the render target in an undefined state
+///
+/// This is used in the sg_pass_action structure.
+///
+/// The default load action for all pass attachments is SG_LOADACTION_CLEAR,
+/// with the values rgba = { 0.5f, 0.5f, 0.5f, 1.0f }, depth=1.0f and stencil=0.
+///
+/// If you want to override the default behaviour, it is important to not
+/// only set the clear color, but the 'action' field as well (as long as this
+/// is _SG_LOADACTION_DEFAULT, the value fields will be ignored).
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum LoadAction {
+    Default,
+    Clear,
+    Load,
+    Dontcare,
+}
+impl LoadAction {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for LoadAction {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_store_action
+///
+/// Defines the store action that should be performed at the end of a render pass:
+///
+/// SG_STOREACTION_STORE:       store the rendered content to the color attachment image
+/// SG_STOREACTION_DONTCARE:    allows the GPU to discard the rendered content
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(u32)]
+pub enum StoreAction {
+    Default,
+    Store,
+    Dontcare,
+}
+impl StoreAction {
+    pub const fn new() -> Self {
+        Self::Default
+    }
+}
+impl Default for StoreAction {
+    fn default() -> Self {
+        Self::Default
+    }
+}
+/// sg_pass_action
+///
+/// The sg_pass_action struct defines the actions to be performed
+/// at the start and end of a render pass.
+///
+/// - at the start of the pass: whether the render attachments should be cleared,
+///   loaded with their previous content, or start in an undefined state
+/// - for clear operations: the clear value (color, depth, or stencil values)
+/// - at the end of the pass: whether the rendering result should be
+///   stored back into the render attachment or discarded
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct ColorAttachmentAction {
+    /// default: SG_LOADACTION_CLEAR
+    pub load_action: LoadAction,
+    /// default: SG_STOREACTION_STORE
+    pub store_action: StoreAction,
+    /// default: { 0.5f, 0.5f, 0.5f, 1.0f }
+    pub clear_value: Color,
+}
+impl ColorAttachmentAction {
+    pub const fn new() -> Self {
+        Self {
+            load_action: LoadAction::new(),
+            store_action: StoreAction::new(),
+            clear_value: Color::new(),
+        }
+    }
+}
+impl Default for ColorAttachmentAction {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct DepthAttachmentAction {
+    /// default: SG_LOADACTION_CLEAR
+    pub load_action: LoadAction,
+    /// default: SG_STOREACTION_DONTCARE
+    pub store_action: StoreAction,
+    /// default: 1.0
+    pub clear_value: f32,
+}
+impl DepthAttachmentAction {
+    pub const fn new() -> Self {
+        Self {
+            load_action: LoadAction::new(),
+            store_action: StoreAction::new(),
+            clear_value: 0.0,
+        }
+    }
+}
+impl Default for DepthAttachmentAction {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct StencilAttachmentAction {
+    /// default: SG_LOADACTION_CLEAR
+    pub load_action: LoadAction,
+    /// default: SG_STOREACTION_DONTCARE
+    pub store_action: StoreAction,
+    /// default: 0
+    pub clear_value: u8,
+}
+impl StencilAttachmentAction {
+    pub const fn new() -> Self {
+        Self {
+            load_action: LoadAction::new(),
+            store_action: StoreAction::new(),
+            clear_value: 0,
+        }
+    }
+}
+impl Default for StencilAttachmentAction {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct PassAction {
+    pub colors: [ColorAttachmentAction; 4],
+    pub depth: DepthAttachmentAction,
+    pub stencil: StencilAttachmentAction,
+}
+impl PassAction {
+    pub const fn new() -> Self {
+        Self {
+            colors: [ColorAttachmentAction::new(); 4],
+            depth: DepthAttachmentAction::new(),
+            stencil: StencilAttachmentAction::new(),
+        }
+    }
+}
+impl Default for PassAction {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// ```text
+/// sg_swapchain
+///
+/// Used in sg_begin_pass() to provide details about an external swapchain
+/// (pixel formats, sample count and backend-API specific render surface objects).
+///
+/// The following information must be provided:
+///
+/// - the width and height of the swapchain surfaces in number of pixels,
+/// - the pixel format of the render- and optional msaa-resolve-surface
+/// - the pixel format of the optional depth- or depth-stencil-surface
+/// - the MSAA sample count for the render and depth-stencil surface
+///
+/// If the pixel formats and MSAA sample counts are left zero-initialized,
+/// their defaults are taken from the sg_environment struct provided in the
+/// sg_setup() call.
+///
+/// The width and height *must* be > 0.
+///
+/// Additionally the following backend API specific objects must be passed in
+/// as 'type erased' void pointers:
+///
+/// GL:
+///     - on all GL backends, a GL framebuffer object must be provided. This
+///       can be zero for the default framebuffer.
+///
+/// D3D11:
+///     - an ID3D11RenderTargetView for the rendering surface, without
+///       MSAA rendering this surface will also be displayed
+///     - an optional ID3D11DepthStencilView for the depth- or depth/stencil
+///       buffer surface
+///     - when MSAA rendering is used, another ID3D11RenderTargetView
+///       which serves as MSAA resolve target and will be displayed
+///
+/// WebGPU (same as D3D11, except different types)
+///     - a WGPUTextureView for the rendering surface, without
+///       MSAA rendering this surface will also be displayed
+///     - an optional WGPUTextureView for the depth- or depth/stencil
+///       buffer surface
+///     - when MSAA rendering is used, another WGPUTextureView
+///       which serves as MSAA resolve target and will be displayed
+///
+/// Metal (NOTE that the roles of provided surfaces is slightly different
+/// than on D3D11 or WebGPU in case of MSAA vs non-MSAA rendering):
+///
+///     - A current CAMetalDrawable (NOT an MTLDrawable!) which will be presented.
+///       This will either be rendered to directly (if no MSAA is used), or serve
+///       as MSAA-resolve target.
+///     - an optional MTLTexture for the depth- or depth-stencil buffer
+///     - an optional multisampled MTLTexture which serves as intermediate
+///       rendering surface which will then be resolved into the
+///       CAMetalDrawable.
+///
+/// NOTE that for Metal you must use an ObjC __bridge cast to
+/// properly tunnel the ObjC object id through a C void*, e.g.:
+///
+///     swapchain.metal.current_drawable = (__bridge const void*) [mtkView currentDrawable];
+///
+/// On all other backends you shouldn't need to mess with the reference count.
+///
+/// It's a good practice to write a helper function which returns an initialized
+/// sg_swapchain structs, which can then be plugged directly into
+/// sg_pass.swapchain. Look at the function sglue_swapchain() in the sokol_glue.h
+/// as an example.
+/// ```
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct MetalSwapchain {
+    /// CAMetalDrawable (NOT MTLDrawable!!!)
+    pub current_drawable: *const core::ffi::c_void,
+    /// MTLTexture
+    pub depth_stencil_texture: *const core::ffi::c_void,
+    /// MTLTexture
+    pub msaa_color_texture: *const core::ffi::c_void,
+}
+impl MetalSwapchain {
+    pub const fn new() -> Self {
+        Self {
+            current_drawable: core::ptr::null(),
+            depth_stencil_texture: core::ptr::null(),
+            msaa_color_texture: core::ptr::null(),
+        }
+    }
+}
+impl Default for MetalSwapchain {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct D3d11Swapchain {
+    /// ID3D11RenderTargetView
+    pub render_view: *const core::ffi::c_void,
+    /// ID3D11RenderTargetView
+    pub resolve_view: *const core::ffi::c_void,
+    /// ID3D11DepthStencilView
+    pub depth_stencil_view: *const core::ffi::c_void,
+}
+impl D3d11Swapchain {
+    pub const fn new() -> Self {
+        Self {
+            render_view: core::ptr::null(),
+            resolve_view: core::ptr::null(),
+            depth_stencil_view: core::ptr::null(),
+        }
+    }
+}
+impl Default for D3d11Swapchain {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct WgpuSwapchain {
+    /// WGPUTextureView
+    pub render_view: *const core::ffi::c_void,
+    /// WGPUTextureView
+    pub resolve_view: *const core::ffi::c_void,
+    /// WGPUTextureView
+    pub depth_stencil_view: *const core::ffi::c_void,
+}
+impl WgpuSwapchain {
+    pub const fn new() -> Self {
+        Self {
+            render_view: core::ptr::null(),
+            resolve_view: core::ptr::null(),
+            depth_stencil_view: core::ptr::null(),
+        }
+    }
+}
+impl Default for WgpuSwapchain {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct GlSwapchain {
+    /// GL framebuffer object
+    pub framebuffer: u32,
+}
+impl GlSwapchain {
+    pub const fn new() -> Self {
+        Self {
+            framebuffer: 0,
+        }
+    }
+}
+impl Default for GlSwapchain {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Swapchain {
+    pub width: i32,
+    pub height: i32,
+    pub sample_count: i32,
+    pub color_format: PixelFormat,
+    pub depth_format: PixelFormat,
+    pub metal: MetalSwapchain,
+    pub d3d11: D3d11Swapchain,
+    pub wgpu: WgpuSwapchain,
+    pub gl: GlSwapchain,
+}
+impl Swapchain {
+    pub const fn new() -> Self {
+        Self {
+            width: 0,
+            height: 0,
+            sample_count: 0,
+            color_format: PixelFormat::new(),
+            depth_format: PixelFormat::new(),
+            metal: MetalSwapchain::new(),
+            d3d11: D3d11Swapchain::new(),
+            wgpu: WgpuSwapchain::new(),
+            gl: GlSwapchain::new(),
+        }
+    }
+}
+impl Default for Swapchain {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// ```text
+/// sg_pass
+///
+/// The sg_pass structure is passed as argument into the sg_begin_pass()
+/// function.
+///
+/// For an offscreen rendering pass, an sg_pass_action struct and sg_attachments
+/// object must be provided, and for swapchain passes, an sg_pass_action and
+/// an sg_swapchain struct. It is an error to provide both an sg_attachments
+/// handle and an initialized sg_swapchain struct in the same sg_begin_pass().
+///
+/// An sg_begin_pass() call for an offscreen pass would look like this (where
+/// `attachments` is an sg_attachments handle):
+///
+///     sg_begin_pass(&(sg_pass){
+///         .action = { ... },
+///         .attachments = attachments,
+///     });
+///
+/// ...and a swapchain render pass would look like this (using the sokol_glue.h
+/// helper function sglue_swapchain() which gets the swapchain properties from
+/// sokol_app.h):
+///
+///     sg_begin_pass(&(sg_pass){
+///         .action = { ... },
+///         .swapchain = sglue_swapchain(),
+///     });
+///
+/// You can also omit the .action object to get default pass action behaviour
+/// (clear to color=grey, depth=1 and stencil=0).
+/// ```
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Pass {
+    pub _start_canary: u32,
+    pub action: PassAction,
+    pub attachments: Attachments,
+    pub swapchain: Swapchain,
+    pub label: *const core::ffi::c_char,
+    pub _end_canary: u32,
+}
+impl Pass {
+    pub const fn new() -> Self {
+        Self {
+            _start_canary: 0,
+            action: PassAction::new(),
+            attachments: Attachments::new(),
+            swapchain: Swapchain::new(),
+            label: core::ptr::null(),
+            _end_canary: 0,
+        }
+    }
+}
+impl Default for Pass {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// ```text
+/// sg_bindings
+///
+/// The sg_bindings structure defines the buffers, images and
+/// samplers resource bindings for the next draw call.
+///
+/// To update the resource bindings, call sg_apply_bindings() with
+/// a pointer to a populated sg_bindings struct. Note that
+/// sg_apply_bindings() must be called after sg_apply_pipeline()
+/// and that bindings are not preserved across sg_apply_pipeline()
+/// calls, even when the new pipeline uses the same 'bindings layout'.
+///
+/// A resource binding struct contains:
+///
+/// - 1..N vertex buffers
+/// - 0..N vertex buffer offsets
+/// - 0..1 index buffers
+/// - 0..1 index buffer offsets
+/// - 0..N images
+/// - 0..N samplers
+/// - 0..N storage buffers
+///
+/// Where 'N' is defined in the following constants:
+///
+/// - SG_MAX_VERTEXBUFFER_BINDSLOTS
+/// - SG_MAX_IMAGE_BINDLOTS
+/// - SG_MAX_SAMPLER_BINDSLOTS
+/// - SG_MAX_STORAGEBUFFER_BINDGLOTS
+///
+/// When using sokol-shdc for shader authoring, the `layout(binding=N)`
+/// annotation in the shader code directly maps to the slot index for that
+/// resource type in the bindings struct, for instance the following vertex-
+/// and fragment-shader interface for sokol-shdc:
+///
+///     @vs vs
+///     layout(binding=0) uniform vs_params { ... };
+///     layout(binding=0) readonly buffer ssbo { ... };
+///     layout(binding=0) uniform texture2D vs_tex;
+///     layout(binding=0) uniform sampler vs_smp;
+///     ...
+///     @end
+///
+///     @fs fs
+///     layout(binding=1) uniform fs_params { ... };
+///     layout(binding=1) uniform texture2D fs_tex;
+///     layout(binding=1) uniform sampler fs_smp;
+///     ...
+///     @end
+///
+/// ...would map to the following sg_bindings struct:
+///
+///     const sg_bindings bnd = {
+///         .vertex_buffers[0] = ...,
+///         .images[0] = vs_tex,
+///         .images[1] = fs_tex,
+///         .samplers[0] = vs_smp,
+///         .samplers[1] = fs_smp,
+///         .storage_buffers[0] = ssbo,
+///     };
+///
+/// ...alternatively you can use code-generated slot indices:
+///
+///     const sg_bindings bnd = {
+///         .vertex_buffers[0] = ...,
+///         .images[IMG_vs_tex] = vs_tex,
+///         .images[IMG_fs_tex] = fs_tex,
+///         .samplers[SMP_vs_smp] = vs_smp,
+///         .samplers[SMP_fs_smp] = fs_smp,
+///         .storage_buffers[SBUF_ssbo] = ssbo,
+///     };
+///
+/// Resource bindslots for a specific shader/pipeline may have gaps, and an
+/// sg_bindings struct may have populated bind slots which are not used by a
+/// specific shader. This allows to use the same sg_bindings struct across
+/// different shader variants.
+///
+/// When not using sokol-shdc, the bindslot indices in the sg_bindings
+/// struct need to match the per-resource reflection info slot indices
+/// in the sg_shader_desc struct (for details about that see the
+/// sg_shader_desc struct documentation).
+///
+/// The optional buffer offsets can be used to put different unrelated
+/// chunks of vertex- and/or index-data into the same buffer objects.
+/// ```
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Bindings {
+    pub _start_canary: u32,
+    pub vertex_buffers: [Buffer; 8],
+    pub vertex_buffer_offsets: [i32; 8],
+    pub index_buffer: Buffer,
+    pub index_buffer_offset: i32,
+    pub images: [Image; 16],
+    pub samplers: [Sampler; 16],
+    pub storage_buffers: [Buffer; 8],
+    pub _end_canary: u32,
+}
+impl Bindings {
+    pub const fn new() -> Self {
+        Self {
+            _start_canary: 0,
+            vertex_buffers: [Buffer::new(); 8],
+            vertex_buffer_offsets: [0; 8],
+            index_buffer: Buffer::new(),
+            index_buffer_offset: 0,
+            images: [Image::new(); 16],
+            samplers: [Sampler::new(); 16],
+            storage_buffers: [Buffer::new(); 8],
+            _end_canary: 0,
+        }
+    }
+}
+impl Default for Bindings {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sg_buffer_desc
+///
+/// Creation parameters for sg_buffer objects, used in the
+/// sg_make_buffer() call.
+///
+/// The default configuration is:
+///
+/// .size:      0       (*must* be \>0 for buffers without data)
+/// .type:      SG_BUFFERTYPE_VERTEXBUFFER
+/// .usage:     SG_USAGE_IMMUTABLE
+/// .data.ptr   0       (*must* be valid for immutable buffers)
+/// .data.size  0       (*must* be \> 0 for immutable buffers)
+/// .label      0       (optional string label)
+///
+/// For immutable buffers which are initialized with initial data,
+/// keep the .size item zero-initialized, and set the size together with the
+/// pointer to the initial data in the .data item.
+///
+/// For mutable buffers without initial data, keep the .data item
+/// zero-initialized, and set the buffer size in the .size item instead.
+///
+/// You can also set both size values, but currently both size values must
+/// be identical (this may change in the future when the dynamic resource
+/// management may become more flexible).
+///
+/// ADVANCED TOPIC: Injecting native 3D-API buffers:
+///
+/// The following struct members allow to inject your own GL, Metal
+/// or D3D11 buffers into sokol_gfx:
+///
+/// .gl_buffers\[SG_NUM_INFLIGHT_FRAMES\]
+/// .mtl_buffers\[SG_NUM_INFLIGHT_FRAMES\]
+/// .d3d11_buffer
+///
+/// You must still provide all other struct items except the .data item, and
+/// these must match the creation parameters of the native buffers you
+/// provide. For SG_USAGE_IMMUTABLE, only provide a single native 3D-API
+/// buffer, otherwise you need to provide SG_NUM_INFLIGHT_FRAMES buffers
+/// (only for GL and Metal, not D3D11). Providing multiple buffers for GL and
+/// Metal is necessary because sokol_gfx will rotate through them when
+/// calling sg_update_buffer() to prevent lock-stalls.
+///
+/// Note that it is expected that immutable injected buffer have already been
+/// initialized with content, and the .content member must be 0!
+///
+/// Also you need to call sg_reset_state_cache() after calling native 3D-API
+/// functions, and before calling any sokol_gfx function.
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct BufferDesc {
+    pub _start_canary: u32,
+    pub size: usize,
+    pub _type: BufferType,
+    pub usage: Usage,
+    pub data: Range,
+    pub label: *const core::ffi::c_char,
+    pub gl_buffers: [u32; 2],
+    pub mtl_buffers: [*const core::ffi::c_void; 2],
+    pub d3d11_buffer: *const core::ffi::c_void,
+    pub wgpu_buffer: *const core::ffi::c_void,
+    pub _end_canary: u32,
+}
+impl BufferDesc {
+    pub const fn new() -> Self {
+        Self {
+            _start_canary: 0,
+            size: 0,
+            _type: BufferType::new(),
+            usage: Usage::new(),
+            data: Range::new(),
+            label: core::ptr::null(),
+            gl_buffers: [0; 2],
+            mtl_buffers: [core::ptr::null(); 2],
+            d3d11_buffer: core::ptr::null(),
+            wgpu_buffer: core::ptr::null(),
+            _end_canary: 0,
+        }
+    }
+}
+impl Default for BufferDesc {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sg_image_data
+///
+/// Defines the content of an image through a 2D array of sg_range structs.
+/// The first array dimension is the cubemap face, and the second array
+/// dimension the mipmap level.
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct ImageData {
+    pub subimage: [[Range; 16]; 6],
+}
+impl ImageData {
+    pub const fn new() -> Self {
+        Self {
+            subimage: [[Range::new(); 16]; 6],
+        }
+    }
+}
+impl Default for ImageData {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sg_image_desc
+///
+/// Creation parameters for sg_image objects, used in the sg_make_image() call.
+///
+/// The default configuration is:
+///
+/// .type:              SG_IMAGETYPE_2D
+/// .render_target:     false
+/// .width              0 (must be set to \>0)
+/// .height             0 (must be set to \>0)
+/// .num_slices         1 (3D textures: depth; array textures: number of layers)
+/// .num_mipmaps:       1
+/// .usage:             SG_USAGE_IMMUTABLE
+/// .pixel_format:      SG_PIXELFORMAT_RGBA8 for textures, or sg_desc.environment.defaults.color_format for render targets
+/// .sample_count:      1 for textures, or sg_desc.environment.defaults.sample_count for render targets
+/// .data               an sg_image_data struct to define the initial content
+/// .label              0 (optional string label for trace hooks)
+///
+/// Q: Why is the default sample_count for render targets identical with the
+/// "default sample count" from sg_desc.environment.defaults.sample_count?
+///
+/// A: So that it matches the default sample count in pipeline objects. Even
+/// though it is a bit strange/confusing that offscreen render targets by default
+/// get the same sample count as 'default swapchains', but it's better that
+/// an offscreen render target created with default parameters matches
+/// a pipeline object created with default parameters.
+///
+/// NOTE:
+///
+/// Images with usage SG_USAGE_IMMUTABLE must be fully initialized by
+/// providing a valid .data member which points to initialization data.
+///
+/// ADVANCED TOPIC: Injecting native 3D-API textures:
+///
+/// The following struct members allow to inject your own GL, Metal or D3D11
+/// textures into sokol_gfx:
+///
+/// .gl_textures\[SG_NUM_INFLIGHT_FRAMES\]
+/// .mtl_textures\[SG_NUM_INFLIGHT_FRAMES\]
+/// .d3d11_texture
+/// .d3d11_shader_resource_view
+/// .wgpu_texture
+/// .wgpu_texture_view
+///
+/// For GL, you can also specify the texture target or leave it empty to use
+/// the default texture target for the image type (GL_TEXTURE_2D for
+/// SG_IMAGETYPE_2D etc)
+///
+/// For D3D11 and WebGPU, either only provide a texture, or both a texture and
+/// shader-resource-view / texture-view object. If you want to use access the
+/// injected texture in a shader you *must* provide a shader-resource-view.
+///
+/// The same rules apply as for injecting native buffers (see sg_buffer_desc
+/// documentation for more details).
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct ImageDesc {
+    pub _start_canary: u32,
+    pub _type: ImageType,
+    pub render_target: bool,
+    pub width: i32,
+    pub height: i32,
+    pub num_slices: i32,
+    pub num_mipmaps: i32,
+    pub usage: Usage,
+    pub pixel_format: PixelFormat,
+    pub sample_count: i32,
+    pub data: ImageData,
+    pub label: *const core::ffi::c_char,
+    pub gl_textures: [u32; 2],
+    pub gl_texture_target: u32,
+    pub mtl_textures: [*const core::ffi::c_void; 2],
+    pub d3d11_texture: *const core::ffi::c_void,
+    pub d3d11_shader_resource_view: *const core::ffi::c_void,
+    pub wgpu_texture: *const core::ffi::c_void,
+    pub wgpu_texture_view: *const core::ffi::c_void,
+    pub _end_canary: u32,
+}
+impl ImageDesc {
+    pub const fn new() -> Self {
+        Self {
+            _start_canary: 0,
+            _type: ImageType::new(),
+            render_target: false,
+            width: 0,
+            height: 0,
+            num_slices: 0,
+            num_mipmaps: 0,
+            usage: Usage::new(),
+            pixel_format: PixelFormat::new(),
+            sample_count: 0,
+            data: ImageData::new(),
+            label: core::ptr::null(),
+            gl_textures: [0; 2],
+            gl_texture_target: 0,
+            mtl_textures: [core::ptr::null(); 2],
+            d3d11_texture: core::ptr::null(),
+            d3d11_shader_resource_view: core::ptr::null(),
+            wgpu_texture: core::ptr::null(),
+            wgpu_texture_view: core::ptr::null(),
+            _end_canary: 0,
+        }
+    }
+}
+impl Default for ImageDesc {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sg_sampler_desc
+///
+/// Creation parameters for sg_sampler objects, used in the sg_make_sampler() call
+///
+/// .min_filter:        SG_FILTER_NEAREST
+/// .mag_filter:        SG_FILTER_NEAREST
+/// .mipmap_filter      SG_FILTER_NEAREST
+/// .wrap_u:            SG_WRAP_REPEAT
+/// .wrap_v:            SG_WRAP_REPEAT
+/// .wrap_w:            SG_WRAP_REPEAT (only SG_IMAGETYPE_3D)
+/// .min_lod            0.0f
+/// .max_lod            FLT_MAX
+/// .border_color       SG_BORDERCOLOR_OPAQUE_BLACK
+/// .compare            SG_COMPAREFUNC_NEVER
+/// .max_anisotropy     1 (must be 1..16)
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct SamplerDesc {
+    pub _start_canary: u32,
+    pub min_filter: Filter,
+    pub mag_filter: Filter,
+    pub mipmap_filter: Filter,
+    pub wrap_u: Wrap,
+    pub wrap_v: Wrap,
+    pub wrap_w: Wrap,
+    pub min_lod: f32,
+    pub max_lod: f32,
+    pub border_color: BorderColor,
+    pub compare: CompareFunc,
+    pub max_anisotropy: u32,
+    pub label: *const core::ffi::c_char,
+    pub gl_sampler: u32,
+    pub mtl_sampler: *const core::ffi::c_void,
+    pub d3d11_sampler: *const core::ffi::c_void,
+    pub wgpu_sampler: *const core::ffi::c_void,
+    pub _end_canary: u32,
+}
+impl SamplerDesc {
+    pub const fn new() -> Self {
+        Self {
+            _start_canary: 0,
+            min_filter: Filter::new(),
+            mag_filter: Filter::new(),
+            mipmap_filter: Filter::new(),
+            wrap_u: Wrap::new(),
+            wrap_v: Wrap::new(),
+            wrap_w: Wrap::new(),
+            min_lod: 0.0,
+            max_lod: 0.0,
+            border_color: BorderColor::new(),
+            compare: CompareFunc::new(),
+            max_anisotropy: 0,
+            label: core::ptr::null(),
+            gl_sampler: 0,
+            mtl_sampler: core::ptr::null(),
+            d3d11_sampler: core::ptr::null(),
+            wgpu_sampler: core::ptr::null(),
+            _end_canary: 0,
+        }
+    }
+}
+impl Default for SamplerDesc {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// ```text
+/// sg_shader_desc
+///
+/// Used as parameter of sg_make_shader() to create a shader object which
+/// communicates shader source or bytecode and shader interface
+/// reflection information to sokol-gfx.
+///
+/// If you use sokol-shdc you can ignore the following information since
+/// the sg_shader_desc struct will be code generated.
+///
+/// Otherwise you need to provide the following information to the
+/// sg_make_shader() call:
+///
+/// - a vertex- and fragment-shader function:
+///     - the shader source or bytecode
+///     - an optional entry point name
+///     - for D3D11: an optional compile target when source code is provided
+///       (the defaults are "vs_4_0" and "ps_4_0")
+///
+/// - vertex attributes required by some backends:
+///     - for the GL backend: optional vertex attribute names
+///       used for name lookup
+///     - for the D3D11 backend: semantic names and indices
+///
+/// - reflection information for each uniform block used by the shader:
+///     - the shader stage the uniform block appears in (SG_SHADERSTAGE_*)
+///     - the size in bytes of the uniform block
+///     - backend-specific bindslots:
+///         - HLSL: the constant buffer register `register(b0..7)`
+///         - MSL: the buffer attribute `[[buffer(0..7)]]`
+///         - WGSL: the binding in `@group(0) @binding(0..15)`
+///     - GLSL only: a description of the uniform block interior
+///         - the memory layout standard (SG_UNIFORMLAYOUT_*)
+///         - for each member in the uniform block:
+///             - the member type (SG_UNIFORM_*)
+///             - if the member is an array, the array count
+///             - the member name
+///
+/// - reflection information for each texture used by the shader:
+///     - the shader stage the texture appears in (SG_SHADERSTAGE_*)
+///     - the image type (SG_IMAGETYPE_*)
+///     - the image-sample type (SG_IMAGESAMPLETYPE_*)
+///     - whether the texture is multisampled
+///     - backend specific bindslots:
+///         - HLSL: the texture register `register(t0..23)`
+///         - MSL: the texture attribute `[[texture(0..15)]]`
+///         - WGSL: the binding in `@group(1) @binding(0..127)`
+///
+/// - reflection information for each sampler used by the shader:
+///     - the shader stage the sampler appears in (SG_SHADERSTAGE_*)
+///     - the sampler type (SG_SAMPLERTYPE_*)
+///     - backend specific bindslots:
+///         - HLSL: the sampler register `register(s0..15)`
+///         - MSL: the sampler attribute `[[sampler(0..15)]]`
+///         - WGSL: the binding in `@group(0) @binding(0..127)`
+///
+/// - reflection information for each storage buffer used by the shader:
+///     - the shader stage the storage buffer appears in (SG_SHADERSTAGE_*)
+///     - whether the storage buffer is readonly (currently this must
+///       always be true)
+///     - backend specific bindslots:
+///         - HLSL: the texture(sic) register `register(t0..23)`
+///         - MSL: the buffer attribute `[[buffer(8..15)]]`
+///         - WGSL: the binding in `@group(1) @binding(0..127)`
+///         - GL: the binding in `layout(binding=0..16)`
+///
+/// - reflection information for each combined image-sampler object
+///   used by the shader:
+///     - the shader stage (SG_SHADERSTAGE_*)
+///     - the texture's array index in the sg_shader_desc.images[] array
+///     - the sampler's array index in the sg_shader_desc.samplers[] array
+///     - GLSL only: the name of the combined image-sampler object
+///
+/// The number and order of items in the sg_shader_desc.attrs[]
+/// array corresponds to the items in sg_pipeline_desc.layout.attrs.
+///
+///     - sg_shader_desc.attrs[N] => sg_pipeline_desc.layout.attrs[N]
+///
+/// NOTE that vertex attribute indices currently cannot have gaps.
+///
+/// The items index in the sg_shader_desc.uniform_blocks[] array corresponds
+/// to the ub_slot arg in sg_apply_uniforms():
+///
+///     - sg_shader_desc.uniform_blocks[N] => sg_apply_uniforms(N, ...)
+///
+/// The items in the shader_desc images, samplers and storage_buffers
+/// arrays correspond to the same array items in the sg_bindings struct:
+///
+///     - sg_shader_desc.images[N] => sg_bindings.images[N]
+///     - sg_shader_desc.samplers[N] => sg_bindings.samplers[N]
+///     - sg_shader_desc.storage_buffers[N] => sg_bindings.storage_buffers[N]
+///
+/// For all GL backends, shader source-code must be provided. For D3D11 and Metal,
+/// either shader source-code or byte-code can be provided.
+///
+/// NOTE that the uniform block, image, sampler and storage_buffer arrays
+/// can have gaps. This allows to use the same sg_bindings struct for
+/// different related shader variants.
+///
+/// For D3D11, if source code is provided, the d3dcompiler_47.dll will be loaded
+/// on demand. If this fails, shader creation will fail. When compiling HLSL
+/// source code, you can provide an optional target string via
+/// sg_shader_stage_desc.d3d11_target, the default target is "vs_4_0" for the
+/// vertex shader stage and "ps_4_0" for the pixel shader stage.
+/// ```
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(i32)]
+pub enum ShaderStage {
+    None,
+    Vertex,
+    Fragment,
+}
+impl ShaderStage {
+    pub const fn new() -> Self {
+        Self::None
+    }
+}
+impl Default for ShaderStage {
+    fn default() -> Self {
+        Self::None
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct ShaderFunction {
+    pub source: *const core::ffi::c_char,
+    pub bytecode: Range,
+    pub entry: *const core::ffi::c_char,
+    /// default: "vs_4_0" or "ps_4_0"
+    pub d3d11_target: *const core::ffi::c_char,
+}
+impl ShaderFunction {
+    pub const fn new() -> Self {
+        Self {
+            source: core::ptr::null(),
+            bytecode: Range::new(),
+            entry: core::ptr::null(),
+            d3d11_target: core::ptr::null(),
+        }
+    }
+}
+impl Default for ShaderFunction {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct ShaderVertexAttr {
+    /// \[optional\] GLSL attribute name
+    pub glsl_name: *const core::ffi::c_char,
+    /// HLSL semantic name
+    pub hlsl_sem_name: *const core::ffi::c_char,
+    /// HLSL semantic index
+    pub hlsl_sem_index: u8,
+}
+impl ShaderVertexAttr {
+    pub const fn new() -> Self {
+        Self {
+            glsl_name: core::ptr::null(),
+            hlsl_sem_name: core::ptr::null(),
+            hlsl_sem_index: 0,
+        }
+    }
+}
+impl Default for ShaderVertexAttr {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct GlslShaderUniform {
+    pub _type: UniformType,
+    /// 0 or 1 for scalars, \>1 for arrays
+    pub array_count: u16,
+    /// glsl name binding is required on GL 4.1 and WebGL2
+    pub glsl_name: *const core::ffi::c_char,
+}
+impl GlslShaderUniform {
+    pub const fn new() -> Self {
+        Self {
+            _type: UniformType::new(),
+            array_count: 0,
+            glsl_name: core::ptr::null(),
+        }
+    }
+}
+impl Default for GlslShaderUniform {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct ShaderUniformBlock {
+    pub stage: ShaderStage,
+    pub size: u32,
+    /// HLSL register(bn)
+    pub hlsl_register_b_n: u8,
+    /// MSL \[\[buffer(n)\]\]
+    pub msl_buffer_n: u8,
+    /// WGSL @group(0) @binding(n)
+    pub wgsl_group0_binding_n: u8,
+    pub layout: UniformLayout,
+    pub glsl_uniforms: [GlslShaderUniform; 16],
+}
+impl ShaderUniformBlock {
+    pub const fn new() -> Self {
+        Self {
+            stage: ShaderStage::new(),
+            size: 0,
+            hlsl_register_b_n: 0,
+            msl_buffer_n: 0,
+            wgsl_group0_binding_n: 0,
+            layout: UniformLayout::new(),
+            glsl_uniforms: [GlslShaderUniform::new(); 16],
+        }
+    }
+}
+impl Default for ShaderUniformBlock {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct ShaderImage {
+    pub stage: ShaderStage,
+    pub image_type: ImageType,
+    pub sample_type: ImageSampleType,
+    pub multisampled: bool,
+    /// HLSL register(tn) bind slot
+    pub hlsl_register_t_n: u8,
+    /// MSL \[\[texture(n)\]\] bind slot
+    pub msl_texture_n: u8,
+    /// WGSL @group(1) @binding(n) bind slot
+    pub wgsl_group1_binding_n: u8,
+}
+impl ShaderImage {
+    pub const fn new() -> Self {
+        Self {
+            stage: ShaderStage::new(),
+            image_type: ImageType::new(),
+            sample_type: ImageSampleType::new(),
+            multisampled: false,
+            hlsl_register_t_n: 0,
+            msl_texture_n: 0,
+            wgsl_group1_binding_n: 0,
+        }
+    }
+}
+impl Default for ShaderImage {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct ShaderSampler {
+    pub stage: ShaderStage,
+    pub sampler_type: SamplerType,
+    /// HLSL register(sn) bind slot
+    pub hlsl_register_s_n: u8,
+    /// MSL \[\[sampler(n)\]\] bind slot
+    pub msl_sampler_n: u8,
+    /// WGSL @group(1) @binding(n) bind slot
+    pub wgsl_group1_binding_n: u8,
+}
+impl ShaderSampler {
+    pub const fn new() -> Self {
+        Self {
+            stage: ShaderStage::new(),
+            sampler_type: SamplerType::new(),
+            hlsl_register_s_n: 0,
+            msl_sampler_n: 0,
+            wgsl_group1_binding_n: 0,
+        }
+    }
+}
+impl Default for ShaderSampler {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct ShaderStorageBuffer {
+    pub stage: ShaderStage,
+    pub readonly: bool,
+    /// HLSL register(tn) bind slot
+    pub hlsl_register_t_n: u8,
+    /// MSL \[\[buffer(n)\]\] bind slot
+    pub msl_buffer_n: u8,
+    /// WGSL @group(1) @binding(n) bind slot
+    pub wgsl_group1_binding_n: u8,
+    /// GLSL layout(binding=n)
+    pub glsl_binding_n: u8,
+}
+impl ShaderStorageBuffer {
+    pub const fn new() -> Self {
+        Self {
+            stage: ShaderStage::new(),
+            readonly: false,
+            hlsl_register_t_n: 0,
+            msl_buffer_n: 0,
+            wgsl_group1_binding_n: 0,
+            glsl_binding_n: 0,
+        }
+    }
+}
+impl Default for ShaderStorageBuffer {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct ShaderImageSamplerPair {
+    pub stage: ShaderStage,
+    pub image_slot: u8,
+    pub sampler_slot: u8,
+    /// glsl name binding required because of GL 4.1 and WebGL2
+    pub glsl_name: *const core::ffi::c_char,
+}
+impl ShaderImageSamplerPair {
+    pub const fn new() -> Self {
+        Self {
+            stage: ShaderStage::new(),
+            image_slot: 0,
+            sampler_slot: 0,
+            glsl_name: core::ptr::null(),
+        }
+    }
+}
+impl Default for ShaderImageSamplerPair {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct ShaderDesc {
+    pub _start_canary: u32,
+    pub vertex_func: ShaderFunction,
+    pub fragment_func: ShaderFunction,
+    pub attrs: [ShaderVertexAttr; 16],
+    pub uniform_blocks: [ShaderUniformBlock; 8],
+    pub storage_buffers: [ShaderStorageBuffer; 8],
+    pub images: [ShaderImage; 16],
+    pub samplers: [ShaderSampler; 16],
+    pub image_sampler_pairs: [ShaderImageSamplerPair; 16],
+    pub label: *const core::ffi::c_char,
+    pub _end_canary: u32,
+}
+impl ShaderDesc {
+    pub const fn new() -> Self {
+        Self {
+            _start_canary: 0,
+            vertex_func: ShaderFunction::new(),
+            fragment_func: ShaderFunction::new(),
+            attrs: [ShaderVertexAttr::new(); 16],
+            uniform_blocks: [ShaderUniformBlock::new(); 8],
+            storage_buffers: [ShaderStorageBuffer::new(); 8],
+            images: [ShaderImage::new(); 16],
+            samplers: [ShaderSampler::new(); 16],
+            image_sampler_pairs: [ShaderImageSamplerPair::new(); 16],
+            label: core::ptr::null(),
+            _end_canary: 0,
+        }
+    }
+}
+impl Default for ShaderDesc {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// ```text
+/// sg_pipeline_desc
+///
+/// The sg_pipeline_desc struct defines all creation parameters for an
+/// sg_pipeline object, used as argument to the sg_make_pipeline() function:
+///
+/// - the vertex layout for all input vertex buffers
+/// - a shader object
+/// - the 3D primitive type (points, lines, triangles, ...)
+/// - the index type (none, 16- or 32-bit)
+/// - all the fixed-function-pipeline state (depth-, stencil-, blend-state, etc...)
+///
+/// If the vertex data has no gaps between vertex components, you can omit
+/// the .layout.buffers[].stride and layout.attrs[].offset items (leave them
+/// default-initialized to 0), sokol-gfx will then compute the offsets and
+/// strides from the vertex component formats (.layout.attrs[].format).
+/// Please note that ALL vertex attribute offsets must be 0 in order for the
+/// automatic offset computation to kick in.
+///
+/// The default configuration is as follows:
+///
+/// .shader:                0 (must be initialized with a valid sg_shader id!)
+/// .layout:
+///     .buffers[]:         vertex buffer layouts
+///         .stride:        0 (if no stride is given it will be computed)
+///         .step_func      SG_VERTEXSTEP_PER_VERTEX
+///         .step_rate      1
+///     .attrs[]:           vertex attribute declarations
+///         .buffer_index   0 the vertex buffer bind slot
+///         .offset         0 (offsets can be omitted if the vertex layout has no gaps)
+///         .format         SG_VERTEXFORMAT_INVALID (must be initialized!)
+/// .depth:
+///     .pixel_format:      sg_desc.context.depth_format
+///     .compare:           SG_COMPAREFUNC_ALWAYS
+///     .write_enabled:     false
+///     .bias:              0.0f
+///     .bias_slope_scale:  0.0f
+///     .bias_clamp:        0.0f
+/// .stencil:
+///     .enabled:           false
+///     .front/back:
+///         .compare:       SG_COMPAREFUNC_ALWAYS
+///         .fail_op:       SG_STENCILOP_KEEP
+///         .depth_fail_op: SG_STENCILOP_KEEP
+///         .pass_op:       SG_STENCILOP_KEEP
+///     .read_mask:         0
+///     .write_mask:        0
+///     .ref:               0
+/// .color_count            1
+/// .colors[0..color_count]
+///     .pixel_format       sg_desc.context.color_format
+///     .write_mask:        SG_COLORMASK_RGBA
+///     .blend:
+///         .enabled:           false
+///         .src_factor_rgb:    SG_BLENDFACTOR_ONE
+///         .dst_factor_rgb:    SG_BLENDFACTOR_ZERO
+///         .op_rgb:            SG_BLENDOP_ADD
+///         .src_factor_alpha:  SG_BLENDFACTOR_ONE
+///         .dst_factor_alpha:  SG_BLENDFACTOR_ZERO
+///         .op_alpha:          SG_BLENDOP_ADD
+/// .primitive_type:            SG_PRIMITIVETYPE_TRIANGLES
+/// .index_type:                SG_INDEXTYPE_NONE
+/// .cull_mode:                 SG_CULLMODE_NONE
+/// .face_winding:              SG_FACEWINDING_CW
+/// .sample_count:              sg_desc.context.sample_count
+/// .blend_color:               (sg_color) { 0.0f, 0.0f, 0.0f, 0.0f }
+/// .alpha_to_coverage_enabled: false
+/// .label  0       (optional string label for trace hooks)
+/// ```
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct VertexBufferLayoutState {
+    pub stride: i32,
+    pub step_func: VertexStep,
+    pub step_rate: i32,
+}
+impl VertexBufferLayoutState {
+    pub const fn new() -> Self {
+        Self {
+            stride: 0,
+            step_func: VertexStep::new(),
+            step_rate: 0,
+        }
+    }
+}
+impl Default for VertexBufferLayoutState {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct VertexAttrState {
+    pub buffer_index: i32,
+    pub offset: i32,
+    pub format: VertexFormat,
+}
+impl VertexAttrState {
+    pub const fn new() -> Self {
+        Self {
+            buffer_index: 0,
+            offset: 0,
+            format: VertexFormat::new(),
+        }
+    }
+}
+impl Default for VertexAttrState {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct VertexLayoutState {
+    pub buffers: [VertexBufferLayoutState; 8],
+    pub attrs: [VertexAttrState; 16],
+}
+impl VertexLayoutState {
+    pub const fn new() -> Self {
+        Self {
+            buffers: [VertexBufferLayoutState::new(); 8],
+            attrs: [VertexAttrState::new(); 16],
+        }
+    }
+}
+impl Default for VertexLayoutState {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct StencilFaceState {
+    pub compare: CompareFunc,
+    pub fail_op: StencilOp,
+    pub depth_fail_op: StencilOp,
+    pub pass_op: StencilOp,
+}
+impl StencilFaceState {
+    pub const fn new() -> Self {
+        Self {
+            compare: CompareFunc::new(),
+            fail_op: StencilOp::new(),
+            depth_fail_op: StencilOp::new(),
+            pass_op: StencilOp::new(),
+        }
+    }
+}
+impl Default for StencilFaceState {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct StencilState {
+    pub enabled: bool,
+    pub front: StencilFaceState,
+    pub back: StencilFaceState,
+    pub read_mask: u8,
+    pub write_mask: u8,
+    pub _ref: u8,
+}
+impl StencilState {
+    pub const fn new() -> Self {
+        Self {
+            enabled: false,
+            front: StencilFaceState::new(),
+            back: StencilFaceState::new(),
+            read_mask: 0,
+            write_mask: 0,
+            _ref: 0,
+        }
+    }
+}
+impl Default for StencilState {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct DepthState {
+    pub pixel_format: PixelFormat,
+    pub compare: CompareFunc,
+    pub write_enabled: bool,
+    pub bias: f32,
+    pub bias_slope_scale: f32,
+    pub bias_clamp: f32,
+}
+impl DepthState {
+    pub const fn new() -> Self {
+        Self {
+            pixel_format: PixelFormat::new(),
+            compare: CompareFunc::new(),
+            write_enabled: false,
+            bias: 0.0,
+            bias_slope_scale: 0.0,
+            bias_clamp: 0.0,
+        }
+    }
+}
+impl Default for DepthState {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct BlendState {
+    pub enabled: bool,
+    pub src_factor_rgb: BlendFactor,
+    pub dst_factor_rgb: BlendFactor,
+    pub op_rgb: BlendOp,
+    pub src_factor_alpha: BlendFactor,
+    pub dst_factor_alpha: BlendFactor,
+    pub op_alpha: BlendOp,
+}
+impl BlendState {
+    pub const fn new() -> Self {
+        Self {
+            enabled: false,
+            src_factor_rgb: BlendFactor::new(),
+            dst_factor_rgb: BlendFactor::new(),
+            op_rgb: BlendOp::new(),
+            src_factor_alpha: BlendFactor::new(),
+            dst_factor_alpha: BlendFactor::new(),
+            op_alpha: BlendOp::new(),
+        }
+    }
+}
+impl Default for BlendState {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct ColorTargetState {
+    pub pixel_format: PixelFormat,
+    pub write_mask: ColorMask,
+    pub blend: BlendState,
+}
+impl ColorTargetState {
+    pub const fn new() -> Self {
+        Self {
+            pixel_format: PixelFormat::new(),
+            write_mask: ColorMask::new(),
+            blend: BlendState::new(),
+        }
+    }
+}
+impl Default for ColorTargetState {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct PipelineDesc {
+    pub _start_canary: u32,
+    pub shader: Shader,
+    pub layout: VertexLayoutState,
+    pub depth: DepthState,
+    pub stencil: StencilState,
+    pub color_count: i32,
+    pub colors: [ColorTargetState; 4],
+    pub primitive_type: PrimitiveType,
+    pub index_type: IndexType,
+    pub cull_mode: CullMode,
+    pub face_winding: FaceWinding,
+    pub sample_count: i32,
+    pub blend_color: Color,
+    pub alpha_to_coverage_enabled: bool,
+    pub label: *const core::ffi::c_char,
+    pub _end_canary: u32,
+}
+impl PipelineDesc {
+    pub const fn new() -> Self {
+        Self {
+            _start_canary: 0,
+            shader: Shader::new(),
+            layout: VertexLayoutState::new(),
+            depth: DepthState::new(),
+            stencil: StencilState::new(),
+            color_count: 0,
+            colors: [ColorTargetState::new(); 4],
+            primitive_type: PrimitiveType::new(),
+            index_type: IndexType::new(),
+            cull_mode: CullMode::new(),
+            face_winding: FaceWinding::new(),
+            sample_count: 0,
+            blend_color: Color::new(),
+            alpha_to_coverage_enabled: false,
+            label: core::ptr::null(),
+            _end_canary: 0,
+        }
+    }
+}
+impl Default for PipelineDesc {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sg_attachments_desc
+///
+/// Creation parameters for an sg_attachments object, used as argument to the
+/// sg_make_attachments() function.
+///
+/// An attachments object bundles 0..4 color attachments, 0..4 msaa-resolve
+/// attachments, and none or one depth-stencil attachmente for use
+/// in a render pass. At least one color attachment or one depth-stencil
+/// attachment must be provided (no color attachment and a depth-stencil
+/// attachment is useful for a depth-only render pass).
+///
+/// Each attachment definition consists of an image object, and two additional indices
+/// describing which subimage the pass will render into: one mipmap index, and if the image
+/// is a cubemap, array-texture or 3D-texture, the face-index, array-layer or
+/// depth-slice.
+///
+/// All attachments must have the same width and height.
+///
+/// All color attachments and the depth-stencil attachment must have the
+/// same sample count.
+///
+/// If a resolve attachment is set, an MSAA-resolve operation from the
+/// associated color attachment image into the resolve attachment image will take
+/// place in the sg_end_pass() function. In this case, the color attachment
+/// must have a (sample_count\>1), and the resolve attachment a
+/// (sample_count==1). The resolve attachment also must have the same pixel
+/// format as the color attachment.
+///
+/// NOTE that MSAA depth-stencil attachments cannot be msaa-resolved!
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct AttachmentDesc {
+    pub image: Image,
+    pub mip_level: i32,
+    /// cube texture: face; array texture: layer; 3D texture: slice
+    pub slice: i32,
+}
+impl AttachmentDesc {
+    pub const fn new() -> Self {
+        Self {
+            image: Image::new(),
+            mip_level: 0,
+            slice: 0,
+        }
+    }
+}
+impl Default for AttachmentDesc {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct AttachmentsDesc {
+    pub _start_canary: u32,
+    pub colors: [AttachmentDesc; 4],
+    pub resolves: [AttachmentDesc; 4],
+    pub depth_stencil: AttachmentDesc,
+    pub label: *const core::ffi::c_char,
+    pub _end_canary: u32,
+}
+impl AttachmentsDesc {
+    pub const fn new() -> Self {
+        Self {
+            _start_canary: 0,
+            colors: [AttachmentDesc::new(); 4],
+            resolves: [AttachmentDesc::new(); 4],
+            depth_stencil: AttachmentDesc::new(),
+            label: core::ptr::null(),
+            _end_canary: 0,
+        }
+    }
+}
+impl Default for AttachmentsDesc {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sg_trace_hooks
+///
+/// Installable callback functions to keep track of the sokol-gfx calls,
+/// this is useful for debugging, or keeping track of resource creation
+/// and destruction.
+///
+/// Trace hooks are installed with sg_install_trace_hooks(), this returns
+/// another sg_trace_hooks struct with the previous set of
+/// trace hook function pointers. These should be invoked by the
+/// new trace hooks to form a proper call chain.
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct TraceHooks {
+    pub user_data: *mut core::ffi::c_void,
+    pub reset_state_cache: Option<extern "C" fn(*mut core::ffi::c_void)>,
+    pub make_buffer: Option<extern "C" fn(*const BufferDesc, Buffer, *mut core::ffi::c_void)>,
+    pub make_image: Option<extern "C" fn(*const ImageDesc, Image, *mut core::ffi::c_void)>,
+    pub make_sampler: Option<extern "C" fn(*const SamplerDesc, Sampler, *mut core::ffi::c_void)>,
+    pub make_shader: Option<extern "C" fn(*const ShaderDesc, Shader, *mut core::ffi::c_void)>,
+    pub make_pipeline: Option<extern "C" fn(*const PipelineDesc, Pipeline, *mut core::ffi::c_void)>,
+    pub make_attachments: Option<extern "C" fn(*const AttachmentsDesc, Attachments, *mut core::ffi::c_void)>,
+    pub destroy_buffer: Option<extern "C" fn(Buffer, *mut core::ffi::c_void)>,
+    pub destroy_image: Option<extern "C" fn(Image, *mut core::ffi::c_void)>,
+    pub destroy_sampler: Option<extern "C" fn(Sampler, *mut core::ffi::c_void)>,
+    pub destroy_shader: Option<extern "C" fn(Shader, *mut core::ffi::c_void)>,
+    pub destroy_pipeline: Option<extern "C" fn(Pipeline, *mut core::ffi::c_void)>,
+    pub destroy_attachments: Option<extern "C" fn(Attachments, *mut core::ffi::c_void)>,
+    pub update_buffer: Option<extern "C" fn(Buffer, *const Range, *mut core::ffi::c_void)>,
+    pub update_image: Option<extern "C" fn(Image, *const ImageData, *mut core::ffi::c_void)>,
+    pub append_buffer: Option<extern "C" fn(Buffer, *const Range, i32, *mut core::ffi::c_void)>,
+    pub begin_pass: Option<extern "C" fn(*const Pass, *mut core::ffi::c_void)>,
+    pub apply_viewport: Option<extern "C" fn(i32, i32, i32, i32, bool, *mut core::ffi::c_void)>,
+    pub apply_scissor_rect: Option<extern "C" fn(i32, i32, i32, i32, bool, *mut core::ffi::c_void)>,
+    pub apply_pipeline: Option<extern "C" fn(Pipeline, *mut core::ffi::c_void)>,
+    pub apply_bindings: Option<extern "C" fn(*const Bindings, *mut core::ffi::c_void)>,
+    pub apply_uniforms: Option<extern "C" fn(i32, *const Range, *mut core::ffi::c_void)>,
+    pub draw: Option<extern "C" fn(i32, i32, i32, *mut core::ffi::c_void)>,
+    pub end_pass: Option<extern "C" fn(*mut core::ffi::c_void)>,
+    pub commit: Option<extern "C" fn(*mut core::ffi::c_void)>,
+    pub alloc_buffer: Option<extern "C" fn(Buffer, *mut core::ffi::c_void)>,
+    pub alloc_image: Option<extern "C" fn(Image, *mut core::ffi::c_void)>,
+    pub alloc_sampler: Option<extern "C" fn(Sampler, *mut core::ffi::c_void)>,
+    pub alloc_shader: Option<extern "C" fn(Shader, *mut core::ffi::c_void)>,
+    pub alloc_pipeline: Option<extern "C" fn(Pipeline, *mut core::ffi::c_void)>,
+    pub alloc_attachments: Option<extern "C" fn(Attachments, *mut core::ffi::c_void)>,
+    pub dealloc_buffer: Option<extern "C" fn(Buffer, *mut core::ffi::c_void)>,
+    pub dealloc_image: Option<extern "C" fn(Image, *mut core::ffi::c_void)>,
+    pub dealloc_sampler: Option<extern "C" fn(Sampler, *mut core::ffi::c_void)>,
+    pub dealloc_shader: Option<extern "C" fn(Shader, *mut core::ffi::c_void)>,
+    pub dealloc_pipeline: Option<extern "C" fn(Pipeline, *mut core::ffi::c_void)>,
+    pub dealloc_attachments: Option<extern "C" fn(Attachments, *mut core::ffi::c_void)>,
+    pub init_buffer: Option<extern "C" fn(Buffer, *const BufferDesc, *mut core::ffi::c_void)>,
+    pub init_image: Option<extern "C" fn(Image, *const ImageDesc, *mut core::ffi::c_void)>,
+    pub init_sampler: Option<extern "C" fn(Sampler, *const SamplerDesc, *mut core::ffi::c_void)>,
+    pub init_shader: Option<extern "C" fn(Shader, *const ShaderDesc, *mut core::ffi::c_void)>,
+    pub init_pipeline: Option<extern "C" fn(Pipeline, *const PipelineDesc, *mut core::ffi::c_void)>,
+    pub init_attachments: Option<extern "C" fn(Attachments, *const AttachmentsDesc, *mut core::ffi::c_void)>,
+    pub uninit_buffer: Option<extern "C" fn(Buffer, *mut core::ffi::c_void)>,
+    pub uninit_image: Option<extern "C" fn(Image, *mut core::ffi::c_void)>,
+    pub uninit_sampler: Option<extern "C" fn(Sampler, *mut core::ffi::c_void)>,
+    pub uninit_shader: Option<extern "C" fn(Shader, *mut core::ffi::c_void)>,
+    pub uninit_pipeline: Option<extern "C" fn(Pipeline, *mut core::ffi::c_void)>,
+    pub uninit_attachments: Option<extern "C" fn(Attachments, *mut core::ffi::c_void)>,
+    pub fail_buffer: Option<extern "C" fn(Buffer, *mut core::ffi::c_void)>,
+    pub fail_image: Option<extern "C" fn(Image, *mut core::ffi::c_void)>,
+    pub fail_sampler: Option<extern "C" fn(Sampler, *mut core::ffi::c_void)>,
+    pub fail_shader: Option<extern "C" fn(Shader, *mut core::ffi::c_void)>,
+    pub fail_pipeline: Option<extern "C" fn(Pipeline, *mut core::ffi::c_void)>,
+    pub fail_attachments: Option<extern "C" fn(Attachments, *mut core::ffi::c_void)>,
+    pub push_debug_group: Option<extern "C" fn(*const core::ffi::c_char, *mut core::ffi::c_void)>,
+    pub pop_debug_group: Option<extern "C" fn(*mut core::ffi::c_void)>,
+}
+impl TraceHooks {
+    pub const fn new() -> Self {
+        Self {
+            user_data: core::ptr::null_mut(),
+            reset_state_cache: None,
+            make_buffer: None,
+            make_image: None,
+            make_sampler: None,
+            make_shader: None,
+            make_pipeline: None,
+            make_attachments: None,
+            destroy_buffer: None,
+            destroy_image: None,
+            destroy_sampler: None,
+            destroy_shader: None,
+            destroy_pipeline: None,
+            destroy_attachments: None,
+            update_buffer: None,
+            update_image: None,
+            append_buffer: None,
+            begin_pass: None,
+            apply_viewport: None,
+            apply_scissor_rect: None,
+            apply_pipeline: None,
+            apply_bindings: None,
+            apply_uniforms: None,
+            draw: None,
+            end_pass: None,
+            commit: None,
+            alloc_buffer: None,
+            alloc_image: None,
+            alloc_sampler: None,
+            alloc_shader: None,
+            alloc_pipeline: None,
+            alloc_attachments: None,
+            dealloc_buffer: None,
+            dealloc_image: None,
+            dealloc_sampler: None,
+            dealloc_shader: None,
+            dealloc_pipeline: None,
+            dealloc_attachments: None,
+            init_buffer: None,
+            init_image: None,
+            init_sampler: None,
+            init_shader: None,
+            init_pipeline: None,
+            init_attachments: None,
+            uninit_buffer: None,
+            uninit_image: None,
+            uninit_sampler: None,
+            uninit_shader: None,
+            uninit_pipeline: None,
+            uninit_attachments: None,
+            fail_buffer: None,
+            fail_image: None,
+            fail_sampler: None,
+            fail_shader: None,
+            fail_pipeline: None,
+            fail_attachments: None,
+            push_debug_group: None,
+            pop_debug_group: None,
+        }
+    }
+}
+impl Default for TraceHooks {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sg_buffer_info
+/// sg_image_info
+/// sg_sampler_info
+/// sg_shader_info
+/// sg_pipeline_info
+/// sg_attachments_info
+///
+/// These structs contain various internal resource attributes which
+/// might be useful for debug-inspection. Please don't rely on the
+/// actual content of those structs too much, as they are quite closely
+/// tied to sokol_gfx.h internals and may change more frequently than
+/// the other public API elements.
+///
+/// The *_info structs are used as the return values of the following functions:
+///
+/// sg_query_buffer_info()
+/// sg_query_image_info()
+/// sg_query_sampler_info()
+/// sg_query_shader_info()
+/// sg_query_pipeline_info()
+/// sg_query_pass_info()
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct SlotInfo {
+    /// the current state of this resource slot
+    pub state: ResourceState,
+    /// type-neutral resource if (e.g. sg_buffer.id)
+    pub res_id: u32,
+}
+impl SlotInfo {
+    pub const fn new() -> Self {
+        Self {
+            state: ResourceState::new(),
+            res_id: 0,
+        }
+    }
+}
+impl Default for SlotInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct BufferInfo {
+    /// resource pool slot info
+    pub slot: SlotInfo,
+    /// frame index of last sg_update_buffer()
+    pub update_frame_index: u32,
+    /// frame index of last sg_append_buffer()
+    pub append_frame_index: u32,
+    /// current position in buffer for sg_append_buffer()
+    pub append_pos: i32,
+    /// is buffer in overflow state (due to sg_append_buffer)
+    pub append_overflow: bool,
+    /// number of renaming-slots for dynamically updated buffers
+    pub num_slots: i32,
+    /// currently active write-slot for dynamically updated buffers
+    pub active_slot: i32,
+}
+impl BufferInfo {
+    pub const fn new() -> Self {
+        Self {
+            slot: SlotInfo::new(),
+            update_frame_index: 0,
+            append_frame_index: 0,
+            append_pos: 0,
+            append_overflow: false,
+            num_slots: 0,
+            active_slot: 0,
+        }
+    }
+}
+impl Default for BufferInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct ImageInfo {
+    /// resource pool slot info
+    pub slot: SlotInfo,
+    /// frame index of last sg_update_image()
+    pub upd_frame_index: u32,
+    /// number of renaming-slots for dynamically updated images
+    pub num_slots: i32,
+    /// currently active write-slot for dynamically updated images
+    pub active_slot: i32,
+}
+impl ImageInfo {
+    pub const fn new() -> Self {
+        Self {
+            slot: SlotInfo::new(),
+            upd_frame_index: 0,
+            num_slots: 0,
+            active_slot: 0,
+        }
+    }
+}
+impl Default for ImageInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct SamplerInfo {
+    /// resource pool slot info
+    pub slot: SlotInfo,
+}
+impl SamplerInfo {
+    pub const fn new() -> Self {
+        Self {
+            slot: SlotInfo::new(),
+        }
+    }
+}
+impl Default for SamplerInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct ShaderInfo {
+    /// resource pool slot info
+    pub slot: SlotInfo,
+}
+impl ShaderInfo {
+    pub const fn new() -> Self {
+        Self {
+            slot: SlotInfo::new(),
+        }
+    }
+}
+impl Default for ShaderInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct PipelineInfo {
+    /// resource pool slot info
+    pub slot: SlotInfo,
+}
+impl PipelineInfo {
+    pub const fn new() -> Self {
+        Self {
+            slot: SlotInfo::new(),
+        }
+    }
+}
+impl Default for PipelineInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct AttachmentsInfo {
+    /// resource pool slot info
+    pub slot: SlotInfo,
+}
+impl AttachmentsInfo {
+    pub const fn new() -> Self {
+        Self {
+            slot: SlotInfo::new(),
+        }
+    }
+}
+impl Default for AttachmentsInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sg_frame_stats
+///
+/// Allows to track generic and backend-specific stats about a
+/// render frame. Obtained by calling sg_query_frame_stats(). The returned
+/// struct contains information about the *previous* frame.
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStatsGl {
+    pub num_bind_buffer: u32,
+    pub num_active_texture: u32,
+    pub num_bind_texture: u32,
+    pub num_bind_sampler: u32,
+    pub num_use_program: u32,
+    pub num_render_state: u32,
+    pub num_vertex_attrib_pointer: u32,
+    pub num_vertex_attrib_divisor: u32,
+    pub num_enable_vertex_attrib_array: u32,
+    pub num_disable_vertex_attrib_array: u32,
+    pub num_uniform: u32,
+}
+impl FrameStatsGl {
+    pub const fn new() -> Self {
+        Self {
+            num_bind_buffer: 0,
+            num_active_texture: 0,
+            num_bind_texture: 0,
+            num_bind_sampler: 0,
+            num_use_program: 0,
+            num_render_state: 0,
+            num_vertex_attrib_pointer: 0,
+            num_vertex_attrib_divisor: 0,
+            num_enable_vertex_attrib_array: 0,
+            num_disable_vertex_attrib_array: 0,
+            num_uniform: 0,
+        }
+    }
+}
+impl Default for FrameStatsGl {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStatsD3d11Pass {
+    pub num_om_set_render_targets: u32,
+    pub num_clear_render_target_view: u32,
+    pub num_clear_depth_stencil_view: u32,
+    pub num_resolve_subresource: u32,
+}
+impl FrameStatsD3d11Pass {
+    pub const fn new() -> Self {
+        Self {
+            num_om_set_render_targets: 0,
+            num_clear_render_target_view: 0,
+            num_clear_depth_stencil_view: 0,
+            num_resolve_subresource: 0,
+        }
+    }
+}
+impl Default for FrameStatsD3d11Pass {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStatsD3d11Pipeline {
+    pub num_rs_set_state: u32,
+    pub num_om_set_depth_stencil_state: u32,
+    pub num_om_set_blend_state: u32,
+    pub num_ia_set_primitive_topology: u32,
+    pub num_ia_set_input_layout: u32,
+    pub num_vs_set_shader: u32,
+    pub num_vs_set_constant_buffers: u32,
+    pub num_ps_set_shader: u32,
+    pub num_ps_set_constant_buffers: u32,
+}
+impl FrameStatsD3d11Pipeline {
+    pub const fn new() -> Self {
+        Self {
+            num_rs_set_state: 0,
+            num_om_set_depth_stencil_state: 0,
+            num_om_set_blend_state: 0,
+            num_ia_set_primitive_topology: 0,
+            num_ia_set_input_layout: 0,
+            num_vs_set_shader: 0,
+            num_vs_set_constant_buffers: 0,
+            num_ps_set_shader: 0,
+            num_ps_set_constant_buffers: 0,
+        }
+    }
+}
+impl Default for FrameStatsD3d11Pipeline {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStatsD3d11Bindings {
+    pub num_ia_set_vertex_buffers: u32,
+    pub num_ia_set_index_buffer: u32,
+    pub num_vs_set_shader_resources: u32,
+    pub num_ps_set_shader_resources: u32,
+    pub num_vs_set_samplers: u32,
+    pub num_ps_set_samplers: u32,
+}
+impl FrameStatsD3d11Bindings {
+    pub const fn new() -> Self {
+        Self {
+            num_ia_set_vertex_buffers: 0,
+            num_ia_set_index_buffer: 0,
+            num_vs_set_shader_resources: 0,
+            num_ps_set_shader_resources: 0,
+            num_vs_set_samplers: 0,
+            num_ps_set_samplers: 0,
+        }
+    }
+}
+impl Default for FrameStatsD3d11Bindings {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStatsD3d11Uniforms {
+    pub num_update_subresource: u32,
+}
+impl FrameStatsD3d11Uniforms {
+    pub const fn new() -> Self {
+        Self {
+            num_update_subresource: 0,
+        }
+    }
+}
+impl Default for FrameStatsD3d11Uniforms {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStatsD3d11Draw {
+    pub num_draw_indexed_instanced: u32,
+    pub num_draw_indexed: u32,
+    pub num_draw_instanced: u32,
+    pub num_draw: u32,
+}
+impl FrameStatsD3d11Draw {
+    pub const fn new() -> Self {
+        Self {
+            num_draw_indexed_instanced: 0,
+            num_draw_indexed: 0,
+            num_draw_instanced: 0,
+            num_draw: 0,
+        }
+    }
+}
+impl Default for FrameStatsD3d11Draw {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStatsD3d11 {
+    pub pass: FrameStatsD3d11Pass,
+    pub pipeline: FrameStatsD3d11Pipeline,
+    pub bindings: FrameStatsD3d11Bindings,
+    pub uniforms: FrameStatsD3d11Uniforms,
+    pub draw: FrameStatsD3d11Draw,
+    pub num_map: u32,
+    pub num_unmap: u32,
+}
+impl FrameStatsD3d11 {
+    pub const fn new() -> Self {
+        Self {
+            pass: FrameStatsD3d11Pass::new(),
+            pipeline: FrameStatsD3d11Pipeline::new(),
+            bindings: FrameStatsD3d11Bindings::new(),
+            uniforms: FrameStatsD3d11Uniforms::new(),
+            draw: FrameStatsD3d11Draw::new(),
+            num_map: 0,
+            num_unmap: 0,
+        }
+    }
+}
+impl Default for FrameStatsD3d11 {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStatsMetalIdpool {
+    pub num_added: u32,
+    pub num_released: u32,
+    pub num_garbage_collected: u32,
+}
+impl FrameStatsMetalIdpool {
+    pub const fn new() -> Self {
+        Self {
+            num_added: 0,
+            num_released: 0,
+            num_garbage_collected: 0,
+        }
+    }
+}
+impl Default for FrameStatsMetalIdpool {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStatsMetalPipeline {
+    pub num_set_blend_color: u32,
+    pub num_set_cull_mode: u32,
+    pub num_set_front_facing_winding: u32,
+    pub num_set_stencil_reference_value: u32,
+    pub num_set_depth_bias: u32,
+    pub num_set_render_pipeline_state: u32,
+    pub num_set_depth_stencil_state: u32,
+}
+impl FrameStatsMetalPipeline {
+    pub const fn new() -> Self {
+        Self {
+            num_set_blend_color: 0,
+            num_set_cull_mode: 0,
+            num_set_front_facing_winding: 0,
+            num_set_stencil_reference_value: 0,
+            num_set_depth_bias: 0,
+            num_set_render_pipeline_state: 0,
+            num_set_depth_stencil_state: 0,
+        }
+    }
+}
+impl Default for FrameStatsMetalPipeline {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStatsMetalBindings {
+    pub num_set_vertex_buffer: u32,
+    pub num_set_vertex_texture: u32,
+    pub num_set_vertex_sampler_state: u32,
+    pub num_set_fragment_buffer: u32,
+    pub num_set_fragment_texture: u32,
+    pub num_set_fragment_sampler_state: u32,
+}
+impl FrameStatsMetalBindings {
+    pub const fn new() -> Self {
+        Self {
+            num_set_vertex_buffer: 0,
+            num_set_vertex_texture: 0,
+            num_set_vertex_sampler_state: 0,
+            num_set_fragment_buffer: 0,
+            num_set_fragment_texture: 0,
+            num_set_fragment_sampler_state: 0,
+        }
+    }
+}
+impl Default for FrameStatsMetalBindings {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStatsMetalUniforms {
+    pub num_set_vertex_buffer_offset: u32,
+    pub num_set_fragment_buffer_offset: u32,
+}
+impl FrameStatsMetalUniforms {
+    pub const fn new() -> Self {
+        Self {
+            num_set_vertex_buffer_offset: 0,
+            num_set_fragment_buffer_offset: 0,
+        }
+    }
+}
+impl Default for FrameStatsMetalUniforms {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStatsMetal {
+    pub idpool: FrameStatsMetalIdpool,
+    pub pipeline: FrameStatsMetalPipeline,
+    pub bindings: FrameStatsMetalBindings,
+    pub uniforms: FrameStatsMetalUniforms,
+}
+impl FrameStatsMetal {
+    pub const fn new() -> Self {
+        Self {
+            idpool: FrameStatsMetalIdpool::new(),
+            pipeline: FrameStatsMetalPipeline::new(),
+            bindings: FrameStatsMetalBindings::new(),
+            uniforms: FrameStatsMetalUniforms::new(),
+        }
+    }
+}
+impl Default for FrameStatsMetal {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStatsWgpuUniforms {
+    pub num_set_bindgroup: u32,
+    pub size_write_buffer: u32,
+}
+impl FrameStatsWgpuUniforms {
+    pub const fn new() -> Self {
+        Self {
+            num_set_bindgroup: 0,
+            size_write_buffer: 0,
+        }
+    }
+}
+impl Default for FrameStatsWgpuUniforms {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStatsWgpuBindings {
+    pub num_set_vertex_buffer: u32,
+    pub num_skip_redundant_vertex_buffer: u32,
+    pub num_set_index_buffer: u32,
+    pub num_skip_redundant_index_buffer: u32,
+    pub num_create_bindgroup: u32,
+    pub num_discard_bindgroup: u32,
+    pub num_set_bindgroup: u32,
+    pub num_skip_redundant_bindgroup: u32,
+    pub num_bindgroup_cache_hits: u32,
+    pub num_bindgroup_cache_misses: u32,
+    pub num_bindgroup_cache_collisions: u32,
+    pub num_bindgroup_cache_invalidates: u32,
+    pub num_bindgroup_cache_hash_vs_key_mismatch: u32,
+}
+impl FrameStatsWgpuBindings {
+    pub const fn new() -> Self {
+        Self {
+            num_set_vertex_buffer: 0,
+            num_skip_redundant_vertex_buffer: 0,
+            num_set_index_buffer: 0,
+            num_skip_redundant_index_buffer: 0,
+            num_create_bindgroup: 0,
+            num_discard_bindgroup: 0,
+            num_set_bindgroup: 0,
+            num_skip_redundant_bindgroup: 0,
+            num_bindgroup_cache_hits: 0,
+            num_bindgroup_cache_misses: 0,
+            num_bindgroup_cache_collisions: 0,
+            num_bindgroup_cache_invalidates: 0,
+            num_bindgroup_cache_hash_vs_key_mismatch: 0,
+        }
+    }
+}
+impl Default for FrameStatsWgpuBindings {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStatsWgpu {
+    pub uniforms: FrameStatsWgpuUniforms,
+    pub bindings: FrameStatsWgpuBindings,
+}
+impl FrameStatsWgpu {
+    pub const fn new() -> Self {
+        Self {
+            uniforms: FrameStatsWgpuUniforms::new(),
+            bindings: FrameStatsWgpuBindings::new(),
+        }
+    }
+}
+impl Default for FrameStatsWgpu {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameStats {
+    /// current frame counter, starts at 0
+    pub frame_index: u32,
+    pub num_passes: u32,
+    pub num_apply_viewport: u32,
+    pub num_apply_scissor_rect: u32,
+    pub num_apply_pipeline: u32,
+    pub num_apply_bindings: u32,
+    pub num_apply_uniforms: u32,
+    pub num_draw: u32,
+    pub num_update_buffer: u32,
+    pub num_append_buffer: u32,
+    pub num_update_image: u32,
+    pub size_apply_uniforms: u32,
+    pub size_update_buffer: u32,
+    pub size_append_buffer: u32,
+    pub size_update_image: u32,
+    pub gl: FrameStatsGl,
+    pub d3d11: FrameStatsD3d11,
+    pub metal: FrameStatsMetal,
+    pub wgpu: FrameStatsWgpu,
+}
+impl FrameStats {
+    pub const fn new() -> Self {
+        Self {
+            frame_index: 0,
+            num_passes: 0,
+            num_apply_viewport: 0,
+            num_apply_scissor_rect: 0,
+            num_apply_pipeline: 0,
+            num_apply_bindings: 0,
+            num_apply_uniforms: 0,
+            num_draw: 0,
+            num_update_buffer: 0,
+            num_append_buffer: 0,
+            num_update_image: 0,
+            size_apply_uniforms: 0,
+            size_update_buffer: 0,
+            size_append_buffer: 0,
+            size_update_image: 0,
+            gl: FrameStatsGl::new(),
+            d3d11: FrameStatsD3d11::new(),
+            metal: FrameStatsMetal::new(),
+            wgpu: FrameStatsWgpu::new(),
+        }
+    }
+}
+impl Default for FrameStats {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(i32)]
+pub enum LogItem {
+    Ok,
+    MallocFailed,
+    GlTextureFormatNotSupported,
+    Gl3dTexturesNotSupported,
+    GlArrayTexturesNotSupported,
+    GlShaderCompilationFailed,
+    GlShaderLinkingFailed,
+    GlVertexAttributeNotFoundInShader,
+    GlImageSamplerNameNotFoundInShader,
+    GlFramebufferStatusUndefined,
+    GlFramebufferStatusIncompleteAttachment,
+    GlFramebufferStatusIncompleteMissingAttachment,
+    GlFramebufferStatusUnsupported,
+    GlFramebufferStatusIncompleteMultisample,
+    GlFramebufferStatusUnknown,
+    D3d11CreateBufferFailed,
+    D3d11CreateBufferSrvFailed,
+    D3d11CreateDepthTextureUnsupportedPixelFormat,
+    D3d11CreateDepthTextureFailed,
+    D3d11Create2dTextureUnsupportedPixelFormat,
+    D3d11Create2dTextureFailed,
+    D3d11Create2dSrvFailed,
+    D3d11Create3dTextureUnsupportedPixelFormat,
+    D3d11Create3dTextureFailed,
+    D3d11Create3dSrvFailed,
+    D3d11CreateMsaaTextureFailed,
+    D3d11CreateSamplerStateFailed,
+    D3d11LoadD3dcompiler47DllFailed,
+    D3d11ShaderCompilationFailed,
+    D3d11ShaderCompilationOutput,
+    D3d11CreateConstantBufferFailed,
+    D3d11CreateInputLayoutFailed,
+    D3d11CreateRasterizerStateFailed,
+    D3d11CreateDepthStencilStateFailed,
+    D3d11CreateBlendStateFailed,
+    D3d11CreateRtvFailed,
+    D3d11CreateDsvFailed,
+    D3d11MapForUpdateBufferFailed,
+    D3d11MapForAppendBufferFailed,
+    D3d11MapForUpdateImageFailed,
+    MetalCreateBufferFailed,
+    MetalTextureFormatNotSupported,
+    MetalCreateTextureFailed,
+    MetalCreateSamplerFailed,
+    MetalShaderCompilationFailed,
+    MetalShaderCreationFailed,
+    MetalShaderCompilationOutput,
+    MetalShaderEntryNotFound,
+    MetalCreateRpsFailed,
+    MetalCreateRpsOutput,
+    MetalCreateDssFailed,
+    WgpuBindgroupsPoolExhausted,
+    WgpuBindgroupscacheSizeGreaterOne,
+    WgpuBindgroupscacheSizePow2,
+    WgpuCreatebindgroupFailed,
+    WgpuCreateBufferFailed,
+    WgpuCreateTextureFailed,
+    WgpuCreateTextureViewFailed,
+    WgpuCreateSamplerFailed,
+    WgpuCreateShaderModuleFailed,
+    WgpuShaderCreateBindgroupLayoutFailed,
+    WgpuCreatePipelineLayoutFailed,
+    WgpuCreateRenderPipelineFailed,
+    WgpuAttachmentsCreateTextureViewFailed,
+    DrawRequiredBindingsOrUniformsMissing,
+    IdenticalCommitListener,
+    CommitListenerArrayFull,
+    TraceHooksNotEnabled,
+    DeallocBufferInvalidState,
+    DeallocImageInvalidState,
+    DeallocSamplerInvalidState,
+    DeallocShaderInvalidState,
+    DeallocPipelineInvalidState,
+    DeallocAttachmentsInvalidState,
+    InitBufferInvalidState,
+    InitImageInvalidState,
+    InitSamplerInvalidState,
+    InitShaderInvalidState,
+    InitPipelineInvalidState,
+    InitAttachmentsInvalidState,
+    UninitBufferInvalidState,
+    UninitImageInvalidState,
+    UninitSamplerInvalidState,
+    UninitShaderInvalidState,
+    UninitPipelineInvalidState,
+    UninitAttachmentsInvalidState,
+    FailBufferInvalidState,
+    FailImageInvalidState,
+    FailSamplerInvalidState,
+    FailShaderInvalidState,
+    FailPipelineInvalidState,
+    FailAttachmentsInvalidState,
+    BufferPoolExhausted,
+    ImagePoolExhausted,
+    SamplerPoolExhausted,
+    ShaderPoolExhausted,
+    PipelinePoolExhausted,
+    PassPoolExhausted,
+    BeginpassAttachmentInvalid,
+    DrawWithoutBindings,
+    ValidateBufferdescCanary,
+    ValidateBufferdescSize,
+    ValidateBufferdescData,
+    ValidateBufferdescDataSize,
+    ValidateBufferdescNoData,
+    ValidateBufferdescStoragebufferSupported,
+    ValidateBufferdescStoragebufferSizeMultiple4,
+    ValidateImagedataNodata,
+    ValidateImagedataDataSize,
+    ValidateImagedescCanary,
+    ValidateImagedescWidth,
+    ValidateImagedescHeight,
+    ValidateImagedescRtPixelformat,
+    ValidateImagedescNonrtPixelformat,
+    ValidateImagedescMsaaButNoRt,
+    ValidateImagedescNoMsaaRtSupport,
+    ValidateImagedescMsaaNumMipmaps,
+    ValidateImagedescMsaa3dImage,
+    ValidateImagedescMsaaCubeImage,
+    ValidateImagedescDepth3dImage,
+    ValidateImagedescRtImmutable,
+    ValidateImagedescRtNoData,
+    ValidateImagedescInjectedNoData,
+    ValidateImagedescDynamicNoData,
+    ValidateImagedescCompressedImmutable,
+    ValidateSamplerdescCanary,
+    ValidateSamplerdescAnistropicRequiresLinearFiltering,
+    ValidateShaderdescCanary,
+    ValidateShaderdescSource,
+    ValidateShaderdescBytecode,
+    ValidateShaderdescSourceOrBytecode,
+    ValidateShaderdescNoBytecodeSize,
+    ValidateShaderdescNoContUbMembers,
+    ValidateShaderdescUbSizeIsZero,
+    ValidateShaderdescUbMetalBufferSlotOutOfRange,
+    ValidateShaderdescUbMetalBufferSlotCollision,
+    ValidateShaderdescUbHlslRegisterBOutOfRange,
+    ValidateShaderdescUbHlslRegisterBCollision,
+    ValidateShaderdescUbWgslGroup0BindingOutOfRange,
+    ValidateShaderdescUbWgslGroup0BindingCollision,
+    ValidateShaderdescNoUbMembers,
+    ValidateShaderdescUbUniformGlslName,
+    ValidateShaderdescUbSizeMismatch,
+    ValidateShaderdescUbArrayCount,
+    ValidateShaderdescUbStd140ArrayType,
+    ValidateShaderdescStoragebufferMetalBufferSlotOutOfRange,
+    ValidateShaderdescStoragebufferMetalBufferSlotCollision,
+    ValidateShaderdescStoragebufferHlslRegisterTOutOfRange,
+    ValidateShaderdescStoragebufferHlslRegisterTCollision,
+    ValidateShaderdescStoragebufferGlslBindingOutOfRange,
+    ValidateShaderdescStoragebufferGlslBindingCollision,
+    ValidateShaderdescStoragebufferWgslGroup1BindingOutOfRange,
+    ValidateShaderdescStoragebufferWgslGroup1BindingCollision,
+    ValidateShaderdescStoragebufferReadonly,
+    ValidateShaderdescImageMetalTextureSlotOutOfRange,
+    ValidateShaderdescImageMetalTextureSlotCollision,
+    ValidateShaderdescImageHlslRegisterTOutOfRange,
+    ValidateShaderdescImageHlslRegisterTCollision,
+    ValidateShaderdescImageWgslGroup1BindingOutOfRange,
+    ValidateShaderdescImageWgslGroup1BindingCollision,
+    ValidateShaderdescSamplerMetalSamplerSlotOutOfRange,
+    ValidateShaderdescSamplerMetalSamplerSlotCollision,
+    ValidateShaderdescSamplerHlslRegisterSOutOfRange,
+    ValidateShaderdescSamplerHlslRegisterSCollision,
+    ValidateShaderdescSamplerWgslGroup1BindingOutOfRange,
+    ValidateShaderdescSamplerWgslGroup1BindingCollision,
+    ValidateShaderdescImageSamplerPairImageSlotOutOfRange,
+    ValidateShaderdescImageSamplerPairSamplerSlotOutOfRange,
+    ValidateShaderdescImageSamplerPairImageStageMismatch,
+    ValidateShaderdescImageSamplerPairSamplerStageMismatch,
+    ValidateShaderdescImageSamplerPairGlslName,
+    ValidateShaderdescNonfilteringSamplerRequired,
+    ValidateShaderdescComparisonSamplerRequired,
+    ValidateShaderdescImageNotReferencedByImageSamplerPairs,
+    ValidateShaderdescSamplerNotReferencedByImageSamplerPairs,
+    ValidateShaderdescAttrStringTooLong,
+    ValidatePipelinedescCanary,
+    ValidatePipelinedescShader,
+    ValidatePipelinedescNoContAttrs,
+    ValidatePipelinedescLayoutStride4,
+    ValidatePipelinedescAttrSemantics,
+    ValidateAttachmentsdescCanary,
+    ValidateAttachmentsdescNoAttachments,
+    ValidateAttachmentsdescNoContColorAtts,
+    ValidateAttachmentsdescImage,
+    ValidateAttachmentsdescMiplevel,
+    ValidateAttachmentsdescFace,
+    ValidateAttachmentsdescLayer,
+    ValidateAttachmentsdescSlice,
+    ValidateAttachmentsdescImageNoRt,
+    ValidateAttachmentsdescColorInvPixelformat,
+    ValidateAttachmentsdescDepthInvPixelformat,
+    ValidateAttachmentsdescImageSizes,
+    ValidateAttachmentsdescImageSampleCounts,
+    ValidateAttachmentsdescResolveColorImageMsaa,
+    ValidateAttachmentsdescResolveImage,
+    ValidateAttachmentsdescResolveSampleCount,
+    ValidateAttachmentsdescResolveMiplevel,
+    ValidateAttachmentsdescResolveFace,
+    ValidateAttachmentsdescResolveLayer,
+    ValidateAttachmentsdescResolveSlice,
+    ValidateAttachmentsdescResolveImageNoRt,
+    ValidateAttachmentsdescResolveImageSizes,
+    ValidateAttachmentsdescResolveImageFormat,
+    ValidateAttachmentsdescDepthImage,
+    ValidateAttachmentsdescDepthMiplevel,
+    ValidateAttachmentsdescDepthFace,
+    ValidateAttachmentsdescDepthLayer,
+    ValidateAttachmentsdescDepthSlice,
+    ValidateAttachmentsdescDepthImageNoRt,
+    ValidateAttachmentsdescDepthImageSizes,
+    ValidateAttachmentsdescDepthImageSampleCount,
+    ValidateBeginpassCanary,
+    ValidateBeginpassAttachmentsExists,
+    ValidateBeginpassAttachmentsValid,
+    ValidateBeginpassColorAttachmentImage,
+    ValidateBeginpassResolveAttachmentImage,
+    ValidateBeginpassDepthstencilAttachmentImage,
+    ValidateBeginpassSwapchainExpectWidth,
+    ValidateBeginpassSwapchainExpectWidthNotset,
+    ValidateBeginpassSwapchainExpectHeight,
+    ValidateBeginpassSwapchainExpectHeightNotset,
+    ValidateBeginpassSwapchainExpectSamplecount,
+    ValidateBeginpassSwapchainExpectSamplecountNotset,
+    ValidateBeginpassSwapchainExpectColorformat,
+    ValidateBeginpassSwapchainExpectColorformatNotset,
+    ValidateBeginpassSwapchainExpectDepthformatNotset,
+    ValidateBeginpassSwapchainMetalExpectCurrentdrawable,
+    ValidateBeginpassSwapchainMetalExpectCurrentdrawableNotset,
+    ValidateBeginpassSwapchainMetalExpectDepthstenciltexture,
+    ValidateBeginpassSwapchainMetalExpectDepthstenciltextureNotset,
+    ValidateBeginpassSwapchainMetalExpectMsaacolortexture,
+    ValidateBeginpassSwapchainMetalExpectMsaacolortextureNotset,
+    ValidateBeginpassSwapchainD3d11ExpectRenderview,
+    ValidateBeginpassSwapchainD3d11ExpectRenderviewNotset,
+    ValidateBeginpassSwapchainD3d11ExpectResolveview,
+    ValidateBeginpassSwapchainD3d11ExpectResolveviewNotset,
+    ValidateBeginpassSwapchainD3d11ExpectDepthstencilview,
+    ValidateBeginpassSwapchainD3d11ExpectDepthstencilviewNotset,
+    ValidateBeginpassSwapchainWgpuExpectRenderview,
+    ValidateBeginpassSwapchainWgpuExpectRenderviewNotset,
+    ValidateBeginpassSwapchainWgpuExpectResolveview,
+    ValidateBeginpassSwapchainWgpuExpectResolveviewNotset,
+    ValidateBeginpassSwapchainWgpuExpectDepthstencilview,
+    ValidateBeginpassSwapchainWgpuExpectDepthstencilviewNotset,
+    ValidateBeginpassSwapchainGlExpectFramebufferNotset,
+    ValidateApipPipelineValidId,
+    ValidateApipPipelineExists,
+    ValidateApipPipelineValid,
+    ValidateApipShaderExists,
+    ValidateApipShaderValid,
+    ValidateApipCurpassAttachmentsExists,
+    ValidateApipCurpassAttachmentsValid,
+    ValidateApipAttCount,
+    ValidateApipColorFormat,
+    ValidateApipDepthFormat,
+    ValidateApipSampleCount,
+    ValidateAbndPipeline,
+    ValidateAbndPipelineExists,
+    ValidateAbndPipelineValid,
+    ValidateAbndExpectedVb,
+    ValidateAbndVbExists,
+    ValidateAbndVbType,
+    ValidateAbndVbOverflow,
+    ValidateAbndNoIb,
+    ValidateAbndIb,
+    ValidateAbndIbExists,
+    ValidateAbndIbType,
+    ValidateAbndIbOverflow,
+    ValidateAbndExpectedImageBinding,
+    ValidateAbndImgExists,
+    ValidateAbndImageTypeMismatch,
+    ValidateAbndExpectedMultisampledImage,
+    ValidateAbndImageMsaa,
+    ValidateAbndExpectedFilterableImage,
+    ValidateAbndExpectedDepthImage,
+    ValidateAbndExpectedSamplerBinding,
+    ValidateAbndUnexpectedSamplerCompareNever,
+    ValidateAbndExpectedSamplerCompareNever,
+    ValidateAbndExpectedNonfilteringSampler,
+    ValidateAbndSmpExists,
+    ValidateAbndExpectedStoragebufferBinding,
+    ValidateAbndStoragebufferExists,
+    ValidateAbndStoragebufferBindingBuffertype,
+    ValidateAubNoPipeline,
+    ValidateAubNoUbAtSlot,
+    ValidateAubSize,
+    ValidateUpdatebufUsage,
+    ValidateUpdatebufSize,
+    ValidateUpdatebufOnce,
+    ValidateUpdatebufAppend,
+    ValidateAppendbufUsage,
+    ValidateAppendbufSize,
+    ValidateAppendbufUpdate,
+    ValidateUpdimgUsage,
+    ValidateUpdimgOnce,
+    ValidationFailed,
+}
+impl LogItem {
+    pub const fn new() -> Self {
+        Self::Ok
+    }
+}
+impl Default for LogItem {
+    fn default() -> Self {
+        Self::Ok
+    }
+}
+/// ```text
+/// sg_desc
+///
+/// The sg_desc struct contains configuration values for sokol_gfx,
+/// it is used as parameter to the sg_setup() call.
+///
+/// The default configuration is:
+///
+/// .buffer_pool_size       128
+/// .image_pool_size        128
+/// .sampler_pool_size      64
+/// .shader_pool_size       32
+/// .pipeline_pool_size     64
+/// .pass_pool_size         16
+/// .uniform_buffer_size    4 MB (4*1024*1024)
+/// .max_commit_listeners   1024
+/// .disable_validation     false
+/// .mtl_force_managed_storage_mode false
+/// .wgpu_disable_bindgroups_cache  false
+/// .wgpu_bindgroups_cache_size     1024
+///
+/// .allocator.alloc_fn     0 (in this case, malloc() will be called)
+/// .allocator.free_fn      0 (in this case, free() will be called)
+/// .allocator.user_data    0
+///
+/// .environment.defaults.color_format: default value depends on selected backend:
+///     all GL backends:    SG_PIXELFORMAT_RGBA8
+///     Metal and D3D11:    SG_PIXELFORMAT_BGRA8
+///     WebGPU:             *no default* (must be queried from WebGPU swapchain object)
+/// .environment.defaults.depth_format: SG_PIXELFORMAT_DEPTH_STENCIL
+/// .environment.defaults.sample_count: 1
+///
+/// Metal specific:
+///     (NOTE: All Objective-C object references are transferred through
+///     a bridged cast (__bridge const void*) to sokol_gfx, which will use an
+///     unretained bridged cast (__bridge id<xxx>) to retrieve the Objective-C
+///     references back. Since the bridge cast is unretained, the caller
+///     must hold a strong reference to the Objective-C object until sg_setup()
+///     returns.
+///
+///     .mtl_force_managed_storage_mode
+///         when enabled, Metal buffers and texture resources are created in managed storage
+///         mode, otherwise sokol-gfx will decide whether to create buffers and
+///         textures in managed or shared storage mode (this is mainly a debugging option)
+///     .mtl_use_command_buffer_with_retained_references
+///         when true, the sokol-gfx Metal backend will use Metal command buffers which
+///         bump the reference count of resource objects as long as they are inflight,
+///         this is slower than the default command-buffer-with-unretained-references
+///         method, this may be a workaround when confronted with lifetime validation
+///         errors from the Metal validation layer until a proper fix has been implemented
+///     .environment.metal.device
+///         a pointer to the MTLDevice object
+///
+/// D3D11 specific:
+///     .environment.d3d11.device
+///         a pointer to the ID3D11Device object, this must have been created
+///         before sg_setup() is called
+///     .environment.d3d11.device_context
+///         a pointer to the ID3D11DeviceContext object
+///     .d3d11_shader_debugging
+///         set this to true to compile shaders which are provided as HLSL source
+///         code with debug information and without optimization, this allows
+///         shader debugging in tools like RenderDoc, to output source code
+///         instead of byte code from sokol-shdc, omit the `--binary` cmdline
+///         option
+///
+/// WebGPU specific:
+///     .wgpu_disable_bindgroups_cache
+///         When this is true, the WebGPU backend will create and immediately
+///         release a BindGroup object in the sg_apply_bindings() call, only
+///         use this for debugging purposes.
+///     .wgpu_bindgroups_cache_size
+///         The size of the bindgroups cache for re-using BindGroup objects
+///         between sg_apply_bindings() calls. The smaller the cache size,
+///         the more likely are cache slot collisions which will cause
+///         a BindGroups object to be destroyed and a new one created.
+///         Use the information returned by sg_query_stats() to check
+///         if this is a frequent occurrence, and increase the cache size as
+///         needed (the default is 1024).
+///         NOTE: wgpu_bindgroups_cache_size must be a power-of-2 number!
+///     .environment.wgpu.device
+///         a WGPUDevice handle
+///
+/// When using sokol_gfx.h and sokol_app.h together, consider using the
+/// helper function sglue_environment() in the sokol_glue.h header to
+/// initialize the sg_desc.environment nested struct. sglue_environment() returns
+/// a completely initialized sg_environment struct with information
+/// provided by sokol_app.h.
+/// ```
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct EnvironmentDefaults {
+    pub color_format: PixelFormat,
+    pub depth_format: PixelFormat,
+    pub sample_count: i32,
+}
+impl EnvironmentDefaults {
+    pub const fn new() -> Self {
+        Self {
+            color_format: PixelFormat::new(),
+            depth_format: PixelFormat::new(),
+            sample_count: 0,
+        }
+    }
+}
+impl Default for EnvironmentDefaults {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct MetalEnvironment {
+    pub device: *const core::ffi::c_void,
+}
+impl MetalEnvironment {
+    pub const fn new() -> Self {
+        Self {
+            device: core::ptr::null(),
+        }
+    }
+}
+impl Default for MetalEnvironment {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct D3d11Environment {
+    pub device: *const core::ffi::c_void,
+    pub device_context: *const core::ffi::c_void,
+}
+impl D3d11Environment {
+    pub const fn new() -> Self {
+        Self {
+            device: core::ptr::null(),
+            device_context: core::ptr::null(),
+        }
+    }
+}
+impl Default for D3d11Environment {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct WgpuEnvironment {
+    pub device: *const core::ffi::c_void,
+}
+impl WgpuEnvironment {
+    pub const fn new() -> Self {
+        Self {
+            device: core::ptr::null(),
+        }
+    }
+}
+impl Default for WgpuEnvironment {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Environment {
+    pub defaults: EnvironmentDefaults,
+    pub metal: MetalEnvironment,
+    pub d3d11: D3d11Environment,
+    pub wgpu: WgpuEnvironment,
+}
+impl Environment {
+    pub const fn new() -> Self {
+        Self {
+            defaults: EnvironmentDefaults::new(),
+            metal: MetalEnvironment::new(),
+            d3d11: D3d11Environment::new(),
+            wgpu: WgpuEnvironment::new(),
+        }
+    }
+}
+impl Default for Environment {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sg_commit_listener
+///
+/// Used with function sg_add_commit_listener() to add a callback
+/// which will be called in sg_commit(). This is useful for libraries
+/// building on top of sokol-gfx to be notified about when a frame
+/// ends (instead of having to guess, or add a manual 'new-frame'
+/// function.
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct CommitListener {
+    pub func: Option<extern "C" fn(*mut core::ffi::c_void)>,
+    pub user_data: *mut core::ffi::c_void,
+}
+impl CommitListener {
+    pub const fn new() -> Self {
+        Self {
+            func: None,
+            user_data: core::ptr::null_mut(),
+        }
+    }
+}
+impl Default for CommitListener {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sg_allocator
+///
+/// Used in sg_desc to provide custom memory-alloc and -free functions
+/// to sokol_gfx.h. If memory management should be overridden, both the
+/// alloc_fn and free_fn function must be provided (e.g. it's not valid to
+/// override one function but not the other).
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Allocator {
+    pub alloc_fn: Option<extern "C" fn(usize, *mut core::ffi::c_void) -> *mut core::ffi::c_void>,
+    pub free_fn: Option<extern "C" fn(*mut core::ffi::c_void, *mut core::ffi::c_void)>,
+    pub user_data: *mut core::ffi::c_void,
+}
+impl Allocator {
+    pub const fn new() -> Self {
+        Self {
+            alloc_fn: None,
+            free_fn: None,
+            user_data: core::ptr::null_mut(),
+        }
+    }
+}
+impl Default for Allocator {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// sg_logger
+///
+/// Used in sg_desc to provide a logging function. Please be aware
+/// that without logging function, sokol-gfx will be completely
+/// silent, e.g. it will not report errors, warnings and
+/// validation layer messages. For maximum error verbosity,
+/// compile in debug mode (e.g. NDEBUG *not* defined) and provide a
+/// compatible logger function in the sg_setup() call
+/// (for instance the standard logging function from sokol_log.h).
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Logger {
+    pub func: Option<extern "C" fn(*const core::ffi::c_char, u32, u32, *const core::ffi::c_char, u32, *const core::ffi::c_char, *mut core::ffi::c_void)>,
+    pub user_data: *mut core::ffi::c_void,
+}
+impl Logger {
+    pub const fn new() -> Self {
+        Self {
+            func: None,
+            user_data: core::ptr::null_mut(),
+        }
+    }
+}
+impl Default for Logger {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Desc {
+    pub _start_canary: u32,
+    pub buffer_pool_size: i32,
+    pub image_pool_size: i32,
+    pub sampler_pool_size: i32,
+    pub shader_pool_size: i32,
+    pub pipeline_pool_size: i32,
+    pub attachments_pool_size: i32,
+    pub uniform_buffer_size: i32,
+    pub max_commit_listeners: i32,
+    /// disable validation layer even in debug mode, useful for tests
+    pub disable_validation: bool,
+    /// if true, HLSL shaders are compiled with D3DCOMPILE_DEBUG | D3DCOMPILE_SKIP_OPTIMIZATION
+    pub d3d11_shader_debugging: bool,
+    /// for debugging: use Metal managed storage mode for resources even with UMA
+    pub mtl_force_managed_storage_mode: bool,
+    /// Metal: use a managed MTLCommandBuffer which ref-counts used resources
+    pub mtl_use_command_buffer_with_retained_references: bool,
+    /// set to true to disable the WebGPU backend BindGroup cache
+    pub wgpu_disable_bindgroups_cache: bool,
+    /// number of slots in the WebGPU bindgroup cache (must be 2^N)
+    pub wgpu_bindgroups_cache_size: i32,
+    pub allocator: Allocator,
+    /// optional log function override
+    pub logger: Logger,
+    pub environment: Environment,
+    pub _end_canary: u32,
+}
+impl Desc {
+    pub const fn new() -> Self {
+        Self {
+            _start_canary: 0,
+            buffer_pool_size: 0,
+            image_pool_size: 0,
+            sampler_pool_size: 0,
+            shader_pool_size: 0,
+            pipeline_pool_size: 0,
+            attachments_pool_size: 0,
+            uniform_buffer_size: 0,
+            max_commit_listeners: 0,
+            disable_validation: false,
+            d3d11_shader_debugging: false,
+            mtl_force_managed_storage_mode: false,
+            mtl_use_command_buffer_with_retained_references: false,
+            wgpu_disable_bindgroups_cache: false,
+            wgpu_bindgroups_cache_size: 0,
+            allocator: Allocator::new(),
+            logger: Logger::new(),
+            environment: Environment::new(),
+            _end_canary: 0,
+        }
+    }
+}
+impl Default for Desc {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct D3d11BufferInfo {
+    /// ID3D11Buffer*
+    pub buf: *const core::ffi::c_void,
+}
+impl D3d11BufferInfo {
+    pub const fn new() -> Self {
+        Self {
+            buf: core::ptr::null(),
+        }
+    }
+}
+impl Default for D3d11BufferInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct D3d11ImageInfo {
+    /// ID3D11Texture2D*
+    pub tex2d: *const core::ffi::c_void,
+    /// ID3D11Texture3D*
+    pub tex3d: *const core::ffi::c_void,
+    /// ID3D11Resource* (either tex2d or tex3d)
+    pub res: *const core::ffi::c_void,
+    /// ID3D11ShaderResourceView*
+    pub srv: *const core::ffi::c_void,
+}
+impl D3d11ImageInfo {
+    pub const fn new() -> Self {
+        Self {
+            tex2d: core::ptr::null(),
+            tex3d: core::ptr::null(),
+            res: core::ptr::null(),
+            srv: core::ptr::null(),
+        }
+    }
+}
+impl Default for D3d11ImageInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct D3d11SamplerInfo {
+    /// ID3D11SamplerState*
+    pub smp: *const core::ffi::c_void,
+}
+impl D3d11SamplerInfo {
+    pub const fn new() -> Self {
+        Self {
+            smp: core::ptr::null(),
+        }
+    }
+}
+impl Default for D3d11SamplerInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct D3d11ShaderInfo {
+    /// ID3D11Buffer* (constant buffers by bind slot)
+    pub cbufs: [*const core::ffi::c_void; 8],
+    /// ID3D11VertexShader*
+    pub vs: *const core::ffi::c_void,
+    /// ID3D11PixelShader*
+    pub fs: *const core::ffi::c_void,
+}
+impl D3d11ShaderInfo {
+    pub const fn new() -> Self {
+        Self {
+            cbufs: [core::ptr::null(); 8],
+            vs: core::ptr::null(),
+            fs: core::ptr::null(),
+        }
+    }
+}
+impl Default for D3d11ShaderInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct D3d11PipelineInfo {
+    /// ID3D11InputLayout*
+    pub il: *const core::ffi::c_void,
+    /// ID3D11RasterizerState*
+    pub rs: *const core::ffi::c_void,
+    /// ID3D11DepthStencilState*
+    pub dss: *const core::ffi::c_void,
+    /// ID3D11BlendState*
+    pub bs: *const core::ffi::c_void,
+}
+impl D3d11PipelineInfo {
+    pub const fn new() -> Self {
+        Self {
+            il: core::ptr::null(),
+            rs: core::ptr::null(),
+            dss: core::ptr::null(),
+            bs: core::ptr::null(),
+        }
+    }
+}
+impl Default for D3d11PipelineInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct D3d11AttachmentsInfo {
+    /// ID3D11RenderTargetView
+    pub color_rtv: [*const core::ffi::c_void; 4],
+    /// ID3D11RenderTargetView
+    pub resolve_rtv: [*const core::ffi::c_void; 4],
+    /// ID3D11DepthStencilView
+    pub dsv: *const core::ffi::c_void,
+}
+impl D3d11AttachmentsInfo {
+    pub const fn new() -> Self {
+        Self {
+            color_rtv: [core::ptr::null(); 4],
+            resolve_rtv: [core::ptr::null(); 4],
+            dsv: core::ptr::null(),
+        }
+    }
+}
+impl Default for D3d11AttachmentsInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct MtlBufferInfo {
+    /// id\<MTLBuffer\>
+    pub buf: [*const core::ffi::c_void; 2],
+    pub active_slot: i32,
+}
+impl MtlBufferInfo {
+    pub const fn new() -> Self {
+        Self {
+            buf: [core::ptr::null(); 2],
+            active_slot: 0,
+        }
+    }
+}
+impl Default for MtlBufferInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct MtlImageInfo {
+    /// id\<MTLTexture\>
+    pub tex: [*const core::ffi::c_void; 2],
+    pub active_slot: i32,
+}
+impl MtlImageInfo {
+    pub const fn new() -> Self {
+        Self {
+            tex: [core::ptr::null(); 2],
+            active_slot: 0,
+        }
+    }
+}
+impl Default for MtlImageInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct MtlSamplerInfo {
+    /// id\<MTLSamplerState\>
+    pub smp: *const core::ffi::c_void,
+}
+impl MtlSamplerInfo {
+    pub const fn new() -> Self {
+        Self {
+            smp: core::ptr::null(),
+        }
+    }
+}
+impl Default for MtlSamplerInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct MtlShaderInfo {
+    /// id\<MTLLibrary\>
+    pub vertex_lib: *const core::ffi::c_void,
+    /// id\<MTLLibrary\>
+    pub fragment_lib: *const core::ffi::c_void,
+    /// id\<MTLFunction\>
+    pub vertex_func: *const core::ffi::c_void,
+    /// id\<MTLFunction\>
+    pub fragment_func: *const core::ffi::c_void,
+}
+impl MtlShaderInfo {
+    pub const fn new() -> Self {
+        Self {
+            vertex_lib: core::ptr::null(),
+            fragment_lib: core::ptr::null(),
+            vertex_func: core::ptr::null(),
+            fragment_func: core::ptr::null(),
+        }
+    }
+}
+impl Default for MtlShaderInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct MtlPipelineInfo {
+    /// id\<MTLRenderPipelineState\>
+    pub rps: *const core::ffi::c_void,
+    /// id\<MTLDepthStencilState\>
+    pub dss: *const core::ffi::c_void,
+}
+impl MtlPipelineInfo {
+    pub const fn new() -> Self {
+        Self {
+            rps: core::ptr::null(),
+            dss: core::ptr::null(),
+        }
+    }
+}
+impl Default for MtlPipelineInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct WgpuBufferInfo {
+    /// WGPUBuffer
+    pub buf: *const core::ffi::c_void,
+}
+impl WgpuBufferInfo {
+    pub const fn new() -> Self {
+        Self {
+            buf: core::ptr::null(),
+        }
+    }
+}
+impl Default for WgpuBufferInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct WgpuImageInfo {
+    /// WGPUTexture
+    pub tex: *const core::ffi::c_void,
+    /// WGPUTextureView
+    pub view: *const core::ffi::c_void,
+}
+impl WgpuImageInfo {
+    pub const fn new() -> Self {
+        Self {
+            tex: core::ptr::null(),
+            view: core::ptr::null(),
+        }
+    }
+}
+impl Default for WgpuImageInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct WgpuSamplerInfo {
+    /// WGPUSampler
+    pub smp: *const core::ffi::c_void,
+}
+impl WgpuSamplerInfo {
+    pub const fn new() -> Self {
+        Self {
+            smp: core::ptr::null(),
+        }
+    }
+}
+impl Default for WgpuSamplerInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct WgpuShaderInfo {
+    /// WGPUShaderModule
+    pub vs_mod: *const core::ffi::c_void,
+    /// WGPUShaderModule
+    pub fs_mod: *const core::ffi::c_void,
+    /// WGPUBindGroupLayout;
+    pub bgl: *const core::ffi::c_void,
+}
+impl WgpuShaderInfo {
+    pub const fn new() -> Self {
+        Self {
+            vs_mod: core::ptr::null(),
+            fs_mod: core::ptr::null(),
+            bgl: core::ptr::null(),
+        }
+    }
+}
+impl Default for WgpuShaderInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct WgpuPipelineInfo {
+    /// WGPURenderPipeline
+    pub pip: *const core::ffi::c_void,
+}
+impl WgpuPipelineInfo {
+    pub const fn new() -> Self {
+        Self {
+            pip: core::ptr::null(),
+        }
+    }
+}
+impl Default for WgpuPipelineInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct WgpuAttachmentsInfo {
+    /// WGPUTextureView
+    pub color_view: [*const core::ffi::c_void; 4],
+    /// WGPUTextureView
+    pub resolve_view: [*const core::ffi::c_void; 4],
+    /// WGPUTextureView
+    pub ds_view: *const core::ffi::c_void,
+}
+impl WgpuAttachmentsInfo {
+    pub const fn new() -> Self {
+        Self {
+            color_view: [core::ptr::null(); 4],
+            resolve_view: [core::ptr::null(); 4],
+            ds_view: core::ptr::null(),
+        }
+    }
+}
+impl Default for WgpuAttachmentsInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct GlBufferInfo {
+    pub buf: [u32; 2],
+    pub active_slot: i32,
+}
+impl GlBufferInfo {
+    pub const fn new() -> Self {
+        Self {
+            buf: [0; 2],
+            active_slot: 0,
+        }
+    }
+}
+impl Default for GlBufferInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct GlImageInfo {
+    pub tex: [u32; 2],
+    pub tex_target: u32,
+    pub msaa_render_buffer: u32,
+    pub active_slot: i32,
+}
+impl GlImageInfo {
+    pub const fn new() -> Self {
+        Self {
+            tex: [0; 2],
+            tex_target: 0,
+            msaa_render_buffer: 0,
+            active_slot: 0,
+        }
+    }
+}
+impl Default for GlImageInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct GlSamplerInfo {
+    pub smp: u32,
+}
+impl GlSamplerInfo {
+    pub const fn new() -> Self {
+        Self {
+            smp: 0,
+        }
+    }
+}
+impl Default for GlSamplerInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct GlShaderInfo {
+    pub prog: u32,
+}
+impl GlShaderInfo {
+    pub const fn new() -> Self {
+        Self {
+            prog: 0,
+        }
+    }
+}
+impl Default for GlShaderInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct GlAttachmentsInfo {
+    pub framebuffer: u32,
+    pub msaa_resolve_framebuffer: [u32; 4],
+}
+impl GlAttachmentsInfo {
+    pub const fn new() -> Self {
+        Self {
+            framebuffer: 0,
+            msaa_resolve_framebuffer: [0; 4],
+        }
+    }
+}
+impl Default for GlAttachmentsInfo {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+pub mod ffi {
+    #![allow(unused_imports)]
+    use super::*;
+    extern "C" {
+        pub fn sg_setup(desc: *const Desc);
+        pub fn sg_shutdown();
+        pub fn sg_isvalid() -> bool;
+        pub fn sg_reset_state_cache();
+        pub fn sg_install_trace_hooks(trace_hooks: *const TraceHooks) -> TraceHooks;
+        pub fn sg_push_debug_group(name: *const core::ffi::c_char);
+        pub fn sg_pop_debug_group();
+        pub fn sg_add_commit_listener(listener: CommitListener) -> bool;
+        pub fn sg_remove_commit_listener(listener: CommitListener) -> bool;
+        pub fn sg_make_buffer(desc: *const BufferDesc) -> Buffer;
+        pub fn sg_make_image(desc: *const ImageDesc) -> Image;
+        pub fn sg_make_sampler(desc: *const SamplerDesc) -> Sampler;
+        pub fn sg_make_shader(desc: *const ShaderDesc) -> Shader;
+        pub fn sg_make_pipeline(desc: *const PipelineDesc) -> Pipeline;
+        pub fn sg_make_attachments(desc: *const AttachmentsDesc) -> Attachments;
+        pub fn sg_destroy_buffer(buf: Buffer);
+        pub fn sg_destroy_image(img: Image);
+        pub fn sg_destroy_sampler(smp: Sampler);
+        pub fn sg_destroy_shader(shd: Shader);
+        pub fn sg_destroy_pipeline(pip: Pipeline);
+        pub fn sg_destroy_attachments(atts: Attachments);
+        pub fn sg_update_buffer(buf: Buffer, data: *const Range);
+        pub fn sg_update_image(img: Image, data: *const ImageData);
+        pub fn sg_append_buffer(buf: Buffer, data: *const Range) -> i32;
+        pub fn sg_query_buffer_overflow(buf: Buffer) -> bool;
+        pub fn sg_query_buffer_will_overflow(buf: Buffer, size: usize) -> bool;
+        pub fn sg_begin_pass(pass: *const Pass);
+        pub fn sg_apply_viewport(x: i32, y: i32, width: i32, height: i32, origin_top_left: bool);
+        pub fn sg_apply_viewportf(x: f32, y: f32, width: f32, height: f32, origin_top_left: bool);
+        pub fn sg_apply_scissor_rect(x: i32, y: i32, width: i32, height: i32, origin_top_left: bool);
+        pub fn sg_apply_scissor_rectf(x: f32, y: f32, width: f32, height: f32, origin_top_left: bool);
+        pub fn sg_apply_pipeline(pip: Pipeline);
+        pub fn sg_apply_bindings(bindings: *const Bindings);
+        pub fn sg_apply_uniforms(ub_slot: usize, data: *const Range);
+        pub fn sg_draw(base_element: usize, num_elements: usize, num_instances: usize);
+        pub fn sg_end_pass();
+        pub fn sg_commit();
+        pub fn sg_query_desc() -> Desc;
+        pub fn sg_query_backend() -> Backend;
+        pub fn sg_query_features() -> Features;
+        pub fn sg_query_limits() -> Limits;
+        pub fn sg_query_pixelformat(fmt: PixelFormat) -> PixelformatInfo;
+        pub fn sg_query_row_pitch(fmt: PixelFormat, width: i32, row_align_bytes: i32) -> i32;
+        pub fn sg_query_surface_pitch(fmt: PixelFormat, width: i32, height: i32, row_align_bytes: i32) -> i32;
+        pub fn sg_query_buffer_state(buf: Buffer) -> ResourceState;
+        pub fn sg_query_image_state(img: Image) -> ResourceState;
+        pub fn sg_query_sampler_state(smp: Sampler) -> ResourceState;
+        pub fn sg_query_shader_state(shd: Shader) -> ResourceState;
+        pub fn sg_query_pipeline_state(pip: Pipeline) -> ResourceState;
+        pub fn sg_query_attachments_state(atts: Attachments) -> ResourceState;
+        pub fn sg_query_buffer_info(buf: Buffer) -> BufferInfo;
+        pub fn sg_query_image_info(img: Image) -> ImageInfo;
+        pub fn sg_query_sampler_info(smp: Sampler) -> SamplerInfo;
+        pub fn sg_query_shader_info(shd: Shader) -> ShaderInfo;
+        pub fn sg_query_pipeline_info(pip: Pipeline) -> PipelineInfo;
+        pub fn sg_query_attachments_info(atts: Attachments) -> AttachmentsInfo;
+        pub fn sg_query_buffer_desc(buf: Buffer) -> BufferDesc;
+        pub fn sg_query_image_desc(img: Image) -> ImageDesc;
+        pub fn sg_query_sampler_desc(smp: Sampler) -> SamplerDesc;
+        pub fn sg_query_shader_desc(shd: Shader) -> ShaderDesc;
+        pub fn sg_query_pipeline_desc(pip: Pipeline) -> PipelineDesc;
+        pub fn sg_query_attachments_desc(atts: Attachments) -> AttachmentsDesc;
+        pub fn sg_query_buffer_defaults(desc: *const BufferDesc) -> BufferDesc;
+        pub fn sg_query_image_defaults(desc: *const ImageDesc) -> ImageDesc;
+        pub fn sg_query_sampler_defaults(desc: *const SamplerDesc) -> SamplerDesc;
+        pub fn sg_query_shader_defaults(desc: *const ShaderDesc) -> ShaderDesc;
+        pub fn sg_query_pipeline_defaults(desc: *const PipelineDesc) -> PipelineDesc;
+        pub fn sg_query_attachments_defaults(desc: *const AttachmentsDesc) -> AttachmentsDesc;
+        pub fn sg_query_buffer_size(buf: Buffer) -> usize;
+        pub fn sg_query_buffer_type(buf: Buffer) -> BufferType;
+        pub fn sg_query_buffer_usage(buf: Buffer) -> Usage;
+        pub fn sg_query_image_type(img: Image) -> ImageType;
+        pub fn sg_query_image_width(img: Image) -> i32;
+        pub fn sg_query_image_height(img: Image) -> i32;
+        pub fn sg_query_image_num_slices(img: Image) -> i32;
+        pub fn sg_query_image_num_mipmaps(img: Image) -> i32;
+        pub fn sg_query_image_pixelformat(img: Image) -> PixelFormat;
+        pub fn sg_query_image_usage(img: Image) -> Usage;
+        pub fn sg_query_image_sample_count(img: Image) -> i32;
+        pub fn sg_alloc_buffer() -> Buffer;
+        pub fn sg_alloc_image() -> Image;
+        pub fn sg_alloc_sampler() -> Sampler;
+        pub fn sg_alloc_shader() -> Shader;
+        pub fn sg_alloc_pipeline() -> Pipeline;
+        pub fn sg_alloc_attachments() -> Attachments;
+        pub fn sg_dealloc_buffer(buf: Buffer);
+        pub fn sg_dealloc_image(img: Image);
+        pub fn sg_dealloc_sampler(smp: Sampler);
+        pub fn sg_dealloc_shader(shd: Shader);
+        pub fn sg_dealloc_pipeline(pip: Pipeline);
+        pub fn sg_dealloc_attachments(attachments: Attachments);
+        pub fn sg_init_buffer(buf: Buffer, desc: *const BufferDesc);
+        pub fn sg_init_image(img: Image, desc: *const ImageDesc);
+        pub fn sg_init_sampler(smg: Sampler, desc: *const SamplerDesc);
+        pub fn sg_init_shader(shd: Shader, desc: *const ShaderDesc);
+        pub fn sg_init_pipeline(pip: Pipeline, desc: *const PipelineDesc);
+        pub fn sg_init_attachments(attachments: Attachments, desc: *const AttachmentsDesc);
+        pub fn sg_uninit_buffer(buf: Buffer);
+        pub fn sg_uninit_image(img: Image);
+        pub fn sg_uninit_sampler(smp: Sampler);
+        pub fn sg_uninit_shader(shd: Shader);
+        pub fn sg_uninit_pipeline(pip: Pipeline);
+        pub fn sg_uninit_attachments(atts: Attachments);
+        pub fn sg_fail_buffer(buf: Buffer);
+        pub fn sg_fail_image(img: Image);
+        pub fn sg_fail_sampler(smp: Sampler);
+        pub fn sg_fail_shader(shd: Shader);
+        pub fn sg_fail_pipeline(pip: Pipeline);
+        pub fn sg_fail_attachments(atts: Attachments);
+        pub fn sg_enable_frame_stats();
+        pub fn sg_disable_frame_stats();
+        pub fn sg_frame_stats_enabled() -> bool;
+        pub fn sg_query_frame_stats() -> FrameStats;
+        pub fn sg_d3d11_device() -> *const core::ffi::c_void;
+        pub fn sg_d3d11_device_context() -> *const core::ffi::c_void;
+        pub fn sg_d3d11_query_buffer_info(buf: Buffer) -> D3d11BufferInfo;
+        pub fn sg_d3d11_query_image_info(img: Image) -> D3d11ImageInfo;
+        pub fn sg_d3d11_query_sampler_info(smp: Sampler) -> D3d11SamplerInfo;
+        pub fn sg_d3d11_query_shader_info(shd: Shader) -> D3d11ShaderInfo;
+        pub fn sg_d3d11_query_pipeline_info(pip: Pipeline) -> D3d11PipelineInfo;
+        pub fn sg_d3d11_query_attachments_info(atts: Attachments) -> D3d11AttachmentsInfo;
+        pub fn sg_mtl_device() -> *const core::ffi::c_void;
+        pub fn sg_mtl_render_command_encoder() -> *const core::ffi::c_void;
+        pub fn sg_mtl_query_buffer_info(buf: Buffer) -> MtlBufferInfo;
+        pub fn sg_mtl_query_image_info(img: Image) -> MtlImageInfo;
+        pub fn sg_mtl_query_sampler_info(smp: Sampler) -> MtlSamplerInfo;
+        pub fn sg_mtl_query_shader_info(shd: Shader) -> MtlShaderInfo;
+        pub fn sg_mtl_query_pipeline_info(pip: Pipeline) -> MtlPipelineInfo;
+        pub fn sg_wgpu_device() -> *const core::ffi::c_void;
+        pub fn sg_wgpu_queue() -> *const core::ffi::c_void;
+        pub fn sg_wgpu_command_encoder() -> *const core::ffi::c_void;
+        pub fn sg_wgpu_render_pass_encoder() -> *const core::ffi::c_void;
+        pub fn sg_wgpu_query_buffer_info(buf: Buffer) -> WgpuBufferInfo;
+        pub fn sg_wgpu_query_image_info(img: Image) -> WgpuImageInfo;
+        pub fn sg_wgpu_query_sampler_info(smp: Sampler) -> WgpuSamplerInfo;
+        pub fn sg_wgpu_query_shader_info(shd: Shader) -> WgpuShaderInfo;
+        pub fn sg_wgpu_query_pipeline_info(pip: Pipeline) -> WgpuPipelineInfo;
+        pub fn sg_wgpu_query_attachments_info(atts: Attachments) -> WgpuAttachmentsInfo;
+        pub fn sg_gl_query_buffer_info(buf: Buffer) -> GlBufferInfo;
+        pub fn sg_gl_query_image_info(img: Image) -> GlImageInfo;
+        pub fn sg_gl_query_sampler_info(smp: Sampler) -> GlSamplerInfo;
+        pub fn sg_gl_query_shader_info(shd: Shader) -> GlShaderInfo;
+        pub fn sg_gl_query_attachments_info(atts: Attachments) -> GlAttachmentsInfo;
+    }
+}
+#[inline]
+pub fn setup(desc: &Desc) {
+    unsafe {
+        ffi::sg_setup(desc)
+    }
+}
+#[inline]
+pub fn shutdown() {
+    unsafe {
+        ffi::sg_shutdown()
+    }
+}
+#[inline]
+pub fn isvalid() -> bool {
+    unsafe {
+        ffi::sg_isvalid()
+    }
+}
+#[inline]
+pub fn reset_state_cache() {
+    unsafe {
+        ffi::sg_reset_state_cache()
+    }
+}
+#[inline]
+pub fn install_trace_hooks(trace_hooks: &TraceHooks) -> TraceHooks {
+    unsafe {
+        ffi::sg_install_trace_hooks(trace_hooks)
+    }
+}
+#[inline]
+pub fn push_debug_group(name: &str) {
+    with_c_str(name, |tmp_0| unsafe {
+        ffi::sg_push_debug_group(tmp_0)
+    })
+}
+#[inline]
+pub fn push_debug_group_cstr(name: &core::ffi::CStr) {
+    unsafe {
+        ffi::sg_push_debug_group(name.as_ptr())
+    }
+}
+#[inline]
+pub fn pop_debug_group() {
+    unsafe {
+        ffi::sg_pop_debug_group()
+    }
+}
+#[inline]
+pub fn add_commit_listener(listener: CommitListener) -> bool {
+    unsafe {
+        ffi::sg_add_commit_listener(listener)
+    }
+}
+#[inline]
+pub fn remove_commit_listener(listener: CommitListener) -> bool {
+    unsafe {
+        ffi::sg_remove_commit_listener(listener)
+    }
+}
+#[inline]
+pub fn make_buffer(desc: &BufferDesc) -> Buffer {
+    unsafe {
+        ffi::sg_make_buffer(desc)
+    }
+}
+#[inline]
+pub fn make_image(desc: &ImageDesc) -> Image {
+    unsafe {
+        ffi::sg_make_image(desc)
+    }
+}
+#[inline]
+pub fn make_sampler(desc: &SamplerDesc) -> Sampler {
+    unsafe {
+        ffi::sg_make_sampler(desc)
+    }
+}
+#[inline]
+pub fn make_shader(desc: &ShaderDesc) -> Shader {
+    unsafe {
+        ffi::sg_make_shader(desc)
+    }
+}
+#[inline]
+pub fn make_pipeline(desc: &PipelineDesc) -> Pipeline {
+    unsafe {
+        ffi::sg_make_pipeline(desc)
+    }
+}
+#[inline]
+pub fn make_attachments(desc: &AttachmentsDesc) -> Attachments {
+    unsafe {
+        ffi::sg_make_attachments(desc)
+    }
+}
+#[inline]
+pub fn destroy_buffer(buf: Buffer) {
+    unsafe {
+        ffi::sg_destroy_buffer(buf)
+    }
+}
+#[inline]
+pub fn destroy_image(img: Image) {
+    unsafe {
+        ffi::sg_destroy_image(img)
+    }
+}
+#[inline]
+pub fn destroy_sampler(smp: Sampler) {
+    unsafe {
+        ffi::sg_destroy_sampler(smp)
+    }
+}
+#[inline]
+pub fn destroy_shader(shd: Shader) {
+    unsafe {
+        ffi::sg_destroy_shader(shd)
+    }
+}
+#[inline]
+pub fn destroy_pipeline(pip: Pipeline) {
+    unsafe {
+        ffi::sg_destroy_pipeline(pip)
+    }
+}
+#[inline]
+pub fn destroy_attachments(atts: Attachments) {
+    unsafe {
+        ffi::sg_destroy_attachments(atts)
+    }
+}
+#[inline]
+pub fn update_buffer(buf: Buffer, data: &Range) {
+    unsafe {
+        ffi::sg_update_buffer(buf, data)
+    }
+}
+#[inline]
+pub fn update_image(img: Image, data: &ImageData) {
+    unsafe {
+        ffi::sg_update_image(img, data)
+    }
+}
+#[inline]
+pub fn append_buffer(buf: Buffer, data: &Range) -> i32 {
+    unsafe {
+        ffi::sg_append_buffer(buf, data)
+    }
+}
+#[inline]
+pub fn query_buffer_overflow(buf: Buffer) -> bool {
+    unsafe {
+        ffi::sg_query_buffer_overflow(buf)
+    }
+}
+#[inline]
+pub fn query_buffer_will_overflow(buf: Buffer, size: usize) -> bool {
+    unsafe {
+        ffi::sg_query_buffer_will_overflow(buf, size)
+    }
+}
+#[inline]
+pub fn begin_pass(pass: &Pass) {
+    unsafe {
+        ffi::sg_begin_pass(pass)
+    }
+}
+#[inline]
+pub fn apply_viewport(x: i32, y: i32, width: i32, height: i32, origin_top_left: bool) {
+    unsafe {
+        ffi::sg_apply_viewport(x, y, width, height, origin_top_left)
+    }
+}
+#[inline]
+pub fn apply_viewportf(x: f32, y: f32, width: f32, height: f32, origin_top_left: bool) {
+    unsafe {
+        ffi::sg_apply_viewportf(x, y, width, height, origin_top_left)
+    }
+}
+#[inline]
+pub fn apply_scissor_rect(x: i32, y: i32, width: i32, height: i32, origin_top_left: bool) {
+    unsafe {
+        ffi::sg_apply_scissor_rect(x, y, width, height, origin_top_left)
+    }
+}
+#[inline]
+pub fn apply_scissor_rectf(x: f32, y: f32, width: f32, height: f32, origin_top_left: bool) {
+    unsafe {
+        ffi::sg_apply_scissor_rectf(x, y, width, height, origin_top_left)
+    }
+}
+#[inline]
+pub fn apply_pipeline(pip: Pipeline) {
+    unsafe {
+        ffi::sg_apply_pipeline(pip)
+    }
+}
+#[inline]
+pub fn apply_bindings(bindings: &Bindings) {
+    unsafe {
+        ffi::sg_apply_bindings(bindings)
+    }
+}
+#[inline]
+pub fn apply_uniforms(ub_slot: usize, data: &Range) {
+    unsafe {
+        ffi::sg_apply_uniforms(ub_slot, data)
+    }
+}
+#[inline]
+pub fn draw(base_element: usize, num_elements: usize, num_instances: usize) {
+    unsafe {
+        ffi::sg_draw(base_element, num_elements, num_instances)
+    }
+}
+#[inline]
+pub fn end_pass() {
+    unsafe {
+        ffi::sg_end_pass()
+    }
+}
+#[inline]
+pub fn commit() {
+    unsafe {
+        ffi::sg_commit()
+    }
+}
+#[inline]
+pub fn query_desc() -> Desc {
+    unsafe {
+        ffi::sg_query_desc()
+    }
+}
+#[inline]
+pub fn query_backend() -> Backend {
+    unsafe {
+        ffi::sg_query_backend()
+    }
+}
+#[inline]
+pub fn query_features() -> Features {
+    unsafe {
+        ffi::sg_query_features()
+    }
+}
+#[inline]
+pub fn query_limits() -> Limits {
+    unsafe {
+        ffi::sg_query_limits()
+    }
+}
+#[inline]
+pub fn query_pixelformat(fmt: PixelFormat) -> PixelformatInfo {
+    unsafe {
+        ffi::sg_query_pixelformat(fmt)
+    }
+}
+#[inline]
+pub fn query_row_pitch(fmt: PixelFormat, width: i32, row_align_bytes: i32) -> i32 {
+    unsafe {
+        ffi::sg_query_row_pitch(fmt, width, row_align_bytes)
+    }
+}
+#[inline]
+pub fn query_surface_pitch(fmt: PixelFormat, width: i32, height: i32, row_align_bytes: i32) -> i32 {
+    unsafe {
+        ffi::sg_query_surface_pitch(fmt, width, height, row_align_bytes)
+    }
+}
+#[inline]
+pub fn query_buffer_state(buf: Buffer) -> ResourceState {
+    unsafe {
+        ffi::sg_query_buffer_state(buf)
+    }
+}
+#[inline]
+pub fn query_image_state(img: Image) -> ResourceState {
+    unsafe {
+        ffi::sg_query_image_state(img)
+    }
+}
+#[inline]
+pub fn query_sampler_state(smp: Sampler) -> ResourceState {
+    unsafe {
+        ffi::sg_query_sampler_state(smp)
+    }
+}
+#[inline]
+pub fn query_shader_state(shd: Shader) -> ResourceState {
+    unsafe {
+        ffi::sg_query_shader_state(shd)
+    }
+}
+#[inline]
+pub fn query_pipeline_state(pip: Pipeline) -> ResourceState {
+    unsafe {
+        ffi::sg_query_pipeline_state(pip)
+    }
+}
+#[inline]
+pub fn query_attachments_state(atts: Attachments) -> ResourceState {
+    unsafe {
+        ffi::sg_query_attachments_state(atts)
+    }
+}
+#[inline]
+pub fn query_buffer_info(buf: Buffer) -> BufferInfo {
+    unsafe {
+        ffi::sg_query_buffer_info(buf)
+    }
+}
+#[inline]
+pub fn query_image_info(img: Image) -> ImageInfo {
+    unsafe {
+        ffi::sg_query_image_info(img)
+    }
+}
+#[inline]
+pub fn query_sampler_info(smp: Sampler) -> SamplerInfo {
+    unsafe {
+        ffi::sg_query_sampler_info(smp)
+    }
+}
+#[inline]
+pub fn query_shader_info(shd: Shader) -> ShaderInfo {
+    unsafe {
+        ffi::sg_query_shader_info(shd)
+    }
+}
+#[inline]
+pub fn query_pipeline_info(pip: Pipeline) -> PipelineInfo {
+    unsafe {
+        ffi::sg_query_pipeline_info(pip)
+    }
+}
+#[inline]
+pub fn query_attachments_info(atts: Attachments) -> AttachmentsInfo {
+    unsafe {
+        ffi::sg_query_attachments_info(atts)
+    }
+}
+#[inline]
+pub fn query_buffer_desc(buf: Buffer) -> BufferDesc {
+    unsafe {
+        ffi::sg_query_buffer_desc(buf)
+    }
+}
+#[inline]
+pub fn query_image_desc(img: Image) -> ImageDesc {
+    unsafe {
+        ffi::sg_query_image_desc(img)
+    }
+}
+#[inline]
+pub fn query_sampler_desc(smp: Sampler) -> SamplerDesc {
+    unsafe {
+        ffi::sg_query_sampler_desc(smp)
+    }
+}
+#[inline]
+pub fn query_shader_desc(shd: Shader) -> ShaderDesc {
+    unsafe {
+        ffi::sg_query_shader_desc(shd)
+    }
+}
+#[inline]
+pub fn query_pipeline_desc(pip: Pipeline) -> PipelineDesc {
+    unsafe {
+        ffi::sg_query_pipeline_desc(pip)
+    }
+}
+#[inline]
+pub fn query_attachments_desc(atts: Attachments) -> AttachmentsDesc {
+    unsafe {
+        ffi::sg_query_attachments_desc(atts)
+    }
+}
+#[inline]
+pub fn query_buffer_defaults(desc: &BufferDesc) -> BufferDesc {
+    unsafe {
+        ffi::sg_query_buffer_defaults(desc)
+    }
+}
+#[inline]
+pub fn query_image_defaults(desc: &ImageDesc) -> ImageDesc {
+    unsafe {
+        ffi::sg_query_image_defaults(desc)
+    }
+}
+#[inline]
+pub fn query_sampler_defaults(desc: &SamplerDesc) -> SamplerDesc {
+    unsafe {
+        ffi::sg_query_sampler_defaults(desc)
+    }
+}
+#[inline]
+pub fn query_shader_defaults(desc: &ShaderDesc) -> ShaderDesc {
+    unsafe {
+        ffi::sg_query_shader_defaults(desc)
+    }
+}
+#[inline]
+pub fn query_pipeline_defaults(desc: &PipelineDesc) -> PipelineDesc {
+    unsafe {
+        ffi::sg_query_pipeline_defaults(desc)
+    }
+}
+#[inline]
+pub fn query_attachments_defaults(desc: &AttachmentsDesc) -> AttachmentsDesc {
+    unsafe {
+        ffi::sg_query_attachments_defaults(desc)
+    }
+}
+#[inline]
+pub fn query_buffer_size(buf: Buffer) -> usize {
+    unsafe {
+        ffi::sg_query_buffer_size(buf)
+    }
+}
+#[inline]
+pub fn query_buffer_type(buf: Buffer) -> BufferType {
+    unsafe {
+        ffi::sg_query_buffer_type(buf)
+    }
+}
+#[inline]
+pub fn query_buffer_usage(buf: Buffer) -> Usage {
+    unsafe {
+        ffi::sg_query_buffer_usage(buf)
+    }
+}
+#[inline]
+pub fn query_image_type(img: Image) -> ImageType {
+    unsafe {
+        ffi::sg_query_image_type(img)
+    }
+}
+#[inline]
+pub fn query_image_width(img: Image) -> i32 {
+    unsafe {
+        ffi::sg_query_image_width(img)
+    }
+}
+#[inline]
+pub fn query_image_height(img: Image) -> i32 {
+    unsafe {
+        ffi::sg_query_image_height(img)
+    }
+}
+#[inline]
+pub fn query_image_num_slices(img: Image) -> i32 {
+    unsafe {
+        ffi::sg_query_image_num_slices(img)
+    }
+}
+#[inline]
+pub fn query_image_num_mipmaps(img: Image) -> i32 {
+    unsafe {
+        ffi::sg_query_image_num_mipmaps(img)
+    }
+}
+#[inline]
+pub fn query_image_pixelformat(img: Image) -> PixelFormat {
+    unsafe {
+        ffi::sg_query_image_pixelformat(img)
+    }
+}
+#[inline]
+pub fn query_image_usage(img: Image) -> Usage {
+    unsafe {
+        ffi::sg_query_image_usage(img)
+    }
+}
+#[inline]
+pub fn query_image_sample_count(img: Image) -> i32 {
+    unsafe {
+        ffi::sg_query_image_sample_count(img)
+    }
+}
+#[inline]
+pub fn alloc_buffer() -> Buffer {
+    unsafe {
+        ffi::sg_alloc_buffer()
+    }
+}
+#[inline]
+pub fn alloc_image() -> Image {
+    unsafe {
+        ffi::sg_alloc_image()
+    }
+}
+#[inline]
+pub fn alloc_sampler() -> Sampler {
+    unsafe {
+        ffi::sg_alloc_sampler()
+    }
+}
+#[inline]
+pub fn alloc_shader() -> Shader {
+    unsafe {
+        ffi::sg_alloc_shader()
+    }
+}
+#[inline]
+pub fn alloc_pipeline() -> Pipeline {
+    unsafe {
+        ffi::sg_alloc_pipeline()
+    }
+}
+#[inline]
+pub fn alloc_attachments() -> Attachments {
+    unsafe {
+        ffi::sg_alloc_attachments()
+    }
+}
+#[inline]
+pub fn dealloc_buffer(buf: Buffer) {
+    unsafe {
+        ffi::sg_dealloc_buffer(buf)
+    }
+}
+#[inline]
+pub fn dealloc_image(img: Image) {
+    unsafe {
+        ffi::sg_dealloc_image(img)
+    }
+}
+#[inline]
+pub fn dealloc_sampler(smp: Sampler) {
+    unsafe {
+        ffi::sg_dealloc_sampler(smp)
+    }
+}
+#[inline]
+pub fn dealloc_shader(shd: Shader) {
+    unsafe {
+        ffi::sg_dealloc_shader(shd)
+    }
+}
+#[inline]
+pub fn dealloc_pipeline(pip: Pipeline) {
+    unsafe {
+        ffi::sg_dealloc_pipeline(pip)
+    }
+}
+#[inline]
+pub fn dealloc_attachments(attachments: Attachments) {
+    unsafe {
+        ffi::sg_dealloc_attachments(attachments)
+    }
+}
+#[inline]
+pub fn init_buffer(buf: Buffer, desc: &BufferDesc) {
+    unsafe {
+        ffi::sg_init_buffer(buf, desc)
+    }
+}
+#[inline]
+pub fn init_image(img: Image, desc: &ImageDesc) {
+    unsafe {
+        ffi::sg_init_image(img, desc)
+    }
+}
+#[inline]
+pub fn init_sampler(smg: Sampler, desc: &SamplerDesc) {
+    unsafe {
+        ffi::sg_init_sampler(smg, desc)
+    }
+}
+#[inline]
+pub fn init_shader(shd: Shader, desc: &ShaderDesc) {
+    unsafe {
+        ffi::sg_init_shader(shd, desc)
+    }
+}
+#[inline]
+pub fn init_pipeline(pip: Pipeline, desc: &PipelineDesc) {
+    unsafe {
+        ffi::sg_init_pipeline(pip, desc)
+    }
+}
+#[inline]
+pub fn init_attachments(attachments: Attachments, desc: &AttachmentsDesc) {
+    unsafe {
+        ffi::sg_init_attachments(attachments, desc)
+    }
+}
+#[inline]
+pub fn uninit_buffer(buf: Buffer) {
+    unsafe {
+        ffi::sg_uninit_buffer(buf)
+    }
+}
+#[inline]
+pub fn uninit_image(img: Image) {
+    unsafe {
+        ffi::sg_uninit_image(img)
+    }
+}
+#[inline]
+pub fn uninit_sampler(smp: Sampler) {
+    unsafe {
+        ffi::sg_uninit_sampler(smp)
+    }
+}
+#[inline]
+pub fn uninit_shader(shd: Shader) {
+    unsafe {
+        ffi::sg_uninit_shader(shd)
+    }
+}
+#[inline]
+pub fn uninit_pipeline(pip: Pipeline) {
+    unsafe {
+        ffi::sg_uninit_pipeline(pip)
+    }
+}
+#[inline]
+pub fn uninit_attachments(atts: Attachments) {
+    unsafe {
+        ffi::sg_uninit_attachments(atts)
+    }
+}
+#[inline]
+pub fn fail_buffer(buf: Buffer) {
+    unsafe {
+        ffi::sg_fail_buffer(buf)
+    }
+}
+#[inline]
+pub fn fail_image(img: Image) {
+    unsafe {
+        ffi::sg_fail_image(img)
+    }
+}
+#[inline]
+pub fn fail_sampler(smp: Sampler) {
+    unsafe {
+        ffi::sg_fail_sampler(smp)
+    }
+}
+#[inline]
+pub fn fail_shader(shd: Shader) {
+    unsafe {
+        ffi::sg_fail_shader(shd)
+    }
+}
+#[inline]
+pub fn fail_pipeline(pip: Pipeline) {
+    unsafe {
+        ffi::sg_fail_pipeline(pip)
+    }
+}
+#[inline]
+pub fn fail_attachments(atts: Attachments) {
+    unsafe {
+        ffi::sg_fail_attachments(atts)
+    }
+}
+#[inline]
+pub fn enable_frame_stats() {
+    unsafe {
+        ffi::sg_enable_frame_stats()
+    }
+}
+#[inline]
+pub fn disable_frame_stats() {
+    unsafe {
+        ffi::sg_disable_frame_stats()
+    }
+}
+#[inline]
+pub fn frame_stats_enabled() -> bool {
+    unsafe {
+        ffi::sg_frame_stats_enabled()
+    }
+}
+#[inline]
+pub fn query_frame_stats() -> FrameStats {
+    unsafe {
+        ffi::sg_query_frame_stats()
+    }
+}
+/// D3D11: return ID3D11Device
+#[inline]
+pub fn d3d11_device() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sg_d3d11_device()
+    }
+}
+/// D3D11: return ID3D11DeviceContext
+#[inline]
+pub fn d3d11_device_context() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sg_d3d11_device_context()
+    }
+}
+/// D3D11: get internal buffer resource objects
+#[inline]
+pub fn d3d11_query_buffer_info(buf: Buffer) -> D3d11BufferInfo {
+    unsafe {
+        ffi::sg_d3d11_query_buffer_info(buf)
+    }
+}
+/// D3D11: get internal image resource objects
+#[inline]
+pub fn d3d11_query_image_info(img: Image) -> D3d11ImageInfo {
+    unsafe {
+        ffi::sg_d3d11_query_image_info(img)
+    }
+}
+/// D3D11: get internal sampler resource objects
+#[inline]
+pub fn d3d11_query_sampler_info(smp: Sampler) -> D3d11SamplerInfo {
+    unsafe {
+        ffi::sg_d3d11_query_sampler_info(smp)
+    }
+}
+/// D3D11: get internal shader resource objects
+#[inline]
+pub fn d3d11_query_shader_info(shd: Shader) -> D3d11ShaderInfo {
+    unsafe {
+        ffi::sg_d3d11_query_shader_info(shd)
+    }
+}
+/// D3D11: get internal pipeline resource objects
+#[inline]
+pub fn d3d11_query_pipeline_info(pip: Pipeline) -> D3d11PipelineInfo {
+    unsafe {
+        ffi::sg_d3d11_query_pipeline_info(pip)
+    }
+}
+/// D3D11: get internal pass resource objects
+#[inline]
+pub fn d3d11_query_attachments_info(atts: Attachments) -> D3d11AttachmentsInfo {
+    unsafe {
+        ffi::sg_d3d11_query_attachments_info(atts)
+    }
+}
+/// Metal: return __bridge-casted MTLDevice
+#[inline]
+pub fn mtl_device() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sg_mtl_device()
+    }
+}
+/// Metal: return __bridge-casted MTLRenderCommandEncoder in current pass (or zero if outside pass)
+#[inline]
+pub fn mtl_render_command_encoder() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sg_mtl_render_command_encoder()
+    }
+}
+/// Metal: get internal __bridge-casted buffer resource objects
+#[inline]
+pub fn mtl_query_buffer_info(buf: Buffer) -> MtlBufferInfo {
+    unsafe {
+        ffi::sg_mtl_query_buffer_info(buf)
+    }
+}
+/// Metal: get internal __bridge-casted image resource objects
+#[inline]
+pub fn mtl_query_image_info(img: Image) -> MtlImageInfo {
+    unsafe {
+        ffi::sg_mtl_query_image_info(img)
+    }
+}
+/// Metal: get internal __bridge-casted sampler resource objects
+#[inline]
+pub fn mtl_query_sampler_info(smp: Sampler) -> MtlSamplerInfo {
+    unsafe {
+        ffi::sg_mtl_query_sampler_info(smp)
+    }
+}
+/// Metal: get internal __bridge-casted shader resource objects
+#[inline]
+pub fn mtl_query_shader_info(shd: Shader) -> MtlShaderInfo {
+    unsafe {
+        ffi::sg_mtl_query_shader_info(shd)
+    }
+}
+/// Metal: get internal __bridge-casted pipeline resource objects
+#[inline]
+pub fn mtl_query_pipeline_info(pip: Pipeline) -> MtlPipelineInfo {
+    unsafe {
+        ffi::sg_mtl_query_pipeline_info(pip)
+    }
+}
+/// WebGPU: return WGPUDevice object
+#[inline]
+pub fn wgpu_device() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sg_wgpu_device()
+    }
+}
+/// WebGPU: return WGPUQueue object
+#[inline]
+pub fn wgpu_queue() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sg_wgpu_queue()
+    }
+}
+/// WebGPU: return this frame's WGPUCommandEncoder
+#[inline]
+pub fn wgpu_command_encoder() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sg_wgpu_command_encoder()
+    }
+}
+/// WebGPU: return WGPURenderPassEncoder of current pass
+#[inline]
+pub fn wgpu_render_pass_encoder() -> *const core::ffi::c_void {
+    unsafe {
+        ffi::sg_wgpu_render_pass_encoder()
+    }
+}
+/// WebGPU: get internal buffer resource objects
+#[inline]
+pub fn wgpu_query_buffer_info(buf: Buffer) -> WgpuBufferInfo {
+    unsafe {
+        ffi::sg_wgpu_query_buffer_info(buf)
+    }
+}
+/// WebGPU: get internal image resource objects
+#[inline]
+pub fn wgpu_query_image_info(img: Image) -> WgpuImageInfo {
+    unsafe {
+        ffi::sg_wgpu_query_image_info(img)
+    }
+}
+/// WebGPU: get internal sampler resource objects
+#[inline]
+pub fn wgpu_query_sampler_info(smp: Sampler) -> WgpuSamplerInfo {
+    unsafe {
+        ffi::sg_wgpu_query_sampler_info(smp)
+    }
+}
+/// WebGPU: get internal shader resource objects
+#[inline]
+pub fn wgpu_query_shader_info(shd: Shader) -> WgpuShaderInfo {
+    unsafe {
+        ffi::sg_wgpu_query_shader_info(shd)
+    }
+}
+/// WebGPU: get internal pipeline resource objects
+#[inline]
+pub fn wgpu_query_pipeline_info(pip: Pipeline) -> WgpuPipelineInfo {
+    unsafe {
+        ffi::sg_wgpu_query_pipeline_info(pip)
+    }
+}
+/// WebGPU: get internal pass resource objects
+#[inline]
+pub fn wgpu_query_attachments_info(atts: Attachments) -> WgpuAttachmentsInfo {
+    unsafe {
+        ffi::sg_wgpu_query_attachments_info(atts)
+    }
+}
+/// GL: get internal buffer resource objects
+#[inline]
+pub fn gl_query_buffer_info(buf: Buffer) -> GlBufferInfo {
+    unsafe {
+        ffi::sg_gl_query_buffer_info(buf)
+    }
+}
+/// GL: get internal image resource objects
+#[inline]
+pub fn gl_query_image_info(img: Image) -> GlImageInfo {
+    unsafe {
+        ffi::sg_gl_query_image_info(img)
+    }
+}
+/// GL: get internal sampler resource objects
+#[inline]
+pub fn gl_query_sampler_info(smp: Sampler) -> GlSamplerInfo {
+    unsafe {
+        ffi::sg_gl_query_sampler_info(smp)
+    }
+}
+/// GL: get internal shader resource objects
+#[inline]
+pub fn gl_query_shader_info(shd: Shader) -> GlShaderInfo {
+    unsafe {
+        ffi::sg_gl_query_shader_info(shd)
+    }
+}
+/// GL: get internal pass resource objects
+#[inline]
+pub fn gl_query_attachments_info(atts: Attachments) -> GlAttachmentsInfo {
+    unsafe {
+        ffi::sg_gl_query_attachments_info(atts)
+    }
+}
+/// Call counts of the sokol-gfx functions traced by a `Tracer`
+#[derive(Copy, Clone, Debug, Default)]
+pub struct TracerCounts {
+    pub reset_state_cache: u32,
+    pub make_buffer: u32,
+    pub make_image: u32,
+    pub make_sampler: u32,
+    pub make_shader: u32,
+    pub make_pipeline: u32,
+    pub make_attachments: u32,
+    pub destroy_buffer: u32,
+    pub destroy_image: u32,
+    pub destroy_sampler: u32,
+    pub destroy_shader: u32,
+    pub destroy_pipeline: u32,
+    pub destroy_attachments: u32,
+    pub update_buffer: u32,
+    pub update_image: u32,
+    pub append_buffer: u32,
+    pub begin_pass: u32,
+    pub apply_viewport: u32,
+    pub apply_scissor_rect: u32,
+    pub apply_pipeline: u32,
+    pub apply_bindings: u32,
+    pub apply_uniforms: u32,
+    pub draw: u32,
+    pub end_pass: u32,
+    pub commit: u32,
+    pub alloc_buffer: u32,
+    pub alloc_image: u32,
+    pub alloc_sampler: u32,
+    pub alloc_shader: u32,
+    pub alloc_pipeline: u32,
+    pub alloc_attachments: u32,
+    pub dealloc_buffer: u32,
+    pub dealloc_image: u32,
+    pub dealloc_sampler: u32,
+    pub dealloc_shader: u32,
+    pub dealloc_pipeline: u32,
+    pub dealloc_attachments: u32,
+    pub init_buffer: u32,
+    pub init_image: u32,
+    pub init_sampler: u32,
+    pub init_shader: u32,
+    pub init_pipeline: u32,
+    pub init_attachments: u32,
+    pub uninit_buffer: u32,
+    pub uninit_image: u32,
+    pub uninit_sampler: u32,
+    pub uninit_shader: u32,
+    pub uninit_pipeline: u32,
+    pub uninit_attachments: u32,
+    pub fail_buffer: u32,
+    pub fail_image: u32,
+    pub fail_sampler: u32,
+    pub fail_shader: u32,
+    pub fail_pipeline: u32,
+    pub fail_attachments: u32,
+    pub push_debug_group: u32,
+    pub pop_debug_group: u32,
+}
+
+/// A lightweight sokol-gfx call tracer which counts the calls of each traced
+/// function and measures the CPU time spent between `begin_pass()` and `end_pass()`.
+/// The previously installed trace hooks are called too. The sokol-gfx
+/// implementation must be compiled with `SOKOL_TRACE_HOOKS`.
+#[derive(Debug)]
+pub struct Tracer {
+    pub counts: TracerCounts,
+    pub pass_time: std::time::Duration,
+    pass_start: Option<std::time::Instant>,
+    prev_hooks: TraceHooks,
+}
+impl Default for Tracer {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+impl Tracer {
+    pub const fn new() -> Self {
+        Self {
+            counts: TracerCounts {
+                reset_state_cache: 0,
+                make_buffer: 0,
+                make_image: 0,
+                make_sampler: 0,
+                make_shader: 0,
+                make_pipeline: 0,
+                make_attachments: 0,
+                destroy_buffer: 0,
+                destroy_image: 0,
+                destroy_sampler: 0,
+                destroy_shader: 0,
+                destroy_pipeline: 0,
+                destroy_attachments: 0,
+                update_buffer: 0,
+                update_image: 0,
+                append_buffer: 0,
+                begin_pass: 0,
+                apply_viewport: 0,
+                apply_scissor_rect: 0,
+                apply_pipeline: 0,
+                apply_bindings: 0,
+                apply_uniforms: 0,
+                draw: 0,
+                end_pass: 0,
+                commit: 0,
+                alloc_buffer: 0,
+                alloc_image: 0,
+                alloc_sampler: 0,
+                alloc_shader: 0,
+                alloc_pipeline: 0,
+                alloc_attachments: 0,
+                dealloc_buffer: 0,
+                dealloc_image: 0,
+                dealloc_sampler: 0,
+                dealloc_shader: 0,
+                dealloc_pipeline: 0,
+                dealloc_attachments: 0,
+                init_buffer: 0,
+                init_image: 0,
+                init_sampler: 0,
+                init_shader: 0,
+                init_pipeline: 0,
+                init_attachments: 0,
+                uninit_buffer: 0,
+                uninit_image: 0,
+                uninit_sampler: 0,
+                uninit_shader: 0,
+                uninit_pipeline: 0,
+                uninit_attachments: 0,
+                fail_buffer: 0,
+                fail_image: 0,
+                fail_sampler: 0,
+                fail_shader: 0,
+                fail_pipeline: 0,
+                fail_attachments: 0,
+                push_debug_group: 0,
+                pop_debug_group: 0,
+            },
+            pass_time: std::time::Duration::ZERO,
+            pass_start: None,
+            prev_hooks: TraceHooks::new(),
+        }
+    }
+    /// Install the tracer
+    ///
+    /// # Safety
+    ///
+    /// The tracer must not be moved or dropped until `uninstall()` is called.
+    pub unsafe fn install(&mut self) {
+        self.prev_hooks = install_trace_hooks(&TraceHooks {
+            user_data: self as *mut Tracer as *mut core::ffi::c_void,
+            reset_state_cache: Some(Self::trace_reset_state_cache),
+            make_buffer: Some(Self::trace_make_buffer),
+            make_image: Some(Self::trace_make_image),
+            make_sampler: Some(Self::trace_make_sampler),
+            make_shader: Some(Self::trace_make_shader),
+            make_pipeline: Some(Self::trace_make_pipeline),
+            make_attachments: Some(Self::trace_make_attachments),
+            destroy_buffer: Some(Self::trace_destroy_buffer),
+            destroy_image: Some(Self::trace_destroy_image),
+            destroy_sampler: Some(Self::trace_destroy_sampler),
+            destroy_shader: Some(Self::trace_destroy_shader),
+            destroy_pipeline: Some(Self::trace_destroy_pipeline),
+            destroy_attachments: Some(Self::trace_destroy_attachments),
+            update_buffer: Some(Self::trace_update_buffer),
+            update_image: Some(Self::trace_update_image),
+            append_buffer: Some(Self::trace_append_buffer),
+            begin_pass: Some(Self::trace_begin_pass),
+            apply_viewport: Some(Self::trace_apply_viewport),
+            apply_scissor_rect: Some(Self::trace_apply_scissor_rect),
+            apply_pipeline: Some(Self::trace_apply_pipeline),
+            apply_bindings: Some(Self::trace_apply_bindings),
+            apply_uniforms: Some(Self::trace_apply_uniforms),
+            draw: Some(Self::trace_draw),
+            end_pass: Some(Self::trace_end_pass),
+            commit: Some(Self::trace_commit),
+            alloc_buffer: Some(Self::trace_alloc_buffer),
+            alloc_image: Some(Self::trace_alloc_image),
+            alloc_sampler: Some(Self::trace_alloc_sampler),
+            alloc_shader: Some(Self::trace_alloc_shader),
+            alloc_pipeline: Some(Self::trace_alloc_pipeline),
+            alloc_attachments: Some(Self::trace_alloc_attachments),
+            dealloc_buffer: Some(Self::trace_dealloc_buffer),
+            dealloc_image: Some(Self::trace_dealloc_image),
+            dealloc_sampler: Some(Self::trace_dealloc_sampler),
+            dealloc_shader: Some(Self::trace_dealloc_shader),
+            dealloc_pipeline: Some(Self::trace_dealloc_pipeline),
+            dealloc_attachments: Some(Self::trace_dealloc_attachments),
+            init_buffer: Some(Self::trace_init_buffer),
+            init_image: Some(Self::trace_init_image),
+            init_sampler: Some(Self::trace_init_sampler),
+            init_shader: Some(Self::trace_init_shader),
+            init_pipeline: Some(Self::trace_init_pipeline),
+            init_attachments: Some(Self::trace_init_attachments),
+            uninit_buffer: Some(Self::trace_uninit_buffer),
+            uninit_image: Some(Self::trace_uninit_image),
+            uninit_sampler: Some(Self::trace_uninit_sampler),
+            uninit_shader: Some(Self::trace_uninit_shader),
+            uninit_pipeline: Some(Self::trace_uninit_pipeline),
+            uninit_attachments: Some(Self::trace_uninit_attachments),
+            fail_buffer: Some(Self::trace_fail_buffer),
+            fail_image: Some(Self::trace_fail_image),
+            fail_sampler: Some(Self::trace_fail_sampler),
+            fail_shader: Some(Self::trace_fail_shader),
+            fail_pipeline: Some(Self::trace_fail_pipeline),
+            fail_attachments: Some(Self::trace_fail_attachments),
+            push_debug_group: Some(Self::trace_push_debug_group),
+            pop_debug_group: Some(Self::trace_pop_debug_group),
+        });
+    }
+    /// Restore the trace hooks which were installed before the tracer
+    pub fn uninstall(&mut self) {
+        install_trace_hooks(&self.prev_hooks);
+    }
+    /// Reset the counters and timings, for instance at the start of a frame
+    pub fn reset(&mut self) {
+        self.counts = TracerCounts::default();
+        self.pass_time = std::time::Duration::ZERO;
+    }
+    extern "C" fn trace_reset_state_cache(user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.reset_state_cache += 1;
+        if let Some(prev) = tracer.prev_hooks.reset_state_cache {
+            prev(tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_make_buffer(a0: *const BufferDesc, a1: Buffer, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.make_buffer += 1;
+        if let Some(prev) = tracer.prev_hooks.make_buffer {
+            prev(a0, a1, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_make_image(a0: *const ImageDesc, a1: Image, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.make_image += 1;
+        if let Some(prev) = tracer.prev_hooks.make_image {
+            prev(a0, a1, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_make_sampler(a0: *const SamplerDesc, a1: Sampler, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.make_sampler += 1;
+        if let Some(prev) = tracer.prev_hooks.make_sampler {
+            prev(a0, a1, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_make_shader(a0: *const ShaderDesc, a1: Shader, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.make_shader += 1;
+        if let Some(prev) = tracer.prev_hooks.make_shader {
+            prev(a0, a1, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_make_pipeline(a0: *const PipelineDesc, a1: Pipeline, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.make_pipeline += 1;
+        if let Some(prev) = tracer.prev_hooks.make_pipeline {
+            prev(a0, a1, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_make_attachments(a0: *const AttachmentsDesc, a1: Attachments, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.make_attachments += 1;
+        if let Some(prev) = tracer.prev_hooks.make_attachments {
+            prev(a0, a1, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_destroy_buffer(a0: Buffer, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.destroy_buffer += 1;
+        if let Some(prev) = tracer.prev_hooks.destroy_buffer {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_destroy_image(a0: Image, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.destroy_image += 1;
+        if let Some(prev) = tracer.prev_hooks.destroy_image {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_destroy_sampler(a0: Sampler, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.destroy_sampler += 1;
+        if let Some(prev) = tracer.prev_hooks.destroy_sampler {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_destroy_shader(a0: Shader, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.destroy_shader += 1;
+        if let Some(prev) = tracer.prev_hooks.destroy_shader {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_destroy_pipeline(a0: Pipeline, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.destroy_pipeline += 1;
+        if let Some(prev) = tracer.prev_hooks.destroy_pipeline {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_destroy_attachments(a0: Attachments, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.destroy_attachments += 1;
+        if let Some(prev) = tracer.prev_hooks.destroy_attachments {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_update_buffer(a0: Buffer, a1: *const Range, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.update_buffer += 1;
+        if let Some(prev) = tracer.prev_hooks.update_buffer {
+            prev(a0, a1, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_update_image(a0: Image, a1: *const ImageData, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.update_image += 1;
+        if let Some(prev) = tracer.prev_hooks.update_image {
+            prev(a0, a1, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_append_buffer(a0: Buffer, a1: *const Range, a2: i32, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.append_buffer += 1;
+        if let Some(prev) = tracer.prev_hooks.append_buffer {
+            prev(a0, a1, a2, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_begin_pass(a0: *const Pass, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.begin_pass += 1;
+        tracer.pass_start = Some(std::time::Instant::now());
+        if let Some(prev) = tracer.prev_hooks.begin_pass {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_apply_viewport(a0: i32, a1: i32, a2: i32, a3: i32, a4: bool, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.apply_viewport += 1;
+        if let Some(prev) = tracer.prev_hooks.apply_viewport {
+            prev(a0, a1, a2, a3, a4, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_apply_scissor_rect(a0: i32, a1: i32, a2: i32, a3: i32, a4: bool, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.apply_scissor_rect += 1;
+        if let Some(prev) = tracer.prev_hooks.apply_scissor_rect {
+            prev(a0, a1, a2, a3, a4, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_apply_pipeline(a0: Pipeline, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.apply_pipeline += 1;
+        if let Some(prev) = tracer.prev_hooks.apply_pipeline {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_apply_bindings(a0: *const Bindings, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.apply_bindings += 1;
+        if let Some(prev) = tracer.prev_hooks.apply_bindings {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_apply_uniforms(a0: i32, a1: *const Range, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.apply_uniforms += 1;
+        if let Some(prev) = tracer.prev_hooks.apply_uniforms {
+            prev(a0, a1, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_draw(a0: i32, a1: i32, a2: i32, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.draw += 1;
+        if let Some(prev) = tracer.prev_hooks.draw {
+            prev(a0, a1, a2, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_end_pass(user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.end_pass += 1;
+        if let Some(start) = tracer.pass_start.take() {
+            tracer.pass_time += start.elapsed();
+        }
+        if let Some(prev) = tracer.prev_hooks.end_pass {
+            prev(tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_commit(user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.commit += 1;
+        if let Some(prev) = tracer.prev_hooks.commit {
+            prev(tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_alloc_buffer(a0: Buffer, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.alloc_buffer += 1;
+        if let Some(prev) = tracer.prev_hooks.alloc_buffer {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_alloc_image(a0: Image, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.alloc_image += 1;
+        if let Some(prev) = tracer.prev_hooks.alloc_image {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_alloc_sampler(a0: Sampler, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.alloc_sampler += 1;
+        if let Some(prev) = tracer.prev_hooks.alloc_sampler {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_alloc_shader(a0: Shader, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.alloc_shader += 1;
+        if let Some(prev) = tracer.prev_hooks.alloc_shader {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_alloc_pipeline(a0: Pipeline, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.alloc_pipeline += 1;
+        if let Some(prev) = tracer.prev_hooks.alloc_pipeline {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_alloc_attachments(a0: Attachments, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.alloc_attachments += 1;
+        if let Some(prev) = tracer.prev_hooks.alloc_attachments {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_dealloc_buffer(a0: Buffer, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.dealloc_buffer += 1;
+        if let Some(prev) = tracer.prev_hooks.dealloc_buffer {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_dealloc_image(a0: Image, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.dealloc_image += 1;
+        if let Some(prev) = tracer.prev_hooks.dealloc_image {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_dealloc_sampler(a0: Sampler, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.dealloc_sampler += 1;
+        if let Some(prev) = tracer.prev_hooks.dealloc_sampler {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_dealloc_shader(a0: Shader, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.dealloc_shader += 1;
+        if let Some(prev) = tracer.prev_hooks.dealloc_shader {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_dealloc_pipeline(a0: Pipeline, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.dealloc_pipeline += 1;
+        if let Some(prev) = tracer.prev_hooks.dealloc_pipeline {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_dealloc_attachments(a0: Attachments, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.dealloc_attachments += 1;
+        if let Some(prev) = tracer.prev_hooks.dealloc_attachments {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_init_buffer(a0: Buffer, a1: *const BufferDesc, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.init_buffer += 1;
+        if let Some(prev) = tracer.prev_hooks.init_buffer {
+            prev(a0, a1, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_init_image(a0: Image, a1: *const ImageDesc, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.init_image += 1;
+        if let Some(prev) = tracer.prev_hooks.init_image {
+            prev(a0, a1, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_init_sampler(a0: Sampler, a1: *const SamplerDesc, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.init_sampler += 1;
+        if let Some(prev) = tracer.prev_hooks.init_sampler {
+            prev(a0, a1, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_init_shader(a0: Shader, a1: *const ShaderDesc, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.init_shader += 1;
+        if let Some(prev) = tracer.prev_hooks.init_shader {
+            prev(a0, a1, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_init_pipeline(a0: Pipeline, a1: *const PipelineDesc, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.init_pipeline += 1;
+        if let Some(prev) = tracer.prev_hooks.init_pipeline {
+            prev(a0, a1, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_init_attachments(a0: Attachments, a1: *const AttachmentsDesc, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.init_attachments += 1;
+        if let Some(prev) = tracer.prev_hooks.init_attachments {
+            prev(a0, a1, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_uninit_buffer(a0: Buffer, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.uninit_buffer += 1;
+        if let Some(prev) = tracer.prev_hooks.uninit_buffer {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_uninit_image(a0: Image, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.uninit_image += 1;
+        if let Some(prev) = tracer.prev_hooks.uninit_image {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_uninit_sampler(a0: Sampler, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.uninit_sampler += 1;
+        if let Some(prev) = tracer.prev_hooks.uninit_sampler {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_uninit_shader(a0: Shader, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.uninit_shader += 1;
+        if let Some(prev) = tracer.prev_hooks.uninit_shader {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_uninit_pipeline(a0: Pipeline, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.uninit_pipeline += 1;
+        if let Some(prev) = tracer.prev_hooks.uninit_pipeline {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_uninit_attachments(a0: Attachments, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.uninit_attachments += 1;
+        if let Some(prev) = tracer.prev_hooks.uninit_attachments {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_fail_buffer(a0: Buffer, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.fail_buffer += 1;
+        if let Some(prev) = tracer.prev_hooks.fail_buffer {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_fail_image(a0: Image, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.fail_image += 1;
+        if let Some(prev) = tracer.prev_hooks.fail_image {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_fail_sampler(a0: Sampler, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.fail_sampler += 1;
+        if let Some(prev) = tracer.prev_hooks.fail_sampler {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_fail_shader(a0: Shader, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.fail_shader += 1;
+        if let Some(prev) = tracer.prev_hooks.fail_shader {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_fail_pipeline(a0: Pipeline, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.fail_pipeline += 1;
+        if let Some(prev) = tracer.prev_hooks.fail_pipeline {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_fail_attachments(a0: Attachments, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.fail_attachments += 1;
+        if let Some(prev) = tracer.prev_hooks.fail_attachments {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_push_debug_group(a0: *const core::ffi::c_char, user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.push_debug_group += 1;
+        if let Some(prev) = tracer.prev_hooks.push_debug_group {
+            prev(a0, tracer.prev_hooks.user_data);
+        }
+    }
+    extern "C" fn trace_pop_debug_group(user_data: *mut core::ffi::c_void) {
+        let tracer = unsafe { &mut *(user_data as *mut Tracer) };
+        tracer.counts.pop_debug_group += 1;
+        if let Some(prev) = tracer.prev_hooks.pop_debug_group {
+            prev(tracer.prev_hooks.user_data);
+        }
+    }
+}
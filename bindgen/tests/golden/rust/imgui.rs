@@ -0,0 +1,355 @@
+//! To use this module, enable the feature "imgui"
+// machine generated, do not edit
+
+#![allow(dead_code)]
+#![allow(unused_imports)]
+
+use crate::gfx as sg;
+use crate::app as sapp;
+
+/// Helper function to convert a C string to a Rust string slice
+#[inline]
+fn c_char_ptr_to_rust_str(c_char_ptr: *const core::ffi::c_char) -> &'static str {
+    let c_str = unsafe { core::ffi::CStr::from_ptr(c_char_ptr) };
+    c_str.to_str().expect("c_char_ptr contained invalid Utf8 Data")
+}
+
+/// Helper function to convert a C string to a CStr, skips the UTF-8 validation
+#[inline]
+fn c_char_ptr_to_c_str(c_char_ptr: *const core::ffi::c_char) -> &'static core::ffi::CStr {
+    unsafe { core::ffi::CStr::from_ptr(c_char_ptr) }
+}
+
+/// Helper function to convert a C string to a Rust string slice without UTF-8 validation,
+/// the caller must guarantee that the C string is valid UTF-8
+#[inline]
+unsafe fn c_char_ptr_to_rust_str_unchecked(c_char_ptr: *const core::ffi::c_char) -> &'static str {
+    core::str::from_utf8_unchecked(core::ffi::CStr::from_ptr(c_char_ptr).to_bytes())
+}
+
+/// Helper function to pass a Rust string slice to C as a zero-terminated string,
+/// short strings are copied into a stack buffer instead of allocating a CString
+#[inline]
+fn with_c_str<R>(s: &str, f: impl FnOnce(*const core::ffi::c_char) -> R) -> R {
+    const STACK_BUF_SIZE: usize = 256;
+    let bytes = s.as_bytes();
+    if bytes.len() < STACK_BUF_SIZE && !bytes.contains(&0) {
+        let mut buf = [0u8; STACK_BUF_SIZE];
+        buf[..bytes.len()].copy_from_slice(bytes);
+        f(buf.as_ptr() as *const core::ffi::c_char)
+    } else {
+        let c_string = std::ffi::CString::new(s).unwrap();
+        f(c_string.as_ptr())
+    }
+}
+
+#[derive(Copy, Clone, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[repr(i32)]
+pub enum LogItem {
+    Ok,
+    MallocFailed,
+}
+impl LogItem {
+    pub const fn new() -> Self {
+        Self::Ok
+    }
+}
+impl Default for LogItem {
+    fn default() -> Self {
+        Self::Ok
+    }
+}
+/// simgui_allocator_t
+///
+/// Used in simgui_desc_t to provide custom memory-alloc and -free functions
+/// to sokol_imgui.h. If memory management should be overridden, both the
+/// alloc_fn and free_fn function must be provided (e.g. it's not valid to
+/// override one function but not the other).
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Allocator {
+    pub alloc_fn: Option<extern "C" fn(usize, *mut core::ffi::c_void) -> *mut core::ffi::c_void>,
+    pub free_fn: Option<extern "C" fn(*mut core::ffi::c_void, *mut core::ffi::c_void)>,
+    pub user_data: *mut core::ffi::c_void,
+}
+impl Allocator {
+    pub const fn new() -> Self {
+        Self {
+            alloc_fn: None,
+            free_fn: None,
+            user_data: core::ptr::null_mut(),
+        }
+    }
+}
+impl Default for Allocator {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+/// simgui_logger
+///
+/// Used in simgui_desc_t to provide a logging function. Please be aware
+/// that without logging function, sokol-imgui will be completely
+/// silent, e.g. it will not report errors, warnings and
+/// validation layer messages. For maximum error verbosity,
+/// compile in debug mode (e.g. NDEBUG *not* defined) and install
+/// a logger (for instance the standard logging function from sokol_log.h).
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Logger {
+    pub func: Option<extern "C" fn(*const core::ffi::c_char, u32, u32, *const core::ffi::c_char, u32, *const core::ffi::c_char, *mut core::ffi::c_void)>,
+    pub user_data: *mut core::ffi::c_void,
+}
+impl Logger {
+    pub const fn new() -> Self {
+        Self {
+            func: None,
+            user_data: core::ptr::null_mut(),
+        }
+    }
+}
+impl Default for Logger {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct Desc {
+    /// default: 65536
+    pub max_vertices: i32,
+    pub color_format: sg::PixelFormat,
+    pub depth_format: sg::PixelFormat,
+    pub sample_count: i32,
+    pub ini_filename: *const core::ffi::c_char,
+    pub no_default_font: bool,
+    /// if true, don't send Ctrl-V on EVENTTYPE_CLIPBOARD_PASTED
+    pub disable_paste_override: bool,
+    /// if true, don't control the mouse cursor type via sapp_set_mouse_cursor()
+    pub disable_set_mouse_cursor: bool,
+    /// if true, only resize edges from the bottom right corner
+    pub disable_windows_resize_from_edges: bool,
+    /// if true, alpha values get written into the framebuffer
+    pub write_alpha_channel: bool,
+    /// optional memory allocation overrides (default: malloc/free)
+    pub allocator: Allocator,
+    /// optional log function override
+    pub logger: Logger,
+}
+impl Desc {
+    pub const fn new() -> Self {
+        Self {
+            max_vertices: 0,
+            color_format: sg::PixelFormat::new(),
+            depth_format: sg::PixelFormat::new(),
+            sample_count: 0,
+            ini_filename: core::ptr::null(),
+            no_default_font: false,
+            disable_paste_override: false,
+            disable_set_mouse_cursor: false,
+            disable_windows_resize_from_edges: false,
+            write_alpha_channel: false,
+            allocator: Allocator::new(),
+            logger: Logger::new(),
+        }
+    }
+}
+impl Default for Desc {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FrameDesc {
+    pub width: i32,
+    pub height: i32,
+    pub delta_time: f64,
+    pub dpi_scale: f32,
+}
+impl FrameDesc {
+    pub const fn new() -> Self {
+        Self {
+            width: 0,
+            height: 0,
+            delta_time: 0.0,
+            dpi_scale: 0.0,
+        }
+    }
+}
+impl Default for FrameDesc {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+#[repr(C)]
+#[derive(Copy, Clone, Debug)]
+pub struct FontTexDesc {
+    pub min_filter: sg::Filter,
+    pub mag_filter: sg::Filter,
+}
+impl FontTexDesc {
+    pub const fn new() -> Self {
+        Self {
+            min_filter: sg::Filter::new(),
+            mag_filter: sg::Filter::new(),
+        }
+    }
+}
+impl Default for FontTexDesc {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+pub mod ffi {
+    #![allow(unused_imports)]
+    use super::*;
+    extern "C" {
+        pub fn simgui_setup(desc: *const Desc);
+        pub fn simgui_new_frame(desc: *const FrameDesc);
+        pub fn simgui_render();
+        pub fn simgui_imtextureid(img: sg::Image) -> u64;
+        pub fn simgui_imtextureid_with_sampler(img: sg::Image, smp: sg::Sampler) -> u64;
+        pub fn simgui_image_from_imtextureid(imtex_id: u64) -> sg::Image;
+        pub fn simgui_sampler_from_imtextureid(imtex_id: u64) -> sg::Sampler;
+        pub fn simgui_add_focus_event(focus: bool);
+        pub fn simgui_add_mouse_pos_event(x: f32, y: f32);
+        pub fn simgui_add_touch_pos_event(x: f32, y: f32);
+        pub fn simgui_add_mouse_button_event(mouse_button: i32, down: bool);
+        pub fn simgui_add_mouse_wheel_event(wheel_x: f32, wheel_y: f32);
+        pub fn simgui_add_input_character(c: u32);
+        pub fn simgui_add_input_characters_utf8(c: *const core::ffi::c_char);
+        pub fn simgui_add_touch_button_event(mouse_button: i32, down: bool);
+        pub fn simgui_handle_event(ev: *const sapp::Event) -> bool;
+        pub fn simgui_map_keycode(keycode: sapp::Keycode) -> i32;
+        pub fn simgui_shutdown();
+        pub fn simgui_create_fonts_texture(desc: *const FontTexDesc);
+        pub fn simgui_destroy_fonts_texture();
+    }
+}
+#[inline]
+pub fn setup(desc: &Desc) {
+    unsafe {
+        ffi::simgui_setup(desc)
+    }
+}
+#[inline]
+pub fn new_frame(desc: &FrameDesc) {
+    unsafe {
+        ffi::simgui_new_frame(desc)
+    }
+}
+#[inline]
+pub fn render() {
+    unsafe {
+        ffi::simgui_render()
+    }
+}
+#[inline]
+pub fn imtextureid(img: sg::Image) -> u64 {
+    unsafe {
+        ffi::simgui_imtextureid(img)
+    }
+}
+#[inline]
+pub fn imtextureid_with_sampler(img: sg::Image, smp: sg::Sampler) -> u64 {
+    unsafe {
+        ffi::simgui_imtextureid_with_sampler(img, smp)
+    }
+}
+#[inline]
+pub fn image_from_imtextureid(imtex_id: u64) -> sg::Image {
+    unsafe {
+        ffi::simgui_image_from_imtextureid(imtex_id)
+    }
+}
+#[inline]
+pub fn sampler_from_imtextureid(imtex_id: u64) -> sg::Sampler {
+    unsafe {
+        ffi::simgui_sampler_from_imtextureid(imtex_id)
+    }
+}
+#[inline]
+pub fn add_focus_event(focus: bool) {
+    unsafe {
+        ffi::simgui_add_focus_event(focus)
+    }
+}
+#[inline]
+pub fn add_mouse_pos_event(x: f32, y: f32) {
+    unsafe {
+        ffi::simgui_add_mouse_pos_event(x, y)
+    }
+}
+#[inline]
+pub fn add_touch_pos_event(x: f32, y: f32) {
+    unsafe {
+        ffi::simgui_add_touch_pos_event(x, y)
+    }
+}
+#[inline]
+pub fn add_mouse_button_event(mouse_button: i32, down: bool) {
+    unsafe {
+        ffi::simgui_add_mouse_button_event(mouse_button, down)
+    }
+}
+#[inline]
+pub fn add_mouse_wheel_event(wheel_x: f32, wheel_y: f32) {
+    unsafe {
+        ffi::simgui_add_mouse_wheel_event(wheel_x, wheel_y)
+    }
+}
+#[inline]
+pub fn add_input_character(c: u32) {
+    unsafe {
+        ffi::simgui_add_input_character(c)
+    }
+}
+#[inline]
+pub fn add_input_characters_utf8(c: &str) {
+    with_c_str(c, |tmp_0| unsafe {
+        ffi::simgui_add_input_characters_utf8(tmp_0)
+    })
+}
+#[inline]
+pub fn add_input_characters_utf8_cstr(c: &core::ffi::CStr) {
+    unsafe {
+        ffi::simgui_add_input_characters_utf8(c.as_ptr())
+    }
+}
+#[inline]
+pub fn add_touch_button_event(mouse_button: i32, down: bool) {
+    unsafe {
+        ffi::simgui_add_touch_button_event(mouse_button, down)
+    }
+}
+#[inline]
+pub fn handle_event(ev: &sapp::Event) -> bool {
+    unsafe {
+        ffi::simgui_handle_event(ev)
+    }
+}
+#[inline]
+pub fn map_keycode(keycode: sapp::Keycode) -> i32 {
+    unsafe {
+        ffi::simgui_map_keycode(keycode)
+    }
+}
+#[inline]
+pub fn shutdown() {
+    unsafe {
+        ffi::simgui_shutdown()
+    }
+}
+#[inline]
+pub fn create_fonts_texture(desc: &FontTexDesc) {
+    unsafe {
+        ffi::simgui_create_fonts_texture(desc)
+    }
+}
+#[inline]
+pub fn destroy_fonts_texture() {
+    unsafe {
+        ffi::simgui_destroy_fonts_texture()
+    }
+}
@@ -0,0 +1,65 @@
+// machine generated, do not edit
+
+#![allow(dead_code)]
+#![allow(unused_imports)]
+
+
+/// Helper function to convert a C string to a Rust string slice
+#[inline]
+fn c_char_ptr_to_rust_str(c_char_ptr: *const core::ffi::c_char) -> &'static str {
+    let c_str = unsafe { core::ffi::CStr::from_ptr(c_char_ptr) };
+    c_str.to_str().expect("c_char_ptr contained invalid Utf8 Data")
+}
+
+/// Helper function to convert a C string to a CStr, skips the UTF-8 validation
+#[inline]
+fn c_char_ptr_to_c_str(c_char_ptr: *const core::ffi::c_char) -> &'static core::ffi::CStr {
+    unsafe { core::ffi::CStr::from_ptr(c_char_ptr) }
+}
+
+/// Helper function to convert a C string to a Rust string slice without UTF-8 validation,
+/// the caller must guarantee that the C string is valid UTF-8
+#[inline]
+unsafe fn c_char_ptr_to_rust_str_unchecked(c_char_ptr: *const core::ffi::c_char) -> &'static str {
+    core::str::from_utf8_unchecked(core::ffi::CStr::from_ptr(c_char_ptr).to_bytes())
+}
+
+/// Helper function to pass a Rust string slice to C as a zero-terminated string,
+/// short strings are copied into a stack buffer instead of allocating a CString
+#[inline]
+fn with_c_str<R>(s: &str, f: impl FnOnce(*const core::ffi::c_char) -> R) -> R {
+    const STACK_BUF_SIZE: usize = 256;
+    let bytes = s.as_bytes();
+    if bytes.len() < STACK_BUF_SIZE && !bytes.contains(&0) {
+        let mut buf = [0u8; STACK_BUF_SIZE];
+        buf[..bytes.len()].copy_from_slice(bytes);
+        f(buf.as_ptr() as *const core::ffi::c_char)
+    } else {
+        let c_string = std::ffi::CString::new(s).unwrap();
+        f(c_string.as_ptr())
+    }
+}
+
+pub mod ffi {
+    #![allow(unused_imports)]
+    use super::*;
+    extern "C" {
+        pub fn slog_func(tag: *const core::ffi::c_char, log_level: u32, log_item: u32, message: *const core::ffi::c_char, line_nr: u32, filename: *const core::ffi::c_char, user_data: *mut core::ffi::c_void);
+    }
+}
+/// ```text
+/// Plug this function into the 'logger.func' struct item when initializing any of the sokol
+/// headers. For instance for sokol_audio.h it would loom like this:
+///
+/// saudio_setup(&(saudio_desc){
+///     .logger = {
+///         .func = slog_func
+///     }
+/// });
+/// ```
+#[inline]
+pub extern "C" fn slog_func(tag: *const core::ffi::c_char, log_level: u32, log_item: u32, message: *const core::ffi::c_char, line_nr: u32, filename: *const core::ffi::c_char, user_data: *mut core::ffi::c_void) {
+    unsafe {
+        ffi::slog_func(tag, log_level, log_item, message, line_nr, filename, user_data)
+    }
+}
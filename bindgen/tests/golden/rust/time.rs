@@ -0,0 +1,118 @@
+// machine generated, do not edit
+
+#![allow(dead_code)]
+#![allow(unused_imports)]
+
+
+/// Helper function to convert a C string to a Rust string slice
+#[inline]
+fn c_char_ptr_to_rust_str(c_char_ptr: *const core::ffi::c_char) -> &'static str {
+    let c_str = unsafe { core::ffi::CStr::from_ptr(c_char_ptr) };
+    c_str.to_str().expect("c_char_ptr contained invalid Utf8 Data")
+}
+
+/// Helper function to convert a C string to a CStr, skips the UTF-8 validation
+#[inline]
+fn c_char_ptr_to_c_str(c_char_ptr: *const core::ffi::c_char) -> &'static core::ffi::CStr {
+    unsafe { core::ffi::CStr::from_ptr(c_char_ptr) }
+}
+
+/// Helper function to convert a C string to a Rust string slice without UTF-8 validation,
+/// the caller must guarantee that the C string is valid UTF-8
+#[inline]
+unsafe fn c_char_ptr_to_rust_str_unchecked(c_char_ptr: *const core::ffi::c_char) -> &'static str {
+    core::str::from_utf8_unchecked(core::ffi::CStr::from_ptr(c_char_ptr).to_bytes())
+}
+
+/// Helper function to pass a Rust string slice to C as a zero-terminated string,
+/// short strings are copied into a stack buffer instead of allocating a CString
+#[inline]
+fn with_c_str<R>(s: &str, f: impl FnOnce(*const core::ffi::c_char) -> R) -> R {
+    const STACK_BUF_SIZE: usize = 256;
+    let bytes = s.as_bytes();
+    if bytes.len() < STACK_BUF_SIZE && !bytes.contains(&0) {
+        let mut buf = [0u8; STACK_BUF_SIZE];
+        buf[..bytes.len()].copy_from_slice(bytes);
+        f(buf.as_ptr() as *const core::ffi::c_char)
+    } else {
+        let c_string = std::ffi::CString::new(s).unwrap();
+        f(c_string.as_ptr())
+    }
+}
+
+pub mod ffi {
+    #![allow(unused_imports)]
+    use super::*;
+    extern "C" {
+        pub fn stm_setup();
+        pub fn stm_now() -> u64;
+        pub fn stm_diff(new_ticks: u64, old_ticks: u64) -> u64;
+        pub fn stm_since(start_ticks: u64) -> u64;
+        pub fn stm_laptime(last_time: *mut u64) -> u64;
+        pub fn stm_round_to_common_refresh_rate(frame_ticks: u64) -> u64;
+        pub fn stm_sec(ticks: u64) -> f64;
+        pub fn stm_ms(ticks: u64) -> f64;
+        pub fn stm_us(ticks: u64) -> f64;
+        pub fn stm_ns(ticks: u64) -> f64;
+    }
+}
+#[inline]
+pub fn setup() {
+    unsafe {
+        ffi::stm_setup()
+    }
+}
+#[inline]
+pub fn now() -> u64 {
+    unsafe {
+        ffi::stm_now()
+    }
+}
+#[inline]
+pub fn diff(new_ticks: u64, old_ticks: u64) -> u64 {
+    unsafe {
+        ffi::stm_diff(new_ticks, old_ticks)
+    }
+}
+#[inline]
+pub fn since(start_ticks: u64) -> u64 {
+    unsafe {
+        ffi::stm_since(start_ticks)
+    }
+}
+#[inline]
+pub fn laptime(last_time: &mut u64) -> u64 {
+    unsafe {
+        ffi::stm_laptime(last_time)
+    }
+}
+#[inline]
+pub fn round_to_common_refresh_rate(frame_ticks: u64) -> u64 {
+    unsafe {
+        ffi::stm_round_to_common_refresh_rate(frame_ticks)
+    }
+}
+#[inline]
+pub fn sec(ticks: u64) -> f64 {
+    unsafe {
+        ffi::stm_sec(ticks)
+    }
+}
+#[inline]
+pub fn ms(ticks: u64) -> f64 {
+    unsafe {
+        ffi::stm_ms(ticks)
+    }
+}
+#[inline]
+pub fn us(ticks: u64) -> f64 {
+    unsafe {
+        ffi::stm_us(ticks)
+    }
+}
+#[inline]
+pub fn ns(ticks: u64) -> f64 {
+    unsafe {
+        ffi::stm_ns(ticks)
+    }
+}
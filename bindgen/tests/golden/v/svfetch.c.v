@@ -0,0 +1,189 @@
+// machine generated, do not edit
+
+module svfetch
+
+
+// helper functions
+// helper function to convert a C string to a vlang string slice
+fn vstring_to_cstring(v_str string) &u8 {
+    return v_str.str
+}
+// helper function to get a Range pointing into an array, without copying
+pub fn slice_as_range[T](data []T) Range {
+    return Range{
+        ptr: data.data
+        size: usize(data.len) * usize(sizeof(T))
+    }
+}
+// helper function to get a Range pointing to a single value or a fixed-size
+// array (e.g. `value_as_range(&vertices)`), without copying
+pub fn value_as_range[T](value &T) Range {
+    return Range{
+        ptr: voidptr(value)
+        size: usize(sizeof(T))
+    }
+}
+pub enum LogItem as u32 {
+    ok
+    malloc_failed
+    file_path_utf8_decoding_failed
+    send_queue_full
+    request_channel_index_too_big
+    request_path_is_null
+    request_path_too_long
+    request_callback_missing
+    request_chunk_size_greater_buffer_size
+    request_userdata_ptr_is_set_but_userdata_size_is_null
+    request_userdata_ptr_is_null_but_userdata_size_is_not
+    request_userdata_size_too_big
+    clamping_num_channels_to_max_channels
+    request_pool_exhausted
+}
+pub struct C.sfetch_logger_t {
+pub mut:
+    func  fn (&u8, u32, u32, &u8, u32, &u8, voidptr)  = unsafe { nil }
+    user_data  voidptr
+}
+pub type Logger = C.sfetch_logger_t
+
+pub struct C.sfetch_range_t {
+pub mut:
+    ptr  voidptr
+    size usize
+}
+pub type Range = C.sfetch_range_t
+
+pub struct C.sfetch_allocator_t {
+pub mut:
+    alloc_fn  fn (usize, voidptr) voidptr = unsafe { nil }
+    free_fn  fn (voidptr, voidptr)  = unsafe { nil }
+    user_data  voidptr
+}
+pub type Allocator = C.sfetch_allocator_t
+
+pub struct C.sfetch_desc_t {
+pub mut:
+    max_requests u32
+    num_channels u32
+    num_lanes u32
+    allocator Allocator
+    logger Logger
+}
+pub type Desc = C.sfetch_desc_t
+
+pub struct C.sfetch_handle_t {
+pub mut:
+    id u32
+}
+pub type Handle = C.sfetch_handle_t
+
+pub enum Error as u32 {
+    no_error
+    file_not_found
+    no_buffer
+    buffer_too_small
+    unexpected_eof
+    invalid_http_status
+    cancelled
+}
+pub struct C.sfetch_response_t {
+pub mut:
+    handle Handle
+    dispatched bool
+    fetched bool
+    paused bool
+    finished bool
+    failed bool
+    cancelled bool
+    error_code Error = .no_error
+    channel u32
+    lane u32
+    path &u8 = unsafe { nil }
+    user_data  voidptr
+    data_offset u32
+    data Range
+    buffer Range
+}
+pub type Response = C.sfetch_response_t
+
+pub struct C.sfetch_request_t {
+pub mut:
+    channel u32
+    path &u8 = unsafe { nil }
+    callback  fn (&Response)  = unsafe { nil }
+    chunk_size u32
+    buffer Range
+    user_data Range
+}
+pub type Request = C.sfetch_request_t
+
+fn C.sfetch_setup(&Desc) 
+@[inline]
+pub fn setup(desc &Desc) {
+    C.sfetch_setup(desc)
+}
+fn C.sfetch_shutdown() 
+@[inline]
+pub fn shutdown() {
+    C.sfetch_shutdown()
+}
+fn C.sfetch_valid() bool
+@[inline]
+pub fn valid() bool {
+    return C.sfetch_valid()
+}
+fn C.sfetch_desc() Desc
+@[inline]
+pub fn get_desc() Desc {
+    return C.sfetch_desc()
+}
+fn C.sfetch_max_userdata_bytes() int
+@[inline]
+pub fn max_userdata_bytes() int {
+    return C.sfetch_max_userdata_bytes()
+}
+fn C.sfetch_max_path() int
+@[inline]
+pub fn max_path() int {
+    return C.sfetch_max_path()
+}
+fn C.sfetch_send(&Request) Handle
+@[inline]
+pub fn send(request &Request) Handle {
+    return C.sfetch_send(request)
+}
+fn C.sfetch_handle_valid(Handle) bool
+@[inline]
+pub fn handle_valid(h Handle) bool {
+    return C.sfetch_handle_valid(h)
+}
+fn C.sfetch_dowork() 
+@[inline]
+pub fn dowork() {
+    C.sfetch_dowork()
+}
+fn C.sfetch_bind_buffer(Handle, Range) 
+@[inline]
+pub fn bind_buffer(h Handle, buffer Range) {
+    C.sfetch_bind_buffer(h, buffer)
+}
+fn C.sfetch_unbind_buffer(Handle) voidptr
+@[inline]
+pub fn unbind_buffer(h Handle) voidptr {
+    return C.sfetch_unbind_buffer(h)
+}
+fn C.sfetch_cancel(Handle) 
+@[inline]
+pub fn cancel(h Handle) {
+    C.sfetch_cancel(h)
+}
+fn C.sfetch_pause(Handle) 
+@[inline]
+pub fn pause(h Handle) {
+    C.sfetch_pause(h)
+}
+fn C.sfetch_continue(Handle) 
+@[inline]
+pub fn continue_fetching(h Handle) {
+    C.sfetch_continue(h)
+}
@@ -0,0 +1,822 @@
+// machine generated, do not edit
+
+const builtin = @import("builtin");
+
+// helper function to convert a C string to a Zig string slice
+fn cStrToZig(c_str: [*c]const u8) [:0]const u8 {
+    return @import("std").mem.span(c_str);
+}
+// compile-time check of a struct layout against the C struct layout, which
+// was evaluated by clang for a target with 8-byte pointers (checked
+// only on such targets)
+fn checkLayout(comptime T: type, comptime size: usize, comptime alignment: usize, comptime offsets: anytype) void {
+    if (@sizeOf(usize) != 8) return;
+    if (@sizeOf(T) != size or @alignOf(T) != alignment) {
+        @compileError("size or alignment of " ++ @typeName(T) ++ " doesn't match the C struct");
+    }
+    inline for (@import("std").meta.fields(@TypeOf(offsets))) |field| {
+        if (@offsetOf(T, field.name) != @field(offsets, field.name)) {
+            @compileError("offset of " ++ @typeName(T) ++ "." ++ field.name ++ " doesn't match the C struct");
+        }
+    }
+}
+// misc constants
+pub const max_touchpoints = 8;
+pub const max_mousebuttons = 3;
+pub const max_keycodes = 512;
+pub const max_iconimages = 8;
+/// sapp_event_type
+///
+/// The type of event that's passed to the event handler callback
+/// in the sapp_event.type field. These are not just "traditional"
+/// input events, but also notify the application about state changes
+/// or other user-invoked actions.
+pub const EventType = enum(i32) {
+    INVALID,
+    KEY_DOWN,
+    KEY_UP,
+    CHAR,
+    MOUSE_DOWN,
+    MOUSE_UP,
+    MOUSE_SCROLL,
+    MOUSE_MOVE,
+    MOUSE_ENTER,
+    MOUSE_LEAVE,
+    TOUCHES_BEGAN,
+    TOUCHES_MOVED,
+    TOUCHES_ENDED,
+    TOUCHES_CANCELLED,
+    RESIZED,
+    ICONIFIED,
+    RESTORED,
+    FOCUSED,
+    UNFOCUSED,
+    SUSPENDED,
+    RESUMED,
+    QUIT_REQUESTED,
+    CLIPBOARD_PASTED,
+    FILES_DROPPED,
+    NUM,
+};
+/// sapp_keycode
+///
+/// The 'virtual keycode' of a KEY_DOWN or KEY_UP event in the
+/// struct field sapp_event.key_code.
+///
+/// Note that the keycode values are identical with GLFW.
+pub const Keycode = enum(i32) {
+    INVALID = 0,
+    SPACE = 32,
+    APOSTROPHE = 39,
+    COMMA = 44,
+    MINUS = 45,
+    PERIOD = 46,
+    SLASH = 47,
+    _0 = 48,
+    _1 = 49,
+    _2 = 50,
+    _3 = 51,
+    _4 = 52,
+    _5 = 53,
+    _6 = 54,
+    _7 = 55,
+    _8 = 56,
+    _9 = 57,
+    SEMICOLON = 59,
+    EQUAL = 61,
+    A = 65,
+    B = 66,
+    C = 67,
+    D = 68,
+    E = 69,
+    F = 70,
+    G = 71,
+    H = 72,
+    I = 73,
+    J = 74,
+    K = 75,
+    L = 76,
+    M = 77,
+    N = 78,
+    O = 79,
+    P = 80,
+    Q = 81,
+    R = 82,
+    S = 83,
+    T = 84,
+    U = 85,
+    V = 86,
+    W = 87,
+    X = 88,
+    Y = 89,
+    Z = 90,
+    LEFT_BRACKET = 91,
+    BACKSLASH = 92,
+    RIGHT_BRACKET = 93,
+    GRAVE_ACCENT = 96,
+    WORLD_1 = 161,
+    WORLD_2 = 162,
+    ESCAPE = 256,
+    ENTER = 257,
+    TAB = 258,
+    BACKSPACE = 259,
+    INSERT = 260,
+    DELETE = 261,
+    RIGHT = 262,
+    LEFT = 263,
+    DOWN = 264,
+    UP = 265,
+    PAGE_UP = 266,
+    PAGE_DOWN = 267,
+    HOME = 268,
+    END = 269,
+    CAPS_LOCK = 280,
+    SCROLL_LOCK = 281,
+    NUM_LOCK = 282,
+    PRINT_SCREEN = 283,
+    PAUSE = 284,
+    F1 = 290,
+    F2 = 291,
+    F3 = 292,
+    F4 = 293,
+    F5 = 294,
+    F6 = 295,
+    F7 = 296,
+    F8 = 297,
+    F9 = 298,
+    F10 = 299,
+    F11 = 300,
+    F12 = 301,
+    F13 = 302,
+    F14 = 303,
+    F15 = 304,
+    F16 = 305,
+    F17 = 306,
+    F18 = 307,
+    F19 = 308,
+    F20 = 309,
+    F21 = 310,
+    F22 = 311,
+    F23 = 312,
+    F24 = 313,
+    F25 = 314,
+    KP_0 = 320,
+    KP_1 = 321,
+    KP_2 = 322,
+    KP_3 = 323,
+    KP_4 = 324,
+    KP_5 = 325,
+    KP_6 = 326,
+    KP_7 = 327,
+    KP_8 = 328,
+    KP_9 = 329,
+    KP_DECIMAL = 330,
+    KP_DIVIDE = 331,
+    KP_MULTIPLY = 332,
+    KP_SUBTRACT = 333,
+    KP_ADD = 334,
+    KP_ENTER = 335,
+    KP_EQUAL = 336,
+    LEFT_SHIFT = 340,
+    LEFT_CONTROL = 341,
+    LEFT_ALT = 342,
+    LEFT_SUPER = 343,
+    RIGHT_SHIFT = 344,
+    RIGHT_CONTROL = 345,
+    RIGHT_ALT = 346,
+    RIGHT_SUPER = 347,
+    MENU = 348,
+};
+/// Android specific 'tool type' enum for touch events. This lets the
+/// application check what type of input device was used for
+/// touch events.
+///
+/// NOTE: the values must remain in sync with the corresponding
+/// Android SDK type, so don't change those.
+///
+/// See https://developer.android.com/reference/android/view/MotionEvent#TOOL_TYPE_UNKNOWN
+pub const AndroidTooltype = enum(i32) {
+    /// TOOL_TYPE_UNKNOWN
+    UNKNOWN = 0,
+    /// TOOL_TYPE_FINGER
+    FINGER = 1,
+    /// TOOL_TYPE_STYLUS
+    STYLUS = 2,
+    /// TOOL_TYPE_MOUSE
+    MOUSE = 3,
+};
+/// sapp_touchpoint
+///
+/// Describes a single touchpoint in a multitouch event (TOUCHES_BEGAN,
+/// TOUCHES_MOVED, TOUCHES_ENDED).
+///
+/// Touch points are stored in the nested array sapp_event.touches[],
+/// and the number of touches is stored in sapp_event.num_touches.
+pub const Touchpoint = extern struct {
+    identifier: usize = 0,
+    pos_x: f32 = 0.0,
+    pos_y: f32 = 0.0,
+    /// only valid on Android
+    android_tooltype: AndroidTooltype = .UNKNOWN,
+    changed: bool = false,
+};
+comptime {
+    checkLayout(Touchpoint, 24, 8, .{ .identifier = 0, .pos_x = 8, .pos_y = 12, .android_tooltype = 16, .changed = 20 });
+}
+/// sapp_mousebutton
+///
+/// The currently pressed mouse button in the events MOUSE_DOWN
+/// and MOUSE_UP, stored in the struct field sapp_event.mouse_button.
+pub const Mousebutton = enum(i32) {
+    LEFT = 0,
+    RIGHT = 1,
+    MIDDLE = 2,
+    INVALID = 256,
+};
+// These are currently pressed modifier keys (and mouse buttons) which are
+// passed in the event struct field sapp_event.modifiers.
+/// left or right shift key
+pub const modifier_shift = 1;
+/// left or right control key
+pub const modifier_ctrl = 2;
+/// left or right alt key
+pub const modifier_alt = 4;
+/// left or right 'super' key
+pub const modifier_super = 8;
+/// left mouse button
+pub const modifier_lmb = 256;
+/// right mouse button
+pub const modifier_rmb = 512;
+/// middle mouse button
+pub const modifier_mmb = 1024;
+/// sapp_event
+///
+/// This is an all-in-one event struct passed to the event handler
+/// user callback function. Note that it depends on the event
+/// type what struct fields actually contain useful values, so you
+/// should first check the event type before reading other struct
+/// fields.
+pub const Event = extern struct {
+    /// current frame counter, always valid, useful for checking if two events were issued in the same frame
+    frame_count: u64 = 0,
+    /// the event type, always valid
+    type: EventType = .INVALID,
+    /// the virtual key code, only valid in KEY_UP, KEY_DOWN
+    key_code: Keycode = .INVALID,
+    /// the UTF-32 character code, only valid in CHAR events
+    char_code: u32 = 0,
+    /// true if this is a key-repeat event, valid in KEY_UP, KEY_DOWN and CHAR
+    key_repeat: bool = false,
+    /// current modifier keys, valid in all key-, char- and mouse-events
+    modifiers: u32 = 0,
+    /// mouse button that was pressed or released, valid in MOUSE_DOWN, MOUSE_UP
+    mouse_button: Mousebutton = .LEFT,
+    /// current horizontal mouse position in pixels, always valid except during mouse lock
+    mouse_x: f32 = 0.0,
+    /// current vertical mouse position in pixels, always valid except during mouse lock
+    mouse_y: f32 = 0.0,
+    /// relative horizontal mouse movement since last frame, always valid
+    mouse_dx: f32 = 0.0,
+    /// relative vertical mouse movement since last frame, always valid
+    mouse_dy: f32 = 0.0,
+    /// horizontal mouse wheel scroll distance, valid in MOUSE_SCROLL events
+    scroll_x: f32 = 0.0,
+    /// vertical mouse wheel scroll distance, valid in MOUSE_SCROLL events
+    scroll_y: f32 = 0.0,
+    /// number of valid items in the touches[] array
+    num_touches: i32 = 0,
+    /// current touch points, valid in TOUCHES_BEGIN, TOUCHES_MOVED, TOUCHES_ENDED
+    touches: [8]Touchpoint = @import("std").mem.zeroes([8]Touchpoint),
+    /// current window- and framebuffer sizes in pixels, always valid
+    window_width: i32 = 0,
+    window_height: i32 = 0,
+    /// = window_width * dpi_scale
+    framebuffer_width: i32 = 0,
+    /// = window_height * dpi_scale
+    framebuffer_height: i32 = 0,
+};
+comptime {
+    checkLayout(Event, 272, 8, .{ .frame_count = 0, .type = 8, .key_code = 12, .char_code = 16, .key_repeat = 20, .modifiers = 24, .mouse_button = 28, .mouse_x = 32, .mouse_y = 36, .mouse_dx = 40, .mouse_dy = 44, .scroll_x = 48, .scroll_y = 52, .num_touches = 56, .touches = 64, .window_width = 256, .window_height = 260, .framebuffer_width = 264, .framebuffer_height = 268 });
+}
+/// sg_range
+///
+/// A general pointer/size-pair struct and constructor macros for passing binary blobs
+/// into sokol_app.h.
+pub const Range = extern struct {
+    ptr: ?*const anyopaque = null,
+    size: usize = 0,
+};
+comptime {
+    checkLayout(Range, 16, 8, .{ .ptr = 0, .size = 8 });
+}
+/// sapp_image_desc
+///
+/// This is used to describe image data to sokol_app.h (at first, window
+/// icons, later maybe cursor images).
+///
+/// Note that the actual image pixel format depends on the use case:
+///
+/// - window icon pixels are RGBA8
+pub const ImageDesc = extern struct {
+    width: i32 = 0,
+    height: i32 = 0,
+    pixels: Range = .{},
+};
+comptime {
+    checkLayout(ImageDesc, 24, 8, .{ .width = 0, .height = 4, .pixels = 8 });
+}
+/// sapp_icon_desc
+///
+/// An icon description structure for use in sapp_desc.icon and
+/// sapp_set_icon().
+///
+/// When setting a custom image, the application can provide a number of
+/// candidates differing in size, and sokol_app.h will pick the image(s)
+/// closest to the size expected by the platform's window system.
+///
+/// To set sokol-app's default icon, set .sokol_default to true.
+///
+/// Otherwise provide candidate images of different sizes in the
+/// images[] array.
+///
+/// If both the sokol_default flag is set to true, any image candidates
+/// will be ignored and the sokol_app.h default icon will be set.
+pub const IconDesc = extern struct {
+    sokol_default: bool = false,
+    images: [8]ImageDesc = @import("std").mem.zeroes([8]ImageDesc),
+};
+comptime {
+    checkLayout(IconDesc, 200, 8, .{ .sokol_default = 0, .images = 8 });
+}
+/// sapp_allocator
+///
+/// Used in sapp_desc to provide custom memory-alloc and -free functions
+/// to sokol_app.h. If memory management should be overridden, both the
+/// alloc_fn and free_fn function must be provided (e.g. it's not valid to
+/// override one function but not the other).
+pub const Allocator = extern struct {
+    alloc_fn: ?*const fn (usize, ?*anyopaque) callconv(.C) ?*anyopaque = null,
+    free_fn: ?*const fn (?*anyopaque, ?*anyopaque) callconv(.C) void = null,
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(Allocator, 24, 8, .{ .alloc_fn = 0, .free_fn = 8, .user_data = 16 });
+}
+pub const LogItem = enum(i32) {
+    OK,
+    MALLOC_FAILED,
+    MACOS_INVALID_NSOPENGL_PROFILE,
+    WIN32_LOAD_OPENGL32_DLL_FAILED,
+    WIN32_CREATE_HELPER_WINDOW_FAILED,
+    WIN32_HELPER_WINDOW_GETDC_FAILED,
+    WIN32_DUMMY_CONTEXT_SET_PIXELFORMAT_FAILED,
+    WIN32_CREATE_DUMMY_CONTEXT_FAILED,
+    WIN32_DUMMY_CONTEXT_MAKE_CURRENT_FAILED,
+    WIN32_GET_PIXELFORMAT_ATTRIB_FAILED,
+    WIN32_WGL_FIND_PIXELFORMAT_FAILED,
+    WIN32_WGL_DESCRIBE_PIXELFORMAT_FAILED,
+    WIN32_WGL_SET_PIXELFORMAT_FAILED,
+    WIN32_WGL_ARB_CREATE_CONTEXT_REQUIRED,
+    WIN32_WGL_ARB_CREATE_CONTEXT_PROFILE_REQUIRED,
+    WIN32_WGL_OPENGL_VERSION_NOT_SUPPORTED,
+    WIN32_WGL_OPENGL_PROFILE_NOT_SUPPORTED,
+    WIN32_WGL_INCOMPATIBLE_DEVICE_CONTEXT,
+    WIN32_WGL_CREATE_CONTEXT_ATTRIBS_FAILED_OTHER,
+    WIN32_D3D11_CREATE_DEVICE_AND_SWAPCHAIN_WITH_DEBUG_FAILED,
+    WIN32_D3D11_GET_IDXGIFACTORY_FAILED,
+    WIN32_D3D11_GET_IDXGIADAPTER_FAILED,
+    WIN32_D3D11_QUERY_INTERFACE_IDXGIDEVICE1_FAILED,
+    WIN32_REGISTER_RAW_INPUT_DEVICES_FAILED_MOUSE_LOCK,
+    WIN32_REGISTER_RAW_INPUT_DEVICES_FAILED_MOUSE_UNLOCK,
+    WIN32_GET_RAW_INPUT_DATA_FAILED,
+    LINUX_GLX_LOAD_LIBGL_FAILED,
+    LINUX_GLX_LOAD_ENTRY_POINTS_FAILED,
+    LINUX_GLX_EXTENSION_NOT_FOUND,
+    LINUX_GLX_QUERY_VERSION_FAILED,
+    LINUX_GLX_VERSION_TOO_LOW,
+    LINUX_GLX_NO_GLXFBCONFIGS,
+    LINUX_GLX_NO_SUITABLE_GLXFBCONFIG,
+    LINUX_GLX_GET_VISUAL_FROM_FBCONFIG_FAILED,
+    LINUX_GLX_REQUIRED_EXTENSIONS_MISSING,
+    LINUX_GLX_CREATE_CONTEXT_FAILED,
+    LINUX_GLX_CREATE_WINDOW_FAILED,
+    LINUX_X11_CREATE_WINDOW_FAILED,
+    LINUX_EGL_BIND_OPENGL_API_FAILED,
+    LINUX_EGL_BIND_OPENGL_ES_API_FAILED,
+    LINUX_EGL_GET_DISPLAY_FAILED,
+    LINUX_EGL_INITIALIZE_FAILED,
+    LINUX_EGL_NO_CONFIGS,
+    LINUX_EGL_NO_NATIVE_VISUAL,
+    LINUX_EGL_GET_VISUAL_INFO_FAILED,
+    LINUX_EGL_CREATE_WINDOW_SURFACE_FAILED,
+    LINUX_EGL_CREATE_CONTEXT_FAILED,
+    LINUX_EGL_MAKE_CURRENT_FAILED,
+    LINUX_X11_OPEN_DISPLAY_FAILED,
+    LINUX_X11_QUERY_SYSTEM_DPI_FAILED,
+    LINUX_X11_DROPPED_FILE_URI_WRONG_SCHEME,
+    LINUX_X11_FAILED_TO_BECOME_OWNER_OF_CLIPBOARD,
+    ANDROID_UNSUPPORTED_INPUT_EVENT_INPUT_CB,
+    ANDROID_UNSUPPORTED_INPUT_EVENT_MAIN_CB,
+    ANDROID_READ_MSG_FAILED,
+    ANDROID_WRITE_MSG_FAILED,
+    ANDROID_MSG_CREATE,
+    ANDROID_MSG_RESUME,
+    ANDROID_MSG_PAUSE,
+    ANDROID_MSG_FOCUS,
+    ANDROID_MSG_NO_FOCUS,
+    ANDROID_MSG_SET_NATIVE_WINDOW,
+    ANDROID_MSG_SET_INPUT_QUEUE,
+    ANDROID_MSG_DESTROY,
+    ANDROID_UNKNOWN_MSG,
+    ANDROID_LOOP_THREAD_STARTED,
+    ANDROID_LOOP_THREAD_DONE,
+    ANDROID_NATIVE_ACTIVITY_ONSTART,
+    ANDROID_NATIVE_ACTIVITY_ONRESUME,
+    ANDROID_NATIVE_ACTIVITY_ONSAVEINSTANCESTATE,
+    ANDROID_NATIVE_ACTIVITY_ONWINDOWFOCUSCHANGED,
+    ANDROID_NATIVE_ACTIVITY_ONPAUSE,
+    ANDROID_NATIVE_ACTIVITY_ONSTOP,
+    ANDROID_NATIVE_ACTIVITY_ONNATIVEWINDOWCREATED,
+    ANDROID_NATIVE_ACTIVITY_ONNATIVEWINDOWDESTROYED,
+    ANDROID_NATIVE_ACTIVITY_ONINPUTQUEUECREATED,
+    ANDROID_NATIVE_ACTIVITY_ONINPUTQUEUEDESTROYED,
+    ANDROID_NATIVE_ACTIVITY_ONCONFIGURATIONCHANGED,
+    ANDROID_NATIVE_ACTIVITY_ONLOWMEMORY,
+    ANDROID_NATIVE_ACTIVITY_ONDESTROY,
+    ANDROID_NATIVE_ACTIVITY_DONE,
+    ANDROID_NATIVE_ACTIVITY_ONCREATE,
+    ANDROID_CREATE_THREAD_PIPE_FAILED,
+    ANDROID_NATIVE_ACTIVITY_CREATE_SUCCESS,
+    WGPU_SWAPCHAIN_CREATE_SURFACE_FAILED,
+    WGPU_SWAPCHAIN_CREATE_SWAPCHAIN_FAILED,
+    WGPU_SWAPCHAIN_CREATE_DEPTH_STENCIL_TEXTURE_FAILED,
+    WGPU_SWAPCHAIN_CREATE_DEPTH_STENCIL_VIEW_FAILED,
+    WGPU_SWAPCHAIN_CREATE_MSAA_TEXTURE_FAILED,
+    WGPU_SWAPCHAIN_CREATE_MSAA_VIEW_FAILED,
+    WGPU_REQUEST_DEVICE_STATUS_ERROR,
+    WGPU_REQUEST_DEVICE_STATUS_UNKNOWN,
+    WGPU_REQUEST_ADAPTER_STATUS_UNAVAILABLE,
+    WGPU_REQUEST_ADAPTER_STATUS_ERROR,
+    WGPU_REQUEST_ADAPTER_STATUS_UNKNOWN,
+    WGPU_CREATE_INSTANCE_FAILED,
+    IMAGE_DATA_SIZE_MISMATCH,
+    DROPPED_FILE_PATH_TOO_LONG,
+    CLIPBOARD_STRING_TOO_BIG,
+};
+/// sapp_logger
+///
+/// Used in sapp_desc to provide a logging function. Please be aware that
+/// without logging function, sokol-app will be completely silent, e.g. it will
+/// not report errors or warnings. For maximum error verbosity, compile in
+/// debug mode (e.g. NDEBUG *not* defined) and install a logger (for instance
+/// the standard logging function from sokol_log.h).
+pub const Logger = extern struct {
+    func: ?*const fn ([*c]const u8, u32, u32, [*c]const u8, u32, [*c]const u8, ?*anyopaque) callconv(.C) void = null,
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(Logger, 16, 8, .{ .func = 0, .user_data = 8 });
+}
+pub const Desc = extern struct {
+    /// these are the user-provided callbacks without user data
+    init_cb: ?*const fn () callconv(.C) void = null,
+    frame_cb: ?*const fn () callconv(.C) void = null,
+    cleanup_cb: ?*const fn () callconv(.C) void = null,
+    event_cb: ?*const fn ([*c]const Event) callconv(.C) void = null,
+    /// these are the user-provided callbacks with user data
+    user_data: ?*anyopaque = null,
+    init_userdata_cb: ?*const fn (?*anyopaque) callconv(.C) void = null,
+    frame_userdata_cb: ?*const fn (?*anyopaque) callconv(.C) void = null,
+    cleanup_userdata_cb: ?*const fn (?*anyopaque) callconv(.C) void = null,
+    event_userdata_cb: ?*const fn ([*c]const Event, ?*anyopaque) callconv(.C) void = null,
+    /// the preferred width of the window / canvas
+    width: i32 = 0,
+    /// the preferred height of the window / canvas
+    height: i32 = 0,
+    /// MSAA sample count
+    sample_count: i32 = 0,
+    /// the preferred swap interval (ignored on some platforms)
+    swap_interval: i32 = 0,
+    /// whether the rendering canvas is full-resolution on HighDPI displays
+    high_dpi: bool = false,
+    /// whether the window should be created in fullscreen mode
+    fullscreen: bool = false,
+    /// whether the framebuffer should have an alpha channel (ignored on some platforms)
+    alpha: bool = false,
+    /// the window title as UTF-8 encoded string
+    window_title: [*c]const u8 = null,
+    /// enable clipboard access, default is false
+    enable_clipboard: bool = false,
+    /// max size of clipboard content in bytes
+    clipboard_size: i32 = 0,
+    /// enable file dropping (drag'n'drop), default is false
+    enable_dragndrop: bool = false,
+    /// max number of dropped files to process (default: 1)
+    max_dropped_files: i32 = 0,
+    /// max length in bytes of a dropped UTF-8 file path (default: 2048)
+    max_dropped_file_path_length: i32 = 0,
+    /// the initial window icon to set
+    icon: IconDesc = .{},
+    /// optional memory allocation overrides (default: malloc/free)
+    allocator: Allocator = .{},
+    /// logging callback override (default: NO LOGGING!)
+    logger: Logger = .{},
+    /// override GL major and minor version (the default GL version is 4.1 on macOS, 4.3 elsewhere)
+    gl_major_version: i32 = 0,
+    gl_minor_version: i32 = 0,
+    /// if true, set the output console codepage to UTF-8
+    win32_console_utf8: bool = false,
+    /// if true, attach stdout/stderr to a new console window
+    win32_console_create: bool = false,
+    /// if true, attach stdout/stderr to parent process
+    win32_console_attach: bool = false,
+    /// css selector of the HTML5 canvas element, default is "#canvas"
+    html5_canvas_selector: [*c]const u8 = null,
+    /// if true, the HTML5 canvas size is set to sapp_desc.width/height, otherwise canvas size is tracked
+    html5_canvas_resize: bool = false,
+    /// HTML5 only: whether to preserve default framebuffer content between frames
+    html5_preserve_drawing_buffer: bool = false,
+    /// HTML5 only: whether the rendered pixels use premultiplied alpha convention
+    html5_premultiplied_alpha: bool = false,
+    /// initial state of the internal html5_ask_leave_site flag (see sapp_html5_ask_leave_site())
+    html5_ask_leave_site: bool = false,
+    /// if true, mouse events will bubble up to the web page
+    html5_bubble_mouse_events: bool = false,
+    /// same for touch events
+    html5_bubble_touch_events: bool = false,
+    /// same for wheel events
+    html5_bubble_wheel_events: bool = false,
+    /// if true, bubble up *all* key events to browser, not just key events that represent characters
+    html5_bubble_key_events: bool = false,
+    /// if true, bubble up character events to browser
+    html5_bubble_char_events: bool = false,
+    /// if true, use emscripten_set_main_loop() instead of emscripten_request_animation_frame_loop()
+    html5_use_emsc_set_main_loop: bool = false,
+    /// this will be passed as the simulate_infinite_loop arg to emscripten_set_main_loop()
+    html5_emsc_set_main_loop_simulate_infinite_loop: bool = false,
+    /// if true, showing the iOS keyboard shrinks the canvas
+    ios_keyboard_resizes_canvas: bool = false,
+};
+comptime {
+    checkLayout(Desc, 408, 8, .{ .init_cb = 0, .frame_cb = 8, .cleanup_cb = 16, .event_cb = 24, .user_data = 32, .init_userdata_cb = 40, .frame_userdata_cb = 48, .cleanup_userdata_cb = 56, .event_userdata_cb = 64, .width = 72, .height = 76, .sample_count = 80, .swap_interval = 84, .high_dpi = 88, .fullscreen = 89, .alpha = 90, .window_title = 96, .enable_clipboard = 104, .clipboard_size = 108, .enable_dragndrop = 112, .max_dropped_files = 116, .max_dropped_file_path_length = 120, .icon = 128, .allocator = 328, .logger = 352, .gl_major_version = 368, .gl_minor_version = 372, .win32_console_utf8 = 376, .win32_console_create = 377, .win32_console_attach = 378, .html5_canvas_selector = 384, .html5_canvas_resize = 392, .html5_preserve_drawing_buffer = 393, .html5_premultiplied_alpha = 394, .html5_ask_leave_site = 395, .html5_bubble_mouse_events = 396, .html5_bubble_touch_events = 397, .html5_bubble_wheel_events = 398, .html5_bubble_key_events = 399, .html5_bubble_char_events = 400, .html5_use_emsc_set_main_loop = 401, .html5_emsc_set_main_loop_simulate_infinite_loop = 402, .ios_keyboard_resizes_canvas = 403 });
+}
+/// HTML5 specific: request and response structs for
+///   asynchronously loading dropped-file content.
+pub const Html5FetchError = enum(i32) {
+    FETCH_ERROR_NO_ERROR,
+    FETCH_ERROR_BUFFER_TOO_SMALL,
+    FETCH_ERROR_OTHER,
+};
+pub const Html5FetchResponse = extern struct {
+    /// true if the loading operation has succeeded
+    succeeded: bool = false,
+    error_code: Html5FetchError = .FETCH_ERROR_NO_ERROR,
+    /// index of the dropped file (0..sapp_get_num_dropped_filed()-1)
+    file_index: i32 = 0,
+    /// pointer and size of the fetched data (data.ptr == buffer.ptr, data.size <= buffer.size)
+    data: Range = .{},
+    /// the user-provided buffer ptr/size pair (buffer.ptr == data.ptr, buffer.size >= data.size)
+    buffer: Range = .{},
+    /// user-provided user data pointer
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(Html5FetchResponse, 56, 8, .{ .succeeded = 0, .error_code = 4, .file_index = 8, .data = 16, .buffer = 32, .user_data = 48 });
+}
+pub const Html5FetchRequest = extern struct {
+    /// 0..sapp_get_num_dropped_files()-1
+    dropped_file_index: i32 = 0,
+    /// response callback function pointer (required)
+    callback: ?*const fn ([*c]const Html5FetchResponse) callconv(.C) void = null,
+    /// ptr/size of a memory buffer to load the data into
+    buffer: Range = .{},
+    /// optional userdata pointer
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(Html5FetchRequest, 40, 8, .{ .dropped_file_index = 0, .callback = 8, .buffer = 16, .user_data = 32 });
+}
+/// sapp_mouse_cursor
+///
+/// Predefined cursor image definitions, set with sapp_set_mouse_cursor(sapp_mouse_cursor cursor)
+pub const MouseCursor = enum(i32) {
+    /// equivalent with system default cursor
+    DEFAULT = 0,
+    ARROW,
+    IBEAM,
+    CROSSHAIR,
+    POINTING_HAND,
+    RESIZE_EW,
+    RESIZE_NS,
+    RESIZE_NWSE,
+    RESIZE_NESW,
+    RESIZE_ALL,
+    NOT_ALLOWED,
+    NUM,
+};
+pub extern fn sapp_isvalid() bool;
+/// returns true after sokol-app has been initialized
+pub const isvalid = sapp_isvalid;
+pub extern fn sapp_width() i32;
+/// returns the current framebuffer width in pixels
+pub const width = sapp_width;
+pub extern fn sapp_widthf() f32;
+/// same as sapp_width(), but returns float
+pub const widthf = sapp_widthf;
+pub extern fn sapp_height() i32;
+/// returns the current framebuffer height in pixels
+pub const height = sapp_height;
+pub extern fn sapp_heightf() f32;
+/// same as sapp_height(), but returns float
+pub const heightf = sapp_heightf;
+pub extern fn sapp_color_format() i32;
+/// get default framebuffer color pixel format
+pub const colorFormat = sapp_color_format;
+pub extern fn sapp_depth_format() i32;
+/// get default framebuffer depth pixel format
+pub const depthFormat = sapp_depth_format;
+pub extern fn sapp_sample_count() i32;
+/// get default framebuffer sample count
+pub const sampleCount = sapp_sample_count;
+pub extern fn sapp_high_dpi() bool;
+/// returns true when high_dpi was requested and actually running in a high-dpi scenario
+pub const highDpi = sapp_high_dpi;
+pub extern fn sapp_dpi_scale() f32;
+/// returns the dpi scaling factor (window pixels to framebuffer pixels)
+pub const dpiScale = sapp_dpi_scale;
+pub extern fn sapp_show_keyboard(bool) void;
+/// show or hide the mobile device onscreen keyboard
+pub const showKeyboard = sapp_show_keyboard;
+pub extern fn sapp_keyboard_shown() bool;
+/// return true if the mobile device onscreen keyboard is currently shown
+pub const keyboardShown = sapp_keyboard_shown;
+pub extern fn sapp_is_fullscreen() bool;
+/// query fullscreen mode
+pub const isFullscreen = sapp_is_fullscreen;
+pub extern fn sapp_toggle_fullscreen() void;
+/// toggle fullscreen mode
+pub const toggleFullscreen = sapp_toggle_fullscreen;
+pub extern fn sapp_show_mouse(bool) void;
+/// show or hide the mouse cursor
+pub const showMouse = sapp_show_mouse;
+pub extern fn sapp_mouse_shown() bool;
+/// show or hide the mouse cursor
+pub const mouseShown = sapp_mouse_shown;
+pub extern fn sapp_lock_mouse(bool) void;
+/// enable/disable mouse-pointer-lock mode
+pub const lockMouse = sapp_lock_mouse;
+pub extern fn sapp_mouse_locked() bool;
+/// return true if in mouse-pointer-lock mode (this may toggle a few frames later)
+pub const mouseLocked = sapp_mouse_locked;
+pub extern fn sapp_set_mouse_cursor(MouseCursor) void;
+/// set mouse cursor type
+pub const setMouseCursor = sapp_set_mouse_cursor;
+pub extern fn sapp_get_mouse_cursor() MouseCursor;
+/// get current mouse cursor type
+pub const getMouseCursor = sapp_get_mouse_cursor;
+pub extern fn sapp_userdata() ?*anyopaque;
+/// return the userdata pointer optionally provided in sapp_desc
+pub const userdata = sapp_userdata;
+pub extern fn sapp_query_desc() Desc;
+/// return a copy of the sapp_desc structure
+pub const queryDesc = sapp_query_desc;
+pub extern fn sapp_request_quit() void;
+/// initiate a "soft quit" (sends SAPP_EVENTTYPE_QUIT_REQUESTED)
+pub const requestQuit = sapp_request_quit;
+pub extern fn sapp_cancel_quit() void;
+/// cancel a pending quit (when SAPP_EVENTTYPE_QUIT_REQUESTED has been received)
+pub const cancelQuit = sapp_cancel_quit;
+pub extern fn sapp_quit() void;
+/// initiate a "hard quit" (quit application without sending SAPP_EVENTTYPE_QUIT_REQUESTED)
+pub const quit = sapp_quit;
+pub extern fn sapp_consume_event() void;
+/// call from inside event callback to consume the current event (don't forward to platform)
+pub const consumeEvent = sapp_consume_event;
+pub extern fn sapp_frame_count() u64;
+/// get the current frame counter (for comparison with sapp_event.frame_count)
+pub const frameCount = sapp_frame_count;
+pub extern fn sapp_frame_duration() f64;
+/// get an averaged/smoothed frame duration in seconds
+pub const frameDuration = sapp_frame_duration;
+pub extern fn sapp_set_clipboard_string([*c]const u8) void;
+/// write string into clipboard
+pub fn setClipboardString(str: [:0]const u8) void {
+    sapp_set_clipboard_string(@ptrCast(str));
+}
+pub extern fn sapp_get_clipboard_string() [*c]const u8;
+/// read string from clipboard (usually during SAPP_EVENTTYPE_CLIPBOARD_PASTED)
+pub fn getClipboardString() [:0]const u8 {
+    return cStrToZig(sapp_get_clipboard_string());
+}
+pub extern fn sapp_set_window_title([*c]const u8) void;
+/// set the window title (only on desktop platforms)
+pub fn setWindowTitle(str: [:0]const u8) void {
+    sapp_set_window_title(@ptrCast(str));
+}
+pub extern fn sapp_set_icon([*c]const IconDesc) void;
+/// set the window icon (only on Windows and Linux)
+pub fn setIcon(icon_desc: IconDesc) void {
+    sapp_set_icon(&icon_desc);
+}
+pub fn setIconPtr(icon_desc: *const IconDesc) void {
+    sapp_set_icon(icon_desc);
+}
+pub extern fn sapp_get_num_dropped_files() i32;
+/// gets the total number of dropped files (after an SAPP_EVENTTYPE_FILES_DROPPED event)
+pub const getNumDroppedFiles = sapp_get_num_dropped_files;
+pub extern fn sapp_get_dropped_file_path(i32) [*c]const u8;
+/// gets the dropped file paths
+pub fn getDroppedFilePath(index: i32) [:0]const u8 {
+    return cStrToZig(sapp_get_dropped_file_path(index));
+}
+pub extern fn sapp_run([*c]const Desc) void;
+/// special run-function for SOKOL_NO_ENTRY (in standard mode this is an empty stub)
+pub fn run(desc: Desc) void {
+    sapp_run(&desc);
+}
+pub fn runPtr(desc: *const Desc) void {
+    sapp_run(desc);
+}
+pub extern fn sapp_egl_get_display() ?*const anyopaque;
+/// EGL: get EGLDisplay object
+pub const eglGetDisplay = sapp_egl_get_display;
+pub extern fn sapp_egl_get_context() ?*const anyopaque;
+/// EGL: get EGLContext object
+pub const eglGetContext = sapp_egl_get_context;
+pub extern fn sapp_html5_ask_leave_site(bool) void;
+/// HTML5: enable or disable the hardwired "Leave Site?" dialog box
+pub const html5AskLeaveSite = sapp_html5_ask_leave_site;
+pub extern fn sapp_html5_get_dropped_file_size(i32) u32;
+/// HTML5: get byte size of a dropped file
+pub const html5GetDroppedFileSize = sapp_html5_get_dropped_file_size;
+pub extern fn sapp_html5_fetch_dropped_file([*c]const Html5FetchRequest) void;
+/// HTML5: asynchronously load the content of a dropped file
+pub fn html5FetchDroppedFile(request: Html5FetchRequest) void {
+    sapp_html5_fetch_dropped_file(&request);
+}
+pub fn html5FetchDroppedFilePtr(request: *const Html5FetchRequest) void {
+    sapp_html5_fetch_dropped_file(request);
+}
+pub extern fn sapp_metal_get_device() ?*const anyopaque;
+/// Metal: get bridged pointer to Metal device object
+pub const metalGetDevice = sapp_metal_get_device;
+pub extern fn sapp_metal_get_current_drawable() ?*const anyopaque;
+/// Metal: get bridged pointer to MTKView's current drawable of type CAMetalDrawable
+pub const metalGetCurrentDrawable = sapp_metal_get_current_drawable;
+pub extern fn sapp_metal_get_depth_stencil_texture() ?*const anyopaque;
+/// Metal: get bridged pointer to MTKView's depth-stencil texture of type MTLTexture
+pub const metalGetDepthStencilTexture = sapp_metal_get_depth_stencil_texture;
+pub extern fn sapp_metal_get_msaa_color_texture() ?*const anyopaque;
+/// Metal: get bridged pointer to MTKView's msaa-color-texture of type MTLTexture (may be null)
+pub const metalGetMsaaColorTexture = sapp_metal_get_msaa_color_texture;
+pub extern fn sapp_macos_get_window() ?*const anyopaque;
+/// macOS: get bridged pointer to macOS NSWindow
+pub const macosGetWindow = sapp_macos_get_window;
+pub extern fn sapp_ios_get_window() ?*const anyopaque;
+/// iOS: get bridged pointer to iOS UIWindow
+pub const iosGetWindow = sapp_ios_get_window;
+pub extern fn sapp_d3d11_get_device() ?*const anyopaque;
+/// D3D11: get pointer to ID3D11Device object
+pub const d3d11GetDevice = sapp_d3d11_get_device;
+pub extern fn sapp_d3d11_get_device_context() ?*const anyopaque;
+/// D3D11: get pointer to ID3D11DeviceContext object
+pub const d3d11GetDeviceContext = sapp_d3d11_get_device_context;
+pub extern fn sapp_d3d11_get_swap_chain() ?*const anyopaque;
+/// D3D11: get pointer to IDXGISwapChain object
+pub const d3d11GetSwapChain = sapp_d3d11_get_swap_chain;
+pub extern fn sapp_d3d11_get_render_view() ?*const anyopaque;
+/// D3D11: get pointer to ID3D11RenderTargetView object for rendering
+pub const d3d11GetRenderView = sapp_d3d11_get_render_view;
+pub extern fn sapp_d3d11_get_resolve_view() ?*const anyopaque;
+/// D3D11: get pointer ID3D11RenderTargetView object for msaa-resolve (may return null)
+pub const d3d11GetResolveView = sapp_d3d11_get_resolve_view;
+pub extern fn sapp_d3d11_get_depth_stencil_view() ?*const anyopaque;
+/// D3D11: get pointer ID3D11DepthStencilView
+pub const d3d11GetDepthStencilView = sapp_d3d11_get_depth_stencil_view;
+pub extern fn sapp_win32_get_hwnd() ?*const anyopaque;
+/// Win32: get the HWND window handle
+pub const win32GetHwnd = sapp_win32_get_hwnd;
+pub extern fn sapp_wgpu_get_device() ?*const anyopaque;
+/// WebGPU: get WGPUDevice handle
+pub const wgpuGetDevice = sapp_wgpu_get_device;
+pub extern fn sapp_wgpu_get_render_view() ?*const anyopaque;
+/// WebGPU: get swapchain's WGPUTextureView handle for rendering
+pub const wgpuGetRenderView = sapp_wgpu_get_render_view;
+pub extern fn sapp_wgpu_get_resolve_view() ?*const anyopaque;
+/// WebGPU: get swapchain's MSAA-resolve WGPUTextureView (may return null)
+pub const wgpuGetResolveView = sapp_wgpu_get_resolve_view;
+pub extern fn sapp_wgpu_get_depth_stencil_view() ?*const anyopaque;
+/// WebGPU: get swapchain's WGPUTextureView for the depth-stencil surface
+pub const wgpuGetDepthStencilView = sapp_wgpu_get_depth_stencil_view;
+pub extern fn sapp_gl_get_framebuffer() u32;
+/// GL: get framebuffer object
+pub const glGetFramebuffer = sapp_gl_get_framebuffer;
+pub extern fn sapp_gl_get_major_version() i32;
+/// GL: get major version (only valid for desktop GL)
+pub const glGetMajorVersion = sapp_gl_get_major_version;
+pub extern fn sapp_gl_get_minor_version() i32;
+/// GL: get minor version (only valid for desktop GL)
+pub const glGetMinorVersion = sapp_gl_get_minor_version;
+pub extern fn sapp_android_get_native_activity() ?*const anyopaque;
+/// Android: get native activity handle
+pub const androidGetNativeActivity = sapp_android_get_native_activity;
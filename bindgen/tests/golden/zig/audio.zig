@@ -0,0 +1,150 @@
+// machine generated, do not edit
+
+const builtin = @import("builtin");
+
+// helper function to convert a C string to a Zig string slice
+fn cStrToZig(c_str: [*c]const u8) [:0]const u8 {
+    return @import("std").mem.span(c_str);
+}
+// compile-time check of a struct layout against the C struct layout, which
+// was evaluated by clang for a target with 8-byte pointers (checked
+// only on such targets)
+fn checkLayout(comptime T: type, comptime size: usize, comptime alignment: usize, comptime offsets: anytype) void {
+    if (@sizeOf(usize) != 8) return;
+    if (@sizeOf(T) != size or @alignOf(T) != alignment) {
+        @compileError("size or alignment of " ++ @typeName(T) ++ " doesn't match the C struct");
+    }
+    inline for (@import("std").meta.fields(@TypeOf(offsets))) |field| {
+        if (@offsetOf(T, field.name) != @field(offsets, field.name)) {
+            @compileError("offset of " ++ @typeName(T) ++ "." ++ field.name ++ " doesn't match the C struct");
+        }
+    }
+}
+pub const LogItem = enum(i32) {
+    OK,
+    MALLOC_FAILED,
+    ALSA_SND_PCM_OPEN_FAILED,
+    ALSA_FLOAT_SAMPLES_NOT_SUPPORTED,
+    ALSA_REQUESTED_BUFFER_SIZE_NOT_SUPPORTED,
+    ALSA_REQUESTED_CHANNEL_COUNT_NOT_SUPPORTED,
+    ALSA_SND_PCM_HW_PARAMS_SET_RATE_NEAR_FAILED,
+    ALSA_SND_PCM_HW_PARAMS_FAILED,
+    ALSA_PTHREAD_CREATE_FAILED,
+    WASAPI_CREATE_EVENT_FAILED,
+    WASAPI_CREATE_DEVICE_ENUMERATOR_FAILED,
+    WASAPI_GET_DEFAULT_AUDIO_ENDPOINT_FAILED,
+    WASAPI_DEVICE_ACTIVATE_FAILED,
+    WASAPI_AUDIO_CLIENT_INITIALIZE_FAILED,
+    WASAPI_AUDIO_CLIENT_GET_BUFFER_SIZE_FAILED,
+    WASAPI_AUDIO_CLIENT_GET_SERVICE_FAILED,
+    WASAPI_AUDIO_CLIENT_SET_EVENT_HANDLE_FAILED,
+    WASAPI_CREATE_THREAD_FAILED,
+    AAUDIO_STREAMBUILDER_OPEN_STREAM_FAILED,
+    AAUDIO_PTHREAD_CREATE_FAILED,
+    AAUDIO_RESTARTING_STREAM_AFTER_ERROR,
+    USING_AAUDIO_BACKEND,
+    AAUDIO_CREATE_STREAMBUILDER_FAILED,
+    USING_SLES_BACKEND,
+    SLES_CREATE_ENGINE_FAILED,
+    SLES_ENGINE_GET_ENGINE_INTERFACE_FAILED,
+    SLES_CREATE_OUTPUT_MIX_FAILED,
+    SLES_MIXER_GET_VOLUME_INTERFACE_FAILED,
+    SLES_ENGINE_CREATE_AUDIO_PLAYER_FAILED,
+    SLES_PLAYER_GET_PLAY_INTERFACE_FAILED,
+    SLES_PLAYER_GET_VOLUME_INTERFACE_FAILED,
+    SLES_PLAYER_GET_BUFFERQUEUE_INTERFACE_FAILED,
+    COREAUDIO_NEW_OUTPUT_FAILED,
+    COREAUDIO_ALLOCATE_BUFFER_FAILED,
+    COREAUDIO_START_FAILED,
+    BACKEND_BUFFER_SIZE_ISNT_MULTIPLE_OF_PACKET_SIZE,
+};
+/// saudio_logger
+///
+/// Used in saudio_desc to provide a custom logging and error reporting
+/// callback to sokol-audio.
+pub const Logger = extern struct {
+    func: ?*const fn ([*c]const u8, u32, u32, [*c]const u8, u32, [*c]const u8, ?*anyopaque) callconv(.C) void = null,
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(Logger, 16, 8, .{ .func = 0, .user_data = 8 });
+}
+/// saudio_allocator
+///
+/// Used in saudio_desc to provide custom memory-alloc and -free functions
+/// to sokol_audio.h. If memory management should be overridden, both the
+/// alloc_fn and free_fn function must be provided (e.g. it's not valid to
+/// override one function but not the other).
+pub const Allocator = extern struct {
+    alloc_fn: ?*const fn (usize, ?*anyopaque) callconv(.C) ?*anyopaque = null,
+    free_fn: ?*const fn (?*anyopaque, ?*anyopaque) callconv(.C) void = null,
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(Allocator, 24, 8, .{ .alloc_fn = 0, .free_fn = 8, .user_data = 16 });
+}
+pub const Desc = extern struct {
+    /// requested sample rate
+    sample_rate: i32 = 0,
+    /// number of channels, default: 1 (mono)
+    num_channels: i32 = 0,
+    /// number of frames in streaming buffer
+    buffer_frames: i32 = 0,
+    /// number of frames in a packet
+    packet_frames: i32 = 0,
+    /// number of packets in packet queue
+    num_packets: i32 = 0,
+    /// optional streaming callback (no user data)
+    stream_cb: ?*const fn ([*c]f32, i32, i32) callconv(.C) void = null,
+    /// ... and with user data
+    stream_userdata_cb: ?*const fn ([*c]f32, i32, i32, ?*anyopaque) callconv(.C) void = null,
+    /// optional user data argument for stream_userdata_cb
+    user_data: ?*anyopaque = null,
+    /// optional allocation override functions
+    allocator: Allocator = .{},
+    /// optional logging function (default: NO LOGGING!)
+    logger: Logger = .{},
+};
+comptime {
+    checkLayout(Desc, 88, 8, .{ .sample_rate = 0, .num_channels = 4, .buffer_frames = 8, .packet_frames = 12, .num_packets = 16, .stream_cb = 24, .stream_userdata_cb = 32, .user_data = 40, .allocator = 48, .logger = 72 });
+}
+pub extern fn saudio_setup([*c]const Desc) void;
+/// setup sokol-audio
+pub fn setup(desc: Desc) void {
+    saudio_setup(&desc);
+}
+pub fn setupPtr(desc: *const Desc) void {
+    saudio_setup(desc);
+}
+pub extern fn saudio_shutdown() void;
+/// shutdown sokol-audio
+pub const shutdown = saudio_shutdown;
+pub extern fn saudio_isvalid() bool;
+/// true after setup if audio backend was successfully initialized
+pub const isvalid = saudio_isvalid;
+pub extern fn saudio_userdata() ?*anyopaque;
+/// return the saudio_desc.user_data pointer
+pub const userdata = saudio_userdata;
+pub extern fn saudio_query_desc() Desc;
+/// return a copy of the original saudio_desc struct
+pub const queryDesc = saudio_query_desc;
+pub extern fn saudio_sample_rate() i32;
+/// actual sample rate
+pub const sampleRate = saudio_sample_rate;
+pub extern fn saudio_buffer_frames() i32;
+/// return actual backend buffer size in number of frames
+pub const bufferFrames = saudio_buffer_frames;
+pub extern fn saudio_channels() i32;
+/// actual number of channels
+pub const channels = saudio_channels;
+pub extern fn saudio_suspended() bool;
+/// return true if audio context is currently suspended (only in WebAudio backend, all other backends return false)
+pub const suspended = saudio_suspended;
+pub extern fn saudio_expect() i32;
+/// get current number of frames to fill packet queue
+pub const expect = saudio_expect;
+pub extern fn saudio_push([*c]const f32, i32) i32;
+/// push sample frames from main thread, returns number of frames actually pushed
+pub fn push(frames: *const f32, num_frames: i32) i32 {
+    return saudio_push(frames, num_frames);
+}
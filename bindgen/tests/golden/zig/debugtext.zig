@@ -0,0 +1,311 @@
+// machine generated, do not edit
+
+const builtin = @import("builtin");
+const sg = @import("gfx.zig");
+
+// helper function to convert a C string to a Zig string slice
+fn cStrToZig(c_str: [*c]const u8) [:0]const u8 {
+    return @import("std").mem.span(c_str);
+}
+// compile-time check of a struct layout against the C struct layout, which
+// was evaluated by clang for a target with 8-byte pointers (checked
+// only on such targets)
+fn checkLayout(comptime T: type, comptime size: usize, comptime alignment: usize, comptime offsets: anytype) void {
+    if (@sizeOf(usize) != 8) return;
+    if (@sizeOf(T) != size or @alignOf(T) != alignment) {
+        @compileError("size or alignment of " ++ @typeName(T) ++ " doesn't match the C struct");
+    }
+    inline for (@import("std").meta.fields(@TypeOf(offsets))) |field| {
+        if (@offsetOf(T, field.name) != @field(offsets, field.name)) {
+            @compileError("offset of " ++ @typeName(T) ++ "." ++ field.name ++ " doesn't match the C struct");
+        }
+    }
+}
+// helper function to convert "anything" to a Range struct
+pub fn asRange(val: anytype) Range {
+    const type_info = @typeInfo(@TypeOf(val));
+    // FIXME: naming convention change between 0.13 and 0.14-dev
+    if (@hasField(@TypeOf(type_info), "Pointer")) {
+        switch (type_info) {
+            .Pointer => {
+                switch (type_info.Pointer.size) {
+                    .One => return .{ .ptr = val, .size = @sizeOf(type_info.Pointer.child) },
+                    .Slice => return .{ .ptr = val.ptr, .size = @sizeOf(type_info.Pointer.child) * val.len },
+                    else => @compileError("FIXME: Pointer type!"),
+                }
+            },
+            .Struct, .Array => {
+                @compileError("Structs and arrays must be passed as pointers to asRange");
+            },
+            else => {
+                @compileError("Cannot convert to range!");
+            },
+        }
+    } else {
+        switch (type_info) {
+            .pointer => {
+                switch (type_info.pointer.size) {
+                    .One => return .{ .ptr = val, .size = @sizeOf(type_info.pointer.child) },
+                    .Slice => return .{ .ptr = val.ptr, .size = @sizeOf(type_info.pointer.child) * val.len },
+                    else => @compileError("FIXME: Pointer type!"),
+                }
+            },
+            .@"struct", .array => {
+                @compileError("Structs and arrays must be passed as pointers to asRange");
+            },
+            else => {
+                @compileError("Cannot convert to range!");
+            },
+        }
+    }
+}
+
+// std.fmt compatible Writer
+pub const Writer = struct {
+    pub const Error = error{};
+    pub fn writeAll(self: Writer, bytes: []const u8) Error!void {
+        _ = self;
+        // forward whole slices to sdtx_putr() instead of one putc() call per byte
+        var remaining = bytes;
+        while (remaining.len > 0) {
+            const len = @min(remaining.len, @as(usize, @intCast(@import("std").math.maxInt(i32))));
+            sdtx_putr(remaining.ptr, @intCast(len));
+            remaining = remaining[len..];
+        }
+    }
+    pub fn writeByteNTimes(self: Writer, byte: u8, n: usize) Error!void {
+        // batch repeated bytes through a small stack buffer
+        var buf: [128]u8 = undefined;
+        @memset(&buf, byte);
+        var remaining = n;
+        while (remaining > 0) {
+            const len = @min(remaining, buf.len);
+            try self.writeAll(buf[0..len]);
+            remaining -= len;
+        }
+    }
+    pub fn writeBytesNTimes(self: Writer, bytes: []const u8, n: usize) Error!void {
+        var i: usize = 0;
+        while (i < n) : (i += 1) {
+            try self.writeAll(bytes);
+        }
+    }
+};
+// std.fmt-style formatted print
+pub fn print(comptime fmt: anytype, args: anytype) void {
+    const writer: Writer = .{};
+    @import("std").fmt.format(writer, fmt, args) catch {};
+}
+
+pub const LogItem = enum(i32) {
+    OK,
+    MALLOC_FAILED,
+    ADD_COMMIT_LISTENER_FAILED,
+    COMMAND_BUFFER_FULL,
+    CONTEXT_POOL_EXHAUSTED,
+    CANNOT_DESTROY_DEFAULT_CONTEXT,
+};
+/// sdtx_logger_t
+///
+/// Used in sdtx_desc_t to provide a custom logging and error reporting
+/// callback to sokol-debugtext.
+pub const Logger = extern struct {
+    func: ?*const fn ([*c]const u8, u32, u32, [*c]const u8, u32, [*c]const u8, ?*anyopaque) callconv(.C) void = null,
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(Logger, 16, 8, .{ .func = 0, .user_data = 8 });
+}
+/// a rendering context handle
+pub const Context = extern struct {
+    id: u32 = 0,
+};
+comptime {
+    checkLayout(Context, 4, 4, .{ .id = 0 });
+}
+/// sdtx_range is a pointer-size-pair struct used to pass memory
+/// blobs into sokol-debugtext. When initialized from a value type
+/// (array or struct), use the SDTX_RANGE() macro to build
+/// an sdtx_range struct.
+pub const Range = extern struct {
+    ptr: ?*const anyopaque = null,
+    size: usize = 0,
+};
+comptime {
+    checkLayout(Range, 16, 8, .{ .ptr = 0, .size = 8 });
+}
+pub const FontDesc = extern struct {
+    /// pointer to and size of font pixel data
+    data: Range = .{},
+    /// first character index in font pixel data
+    first_char: u8 = 0,
+    /// last character index in font pixel data, inclusive (default: 255)
+    last_char: u8 = 0,
+};
+comptime {
+    checkLayout(FontDesc, 24, 8, .{ .data = 0, .first_char = 16, .last_char = 17 });
+}
+/// sdtx_context_desc_t
+///
+/// Describes the initialization parameters of a rendering context. Creating
+/// additional rendering contexts is useful if you want to render in
+/// different sokol-gfx rendering passes, or when rendering several layers
+/// of text.
+pub const ContextDesc = extern struct {
+    /// max number of draw commands, each layer transition counts as a command, default: 4096
+    max_commands: i32 = 0,
+    /// max number of characters rendered in one frame, default: 4096
+    char_buf_size: i32 = 0,
+    /// the initial virtual canvas width, default: 640
+    canvas_width: f32 = 0.0,
+    /// the initial virtual canvas height, default: 400
+    canvas_height: f32 = 0.0,
+    /// tab width in number of characters, default: 4
+    tab_width: i32 = 0,
+    /// color pixel format of target render pass
+    color_format: sg.PixelFormat = .DEFAULT,
+    /// depth pixel format of target render pass
+    depth_format: sg.PixelFormat = .DEFAULT,
+    /// MSAA sample count of target render pass
+    sample_count: i32 = 0,
+};
+comptime {
+    checkLayout(ContextDesc, 32, 4, .{ .max_commands = 0, .char_buf_size = 4, .canvas_width = 8, .canvas_height = 12, .tab_width = 16, .color_format = 20, .depth_format = 24, .sample_count = 28 });
+}
+/// sdtx_allocator_t
+///
+/// Used in sdtx_desc_t to provide custom memory-alloc and -free functions
+/// to sokol_debugtext.h. If memory management should be overridden, both the
+/// alloc_fn and free_fn function must be provided (e.g. it's not valid to
+/// override one function but not the other).
+pub const Allocator = extern struct {
+    alloc_fn: ?*const fn (usize, ?*anyopaque) callconv(.C) ?*anyopaque = null,
+    free_fn: ?*const fn (?*anyopaque, ?*anyopaque) callconv(.C) void = null,
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(Allocator, 24, 8, .{ .alloc_fn = 0, .free_fn = 8, .user_data = 16 });
+}
+/// sdtx_desc_t
+///
+/// Describes the sokol-debugtext API initialization parameters. Passed
+/// to the sdtx_setup() function.
+///
+/// NOTE: to populate the fonts item array with builtin fonts, use any
+/// of the following functions:
+///
+///     sdtx_font_kc853()
+///     sdtx_font_kc854()
+///     sdtx_font_z1013()
+///     sdtx_font_cpc()
+///     sdtx_font_c64()
+///     sdtx_font_oric()
+pub const Desc = extern struct {
+    /// max number of rendering contexts that can be created, default: 8
+    context_pool_size: i32 = 0,
+    /// size of internal buffer for snprintf(), default: 4096
+    printf_buf_size: i32 = 0,
+    /// up to 8 fonts descriptions
+    fonts: [8]FontDesc = @import("std").mem.zeroes([8]FontDesc),
+    /// the default context creation parameters
+    context: ContextDesc = .{},
+    /// optional memory allocation overrides (default: malloc/free)
+    allocator: Allocator = .{},
+    /// optional log override function (default: NO LOGGING)
+    logger: Logger = .{},
+};
+comptime {
+    checkLayout(Desc, 272, 8, .{ .context_pool_size = 0, .printf_buf_size = 4, .fonts = 8, .context = 200, .allocator = 232, .logger = 256 });
+}
+pub extern fn sdtx_setup([*c]const Desc) void;
+pub fn setup(desc: Desc) void {
+    sdtx_setup(&desc);
+}
+pub fn setupPtr(desc: *const Desc) void {
+    sdtx_setup(desc);
+}
+pub extern fn sdtx_shutdown() void;
+pub const shutdown = sdtx_shutdown;
+pub extern fn sdtx_font_kc853() FontDesc;
+pub const fontKc853 = sdtx_font_kc853;
+pub extern fn sdtx_font_kc854() FontDesc;
+pub const fontKc854 = sdtx_font_kc854;
+pub extern fn sdtx_font_z1013() FontDesc;
+pub const fontZ1013 = sdtx_font_z1013;
+pub extern fn sdtx_font_cpc() FontDesc;
+pub const fontCpc = sdtx_font_cpc;
+pub extern fn sdtx_font_c64() FontDesc;
+pub const fontC64 = sdtx_font_c64;
+pub extern fn sdtx_font_oric() FontDesc;
+pub const fontOric = sdtx_font_oric;
+pub extern fn sdtx_make_context([*c]const ContextDesc) Context;
+pub fn makeContext(desc: ContextDesc) Context {
+    return sdtx_make_context(&desc);
+}
+pub fn makeContextPtr(desc: *const ContextDesc) Context {
+    return sdtx_make_context(desc);
+}
+pub extern fn sdtx_destroy_context(Context) void;
+pub const destroyContext = sdtx_destroy_context;
+pub extern fn sdtx_set_context(Context) void;
+pub const setContext = sdtx_set_context;
+pub extern fn sdtx_get_context() Context;
+pub const getContext = sdtx_get_context;
+pub extern fn sdtx_default_context() Context;
+pub const defaultContext = sdtx_default_context;
+pub extern fn sdtx_draw() void;
+pub const draw = sdtx_draw;
+pub extern fn sdtx_context_draw(Context) void;
+pub const contextDraw = sdtx_context_draw;
+pub extern fn sdtx_draw_layer(i32) void;
+pub const drawLayer = sdtx_draw_layer;
+pub extern fn sdtx_context_draw_layer(Context, i32) void;
+pub const contextDrawLayer = sdtx_context_draw_layer;
+pub extern fn sdtx_layer(i32) void;
+/// switch render layer
+pub const layer = sdtx_layer;
+pub extern fn sdtx_font(u32) void;
+/// switch to a different font
+pub const font = sdtx_font;
+pub extern fn sdtx_canvas(f32, f32) void;
+/// set a new virtual canvas size in screen pixels
+pub const canvas = sdtx_canvas;
+pub extern fn sdtx_origin(f32, f32) void;
+/// set a new origin in character grid coordinates
+pub const origin = sdtx_origin;
+pub extern fn sdtx_home() void;
+pub const home = sdtx_home;
+pub extern fn sdtx_pos(f32, f32) void;
+pub const pos = sdtx_pos;
+pub extern fn sdtx_pos_x(f32) void;
+pub const posX = sdtx_pos_x;
+pub extern fn sdtx_pos_y(f32) void;
+pub const posY = sdtx_pos_y;
+pub extern fn sdtx_move(f32, f32) void;
+pub const move = sdtx_move;
+pub extern fn sdtx_move_x(f32) void;
+pub const moveX = sdtx_move_x;
+pub extern fn sdtx_move_y(f32) void;
+pub const moveY = sdtx_move_y;
+pub extern fn sdtx_crlf() void;
+pub const crlf = sdtx_crlf;
+pub extern fn sdtx_color3b(u8, u8, u8) void;
+pub const color3b = sdtx_color3b;
+pub extern fn sdtx_color3f(f32, f32, f32) void;
+pub const color3f = sdtx_color3f;
+pub extern fn sdtx_color4b(u8, u8, u8, u8) void;
+pub const color4b = sdtx_color4b;
+pub extern fn sdtx_color4f(f32, f32, f32, f32) void;
+pub const color4f = sdtx_color4f;
+pub extern fn sdtx_color1i(u32) void;
+pub const color1i = sdtx_color1i;
+pub extern fn sdtx_putc(u8) void;
+pub const putc = sdtx_putc;
+pub extern fn sdtx_puts([*c]const u8) void;
+pub fn puts(str: [:0]const u8) void {
+    sdtx_puts(@ptrCast(str));
+}
+pub extern fn sdtx_putr([*c]const u8, i32) void;
+pub fn putr(str: [:0]const u8, len: i32) void {
+    sdtx_putr(@ptrCast(str), len);
+}
@@ -0,0 +1,253 @@
+// machine generated, do not edit
+
+const builtin = @import("builtin");
+
+// helper function to convert a C string to a Zig string slice
+fn cStrToZig(c_str: [*c]const u8) [:0]const u8 {
+    return @import("std").mem.span(c_str);
+}
+// compile-time check of a struct layout against the C struct layout, which
+// was evaluated by clang for a target with 8-byte pointers (checked
+// only on such targets)
+fn checkLayout(comptime T: type, comptime size: usize, comptime alignment: usize, comptime offsets: anytype) void {
+    if (@sizeOf(usize) != 8) return;
+    if (@sizeOf(T) != size or @alignOf(T) != alignment) {
+        @compileError("size or alignment of " ++ @typeName(T) ++ " doesn't match the C struct");
+    }
+    inline for (@import("std").meta.fields(@TypeOf(offsets))) |field| {
+        if (@offsetOf(T, field.name) != @field(offsets, field.name)) {
+            @compileError("offset of " ++ @typeName(T) ++ "." ++ field.name ++ " doesn't match the C struct");
+        }
+    }
+}
+// helper function to convert "anything" to a Range struct
+pub fn asRange(val: anytype) Range {
+    const type_info = @typeInfo(@TypeOf(val));
+    // FIXME: naming convention change between 0.13 and 0.14-dev
+    if (@hasField(@TypeOf(type_info), "Pointer")) {
+        switch (type_info) {
+            .Pointer => {
+                switch (type_info.Pointer.size) {
+                    .One => return .{ .ptr = val, .size = @sizeOf(type_info.Pointer.child) },
+                    .Slice => return .{ .ptr = val.ptr, .size = @sizeOf(type_info.Pointer.child) * val.len },
+                    else => @compileError("FIXME: Pointer type!"),
+                }
+            },
+            .Struct, .Array => {
+                @compileError("Structs and arrays must be passed as pointers to asRange");
+            },
+            else => {
+                @compileError("Cannot convert to range!");
+            },
+        }
+    } else {
+        switch (type_info) {
+            .pointer => {
+                switch (type_info.pointer.size) {
+                    .One => return .{ .ptr = val, .size = @sizeOf(type_info.pointer.child) },
+                    .Slice => return .{ .ptr = val.ptr, .size = @sizeOf(type_info.pointer.child) * val.len },
+                    else => @compileError("FIXME: Pointer type!"),
+                }
+            },
+            .@"struct", .array => {
+                @compileError("Structs and arrays must be passed as pointers to asRange");
+            },
+            else => {
+                @compileError("Cannot convert to range!");
+            },
+        }
+    }
+}
+
+pub const LogItem = enum(i32) {
+    OK,
+    MALLOC_FAILED,
+    FILE_PATH_UTF8_DECODING_FAILED,
+    SEND_QUEUE_FULL,
+    REQUEST_CHANNEL_INDEX_TOO_BIG,
+    REQUEST_PATH_IS_NULL,
+    REQUEST_PATH_TOO_LONG,
+    REQUEST_CALLBACK_MISSING,
+    REQUEST_CHUNK_SIZE_GREATER_BUFFER_SIZE,
+    REQUEST_USERDATA_PTR_IS_SET_BUT_USERDATA_SIZE_IS_NULL,
+    REQUEST_USERDATA_PTR_IS_NULL_BUT_USERDATA_SIZE_IS_NOT,
+    REQUEST_USERDATA_SIZE_TOO_BIG,
+    CLAMPING_NUM_CHANNELS_TO_MAX_CHANNELS,
+    REQUEST_POOL_EXHAUSTED,
+};
+/// sfetch_logger_t
+///
+/// Used in sfetch_desc_t to provide a custom logging and error reporting
+/// callback to sokol-fetch.
+pub const Logger = extern struct {
+    func: ?*const fn ([*c]const u8, u32, u32, [*c]const u8, u32, [*c]const u8, ?*anyopaque) callconv(.C) void = null,
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(Logger, 16, 8, .{ .func = 0, .user_data = 8 });
+}
+/// sfetch_range_t
+///
+/// A pointer-size pair struct to pass memory ranges into and out of sokol-fetch.
+/// When initialized from a value type (array or struct) you can use the
+/// SFETCH_RANGE() helper macro to build an sfetch_range_t struct.
+pub const Range = extern struct {
+    ptr: ?*const anyopaque = null,
+    size: usize = 0,
+};
+comptime {
+    checkLayout(Range, 16, 8, .{ .ptr = 0, .size = 8 });
+}
+/// sfetch_allocator_t
+///
+/// Used in sfetch_desc_t to provide custom memory-alloc and -free functions
+/// to sokol_fetch.h. If memory management should be overridden, both the
+/// alloc and free function must be provided (e.g. it's not valid to
+/// override one function but not the other).
+pub const Allocator = extern struct {
+    alloc_fn: ?*const fn (usize, ?*anyopaque) callconv(.C) ?*anyopaque = null,
+    free_fn: ?*const fn (?*anyopaque, ?*anyopaque) callconv(.C) void = null,
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(Allocator, 24, 8, .{ .alloc_fn = 0, .free_fn = 8, .user_data = 16 });
+}
+/// configuration values for sfetch_setup()
+pub const Desc = extern struct {
+    /// max number of active requests across all channels (default: 128)
+    max_requests: u32 = 0,
+    /// number of channels to fetch requests in parallel (default: 1)
+    num_channels: u32 = 0,
+    /// max number of requests active on the same channel (default: 1)
+    num_lanes: u32 = 0,
+    /// optional memory allocation overrides (default: malloc/free)
+    allocator: Allocator = .{},
+    /// optional log function overrides (default: NO LOGGING!)
+    logger: Logger = .{},
+};
+comptime {
+    checkLayout(Desc, 56, 8, .{ .max_requests = 0, .num_channels = 4, .num_lanes = 8, .allocator = 16, .logger = 40 });
+}
+/// a request handle to identify an active fetch request, returned by sfetch_send()
+pub const Handle = extern struct {
+    id: u32 = 0,
+};
+comptime {
+    checkLayout(Handle, 4, 4, .{ .id = 0 });
+}
+/// error codes
+pub const Error = enum(i32) {
+    NO_ERROR,
+    FILE_NOT_FOUND,
+    NO_BUFFER,
+    BUFFER_TOO_SMALL,
+    UNEXPECTED_EOF,
+    INVALID_HTTP_STATUS,
+    CANCELLED,
+};
+/// the response struct passed to the response callback
+pub const Response = extern struct {
+    /// request handle this response belongs to
+    handle: Handle = .{},
+    /// true when request is in DISPATCHED state (lane has been assigned)
+    dispatched: bool = false,
+    /// true when request is in FETCHED state (fetched data is available)
+    fetched: bool = false,
+    /// request is currently in paused state
+    paused: bool = false,
+    /// this is the last response for this request
+    finished: bool = false,
+    /// request has failed (always set together with 'finished')
+    failed: bool = false,
+    /// request was cancelled (always set together with 'finished')
+    cancelled: bool = false,
+    /// more detailed error code when failed is true
+    error_code: Error = .NO_ERROR,
+    /// the channel which processes this request
+    channel: u32 = 0,
+    /// the lane this request occupies on its channel
+    lane: u32 = 0,
+    /// the original filesystem path of the request
+    path: [*c]const u8 = null,
+    /// pointer to read/write user-data area
+    user_data: ?*anyopaque = null,
+    /// current offset of fetched data chunk in the overall file data
+    data_offset: u32 = 0,
+    /// the fetched data as ptr/size pair (data.ptr == buffer.ptr, data.size <= buffer.size)
+    data: Range = .{},
+    /// the user-provided buffer which holds the fetched data
+    buffer: Range = .{},
+};
+comptime {
+    checkLayout(Response, 80, 8, .{ .handle = 0, .dispatched = 4, .fetched = 5, .paused = 6, .finished = 7, .failed = 8, .cancelled = 9, .error_code = 12, .channel = 16, .lane = 20, .path = 24, .user_data = 32, .data_offset = 40, .data = 48, .buffer = 64 });
+}
+/// request parameters passed to sfetch_send()
+pub const Request = extern struct {
+    /// index of channel this request is assigned to (default: 0)
+    channel: u32 = 0,
+    /// filesystem path or HTTP URL (required)
+    path: [*c]const u8 = null,
+    /// response callback function pointer (required)
+    callback: ?*const fn ([*c]const Response) callconv(.C) void = null,
+    /// number of bytes to load per stream-block (optional)
+    chunk_size: u32 = 0,
+    /// a memory buffer where the data will be loaded into (optional)
+    buffer: Range = .{},
+    /// ptr/size of a POD user data block which will be memcpy'd (optional)
+    user_data: Range = .{},
+};
+comptime {
+    checkLayout(Request, 64, 8, .{ .channel = 0, .path = 8, .callback = 16, .chunk_size = 24, .buffer = 32, .user_data = 48 });
+}
+pub extern fn sfetch_setup([*c]const Desc) void;
+/// setup sokol-fetch (can be called on multiple threads)
+pub fn setup(desc: Desc) void {
+    sfetch_setup(&desc);
+}
+pub fn setupPtr(desc: *const Desc) void {
+    sfetch_setup(desc);
+}
+pub extern fn sfetch_shutdown() void;
+/// discard a sokol-fetch context
+pub const shutdown = sfetch_shutdown;
+pub extern fn sfetch_valid() bool;
+/// return true if sokol-fetch has been setup
+pub const valid = sfetch_valid;
+pub extern fn sfetch_desc() Desc;
+/// get the desc struct that was passed to sfetch_setup()
+pub const getDesc = sfetch_desc;
+pub extern fn sfetch_max_userdata_bytes() i32;
+/// return the max userdata size in number of bytes (SFETCH_MAX_USERDATA_UINT64 * sizeof(uint64_t))
+pub const maxUserdataBytes = sfetch_max_userdata_bytes;
+pub extern fn sfetch_max_path() i32;
+/// return the value of the SFETCH_MAX_PATH implementation config value
+pub const maxPath = sfetch_max_path;
+pub extern fn sfetch_send([*c]const Request) Handle;
+/// send a fetch-request, get handle to request back
+pub fn send(request: Request) Handle {
+    return sfetch_send(&request);
+}
+pub fn sendPtr(request: *const Request) Handle {
+    return sfetch_send(request);
+}
+pub extern fn sfetch_handle_valid(Handle) bool;
+/// return true if a handle is valid *and* the request is alive
+pub const handleValid = sfetch_handle_valid;
+pub extern fn sfetch_dowork() void;
+/// do per-frame work, moves requests into and out of IO threads, and invokes response-callbacks
+pub const dowork = sfetch_dowork;
+pub extern fn sfetch_bind_buffer(Handle, Range) void;
+/// bind a data buffer to a request (request must not currently have a buffer bound, must be called from response callback
+pub const bindBuffer = sfetch_bind_buffer;
+pub extern fn sfetch_unbind_buffer(Handle) ?*anyopaque;
+/// clear the 'buffer binding' of a request, returns previous buffer pointer (can be 0), must be called from response callback
+pub const unbindBuffer = sfetch_unbind_buffer;
+pub extern fn sfetch_cancel(Handle) void;
+/// cancel a request that's in flight (will call response callback with .cancelled + .finished)
+pub const cancel = sfetch_cancel;
+pub extern fn sfetch_pause(Handle) void;
+/// pause a request (will call response callback each frame with .paused)
+pub const pause = sfetch_pause;
+pub extern fn sfetch_continue(Handle) void;
+/// continue a paused request
+pub const continueFetching = sfetch_continue;
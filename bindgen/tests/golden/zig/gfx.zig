@@ -0,0 +1,3968 @@
+// machine generated, do not edit
+
+const builtin = @import("builtin");
+
+// helper function to convert a C string to a Zig string slice
+fn cStrToZig(c_str: [*c]const u8) [:0]const u8 {
+    return @import("std").mem.span(c_str);
+}
+// compile-time check of a struct layout against the C struct layout, which
+// was evaluated by clang for a target with 8-byte pointers (checked
+// only on such targets)
+fn checkLayout(comptime T: type, comptime size: usize, comptime alignment: usize, comptime offsets: anytype) void {
+    if (@sizeOf(usize) != 8) return;
+    if (@sizeOf(T) != size or @alignOf(T) != alignment) {
+        @compileError("size or alignment of " ++ @typeName(T) ++ " doesn't match the C struct");
+    }
+    inline for (@import("std").meta.fields(@TypeOf(offsets))) |field| {
+        if (@offsetOf(T, field.name) != @field(offsets, field.name)) {
+            @compileError("offset of " ++ @typeName(T) ++ "." ++ field.name ++ " doesn't match the C struct");
+        }
+    }
+}
+// helper function to convert "anything" to a Range struct
+pub fn asRange(val: anytype) Range {
+    const type_info = @typeInfo(@TypeOf(val));
+    // FIXME: naming convention change between 0.13 and 0.14-dev
+    if (@hasField(@TypeOf(type_info), "Pointer")) {
+        switch (type_info) {
+            .Pointer => {
+                switch (type_info.Pointer.size) {
+                    .One => return .{ .ptr = val, .size = @sizeOf(type_info.Pointer.child) },
+                    .Slice => return .{ .ptr = val.ptr, .size = @sizeOf(type_info.Pointer.child) * val.len },
+                    else => @compileError("FIXME: Pointer type!"),
+                }
+            },
+            .Struct, .Array => {
+                @compileError("Structs and arrays must be passed as pointers to asRange");
+            },
+            else => {
+                @compileError("Cannot convert to range!");
+            },
+        }
+    } else {
+        switch (type_info) {
+            .pointer => {
+                switch (type_info.pointer.size) {
+                    .One => return .{ .ptr = val, .size = @sizeOf(type_info.pointer.child) },
+                    .Slice => return .{ .ptr = val.ptr, .size = @sizeOf(type_info.pointer.child) * val.len },
+                    else => @compileError("FIXME: Pointer type!"),
+                }
+            },
+            .@"struct", .array => {
+                @compileError("Structs and arrays must be passed as pointers to asRange");
+            },
+            else => {
+                @compileError("Cannot convert to range!");
+            },
+        }
+    }
+}
+
+// number of values in a flattened FrameStats struct
+pub const frame_stats_num_values = 85;
+// names of the values in a flattened FrameStats struct
+pub const frame_stats_names = [frame_stats_num_values][]const u8{
+    "frame_index",
+    "num_passes",
+    "num_apply_viewport",
+    "num_apply_scissor_rect",
+    "num_apply_pipeline",
+    "num_apply_bindings",
+    "num_apply_uniforms",
+    "num_draw",
+    "num_update_buffer",
+    "num_append_buffer",
+    "num_update_image",
+    "size_apply_uniforms",
+    "size_update_buffer",
+    "size_append_buffer",
+    "size_update_image",
+    "gl.num_bind_buffer",
+    "gl.num_active_texture",
+    "gl.num_bind_texture",
+    "gl.num_bind_sampler",
+    "gl.num_use_program",
+    "gl.num_render_state",
+    "gl.num_vertex_attrib_pointer",
+    "gl.num_vertex_attrib_divisor",
+    "gl.num_enable_vertex_attrib_array",
+    "gl.num_disable_vertex_attrib_array",
+    "gl.num_uniform",
+    "d3d11.pass.num_om_set_render_targets",
+    "d3d11.pass.num_clear_render_target_view",
+    "d3d11.pass.num_clear_depth_stencil_view",
+    "d3d11.pass.num_resolve_subresource",
+    "d3d11.pipeline.num_rs_set_state",
+    "d3d11.pipeline.num_om_set_depth_stencil_state",
+    "d3d11.pipeline.num_om_set_blend_state",
+    "d3d11.pipeline.num_ia_set_primitive_topology",
+    "d3d11.pipeline.num_ia_set_input_layout",
+    "d3d11.pipeline.num_vs_set_shader",
+    "d3d11.pipeline.num_vs_set_constant_buffers",
+    "d3d11.pipeline.num_ps_set_shader",
+    "d3d11.pipeline.num_ps_set_constant_buffers",
+    "d3d11.bindings.num_ia_set_vertex_buffers",
+    "d3d11.bindings.num_ia_set_index_buffer",
+    "d3d11.bindings.num_vs_set_shader_resources",
+    "d3d11.bindings.num_ps_set_shader_resources",
+    "d3d11.bindings.num_vs_set_samplers",
+    "d3d11.bindings.num_ps_set_samplers",
+    "d3d11.uniforms.num_update_subresource",
+    "d3d11.draw.num_draw_indexed_instanced",
+    "d3d11.draw.num_draw_indexed",
+    "d3d11.draw.num_draw_instanced",
+    "d3d11.draw.num_draw",
+    "d3d11.num_map",
+    "d3d11.num_unmap",
+    "metal.idpool.num_added",
+    "metal.idpool.num_released",
+    "metal.idpool.num_garbage_collected",
+    "metal.pipeline.num_set_blend_color",
+    "metal.pipeline.num_set_cull_mode",
+    "metal.pipeline.num_set_front_facing_winding",
+    "metal.pipeline.num_set_stencil_reference_value",
+    "metal.pipeline.num_set_depth_bias",
+    "metal.pipeline.num_set_render_pipeline_state",
+    "metal.pipeline.num_set_depth_stencil_state",
+    "metal.bindings.num_set_vertex_buffer",
+    "metal.bindings.num_set_vertex_texture",
+    "metal.bindings.num_set_vertex_sampler_state",
+    "metal.bindings.num_set_fragment_buffer",
+    "metal.bindings.num_set_fragment_texture",
+    "metal.bindings.num_set_fragment_sampler_state",
+    "metal.uniforms.num_set_vertex_buffer_offset",
+    "metal.uniforms.num_set_fragment_buffer_offset",
+    "wgpu.uniforms.num_set_bindgroup",
+    "wgpu.uniforms.size_write_buffer",
+    "wgpu.bindings.num_set_vertex_buffer",
+    "wgpu.bindings.num_skip_redundant_vertex_buffer",
+    "wgpu.bindings.num_set_index_buffer",
+    "wgpu.bindings.num_skip_redundant_index_buffer",
+    "wgpu.bindings.num_create_bindgroup",
+    "wgpu.bindings.num_discard_bindgroup",
+    "wgpu.bindings.num_set_bindgroup",
+    "wgpu.bindings.num_skip_redundant_bindgroup",
+    "wgpu.bindings.num_bindgroup_cache_hits",
+    "wgpu.bindings.num_bindgroup_cache_misses",
+    "wgpu.bindings.num_bindgroup_cache_collisions",
+    "wgpu.bindings.num_bindgroup_cache_invalidates",
+    "wgpu.bindings.num_bindgroup_cache_hash_vs_key_mismatch",
+};
+// flat array view of a FrameStats struct, for instance for exporting
+pub fn frameStatsFlatten(stats: FrameStats) [frame_stats_num_values]u32 {
+    return .{
+        stats.frame_index,
+        stats.num_passes,
+        stats.num_apply_viewport,
+        stats.num_apply_scissor_rect,
+        stats.num_apply_pipeline,
+        stats.num_apply_bindings,
+        stats.num_apply_uniforms,
+        stats.num_draw,
+        stats.num_update_buffer,
+        stats.num_append_buffer,
+        stats.num_update_image,
+        stats.size_apply_uniforms,
+        stats.size_update_buffer,
+        stats.size_append_buffer,
+        stats.size_update_image,
+        stats.gl.num_bind_buffer,
+        stats.gl.num_active_texture,
+        stats.gl.num_bind_texture,
+        stats.gl.num_bind_sampler,
+        stats.gl.num_use_program,
+        stats.gl.num_render_state,
+        stats.gl.num_vertex_attrib_pointer,
+        stats.gl.num_vertex_attrib_divisor,
+        stats.gl.num_enable_vertex_attrib_array,
+        stats.gl.num_disable_vertex_attrib_array,
+        stats.gl.num_uniform,
+        stats.d3d11.pass.num_om_set_render_targets,
+        stats.d3d11.pass.num_clear_render_target_view,
+        stats.d3d11.pass.num_clear_depth_stencil_view,
+        stats.d3d11.pass.num_resolve_subresource,
+        stats.d3d11.pipeline.num_rs_set_state,
+        stats.d3d11.pipeline.num_om_set_depth_stencil_state,
+        stats.d3d11.pipeline.num_om_set_blend_state,
+        stats.d3d11.pipeline.num_ia_set_primitive_topology,
+        stats.d3d11.pipeline.num_ia_set_input_layout,
+        stats.d3d11.pipeline.num_vs_set_shader,
+        stats.d3d11.pipeline.num_vs_set_constant_buffers,
+        stats.d3d11.pipeline.num_ps_set_shader,
+        stats.d3d11.pipeline.num_ps_set_constant_buffers,
+        stats.d3d11.bindings.num_ia_set_vertex_buffers,
+        stats.d3d11.bindings.num_ia_set_index_buffer,
+        stats.d3d11.bindings.num_vs_set_shader_resources,
+        stats.d3d11.bindings.num_ps_set_shader_resources,
+        stats.d3d11.bindings.num_vs_set_samplers,
+        stats.d3d11.bindings.num_ps_set_samplers,
+        stats.d3d11.uniforms.num_update_subresource,
+        stats.d3d11.draw.num_draw_indexed_instanced,
+        stats.d3d11.draw.num_draw_indexed,
+        stats.d3d11.draw.num_draw_instanced,
+        stats.d3d11.draw.num_draw,
+        stats.d3d11.num_map,
+        stats.d3d11.num_unmap,
+        stats.metal.idpool.num_added,
+        stats.metal.idpool.num_released,
+        stats.metal.idpool.num_garbage_collected,
+        stats.metal.pipeline.num_set_blend_color,
+        stats.metal.pipeline.num_set_cull_mode,
+        stats.metal.pipeline.num_set_front_facing_winding,
+        stats.metal.pipeline.num_set_stencil_reference_value,
+        stats.metal.pipeline.num_set_depth_bias,
+        stats.metal.pipeline.num_set_render_pipeline_state,
+        stats.metal.pipeline.num_set_depth_stencil_state,
+        stats.metal.bindings.num_set_vertex_buffer,
+        stats.metal.bindings.num_set_vertex_texture,
+        stats.metal.bindings.num_set_vertex_sampler_state,
+        stats.metal.bindings.num_set_fragment_buffer,
+        stats.metal.bindings.num_set_fragment_texture,
+        stats.metal.bindings.num_set_fragment_sampler_state,
+        stats.metal.uniforms.num_set_vertex_buffer_offset,
+        stats.metal.uniforms.num_set_fragment_buffer_offset,
+        stats.wgpu.uniforms.num_set_bindgroup,
+        stats.wgpu.uniforms.size_write_buffer,
+        stats.wgpu.bindings.num_set_vertex_buffer,
+        stats.wgpu.bindings.num_skip_redundant_vertex_buffer,
+        stats.wgpu.bindings.num_set_index_buffer,
+        stats.wgpu.bindings.num_skip_redundant_index_buffer,
+        stats.wgpu.bindings.num_create_bindgroup,
+        stats.wgpu.bindings.num_discard_bindgroup,
+        stats.wgpu.bindings.num_set_bindgroup,
+        stats.wgpu.bindings.num_skip_redundant_bindgroup,
+        stats.wgpu.bindings.num_bindgroup_cache_hits,
+        stats.wgpu.bindings.num_bindgroup_cache_misses,
+        stats.wgpu.bindings.num_bindgroup_cache_collisions,
+        stats.wgpu.bindings.num_bindgroup_cache_invalidates,
+        stats.wgpu.bindings.num_bindgroup_cache_hash_vs_key_mismatch,
+    };
+}
+// records the flattened frame stats of the last num_frames frames,
+// call push(queryFrameStats()) once per frame
+pub fn FrameStatsCollector(comptime num_frames: usize) type {
+    return struct {
+        const Self = @This();
+        frames: [num_frames][frame_stats_num_values]u32 = undefined,
+        num: usize = 0,
+        pos: usize = 0,
+
+        pub fn push(self: *Self, stats: FrameStats) void {
+            self.frames[self.pos] = frameStatsFlatten(stats);
+            self.pos = (self.pos + 1) % num_frames;
+            self.num = @min(self.num + 1, num_frames);
+        }
+        // the most recently pushed frame stats
+        pub fn latest(self: *const Self) ?[frame_stats_num_values]u32 {
+            if (self.num == 0) return null;
+            return self.frames[(self.pos + num_frames - 1) % num_frames];
+        }
+        // average of a value over the recorded frames
+        pub fn average(self: *const Self, value_index: usize) f64 {
+            if (self.num == 0) return 0.0;
+            var sum: u64 = 0;
+            for (self.frames[0..self.num]) |frame| {
+                sum += frame[value_index];
+            }
+            return @as(f64, @floatFromInt(sum)) / @as(f64, @floatFromInt(self.num));
+        }
+        // nearest-rank percentile (0..100) of a value over the recorded frames
+        pub fn percentile(self: *const Self, value_index: usize, p: u32) u32 {
+            if (self.num == 0) return 0;
+            var values: [num_frames]u32 = undefined;
+            for (self.frames[0..self.num], 0..) |frame, i| {
+                values[i] = frame[value_index];
+            }
+            @import("std").mem.sort(u32, values[0..self.num], {}, @import("std").sort.asc(u32));
+            const rank = (@as(usize, @min(p, 100)) * self.num + 99) / 100;
+            return values[if (rank > 0) rank - 1 else 0];
+        }
+    };
+}
+
+pub const Buffer = extern struct {
+    id: u32 = 0,
+};
+comptime {
+    checkLayout(Buffer, 4, 4, .{ .id = 0 });
+}
+pub const Image = extern struct {
+    id: u32 = 0,
+};
+comptime {
+    checkLayout(Image, 4, 4, .{ .id = 0 });
+}
+pub const Sampler = extern struct {
+    id: u32 = 0,
+};
+comptime {
+    checkLayout(Sampler, 4, 4, .{ .id = 0 });
+}
+pub const Shader = extern struct {
+    id: u32 = 0,
+};
+comptime {
+    checkLayout(Shader, 4, 4, .{ .id = 0 });
+}
+pub const Pipeline = extern struct {
+    id: u32 = 0,
+};
+comptime {
+    checkLayout(Pipeline, 4, 4, .{ .id = 0 });
+}
+pub const Attachments = extern struct {
+    id: u32 = 0,
+};
+comptime {
+    checkLayout(Attachments, 4, 4, .{ .id = 0 });
+}
+/// sg_range is a pointer-size-pair struct used to pass memory blobs into
+/// sokol-gfx. When initialized from a value type (array or struct), you can
+/// use the SG_RANGE() macro to build an sg_range struct. For functions which
+/// take either a sg_range pointer, or a (C++) sg_range reference, use the
+/// SG_RANGE_REF macro as a solution which compiles both in C and C++.
+pub const Range = extern struct {
+    ptr: ?*const anyopaque = null,
+    size: usize = 0,
+};
+comptime {
+    checkLayout(Range, 16, 8, .{ .ptr = 0, .size = 8 });
+}
+// various compile-time constants in the public API
+pub const invalid_id = 0;
+pub const num_inflight_frames = 2;
+pub const max_color_attachments = 4;
+pub const max_uniformblock_members = 16;
+pub const max_vertex_attributes = 16;
+pub const max_mipmaps = 16;
+pub const max_texturearray_layers = 128;
+pub const max_uniformblock_bindslots = 8;
+pub const max_vertexbuffer_bindslots = 8;
+pub const max_image_bindslots = 16;
+pub const max_sampler_bindslots = 16;
+pub const max_storagebuffer_bindslots = 8;
+pub const max_image_sampler_pairs = 16;
+/// sg_color
+///
+/// An RGBA color value.
+pub const Color = extern struct {
+    r: f32 = 0.0,
+    g: f32 = 0.0,
+    b: f32 = 0.0,
+    a: f32 = 0.0,
+};
+comptime {
+    checkLayout(Color, 16, 4, .{ .r = 0, .g = 4, .b = 8, .a = 12 });
+}
+/// sg_backend
+///
+/// The active 3D-API backend, use the function sg_query_backend()
+/// to get the currently active backend.
+pub const Backend = enum(i32) {
+    GLCORE,
+    GLES3,
+    D3D11,
+    METAL_IOS,
+    METAL_MACOS,
+    METAL_SIMULATOR,
+    WGPU,
+    DUMMY,
+};
+/// sg_pixel_format
+///
+/// sokol_gfx.h basically uses the same pixel formats as WebGPU, since these
+/// are supported on most newer GPUs.
+///
+/// A pixelformat name consist of three parts:
+///
+///     - components (R, RG, RGB or RGBA)
+///     - bit width per component (8, 16 or 32)
+///     - component data type:
+///         - unsigned normalized (no postfix)
+///         - signed normalized (SN postfix)
+///         - unsigned integer (UI postfix)
+///         - signed integer (SI postfix)
+///         - float (F postfix)
+///
+/// Not all pixel formats can be used for everything, call sg_query_pixelformat()
+/// to inspect the capabilities of a given pixelformat. The function returns
+/// an sg_pixelformat_info struct with the following members:
+///
+///     - sample: the pixelformat can be sampled as texture at least with
+///               nearest filtering
+///     - filter: the pixelformat can be sampled as texture with linear
+///               filtering
+///     - render: the pixelformat can be used as render-pass attachment
+///     - blend:  blending is supported when used as render-pass attachment
+///     - msaa:   multisample-antialiasing is supported when used
+///               as render-pass attachment
+///     - depth:  the pixelformat can be used for depth-stencil attachments
+///     - compressed: this is a block-compressed format
+///     - bytes_per_pixel: the numbers of bytes in a pixel (0 for compressed formats)
+///
+/// The default pixel format for texture images is SG_PIXELFORMAT_RGBA8.
+///
+/// The default pixel format for render target images is platform-dependent
+/// and taken from the sg_environment struct passed into sg_setup(). Typically
+/// the default formats are:
+///
+///     - for the Metal, D3D11 and WebGPU backends: SG_PIXELFORMAT_BGRA8
+///     - for GL backends: SG_PIXELFORMAT_RGBA8
+pub const PixelFormat = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    NONE,
+    R8,
+    R8SN,
+    R8UI,
+    R8SI,
+    R16,
+    R16SN,
+    R16UI,
+    R16SI,
+    R16F,
+    RG8,
+    RG8SN,
+    RG8UI,
+    RG8SI,
+    R32UI,
+    R32SI,
+    R32F,
+    RG16,
+    RG16SN,
+    RG16UI,
+    RG16SI,
+    RG16F,
+    RGBA8,
+    SRGB8A8,
+    RGBA8SN,
+    RGBA8UI,
+    RGBA8SI,
+    BGRA8,
+    RGB10A2,
+    RG11B10F,
+    RGB9E5,
+    RG32UI,
+    RG32SI,
+    RG32F,
+    RGBA16,
+    RGBA16SN,
+    RGBA16UI,
+    RGBA16SI,
+    RGBA16F,
+    RGBA32UI,
+    RGBA32SI,
+    RGBA32F,
+    DEPTH,
+    DEPTH_STENCIL,
+    BC1_RGBA,
+    BC2_RGBA,
+    BC3_RGBA,
+    BC3_SRGBA,
+    BC4_R,
+    BC4_RSN,
+    BC5_RG,
+    BC5_RGSN,
+    BC6H_RGBF,
+    BC6H_RGBUF,
+    BC7_RGBA,
+    BC7_SRGBA,
+    /// FIXME: deprecated
+    PVRTC_RGB_2BPP,
+    /// FIXME: deprecated
+    PVRTC_RGB_4BPP,
+    /// FIXME: deprecated
+    PVRTC_RGBA_2BPP,
+    /// FIXME: deprecated
+    PVRTC_RGBA_4BPP,
+    ETC2_RGB8,
+    ETC2_SRGB8,
+    ETC2_RGB8A1,
+    ETC2_RGBA8,
+    ETC2_SRGB8A8,
+    EAC_R11,
+    EAC_R11SN,
+    EAC_RG11,
+    EAC_RG11SN,
+    ASTC_4x4_RGBA,
+    ASTC_4x4_SRGBA,
+    NUM,
+};
+/// Runtime information about a pixel format, returned by sg_query_pixelformat().
+pub const PixelformatInfo = extern struct {
+    /// pixel format can be sampled in shaders at least with nearest filtering
+    sample: bool = false,
+    /// pixel format can be sampled with linear filtering
+    filter: bool = false,
+    /// pixel format can be used as render-pass attachment
+    render: bool = false,
+    /// pixel format supports alpha-blending when used as render-pass attachment
+    blend: bool = false,
+    /// pixel format supports MSAA when used as render-pass attachment
+    msaa: bool = false,
+    /// pixel format is a depth format
+    depth: bool = false,
+    /// true if this is a hardware-compressed format
+    compressed: bool = false,
+    /// NOTE: this is 0 for compressed formats, use sg_query_row_pitch() / sg_query_surface_pitch() as alternative
+    bytes_per_pixel: i32 = 0,
+};
+comptime {
+    checkLayout(PixelformatInfo, 12, 4, .{ .sample = 0, .filter = 1, .render = 2, .blend = 3, .msaa = 4, .depth = 5, .compressed = 6, .bytes_per_pixel = 8 });
+}
+/// Runtime information about available optional features, returned by sg_query_features()
+pub const Features = extern struct {
+    /// framebuffer- and texture-origin is in top left corner
+    origin_top_left: bool = false,
+    /// border color and clamp-to-border uv-wrap mode is supported
+    image_clamp_to_border: bool = false,
+    /// multiple-render-target rendering can use per-render-target blend state
+    mrt_independent_blend_state: bool = false,
+    /// multiple-render-target rendering can use per-render-target color write masks
+    mrt_independent_write_mask: bool = false,
+    /// storage buffers are supported
+    storage_buffer: bool = false,
+    /// if true, multisampled images can be bound as texture resources
+    msaa_image_bindings: bool = false,
+};
+comptime {
+    checkLayout(Features, 6, 1, .{ .origin_top_left = 0, .image_clamp_to_border = 1, .mrt_independent_blend_state = 2, .mrt_independent_write_mask = 3, .storage_buffer = 4, .msaa_image_bindings = 5 });
+}
+/// Runtime information about resource limits, returned by sg_query_limit()
+pub const Limits = extern struct {
+    /// max width/height of SG_IMAGETYPE_2D images
+    max_image_size_2d: i32 = 0,
+    /// max width/height of SG_IMAGETYPE_CUBE images
+    max_image_size_cube: i32 = 0,
+    /// max width/height/depth of SG_IMAGETYPE_3D images
+    max_image_size_3d: i32 = 0,
+    /// max width/height of SG_IMAGETYPE_ARRAY images
+    max_image_size_array: i32 = 0,
+    /// max number of layers in SG_IMAGETYPE_ARRAY images
+    max_image_array_layers: i32 = 0,
+    /// max number of vertex attributes, clamped to SG_MAX_VERTEX_ATTRIBUTES
+    max_vertex_attrs: i32 = 0,
+    /// <= GL_MAX_VERTEX_UNIFORM_COMPONENTS (only on GL backends)
+    gl_max_vertex_uniform_components: i32 = 0,
+    /// <= GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS (only on GL backends)
+    gl_max_combined_texture_image_units: i32 = 0,
+};
+comptime {
+    checkLayout(Limits, 32, 4, .{ .max_image_size_2d = 0, .max_image_size_cube = 4, .max_image_size_3d = 8, .max_image_size_array = 12, .max_image_array_layers = 16, .max_vertex_attrs = 20, .gl_max_vertex_uniform_components = 24, .gl_max_combined_texture_image_units = 28 });
+}
+/// sg_resource_state
+///
+/// The current state of a resource in its resource pool.
+/// Resources start in the INITIAL state, which means the
+/// pool slot is unoccupied and can be allocated. When a resource is
+/// created, first an id is allocated, and the resource pool slot
+/// is set to state ALLOC. After allocation, the resource is
+/// initialized, which may result in the VALID or FAILED state. The
+/// reason why allocation and initialization are separate is because
+/// some resource types (e.g. buffers and images) might be asynchronously
+/// initialized by the user application. If a resource which is not
+/// in the VALID state is attempted to be used for rendering, rendering
+/// operations will silently be dropped.
+///
+/// The special INVALID state is returned in sg_query_xxx_state() if no
+/// resource object exists for the provided resource id.
+pub const ResourceState = enum(i32) {
+    INITIAL,
+    ALLOC,
+    VALID,
+    FAILED,
+    INVALID,
+};
+/// sg_usage
+///
+/// A resource usage hint describing the update strategy of
+/// buffers and images. This is used in the sg_buffer_desc.usage
+/// and sg_image_desc.usage members when creating buffers
+/// and images:
+///
+/// SG_USAGE_IMMUTABLE:     the resource will never be updated with
+///                         new data, instead the content of the
+///                         resource must be provided on creation
+/// SG_USAGE_DYNAMIC:       the resource will be updated infrequently
+///                         with new data (this could range from "once
+///                         after creation", to "quite often but not
+///                         every frame")
+/// SG_USAGE_STREAM:        the resource will be updated each frame
+///                         with new content
+///
+/// The rendering backends use this hint to prevent that the
+/// CPU needs to wait for the GPU when attempting to update
+/// a resource that might be currently accessed by the GPU.
+///
+/// Resource content is updated with the functions sg_update_buffer() or
+/// sg_append_buffer() for buffer objects, and sg_update_image() for image
+/// objects. For the sg_update_*() functions, only one update is allowed per
+/// frame and resource object, while sg_append_buffer() can be called
+/// multiple times per frame on the same buffer. The application must update
+/// all data required for rendering (this means that the update data can be
+/// smaller than the resource size, if only a part of the overall resource
+/// size is used for rendering, you only need to make sure that the data that
+/// *is* used is valid).
+///
+/// The default usage is SG_USAGE_IMMUTABLE.
+pub const Usage = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    IMMUTABLE,
+    DYNAMIC,
+    STREAM,
+    NUM,
+};
+/// sg_buffer_type
+///
+/// Indicates whether a buffer will be bound as vertex-,
+/// index- or storage-buffer.
+///
+/// Used in the sg_buffer_desc.type member when creating a buffer.
+///
+/// The default value is SG_BUFFERTYPE_VERTEXBUFFER.
+pub const BufferType = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    VERTEXBUFFER,
+    INDEXBUFFER,
+    STORAGEBUFFER,
+    NUM,
+};
+/// sg_index_type
+///
+/// Indicates whether indexed rendering (fetching vertex-indices from an
+/// index buffer) is used, and if yes, the index data type (16- or 32-bits).
+///
+/// This is used in the sg_pipeline_desc.index_type member when creating a
+/// pipeline object.
+///
+/// The default index type is SG_INDEXTYPE_NONE.
+pub const IndexType = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    NONE,
+    UINT16,
+    UINT32,
+    NUM,
+};
+/// sg_image_type
+///
+/// Indicates the basic type of an image object (2D-texture, cubemap,
+/// 3D-texture or 2D-array-texture). Used in the sg_image_desc.type member when
+/// creating an image, and in sg_shader_image_desc to describe a sampled texture
+/// in the shader (both must match and will be checked in the validation layer
+/// when calling sg_apply_bindings).
+///
+/// The default image type when creating an image is SG_IMAGETYPE_2D.
+pub const ImageType = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    _2D,
+    CUBE,
+    _3D,
+    ARRAY,
+    NUM,
+};
+/// sg_image_sample_type
+///
+/// The basic data type of a texture sample as expected by a shader.
+/// Must be provided in sg_shader_image and used by the validation
+/// layer in sg_apply_bindings() to check if the provided image object
+/// is compatible with what the shader expects. Apart from the sokol-gfx
+/// validation layer, WebGPU is the only backend API which actually requires
+/// matching texture and sampler type to be provided upfront for validation
+/// (other 3D APIs treat texture/sampler type mismatches as undefined behaviour).
+///
+/// NOTE that the following texture pixel formats require the use
+/// of SG_IMAGESAMPLETYPE_UNFILTERABLE_FLOAT, combined with a sampler
+/// of type SG_SAMPLERTYPE_NONFILTERING:
+///
+/// - SG_PIXELFORMAT_R32F
+/// - SG_PIXELFORMAT_RG32F
+/// - SG_PIXELFORMAT_RGBA32F
+///
+/// (when using sokol-shdc, also check out the meta tags `@image_sample_type`
+/// and `@sampler_type`)
+pub const ImageSampleType = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    FLOAT,
+    DEPTH,
+    SINT,
+    UINT,
+    UNFILTERABLE_FLOAT,
+    NUM,
+};
+/// sg_sampler_type
+///
+/// The basic type of a texture sampler (sampling vs comparison) as
+/// defined in a shader. Must be provided in sg_shader_sampler_desc.
+///
+/// sg_image_sample_type and sg_sampler_type for a texture/sampler
+/// pair must be compatible with each other, specifically only
+/// the following pairs are allowed:
+///
+/// - SG_IMAGESAMPLETYPE_FLOAT => (SG_SAMPLERTYPE_FILTERING or SG_SAMPLERTYPE_NONFILTERING)
+/// - SG_IMAGESAMPLETYPE_UNFILTERABLE_FLOAT => SG_SAMPLERTYPE_NONFILTERING
+/// - SG_IMAGESAMPLETYPE_SINT => SG_SAMPLERTYPE_NONFILTERING
+/// - SG_IMAGESAMPLETYPE_UINT => SG_SAMPLERTYPE_NONFILTERING
+/// - SG_IMAGESAMPLETYPE_DEPTH => SG_SAMPLERTYPE_COMPARISON
+pub const SamplerType = enum(i32) {
+    DEFAULT,
+    FILTERING,
+    NONFILTERING,
+    COMPARISON,
+    NUM,
+};
+/// sg_cube_face
+///
+/// The cubemap faces. Use these as indices in the sg_image_desc.content
+/// array.
+pub const CubeFace = enum(i32) {
+    POS_X,
+    NEG_X,
+    POS_Y,
+    NEG_Y,
+    POS_Z,
+    NEG_Z,
+    NUM,
+};
+/// sg_primitive_type
+///
+/// This is the common subset of 3D primitive types supported across all 3D
+/// APIs. This is used in the sg_pipeline_desc.primitive_type member when
+/// creating a pipeline object.
+///
+/// The default primitive type is SG_PRIMITIVETYPE_TRIANGLES.
+pub const PrimitiveType = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    POINTS,
+    LINES,
+    LINE_STRIP,
+    TRIANGLES,
+    TRIANGLE_STRIP,
+    NUM,
+};
+/// sg_filter
+///
+/// The filtering mode when sampling a texture image. This is
+/// used in the sg_sampler_desc.min_filter, sg_sampler_desc.mag_filter
+/// and sg_sampler_desc.mipmap_filter members when creating a sampler object.
+///
+/// For the default is SG_FILTER_NEAREST.
+pub const Filter = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    NEAREST,
+    LINEAR,
+    NUM,
+};
+/// sg_wrap
+///
+/// The texture coordinates wrapping mode when sampling a texture
+/// image. This is used in the sg_image_desc.wrap_u, .wrap_v
+/// and .wrap_w members when creating an image.
+///
+/// The default wrap mode is SG_WRAP_REPEAT.
+///
+/// NOTE: SG_WRAP_CLAMP_TO_BORDER is not supported on all backends
+/// and platforms. To check for support, call sg_query_features()
+/// and check the "clamp_to_border" boolean in the returned
+/// sg_features struct.
+///
+/// Platforms which don't support SG_WRAP_CLAMP_TO_BORDER will silently fall back
+/// to SG_WRAP_CLAMP_TO_EDGE without a validation error.
+pub const Wrap = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    REPEAT,
+    CLAMP_TO_EDGE,
+    CLAMP_TO_BORDER,
+    MIRRORED_REPEAT,
+    NUM,
+};
+/// sg_border_color
+///
+/// The border color to use when sampling a texture, and the UV wrap
+/// mode is SG_WRAP_CLAMP_TO_BORDER.
+///
+/// The default border color is SG_BORDERCOLOR_OPAQUE_BLACK
+pub const BorderColor = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    TRANSPARENT_BLACK,
+    OPAQUE_BLACK,
+    OPAQUE_WHITE,
+    NUM,
+};
+/// sg_vertex_format
+///
+/// The data type of a vertex component. This is used to describe
+/// the layout of vertex data when creating a pipeline object.
+pub const VertexFormat = enum(i32) {
+    INVALID,
+    FLOAT,
+    FLOAT2,
+    FLOAT3,
+    FLOAT4,
+    BYTE4,
+    BYTE4N,
+    UBYTE4,
+    UBYTE4N,
+    SHORT2,
+    SHORT2N,
+    USHORT2N,
+    SHORT4,
+    SHORT4N,
+    USHORT4N,
+    UINT10_N2,
+    HALF2,
+    HALF4,
+    NUM,
+};
+/// sg_vertex_step
+///
+/// Defines whether the input pointer of a vertex input stream is advanced
+/// 'per vertex' or 'per instance'. The default step-func is
+/// SG_VERTEXSTEP_PER_VERTEX. SG_VERTEXSTEP_PER_INSTANCE is used with
+/// instanced-rendering.
+///
+/// The vertex-step is part of the vertex-layout definition
+/// when creating pipeline objects.
+pub const VertexStep = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    PER_VERTEX,
+    PER_INSTANCE,
+    NUM,
+};
+/// sg_uniform_type
+///
+/// The data type of a uniform block member. This is used to
+/// describe the internal layout of uniform blocks when creating
+/// a shader object. This is only required for the GL backend, all
+/// other backends will ignore the interior layout of uniform blocks.
+pub const UniformType = enum(i32) {
+    INVALID,
+    FLOAT,
+    FLOAT2,
+    FLOAT3,
+    FLOAT4,
+    INT,
+    INT2,
+    INT3,
+    INT4,
+    MAT4,
+    NUM,
+};
+/// sg_uniform_layout
+///
+/// A hint for the interior memory layout of uniform blocks. This is
+/// only relevant for the GL backend where the internal layout
+/// of uniform blocks must be known to sokol-gfx. For all other backends the
+/// internal memory layout of uniform blocks doesn't matter, sokol-gfx
+/// will just pass uniform data as a single memory blob to the
+/// 3D backend.
+///
+/// SG_UNIFORMLAYOUT_NATIVE (default)
+///     Native layout means that a 'backend-native' memory layout
+///     is used. For the GL backend this means that uniforms
+///     are packed tightly in memory (e.g. there are no padding
+///     bytes).
+///
+/// SG_UNIFORMLAYOUT_STD140
+///     The memory layout is a subset of std140. Arrays are only
+///     allowed for the FLOAT4, INT4 and MAT4. Alignment is as
+///     is as follows:
+///
+///         FLOAT, INT:         4 byte alignment
+///         FLOAT2, INT2:       8 byte alignment
+///         FLOAT3, INT3:       16 byte alignment(!)
+///         FLOAT4, INT4:       16 byte alignment
+///         MAT4:               16 byte alignment
+///         FLOAT4[], INT4[]:   16 byte alignment
+///
+///     The overall size of the uniform block must be a multiple
+///     of 16.
+///
+/// For more information search for 'UNIFORM DATA LAYOUT' in the documentation block
+/// at the start of the header.
+pub const UniformLayout = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    /// default: layout depends on currently active backend
+    NATIVE,
+    /// std140: memory layout according to std140
+    STD140,
+    NUM,
+};
+/// sg_cull_mode
+///
+/// The face-culling mode, this is used in the
+/// sg_pipeline_desc.cull_mode member when creating a
+/// pipeline object.
+///
+/// The default cull mode is SG_CULLMODE_NONE
+pub const CullMode = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    NONE,
+    FRONT,
+    BACK,
+    NUM,
+};
+/// sg_face_winding
+///
+/// The vertex-winding rule that determines a front-facing primitive. This
+/// is used in the member sg_pipeline_desc.face_winding
+/// when creating a pipeline object.
+///
+/// The default winding is SG_FACEWINDING_CW (clockwise)
+pub const FaceWinding = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    CCW,
+    CW,
+    NUM,
+};
+/// sg_compare_func
+///
+/// The compare-function for configuring depth- and stencil-ref tests
+/// in pipeline objects, and for texture samplers which perform a comparison
+/// instead of regular sampling operation.
+///
+/// Used in the following structs:
+///
+/// sg_pipeline_desc
+///     .depth
+///         .compare
+///     .stencil
+///         .front.compare
+///         .back.compar
+///
+/// sg_sampler_desc
+///     .compare
+///
+/// The default compare func for depth- and stencil-tests is
+/// SG_COMPAREFUNC_ALWAYS.
+///
+/// The default compare func for samplers is SG_COMPAREFUNC_NEVER.
+pub const CompareFunc = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    NEVER,
+    LESS,
+    EQUAL,
+    LESS_EQUAL,
+    GREATER,
+    NOT_EQUAL,
+    GREATER_EQUAL,
+    ALWAYS,
+    NUM,
+};
+/// sg_stencil_op
+///
+/// The operation performed on a currently stored stencil-value when a
+/// comparison test passes or fails. This is used when creating a pipeline
+/// object in the following sg_pipeline_desc struct items:
+///
+/// sg_pipeline_desc
+///     .stencil
+///         .front
+///             .fail_op
+///             .depth_fail_op
+///             .pass_op
+///         .back
+///             .fail_op
+///             .depth_fail_op
+///             .pass_op
+///
+/// The default value is SG_STENCILOP_KEEP.
+pub const StencilOp = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    KEEP,
+    ZERO,
+    REPLACE,
+    INCR_CLAMP,
+    DECR_CLAMP,
+    INVERT,
+    INCR_WRAP,
+    DECR_WRAP,
+    NUM,
+};
+/// sg_blend_factor
+///
+/// The source and destination factors in blending operations.
+/// This is used in the following members when creating a pipeline object:
+///
+/// sg_pipeline_desc
+///     .colors[i]
+///         .blend
+///             .src_factor_rgb
+///             .dst_factor_rgb
+///             .src_factor_alpha
+///             .dst_factor_alpha
+///
+/// The default value is SG_BLENDFACTOR_ONE for source
+/// factors, and SG_BLENDFACTOR_ZERO for destination factors.
+pub const BlendFactor = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    ZERO,
+    ONE,
+    SRC_COLOR,
+    ONE_MINUS_SRC_COLOR,
+    SRC_ALPHA,
+    ONE_MINUS_SRC_ALPHA,
+    DST_COLOR,
+    ONE_MINUS_DST_COLOR,
+    DST_ALPHA,
+    ONE_MINUS_DST_ALPHA,
+    SRC_ALPHA_SATURATED,
+    BLEND_COLOR,
+    ONE_MINUS_BLEND_COLOR,
+    BLEND_ALPHA,
+    ONE_MINUS_BLEND_ALPHA,
+    NUM,
+};
+/// sg_blend_op
+///
+/// Describes how the source and destination values are combined in the
+/// fragment blending operation. It is used in the following struct items
+/// when creating a pipeline object:
+///
+/// sg_pipeline_desc
+///     .colors[i]
+///         .blend
+///             .op_rgb
+///             .op_alpha
+///
+/// The default value is SG_BLENDOP_ADD.
+pub const BlendOp = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT,
+    ADD,
+    SUBTRACT,
+    REVERSE_SUBTRACT,
+    NUM,
+};
+/// sg_color_mask
+///
+/// Selects the active color channels when writing a fragment color to the
+/// framebuffer. This is used in the members
+/// sg_pipeline_desc.colors[i].write_mask when creating a pipeline object.
+///
+/// The default colormask is SG_COLORMASK_RGBA (write all colors channels)
+///
+/// NOTE: since the color mask value 0 is reserved for the default value
+/// (SG_COLORMASK_RGBA), use SG_COLORMASK_NONE if all color channels
+/// should be disabled.
+pub const ColorMask = enum(i32) {
+    /// value 0 reserved for default-init
+    DEFAULT = 0,
+    /// special value for 'all channels disabled
+    NONE = 16,
+    R = 1,
+    G = 2,
+    RG = 3,
+    B = 4,
+    RB = 5,
+    GB = 6,
+    RGB = 7,
+    A = 8,
+    RA = 9,
+    GA = 10,
+    RGA = 11,
+    BA = 12,
+    RBA = 13,
+    GBA = 14,
+    RGBA = 15,
+};
+/// sg_load_action
+///
+/// Defines the load action that should be performed at the start of a render pass:
+///
+/// SG_LOADACTION_CLEAR:        clear the render target
+/// SG_LOADACTION_LOAD:         load the previous content of the render target
+/// SG_LOADACTION_DONTCARE:     leave the render target in an undefined state
+///
+/// This is used in the sg_pass_action structure.
+///
+/// The default load action for all pass attachments is SG_LOADACTION_CLEAR,
+/// with the values rgba = { 0.5f, 0.5f, 0.5f, 1.0f }, depth=1.0f and stencil=0.
+///
+/// If you want to override the default behaviour, it is important to not
+/// only set the clear color, but the 'action' field as well (as long as this
+/// is _SG_LOADACTION_DEFAULT, the value fields will be ignored).
+pub const LoadAction = enum(i32) {
+    DEFAULT,
+    CLEAR,
+    LOAD,
+    DONTCARE,
+};
+/// sg_store_action
+///
+/// Defines the store action that should be performed at the end of a render pass:
+///
+/// SG_STOREACTION_STORE:       store the rendered content to the color attachment image
+/// SG_STOREACTION_DONTCARE:    allows the GPU to discard the rendered content
+pub const StoreAction = enum(i32) {
+    DEFAULT,
+    STORE,
+    DONTCARE,
+};
+/// sg_pass_action
+///
+/// The sg_pass_action struct defines the actions to be performed
+/// at the start and end of a render pass.
+///
+/// - at the start of the pass: whether the render attachments should be cleared,
+///   loaded with their previous content, or start in an undefined state
+/// - for clear operations: the clear value (color, depth, or stencil values)
+/// - at the end of the pass: whether the rendering result should be
+///   stored back into the render attachment or discarded
+pub const ColorAttachmentAction = extern struct {
+    /// default: SG_LOADACTION_CLEAR
+    load_action: LoadAction = .DEFAULT,
+    /// default: SG_STOREACTION_STORE
+    store_action: StoreAction = .DEFAULT,
+    /// default: { 0.5f, 0.5f, 0.5f, 1.0f }
+    clear_value: Color = .{},
+};
+comptime {
+    checkLayout(ColorAttachmentAction, 24, 4, .{ .load_action = 0, .store_action = 4, .clear_value = 8 });
+}
+pub const DepthAttachmentAction = extern struct {
+    /// default: SG_LOADACTION_CLEAR
+    load_action: LoadAction = .DEFAULT,
+    /// default: SG_STOREACTION_DONTCARE
+    store_action: StoreAction = .DEFAULT,
+    /// default: 1.0
+    clear_value: f32 = 0.0,
+};
+comptime {
+    checkLayout(DepthAttachmentAction, 12, 4, .{ .load_action = 0, .store_action = 4, .clear_value = 8 });
+}
+pub const StencilAttachmentAction = extern struct {
+    /// default: SG_LOADACTION_CLEAR
+    load_action: LoadAction = .DEFAULT,
+    /// default: SG_STOREACTION_DONTCARE
+    store_action: StoreAction = .DEFAULT,
+    /// default: 0
+    clear_value: u8 = 0,
+};
+comptime {
+    checkLayout(StencilAttachmentAction, 12, 4, .{ .load_action = 0, .store_action = 4, .clear_value = 8 });
+}
+pub const PassAction = extern struct {
+    colors: [4]ColorAttachmentAction = @import("std").mem.zeroes([4]ColorAttachmentAction),
+    depth: DepthAttachmentAction = .{},
+    stencil: StencilAttachmentAction = .{},
+};
+comptime {
+    checkLayout(PassAction, 120, 4, .{ .colors = 0, .depth = 96, .stencil = 108 });
+}
+/// sg_swapchain
+///
+/// Used in sg_begin_pass() to provide details about an external swapchain
+/// (pixel formats, sample count and backend-API specific render surface objects).
+///
+/// The following information must be provided:
+///
+/// - the width and height of the swapchain surfaces in number of pixels,
+/// - the pixel format of the render- and optional msaa-resolve-surface
+/// - the pixel format of the optional depth- or depth-stencil-surface
+/// - the MSAA sample count for the render and depth-stencil surface
+///
+/// If the pixel formats and MSAA sample counts are left zero-initialized,
+/// their defaults are taken from the sg_environment struct provided in the
+/// sg_setup() call.
+///
+/// The width and height *must* be > 0.
+///
+/// Additionally the following backend API specific objects must be passed in
+/// as 'type erased' void pointers:
+///
+/// GL:
+///     - on all GL backends, a GL framebuffer object must be provided. This
+///       can be zero for the default framebuffer.
+///
+/// D3D11:
+///     - an ID3D11RenderTargetView for the rendering surface, without
+///       MSAA rendering this surface will also be displayed
+///     - an optional ID3D11DepthStencilView for the depth- or depth/stencil
+///       buffer surface
+///     - when MSAA rendering is used, another ID3D11RenderTargetView
+///       which serves as MSAA resolve target and will be displayed
+///
+/// WebGPU (same as D3D11, except different types)
+///     - a WGPUTextureView for the rendering surface, without
+///       MSAA rendering this surface will also be displayed
+///     - an optional WGPUTextureView for the depth- or depth/stencil
+///       buffer surface
+///     - when MSAA rendering is used, another WGPUTextureView
+///       which serves as MSAA resolve target and will be displayed
+///
+/// Metal (NOTE that the roles of provided surfaces is slightly different
+/// than on D3D11 or WebGPU in case of MSAA vs non-MSAA rendering):
+///
+///     - A current CAMetalDrawable (NOT an MTLDrawable!) which will be presented.
+///       This will either be rendered to directly (if no MSAA is used), or serve
+///       as MSAA-resolve target.
+///     - an optional MTLTexture for the depth- or depth-stencil buffer
+///     - an optional multisampled MTLTexture which serves as intermediate
+///       rendering surface which will then be resolved into the
+///       CAMetalDrawable.
+///
+/// NOTE that for Metal you must use an ObjC __bridge cast to
+/// properly tunnel the ObjC object id through a C void*, e.g.:
+///
+///     swapchain.metal.current_drawable = (__bridge const void*) [mtkView currentDrawable];
+///
+/// On all other backends you shouldn't need to mess with the reference count.
+///
+/// It's a good practice to write a helper function which returns an initialized
+/// sg_swapchain structs, which can then be plugged directly into
+/// sg_pass.swapchain. Look at the function sglue_swapchain() in the sokol_glue.h
+/// as an example.
+pub const MetalSwapchain = extern struct {
+    /// CAMetalDrawable (NOT MTLDrawable!!!)
+    current_drawable: ?*const anyopaque = null,
+    /// MTLTexture
+    depth_stencil_texture: ?*const anyopaque = null,
+    /// MTLTexture
+    msaa_color_texture: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(MetalSwapchain, 24, 8, .{ .current_drawable = 0, .depth_stencil_texture = 8, .msaa_color_texture = 16 });
+}
+pub const D3d11Swapchain = extern struct {
+    /// ID3D11RenderTargetView
+    render_view: ?*const anyopaque = null,
+    /// ID3D11RenderTargetView
+    resolve_view: ?*const anyopaque = null,
+    /// ID3D11DepthStencilView
+    depth_stencil_view: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(D3d11Swapchain, 24, 8, .{ .render_view = 0, .resolve_view = 8, .depth_stencil_view = 16 });
+}
+pub const WgpuSwapchain = extern struct {
+    /// WGPUTextureView
+    render_view: ?*const anyopaque = null,
+    /// WGPUTextureView
+    resolve_view: ?*const anyopaque = null,
+    /// WGPUTextureView
+    depth_stencil_view: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(WgpuSwapchain, 24, 8, .{ .render_view = 0, .resolve_view = 8, .depth_stencil_view = 16 });
+}
+pub const GlSwapchain = extern struct {
+    /// GL framebuffer object
+    framebuffer: u32 = 0,
+};
+comptime {
+    checkLayout(GlSwapchain, 4, 4, .{ .framebuffer = 0 });
+}
+pub const Swapchain = extern struct {
+    width: i32 = 0,
+    height: i32 = 0,
+    sample_count: i32 = 0,
+    color_format: PixelFormat = .DEFAULT,
+    depth_format: PixelFormat = .DEFAULT,
+    metal: MetalSwapchain = .{},
+    d3d11: D3d11Swapchain = .{},
+    wgpu: WgpuSwapchain = .{},
+    gl: GlSwapchain = .{},
+};
+comptime {
+    checkLayout(Swapchain, 104, 8, .{ .width = 0, .height = 4, .sample_count = 8, .color_format = 12, .depth_format = 16, .metal = 24, .d3d11 = 48, .wgpu = 72, .gl = 96 });
+}
+/// sg_pass
+///
+/// The sg_pass structure is passed as argument into the sg_begin_pass()
+/// function.
+///
+/// For an offscreen rendering pass, an sg_pass_action struct and sg_attachments
+/// object must be provided, and for swapchain passes, an sg_pass_action and
+/// an sg_swapchain struct. It is an error to provide both an sg_attachments
+/// handle and an initialized sg_swapchain struct in the same sg_begin_pass().
+///
+/// An sg_begin_pass() call for an offscreen pass would look like this (where
+/// `attachments` is an sg_attachments handle):
+///
+///     sg_begin_pass(&(sg_pass){
+///         .action = { ... },
+///         .attachments = attachments,
+///     });
+///
+/// ...and a swapchain render pass would look like this (using the sokol_glue.h
+/// helper function sglue_swapchain() which gets the swapchain properties from
+/// sokol_app.h):
+///
+///     sg_begin_pass(&(sg_pass){
+///         .action = { ... },
+///         .swapchain = sglue_swapchain(),
+///     });
+///
+/// You can also omit the .action object to get default pass action behaviour
+/// (clear to color=grey, depth=1 and stencil=0).
+pub const Pass = extern struct {
+    _start_canary: u32 = 0,
+    action: PassAction = .{},
+    attachments: Attachments = .{},
+    swapchain: Swapchain = .{},
+    label: [*c]const u8 = null,
+    _end_canary: u32 = 0,
+};
+comptime {
+    checkLayout(Pass, 248, 8, .{ ._start_canary = 0, .action = 4, .attachments = 124, .swapchain = 128, .label = 232, ._end_canary = 240 });
+}
+/// sg_bindings
+///
+/// The sg_bindings structure defines the buffers, images and
+/// samplers resource bindings for the next draw call.
+///
+/// To update the resource bindings, call sg_apply_bindings() with
+/// a pointer to a populated sg_bindings struct. Note that
+/// sg_apply_bindings() must be called after sg_apply_pipeline()
+/// and that bindings are not preserved across sg_apply_pipeline()
+/// calls, even when the new pipeline uses the same 'bindings layout'.
+///
+/// A resource binding struct contains:
+///
+/// - 1..N vertex buffers
+/// - 0..N vertex buffer offsets
+/// - 0..1 index buffers
+/// - 0..1 index buffer offsets
+/// - 0..N images
+/// - 0..N samplers
+/// - 0..N storage buffers
+///
+/// Where 'N' is defined in the following constants:
+///
+/// - SG_MAX_VERTEXBUFFER_BINDSLOTS
+/// - SG_MAX_IMAGE_BINDLOTS
+/// - SG_MAX_SAMPLER_BINDSLOTS
+/// - SG_MAX_STORAGEBUFFER_BINDGLOTS
+///
+/// When using sokol-shdc for shader authoring, the `layout(binding=N)`
+/// annotation in the shader code directly maps to the slot index for that
+/// resource type in the bindings struct, for instance the following vertex-
+/// and fragment-shader interface for sokol-shdc:
+///
+///     @vs vs
+///     layout(binding=0) uniform vs_params { ... };
+///     layout(binding=0) readonly buffer ssbo { ... };
+///     layout(binding=0) uniform texture2D vs_tex;
+///     layout(binding=0) uniform sampler vs_smp;
+///     ...
+///     @end
+///
+///     @fs fs
+///     layout(binding=1) uniform fs_params { ... };
+///     layout(binding=1) uniform texture2D fs_tex;
+///     layout(binding=1) uniform sampler fs_smp;
+///     ...
+///     @end
+///
+/// ...would map to the following sg_bindings struct:
+///
+///     const sg_bindings bnd = {
+///         .vertex_buffers[0] = ...,
+///         .images[0] = vs_tex,
+///         .images[1] = fs_tex,
+///         .samplers[0] = vs_smp,
+///         .samplers[1] = fs_smp,
+///         .storage_buffers[0] = ssbo,
+///     };
+///
+/// ...alternatively you can use code-generated slot indices:
+///
+///     const sg_bindings bnd = {
+///         .vertex_buffers[0] = ...,
+///         .images[IMG_vs_tex] = vs_tex,
+///         .images[IMG_fs_tex] = fs_tex,
+///         .samplers[SMP_vs_smp] = vs_smp,
+///         .samplers[SMP_fs_smp] = fs_smp,
+///         .storage_buffers[SBUF_ssbo] = ssbo,
+///     };
+///
+/// Resource bindslots for a specific shader/pipeline may have gaps, and an
+/// sg_bindings struct may have populated bind slots which are not used by a
+/// specific shader. This allows to use the same sg_bindings struct across
+/// different shader variants.
+///
+/// When not using sokol-shdc, the bindslot indices in the sg_bindings
+/// struct need to match the per-resource reflection info slot indices
+/// in the sg_shader_desc struct (for details about that see the
+/// sg_shader_desc struct documentation).
+///
+/// The optional buffer offsets can be used to put different unrelated
+/// chunks of vertex- and/or index-data into the same buffer objects.
+pub const Bindings = extern struct {
+    _start_canary: u32 = 0,
+    vertex_buffers: [8]Buffer = @import("std").mem.zeroes([8]Buffer),
+    vertex_buffer_offsets: [8]i32 = @import("std").mem.zeroes([8]i32),
+    index_buffer: Buffer = .{},
+    index_buffer_offset: i32 = 0,
+    images: [16]Image = @import("std").mem.zeroes([16]Image),
+    samplers: [16]Sampler = @import("std").mem.zeroes([16]Sampler),
+    storage_buffers: [8]Buffer = @import("std").mem.zeroes([8]Buffer),
+    _end_canary: u32 = 0,
+};
+comptime {
+    checkLayout(Bindings, 240, 4, .{ ._start_canary = 0, .vertex_buffers = 4, .vertex_buffer_offsets = 36, .index_buffer = 68, .index_buffer_offset = 72, .images = 76, .samplers = 140, .storage_buffers = 204, ._end_canary = 236 });
+}
+/// sg_buffer_desc
+///
+/// Creation parameters for sg_buffer objects, used in the
+/// sg_make_buffer() call.
+///
+/// The default configuration is:
+///
+/// .size:      0       (*must* be >0 for buffers without data)
+/// .type:      SG_BUFFERTYPE_VERTEXBUFFER
+/// .usage:     SG_USAGE_IMMUTABLE
+/// .data.ptr   0       (*must* be valid for immutable buffers)
+/// .data.size  0       (*must* be > 0 for immutable buffers)
+/// .label      0       (optional string label)
+///
+/// For immutable buffers which are initialized with initial data,
+/// keep the .size item zero-initialized, and set the size together with the
+/// pointer to the initial data in the .data item.
+///
+/// For mutable buffers without initial data, keep the .data item
+/// zero-initialized, and set the buffer size in the .size item instead.
+///
+/// You can also set both size values, but currently both size values must
+/// be identical (this may change in the future when the dynamic resource
+/// management may become more flexible).
+///
+/// ADVANCED TOPIC: Injecting native 3D-API buffers:
+///
+/// The following struct members allow to inject your own GL, Metal
+/// or D3D11 buffers into sokol_gfx:
+///
+/// .gl_buffers[SG_NUM_INFLIGHT_FRAMES]
+/// .mtl_buffers[SG_NUM_INFLIGHT_FRAMES]
+/// .d3d11_buffer
+///
+/// You must still provide all other struct items except the .data item, and
+/// these must match the creation parameters of the native buffers you
+/// provide. For SG_USAGE_IMMUTABLE, only provide a single native 3D-API
+/// buffer, otherwise you need to provide SG_NUM_INFLIGHT_FRAMES buffers
+/// (only for GL and Metal, not D3D11). Providing multiple buffers for GL and
+/// Metal is necessary because sokol_gfx will rotate through them when
+/// calling sg_update_buffer() to prevent lock-stalls.
+///
+/// Note that it is expected that immutable injected buffer have already been
+/// initialized with content, and the .content member must be 0!
+///
+/// Also you need to call sg_reset_state_cache() after calling native 3D-API
+/// functions, and before calling any sokol_gfx function.
+pub const BufferDesc = extern struct {
+    _start_canary: u32 = 0,
+    size: usize = 0,
+    type: BufferType = .DEFAULT,
+    usage: Usage = .DEFAULT,
+    data: Range = .{},
+    label: [*c]const u8 = null,
+    gl_buffers: [2]u32 = @import("std").mem.zeroes([2]u32),
+    mtl_buffers: [2]?*const anyopaque = @import("std").mem.zeroes([2]?*const anyopaque),
+    d3d11_buffer: ?*const anyopaque = null,
+    wgpu_buffer: ?*const anyopaque = null,
+    _end_canary: u32 = 0,
+};
+comptime {
+    checkLayout(BufferDesc, 96, 8, .{ ._start_canary = 0, .size = 8, .type = 16, .usage = 20, .data = 24, .label = 40, .gl_buffers = 48, .mtl_buffers = 56, .d3d11_buffer = 72, .wgpu_buffer = 80, ._end_canary = 88 });
+}
+/// sg_image_data
+///
+/// Defines the content of an image through a 2D array of sg_range structs.
+/// The first array dimension is the cubemap face, and the second array
+/// dimension the mipmap level.
+pub const ImageData = extern struct {
+    subimage: [6][16]Range = @import("std").mem.zeroes([6][16]Range),
+};
+comptime {
+    checkLayout(ImageData, 1536, 8, .{ .subimage = 0 });
+}
+/// sg_image_desc
+///
+/// Creation parameters for sg_image objects, used in the sg_make_image() call.
+///
+/// The default configuration is:
+///
+/// .type:              SG_IMAGETYPE_2D
+/// .render_target:     false
+/// .width              0 (must be set to >0)
+/// .height             0 (must be set to >0)
+/// .num_slices         1 (3D textures: depth; array textures: number of layers)
+/// .num_mipmaps:       1
+/// .usage:             SG_USAGE_IMMUTABLE
+/// .pixel_format:      SG_PIXELFORMAT_RGBA8 for textures, or sg_desc.environment.defaults.color_format for render targets
+/// .sample_count:      1 for textures, or sg_desc.environment.defaults.sample_count for render targets
+/// .data               an sg_image_data struct to define the initial content
+/// .label              0 (optional string label for trace hooks)
+///
+/// Q: Why is the default sample_count for render targets identical with the
+/// "default sample count" from sg_desc.environment.defaults.sample_count?
+///
+/// A: So that it matches the default sample count in pipeline objects. Even
+/// though it is a bit strange/confusing that offscreen render targets by default
+/// get the same sample count as 'default swapchains', but it's better that
+/// an offscreen render target created with default parameters matches
+/// a pipeline object created with default parameters.
+///
+/// NOTE:
+///
+/// Images with usage SG_USAGE_IMMUTABLE must be fully initialized by
+/// providing a valid .data member which points to initialization data.
+///
+/// ADVANCED TOPIC: Injecting native 3D-API textures:
+///
+/// The following struct members allow to inject your own GL, Metal or D3D11
+/// textures into sokol_gfx:
+///
+/// .gl_textures[SG_NUM_INFLIGHT_FRAMES]
+/// .mtl_textures[SG_NUM_INFLIGHT_FRAMES]
+/// .d3d11_texture
+/// .d3d11_shader_resource_view
+/// .wgpu_texture
+/// .wgpu_texture_view
+///
+/// For GL, you can also specify the texture target or leave it empty to use
+/// the default texture target for the image type (GL_TEXTURE_2D for
+/// SG_IMAGETYPE_2D etc)
+///
+/// For D3D11 and WebGPU, either only provide a texture, or both a texture and
+/// shader-resource-view / texture-view object. If you want to use access the
+/// injected texture in a shader you *must* provide a shader-resource-view.
+///
+/// The same rules apply as for injecting native buffers (see sg_buffer_desc
+/// documentation for more details).
+pub const ImageDesc = extern struct {
+    _start_canary: u32 = 0,
+    type: ImageType = .DEFAULT,
+    render_target: bool = false,
+    width: i32 = 0,
+    height: i32 = 0,
+    num_slices: i32 = 0,
+    num_mipmaps: i32 = 0,
+    usage: Usage = .DEFAULT,
+    pixel_format: PixelFormat = .DEFAULT,
+    sample_count: i32 = 0,
+    data: ImageData = .{},
+    label: [*c]const u8 = null,
+    gl_textures: [2]u32 = @import("std").mem.zeroes([2]u32),
+    gl_texture_target: u32 = 0,
+    mtl_textures: [2]?*const anyopaque = @import("std").mem.zeroes([2]?*const anyopaque),
+    d3d11_texture: ?*const anyopaque = null,
+    d3d11_shader_resource_view: ?*const anyopaque = null,
+    wgpu_texture: ?*const anyopaque = null,
+    wgpu_texture_view: ?*const anyopaque = null,
+    _end_canary: u32 = 0,
+};
+comptime {
+    checkLayout(ImageDesc, 1656, 8, .{ ._start_canary = 0, .type = 4, .render_target = 8, .width = 12, .height = 16, .num_slices = 20, .num_mipmaps = 24, .usage = 28, .pixel_format = 32, .sample_count = 36, .data = 40, .label = 1576, .gl_textures = 1584, .gl_texture_target = 1592, .mtl_textures = 1600, .d3d11_texture = 1616, .d3d11_shader_resource_view = 1624, .wgpu_texture = 1632, .wgpu_texture_view = 1640, ._end_canary = 1648 });
+}
+/// sg_sampler_desc
+///
+/// Creation parameters for sg_sampler objects, used in the sg_make_sampler() call
+///
+/// .min_filter:        SG_FILTER_NEAREST
+/// .mag_filter:        SG_FILTER_NEAREST
+/// .mipmap_filter      SG_FILTER_NEAREST
+/// .wrap_u:            SG_WRAP_REPEAT
+/// .wrap_v:            SG_WRAP_REPEAT
+/// .wrap_w:            SG_WRAP_REPEAT (only SG_IMAGETYPE_3D)
+/// .min_lod            0.0f
+/// .max_lod            FLT_MAX
+/// .border_color       SG_BORDERCOLOR_OPAQUE_BLACK
+/// .compare            SG_COMPAREFUNC_NEVER
+/// .max_anisotropy     1 (must be 1..16)
+pub const SamplerDesc = extern struct {
+    _start_canary: u32 = 0,
+    min_filter: Filter = .DEFAULT,
+    mag_filter: Filter = .DEFAULT,
+    mipmap_filter: Filter = .DEFAULT,
+    wrap_u: Wrap = .DEFAULT,
+    wrap_v: Wrap = .DEFAULT,
+    wrap_w: Wrap = .DEFAULT,
+    min_lod: f32 = 0.0,
+    max_lod: f32 = 0.0,
+    border_color: BorderColor = .DEFAULT,
+    compare: CompareFunc = .DEFAULT,
+    max_anisotropy: u32 = 0,
+    label: [*c]const u8 = null,
+    gl_sampler: u32 = 0,
+    mtl_sampler: ?*const anyopaque = null,
+    d3d11_sampler: ?*const anyopaque = null,
+    wgpu_sampler: ?*const anyopaque = null,
+    _end_canary: u32 = 0,
+};
+comptime {
+    checkLayout(SamplerDesc, 96, 8, .{ ._start_canary = 0, .min_filter = 4, .mag_filter = 8, .mipmap_filter = 12, .wrap_u = 16, .wrap_v = 20, .wrap_w = 24, .min_lod = 28, .max_lod = 32, .border_color = 36, .compare = 40, .max_anisotropy = 44, .label = 48, .gl_sampler = 56, .mtl_sampler = 64, .d3d11_sampler = 72, .wgpu_sampler = 80, ._end_canary = 88 });
+}
+/// sg_shader_desc
+///
+/// Used as parameter of sg_make_shader() to create a shader object which
+/// communicates shader source or bytecode and shader interface
+/// reflection information to sokol-gfx.
+///
+/// If you use sokol-shdc you can ignore the following information since
+/// the sg_shader_desc struct will be code generated.
+///
+/// Otherwise you need to provide the following information to the
+/// sg_make_shader() call:
+///
+/// - a vertex- and fragment-shader function:
+///     - the shader source or bytecode
+///     - an optional entry point name
+///     - for D3D11: an optional compile target when source code is provided
+///       (the defaults are "vs_4_0" and "ps_4_0")
+///
+/// - vertex attributes required by some backends:
+///     - for the GL backend: optional vertex attribute names
+///       used for name lookup
+///     - for the D3D11 backend: semantic names and indices
+///
+/// - reflection information for each uniform block used by the shader:
+///     - the shader stage the uniform block appears in (SG_SHADERSTAGE_*)
+///     - the size in bytes of the uniform block
+///     - backend-specific bindslots:
+///         - HLSL: the constant buffer register `register(b0..7)`
+///         - MSL: the buffer attribute `[[buffer(0..7)]]`
+///         - WGSL: the binding in `@group(0) @binding(0..15)`
+///     - GLSL only: a description of the uniform block interior
+///         - the memory layout standard (SG_UNIFORMLAYOUT_*)
+///         - for each member in the uniform block:
+///             - the member type (SG_UNIFORM_*)
+///             - if the member is an array, the array count
+///             - the member name
+///
+/// - reflection information for each texture used by the shader:
+///     - the shader stage the texture appears in (SG_SHADERSTAGE_*)
+///     - the image type (SG_IMAGETYPE_*)
+///     - the image-sample type (SG_IMAGESAMPLETYPE_*)
+///     - whether the texture is multisampled
+///     - backend specific bindslots:
+///         - HLSL: the texture register `register(t0..23)`
+///         - MSL: the texture attribute `[[texture(0..15)]]`
+///         - WGSL: the binding in `@group(1) @binding(0..127)`
+///
+/// - reflection information for each sampler used by the shader:
+///     - the shader stage the sampler appears in (SG_SHADERSTAGE_*)
+///     - the sampler type (SG_SAMPLERTYPE_*)
+///     - backend specific bindslots:
+///         - HLSL: the sampler register `register(s0..15)`
+///         - MSL: the sampler attribute `[[sampler(0..15)]]`
+///         - WGSL: the binding in `@group(0) @binding(0..127)`
+///
+/// - reflection information for each storage buffer used by the shader:
+///     - the shader stage the storage buffer appears in (SG_SHADERSTAGE_*)
+///     - whether the storage buffer is readonly (currently this must
+///       always be true)
+///     - backend specific bindslots:
+///         - HLSL: the texture(sic) register `register(t0..23)`
+///         - MSL: the buffer attribute `[[buffer(8..15)]]`
+///         - WGSL: the binding in `@group(1) @binding(0..127)`
+///         - GL: the binding in `layout(binding=0..16)`
+///
+/// - reflection information for each combined image-sampler object
+///   used by the shader:
+///     - the shader stage (SG_SHADERSTAGE_*)
+///     - the texture's array index in the sg_shader_desc.images[] array
+///     - the sampler's array index in the sg_shader_desc.samplers[] array
+///     - GLSL only: the name of the combined image-sampler object
+///
+/// The number and order of items in the sg_shader_desc.attrs[]
+/// array corresponds to the items in sg_pipeline_desc.layout.attrs.
+///
+///     - sg_shader_desc.attrs[N] => sg_pipeline_desc.layout.attrs[N]
+///
+/// NOTE that vertex attribute indices currently cannot have gaps.
+///
+/// The items index in the sg_shader_desc.uniform_blocks[] array corresponds
+/// to the ub_slot arg in sg_apply_uniforms():
+///
+///     - sg_shader_desc.uniform_blocks[N] => sg_apply_uniforms(N, ...)
+///
+/// The items in the shader_desc images, samplers and storage_buffers
+/// arrays correspond to the same array items in the sg_bindings struct:
+///
+///     - sg_shader_desc.images[N] => sg_bindings.images[N]
+///     - sg_shader_desc.samplers[N] => sg_bindings.samplers[N]
+///     - sg_shader_desc.storage_buffers[N] => sg_bindings.storage_buffers[N]
+///
+/// For all GL backends, shader source-code must be provided. For D3D11 and Metal,
+/// either shader source-code or byte-code can be provided.
+///
+/// NOTE that the uniform block, image, sampler and storage_buffer arrays
+/// can have gaps. This allows to use the same sg_bindings struct for
+/// different related shader variants.
+///
+/// For D3D11, if source code is provided, the d3dcompiler_47.dll will be loaded
+/// on demand. If this fails, shader creation will fail. When compiling HLSL
+/// source code, you can provide an optional target string via
+/// sg_shader_stage_desc.d3d11_target, the default target is "vs_4_0" for the
+/// vertex shader stage and "ps_4_0" for the pixel shader stage.
+pub const ShaderStage = enum(i32) {
+    NONE,
+    VERTEX,
+    FRAGMENT,
+};
+pub const ShaderFunction = extern struct {
+    source: [*c]const u8 = null,
+    bytecode: Range = .{},
+    entry: [*c]const u8 = null,
+    /// default: "vs_4_0" or "ps_4_0"
+    d3d11_target: [*c]const u8 = null,
+};
+comptime {
+    checkLayout(ShaderFunction, 40, 8, .{ .source = 0, .bytecode = 8, .entry = 24, .d3d11_target = 32 });
+}
+pub const ShaderVertexAttr = extern struct {
+    /// [optional] GLSL attribute name
+    glsl_name: [*c]const u8 = null,
+    /// HLSL semantic name
+    hlsl_sem_name: [*c]const u8 = null,
+    /// HLSL semantic index
+    hlsl_sem_index: u8 = 0,
+};
+comptime {
+    checkLayout(ShaderVertexAttr, 24, 8, .{ .glsl_name = 0, .hlsl_sem_name = 8, .hlsl_sem_index = 16 });
+}
+pub const GlslShaderUniform = extern struct {
+    type: UniformType = .INVALID,
+    /// 0 or 1 for scalars, >1 for arrays
+    array_count: u16 = 0,
+    /// glsl name binding is required on GL 4.1 and WebGL2
+    glsl_name: [*c]const u8 = null,
+};
+comptime {
+    checkLayout(GlslShaderUniform, 16, 8, .{ .type = 0, .array_count = 4, .glsl_name = 8 });
+}
+pub const ShaderUniformBlock = extern struct {
+    stage: ShaderStage = .NONE,
+    size: u32 = 0,
+    /// HLSL register(bn)
+    hlsl_register_b_n: u8 = 0,
+    /// MSL [[buffer(n)]]
+    msl_buffer_n: u8 = 0,
+    /// WGSL @group(0) @binding(n)
+    wgsl_group0_binding_n: u8 = 0,
+    layout: UniformLayout = .DEFAULT,
+    glsl_uniforms: [16]GlslShaderUniform = @import("std").mem.zeroes([16]GlslShaderUniform),
+};
+comptime {
+    checkLayout(ShaderUniformBlock, 272, 8, .{ .stage = 0, .size = 4, .hlsl_register_b_n = 8, .msl_buffer_n = 9, .wgsl_group0_binding_n = 10, .layout = 12, .glsl_uniforms = 16 });
+}
+pub const ShaderImage = extern struct {
+    stage: ShaderStage = .NONE,
+    image_type: ImageType = .DEFAULT,
+    sample_type: ImageSampleType = .DEFAULT,
+    multisampled: bool = false,
+    /// HLSL register(tn) bind slot
+    hlsl_register_t_n: u8 = 0,
+    /// MSL [[texture(n)]] bind slot
+    msl_texture_n: u8 = 0,
+    /// WGSL @group(1) @binding(n) bind slot
+    wgsl_group1_binding_n: u8 = 0,
+};
+comptime {
+    checkLayout(ShaderImage, 16, 4, .{ .stage = 0, .image_type = 4, .sample_type = 8, .multisampled = 12, .hlsl_register_t_n = 13, .msl_texture_n = 14, .wgsl_group1_binding_n = 15 });
+}
+pub const ShaderSampler = extern struct {
+    stage: ShaderStage = .NONE,
+    sampler_type: SamplerType = .DEFAULT,
+    /// HLSL register(sn) bind slot
+    hlsl_register_s_n: u8 = 0,
+    /// MSL [[sampler(n)]] bind slot
+    msl_sampler_n: u8 = 0,
+    /// WGSL @group(1) @binding(n) bind slot
+    wgsl_group1_binding_n: u8 = 0,
+};
+comptime {
+    checkLayout(ShaderSampler, 12, 4, .{ .stage = 0, .sampler_type = 4, .hlsl_register_s_n = 8, .msl_sampler_n = 9, .wgsl_group1_binding_n = 10 });
+}
+pub const ShaderStorageBuffer = extern struct {
+    stage: ShaderStage = .NONE,
+    readonly: bool = false,
+    /// HLSL register(tn) bind slot
+    hlsl_register_t_n: u8 = 0,
+    /// MSL [[buffer(n)]] bind slot
+    msl_buffer_n: u8 = 0,
+    /// WGSL @group(1) @binding(n) bind slot
+    wgsl_group1_binding_n: u8 = 0,
+    /// GLSL layout(binding=n)
+    glsl_binding_n: u8 = 0,
+};
+comptime {
+    checkLayout(ShaderStorageBuffer, 12, 4, .{ .stage = 0, .readonly = 4, .hlsl_register_t_n = 5, .msl_buffer_n = 6, .wgsl_group1_binding_n = 7, .glsl_binding_n = 8 });
+}
+pub const ShaderImageSamplerPair = extern struct {
+    stage: ShaderStage = .NONE,
+    image_slot: u8 = 0,
+    sampler_slot: u8 = 0,
+    /// glsl name binding required because of GL 4.1 and WebGL2
+    glsl_name: [*c]const u8 = null,
+};
+comptime {
+    checkLayout(ShaderImageSamplerPair, 16, 8, .{ .stage = 0, .image_slot = 4, .sampler_slot = 5, .glsl_name = 8 });
+}
+pub const ShaderDesc = extern struct {
+    _start_canary: u32 = 0,
+    vertex_func: ShaderFunction = .{},
+    fragment_func: ShaderFunction = .{},
+    attrs: [16]ShaderVertexAttr = @import("std").mem.zeroes([16]ShaderVertexAttr),
+    uniform_blocks: [8]ShaderUniformBlock = @import("std").mem.zeroes([8]ShaderUniformBlock),
+    storage_buffers: [8]ShaderStorageBuffer = @import("std").mem.zeroes([8]ShaderStorageBuffer),
+    images: [16]ShaderImage = @import("std").mem.zeroes([16]ShaderImage),
+    samplers: [16]ShaderSampler = @import("std").mem.zeroes([16]ShaderSampler),
+    image_sampler_pairs: [16]ShaderImageSamplerPair = @import("std").mem.zeroes([16]ShaderImageSamplerPair),
+    label: [*c]const u8 = null,
+    _end_canary: u32 = 0,
+};
+comptime {
+    checkLayout(ShaderDesc, 3464, 8, .{ ._start_canary = 0, .vertex_func = 8, .fragment_func = 48, .attrs = 88, .uniform_blocks = 472, .storage_buffers = 2648, .images = 2744, .samplers = 3000, .image_sampler_pairs = 3192, .label = 3448, ._end_canary = 3456 });
+}
+/// sg_pipeline_desc
+///
+/// The sg_pipeline_desc struct defines all creation parameters for an
+/// sg_pipeline object, used as argument to the sg_make_pipeline() function:
+///
+/// - the vertex layout for all input vertex buffers
+/// - a shader object
+/// - the 3D primitive type (points, lines, triangles, ...)
+/// - the index type (none, 16- or 32-bit)
+/// - all the fixed-function-pipeline state (depth-, stencil-, blend-state, etc...)
+///
+/// If the vertex data has no gaps between vertex components, you can omit
+/// the .layout.buffers[].stride and layout.attrs[].offset items (leave them
+/// default-initialized to 0), sokol-gfx will then compute the offsets and
+/// strides from the vertex component formats (.layout.attrs[].format).
+/// Please note that ALL vertex attribute offsets must be 0 in order for the
+/// automatic offset computation to kick in.
+///
+/// The default configuration is as follows:
+///
+/// .shader:                0 (must be initialized with a valid sg_shader id!)
+/// .layout:
+///     .buffers[]:         vertex buffer layouts
+///         .stride:        0 (if no stride is given it will be computed)
+///         .step_func      SG_VERTEXSTEP_PER_VERTEX
+///         .step_rate      1
+///     .attrs[]:           vertex attribute declarations
+///         .buffer_index   0 the vertex buffer bind slot
+///         .offset         0 (offsets can be omitted if the vertex layout has no gaps)
+///         .format         SG_VERTEXFORMAT_INVALID (must be initialized!)
+/// .depth:
+///     .pixel_format:      sg_desc.context.depth_format
+///     .compare:           SG_COMPAREFUNC_ALWAYS
+///     .write_enabled:     false
+///     .bias:              0.0f
+///     .bias_slope_scale:  0.0f
+///     .bias_clamp:        0.0f
+/// .stencil:
+///     .enabled:           false
+///     .front/back:
+///         .compare:       SG_COMPAREFUNC_ALWAYS
+///         .fail_op:       SG_STENCILOP_KEEP
+///         .depth_fail_op: SG_STENCILOP_KEEP
+///         .pass_op:       SG_STENCILOP_KEEP
+///     .read_mask:         0
+///     .write_mask:        0
+///     .ref:               0
+/// .color_count            1
+/// .colors[0..color_count]
+///     .pixel_format       sg_desc.context.color_format
+///     .write_mask:        SG_COLORMASK_RGBA
+///     .blend:
+///         .enabled:           false
+///         .src_factor_rgb:    SG_BLENDFACTOR_ONE
+///         .dst_factor_rgb:    SG_BLENDFACTOR_ZERO
+///         .op_rgb:            SG_BLENDOP_ADD
+///         .src_factor_alpha:  SG_BLENDFACTOR_ONE
+///         .dst_factor_alpha:  SG_BLENDFACTOR_ZERO
+///         .op_alpha:          SG_BLENDOP_ADD
+/// .primitive_type:            SG_PRIMITIVETYPE_TRIANGLES
+/// .index_type:                SG_INDEXTYPE_NONE
+/// .cull_mode:                 SG_CULLMODE_NONE
+/// .face_winding:              SG_FACEWINDING_CW
+/// .sample_count:              sg_desc.context.sample_count
+/// .blend_color:               (sg_color) { 0.0f, 0.0f, 0.0f, 0.0f }
+/// .alpha_to_coverage_enabled: false
+/// .label  0       (optional string label for trace hooks)
+pub const VertexBufferLayoutState = extern struct {
+    stride: i32 = 0,
+    step_func: VertexStep = .DEFAULT,
+    step_rate: i32 = 0,
+};
+comptime {
+    checkLayout(VertexBufferLayoutState, 12, 4, .{ .stride = 0, .step_func = 4, .step_rate = 8 });
+}
+pub const VertexAttrState = extern struct {
+    buffer_index: i32 = 0,
+    offset: i32 = 0,
+    format: VertexFormat = .INVALID,
+};
+comptime {
+    checkLayout(VertexAttrState, 12, 4, .{ .buffer_index = 0, .offset = 4, .format = 8 });
+}
+pub const VertexLayoutState = extern struct {
+    buffers: [8]VertexBufferLayoutState = @import("std").mem.zeroes([8]VertexBufferLayoutState),
+    attrs: [16]VertexAttrState = @import("std").mem.zeroes([16]VertexAttrState),
+};
+comptime {
+    checkLayout(VertexLayoutState, 288, 4, .{ .buffers = 0, .attrs = 96 });
+}
+pub const StencilFaceState = extern struct {
+    compare: CompareFunc = .DEFAULT,
+    fail_op: StencilOp = .DEFAULT,
+    depth_fail_op: StencilOp = .DEFAULT,
+    pass_op: StencilOp = .DEFAULT,
+};
+comptime {
+    checkLayout(StencilFaceState, 16, 4, .{ .compare = 0, .fail_op = 4, .depth_fail_op = 8, .pass_op = 12 });
+}
+pub const StencilState = extern struct {
+    enabled: bool = false,
+    front: StencilFaceState = .{},
+    back: StencilFaceState = .{},
+    read_mask: u8 = 0,
+    write_mask: u8 = 0,
+    ref: u8 = 0,
+};
+comptime {
+    checkLayout(StencilState, 40, 4, .{ .enabled = 0, .front = 4, .back = 20, .read_mask = 36, .write_mask = 37, .ref = 38 });
+}
+pub const DepthState = extern struct {
+    pixel_format: PixelFormat = .DEFAULT,
+    compare: CompareFunc = .DEFAULT,
+    write_enabled: bool = false,
+    bias: f32 = 0.0,
+    bias_slope_scale: f32 = 0.0,
+    bias_clamp: f32 = 0.0,
+};
+comptime {
+    checkLayout(DepthState, 24, 4, .{ .pixel_format = 0, .compare = 4, .write_enabled = 8, .bias = 12, .bias_slope_scale = 16, .bias_clamp = 20 });
+}
+pub const BlendState = extern struct {
+    enabled: bool = false,
+    src_factor_rgb: BlendFactor = .DEFAULT,
+    dst_factor_rgb: BlendFactor = .DEFAULT,
+    op_rgb: BlendOp = .DEFAULT,
+    src_factor_alpha: BlendFactor = .DEFAULT,
+    dst_factor_alpha: BlendFactor = .DEFAULT,
+    op_alpha: BlendOp = .DEFAULT,
+};
+comptime {
+    checkLayout(BlendState, 28, 4, .{ .enabled = 0, .src_factor_rgb = 4, .dst_factor_rgb = 8, .op_rgb = 12, .src_factor_alpha = 16, .dst_factor_alpha = 20, .op_alpha = 24 });
+}
+pub const ColorTargetState = extern struct {
+    pixel_format: PixelFormat = .DEFAULT,
+    write_mask: ColorMask = .DEFAULT,
+    blend: BlendState = .{},
+};
+comptime {
+    checkLayout(ColorTargetState, 36, 4, .{ .pixel_format = 0, .write_mask = 4, .blend = 8 });
+}
+pub const PipelineDesc = extern struct {
+    _start_canary: u32 = 0,
+    shader: Shader = .{},
+    layout: VertexLayoutState = .{},
+    depth: DepthState = .{},
+    stencil: StencilState = .{},
+    color_count: i32 = 0,
+    colors: [4]ColorTargetState = @import("std").mem.zeroes([4]ColorTargetState),
+    primitive_type: PrimitiveType = .DEFAULT,
+    index_type: IndexType = .DEFAULT,
+    cull_mode: CullMode = .DEFAULT,
+    face_winding: FaceWinding = .DEFAULT,
+    sample_count: i32 = 0,
+    blend_color: Color = .{},
+    alpha_to_coverage_enabled: bool = false,
+    label: [*c]const u8 = null,
+    _end_canary: u32 = 0,
+};
+comptime {
+    checkLayout(PipelineDesc, 568, 8, .{ ._start_canary = 0, .shader = 4, .layout = 8, .depth = 296, .stencil = 320, .color_count = 360, .colors = 364, .primitive_type = 508, .index_type = 512, .cull_mode = 516, .face_winding = 520, .sample_count = 524, .blend_color = 528, .alpha_to_coverage_enabled = 544, .label = 552, ._end_canary = 560 });
+}
+/// sg_attachments_desc
+///
+/// Creation parameters for an sg_attachments object, used as argument to the
+/// sg_make_attachments() function.
+///
+/// An attachments object bundles 0..4 color attachments, 0..4 msaa-resolve
+/// attachments, and none or one depth-stencil attachmente for use
+/// in a render pass. At least one color attachment or one depth-stencil
+/// attachment must be provided (no color attachment and a depth-stencil
+/// attachment is useful for a depth-only render pass).
+///
+/// Each attachment definition consists of an image object, and two additional indices
+/// describing which subimage the pass will render into: one mipmap index, and if the image
+/// is a cubemap, array-texture or 3D-texture, the face-index, array-layer or
+/// depth-slice.
+///
+/// All attachments must have the same width and height.
+///
+/// All color attachments and the depth-stencil attachment must have the
+/// same sample count.
+///
+/// If a resolve attachment is set, an MSAA-resolve operation from the
+/// associated color attachment image into the resolve attachment image will take
+/// place in the sg_end_pass() function. In this case, the color attachment
+/// must have a (sample_count>1), and the resolve attachment a
+/// (sample_count==1). The resolve attachment also must have the same pixel
+/// format as the color attachment.
+///
+/// NOTE that MSAA depth-stencil attachments cannot be msaa-resolved!
+pub const AttachmentDesc = extern struct {
+    image: Image = .{},
+    mip_level: i32 = 0,
+    /// cube texture: face; array texture: layer; 3D texture: slice
+    slice: i32 = 0,
+};
+comptime {
+    checkLayout(AttachmentDesc, 12, 4, .{ .image = 0, .mip_level = 4, .slice = 8 });
+}
+pub const AttachmentsDesc = extern struct {
+    _start_canary: u32 = 0,
+    colors: [4]AttachmentDesc = @import("std").mem.zeroes([4]AttachmentDesc),
+    resolves: [4]AttachmentDesc = @import("std").mem.zeroes([4]AttachmentDesc),
+    depth_stencil: AttachmentDesc = .{},
+    label: [*c]const u8 = null,
+    _end_canary: u32 = 0,
+};
+comptime {
+    checkLayout(AttachmentsDesc, 128, 8, .{ ._start_canary = 0, .colors = 4, .resolves = 52, .depth_stencil = 100, .label = 112, ._end_canary = 120 });
+}
+/// sg_trace_hooks
+///
+/// Installable callback functions to keep track of the sokol-gfx calls,
+/// this is useful for debugging, or keeping track of resource creation
+/// and destruction.
+///
+/// Trace hooks are installed with sg_install_trace_hooks(), this returns
+/// another sg_trace_hooks struct with the previous set of
+/// trace hook function pointers. These should be invoked by the
+/// new trace hooks to form a proper call chain.
+pub const TraceHooks = extern struct {
+    user_data: ?*anyopaque = null,
+    reset_state_cache: ?*const fn (?*anyopaque) callconv(.C) void = null,
+    make_buffer: ?*const fn ([*c]const BufferDesc, Buffer, ?*anyopaque) callconv(.C) void = null,
+    make_image: ?*const fn ([*c]const ImageDesc, Image, ?*anyopaque) callconv(.C) void = null,
+    make_sampler: ?*const fn ([*c]const SamplerDesc, Sampler, ?*anyopaque) callconv(.C) void = null,
+    make_shader: ?*const fn ([*c]const ShaderDesc, Shader, ?*anyopaque) callconv(.C) void = null,
+    make_pipeline: ?*const fn ([*c]const PipelineDesc, Pipeline, ?*anyopaque) callconv(.C) void = null,
+    make_attachments: ?*const fn ([*c]const AttachmentsDesc, Attachments, ?*anyopaque) callconv(.C) void = null,
+    destroy_buffer: ?*const fn (Buffer, ?*anyopaque) callconv(.C) void = null,
+    destroy_image: ?*const fn (Image, ?*anyopaque) callconv(.C) void = null,
+    destroy_sampler: ?*const fn (Sampler, ?*anyopaque) callconv(.C) void = null,
+    destroy_shader: ?*const fn (Shader, ?*anyopaque) callconv(.C) void = null,
+    destroy_pipeline: ?*const fn (Pipeline, ?*anyopaque) callconv(.C) void = null,
+    destroy_attachments: ?*const fn (Attachments, ?*anyopaque) callconv(.C) void = null,
+    update_buffer: ?*const fn (Buffer, [*c]const Range, ?*anyopaque) callconv(.C) void = null,
+    update_image: ?*const fn (Image, [*c]const ImageData, ?*anyopaque) callconv(.C) void = null,
+    append_buffer: ?*const fn (Buffer, [*c]const Range, i32, ?*anyopaque) callconv(.C) void = null,
+    begin_pass: ?*const fn ([*c]const Pass, ?*anyopaque) callconv(.C) void = null,
+    apply_viewport: ?*const fn (i32, i32, i32, i32, bool, ?*anyopaque) callconv(.C) void = null,
+    apply_scissor_rect: ?*const fn (i32, i32, i32, i32, bool, ?*anyopaque) callconv(.C) void = null,
+    apply_pipeline: ?*const fn (Pipeline, ?*anyopaque) callconv(.C) void = null,
+    apply_bindings: ?*const fn ([*c]const Bindings, ?*anyopaque) callconv(.C) void = null,
+    apply_uniforms: ?*const fn (i32, [*c]const Range, ?*anyopaque) callconv(.C) void = null,
+    draw: ?*const fn (i32, i32, i32, ?*anyopaque) callconv(.C) void = null,
+    end_pass: ?*const fn (?*anyopaque) callconv(.C) void = null,
+    commit: ?*const fn (?*anyopaque) callconv(.C) void = null,
+    alloc_buffer: ?*const fn (Buffer, ?*anyopaque) callconv(.C) void = null,
+    alloc_image: ?*const fn (Image, ?*anyopaque) callconv(.C) void = null,
+    alloc_sampler: ?*const fn (Sampler, ?*anyopaque) callconv(.C) void = null,
+    alloc_shader: ?*const fn (Shader, ?*anyopaque) callconv(.C) void = null,
+    alloc_pipeline: ?*const fn (Pipeline, ?*anyopaque) callconv(.C) void = null,
+    alloc_attachments: ?*const fn (Attachments, ?*anyopaque) callconv(.C) void = null,
+    dealloc_buffer: ?*const fn (Buffer, ?*anyopaque) callconv(.C) void = null,
+    dealloc_image: ?*const fn (Image, ?*anyopaque) callconv(.C) void = null,
+    dealloc_sampler: ?*const fn (Sampler, ?*anyopaque) callconv(.C) void = null,
+    dealloc_shader: ?*const fn (Shader, ?*anyopaque) callconv(.C) void = null,
+    dealloc_pipeline: ?*const fn (Pipeline, ?*anyopaque) callconv(.C) void = null,
+    dealloc_attachments: ?*const fn (Attachments, ?*anyopaque) callconv(.C) void = null,
+    init_buffer: ?*const fn (Buffer, [*c]const BufferDesc, ?*anyopaque) callconv(.C) void = null,
+    init_image: ?*const fn (Image, [*c]const ImageDesc, ?*anyopaque) callconv(.C) void = null,
+    init_sampler: ?*const fn (Sampler, [*c]const SamplerDesc, ?*anyopaque) callconv(.C) void = null,
+    init_shader: ?*const fn (Shader, [*c]const ShaderDesc, ?*anyopaque) callconv(.C) void = null,
+    init_pipeline: ?*const fn (Pipeline, [*c]const PipelineDesc, ?*anyopaque) callconv(.C) void = null,
+    init_attachments: ?*const fn (Attachments, [*c]const AttachmentsDesc, ?*anyopaque) callconv(.C) void = null,
+    uninit_buffer: ?*const fn (Buffer, ?*anyopaque) callconv(.C) void = null,
+    uninit_image: ?*const fn (Image, ?*anyopaque) callconv(.C) void = null,
+    uninit_sampler: ?*const fn (Sampler, ?*anyopaque) callconv(.C) void = null,
+    uninit_shader: ?*const fn (Shader, ?*anyopaque) callconv(.C) void = null,
+    uninit_pipeline: ?*const fn (Pipeline, ?*anyopaque) callconv(.C) void = null,
+    uninit_attachments: ?*const fn (Attachments, ?*anyopaque) callconv(.C) void = null,
+    fail_buffer: ?*const fn (Buffer, ?*anyopaque) callconv(.C) void = null,
+    fail_image: ?*const fn (Image, ?*anyopaque) callconv(.C) void = null,
+    fail_sampler: ?*const fn (Sampler, ?*anyopaque) callconv(.C) void = null,
+    fail_shader: ?*const fn (Shader, ?*anyopaque) callconv(.C) void = null,
+    fail_pipeline: ?*const fn (Pipeline, ?*anyopaque) callconv(.C) void = null,
+    fail_attachments: ?*const fn (Attachments, ?*anyopaque) callconv(.C) void = null,
+    push_debug_group: ?*const fn ([*c]const u8, ?*anyopaque) callconv(.C) void = null,
+    pop_debug_group: ?*const fn (?*anyopaque) callconv(.C) void = null,
+};
+comptime {
+    checkLayout(TraceHooks, 464, 8, .{ .user_data = 0, .reset_state_cache = 8, .make_buffer = 16, .make_image = 24, .make_sampler = 32, .make_shader = 40, .make_pipeline = 48, .make_attachments = 56, .destroy_buffer = 64, .destroy_image = 72, .destroy_sampler = 80, .destroy_shader = 88, .destroy_pipeline = 96, .destroy_attachments = 104, .update_buffer = 112, .update_image = 120, .append_buffer = 128, .begin_pass = 136, .apply_viewport = 144, .apply_scissor_rect = 152, .apply_pipeline = 160, .apply_bindings = 168, .apply_uniforms = 176, .draw = 184, .end_pass = 192, .commit = 200, .alloc_buffer = 208, .alloc_image = 216, .alloc_sampler = 224, .alloc_shader = 232, .alloc_pipeline = 240, .alloc_attachments = 248, .dealloc_buffer = 256, .dealloc_image = 264, .dealloc_sampler = 272, .dealloc_shader = 280, .dealloc_pipeline = 288, .dealloc_attachments = 296, .init_buffer = 304, .init_image = 312, .init_sampler = 320, .init_shader = 328, .init_pipeline = 336, .init_attachments = 344, .uninit_buffer = 352, .uninit_image = 360, .uninit_sampler = 368, .uninit_shader = 376, .uninit_pipeline = 384, .uninit_attachments = 392, .fail_buffer = 400, .fail_image = 408, .fail_sampler = 416, .fail_shader = 424, .fail_pipeline = 432, .fail_attachments = 440, .push_debug_group = 448, .pop_debug_group = 456 });
+}
+/// sg_buffer_info
+/// sg_image_info
+/// sg_sampler_info
+/// sg_shader_info
+/// sg_pipeline_info
+/// sg_attachments_info
+///
+/// These structs contain various internal resource attributes which
+/// might be useful for debug-inspection. Please don't rely on the
+/// actual content of those structs too much, as they are quite closely
+/// tied to sokol_gfx.h internals and may change more frequently than
+/// the other public API elements.
+///
+/// The *_info structs are used as the return values of the following functions:
+///
+/// sg_query_buffer_info()
+/// sg_query_image_info()
+/// sg_query_sampler_info()
+/// sg_query_shader_info()
+/// sg_query_pipeline_info()
+/// sg_query_pass_info()
+pub const SlotInfo = extern struct {
+    /// the current state of this resource slot
+    state: ResourceState = .INITIAL,
+    /// type-neutral resource if (e.g. sg_buffer.id)
+    res_id: u32 = 0,
+};
+comptime {
+    checkLayout(SlotInfo, 8, 4, .{ .state = 0, .res_id = 4 });
+}
+pub const BufferInfo = extern struct {
+    /// resource pool slot info
+    slot: SlotInfo = .{},
+    /// frame index of last sg_update_buffer()
+    update_frame_index: u32 = 0,
+    /// frame index of last sg_append_buffer()
+    append_frame_index: u32 = 0,
+    /// current position in buffer for sg_append_buffer()
+    append_pos: i32 = 0,
+    /// is buffer in overflow state (due to sg_append_buffer)
+    append_overflow: bool = false,
+    /// number of renaming-slots for dynamically updated buffers
+    num_slots: i32 = 0,
+    /// currently active write-slot for dynamically updated buffers
+    active_slot: i32 = 0,
+};
+comptime {
+    checkLayout(BufferInfo, 32, 4, .{ .slot = 0, .update_frame_index = 8, .append_frame_index = 12, .append_pos = 16, .append_overflow = 20, .num_slots = 24, .active_slot = 28 });
+}
+pub const ImageInfo = extern struct {
+    /// resource pool slot info
+    slot: SlotInfo = .{},
+    /// frame index of last sg_update_image()
+    upd_frame_index: u32 = 0,
+    /// number of renaming-slots for dynamically updated images
+    num_slots: i32 = 0,
+    /// currently active write-slot for dynamically updated images
+    active_slot: i32 = 0,
+};
+comptime {
+    checkLayout(ImageInfo, 20, 4, .{ .slot = 0, .upd_frame_index = 8, .num_slots = 12, .active_slot = 16 });
+}
+pub const SamplerInfo = extern struct {
+    /// resource pool slot info
+    slot: SlotInfo = .{},
+};
+comptime {
+    checkLayout(SamplerInfo, 8, 4, .{ .slot = 0 });
+}
+pub const ShaderInfo = extern struct {
+    /// resource pool slot info
+    slot: SlotInfo = .{},
+};
+comptime {
+    checkLayout(ShaderInfo, 8, 4, .{ .slot = 0 });
+}
+pub const PipelineInfo = extern struct {
+    /// resource pool slot info
+    slot: SlotInfo = .{},
+};
+comptime {
+    checkLayout(PipelineInfo, 8, 4, .{ .slot = 0 });
+}
+pub const AttachmentsInfo = extern struct {
+    /// resource pool slot info
+    slot: SlotInfo = .{},
+};
+comptime {
+    checkLayout(AttachmentsInfo, 8, 4, .{ .slot = 0 });
+}
+/// sg_frame_stats
+///
+/// Allows to track generic and backend-specific stats about a
+/// render frame. Obtained by calling sg_query_frame_stats(). The returned
+/// struct contains information about the *previous* frame.
+pub const FrameStatsGl = extern struct {
+    num_bind_buffer: u32 = 0,
+    num_active_texture: u32 = 0,
+    num_bind_texture: u32 = 0,
+    num_bind_sampler: u32 = 0,
+    num_use_program: u32 = 0,
+    num_render_state: u32 = 0,
+    num_vertex_attrib_pointer: u32 = 0,
+    num_vertex_attrib_divisor: u32 = 0,
+    num_enable_vertex_attrib_array: u32 = 0,
+    num_disable_vertex_attrib_array: u32 = 0,
+    num_uniform: u32 = 0,
+};
+comptime {
+    checkLayout(FrameStatsGl, 44, 4, .{ .num_bind_buffer = 0, .num_active_texture = 4, .num_bind_texture = 8, .num_bind_sampler = 12, .num_use_program = 16, .num_render_state = 20, .num_vertex_attrib_pointer = 24, .num_vertex_attrib_divisor = 28, .num_enable_vertex_attrib_array = 32, .num_disable_vertex_attrib_array = 36, .num_uniform = 40 });
+}
+pub const FrameStatsD3d11Pass = extern struct {
+    num_om_set_render_targets: u32 = 0,
+    num_clear_render_target_view: u32 = 0,
+    num_clear_depth_stencil_view: u32 = 0,
+    num_resolve_subresource: u32 = 0,
+};
+comptime {
+    checkLayout(FrameStatsD3d11Pass, 16, 4, .{ .num_om_set_render_targets = 0, .num_clear_render_target_view = 4, .num_clear_depth_stencil_view = 8, .num_resolve_subresource = 12 });
+}
+pub const FrameStatsD3d11Pipeline = extern struct {
+    num_rs_set_state: u32 = 0,
+    num_om_set_depth_stencil_state: u32 = 0,
+    num_om_set_blend_state: u32 = 0,
+    num_ia_set_primitive_topology: u32 = 0,
+    num_ia_set_input_layout: u32 = 0,
+    num_vs_set_shader: u32 = 0,
+    num_vs_set_constant_buffers: u32 = 0,
+    num_ps_set_shader: u32 = 0,
+    num_ps_set_constant_buffers: u32 = 0,
+};
+comptime {
+    checkLayout(FrameStatsD3d11Pipeline, 36, 4, .{ .num_rs_set_state = 0, .num_om_set_depth_stencil_state = 4, .num_om_set_blend_state = 8, .num_ia_set_primitive_topology = 12, .num_ia_set_input_layout = 16, .num_vs_set_shader = 20, .num_vs_set_constant_buffers = 24, .num_ps_set_shader = 28, .num_ps_set_constant_buffers = 32 });
+}
+pub const FrameStatsD3d11Bindings = extern struct {
+    num_ia_set_vertex_buffers: u32 = 0,
+    num_ia_set_index_buffer: u32 = 0,
+    num_vs_set_shader_resources: u32 = 0,
+    num_ps_set_shader_resources: u32 = 0,
+    num_vs_set_samplers: u32 = 0,
+    num_ps_set_samplers: u32 = 0,
+};
+comptime {
+    checkLayout(FrameStatsD3d11Bindings, 24, 4, .{ .num_ia_set_vertex_buffers = 0, .num_ia_set_index_buffer = 4, .num_vs_set_shader_resources = 8, .num_ps_set_shader_resources = 12, .num_vs_set_samplers = 16, .num_ps_set_samplers = 20 });
+}
+pub const FrameStatsD3d11Uniforms = extern struct {
+    num_update_subresource: u32 = 0,
+};
+comptime {
+    checkLayout(FrameStatsD3d11Uniforms, 4, 4, .{ .num_update_subresource = 0 });
+}
+pub const FrameStatsD3d11Draw = extern struct {
+    num_draw_indexed_instanced: u32 = 0,
+    num_draw_indexed: u32 = 0,
+    num_draw_instanced: u32 = 0,
+    num_draw: u32 = 0,
+};
+comptime {
+    checkLayout(FrameStatsD3d11Draw, 16, 4, .{ .num_draw_indexed_instanced = 0, .num_draw_indexed = 4, .num_draw_instanced = 8, .num_draw = 12 });
+}
+pub const FrameStatsD3d11 = extern struct {
+    pass: FrameStatsD3d11Pass = .{},
+    pipeline: FrameStatsD3d11Pipeline = .{},
+    bindings: FrameStatsD3d11Bindings = .{},
+    uniforms: FrameStatsD3d11Uniforms = .{},
+    draw: FrameStatsD3d11Draw = .{},
+    num_map: u32 = 0,
+    num_unmap: u32 = 0,
+};
+comptime {
+    checkLayout(FrameStatsD3d11, 104, 4, .{ .pass = 0, .pipeline = 16, .bindings = 52, .uniforms = 76, .draw = 80, .num_map = 96, .num_unmap = 100 });
+}
+pub const FrameStatsMetalIdpool = extern struct {
+    num_added: u32 = 0,
+    num_released: u32 = 0,
+    num_garbage_collected: u32 = 0,
+};
+comptime {
+    checkLayout(FrameStatsMetalIdpool, 12, 4, .{ .num_added = 0, .num_released = 4, .num_garbage_collected = 8 });
+}
+pub const FrameStatsMetalPipeline = extern struct {
+    num_set_blend_color: u32 = 0,
+    num_set_cull_mode: u32 = 0,
+    num_set_front_facing_winding: u32 = 0,
+    num_set_stencil_reference_value: u32 = 0,
+    num_set_depth_bias: u32 = 0,
+    num_set_render_pipeline_state: u32 = 0,
+    num_set_depth_stencil_state: u32 = 0,
+};
+comptime {
+    checkLayout(FrameStatsMetalPipeline, 28, 4, .{ .num_set_blend_color = 0, .num_set_cull_mode = 4, .num_set_front_facing_winding = 8, .num_set_stencil_reference_value = 12, .num_set_depth_bias = 16, .num_set_render_pipeline_state = 20, .num_set_depth_stencil_state = 24 });
+}
+pub const FrameStatsMetalBindings = extern struct {
+    num_set_vertex_buffer: u32 = 0,
+    num_set_vertex_texture: u32 = 0,
+    num_set_vertex_sampler_state: u32 = 0,
+    num_set_fragment_buffer: u32 = 0,
+    num_set_fragment_texture: u32 = 0,
+    num_set_fragment_sampler_state: u32 = 0,
+};
+comptime {
+    checkLayout(FrameStatsMetalBindings, 24, 4, .{ .num_set_vertex_buffer = 0, .num_set_vertex_texture = 4, .num_set_vertex_sampler_state = 8, .num_set_fragment_buffer = 12, .num_set_fragment_texture = 16, .num_set_fragment_sampler_state = 20 });
+}
+pub const FrameStatsMetalUniforms = extern struct {
+    num_set_vertex_buffer_offset: u32 = 0,
+    num_set_fragment_buffer_offset: u32 = 0,
+};
+comptime {
+    checkLayout(FrameStatsMetalUniforms, 8, 4, .{ .num_set_vertex_buffer_offset = 0, .num_set_fragment_buffer_offset = 4 });
+}
+pub const FrameStatsMetal = extern struct {
+    idpool: FrameStatsMetalIdpool = .{},
+    pipeline: FrameStatsMetalPipeline = .{},
+    bindings: FrameStatsMetalBindings = .{},
+    uniforms: FrameStatsMetalUniforms = .{},
+};
+comptime {
+    checkLayout(FrameStatsMetal, 72, 4, .{ .idpool = 0, .pipeline = 12, .bindings = 40, .uniforms = 64 });
+}
+pub const FrameStatsWgpuUniforms = extern struct {
+    num_set_bindgroup: u32 = 0,
+    size_write_buffer: u32 = 0,
+};
+comptime {
+    checkLayout(FrameStatsWgpuUniforms, 8, 4, .{ .num_set_bindgroup = 0, .size_write_buffer = 4 });
+}
+pub const FrameStatsWgpuBindings = extern struct {
+    num_set_vertex_buffer: u32 = 0,
+    num_skip_redundant_vertex_buffer: u32 = 0,
+    num_set_index_buffer: u32 = 0,
+    num_skip_redundant_index_buffer: u32 = 0,
+    num_create_bindgroup: u32 = 0,
+    num_discard_bindgroup: u32 = 0,
+    num_set_bindgroup: u32 = 0,
+    num_skip_redundant_bindgroup: u32 = 0,
+    num_bindgroup_cache_hits: u32 = 0,
+    num_bindgroup_cache_misses: u32 = 0,
+    num_bindgroup_cache_collisions: u32 = 0,
+    num_bindgroup_cache_invalidates: u32 = 0,
+    num_bindgroup_cache_hash_vs_key_mismatch: u32 = 0,
+};
+comptime {
+    checkLayout(FrameStatsWgpuBindings, 52, 4, .{ .num_set_vertex_buffer = 0, .num_skip_redundant_vertex_buffer = 4, .num_set_index_buffer = 8, .num_skip_redundant_index_buffer = 12, .num_create_bindgroup = 16, .num_discard_bindgroup = 20, .num_set_bindgroup = 24, .num_skip_redundant_bindgroup = 28, .num_bindgroup_cache_hits = 32, .num_bindgroup_cache_misses = 36, .num_bindgroup_cache_collisions = 40, .num_bindgroup_cache_invalidates = 44, .num_bindgroup_cache_hash_vs_key_mismatch = 48 });
+}
+pub const FrameStatsWgpu = extern struct {
+    uniforms: FrameStatsWgpuUniforms = .{},
+    bindings: FrameStatsWgpuBindings = .{},
+};
+comptime {
+    checkLayout(FrameStatsWgpu, 60, 4, .{ .uniforms = 0, .bindings = 8 });
+}
+pub const FrameStats = extern struct {
+    /// current frame counter, starts at 0
+    frame_index: u32 = 0,
+    num_passes: u32 = 0,
+    num_apply_viewport: u32 = 0,
+    num_apply_scissor_rect: u32 = 0,
+    num_apply_pipeline: u32 = 0,
+    num_apply_bindings: u32 = 0,
+    num_apply_uniforms: u32 = 0,
+    num_draw: u32 = 0,
+    num_update_buffer: u32 = 0,
+    num_append_buffer: u32 = 0,
+    num_update_image: u32 = 0,
+    size_apply_uniforms: u32 = 0,
+    size_update_buffer: u32 = 0,
+    size_append_buffer: u32 = 0,
+    size_update_image: u32 = 0,
+    gl: FrameStatsGl = .{},
+    d3d11: FrameStatsD3d11 = .{},
+    metal: FrameStatsMetal = .{},
+    wgpu: FrameStatsWgpu = .{},
+};
+comptime {
+    checkLayout(FrameStats, 340, 4, .{ .frame_index = 0, .num_passes = 4, .num_apply_viewport = 8, .num_apply_scissor_rect = 12, .num_apply_pipeline = 16, .num_apply_bindings = 20, .num_apply_uniforms = 24, .num_draw = 28, .num_update_buffer = 32, .num_append_buffer = 36, .num_update_image = 40, .size_apply_uniforms = 44, .size_update_buffer = 48, .size_append_buffer = 52, .size_update_image = 56, .gl = 60, .d3d11 = 104, .metal = 208, .wgpu = 280 });
+}
+pub const LogItem = enum(i32) {
+    OK,
+    MALLOC_FAILED,
+    GL_TEXTURE_FORMAT_NOT_SUPPORTED,
+    GL_3D_TEXTURES_NOT_SUPPORTED,
+    GL_ARRAY_TEXTURES_NOT_SUPPORTED,
+    GL_SHADER_COMPILATION_FAILED,
+    GL_SHADER_LINKING_FAILED,
+    GL_VERTEX_ATTRIBUTE_NOT_FOUND_IN_SHADER,
+    GL_IMAGE_SAMPLER_NAME_NOT_FOUND_IN_SHADER,
+    GL_FRAMEBUFFER_STATUS_UNDEFINED,
+    GL_FRAMEBUFFER_STATUS_INCOMPLETE_ATTACHMENT,
+    GL_FRAMEBUFFER_STATUS_INCOMPLETE_MISSING_ATTACHMENT,
+    GL_FRAMEBUFFER_STATUS_UNSUPPORTED,
+    GL_FRAMEBUFFER_STATUS_INCOMPLETE_MULTISAMPLE,
+    GL_FRAMEBUFFER_STATUS_UNKNOWN,
+    D3D11_CREATE_BUFFER_FAILED,
+    D3D11_CREATE_BUFFER_SRV_FAILED,
+    D3D11_CREATE_DEPTH_TEXTURE_UNSUPPORTED_PIXEL_FORMAT,
+    D3D11_CREATE_DEPTH_TEXTURE_FAILED,
+    D3D11_CREATE_2D_TEXTURE_UNSUPPORTED_PIXEL_FORMAT,
+    D3D11_CREATE_2D_TEXTURE_FAILED,
+    D3D11_CREATE_2D_SRV_FAILED,
+    D3D11_CREATE_3D_TEXTURE_UNSUPPORTED_PIXEL_FORMAT,
+    D3D11_CREATE_3D_TEXTURE_FAILED,
+    D3D11_CREATE_3D_SRV_FAILED,
+    D3D11_CREATE_MSAA_TEXTURE_FAILED,
+    D3D11_CREATE_SAMPLER_STATE_FAILED,
+    D3D11_LOAD_D3DCOMPILER_47_DLL_FAILED,
+    D3D11_SHADER_COMPILATION_FAILED,
+    D3D11_SHADER_COMPILATION_OUTPUT,
+    D3D11_CREATE_CONSTANT_BUFFER_FAILED,
+    D3D11_CREATE_INPUT_LAYOUT_FAILED,
+    D3D11_CREATE_RASTERIZER_STATE_FAILED,
+    D3D11_CREATE_DEPTH_STENCIL_STATE_FAILED,
+    D3D11_CREATE_BLEND_STATE_FAILED,
+    D3D11_CREATE_RTV_FAILED,
+    D3D11_CREATE_DSV_FAILED,
+    D3D11_MAP_FOR_UPDATE_BUFFER_FAILED,
+    D3D11_MAP_FOR_APPEND_BUFFER_FAILED,
+    D3D11_MAP_FOR_UPDATE_IMAGE_FAILED,
+    METAL_CREATE_BUFFER_FAILED,
+    METAL_TEXTURE_FORMAT_NOT_SUPPORTED,
+    METAL_CREATE_TEXTURE_FAILED,
+    METAL_CREATE_SAMPLER_FAILED,
+    METAL_SHADER_COMPILATION_FAILED,
+    METAL_SHADER_CREATION_FAILED,
+    METAL_SHADER_COMPILATION_OUTPUT,
+    METAL_SHADER_ENTRY_NOT_FOUND,
+    METAL_CREATE_RPS_FAILED,
+    METAL_CREATE_RPS_OUTPUT,
+    METAL_CREATE_DSS_FAILED,
+    WGPU_BINDGROUPS_POOL_EXHAUSTED,
+    WGPU_BINDGROUPSCACHE_SIZE_GREATER_ONE,
+    WGPU_BINDGROUPSCACHE_SIZE_POW2,
+    WGPU_CREATEBINDGROUP_FAILED,
+    WGPU_CREATE_BUFFER_FAILED,
+    WGPU_CREATE_TEXTURE_FAILED,
+    WGPU_CREATE_TEXTURE_VIEW_FAILED,
+    WGPU_CREATE_SAMPLER_FAILED,
+    WGPU_CREATE_SHADER_MODULE_FAILED,
+    WGPU_SHADER_CREATE_BINDGROUP_LAYOUT_FAILED,
+    WGPU_CREATE_PIPELINE_LAYOUT_FAILED,
+    WGPU_CREATE_RENDER_PIPELINE_FAILED,
+    WGPU_ATTACHMENTS_CREATE_TEXTURE_VIEW_FAILED,
+    DRAW_REQUIRED_BINDINGS_OR_UNIFORMS_MISSING,
+    IDENTICAL_COMMIT_LISTENER,
+    COMMIT_LISTENER_ARRAY_FULL,
+    TRACE_HOOKS_NOT_ENABLED,
+    DEALLOC_BUFFER_INVALID_STATE,
+    DEALLOC_IMAGE_INVALID_STATE,
+    DEALLOC_SAMPLER_INVALID_STATE,
+    DEALLOC_SHADER_INVALID_STATE,
+    DEALLOC_PIPELINE_INVALID_STATE,
+    DEALLOC_ATTACHMENTS_INVALID_STATE,
+    INIT_BUFFER_INVALID_STATE,
+    INIT_IMAGE_INVALID_STATE,
+    INIT_SAMPLER_INVALID_STATE,
+    INIT_SHADER_INVALID_STATE,
+    INIT_PIPELINE_INVALID_STATE,
+    INIT_ATTACHMENTS_INVALID_STATE,
+    UNINIT_BUFFER_INVALID_STATE,
+    UNINIT_IMAGE_INVALID_STATE,
+    UNINIT_SAMPLER_INVALID_STATE,
+    UNINIT_SHADER_INVALID_STATE,
+    UNINIT_PIPELINE_INVALID_STATE,
+    UNINIT_ATTACHMENTS_INVALID_STATE,
+    FAIL_BUFFER_INVALID_STATE,
+    FAIL_IMAGE_INVALID_STATE,
+    FAIL_SAMPLER_INVALID_STATE,
+    FAIL_SHADER_INVALID_STATE,
+    FAIL_PIPELINE_INVALID_STATE,
+    FAIL_ATTACHMENTS_INVALID_STATE,
+    BUFFER_POOL_EXHAUSTED,
+    IMAGE_POOL_EXHAUSTED,
+    SAMPLER_POOL_EXHAUSTED,
+    SHADER_POOL_EXHAUSTED,
+    PIPELINE_POOL_EXHAUSTED,
+    PASS_POOL_EXHAUSTED,
+    BEGINPASS_ATTACHMENT_INVALID,
+    DRAW_WITHOUT_BINDINGS,
+    VALIDATE_BUFFERDESC_CANARY,
+    VALIDATE_BUFFERDESC_SIZE,
+    VALIDATE_BUFFERDESC_DATA,
+    VALIDATE_BUFFERDESC_DATA_SIZE,
+    VALIDATE_BUFFERDESC_NO_DATA,
+    VALIDATE_BUFFERDESC_STORAGEBUFFER_SUPPORTED,
+    VALIDATE_BUFFERDESC_STORAGEBUFFER_SIZE_MULTIPLE_4,
+    VALIDATE_IMAGEDATA_NODATA,
+    VALIDATE_IMAGEDATA_DATA_SIZE,
+    VALIDATE_IMAGEDESC_CANARY,
+    VALIDATE_IMAGEDESC_WIDTH,
+    VALIDATE_IMAGEDESC_HEIGHT,
+    VALIDATE_IMAGEDESC_RT_PIXELFORMAT,
+    VALIDATE_IMAGEDESC_NONRT_PIXELFORMAT,
+    VALIDATE_IMAGEDESC_MSAA_BUT_NO_RT,
+    VALIDATE_IMAGEDESC_NO_MSAA_RT_SUPPORT,
+    VALIDATE_IMAGEDESC_MSAA_NUM_MIPMAPS,
+    VALIDATE_IMAGEDESC_MSAA_3D_IMAGE,
+    VALIDATE_IMAGEDESC_MSAA_CUBE_IMAGE,
+    VALIDATE_IMAGEDESC_DEPTH_3D_IMAGE,
+    VALIDATE_IMAGEDESC_RT_IMMUTABLE,
+    VALIDATE_IMAGEDESC_RT_NO_DATA,
+    VALIDATE_IMAGEDESC_INJECTED_NO_DATA,
+    VALIDATE_IMAGEDESC_DYNAMIC_NO_DATA,
+    VALIDATE_IMAGEDESC_COMPRESSED_IMMUTABLE,
+    VALIDATE_SAMPLERDESC_CANARY,
+    VALIDATE_SAMPLERDESC_ANISTROPIC_REQUIRES_LINEAR_FILTERING,
+    VALIDATE_SHADERDESC_CANARY,
+    VALIDATE_SHADERDESC_SOURCE,
+    VALIDATE_SHADERDESC_BYTECODE,
+    VALIDATE_SHADERDESC_SOURCE_OR_BYTECODE,
+    VALIDATE_SHADERDESC_NO_BYTECODE_SIZE,
+    VALIDATE_SHADERDESC_NO_CONT_UB_MEMBERS,
+    VALIDATE_SHADERDESC_UB_SIZE_IS_ZERO,
+    VALIDATE_SHADERDESC_UB_METAL_BUFFER_SLOT_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_UB_METAL_BUFFER_SLOT_COLLISION,
+    VALIDATE_SHADERDESC_UB_HLSL_REGISTER_B_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_UB_HLSL_REGISTER_B_COLLISION,
+    VALIDATE_SHADERDESC_UB_WGSL_GROUP0_BINDING_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_UB_WGSL_GROUP0_BINDING_COLLISION,
+    VALIDATE_SHADERDESC_NO_UB_MEMBERS,
+    VALIDATE_SHADERDESC_UB_UNIFORM_GLSL_NAME,
+    VALIDATE_SHADERDESC_UB_SIZE_MISMATCH,
+    VALIDATE_SHADERDESC_UB_ARRAY_COUNT,
+    VALIDATE_SHADERDESC_UB_STD140_ARRAY_TYPE,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_METAL_BUFFER_SLOT_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_METAL_BUFFER_SLOT_COLLISION,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_HLSL_REGISTER_T_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_HLSL_REGISTER_T_COLLISION,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_GLSL_BINDING_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_GLSL_BINDING_COLLISION,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_WGSL_GROUP1_BINDING_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_WGSL_GROUP1_BINDING_COLLISION,
+    VALIDATE_SHADERDESC_STORAGEBUFFER_READONLY,
+    VALIDATE_SHADERDESC_IMAGE_METAL_TEXTURE_SLOT_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_IMAGE_METAL_TEXTURE_SLOT_COLLISION,
+    VALIDATE_SHADERDESC_IMAGE_HLSL_REGISTER_T_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_IMAGE_HLSL_REGISTER_T_COLLISION,
+    VALIDATE_SHADERDESC_IMAGE_WGSL_GROUP1_BINDING_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_IMAGE_WGSL_GROUP1_BINDING_COLLISION,
+    VALIDATE_SHADERDESC_SAMPLER_METAL_SAMPLER_SLOT_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_SAMPLER_METAL_SAMPLER_SLOT_COLLISION,
+    VALIDATE_SHADERDESC_SAMPLER_HLSL_REGISTER_S_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_SAMPLER_HLSL_REGISTER_S_COLLISION,
+    VALIDATE_SHADERDESC_SAMPLER_WGSL_GROUP1_BINDING_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_SAMPLER_WGSL_GROUP1_BINDING_COLLISION,
+    VALIDATE_SHADERDESC_IMAGE_SAMPLER_PAIR_IMAGE_SLOT_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_IMAGE_SAMPLER_PAIR_SAMPLER_SLOT_OUT_OF_RANGE,
+    VALIDATE_SHADERDESC_IMAGE_SAMPLER_PAIR_IMAGE_STAGE_MISMATCH,
+    VALIDATE_SHADERDESC_IMAGE_SAMPLER_PAIR_SAMPLER_STAGE_MISMATCH,
+    VALIDATE_SHADERDESC_IMAGE_SAMPLER_PAIR_GLSL_NAME,
+    VALIDATE_SHADERDESC_NONFILTERING_SAMPLER_REQUIRED,
+    VALIDATE_SHADERDESC_COMPARISON_SAMPLER_REQUIRED,
+    VALIDATE_SHADERDESC_IMAGE_NOT_REFERENCED_BY_IMAGE_SAMPLER_PAIRS,
+    VALIDATE_SHADERDESC_SAMPLER_NOT_REFERENCED_BY_IMAGE_SAMPLER_PAIRS,
+    VALIDATE_SHADERDESC_ATTR_STRING_TOO_LONG,
+    VALIDATE_PIPELINEDESC_CANARY,
+    VALIDATE_PIPELINEDESC_SHADER,
+    VALIDATE_PIPELINEDESC_NO_CONT_ATTRS,
+    VALIDATE_PIPELINEDESC_LAYOUT_STRIDE4,
+    VALIDATE_PIPELINEDESC_ATTR_SEMANTICS,
+    VALIDATE_ATTACHMENTSDESC_CANARY,
+    VALIDATE_ATTACHMENTSDESC_NO_ATTACHMENTS,
+    VALIDATE_ATTACHMENTSDESC_NO_CONT_COLOR_ATTS,
+    VALIDATE_ATTACHMENTSDESC_IMAGE,
+    VALIDATE_ATTACHMENTSDESC_MIPLEVEL,
+    VALIDATE_ATTACHMENTSDESC_FACE,
+    VALIDATE_ATTACHMENTSDESC_LAYER,
+    VALIDATE_ATTACHMENTSDESC_SLICE,
+    VALIDATE_ATTACHMENTSDESC_IMAGE_NO_RT,
+    VALIDATE_ATTACHMENTSDESC_COLOR_INV_PIXELFORMAT,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_INV_PIXELFORMAT,
+    VALIDATE_ATTACHMENTSDESC_IMAGE_SIZES,
+    VALIDATE_ATTACHMENTSDESC_IMAGE_SAMPLE_COUNTS,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_COLOR_IMAGE_MSAA,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_IMAGE,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_SAMPLE_COUNT,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_MIPLEVEL,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_FACE,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_LAYER,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_SLICE,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_IMAGE_NO_RT,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_IMAGE_SIZES,
+    VALIDATE_ATTACHMENTSDESC_RESOLVE_IMAGE_FORMAT,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_IMAGE,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_MIPLEVEL,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_FACE,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_LAYER,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_SLICE,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_IMAGE_NO_RT,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_IMAGE_SIZES,
+    VALIDATE_ATTACHMENTSDESC_DEPTH_IMAGE_SAMPLE_COUNT,
+    VALIDATE_BEGINPASS_CANARY,
+    VALIDATE_BEGINPASS_ATTACHMENTS_EXISTS,
+    VALIDATE_BEGINPASS_ATTACHMENTS_VALID,
+    VALIDATE_BEGINPASS_COLOR_ATTACHMENT_IMAGE,
+    VALIDATE_BEGINPASS_RESOLVE_ATTACHMENT_IMAGE,
+    VALIDATE_BEGINPASS_DEPTHSTENCIL_ATTACHMENT_IMAGE,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_WIDTH,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_WIDTH_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_HEIGHT,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_HEIGHT_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_SAMPLECOUNT,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_SAMPLECOUNT_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_COLORFORMAT,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_COLORFORMAT_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_EXPECT_DEPTHFORMAT_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_CURRENTDRAWABLE,
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_CURRENTDRAWABLE_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_DEPTHSTENCILTEXTURE,
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_DEPTHSTENCILTEXTURE_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_MSAACOLORTEXTURE,
+    VALIDATE_BEGINPASS_SWAPCHAIN_METAL_EXPECT_MSAACOLORTEXTURE_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_RENDERVIEW,
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_RENDERVIEW_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_RESOLVEVIEW,
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_RESOLVEVIEW_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_DEPTHSTENCILVIEW,
+    VALIDATE_BEGINPASS_SWAPCHAIN_D3D11_EXPECT_DEPTHSTENCILVIEW_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_RENDERVIEW,
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_RENDERVIEW_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_RESOLVEVIEW,
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_RESOLVEVIEW_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_DEPTHSTENCILVIEW,
+    VALIDATE_BEGINPASS_SWAPCHAIN_WGPU_EXPECT_DEPTHSTENCILVIEW_NOTSET,
+    VALIDATE_BEGINPASS_SWAPCHAIN_GL_EXPECT_FRAMEBUFFER_NOTSET,
+    VALIDATE_APIP_PIPELINE_VALID_ID,
+    VALIDATE_APIP_PIPELINE_EXISTS,
+    VALIDATE_APIP_PIPELINE_VALID,
+    VALIDATE_APIP_SHADER_EXISTS,
+    VALIDATE_APIP_SHADER_VALID,
+    VALIDATE_APIP_CURPASS_ATTACHMENTS_EXISTS,
+    VALIDATE_APIP_CURPASS_ATTACHMENTS_VALID,
+    VALIDATE_APIP_ATT_COUNT,
+    VALIDATE_APIP_COLOR_FORMAT,
+    VALIDATE_APIP_DEPTH_FORMAT,
+    VALIDATE_APIP_SAMPLE_COUNT,
+    VALIDATE_ABND_PIPELINE,
+    VALIDATE_ABND_PIPELINE_EXISTS,
+    VALIDATE_ABND_PIPELINE_VALID,
+    VALIDATE_ABND_EXPECTED_VB,
+    VALIDATE_ABND_VB_EXISTS,
+    VALIDATE_ABND_VB_TYPE,
+    VALIDATE_ABND_VB_OVERFLOW,
+    VALIDATE_ABND_NO_IB,
+    VALIDATE_ABND_IB,
+    VALIDATE_ABND_IB_EXISTS,
+    VALIDATE_ABND_IB_TYPE,
+    VALIDATE_ABND_IB_OVERFLOW,
+    VALIDATE_ABND_EXPECTED_IMAGE_BINDING,
+    VALIDATE_ABND_IMG_EXISTS,
+    VALIDATE_ABND_IMAGE_TYPE_MISMATCH,
+    VALIDATE_ABND_EXPECTED_MULTISAMPLED_IMAGE,
+    VALIDATE_ABND_IMAGE_MSAA,
+    VALIDATE_ABND_EXPECTED_FILTERABLE_IMAGE,
+    VALIDATE_ABND_EXPECTED_DEPTH_IMAGE,
+    VALIDATE_ABND_EXPECTED_SAMPLER_BINDING,
+    VALIDATE_ABND_UNEXPECTED_SAMPLER_COMPARE_NEVER,
+    VALIDATE_ABND_EXPECTED_SAMPLER_COMPARE_NEVER,
+    VALIDATE_ABND_EXPECTED_NONFILTERING_SAMPLER,
+    VALIDATE_ABND_SMP_EXISTS,
+    VALIDATE_ABND_EXPECTED_STORAGEBUFFER_BINDING,
+    VALIDATE_ABND_STORAGEBUFFER_EXISTS,
+    VALIDATE_ABND_STORAGEBUFFER_BINDING_BUFFERTYPE,
+    VALIDATE_AUB_NO_PIPELINE,
+    VALIDATE_AUB_NO_UB_AT_SLOT,
+    VALIDATE_AUB_SIZE,
+    VALIDATE_UPDATEBUF_USAGE,
+    VALIDATE_UPDATEBUF_SIZE,
+    VALIDATE_UPDATEBUF_ONCE,
+    VALIDATE_UPDATEBUF_APPEND,
+    VALIDATE_APPENDBUF_USAGE,
+    VALIDATE_APPENDBUF_SIZE,
+    VALIDATE_APPENDBUF_UPDATE,
+    VALIDATE_UPDIMG_USAGE,
+    VALIDATE_UPDIMG_ONCE,
+    VALIDATION_FAILED,
+};
+/// sg_desc
+///
+/// The sg_desc struct contains configuration values for sokol_gfx,
+/// it is used as parameter to the sg_setup() call.
+///
+/// The default configuration is:
+///
+/// .buffer_pool_size       128
+/// .image_pool_size        128
+/// .sampler_pool_size      64
+/// .shader_pool_size       32
+/// .pipeline_pool_size     64
+/// .pass_pool_size         16
+/// .uniform_buffer_size    4 MB (4*1024*1024)
+/// .max_commit_listeners   1024
+/// .disable_validation     false
+/// .mtl_force_managed_storage_mode false
+/// .wgpu_disable_bindgroups_cache  false
+/// .wgpu_bindgroups_cache_size     1024
+///
+/// .allocator.alloc_fn     0 (in this case, malloc() will be called)
+/// .allocator.free_fn      0 (in this case, free() will be called)
+/// .allocator.user_data    0
+///
+/// .environment.defaults.color_format: default value depends on selected backend:
+///     all GL backends:    SG_PIXELFORMAT_RGBA8
+///     Metal and D3D11:    SG_PIXELFORMAT_BGRA8
+///     WebGPU:             *no default* (must be queried from WebGPU swapchain object)
+/// .environment.defaults.depth_format: SG_PIXELFORMAT_DEPTH_STENCIL
+/// .environment.defaults.sample_count: 1
+///
+/// Metal specific:
+///     (NOTE: All Objective-C object references are transferred through
+///     a bridged cast (__bridge const void*) to sokol_gfx, which will use an
+///     unretained bridged cast (__bridge id<xxx>) to retrieve the Objective-C
+///     references back. Since the bridge cast is unretained, the caller
+///     must hold a strong reference to the Objective-C object until sg_setup()
+///     returns.
+///
+///     .mtl_force_managed_storage_mode
+///         when enabled, Metal buffers and texture resources are created in managed storage
+///         mode, otherwise sokol-gfx will decide whether to create buffers and
+///         textures in managed or shared storage mode (this is mainly a debugging option)
+///     .mtl_use_command_buffer_with_retained_references
+///         when true, the sokol-gfx Metal backend will use Metal command buffers which
+///         bump the reference count of resource objects as long as they are inflight,
+///         this is slower than the default command-buffer-with-unretained-references
+///         method, this may be a workaround when confronted with lifetime validation
+///         errors from the Metal validation layer until a proper fix has been implemented
+///     .environment.metal.device
+///         a pointer to the MTLDevice object
+///
+/// D3D11 specific:
+///     .environment.d3d11.device
+///         a pointer to the ID3D11Device object, this must have been created
+///         before sg_setup() is called
+///     .environment.d3d11.device_context
+///         a pointer to the ID3D11DeviceContext object
+///     .d3d11_shader_debugging
+///         set this to true to compile shaders which are provided as HLSL source
+///         code with debug information and without optimization, this allows
+///         shader debugging in tools like RenderDoc, to output source code
+///         instead of byte code from sokol-shdc, omit the `--binary` cmdline
+///         option
+///
+/// WebGPU specific:
+///     .wgpu_disable_bindgroups_cache
+///         When this is true, the WebGPU backend will create and immediately
+///         release a BindGroup object in the sg_apply_bindings() call, only
+///         use this for debugging purposes.
+///     .wgpu_bindgroups_cache_size
+///         The size of the bindgroups cache for re-using BindGroup objects
+///         between sg_apply_bindings() calls. The smaller the cache size,
+///         the more likely are cache slot collisions which will cause
+///         a BindGroups object to be destroyed and a new one created.
+///         Use the information returned by sg_query_stats() to check
+///         if this is a frequent occurrence, and increase the cache size as
+///         needed (the default is 1024).
+///         NOTE: wgpu_bindgroups_cache_size must be a power-of-2 number!
+///     .environment.wgpu.device
+///         a WGPUDevice handle
+///
+/// When using sokol_gfx.h and sokol_app.h together, consider using the
+/// helper function sglue_environment() in the sokol_glue.h header to
+/// initialize the sg_desc.environment nested struct. sglue_environment() returns
+/// a completely initialized sg_environment struct with information
+/// provided by sokol_app.h.
+pub const EnvironmentDefaults = extern struct {
+    color_format: PixelFormat = .DEFAULT,
+    depth_format: PixelFormat = .DEFAULT,
+    sample_count: i32 = 0,
+};
+comptime {
+    checkLayout(EnvironmentDefaults, 12, 4, .{ .color_format = 0, .depth_format = 4, .sample_count = 8 });
+}
+pub const MetalEnvironment = extern struct {
+    device: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(MetalEnvironment, 8, 8, .{ .device = 0 });
+}
+pub const D3d11Environment = extern struct {
+    device: ?*const anyopaque = null,
+    device_context: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(D3d11Environment, 16, 8, .{ .device = 0, .device_context = 8 });
+}
+pub const WgpuEnvironment = extern struct {
+    device: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(WgpuEnvironment, 8, 8, .{ .device = 0 });
+}
+pub const Environment = extern struct {
+    defaults: EnvironmentDefaults = .{},
+    metal: MetalEnvironment = .{},
+    d3d11: D3d11Environment = .{},
+    wgpu: WgpuEnvironment = .{},
+};
+comptime {
+    checkLayout(Environment, 48, 8, .{ .defaults = 0, .metal = 16, .d3d11 = 24, .wgpu = 40 });
+}
+/// sg_commit_listener
+///
+/// Used with function sg_add_commit_listener() to add a callback
+/// which will be called in sg_commit(). This is useful for libraries
+/// building on top of sokol-gfx to be notified about when a frame
+/// ends (instead of having to guess, or add a manual 'new-frame'
+/// function.
+pub const CommitListener = extern struct {
+    func: ?*const fn (?*anyopaque) callconv(.C) void = null,
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(CommitListener, 16, 8, .{ .func = 0, .user_data = 8 });
+}
+/// sg_allocator
+///
+/// Used in sg_desc to provide custom memory-alloc and -free functions
+/// to sokol_gfx.h. If memory management should be overridden, both the
+/// alloc_fn and free_fn function must be provided (e.g. it's not valid to
+/// override one function but not the other).
+pub const Allocator = extern struct {
+    alloc_fn: ?*const fn (usize, ?*anyopaque) callconv(.C) ?*anyopaque = null,
+    free_fn: ?*const fn (?*anyopaque, ?*anyopaque) callconv(.C) void = null,
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(Allocator, 24, 8, .{ .alloc_fn = 0, .free_fn = 8, .user_data = 16 });
+}
+/// sg_logger
+///
+/// Used in sg_desc to provide a logging function. Please be aware
+/// that without logging function, sokol-gfx will be completely
+/// silent, e.g. it will not report errors, warnings and
+/// validation layer messages. For maximum error verbosity,
+/// compile in debug mode (e.g. NDEBUG *not* defined) and provide a
+/// compatible logger function in the sg_setup() call
+/// (for instance the standard logging function from sokol_log.h).
+pub const Logger = extern struct {
+    func: ?*const fn ([*c]const u8, u32, u32, [*c]const u8, u32, [*c]const u8, ?*anyopaque) callconv(.C) void = null,
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(Logger, 16, 8, .{ .func = 0, .user_data = 8 });
+}
+pub const Desc = extern struct {
+    _start_canary: u32 = 0,
+    buffer_pool_size: i32 = 0,
+    image_pool_size: i32 = 0,
+    sampler_pool_size: i32 = 0,
+    shader_pool_size: i32 = 0,
+    pipeline_pool_size: i32 = 0,
+    attachments_pool_size: i32 = 0,
+    uniform_buffer_size: i32 = 0,
+    max_commit_listeners: i32 = 0,
+    /// disable validation layer even in debug mode, useful for tests
+    disable_validation: bool = false,
+    /// if true, HLSL shaders are compiled with D3DCOMPILE_DEBUG | D3DCOMPILE_SKIP_OPTIMIZATION
+    d3d11_shader_debugging: bool = false,
+    /// for debugging: use Metal managed storage mode for resources even with UMA
+    mtl_force_managed_storage_mode: bool = false,
+    /// Metal: use a managed MTLCommandBuffer which ref-counts used resources
+    mtl_use_command_buffer_with_retained_references: bool = false,
+    /// set to true to disable the WebGPU backend BindGroup cache
+    wgpu_disable_bindgroups_cache: bool = false,
+    /// number of slots in the WebGPU bindgroup cache (must be 2^N)
+    wgpu_bindgroups_cache_size: i32 = 0,
+    allocator: Allocator = .{},
+    /// optional log function override
+    logger: Logger = .{},
+    environment: Environment = .{},
+    _end_canary: u32 = 0,
+};
+comptime {
+    checkLayout(Desc, 144, 8, .{ ._start_canary = 0, .buffer_pool_size = 4, .image_pool_size = 8, .sampler_pool_size = 12, .shader_pool_size = 16, .pipeline_pool_size = 20, .attachments_pool_size = 24, .uniform_buffer_size = 28, .max_commit_listeners = 32, .disable_validation = 36, .d3d11_shader_debugging = 37, .mtl_force_managed_storage_mode = 38, .mtl_use_command_buffer_with_retained_references = 39, .wgpu_disable_bindgroups_cache = 40, .wgpu_bindgroups_cache_size = 44, .allocator = 48, .logger = 72, .environment = 88, ._end_canary = 136 });
+}
+pub extern fn sg_setup([*c]const Desc) void;
+pub fn setup(desc: Desc) void {
+    sg_setup(&desc);
+}
+pub fn setupPtr(desc: *const Desc) void {
+    sg_setup(desc);
+}
+pub extern fn sg_shutdown() void;
+pub const shutdown = sg_shutdown;
+pub extern fn sg_isvalid() bool;
+pub const isvalid = sg_isvalid;
+pub extern fn sg_reset_state_cache() void;
+pub const resetStateCache = sg_reset_state_cache;
+pub extern fn sg_install_trace_hooks([*c]const TraceHooks) TraceHooks;
+pub fn installTraceHooks(trace_hooks: TraceHooks) TraceHooks {
+    return sg_install_trace_hooks(&trace_hooks);
+}
+pub fn installTraceHooksPtr(trace_hooks: *const TraceHooks) TraceHooks {
+    return sg_install_trace_hooks(trace_hooks);
+}
+pub extern fn sg_push_debug_group([*c]const u8) void;
+pub fn pushDebugGroup(name: [:0]const u8) void {
+    sg_push_debug_group(@ptrCast(name));
+}
+pub extern fn sg_pop_debug_group() void;
+pub const popDebugGroup = sg_pop_debug_group;
+pub extern fn sg_add_commit_listener(CommitListener) bool;
+pub const addCommitListener = sg_add_commit_listener;
+pub extern fn sg_remove_commit_listener(CommitListener) bool;
+pub const removeCommitListener = sg_remove_commit_listener;
+pub extern fn sg_make_buffer([*c]const BufferDesc) Buffer;
+pub fn makeBuffer(desc: BufferDesc) Buffer {
+    return sg_make_buffer(&desc);
+}
+pub fn makeBufferPtr(desc: *const BufferDesc) Buffer {
+    return sg_make_buffer(desc);
+}
+pub extern fn sg_make_image([*c]const ImageDesc) Image;
+pub fn makeImage(desc: ImageDesc) Image {
+    return sg_make_image(&desc);
+}
+pub fn makeImagePtr(desc: *const ImageDesc) Image {
+    return sg_make_image(desc);
+}
+pub extern fn sg_make_sampler([*c]const SamplerDesc) Sampler;
+pub fn makeSampler(desc: SamplerDesc) Sampler {
+    return sg_make_sampler(&desc);
+}
+pub fn makeSamplerPtr(desc: *const SamplerDesc) Sampler {
+    return sg_make_sampler(desc);
+}
+pub extern fn sg_make_shader([*c]const ShaderDesc) Shader;
+pub fn makeShader(desc: ShaderDesc) Shader {
+    return sg_make_shader(&desc);
+}
+pub fn makeShaderPtr(desc: *const ShaderDesc) Shader {
+    return sg_make_shader(desc);
+}
+pub extern fn sg_make_pipeline([*c]const PipelineDesc) Pipeline;
+pub fn makePipeline(desc: PipelineDesc) Pipeline {
+    return sg_make_pipeline(&desc);
+}
+pub fn makePipelinePtr(desc: *const PipelineDesc) Pipeline {
+    return sg_make_pipeline(desc);
+}
+pub extern fn sg_make_attachments([*c]const AttachmentsDesc) Attachments;
+pub fn makeAttachments(desc: AttachmentsDesc) Attachments {
+    return sg_make_attachments(&desc);
+}
+pub fn makeAttachmentsPtr(desc: *const AttachmentsDesc) Attachments {
+    return sg_make_attachments(desc);
+}
+pub extern fn sg_destroy_buffer(Buffer) void;
+pub const destroyBuffer = sg_destroy_buffer;
+pub extern fn sg_destroy_image(Image) void;
+pub const destroyImage = sg_destroy_image;
+pub extern fn sg_destroy_sampler(Sampler) void;
+pub const destroySampler = sg_destroy_sampler;
+pub extern fn sg_destroy_shader(Shader) void;
+pub const destroyShader = sg_destroy_shader;
+pub extern fn sg_destroy_pipeline(Pipeline) void;
+pub const destroyPipeline = sg_destroy_pipeline;
+pub extern fn sg_destroy_attachments(Attachments) void;
+pub const destroyAttachments = sg_destroy_attachments;
+pub extern fn sg_update_buffer(Buffer, [*c]const Range) void;
+pub fn updateBuffer(buf: Buffer, data: Range) void {
+    sg_update_buffer(buf, &data);
+}
+pub fn updateBufferPtr(buf: Buffer, data: *const Range) void {
+    sg_update_buffer(buf, data);
+}
+pub extern fn sg_update_image(Image, [*c]const ImageData) void;
+pub fn updateImage(img: Image, data: ImageData) void {
+    sg_update_image(img, &data);
+}
+pub fn updateImagePtr(img: Image, data: *const ImageData) void {
+    sg_update_image(img, data);
+}
+pub extern fn sg_append_buffer(Buffer, [*c]const Range) i32;
+pub fn appendBuffer(buf: Buffer, data: Range) i32 {
+    return sg_append_buffer(buf, &data);
+}
+pub fn appendBufferPtr(buf: Buffer, data: *const Range) i32 {
+    return sg_append_buffer(buf, data);
+}
+pub extern fn sg_query_buffer_overflow(Buffer) bool;
+pub const queryBufferOverflow = sg_query_buffer_overflow;
+pub extern fn sg_query_buffer_will_overflow(Buffer, usize) bool;
+pub const queryBufferWillOverflow = sg_query_buffer_will_overflow;
+pub extern fn sg_begin_pass([*c]const Pass) void;
+pub fn beginPass(pass: Pass) void {
+    sg_begin_pass(&pass);
+}
+pub fn beginPassPtr(pass: *const Pass) void {
+    sg_begin_pass(pass);
+}
+pub extern fn sg_apply_viewport(i32, i32, i32, i32, bool) void;
+pub const applyViewport = sg_apply_viewport;
+pub extern fn sg_apply_viewportf(f32, f32, f32, f32, bool) void;
+pub const applyViewportf = sg_apply_viewportf;
+pub extern fn sg_apply_scissor_rect(i32, i32, i32, i32, bool) void;
+pub const applyScissorRect = sg_apply_scissor_rect;
+pub extern fn sg_apply_scissor_rectf(f32, f32, f32, f32, bool) void;
+pub const applyScissorRectf = sg_apply_scissor_rectf;
+pub extern fn sg_apply_pipeline(Pipeline) void;
+pub const applyPipeline = sg_apply_pipeline;
+pub extern fn sg_apply_bindings([*c]const Bindings) void;
+pub fn applyBindings(bindings: Bindings) void {
+    sg_apply_bindings(&bindings);
+}
+pub fn applyBindingsPtr(bindings: *const Bindings) void {
+    sg_apply_bindings(bindings);
+}
+pub extern fn sg_apply_uniforms(u32, [*c]const Range) void;
+pub fn applyUniforms(ub_slot: u32, data: Range) void {
+    sg_apply_uniforms(ub_slot, &data);
+}
+pub fn applyUniformsPtr(ub_slot: u32, data: *const Range) void {
+    sg_apply_uniforms(ub_slot, data);
+}
+pub extern fn sg_draw(u32, u32, u32) void;
+pub const draw = sg_draw;
+pub extern fn sg_end_pass() void;
+pub const endPass = sg_end_pass;
+pub extern fn sg_commit() void;
+pub const commit = sg_commit;
+pub extern fn sg_query_desc() Desc;
+pub const queryDesc = sg_query_desc;
+pub extern fn sg_query_backend() Backend;
+pub const queryBackend = sg_query_backend;
+pub extern fn sg_query_features() Features;
+pub const queryFeatures = sg_query_features;
+pub extern fn sg_query_limits() Limits;
+pub const queryLimits = sg_query_limits;
+pub extern fn sg_query_pixelformat(PixelFormat) PixelformatInfo;
+pub const queryPixelformat = sg_query_pixelformat;
+pub extern fn sg_query_row_pitch(PixelFormat, i32, i32) i32;
+pub const queryRowPitch = sg_query_row_pitch;
+pub extern fn sg_query_surface_pitch(PixelFormat, i32, i32, i32) i32;
+pub const querySurfacePitch = sg_query_surface_pitch;
+pub extern fn sg_query_buffer_state(Buffer) ResourceState;
+pub const queryBufferState = sg_query_buffer_state;
+pub extern fn sg_query_image_state(Image) ResourceState;
+pub const queryImageState = sg_query_image_state;
+pub extern fn sg_query_sampler_state(Sampler) ResourceState;
+pub const querySamplerState = sg_query_sampler_state;
+pub extern fn sg_query_shader_state(Shader) ResourceState;
+pub const queryShaderState = sg_query_shader_state;
+pub extern fn sg_query_pipeline_state(Pipeline) ResourceState;
+pub const queryPipelineState = sg_query_pipeline_state;
+pub extern fn sg_query_attachments_state(Attachments) ResourceState;
+pub const queryAttachmentsState = sg_query_attachments_state;
+pub extern fn sg_query_buffer_info(Buffer) BufferInfo;
+pub const queryBufferInfo = sg_query_buffer_info;
+pub extern fn sg_query_image_info(Image) ImageInfo;
+pub const queryImageInfo = sg_query_image_info;
+pub extern fn sg_query_sampler_info(Sampler) SamplerInfo;
+pub const querySamplerInfo = sg_query_sampler_info;
+pub extern fn sg_query_shader_info(Shader) ShaderInfo;
+pub const queryShaderInfo = sg_query_shader_info;
+pub extern fn sg_query_pipeline_info(Pipeline) PipelineInfo;
+pub const queryPipelineInfo = sg_query_pipeline_info;
+pub extern fn sg_query_attachments_info(Attachments) AttachmentsInfo;
+pub const queryAttachmentsInfo = sg_query_attachments_info;
+pub extern fn sg_query_buffer_desc(Buffer) BufferDesc;
+pub const queryBufferDesc = sg_query_buffer_desc;
+pub extern fn sg_query_image_desc(Image) ImageDesc;
+pub const queryImageDesc = sg_query_image_desc;
+pub extern fn sg_query_sampler_desc(Sampler) SamplerDesc;
+pub const querySamplerDesc = sg_query_sampler_desc;
+pub extern fn sg_query_shader_desc(Shader) ShaderDesc;
+pub const queryShaderDesc = sg_query_shader_desc;
+pub extern fn sg_query_pipeline_desc(Pipeline) PipelineDesc;
+pub const queryPipelineDesc = sg_query_pipeline_desc;
+pub extern fn sg_query_attachments_desc(Attachments) AttachmentsDesc;
+pub const queryAttachmentsDesc = sg_query_attachments_desc;
+pub extern fn sg_query_buffer_defaults([*c]const BufferDesc) BufferDesc;
+pub fn queryBufferDefaults(desc: BufferDesc) BufferDesc {
+    return sg_query_buffer_defaults(&desc);
+}
+pub fn queryBufferDefaultsPtr(desc: *const BufferDesc) BufferDesc {
+    return sg_query_buffer_defaults(desc);
+}
+pub extern fn sg_query_image_defaults([*c]const ImageDesc) ImageDesc;
+pub fn queryImageDefaults(desc: ImageDesc) ImageDesc {
+    return sg_query_image_defaults(&desc);
+}
+pub fn queryImageDefaultsPtr(desc: *const ImageDesc) ImageDesc {
+    return sg_query_image_defaults(desc);
+}
+pub extern fn sg_query_sampler_defaults([*c]const SamplerDesc) SamplerDesc;
+pub fn querySamplerDefaults(desc: SamplerDesc) SamplerDesc {
+    return sg_query_sampler_defaults(&desc);
+}
+pub fn querySamplerDefaultsPtr(desc: *const SamplerDesc) SamplerDesc {
+    return sg_query_sampler_defaults(desc);
+}
+pub extern fn sg_query_shader_defaults([*c]const ShaderDesc) ShaderDesc;
+pub fn queryShaderDefaults(desc: ShaderDesc) ShaderDesc {
+    return sg_query_shader_defaults(&desc);
+}
+pub fn queryShaderDefaultsPtr(desc: *const ShaderDesc) ShaderDesc {
+    return sg_query_shader_defaults(desc);
+}
+pub extern fn sg_query_pipeline_defaults([*c]const PipelineDesc) PipelineDesc;
+pub fn queryPipelineDefaults(desc: PipelineDesc) PipelineDesc {
+    return sg_query_pipeline_defaults(&desc);
+}
+pub fn queryPipelineDefaultsPtr(desc: *const PipelineDesc) PipelineDesc {
+    return sg_query_pipeline_defaults(desc);
+}
+pub extern fn sg_query_attachments_defaults([*c]const AttachmentsDesc) AttachmentsDesc;
+pub fn queryAttachmentsDefaults(desc: AttachmentsDesc) AttachmentsDesc {
+    return sg_query_attachments_defaults(&desc);
+}
+pub fn queryAttachmentsDefaultsPtr(desc: *const AttachmentsDesc) AttachmentsDesc {
+    return sg_query_attachments_defaults(desc);
+}
+pub extern fn sg_query_buffer_size(Buffer) usize;
+pub const queryBufferSize = sg_query_buffer_size;
+pub extern fn sg_query_buffer_type(Buffer) BufferType;
+pub const queryBufferType = sg_query_buffer_type;
+pub extern fn sg_query_buffer_usage(Buffer) Usage;
+pub const queryBufferUsage = sg_query_buffer_usage;
+pub extern fn sg_query_image_type(Image) ImageType;
+pub const queryImageType = sg_query_image_type;
+pub extern fn sg_query_image_width(Image) i32;
+pub const queryImageWidth = sg_query_image_width;
+pub extern fn sg_query_image_height(Image) i32;
+pub const queryImageHeight = sg_query_image_height;
+pub extern fn sg_query_image_num_slices(Image) i32;
+pub const queryImageNumSlices = sg_query_image_num_slices;
+pub extern fn sg_query_image_num_mipmaps(Image) i32;
+pub const queryImageNumMipmaps = sg_query_image_num_mipmaps;
+pub extern fn sg_query_image_pixelformat(Image) PixelFormat;
+pub const queryImagePixelformat = sg_query_image_pixelformat;
+pub extern fn sg_query_image_usage(Image) Usage;
+pub const queryImageUsage = sg_query_image_usage;
+pub extern fn sg_query_image_sample_count(Image) i32;
+pub const queryImageSampleCount = sg_query_image_sample_count;
+pub extern fn sg_alloc_buffer() Buffer;
+pub const allocBuffer = sg_alloc_buffer;
+pub extern fn sg_alloc_image() Image;
+pub const allocImage = sg_alloc_image;
+pub extern fn sg_alloc_sampler() Sampler;
+pub const allocSampler = sg_alloc_sampler;
+pub extern fn sg_alloc_shader() Shader;
+pub const allocShader = sg_alloc_shader;
+pub extern fn sg_alloc_pipeline() Pipeline;
+pub const allocPipeline = sg_alloc_pipeline;
+pub extern fn sg_alloc_attachments() Attachments;
+pub const allocAttachments = sg_alloc_attachments;
+pub extern fn sg_dealloc_buffer(Buffer) void;
+pub const deallocBuffer = sg_dealloc_buffer;
+pub extern fn sg_dealloc_image(Image) void;
+pub const deallocImage = sg_dealloc_image;
+pub extern fn sg_dealloc_sampler(Sampler) void;
+pub const deallocSampler = sg_dealloc_sampler;
+pub extern fn sg_dealloc_shader(Shader) void;
+pub const deallocShader = sg_dealloc_shader;
+pub extern fn sg_dealloc_pipeline(Pipeline) void;
+pub const deallocPipeline = sg_dealloc_pipeline;
+pub extern fn sg_dealloc_attachments(Attachments) void;
+pub const deallocAttachments = sg_dealloc_attachments;
+pub extern fn sg_init_buffer(Buffer, [*c]const BufferDesc) void;
+pub fn initBuffer(buf: Buffer, desc: BufferDesc) void {
+    sg_init_buffer(buf, &desc);
+}
+pub fn initBufferPtr(buf: Buffer, desc: *const BufferDesc) void {
+    sg_init_buffer(buf, desc);
+}
+pub extern fn sg_init_image(Image, [*c]const ImageDesc) void;
+pub fn initImage(img: Image, desc: ImageDesc) void {
+    sg_init_image(img, &desc);
+}
+pub fn initImagePtr(img: Image, desc: *const ImageDesc) void {
+    sg_init_image(img, desc);
+}
+pub extern fn sg_init_sampler(Sampler, [*c]const SamplerDesc) void;
+pub fn initSampler(smg: Sampler, desc: SamplerDesc) void {
+    sg_init_sampler(smg, &desc);
+}
+pub fn initSamplerPtr(smg: Sampler, desc: *const SamplerDesc) void {
+    sg_init_sampler(smg, desc);
+}
+pub extern fn sg_init_shader(Shader, [*c]const ShaderDesc) void;
+pub fn initShader(shd: Shader, desc: ShaderDesc) void {
+    sg_init_shader(shd, &desc);
+}
+pub fn initShaderPtr(shd: Shader, desc: *const ShaderDesc) void {
+    sg_init_shader(shd, desc);
+}
+pub extern fn sg_init_pipeline(Pipeline, [*c]const PipelineDesc) void;
+pub fn initPipeline(pip: Pipeline, desc: PipelineDesc) void {
+    sg_init_pipeline(pip, &desc);
+}
+pub fn initPipelinePtr(pip: Pipeline, desc: *const PipelineDesc) void {
+    sg_init_pipeline(pip, desc);
+}
+pub extern fn sg_init_attachments(Attachments, [*c]const AttachmentsDesc) void;
+pub fn initAttachments(attachments: Attachments, desc: AttachmentsDesc) void {
+    sg_init_attachments(attachments, &desc);
+}
+pub fn initAttachmentsPtr(attachments: Attachments, desc: *const AttachmentsDesc) void {
+    sg_init_attachments(attachments, desc);
+}
+pub extern fn sg_uninit_buffer(Buffer) void;
+pub const uninitBuffer = sg_uninit_buffer;
+pub extern fn sg_uninit_image(Image) void;
+pub const uninitImage = sg_uninit_image;
+pub extern fn sg_uninit_sampler(Sampler) void;
+pub const uninitSampler = sg_uninit_sampler;
+pub extern fn sg_uninit_shader(Shader) void;
+pub const uninitShader = sg_uninit_shader;
+pub extern fn sg_uninit_pipeline(Pipeline) void;
+pub const uninitPipeline = sg_uninit_pipeline;
+pub extern fn sg_uninit_attachments(Attachments) void;
+pub const uninitAttachments = sg_uninit_attachments;
+pub extern fn sg_fail_buffer(Buffer) void;
+pub const failBuffer = sg_fail_buffer;
+pub extern fn sg_fail_image(Image) void;
+pub const failImage = sg_fail_image;
+pub extern fn sg_fail_sampler(Sampler) void;
+pub const failSampler = sg_fail_sampler;
+pub extern fn sg_fail_shader(Shader) void;
+pub const failShader = sg_fail_shader;
+pub extern fn sg_fail_pipeline(Pipeline) void;
+pub const failPipeline = sg_fail_pipeline;
+pub extern fn sg_fail_attachments(Attachments) void;
+pub const failAttachments = sg_fail_attachments;
+pub extern fn sg_enable_frame_stats() void;
+pub const enableFrameStats = sg_enable_frame_stats;
+pub extern fn sg_disable_frame_stats() void;
+pub const disableFrameStats = sg_disable_frame_stats;
+pub extern fn sg_frame_stats_enabled() bool;
+pub const frameStatsEnabled = sg_frame_stats_enabled;
+pub extern fn sg_query_frame_stats() FrameStats;
+pub const queryFrameStats = sg_query_frame_stats;
+pub const D3d11BufferInfo = extern struct {
+    /// ID3D11Buffer*
+    buf: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(D3d11BufferInfo, 8, 8, .{ .buf = 0 });
+}
+pub const D3d11ImageInfo = extern struct {
+    /// ID3D11Texture2D*
+    tex2d: ?*const anyopaque = null,
+    /// ID3D11Texture3D*
+    tex3d: ?*const anyopaque = null,
+    /// ID3D11Resource* (either tex2d or tex3d)
+    res: ?*const anyopaque = null,
+    /// ID3D11ShaderResourceView*
+    srv: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(D3d11ImageInfo, 32, 8, .{ .tex2d = 0, .tex3d = 8, .res = 16, .srv = 24 });
+}
+pub const D3d11SamplerInfo = extern struct {
+    /// ID3D11SamplerState*
+    smp: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(D3d11SamplerInfo, 8, 8, .{ .smp = 0 });
+}
+pub const D3d11ShaderInfo = extern struct {
+    /// ID3D11Buffer* (constant buffers by bind slot)
+    cbufs: [8]?*const anyopaque = @import("std").mem.zeroes([8]?*const anyopaque),
+    /// ID3D11VertexShader*
+    vs: ?*const anyopaque = null,
+    /// ID3D11PixelShader*
+    fs: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(D3d11ShaderInfo, 80, 8, .{ .cbufs = 0, .vs = 64, .fs = 72 });
+}
+pub const D3d11PipelineInfo = extern struct {
+    /// ID3D11InputLayout*
+    il: ?*const anyopaque = null,
+    /// ID3D11RasterizerState*
+    rs: ?*const anyopaque = null,
+    /// ID3D11DepthStencilState*
+    dss: ?*const anyopaque = null,
+    /// ID3D11BlendState*
+    bs: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(D3d11PipelineInfo, 32, 8, .{ .il = 0, .rs = 8, .dss = 16, .bs = 24 });
+}
+pub const D3d11AttachmentsInfo = extern struct {
+    /// ID3D11RenderTargetView
+    color_rtv: [4]?*const anyopaque = @import("std").mem.zeroes([4]?*const anyopaque),
+    /// ID3D11RenderTargetView
+    resolve_rtv: [4]?*const anyopaque = @import("std").mem.zeroes([4]?*const anyopaque),
+    /// ID3D11DepthStencilView
+    dsv: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(D3d11AttachmentsInfo, 72, 8, .{ .color_rtv = 0, .resolve_rtv = 32, .dsv = 64 });
+}
+pub const MtlBufferInfo = extern struct {
+    /// id<MTLBuffer>
+    buf: [2]?*const anyopaque = @import("std").mem.zeroes([2]?*const anyopaque),
+    active_slot: i32 = 0,
+};
+comptime {
+    checkLayout(MtlBufferInfo, 24, 8, .{ .buf = 0, .active_slot = 16 });
+}
+pub const MtlImageInfo = extern struct {
+    /// id<MTLTexture>
+    tex: [2]?*const anyopaque = @import("std").mem.zeroes([2]?*const anyopaque),
+    active_slot: i32 = 0,
+};
+comptime {
+    checkLayout(MtlImageInfo, 24, 8, .{ .tex = 0, .active_slot = 16 });
+}
+pub const MtlSamplerInfo = extern struct {
+    /// id<MTLSamplerState>
+    smp: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(MtlSamplerInfo, 8, 8, .{ .smp = 0 });
+}
+pub const MtlShaderInfo = extern struct {
+    /// id<MTLLibrary>
+    vertex_lib: ?*const anyopaque = null,
+    /// id<MTLLibrary>
+    fragment_lib: ?*const anyopaque = null,
+    /// id<MTLFunction>
+    vertex_func: ?*const anyopaque = null,
+    /// id<MTLFunction>
+    fragment_func: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(MtlShaderInfo, 32, 8, .{ .vertex_lib = 0, .fragment_lib = 8, .vertex_func = 16, .fragment_func = 24 });
+}
+pub const MtlPipelineInfo = extern struct {
+    /// id<MTLRenderPipelineState>
+    rps: ?*const anyopaque = null,
+    /// id<MTLDepthStencilState>
+    dss: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(MtlPipelineInfo, 16, 8, .{ .rps = 0, .dss = 8 });
+}
+pub const WgpuBufferInfo = extern struct {
+    /// WGPUBuffer
+    buf: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(WgpuBufferInfo, 8, 8, .{ .buf = 0 });
+}
+pub const WgpuImageInfo = extern struct {
+    /// WGPUTexture
+    tex: ?*const anyopaque = null,
+    /// WGPUTextureView
+    view: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(WgpuImageInfo, 16, 8, .{ .tex = 0, .view = 8 });
+}
+pub const WgpuSamplerInfo = extern struct {
+    /// WGPUSampler
+    smp: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(WgpuSamplerInfo, 8, 8, .{ .smp = 0 });
+}
+pub const WgpuShaderInfo = extern struct {
+    /// WGPUShaderModule
+    vs_mod: ?*const anyopaque = null,
+    /// WGPUShaderModule
+    fs_mod: ?*const anyopaque = null,
+    /// WGPUBindGroupLayout;
+    bgl: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(WgpuShaderInfo, 24, 8, .{ .vs_mod = 0, .fs_mod = 8, .bgl = 16 });
+}
+pub const WgpuPipelineInfo = extern struct {
+    /// WGPURenderPipeline
+    pip: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(WgpuPipelineInfo, 8, 8, .{ .pip = 0 });
+}
+pub const WgpuAttachmentsInfo = extern struct {
+    /// WGPUTextureView
+    color_view: [4]?*const anyopaque = @import("std").mem.zeroes([4]?*const anyopaque),
+    /// WGPUTextureView
+    resolve_view: [4]?*const anyopaque = @import("std").mem.zeroes([4]?*const anyopaque),
+    /// WGPUTextureView
+    ds_view: ?*const anyopaque = null,
+};
+comptime {
+    checkLayout(WgpuAttachmentsInfo, 72, 8, .{ .color_view = 0, .resolve_view = 32, .ds_view = 64 });
+}
+pub const GlBufferInfo = extern struct {
+    buf: [2]u32 = @import("std").mem.zeroes([2]u32),
+    active_slot: i32 = 0,
+};
+comptime {
+    checkLayout(GlBufferInfo, 12, 4, .{ .buf = 0, .active_slot = 8 });
+}
+pub const GlImageInfo = extern struct {
+    tex: [2]u32 = @import("std").mem.zeroes([2]u32),
+    tex_target: u32 = 0,
+    msaa_render_buffer: u32 = 0,
+    active_slot: i32 = 0,
+};
+comptime {
+    checkLayout(GlImageInfo, 20, 4, .{ .tex = 0, .tex_target = 8, .msaa_render_buffer = 12, .active_slot = 16 });
+}
+pub const GlSamplerInfo = extern struct {
+    smp: u32 = 0,
+};
+comptime {
+    checkLayout(GlSamplerInfo, 4, 4, .{ .smp = 0 });
+}
+pub const GlShaderInfo = extern struct {
+    prog: u32 = 0,
+};
+comptime {
+    checkLayout(GlShaderInfo, 4, 4, .{ .prog = 0 });
+}
+pub const GlAttachmentsInfo = extern struct {
+    framebuffer: u32 = 0,
+    msaa_resolve_framebuffer: [4]u32 = @import("std").mem.zeroes([4]u32),
+};
+comptime {
+    checkLayout(GlAttachmentsInfo, 20, 4, .{ .framebuffer = 0, .msaa_resolve_framebuffer = 4 });
+}
+pub extern fn sg_d3d11_device() ?*const anyopaque;
+/// D3D11: return ID3D11Device
+pub const d3d11Device = sg_d3d11_device;
+pub extern fn sg_d3d11_device_context() ?*const anyopaque;
+/// D3D11: return ID3D11DeviceContext
+pub const d3d11DeviceContext = sg_d3d11_device_context;
+pub extern fn sg_d3d11_query_buffer_info(Buffer) D3d11BufferInfo;
+/// D3D11: get internal buffer resource objects
+pub const d3d11QueryBufferInfo = sg_d3d11_query_buffer_info;
+pub extern fn sg_d3d11_query_image_info(Image) D3d11ImageInfo;
+/// D3D11: get internal image resource objects
+pub const d3d11QueryImageInfo = sg_d3d11_query_image_info;
+pub extern fn sg_d3d11_query_sampler_info(Sampler) D3d11SamplerInfo;
+/// D3D11: get internal sampler resource objects
+pub const d3d11QuerySamplerInfo = sg_d3d11_query_sampler_info;
+pub extern fn sg_d3d11_query_shader_info(Shader) D3d11ShaderInfo;
+/// D3D11: get internal shader resource objects
+pub const d3d11QueryShaderInfo = sg_d3d11_query_shader_info;
+pub extern fn sg_d3d11_query_pipeline_info(Pipeline) D3d11PipelineInfo;
+/// D3D11: get internal pipeline resource objects
+pub const d3d11QueryPipelineInfo = sg_d3d11_query_pipeline_info;
+pub extern fn sg_d3d11_query_attachments_info(Attachments) D3d11AttachmentsInfo;
+/// D3D11: get internal pass resource objects
+pub const d3d11QueryAttachmentsInfo = sg_d3d11_query_attachments_info;
+pub extern fn sg_mtl_device() ?*const anyopaque;
+/// Metal: return __bridge-casted MTLDevice
+pub const mtlDevice = sg_mtl_device;
+pub extern fn sg_mtl_render_command_encoder() ?*const anyopaque;
+/// Metal: return __bridge-casted MTLRenderCommandEncoder in current pass (or zero if outside pass)
+pub const mtlRenderCommandEncoder = sg_mtl_render_command_encoder;
+pub extern fn sg_mtl_query_buffer_info(Buffer) MtlBufferInfo;
+/// Metal: get internal __bridge-casted buffer resource objects
+pub const mtlQueryBufferInfo = sg_mtl_query_buffer_info;
+pub extern fn sg_mtl_query_image_info(Image) MtlImageInfo;
+/// Metal: get internal __bridge-casted image resource objects
+pub const mtlQueryImageInfo = sg_mtl_query_image_info;
+pub extern fn sg_mtl_query_sampler_info(Sampler) MtlSamplerInfo;
+/// Metal: get internal __bridge-casted sampler resource objects
+pub const mtlQuerySamplerInfo = sg_mtl_query_sampler_info;
+pub extern fn sg_mtl_query_shader_info(Shader) MtlShaderInfo;
+/// Metal: get internal __bridge-casted shader resource objects
+pub const mtlQueryShaderInfo = sg_mtl_query_shader_info;
+pub extern fn sg_mtl_query_pipeline_info(Pipeline) MtlPipelineInfo;
+/// Metal: get internal __bridge-casted pipeline resource objects
+pub const mtlQueryPipelineInfo = sg_mtl_query_pipeline_info;
+pub extern fn sg_wgpu_device() ?*const anyopaque;
+/// WebGPU: return WGPUDevice object
+pub const wgpuDevice = sg_wgpu_device;
+pub extern fn sg_wgpu_queue() ?*const anyopaque;
+/// WebGPU: return WGPUQueue object
+pub const wgpuQueue = sg_wgpu_queue;
+pub extern fn sg_wgpu_command_encoder() ?*const anyopaque;
+/// WebGPU: return this frame's WGPUCommandEncoder
+pub const wgpuCommandEncoder = sg_wgpu_command_encoder;
+pub extern fn sg_wgpu_render_pass_encoder() ?*const anyopaque;
+/// WebGPU: return WGPURenderPassEncoder of current pass
+pub const wgpuRenderPassEncoder = sg_wgpu_render_pass_encoder;
+pub extern fn sg_wgpu_query_buffer_info(Buffer) WgpuBufferInfo;
+/// WebGPU: get internal buffer resource objects
+pub const wgpuQueryBufferInfo = sg_wgpu_query_buffer_info;
+pub extern fn sg_wgpu_query_image_info(Image) WgpuImageInfo;
+/// WebGPU: get internal image resource objects
+pub const wgpuQueryImageInfo = sg_wgpu_query_image_info;
+pub extern fn sg_wgpu_query_sampler_info(Sampler) WgpuSamplerInfo;
+/// WebGPU: get internal sampler resource objects
+pub const wgpuQuerySamplerInfo = sg_wgpu_query_sampler_info;
+pub extern fn sg_wgpu_query_shader_info(Shader) WgpuShaderInfo;
+/// WebGPU: get internal shader resource objects
+pub const wgpuQueryShaderInfo = sg_wgpu_query_shader_info;
+pub extern fn sg_wgpu_query_pipeline_info(Pipeline) WgpuPipelineInfo;
+/// WebGPU: get internal pipeline resource objects
+pub const wgpuQueryPipelineInfo = sg_wgpu_query_pipeline_info;
+pub extern fn sg_wgpu_query_attachments_info(Attachments) WgpuAttachmentsInfo;
+/// WebGPU: get internal pass resource objects
+pub const wgpuQueryAttachmentsInfo = sg_wgpu_query_attachments_info;
+pub extern fn sg_gl_query_buffer_info(Buffer) GlBufferInfo;
+/// GL: get internal buffer resource objects
+pub const glQueryBufferInfo = sg_gl_query_buffer_info;
+pub extern fn sg_gl_query_image_info(Image) GlImageInfo;
+/// GL: get internal image resource objects
+pub const glQueryImageInfo = sg_gl_query_image_info;
+pub extern fn sg_gl_query_sampler_info(Sampler) GlSamplerInfo;
+/// GL: get internal sampler resource objects
+pub const glQuerySamplerInfo = sg_gl_query_sampler_info;
+pub extern fn sg_gl_query_shader_info(Shader) GlShaderInfo;
+/// GL: get internal shader resource objects
+pub const glQueryShaderInfo = sg_gl_query_shader_info;
+pub extern fn sg_gl_query_attachments_info(Attachments) GlAttachmentsInfo;
+/// GL: get internal pass resource objects
+pub const glQueryAttachmentsInfo = sg_gl_query_attachments_info;
+// A lightweight sokol-gfx call tracer which counts the calls of each traced
+// function and measures the CPU time spent between beginPass() and endPass().
+// The previously installed trace hooks are called too. The sokol-gfx
+// implementation must be compiled with SOKOL_TRACE_HOOKS.
+pub const Tracer = struct {
+    pub const Counts = struct {
+        reset_state_cache: u32 = 0,
+        make_buffer: u32 = 0,
+        make_image: u32 = 0,
+        make_sampler: u32 = 0,
+        make_shader: u32 = 0,
+        make_pipeline: u32 = 0,
+        make_attachments: u32 = 0,
+        destroy_buffer: u32 = 0,
+        destroy_image: u32 = 0,
+        destroy_sampler: u32 = 0,
+        destroy_shader: u32 = 0,
+        destroy_pipeline: u32 = 0,
+        destroy_attachments: u32 = 0,
+        update_buffer: u32 = 0,
+        update_image: u32 = 0,
+        append_buffer: u32 = 0,
+        begin_pass: u32 = 0,
+        apply_viewport: u32 = 0,
+        apply_scissor_rect: u32 = 0,
+        apply_pipeline: u32 = 0,
+        apply_bindings: u32 = 0,
+        apply_uniforms: u32 = 0,
+        draw: u32 = 0,
+        end_pass: u32 = 0,
+        commit: u32 = 0,
+        alloc_buffer: u32 = 0,
+        alloc_image: u32 = 0,
+        alloc_sampler: u32 = 0,
+        alloc_shader: u32 = 0,
+        alloc_pipeline: u32 = 0,
+        alloc_attachments: u32 = 0,
+        dealloc_buffer: u32 = 0,
+        dealloc_image: u32 = 0,
+        dealloc_sampler: u32 = 0,
+        dealloc_shader: u32 = 0,
+        dealloc_pipeline: u32 = 0,
+        dealloc_attachments: u32 = 0,
+        init_buffer: u32 = 0,
+        init_image: u32 = 0,
+        init_sampler: u32 = 0,
+        init_shader: u32 = 0,
+        init_pipeline: u32 = 0,
+        init_attachments: u32 = 0,
+        uninit_buffer: u32 = 0,
+        uninit_image: u32 = 0,
+        uninit_sampler: u32 = 0,
+        uninit_shader: u32 = 0,
+        uninit_pipeline: u32 = 0,
+        uninit_attachments: u32 = 0,
+        fail_buffer: u32 = 0,
+        fail_image: u32 = 0,
+        fail_sampler: u32 = 0,
+        fail_shader: u32 = 0,
+        fail_pipeline: u32 = 0,
+        fail_attachments: u32 = 0,
+        push_debug_group: u32 = 0,
+        pop_debug_group: u32 = 0,
+    };
+    counts: Counts = .{},
+    pass_time_ns: u64 = 0,
+    pass_start: ?@import("std").time.Instant = null,
+    prev_hooks: TraceHooks = .{},
+
+    // the tracer must stay alive at the same address until uninstall() is called
+    pub fn install(self: *Tracer) void {
+        self.prev_hooks = installTraceHooks(.{
+            .user_data = self,
+            .reset_state_cache = traceResetStateCache,
+            .make_buffer = traceMakeBuffer,
+            .make_image = traceMakeImage,
+            .make_sampler = traceMakeSampler,
+            .make_shader = traceMakeShader,
+            .make_pipeline = traceMakePipeline,
+            .make_attachments = traceMakeAttachments,
+            .destroy_buffer = traceDestroyBuffer,
+            .destroy_image = traceDestroyImage,
+            .destroy_sampler = traceDestroySampler,
+            .destroy_shader = traceDestroyShader,
+            .destroy_pipeline = traceDestroyPipeline,
+            .destroy_attachments = traceDestroyAttachments,
+            .update_buffer = traceUpdateBuffer,
+            .update_image = traceUpdateImage,
+            .append_buffer = traceAppendBuffer,
+            .begin_pass = traceBeginPass,
+            .apply_viewport = traceApplyViewport,
+            .apply_scissor_rect = traceApplyScissorRect,
+            .apply_pipeline = traceApplyPipeline,
+            .apply_bindings = traceApplyBindings,
+            .apply_uniforms = traceApplyUniforms,
+            .draw = traceDraw,
+            .end_pass = traceEndPass,
+            .commit = traceCommit,
+            .alloc_buffer = traceAllocBuffer,
+            .alloc_image = traceAllocImage,
+            .alloc_sampler = traceAllocSampler,
+            .alloc_shader = traceAllocShader,
+            .alloc_pipeline = traceAllocPipeline,
+            .alloc_attachments = traceAllocAttachments,
+            .dealloc_buffer = traceDeallocBuffer,
+            .dealloc_image = traceDeallocImage,
+            .dealloc_sampler = traceDeallocSampler,
+            .dealloc_shader = traceDeallocShader,
+            .dealloc_pipeline = traceDeallocPipeline,
+            .dealloc_attachments = traceDeallocAttachments,
+            .init_buffer = traceInitBuffer,
+            .init_image = traceInitImage,
+            .init_sampler = traceInitSampler,
+            .init_shader = traceInitShader,
+            .init_pipeline = traceInitPipeline,
+            .init_attachments = traceInitAttachments,
+            .uninit_buffer = traceUninitBuffer,
+            .uninit_image = traceUninitImage,
+            .uninit_sampler = traceUninitSampler,
+            .uninit_shader = traceUninitShader,
+            .uninit_pipeline = traceUninitPipeline,
+            .uninit_attachments = traceUninitAttachments,
+            .fail_buffer = traceFailBuffer,
+            .fail_image = traceFailImage,
+            .fail_sampler = traceFailSampler,
+            .fail_shader = traceFailShader,
+            .fail_pipeline = traceFailPipeline,
+            .fail_attachments = traceFailAttachments,
+            .push_debug_group = tracePushDebugGroup,
+            .pop_debug_group = tracePopDebugGroup,
+        });
+    }
+    // restores the trace hooks which were installed before the tracer
+    pub fn uninstall(self: *Tracer) void {
+        _ = installTraceHooks(self.prev_hooks);
+    }
+    // resets the counters and timings, for instance at the start of a frame
+    pub fn reset(self: *Tracer) void {
+        self.counts = .{};
+        self.pass_time_ns = 0;
+    }
+    fn traceResetStateCache(user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.reset_state_cache += 1;
+        if (self.prev_hooks.reset_state_cache) |prev| prev(self.prev_hooks.user_data);
+    }
+    fn traceMakeBuffer(a0: [*c]const BufferDesc, a1: Buffer, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.make_buffer += 1;
+        if (self.prev_hooks.make_buffer) |prev| prev(a0, a1, self.prev_hooks.user_data);
+    }
+    fn traceMakeImage(a0: [*c]const ImageDesc, a1: Image, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.make_image += 1;
+        if (self.prev_hooks.make_image) |prev| prev(a0, a1, self.prev_hooks.user_data);
+    }
+    fn traceMakeSampler(a0: [*c]const SamplerDesc, a1: Sampler, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.make_sampler += 1;
+        if (self.prev_hooks.make_sampler) |prev| prev(a0, a1, self.prev_hooks.user_data);
+    }
+    fn traceMakeShader(a0: [*c]const ShaderDesc, a1: Shader, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.make_shader += 1;
+        if (self.prev_hooks.make_shader) |prev| prev(a0, a1, self.prev_hooks.user_data);
+    }
+    fn traceMakePipeline(a0: [*c]const PipelineDesc, a1: Pipeline, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.make_pipeline += 1;
+        if (self.prev_hooks.make_pipeline) |prev| prev(a0, a1, self.prev_hooks.user_data);
+    }
+    fn traceMakeAttachments(a0: [*c]const AttachmentsDesc, a1: Attachments, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.make_attachments += 1;
+        if (self.prev_hooks.make_attachments) |prev| prev(a0, a1, self.prev_hooks.user_data);
+    }
+    fn traceDestroyBuffer(a0: Buffer, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.destroy_buffer += 1;
+        if (self.prev_hooks.destroy_buffer) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceDestroyImage(a0: Image, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.destroy_image += 1;
+        if (self.prev_hooks.destroy_image) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceDestroySampler(a0: Sampler, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.destroy_sampler += 1;
+        if (self.prev_hooks.destroy_sampler) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceDestroyShader(a0: Shader, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.destroy_shader += 1;
+        if (self.prev_hooks.destroy_shader) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceDestroyPipeline(a0: Pipeline, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.destroy_pipeline += 1;
+        if (self.prev_hooks.destroy_pipeline) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceDestroyAttachments(a0: Attachments, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.destroy_attachments += 1;
+        if (self.prev_hooks.destroy_attachments) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceUpdateBuffer(a0: Buffer, a1: [*c]const Range, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.update_buffer += 1;
+        if (self.prev_hooks.update_buffer) |prev| prev(a0, a1, self.prev_hooks.user_data);
+    }
+    fn traceUpdateImage(a0: Image, a1: [*c]const ImageData, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.update_image += 1;
+        if (self.prev_hooks.update_image) |prev| prev(a0, a1, self.prev_hooks.user_data);
+    }
+    fn traceAppendBuffer(a0: Buffer, a1: [*c]const Range, a2: i32, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.append_buffer += 1;
+        if (self.prev_hooks.append_buffer) |prev| prev(a0, a1, a2, self.prev_hooks.user_data);
+    }
+    fn traceBeginPass(a0: [*c]const Pass, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.begin_pass += 1;
+        self.pass_start = @import("std").time.Instant.now() catch null;
+        if (self.prev_hooks.begin_pass) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceApplyViewport(a0: i32, a1: i32, a2: i32, a3: i32, a4: bool, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.apply_viewport += 1;
+        if (self.prev_hooks.apply_viewport) |prev| prev(a0, a1, a2, a3, a4, self.prev_hooks.user_data);
+    }
+    fn traceApplyScissorRect(a0: i32, a1: i32, a2: i32, a3: i32, a4: bool, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.apply_scissor_rect += 1;
+        if (self.prev_hooks.apply_scissor_rect) |prev| prev(a0, a1, a2, a3, a4, self.prev_hooks.user_data);
+    }
+    fn traceApplyPipeline(a0: Pipeline, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.apply_pipeline += 1;
+        if (self.prev_hooks.apply_pipeline) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceApplyBindings(a0: [*c]const Bindings, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.apply_bindings += 1;
+        if (self.prev_hooks.apply_bindings) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceApplyUniforms(a0: i32, a1: [*c]const Range, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.apply_uniforms += 1;
+        if (self.prev_hooks.apply_uniforms) |prev| prev(a0, a1, self.prev_hooks.user_data);
+    }
+    fn traceDraw(a0: i32, a1: i32, a2: i32, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.draw += 1;
+        if (self.prev_hooks.draw) |prev| prev(a0, a1, a2, self.prev_hooks.user_data);
+    }
+    fn traceEndPass(user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.end_pass += 1;
+        if (self.pass_start) |start| {
+            if (@import("std").time.Instant.now()) |now| {
+                self.pass_time_ns += now.since(start);
+            } else |_| {}
+            self.pass_start = null;
+        }
+        if (self.prev_hooks.end_pass) |prev| prev(self.prev_hooks.user_data);
+    }
+    fn traceCommit(user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.commit += 1;
+        if (self.prev_hooks.commit) |prev| prev(self.prev_hooks.user_data);
+    }
+    fn traceAllocBuffer(a0: Buffer, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.alloc_buffer += 1;
+        if (self.prev_hooks.alloc_buffer) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceAllocImage(a0: Image, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.alloc_image += 1;
+        if (self.prev_hooks.alloc_image) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceAllocSampler(a0: Sampler, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.alloc_sampler += 1;
+        if (self.prev_hooks.alloc_sampler) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceAllocShader(a0: Shader, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.alloc_shader += 1;
+        if (self.prev_hooks.alloc_shader) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceAllocPipeline(a0: Pipeline, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.alloc_pipeline += 1;
+        if (self.prev_hooks.alloc_pipeline) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceAllocAttachments(a0: Attachments, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.alloc_attachments += 1;
+        if (self.prev_hooks.alloc_attachments) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceDeallocBuffer(a0: Buffer, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.dealloc_buffer += 1;
+        if (self.prev_hooks.dealloc_buffer) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceDeallocImage(a0: Image, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.dealloc_image += 1;
+        if (self.prev_hooks.dealloc_image) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceDeallocSampler(a0: Sampler, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.dealloc_sampler += 1;
+        if (self.prev_hooks.dealloc_sampler) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceDeallocShader(a0: Shader, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.dealloc_shader += 1;
+        if (self.prev_hooks.dealloc_shader) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceDeallocPipeline(a0: Pipeline, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.dealloc_pipeline += 1;
+        if (self.prev_hooks.dealloc_pipeline) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceDeallocAttachments(a0: Attachments, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.dealloc_attachments += 1;
+        if (self.prev_hooks.dealloc_attachments) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceInitBuffer(a0: Buffer, a1: [*c]const BufferDesc, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.init_buffer += 1;
+        if (self.prev_hooks.init_buffer) |prev| prev(a0, a1, self.prev_hooks.user_data);
+    }
+    fn traceInitImage(a0: Image, a1: [*c]const ImageDesc, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.init_image += 1;
+        if (self.prev_hooks.init_image) |prev| prev(a0, a1, self.prev_hooks.user_data);
+    }
+    fn traceInitSampler(a0: Sampler, a1: [*c]const SamplerDesc, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.init_sampler += 1;
+        if (self.prev_hooks.init_sampler) |prev| prev(a0, a1, self.prev_hooks.user_data);
+    }
+    fn traceInitShader(a0: Shader, a1: [*c]const ShaderDesc, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.init_shader += 1;
+        if (self.prev_hooks.init_shader) |prev| prev(a0, a1, self.prev_hooks.user_data);
+    }
+    fn traceInitPipeline(a0: Pipeline, a1: [*c]const PipelineDesc, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.init_pipeline += 1;
+        if (self.prev_hooks.init_pipeline) |prev| prev(a0, a1, self.prev_hooks.user_data);
+    }
+    fn traceInitAttachments(a0: Attachments, a1: [*c]const AttachmentsDesc, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.init_attachments += 1;
+        if (self.prev_hooks.init_attachments) |prev| prev(a0, a1, self.prev_hooks.user_data);
+    }
+    fn traceUninitBuffer(a0: Buffer, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.uninit_buffer += 1;
+        if (self.prev_hooks.uninit_buffer) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceUninitImage(a0: Image, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.uninit_image += 1;
+        if (self.prev_hooks.uninit_image) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceUninitSampler(a0: Sampler, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.uninit_sampler += 1;
+        if (self.prev_hooks.uninit_sampler) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceUninitShader(a0: Shader, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.uninit_shader += 1;
+        if (self.prev_hooks.uninit_shader) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceUninitPipeline(a0: Pipeline, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.uninit_pipeline += 1;
+        if (self.prev_hooks.uninit_pipeline) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceUninitAttachments(a0: Attachments, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.uninit_attachments += 1;
+        if (self.prev_hooks.uninit_attachments) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceFailBuffer(a0: Buffer, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.fail_buffer += 1;
+        if (self.prev_hooks.fail_buffer) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceFailImage(a0: Image, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.fail_image += 1;
+        if (self.prev_hooks.fail_image) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceFailSampler(a0: Sampler, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.fail_sampler += 1;
+        if (self.prev_hooks.fail_sampler) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceFailShader(a0: Shader, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.fail_shader += 1;
+        if (self.prev_hooks.fail_shader) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceFailPipeline(a0: Pipeline, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.fail_pipeline += 1;
+        if (self.prev_hooks.fail_pipeline) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn traceFailAttachments(a0: Attachments, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.fail_attachments += 1;
+        if (self.prev_hooks.fail_attachments) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn tracePushDebugGroup(a0: [*c]const u8, user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.push_debug_group += 1;
+        if (self.prev_hooks.push_debug_group) |prev| prev(a0, self.prev_hooks.user_data);
+    }
+    fn tracePopDebugGroup(user_data: ?*anyopaque) callconv(.C) void {
+        const self: *Tracer = @ptrCast(@alignCast(user_data));
+        self.counts.pop_debug_group += 1;
+        if (self.prev_hooks.pop_debug_group) |prev| prev(self.prev_hooks.user_data);
+    }
+};
@@ -0,0 +1,643 @@
+// machine generated, do not edit
+
+const builtin = @import("builtin");
+const sg = @import("gfx.zig");
+
+// helper function to convert a C string to a Zig string slice
+fn cStrToZig(c_str: [*c]const u8) [:0]const u8 {
+    return @import("std").mem.span(c_str);
+}
+// compile-time check of a struct layout against the C struct layout, which
+// was evaluated by clang for a target with 8-byte pointers (checked
+// only on such targets)
+fn checkLayout(comptime T: type, comptime size: usize, comptime alignment: usize, comptime offsets: anytype) void {
+    if (@sizeOf(usize) != 8) return;
+    if (@sizeOf(T) != size or @alignOf(T) != alignment) {
+        @compileError("size or alignment of " ++ @typeName(T) ++ " doesn't match the C struct");
+    }
+    inline for (@import("std").meta.fields(@TypeOf(offsets))) |field| {
+        if (@offsetOf(T, field.name) != @field(offsets, field.name)) {
+            @compileError("offset of " ++ @typeName(T) ++ "." ++ field.name ++ " doesn't match the C struct");
+        }
+    }
+}
+pub const V2f = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+};
+pub fn v2fSlice(vertices: []const V2f) void {
+    for (vertices) |vtx| {
+        sgl_v2f(vtx.x, vtx.y);
+    }
+}
+pub const V3f = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    z: f32 = 0.0,
+};
+pub fn v3fSlice(vertices: []const V3f) void {
+    for (vertices) |vtx| {
+        sgl_v3f(vtx.x, vtx.y, vtx.z);
+    }
+}
+pub const V2fT2f = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    u: f32 = 0.0,
+    v: f32 = 0.0,
+};
+pub fn v2fT2fSlice(vertices: []const V2fT2f) void {
+    for (vertices) |vtx| {
+        sgl_v2f_t2f(vtx.x, vtx.y, vtx.u, vtx.v);
+    }
+}
+pub const V3fT2f = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    z: f32 = 0.0,
+    u: f32 = 0.0,
+    v: f32 = 0.0,
+};
+pub fn v3fT2fSlice(vertices: []const V3fT2f) void {
+    for (vertices) |vtx| {
+        sgl_v3f_t2f(vtx.x, vtx.y, vtx.z, vtx.u, vtx.v);
+    }
+}
+pub const V2fC3f = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    r: f32 = 0.0,
+    g: f32 = 0.0,
+    b: f32 = 0.0,
+};
+pub fn v2fC3fSlice(vertices: []const V2fC3f) void {
+    for (vertices) |vtx| {
+        sgl_v2f_c3f(vtx.x, vtx.y, vtx.r, vtx.g, vtx.b);
+    }
+}
+pub const V2fC3b = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    r: u8 = 0,
+    g: u8 = 0,
+    b: u8 = 0,
+};
+pub fn v2fC3bSlice(vertices: []const V2fC3b) void {
+    for (vertices) |vtx| {
+        sgl_v2f_c3b(vtx.x, vtx.y, vtx.r, vtx.g, vtx.b);
+    }
+}
+pub const V2fC4f = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    r: f32 = 0.0,
+    g: f32 = 0.0,
+    b: f32 = 0.0,
+    a: f32 = 0.0,
+};
+pub fn v2fC4fSlice(vertices: []const V2fC4f) void {
+    for (vertices) |vtx| {
+        sgl_v2f_c4f(vtx.x, vtx.y, vtx.r, vtx.g, vtx.b, vtx.a);
+    }
+}
+pub const V2fC4b = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    r: u8 = 0,
+    g: u8 = 0,
+    b: u8 = 0,
+    a: u8 = 0,
+};
+pub fn v2fC4bSlice(vertices: []const V2fC4b) void {
+    for (vertices) |vtx| {
+        sgl_v2f_c4b(vtx.x, vtx.y, vtx.r, vtx.g, vtx.b, vtx.a);
+    }
+}
+pub const V2fC1i = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    rgba: u32 = 0,
+};
+pub fn v2fC1iSlice(vertices: []const V2fC1i) void {
+    for (vertices) |vtx| {
+        sgl_v2f_c1i(vtx.x, vtx.y, vtx.rgba);
+    }
+}
+pub const V3fC3f = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    z: f32 = 0.0,
+    r: f32 = 0.0,
+    g: f32 = 0.0,
+    b: f32 = 0.0,
+};
+pub fn v3fC3fSlice(vertices: []const V3fC3f) void {
+    for (vertices) |vtx| {
+        sgl_v3f_c3f(vtx.x, vtx.y, vtx.z, vtx.r, vtx.g, vtx.b);
+    }
+}
+pub const V3fC3b = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    z: f32 = 0.0,
+    r: u8 = 0,
+    g: u8 = 0,
+    b: u8 = 0,
+};
+pub fn v3fC3bSlice(vertices: []const V3fC3b) void {
+    for (vertices) |vtx| {
+        sgl_v3f_c3b(vtx.x, vtx.y, vtx.z, vtx.r, vtx.g, vtx.b);
+    }
+}
+pub const V3fC4f = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    z: f32 = 0.0,
+    r: f32 = 0.0,
+    g: f32 = 0.0,
+    b: f32 = 0.0,
+    a: f32 = 0.0,
+};
+pub fn v3fC4fSlice(vertices: []const V3fC4f) void {
+    for (vertices) |vtx| {
+        sgl_v3f_c4f(vtx.x, vtx.y, vtx.z, vtx.r, vtx.g, vtx.b, vtx.a);
+    }
+}
+pub const V3fC4b = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    z: f32 = 0.0,
+    r: u8 = 0,
+    g: u8 = 0,
+    b: u8 = 0,
+    a: u8 = 0,
+};
+pub fn v3fC4bSlice(vertices: []const V3fC4b) void {
+    for (vertices) |vtx| {
+        sgl_v3f_c4b(vtx.x, vtx.y, vtx.z, vtx.r, vtx.g, vtx.b, vtx.a);
+    }
+}
+pub const V3fC1i = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    z: f32 = 0.0,
+    rgba: u32 = 0,
+};
+pub fn v3fC1iSlice(vertices: []const V3fC1i) void {
+    for (vertices) |vtx| {
+        sgl_v3f_c1i(vtx.x, vtx.y, vtx.z, vtx.rgba);
+    }
+}
+pub const V2fT2fC3f = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    u: f32 = 0.0,
+    v: f32 = 0.0,
+    r: f32 = 0.0,
+    g: f32 = 0.0,
+    b: f32 = 0.0,
+};
+pub fn v2fT2fC3fSlice(vertices: []const V2fT2fC3f) void {
+    for (vertices) |vtx| {
+        sgl_v2f_t2f_c3f(vtx.x, vtx.y, vtx.u, vtx.v, vtx.r, vtx.g, vtx.b);
+    }
+}
+pub const V2fT2fC3b = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    u: f32 = 0.0,
+    v: f32 = 0.0,
+    r: u8 = 0,
+    g: u8 = 0,
+    b: u8 = 0,
+};
+pub fn v2fT2fC3bSlice(vertices: []const V2fT2fC3b) void {
+    for (vertices) |vtx| {
+        sgl_v2f_t2f_c3b(vtx.x, vtx.y, vtx.u, vtx.v, vtx.r, vtx.g, vtx.b);
+    }
+}
+pub const V2fT2fC4f = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    u: f32 = 0.0,
+    v: f32 = 0.0,
+    r: f32 = 0.0,
+    g: f32 = 0.0,
+    b: f32 = 0.0,
+    a: f32 = 0.0,
+};
+pub fn v2fT2fC4fSlice(vertices: []const V2fT2fC4f) void {
+    for (vertices) |vtx| {
+        sgl_v2f_t2f_c4f(vtx.x, vtx.y, vtx.u, vtx.v, vtx.r, vtx.g, vtx.b, vtx.a);
+    }
+}
+pub const V2fT2fC4b = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    u: f32 = 0.0,
+    v: f32 = 0.0,
+    r: u8 = 0,
+    g: u8 = 0,
+    b: u8 = 0,
+    a: u8 = 0,
+};
+pub fn v2fT2fC4bSlice(vertices: []const V2fT2fC4b) void {
+    for (vertices) |vtx| {
+        sgl_v2f_t2f_c4b(vtx.x, vtx.y, vtx.u, vtx.v, vtx.r, vtx.g, vtx.b, vtx.a);
+    }
+}
+pub const V2fT2fC1i = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    u: f32 = 0.0,
+    v: f32 = 0.0,
+    rgba: u32 = 0,
+};
+pub fn v2fT2fC1iSlice(vertices: []const V2fT2fC1i) void {
+    for (vertices) |vtx| {
+        sgl_v2f_t2f_c1i(vtx.x, vtx.y, vtx.u, vtx.v, vtx.rgba);
+    }
+}
+pub const V3fT2fC3f = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    z: f32 = 0.0,
+    u: f32 = 0.0,
+    v: f32 = 0.0,
+    r: f32 = 0.0,
+    g: f32 = 0.0,
+    b: f32 = 0.0,
+};
+pub fn v3fT2fC3fSlice(vertices: []const V3fT2fC3f) void {
+    for (vertices) |vtx| {
+        sgl_v3f_t2f_c3f(vtx.x, vtx.y, vtx.z, vtx.u, vtx.v, vtx.r, vtx.g, vtx.b);
+    }
+}
+pub const V3fT2fC3b = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    z: f32 = 0.0,
+    u: f32 = 0.0,
+    v: f32 = 0.0,
+    r: u8 = 0,
+    g: u8 = 0,
+    b: u8 = 0,
+};
+pub fn v3fT2fC3bSlice(vertices: []const V3fT2fC3b) void {
+    for (vertices) |vtx| {
+        sgl_v3f_t2f_c3b(vtx.x, vtx.y, vtx.z, vtx.u, vtx.v, vtx.r, vtx.g, vtx.b);
+    }
+}
+pub const V3fT2fC4f = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    z: f32 = 0.0,
+    u: f32 = 0.0,
+    v: f32 = 0.0,
+    r: f32 = 0.0,
+    g: f32 = 0.0,
+    b: f32 = 0.0,
+    a: f32 = 0.0,
+};
+pub fn v3fT2fC4fSlice(vertices: []const V3fT2fC4f) void {
+    for (vertices) |vtx| {
+        sgl_v3f_t2f_c4f(vtx.x, vtx.y, vtx.z, vtx.u, vtx.v, vtx.r, vtx.g, vtx.b, vtx.a);
+    }
+}
+pub const V3fT2fC4b = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    z: f32 = 0.0,
+    u: f32 = 0.0,
+    v: f32 = 0.0,
+    r: u8 = 0,
+    g: u8 = 0,
+    b: u8 = 0,
+    a: u8 = 0,
+};
+pub fn v3fT2fC4bSlice(vertices: []const V3fT2fC4b) void {
+    for (vertices) |vtx| {
+        sgl_v3f_t2f_c4b(vtx.x, vtx.y, vtx.z, vtx.u, vtx.v, vtx.r, vtx.g, vtx.b, vtx.a);
+    }
+}
+pub const V3fT2fC1i = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    z: f32 = 0.0,
+    u: f32 = 0.0,
+    v: f32 = 0.0,
+    rgba: u32 = 0,
+};
+pub fn v3fT2fC1iSlice(vertices: []const V3fT2fC1i) void {
+    for (vertices) |vtx| {
+        sgl_v3f_t2f_c1i(vtx.x, vtx.y, vtx.z, vtx.u, vtx.v, vtx.rgba);
+    }
+}
+
+pub const LogItem = enum(i32) {
+    OK,
+    MALLOC_FAILED,
+    MAKE_PIPELINE_FAILED,
+    PIPELINE_POOL_EXHAUSTED,
+    ADD_COMMIT_LISTENER_FAILED,
+    CONTEXT_POOL_EXHAUSTED,
+    CANNOT_DESTROY_DEFAULT_CONTEXT,
+};
+/// sgl_logger_t
+///
+/// Used in sgl_desc_t to provide a custom logging and error reporting
+/// callback to sokol-gl.
+pub const Logger = extern struct {
+    func: ?*const fn ([*c]const u8, u32, u32, [*c]const u8, u32, [*c]const u8, ?*anyopaque) callconv(.C) void = null,
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(Logger, 16, 8, .{ .func = 0, .user_data = 8 });
+}
+/// sokol_gl pipeline handle (created with sgl_make_pipeline())
+pub const Pipeline = extern struct {
+    id: u32 = 0,
+};
+comptime {
+    checkLayout(Pipeline, 4, 4, .{ .id = 0 });
+}
+/// a context handle (created with sgl_make_context())
+pub const Context = extern struct {
+    id: u32 = 0,
+};
+comptime {
+    checkLayout(Context, 4, 4, .{ .id = 0 });
+}
+/// sgl_error_t
+///
+/// Errors are reset each frame after calling sgl_draw(),
+/// get the last error code with sgl_error()
+pub const Error = extern struct {
+    any: bool = false,
+    vertices_full: bool = false,
+    uniforms_full: bool = false,
+    commands_full: bool = false,
+    stack_overflow: bool = false,
+    stack_underflow: bool = false,
+    no_context: bool = false,
+};
+comptime {
+    checkLayout(Error, 7, 1, .{ .any = 0, .vertices_full = 1, .uniforms_full = 2, .commands_full = 3, .stack_overflow = 4, .stack_underflow = 5, .no_context = 6 });
+}
+/// sgl_context_desc_t
+///
+/// Describes the initialization parameters of a rendering context.
+/// Creating additional contexts is useful if you want to render
+/// in separate sokol-gfx passes.
+pub const ContextDesc = extern struct {
+    /// default: 64k
+    max_vertices: i32 = 0,
+    /// default: 16k
+    max_commands: i32 = 0,
+    color_format: sg.PixelFormat = .DEFAULT,
+    depth_format: sg.PixelFormat = .DEFAULT,
+    sample_count: i32 = 0,
+};
+comptime {
+    checkLayout(ContextDesc, 20, 4, .{ .max_vertices = 0, .max_commands = 4, .color_format = 8, .depth_format = 12, .sample_count = 16 });
+}
+/// sgl_allocator_t
+///
+/// Used in sgl_desc_t to provide custom memory-alloc and -free functions
+/// to sokol_gl.h. If memory management should be overridden, both the
+/// alloc and free function must be provided (e.g. it's not valid to
+/// override one function but not the other).
+pub const Allocator = extern struct {
+    alloc_fn: ?*const fn (usize, ?*anyopaque) callconv(.C) ?*anyopaque = null,
+    free_fn: ?*const fn (?*anyopaque, ?*anyopaque) callconv(.C) void = null,
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(Allocator, 24, 8, .{ .alloc_fn = 0, .free_fn = 8, .user_data = 16 });
+}
+pub const Desc = extern struct {
+    /// default: 64k
+    max_vertices: i32 = 0,
+    /// default: 16k
+    max_commands: i32 = 0,
+    /// max number of contexts (including default context), default: 4
+    context_pool_size: i32 = 0,
+    /// size of internal pipeline pool, default: 64
+    pipeline_pool_size: i32 = 0,
+    color_format: sg.PixelFormat = .DEFAULT,
+    depth_format: sg.PixelFormat = .DEFAULT,
+    sample_count: i32 = 0,
+    /// default: SG_FACEWINDING_CCW
+    face_winding: sg.FaceWinding = .DEFAULT,
+    /// optional memory allocation overrides (default: malloc/free)
+    allocator: Allocator = .{},
+    /// optional log function override (default: NO LOGGING)
+    logger: Logger = .{},
+};
+comptime {
+    checkLayout(Desc, 72, 8, .{ .max_vertices = 0, .max_commands = 4, .context_pool_size = 8, .pipeline_pool_size = 12, .color_format = 16, .depth_format = 20, .sample_count = 24, .face_winding = 28, .allocator = 32, .logger = 56 });
+}
+pub extern fn sgl_setup([*c]const Desc) void;
+pub fn setup(desc: Desc) void {
+    sgl_setup(&desc);
+}
+pub fn setupPtr(desc: *const Desc) void {
+    sgl_setup(desc);
+}
+pub extern fn sgl_shutdown() void;
+pub const shutdown = sgl_shutdown;
+pub extern fn sgl_rad(f32) f32;
+pub const asRadians = sgl_rad;
+pub extern fn sgl_deg(f32) f32;
+pub const asDegrees = sgl_deg;
+pub extern fn sgl_error() Error;
+pub const getError = sgl_error;
+pub extern fn sgl_context_error(Context) Error;
+pub const contextError = sgl_context_error;
+pub extern fn sgl_make_context([*c]const ContextDesc) Context;
+pub fn makeContext(desc: ContextDesc) Context {
+    return sgl_make_context(&desc);
+}
+pub fn makeContextPtr(desc: *const ContextDesc) Context {
+    return sgl_make_context(desc);
+}
+pub extern fn sgl_destroy_context(Context) void;
+pub const destroyContext = sgl_destroy_context;
+pub extern fn sgl_set_context(Context) void;
+pub const setContext = sgl_set_context;
+pub extern fn sgl_get_context() Context;
+pub const getContext = sgl_get_context;
+pub extern fn sgl_default_context() Context;
+pub const defaultContext = sgl_default_context;
+pub extern fn sgl_num_vertices() i32;
+pub const numVertices = sgl_num_vertices;
+pub extern fn sgl_num_commands() i32;
+pub const numCommands = sgl_num_commands;
+pub extern fn sgl_draw() void;
+pub const draw = sgl_draw;
+pub extern fn sgl_context_draw(Context) void;
+pub const contextDraw = sgl_context_draw;
+pub extern fn sgl_draw_layer(i32) void;
+pub const drawLayer = sgl_draw_layer;
+pub extern fn sgl_context_draw_layer(Context, i32) void;
+pub const contextDrawLayer = sgl_context_draw_layer;
+pub extern fn sgl_make_pipeline([*c]const sg.PipelineDesc) Pipeline;
+pub fn makePipeline(desc: sg.PipelineDesc) Pipeline {
+    return sgl_make_pipeline(&desc);
+}
+pub fn makePipelinePtr(desc: *const sg.PipelineDesc) Pipeline {
+    return sgl_make_pipeline(desc);
+}
+pub extern fn sgl_context_make_pipeline(Context, [*c]const sg.PipelineDesc) Pipeline;
+pub fn contextMakePipeline(ctx: Context, desc: sg.PipelineDesc) Pipeline {
+    return sgl_context_make_pipeline(ctx, &desc);
+}
+pub fn contextMakePipelinePtr(ctx: Context, desc: *const sg.PipelineDesc) Pipeline {
+    return sgl_context_make_pipeline(ctx, desc);
+}
+pub extern fn sgl_destroy_pipeline(Pipeline) void;
+pub const destroyPipeline = sgl_destroy_pipeline;
+pub extern fn sgl_defaults() void;
+pub const defaults = sgl_defaults;
+pub extern fn sgl_viewport(i32, i32, i32, i32, bool) void;
+pub const viewport = sgl_viewport;
+pub extern fn sgl_viewportf(f32, f32, f32, f32, bool) void;
+pub const viewportf = sgl_viewportf;
+pub extern fn sgl_scissor_rect(i32, i32, i32, i32, bool) void;
+pub const scissorRect = sgl_scissor_rect;
+pub extern fn sgl_scissor_rectf(f32, f32, f32, f32, bool) void;
+pub const scissorRectf = sgl_scissor_rectf;
+pub extern fn sgl_enable_texture() void;
+pub const enableTexture = sgl_enable_texture;
+pub extern fn sgl_disable_texture() void;
+pub const disableTexture = sgl_disable_texture;
+pub extern fn sgl_texture(sg.Image, sg.Sampler) void;
+pub const texture = sgl_texture;
+pub extern fn sgl_layer(i32) void;
+pub const layer = sgl_layer;
+pub extern fn sgl_load_default_pipeline() void;
+pub const loadDefaultPipeline = sgl_load_default_pipeline;
+pub extern fn sgl_load_pipeline(Pipeline) void;
+pub const loadPipeline = sgl_load_pipeline;
+pub extern fn sgl_push_pipeline() void;
+pub const pushPipeline = sgl_push_pipeline;
+pub extern fn sgl_pop_pipeline() void;
+pub const popPipeline = sgl_pop_pipeline;
+pub extern fn sgl_matrix_mode_modelview() void;
+pub const matrixModeModelview = sgl_matrix_mode_modelview;
+pub extern fn sgl_matrix_mode_projection() void;
+pub const matrixModeProjection = sgl_matrix_mode_projection;
+pub extern fn sgl_matrix_mode_texture() void;
+pub const matrixModeTexture = sgl_matrix_mode_texture;
+pub extern fn sgl_load_identity() void;
+pub const loadIdentity = sgl_load_identity;
+pub extern fn sgl_load_matrix([*c]const f32) void;
+pub fn loadMatrix(m: *const f32) void {
+    sgl_load_matrix(m);
+}
+pub extern fn sgl_load_transpose_matrix([*c]const f32) void;
+pub fn loadTransposeMatrix(m: *const f32) void {
+    sgl_load_transpose_matrix(m);
+}
+pub extern fn sgl_mult_matrix([*c]const f32) void;
+pub fn multMatrix(m: *const f32) void {
+    sgl_mult_matrix(m);
+}
+pub extern fn sgl_mult_transpose_matrix([*c]const f32) void;
+pub fn multTransposeMatrix(m: *const f32) void {
+    sgl_mult_transpose_matrix(m);
+}
+pub extern fn sgl_rotate(f32, f32, f32, f32) void;
+pub const rotate = sgl_rotate;
+pub extern fn sgl_scale(f32, f32, f32) void;
+pub const scale = sgl_scale;
+pub extern fn sgl_translate(f32, f32, f32) void;
+pub const translate = sgl_translate;
+pub extern fn sgl_frustum(f32, f32, f32, f32, f32, f32) void;
+pub const frustum = sgl_frustum;
+pub extern fn sgl_ortho(f32, f32, f32, f32, f32, f32) void;
+pub const ortho = sgl_ortho;
+pub extern fn sgl_perspective(f32, f32, f32, f32) void;
+pub const perspective = sgl_perspective;
+pub extern fn sgl_lookat(f32, f32, f32, f32, f32, f32, f32, f32, f32) void;
+pub const lookat = sgl_lookat;
+pub extern fn sgl_push_matrix() void;
+pub const pushMatrix = sgl_push_matrix;
+pub extern fn sgl_pop_matrix() void;
+pub const popMatrix = sgl_pop_matrix;
+pub extern fn sgl_t2f(f32, f32) void;
+pub const t2f = sgl_t2f;
+pub extern fn sgl_c3f(f32, f32, f32) void;
+pub const c3f = sgl_c3f;
+pub extern fn sgl_c4f(f32, f32, f32, f32) void;
+pub const c4f = sgl_c4f;
+pub extern fn sgl_c3b(u8, u8, u8) void;
+pub const c3b = sgl_c3b;
+pub extern fn sgl_c4b(u8, u8, u8, u8) void;
+pub const c4b = sgl_c4b;
+pub extern fn sgl_c1i(u32) void;
+pub const c1i = sgl_c1i;
+pub extern fn sgl_point_size(f32) void;
+pub const pointSize = sgl_point_size;
+pub extern fn sgl_begin_points() void;
+pub const beginPoints = sgl_begin_points;
+pub extern fn sgl_begin_lines() void;
+pub const beginLines = sgl_begin_lines;
+pub extern fn sgl_begin_line_strip() void;
+pub const beginLineStrip = sgl_begin_line_strip;
+pub extern fn sgl_begin_triangles() void;
+pub const beginTriangles = sgl_begin_triangles;
+pub extern fn sgl_begin_triangle_strip() void;
+pub const beginTriangleStrip = sgl_begin_triangle_strip;
+pub extern fn sgl_begin_quads() void;
+pub const beginQuads = sgl_begin_quads;
+pub extern fn sgl_v2f(f32, f32) void;
+pub const v2f = sgl_v2f;
+pub extern fn sgl_v3f(f32, f32, f32) void;
+pub const v3f = sgl_v3f;
+pub extern fn sgl_v2f_t2f(f32, f32, f32, f32) void;
+pub const v2fT2f = sgl_v2f_t2f;
+pub extern fn sgl_v3f_t2f(f32, f32, f32, f32, f32) void;
+pub const v3fT2f = sgl_v3f_t2f;
+pub extern fn sgl_v2f_c3f(f32, f32, f32, f32, f32) void;
+pub const v2fC3f = sgl_v2f_c3f;
+pub extern fn sgl_v2f_c3b(f32, f32, u8, u8, u8) void;
+pub const v2fC3b = sgl_v2f_c3b;
+pub extern fn sgl_v2f_c4f(f32, f32, f32, f32, f32, f32) void;
+pub const v2fC4f = sgl_v2f_c4f;
+pub extern fn sgl_v2f_c4b(f32, f32, u8, u8, u8, u8) void;
+pub const v2fC4b = sgl_v2f_c4b;
+pub extern fn sgl_v2f_c1i(f32, f32, u32) void;
+pub const v2fC1i = sgl_v2f_c1i;
+pub extern fn sgl_v3f_c3f(f32, f32, f32, f32, f32, f32) void;
+pub const v3fC3f = sgl_v3f_c3f;
+pub extern fn sgl_v3f_c3b(f32, f32, f32, u8, u8, u8) void;
+pub const v3fC3b = sgl_v3f_c3b;
+pub extern fn sgl_v3f_c4f(f32, f32, f32, f32, f32, f32, f32) void;
+pub const v3fC4f = sgl_v3f_c4f;
+pub extern fn sgl_v3f_c4b(f32, f32, f32, u8, u8, u8, u8) void;
+pub const v3fC4b = sgl_v3f_c4b;
+pub extern fn sgl_v3f_c1i(f32, f32, f32, u32) void;
+pub const v3fC1i = sgl_v3f_c1i;
+pub extern fn sgl_v2f_t2f_c3f(f32, f32, f32, f32, f32, f32, f32) void;
+pub const v2fT2fC3f = sgl_v2f_t2f_c3f;
+pub extern fn sgl_v2f_t2f_c3b(f32, f32, f32, f32, u8, u8, u8) void;
+pub const v2fT2fC3b = sgl_v2f_t2f_c3b;
+pub extern fn sgl_v2f_t2f_c4f(f32, f32, f32, f32, f32, f32, f32, f32) void;
+pub const v2fT2fC4f = sgl_v2f_t2f_c4f;
+pub extern fn sgl_v2f_t2f_c4b(f32, f32, f32, f32, u8, u8, u8, u8) void;
+pub const v2fT2fC4b = sgl_v2f_t2f_c4b;
+pub extern fn sgl_v2f_t2f_c1i(f32, f32, f32, f32, u32) void;
+pub const v2fT2fC1i = sgl_v2f_t2f_c1i;
+pub extern fn sgl_v3f_t2f_c3f(f32, f32, f32, f32, f32, f32, f32, f32) void;
+pub const v3fT2fC3f = sgl_v3f_t2f_c3f;
+pub extern fn sgl_v3f_t2f_c3b(f32, f32, f32, f32, f32, u8, u8, u8) void;
+pub const v3fT2fC3b = sgl_v3f_t2f_c3b;
+pub extern fn sgl_v3f_t2f_c4f(f32, f32, f32, f32, f32, f32, f32, f32, f32) void;
+pub const v3fT2fC4f = sgl_v3f_t2f_c4f;
+pub extern fn sgl_v3f_t2f_c4b(f32, f32, f32, f32, f32, u8, u8, u8, u8) void;
+pub const v3fT2fC4b = sgl_v3f_t2f_c4b;
+pub extern fn sgl_v3f_t2f_c1i(f32, f32, f32, f32, f32, u32) void;
+pub const v3fT2fC1i = sgl_v3f_t2f_c1i;
+pub extern fn sgl_end() void;
+pub const end = sgl_end;
@@ -0,0 +1,161 @@
+// machine generated, do not edit
+
+const builtin = @import("builtin");
+const sg = @import("gfx.zig");
+const sapp = @import("app.zig");
+
+// helper function to convert a C string to a Zig string slice
+fn cStrToZig(c_str: [*c]const u8) [:0]const u8 {
+    return @import("std").mem.span(c_str);
+}
+// compile-time check of a struct layout against the C struct layout, which
+// was evaluated by clang for a target with 8-byte pointers (checked
+// only on such targets)
+fn checkLayout(comptime T: type, comptime size: usize, comptime alignment: usize, comptime offsets: anytype) void {
+    if (@sizeOf(usize) != 8) return;
+    if (@sizeOf(T) != size or @alignOf(T) != alignment) {
+        @compileError("size or alignment of " ++ @typeName(T) ++ " doesn't match the C struct");
+    }
+    inline for (@import("std").meta.fields(@TypeOf(offsets))) |field| {
+        if (@offsetOf(T, field.name) != @field(offsets, field.name)) {
+            @compileError("offset of " ++ @typeName(T) ++ "." ++ field.name ++ " doesn't match the C struct");
+        }
+    }
+}
+pub const LogItem = enum(i32) {
+    OK,
+    MALLOC_FAILED,
+};
+/// simgui_allocator_t
+///
+/// Used in simgui_desc_t to provide custom memory-alloc and -free functions
+/// to sokol_imgui.h. If memory management should be overridden, both the
+/// alloc_fn and free_fn function must be provided (e.g. it's not valid to
+/// override one function but not the other).
+pub const Allocator = extern struct {
+    alloc_fn: ?*const fn (usize, ?*anyopaque) callconv(.C) ?*anyopaque = null,
+    free_fn: ?*const fn (?*anyopaque, ?*anyopaque) callconv(.C) void = null,
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(Allocator, 24, 8, .{ .alloc_fn = 0, .free_fn = 8, .user_data = 16 });
+}
+/// simgui_logger
+///
+/// Used in simgui_desc_t to provide a logging function. Please be aware
+/// that without logging function, sokol-imgui will be completely
+/// silent, e.g. it will not report errors, warnings and
+/// validation layer messages. For maximum error verbosity,
+/// compile in debug mode (e.g. NDEBUG *not* defined) and install
+/// a logger (for instance the standard logging function from sokol_log.h).
+pub const Logger = extern struct {
+    func: ?*const fn ([*c]const u8, u32, u32, [*c]const u8, u32, [*c]const u8, ?*anyopaque) callconv(.C) void = null,
+    user_data: ?*anyopaque = null,
+};
+comptime {
+    checkLayout(Logger, 16, 8, .{ .func = 0, .user_data = 8 });
+}
+pub const Desc = extern struct {
+    /// default: 65536
+    max_vertices: i32 = 0,
+    color_format: sg.PixelFormat = .DEFAULT,
+    depth_format: sg.PixelFormat = .DEFAULT,
+    sample_count: i32 = 0,
+    ini_filename: [*c]const u8 = null,
+    no_default_font: bool = false,
+    /// if true, don't send Ctrl-V on EVENTTYPE_CLIPBOARD_PASTED
+    disable_paste_override: bool = false,
+    /// if true, don't control the mouse cursor type via sapp_set_mouse_cursor()
+    disable_set_mouse_cursor: bool = false,
+    /// if true, only resize edges from the bottom right corner
+    disable_windows_resize_from_edges: bool = false,
+    /// if true, alpha values get written into the framebuffer
+    write_alpha_channel: bool = false,
+    /// optional memory allocation overrides (default: malloc/free)
+    allocator: Allocator = .{},
+    /// optional log function override
+    logger: Logger = .{},
+};
+comptime {
+    checkLayout(Desc, 72, 8, .{ .max_vertices = 0, .color_format = 4, .depth_format = 8, .sample_count = 12, .ini_filename = 16, .no_default_font = 24, .disable_paste_override = 25, .disable_set_mouse_cursor = 26, .disable_windows_resize_from_edges = 27, .write_alpha_channel = 28, .allocator = 32, .logger = 56 });
+}
+pub const FrameDesc = extern struct {
+    width: i32 = 0,
+    height: i32 = 0,
+    delta_time: f64 = 0.0,
+    dpi_scale: f32 = 0.0,
+};
+comptime {
+    checkLayout(FrameDesc, 24, 8, .{ .width = 0, .height = 4, .delta_time = 8, .dpi_scale = 16 });
+}
+pub const FontTexDesc = extern struct {
+    min_filter: sg.Filter = .DEFAULT,
+    mag_filter: sg.Filter = .DEFAULT,
+};
+comptime {
+    checkLayout(FontTexDesc, 8, 4, .{ .min_filter = 0, .mag_filter = 4 });
+}
+pub extern fn simgui_setup([*c]const Desc) void;
+pub fn setup(desc: Desc) void {
+    simgui_setup(&desc);
+}
+pub fn setupPtr(desc: *const Desc) void {
+    simgui_setup(desc);
+}
+pub extern fn simgui_new_frame([*c]const FrameDesc) void;
+pub fn newFrame(desc: FrameDesc) void {
+    simgui_new_frame(&desc);
+}
+pub fn newFramePtr(desc: *const FrameDesc) void {
+    simgui_new_frame(desc);
+}
+pub extern fn simgui_render() void;
+pub const render = simgui_render;
+pub extern fn simgui_imtextureid(sg.Image) u64;
+pub const imtextureid = simgui_imtextureid;
+pub extern fn simgui_imtextureid_with_sampler(sg.Image, sg.Sampler) u64;
+pub const imtextureidWithSampler = simgui_imtextureid_with_sampler;
+pub extern fn simgui_image_from_imtextureid(u64) sg.Image;
+pub const imageFromImtextureid = simgui_image_from_imtextureid;
+pub extern fn simgui_sampler_from_imtextureid(u64) sg.Sampler;
+pub const samplerFromImtextureid = simgui_sampler_from_imtextureid;
+pub extern fn simgui_add_focus_event(bool) void;
+pub const addFocusEvent = simgui_add_focus_event;
+pub extern fn simgui_add_mouse_pos_event(f32, f32) void;
+pub const addMousePosEvent = simgui_add_mouse_pos_event;
+pub extern fn simgui_add_touch_pos_event(f32, f32) void;
+pub const addTouchPosEvent = simgui_add_touch_pos_event;
+pub extern fn simgui_add_mouse_button_event(i32, bool) void;
+pub const addMouseButtonEvent = simgui_add_mouse_button_event;
+pub extern fn simgui_add_mouse_wheel_event(f32, f32) void;
+pub const addMouseWheelEvent = simgui_add_mouse_wheel_event;
+pub extern fn simgui_add_key_event(i32, bool) void;
+pub const addKeyEvent = simgui_add_key_event;
+pub extern fn simgui_add_input_character(u32) void;
+pub const addInputCharacter = simgui_add_input_character;
+pub extern fn simgui_add_input_characters_utf8([*c]const u8) void;
+pub fn addInputCharactersUtf8(c: [:0]const u8) void {
+    simgui_add_input_characters_utf8(@ptrCast(c));
+}
+pub extern fn simgui_add_touch_button_event(i32, bool) void;
+pub const addTouchButtonEvent = simgui_add_touch_button_event;
+pub extern fn simgui_handle_event([*c]const sapp.Event) bool;
+pub fn handleEvent(ev: sapp.Event) bool {
+    return simgui_handle_event(&ev);
+}
+pub fn handleEventPtr(ev: *const sapp.Event) bool {
+    return simgui_handle_event(ev);
+}
+pub extern fn simgui_map_keycode(sapp.Keycode) i32;
+pub const mapKeycode = simgui_map_keycode;
+pub extern fn simgui_shutdown() void;
+pub const shutdown = simgui_shutdown;
+pub extern fn simgui_create_fonts_texture([*c]const FontTexDesc) void;
+pub fn createFontsTexture(desc: FontTexDesc) void {
+    simgui_create_fonts_texture(&desc);
+}
+pub fn createFontsTexturePtr(desc: *const FontTexDesc) void {
+    simgui_create_fonts_texture(desc);
+}
+pub extern fn simgui_destroy_fonts_texture() void;
+pub const destroyFontsTexture = simgui_destroy_fonts_texture;
@@ -0,0 +1,18 @@
+// machine generated, do not edit
+
+const builtin = @import("builtin");
+
+// helper function to convert a C string to a Zig string slice
+fn cStrToZig(c_str: [*c]const u8) [:0]const u8 {
+    return @import("std").mem.span(c_str);
+}
+pub extern fn slog_func([*c]const u8, u32, u32, [*c]const u8, u32, [*c]const u8, ?*anyopaque) void;
+/// Plug this function into the 'logger.func' struct item when initializing any of the sokol
+/// headers. For instance for sokol_audio.h it would loom like this:
+///
+/// saudio_setup(&(saudio_desc){
+///     .logger = {
+///         .func = slog_func
+///     }
+/// });
+pub const func = slog_func;
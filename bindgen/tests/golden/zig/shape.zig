@@ -0,0 +1,336 @@
+// machine generated, do not edit
+
+const builtin = @import("builtin");
+const sg = @import("gfx.zig");
+
+// helper function to convert a C string to a Zig string slice
+fn cStrToZig(c_str: [*c]const u8) [:0]const u8 {
+    return @import("std").mem.span(c_str);
+}
+// compile-time check of a struct layout against the C struct layout, which
+// was evaluated by clang for a target with 8-byte pointers (checked
+// only on such targets)
+fn checkLayout(comptime T: type, comptime size: usize, comptime alignment: usize, comptime offsets: anytype) void {
+    if (@sizeOf(usize) != 8) return;
+    if (@sizeOf(T) != size or @alignOf(T) != alignment) {
+        @compileError("size or alignment of " ++ @typeName(T) ++ " doesn't match the C struct");
+    }
+    inline for (@import("std").meta.fields(@TypeOf(offsets))) |field| {
+        if (@offsetOf(T, field.name) != @field(offsets, field.name)) {
+            @compileError("offset of " ++ @typeName(T) ++ "." ++ field.name ++ " doesn't match the C struct");
+        }
+    }
+}
+// helper function to convert "anything" to a Range struct
+pub fn asRange(val: anytype) Range {
+    const type_info = @typeInfo(@TypeOf(val));
+    // FIXME: naming convention change between 0.13 and 0.14-dev
+    if (@hasField(@TypeOf(type_info), "Pointer")) {
+        switch (type_info) {
+            .Pointer => {
+                switch (type_info.Pointer.size) {
+                    .One => return .{ .ptr = val, .size = @sizeOf(type_info.Pointer.child) },
+                    .Slice => return .{ .ptr = val.ptr, .size = @sizeOf(type_info.Pointer.child) * val.len },
+                    else => @compileError("FIXME: Pointer type!"),
+                }
+            },
+            .Struct, .Array => {
+                @compileError("Structs and arrays must be passed as pointers to asRange");
+            },
+            else => {
+                @compileError("Cannot convert to range!");
+            },
+        }
+    } else {
+        switch (type_info) {
+            .pointer => {
+                switch (type_info.pointer.size) {
+                    .One => return .{ .ptr = val, .size = @sizeOf(type_info.pointer.child) },
+                    .Slice => return .{ .ptr = val.ptr, .size = @sizeOf(type_info.pointer.child) * val.len },
+                    else => @compileError("FIXME: Pointer type!"),
+                }
+            },
+            .@"struct", .array => {
+                @compileError("Structs and arrays must be passed as pointers to asRange");
+            },
+            else => {
+                @compileError("Cannot convert to range!");
+            },
+        }
+    }
+}
+
+/// sshape_range is a pointer-size-pair struct used to pass memory
+/// blobs into sokol-shape. When initialized from a value type
+/// (array or struct), use the SSHAPE_RANGE() macro to build
+/// an sshape_range struct.
+pub const Range = extern struct {
+    ptr: ?*const anyopaque = null,
+    size: usize = 0,
+};
+comptime {
+    checkLayout(Range, 16, 8, .{ .ptr = 0, .size = 8 });
+}
+/// a 4x4 matrix wrapper struct
+pub const Mat4 = extern struct {
+    m: [4][4]f32 = @import("std").mem.zeroes([4][4]f32),
+};
+comptime {
+    checkLayout(Mat4, 64, 4, .{ .m = 0 });
+}
+/// vertex layout of the generated geometry
+pub const Vertex = extern struct {
+    x: f32 = 0.0,
+    y: f32 = 0.0,
+    z: f32 = 0.0,
+    /// packed normal as BYTE4N
+    normal: u32 = 0,
+    /// packed uv coords as USHORT2N
+    u: u16 = 0,
+    /// packed uv coords as USHORT2N
+    v: u16 = 0,
+    /// packed color as UBYTE4N (r,g,b,a);
+    color: u32 = 0,
+};
+comptime {
+    checkLayout(Vertex, 24, 4, .{ .x = 0, .y = 4, .z = 8, .normal = 12, .u = 16, .v = 18, .color = 20 });
+}
+/// a range of draw-elements (sg_draw(int base_element, int num_element, ...))
+pub const ElementRange = extern struct {
+    base_element: u32 = 0,
+    num_elements: u32 = 0,
+};
+comptime {
+    checkLayout(ElementRange, 8, 4, .{ .base_element = 0, .num_elements = 4 });
+}
+/// number of elements and byte size of build actions
+pub const SizesItem = extern struct {
+    /// number of elements
+    num: u32 = 0,
+    /// the same as size in bytes
+    size: u32 = 0,
+};
+comptime {
+    checkLayout(SizesItem, 8, 4, .{ .num = 0, .size = 4 });
+}
+pub const Sizes = extern struct {
+    vertices: SizesItem = .{},
+    indices: SizesItem = .{},
+};
+comptime {
+    checkLayout(Sizes, 16, 4, .{ .vertices = 0, .indices = 8 });
+}
+/// in/out struct to keep track of mesh-build state
+pub const BufferItem = extern struct {
+    /// pointer/size pair of output buffer
+    buffer: Range = .{},
+    /// size in bytes of valid data in buffer
+    data_size: usize = 0,
+    /// data offset of the most recent shape
+    shape_offset: usize = 0,
+};
+comptime {
+    checkLayout(BufferItem, 32, 8, .{ .buffer = 0, .data_size = 16, .shape_offset = 24 });
+}
+pub const Buffer = extern struct {
+    valid: bool = false,
+    vertices: BufferItem = .{},
+    indices: BufferItem = .{},
+};
+comptime {
+    checkLayout(Buffer, 72, 8, .{ .valid = 0, .vertices = 8, .indices = 40 });
+}
+/// creation parameters for the different shape types
+pub const Plane = extern struct {
+    /// default: 1.0
+    width: f32 = 0.0,
+    /// default: 1.0
+    depth: f32 = 0.0,
+    /// default: 1
+    tiles: u16 = 0,
+    /// default: white
+    color: u32 = 0,
+    /// default: false
+    random_colors: bool = false,
+    /// if true merge with previous shape (default: false)
+    merge: bool = false,
+    /// default: identity matrix
+    transform: Mat4 = .{},
+};
+comptime {
+    checkLayout(Plane, 84, 4, .{ .width = 0, .depth = 4, .tiles = 8, .color = 12, .random_colors = 16, .merge = 17, .transform = 20 });
+}
+pub const Box = extern struct {
+    /// default: 1.0
+    width: f32 = 0.0,
+    /// default: 1.0
+    height: f32 = 0.0,
+    /// default: 1.0
+    depth: f32 = 0.0,
+    /// default: 1
+    tiles: u16 = 0,
+    /// default: white
+    color: u32 = 0,
+    /// default: false
+    random_colors: bool = false,
+    /// if true merge with previous shape (default: false)
+    merge: bool = false,
+    /// default: identity matrix
+    transform: Mat4 = .{},
+};
+comptime {
+    checkLayout(Box, 88, 4, .{ .width = 0, .height = 4, .depth = 8, .tiles = 12, .color = 16, .random_colors = 20, .merge = 21, .transform = 24 });
+}
+pub const Sphere = extern struct {
+    /// default: 0.5
+    radius: f32 = 0.0,
+    /// default: 5
+    slices: u16 = 0,
+    /// default: 4
+    stacks: u16 = 0,
+    /// default: white
+    color: u32 = 0,
+    /// default: false
+    random_colors: bool = false,
+    /// if true merge with previous shape (default: false)
+    merge: bool = false,
+    /// default: identity matrix
+    transform: Mat4 = .{},
+};
+comptime {
+    checkLayout(Sphere, 80, 4, .{ .radius = 0, .slices = 4, .stacks = 6, .color = 8, .random_colors = 12, .merge = 13, .transform = 16 });
+}
+pub const Cylinder = extern struct {
+    /// default: 0.5
+    radius: f32 = 0.0,
+    /// default: 1.0
+    height: f32 = 0.0,
+    /// default: 5
+    slices: u16 = 0,
+    /// default: 1
+    stacks: u16 = 0,
+    /// default: white
+    color: u32 = 0,
+    /// default: false
+    random_colors: bool = false,
+    /// if true merge with previous shape (default: false)
+    merge: bool = false,
+    /// default: identity matrix
+    transform: Mat4 = .{},
+};
+comptime {
+    checkLayout(Cylinder, 84, 4, .{ .radius = 0, .height = 4, .slices = 8, .stacks = 10, .color = 12, .random_colors = 16, .merge = 17, .transform = 20 });
+}
+pub const Torus = extern struct {
+    /// default: 0.5f
+    radius: f32 = 0.0,
+    /// default: 0.2f
+    ring_radius: f32 = 0.0,
+    /// default: 5
+    sides: u16 = 0,
+    /// default: 5
+    rings: u16 = 0,
+    /// default: white
+    color: u32 = 0,
+    /// default: false
+    random_colors: bool = false,
+    /// if true merge with previous shape (default: false)
+    merge: bool = false,
+    /// default: identity matrix
+    transform: Mat4 = .{},
+};
+comptime {
+    checkLayout(Torus, 84, 4, .{ .radius = 0, .ring_radius = 4, .sides = 8, .rings = 10, .color = 12, .random_colors = 16, .merge = 17, .transform = 20 });
+}
+pub extern fn sshape_build_plane([*c]const Buffer, [*c]const Plane) Buffer;
+pub fn buildPlane(buf: Buffer, params: Plane) Buffer {
+    return sshape_build_plane(&buf, &params);
+}
+pub fn buildPlanePtr(buf: *const Buffer, params: *const Plane) Buffer {
+    return sshape_build_plane(buf, params);
+}
+pub extern fn sshape_build_box([*c]const Buffer, [*c]const Box) Buffer;
+pub fn buildBox(buf: Buffer, params: Box) Buffer {
+    return sshape_build_box(&buf, &params);
+}
+pub fn buildBoxPtr(buf: *const Buffer, params: *const Box) Buffer {
+    return sshape_build_box(buf, params);
+}
+pub extern fn sshape_build_sphere([*c]const Buffer, [*c]const Sphere) Buffer;
+pub fn buildSphere(buf: Buffer, params: Sphere) Buffer {
+    return sshape_build_sphere(&buf, &params);
+}
+pub fn buildSpherePtr(buf: *const Buffer, params: *const Sphere) Buffer {
+    return sshape_build_sphere(buf, params);
+}
+pub extern fn sshape_build_cylinder([*c]const Buffer, [*c]const Cylinder) Buffer;
+pub fn buildCylinder(buf: Buffer, params: Cylinder) Buffer {
+    return sshape_build_cylinder(&buf, &params);
+}
+pub fn buildCylinderPtr(buf: *const Buffer, params: *const Cylinder) Buffer {
+    return sshape_build_cylinder(buf, params);
+}
+pub extern fn sshape_build_torus([*c]const Buffer, [*c]const Torus) Buffer;
+pub fn buildTorus(buf: Buffer, params: Torus) Buffer {
+    return sshape_build_torus(&buf, &params);
+}
+pub fn buildTorusPtr(buf: *const Buffer, params: *const Torus) Buffer {
+    return sshape_build_torus(buf, params);
+}
+pub extern fn sshape_plane_sizes(u32) Sizes;
+pub const planeSizes = sshape_plane_sizes;
+pub extern fn sshape_box_sizes(u32) Sizes;
+pub const boxSizes = sshape_box_sizes;
+pub extern fn sshape_sphere_sizes(u32, u32) Sizes;
+pub const sphereSizes = sshape_sphere_sizes;
+pub extern fn sshape_cylinder_sizes(u32, u32) Sizes;
+pub const cylinderSizes = sshape_cylinder_sizes;
+pub extern fn sshape_torus_sizes(u32, u32) Sizes;
+pub const torusSizes = sshape_torus_sizes;
+pub extern fn sshape_element_range([*c]const Buffer) ElementRange;
+pub fn elementRange(buf: Buffer) ElementRange {
+    return sshape_element_range(&buf);
+}
+pub fn elementRangePtr(buf: *const Buffer) ElementRange {
+    return sshape_element_range(buf);
+}
+pub extern fn sshape_vertex_buffer_desc([*c]const Buffer) sg.BufferDesc;
+pub fn vertexBufferDesc(buf: Buffer) sg.BufferDesc {
+    return sshape_vertex_buffer_desc(&buf);
+}
+pub fn vertexBufferDescPtr(buf: *const Buffer) sg.BufferDesc {
+    return sshape_vertex_buffer_desc(buf);
+}
+pub extern fn sshape_index_buffer_desc([*c]const Buffer) sg.BufferDesc;
+pub fn indexBufferDesc(buf: Buffer) sg.BufferDesc {
+    return sshape_index_buffer_desc(&buf);
+}
+pub fn indexBufferDescPtr(buf: *const Buffer) sg.BufferDesc {
+    return sshape_index_buffer_desc(buf);
+}
+pub extern fn sshape_vertex_buffer_layout_state() sg.VertexBufferLayoutState;
+pub const vertexBufferLayoutState = sshape_vertex_buffer_layout_state;
+pub extern fn sshape_position_vertex_attr_state() sg.VertexAttrState;
+pub const positionVertexAttrState = sshape_position_vertex_attr_state;
+pub extern fn sshape_normal_vertex_attr_state() sg.VertexAttrState;
+pub const normalVertexAttrState = sshape_normal_vertex_attr_state;
+pub extern fn sshape_texcoord_vertex_attr_state() sg.VertexAttrState;
+pub const texcoordVertexAttrState = sshape_texcoord_vertex_attr_state;
+pub extern fn sshape_color_vertex_attr_state() sg.VertexAttrState;
+pub const colorVertexAttrState = sshape_color_vertex_attr_state;
+pub extern fn sshape_color_4f(f32, f32, f32, f32) u32;
+pub const color4f = sshape_color_4f;
+pub extern fn sshape_color_3f(f32, f32, f32) u32;
+pub const color3f = sshape_color_3f;
+pub extern fn sshape_color_4b(u8, u8, u8, u8) u32;
+pub const color4b = sshape_color_4b;
+pub extern fn sshape_color_3b(u8, u8, u8) u32;
+pub const color3b = sshape_color_3b;
+pub extern fn sshape_mat4([*c]const f32) Mat4;
+pub fn mat4(m: *const f32) Mat4 {
+    return sshape_mat4(m);
+}
+pub extern fn sshape_mat4_transpose([*c]const f32) Mat4;
+pub fn mat4Transpose(m: *const f32) Mat4 {
+    return sshape_mat4_transpose(m);
+}
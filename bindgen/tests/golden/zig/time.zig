@@ -0,0 +1,30 @@
+// machine generated, do not edit
+
+const builtin = @import("builtin");
+
+// helper function to convert a C string to a Zig string slice
+fn cStrToZig(c_str: [*c]const u8) [:0]const u8 {
+    return @import("std").mem.span(c_str);
+}
+pub extern fn stm_setup() void;
+pub const setup = stm_setup;
+pub extern fn stm_now() u64;
+pub const now = stm_now;
+pub extern fn stm_diff(u64, u64) u64;
+pub const diff = stm_diff;
+pub extern fn stm_since(u64) u64;
+pub const since = stm_since;
+pub extern fn stm_laptime([*c]u64) u64;
+pub fn laptime(last_time: *u64) u64 {
+    return stm_laptime(last_time);
+}
+pub extern fn stm_round_to_common_refresh_rate(u64) u64;
+pub const roundToCommonRefreshRate = stm_round_to_common_refresh_rate;
+pub extern fn stm_sec(u64) f64;
+pub const sec = stm_sec;
+pub extern fn stm_ms(u64) f64;
+pub const ms = stm_ms;
+pub extern fn stm_us(u64) f64;
+pub const us = stm_us;
+pub extern fn stm_ns(u64) f64;
+pub const ns = stm_ns;
@@ -0,0 +1,88 @@
+# -------------------------------------------------------------------------------
+#   Tests for the decl-level fragment cache (gen_util.FragmentCache).
+#
+#   Runs every golden case with an empty cache, with a warm cache, and with
+#   a warm cache after one function decl changed, and checks that the output
+#   is always identical to an uncached run.
+#
+#       python3 -m unittest discover -s tests
+# -------------------------------------------------------------------------------
+import copy, os, sys, tempfile, unittest
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, tests_dir)
+import test_golden
+import gen_util as util
+from test_golden import backends, gen_output, golden_cases, load_manifest, output_hash
+
+
+# like test_golden.gen_output(), but on an explicit IR
+def gen_output_ir(backend_name, c_prefix, ir):
+    backend, _ = backends[backend_name]
+    ir = copy.deepcopy(ir)
+    ir["module"] = backend.module_names[c_prefix]
+    backend.reset_globals()
+    if backend_name in ["odin", "jai"]:
+        backend.gen_module(ir, c_prefix, ir["dep_prefixes"])
+    else:
+        backend.gen_module(ir, ir["dep_prefixes"])
+    return backend.out_lines
+
+
+# rename the first param of the module's first function with params
+def change_one_func(ir):
+    ir = copy.deepcopy(ir)
+    for decl in ir["decls"]:
+        if decl["kind"] == "func" and not decl["is_dep"] and decl["params"]:
+            decl["params"][0]["name"] += "_changed"
+            return ir, decl["name"]
+    return None, None
+
+
+class FragmentCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.prev_cache_dir = util.fragment_cache_dir
+        util.fragment_cache_dir = self.tmp_dir.name
+        util.fragment_cache_stats.clear()
+
+    def tearDown(self):
+        util.fragment_cache_dir = self.prev_cache_dir
+        self.tmp_dir.cleanup()
+
+    def stats(self, backend_name, c_prefix):
+        backend, _ = backends[backend_name]
+        return util.fragment_cache_stats[(backend.__name__, backend.module_names[c_prefix])]
+
+    def test_cold_and_warm_cache_match_golden(self):
+        manifest = load_manifest()
+        for backend_name, c_prefix, rel_path in golden_cases():
+            with self.subTest(golden=rel_path):
+                self.assertEqual(output_hash(gen_output(backend_name, c_prefix)), manifest[rel_path])
+                self.assertEqual(self.stats(backend_name, c_prefix)[0], 0)
+                self.assertEqual(output_hash(gen_output(backend_name, c_prefix)), manifest[rel_path])
+                self.assertEqual(self.stats(backend_name, c_prefix)[1], 0)
+
+    def test_changed_decl_is_regenerated(self):
+        for backend_name, c_prefix, rel_path in golden_cases():
+            ir = test_golden.load_fixture(test_golden.fixtures[c_prefix])
+            changed_ir, func_name = change_one_func(ir)
+            if changed_ir is None or backends[backend_name][0].check_ignore(func_name):
+                continue
+            with self.subTest(golden=rel_path, func=func_name):
+                gen_output_ir(backend_name, c_prefix, ir)
+                _, num_fragments = self.stats(backend_name, c_prefix)
+                outp = gen_output_ir(backend_name, c_prefix, changed_ir)
+                hits, misses = self.stats(backend_name, c_prefix)
+                self.assertEqual(hits + misses, num_fragments)
+                self.assertIn(misses, [1, 2])
+                prev_cache_dir = util.fragment_cache_dir
+                util.fragment_cache_dir = None
+                try:
+                    self.assertEqual(outp, gen_output_ir(backend_name, c_prefix, changed_ir))
+                finally:
+                    util.fragment_cache_dir = prev_cache_dir
+
+
+if __name__ == "__main__":
+    unittest.main()
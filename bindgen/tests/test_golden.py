@@ -0,0 +1,162 @@
+# -------------------------------------------------------------------------------
+#   Golden-output regression tests for the bindings generators.
+#
+#   Runs every backend's gen_module() against the frozen IR fixtures in
+#   tests/fixtures and compares the result with the files in tests/golden.
+#   Outputs are compared by hash first (against golden/manifest.json), the
+#   golden file is only read and diffed on a mismatch. No clang needed.
+#
+#   Run the tests (from the bindgen directory):
+#
+#       python3 -m unittest discover -s tests
+#
+#   After an intentional output change, regenerate the golden files:
+#
+#       python3 tests/test_golden.py --update
+#
+#   To refresh the IR fixtures after a header change, first run gen_all.py
+#   (which writes {module}.json files as a side effect) and then:
+#
+#       python3 tests/test_golden.py --update-fixtures --update
+# -------------------------------------------------------------------------------
+import difflib, hashlib, json, os, shutil, sys, unittest
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+bindgen_dir = os.path.dirname(tests_dir)
+fixtures_dir = f"{tests_dir}/fixtures"
+golden_dir = f"{tests_dir}/golden"
+manifest_path = f"{golden_dir}/manifest.json"
+
+sys.path.insert(0, bindgen_dir)
+import gen_zig, gen_rust, gen_d, gen_v, gen_nim, gen_odin, gen_jai, gen_python
+
+# C prefix => IR fixture name
+fixtures = {
+    "slog_": "log",
+    "sg_": "gfx",
+    "sapp_": "app",
+    "sglue_": "glue",
+    "stm_": "time",
+    "saudio_": "audio",
+    "sgl_": "gl",
+    "sdtx_": "debugtext",
+    "sshape_": "shape",
+    "sfetch_": "fetch",
+    "simgui_": "imgui",
+}
+
+# backend name => (generator module, output file extension)
+backends = {
+    "zig": (gen_zig, ".zig"),
+    "rust": (gen_rust, ".rs"),
+    "d": (gen_d, ".d"),
+    "v": (gen_v, ".c.v"),
+    "nim": (gen_nim, ".nim"),
+    "odin": (gen_odin, ".odin"),
+    "jai": (gen_jai, ".jai"),
+    "python": (gen_python, ".py"),
+}
+
+
+def load_fixture(name):
+    with open(f"{fixtures_dir}/{name}.json", "r") as f:
+        return json.load(f)
+
+
+def output_hash(s):
+    return hashlib.blake2b(s.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_manifest():
+    if not os.path.isfile(manifest_path):
+        return {}
+    with open(manifest_path, "r") as f:
+        return json.load(f)
+
+
+# yields (backend name, C prefix, golden file path relative to golden_dir)
+def golden_cases():
+    for backend_name, (backend, ext) in backends.items():
+        for c_prefix in fixtures:
+            if c_prefix in backend.module_names:
+                rel_path = f"{backend_name}/{backend.module_names[c_prefix]}{ext}"
+                yield backend_name, c_prefix, rel_path
+
+
+# run a backend's gen_module() on an IR fixture, like the backend's gen() would
+def gen_output(backend_name, c_prefix):
+    backend, _ = backends[backend_name]
+    ir = load_fixture(fixtures[c_prefix])
+    ir["module"] = backend.module_names[c_prefix]
+    dep_prefixes = ir["dep_prefixes"]
+    backend.reset_globals()
+    if backend in [gen_odin, gen_jai]:
+        backend.gen_module(ir, c_prefix, dep_prefixes)
+    else:
+        backend.gen_module(ir, dep_prefixes)
+    return backend.out_lines
+
+
+def update_golden():
+    if os.path.isdir(golden_dir):
+        shutil.rmtree(golden_dir)
+    manifest = {}
+    for backend_name, c_prefix, rel_path in golden_cases():
+        outp = gen_output(backend_name, c_prefix)
+        path = f"{golden_dir}/{rel_path}"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", newline="\n") as f:
+            f.write(outp)
+        manifest[rel_path] = output_hash(outp)
+    with open(manifest_path, "w", newline="\n") as f:
+        f.write(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    print(f"  updated {len(manifest)} golden files")
+
+
+def update_fixtures():
+    os.makedirs(fixtures_dir, exist_ok=True)
+    for name in fixtures.values():
+        src_path = f"{bindgen_dir}/{name}.json"
+        if not os.path.isfile(src_path):
+            sys.exit(f"ERROR: {src_path} not found, run gen_all.py first")
+        shutil.copyfile(src_path, f"{fixtures_dir}/{name}.json")
+    print(f"  updated {len(fixtures)} IR fixtures")
+
+
+class GoldenOutputTest(unittest.TestCase):
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.manifest = load_manifest()
+
+    def test_golden_output(self):
+        for backend_name, c_prefix, rel_path in golden_cases():
+            with self.subTest(golden=rel_path):
+                self.assertIn(rel_path, self.manifest, "missing golden file, run with --update")
+                outp = gen_output(backend_name, c_prefix)
+                if output_hash(outp) == self.manifest[rel_path]:
+                    continue
+                with open(f"{golden_dir}/{rel_path}", "r", newline="\n") as f:
+                    golden = f.read()
+                diff = difflib.unified_diff(
+                    golden.splitlines(keepends=True),
+                    outp.splitlines(keepends=True),
+                    fromfile=f"golden/{rel_path}",
+                    tofile=f"generated/{rel_path}",
+                )
+                self.fail("generated output differs from golden file:\n" + "".join(diff))
+
+    def test_manifest_has_no_stale_entries(self):
+        expected = set(rel_path for _, _, rel_path in golden_cases())
+        self.assertEqual(set(self.manifest.keys()) - expected, set())
+
+
+if __name__ == "__main__":
+    if "--update-fixtures" in sys.argv or "--update" in sys.argv:
+        if "--update-fixtures" in sys.argv:
+            update_fixtures()
+        if "--update" in sys.argv:
+            update_golden()
+    else:
+        unittest.main()
@@ -0,0 +1,101 @@
+# -------------------------------------------------------------------------------
+#   Tests for the read-only IR API in gen_ir.py (uses the IR fixtures), and
+#   for the doc comment extraction from the header text.
+# -------------------------------------------------------------------------------
+import os, sys, tempfile, unittest
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+fixtures_dir = f"{tests_dir}/fixtures"
+
+sys.path.insert(0, os.path.dirname(tests_dir))
+import gen_ir
+
+
+class LoadIRTest(unittest.TestCase):
+    def test_load_is_cached(self):
+        self.assertIs(gen_ir.load_ir("gfx", fixtures_dir), gen_ir.load_ir("gfx", fixtures_dir))
+
+    def test_ir_is_immutable(self):
+        ir = gen_ir.load_ir("gfx", fixtures_dir)
+        with self.assertRaises(TypeError):
+            ir.by_name["sg_desc"]["name"] = "bla"
+        with self.assertRaises(AttributeError):
+            ir.decls.append({})
+
+    def test_indexes(self):
+        ir = gen_ir.load_ir("glue", fixtures_dir)
+        self.assertEqual(ir.by_name["sg_desc"]["kind"], "struct")
+        self.assertEqual(ir.by_name["sglue_environment"]["kind"], "func")
+        self.assertTrue(all(d["kind"] == "enum" for d in ir.by_kind["enum"]))
+        self.assertEqual(set(ir.by_prefix.keys()), {"sglue_", "sg_"})
+        self.assertEqual(ir.api_decls, ir.by_prefix["sglue_"])
+        self.assertTrue(all(d["name"].startswith("sglue_") for d in ir.api_decls))
+        self.assertEqual(len(ir.api_decls) + len(ir.by_prefix["sg_"]), len(ir.decls))
+
+    def test_missing_ir(self):
+        with self.assertRaises(FileNotFoundError):
+            gen_ir.load_ir("bla", fixtures_dir)
+
+
+class HeaderTextTest(unittest.TestCase):
+    header = (
+        "/*\n"
+        "    bla_desc\n"
+        "\n"
+        "    A desc struct.\n"
+        "*/\n"
+        "typedef struct bla_desc {\n"
+        "    int count;      // number of items\n"
+        "    float scale;\n"
+        "} bla_desc;\n"
+        "\n"
+        "// setup and shutdown\n"
+        "// (call once)\n"
+        "void bla_setup(const bla_desc* desc);\n"
+        "void bla_shutdown(void);\n"
+        "\n"
+        "/*=== frame functions ===*/\n"
+        "void bla_frame(void);\n"
+    )
+
+    def setUp(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".h", delete=False, newline="\n") as f:
+            f.write(self.header)
+        self.text = gen_ir.HeaderText(f.name)
+        os.remove(f.name)
+
+    def loc(self, token):
+        return {"offset": self.header.index(token)}
+
+    def test_line_index(self):
+        self.assertEqual(self.text.line_index(0), 0)
+        self.assertEqual(self.text.line_index(self.header.index("bla_shutdown")), 13)
+        self.assertEqual(self.text.line(5), "typedef struct bla_desc {")
+
+    def test_offset_checks_token(self):
+        self.assertIsNotNone(self.text.offset(self.loc("bla_setup"), "bla_setup"))
+        self.assertIsNone(self.text.offset(self.loc("bla_setup"), "bla_shutdown"))
+        self.assertIsNone(self.text.offset({"offset": len(self.header) + 10}, "bla_setup"))
+
+    def test_leading_comments(self):
+        line_index = self.text.line_index(self.header.index("typedef"))
+        self.assertEqual(self.text.leading_comment(line_index), "bla_desc\n\nA desc struct.")
+        line_index = self.text.line_index(self.header.index("void bla_setup"))
+        self.assertEqual(self.text.leading_comment(line_index), "setup and shutdown\n(call once)")
+        line_index = self.text.line_index(self.header.index("void bla_shutdown"))
+        self.assertIsNone(self.text.leading_comment(line_index))
+
+    def test_group_and_banner_comments(self):
+        self.assertFalse(self.text.is_followed_by_decl(self.header.index("} bla_desc;")))
+        self.assertTrue(self.text.is_followed_by_decl(self.header.index("void bla_setup")))
+        self.assertFalse(self.text.is_followed_by_decl(self.header.index("void bla_shutdown")))
+        line_index = self.text.line_index(self.header.index("void bla_frame"))
+        self.assertIsNone(self.text.leading_comment(line_index))
+
+    def test_trailing_comments(self):
+        self.assertEqual(self.text.trailing_comment(self.header.index("count")), "number of items")
+        self.assertIsNone(self.text.trailing_comment(self.header.index("scale")))
+
+
+if __name__ == "__main__":
+    unittest.main()
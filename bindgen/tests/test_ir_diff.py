@@ -0,0 +1,86 @@
+# -------------------------------------------------------------------------------
+#   Tests for the semantic IR diff in gen_ir.py.
+#
+#   Applies small API changes to the IR fixtures and checks the reported
+#   decl changes, and that the reported affected outputs include all
+#   generated files which actually change (the mapping is conservative,
+#   e.g. a renamed param doesn't change the Python bindings).
+#
+#       python3 -m unittest discover -s tests
+# -------------------------------------------------------------------------------
+import copy, os, sys, unittest
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, tests_dir)
+import gen_ir
+from test_golden import backends, fixtures, load_fixture
+from test_fragment_cache import gen_output_ir
+
+# backend name => generator module
+backend_modules = {name: backend for name, (backend, _) in backends.items()}
+
+
+def find_decl(ir, name):
+    for decl in ir["decls"]:
+        if decl.get("name") == name:
+            return decl
+    raise KeyError(name)
+
+
+class IRDiffTest(unittest.TestCase):
+    def check_affected_outputs(self, c_prefix, old_ir, new_ir):
+        changes = gen_ir.diff_ir(old_ir, new_ir)
+        expected = set()
+        for backend_name, (backend, _) in backends.items():
+            if c_prefix in backend.module_names:
+                if gen_output_ir(backend_name, c_prefix, old_ir) != gen_output_ir(backend_name, c_prefix, new_ir):
+                    expected.add(backend_name)
+        affected = gen_ir.affected_outputs(changes, c_prefix, backend_modules)
+        self.assertTrue(expected <= set(affected.keys()), f"missing: {expected - set(affected.keys())}")
+        return changes
+
+    def test_no_changes(self):
+        ir = load_fixture("gfx")
+        self.assertEqual(gen_ir.diff_ir(ir, copy.deepcopy(ir)), [])
+
+    def test_struct_enum_and_func_changes(self):
+        old_ir = load_fixture("gfx")
+        new_ir = copy.deepcopy(old_ir)
+        find_decl(new_ir, "sg_range")["fields"].append({"name": "extra", "type": "int", "offset": 16})
+        find_decl(new_ir, "sg_backend")["items"].pop()
+        find_decl(new_ir, "sg_setup")["params"][0]["name"] = "d"
+        new_ir["decls"].remove(find_decl(new_ir, "sg_reset_state_cache"))
+        changes = self.check_affected_outputs("sg_", old_ir, new_ir)
+        summary = sorted((c["change"], c["kind"], c["name"]) for c in changes)
+        self.assertEqual(
+            summary,
+            [
+                ("changed", "enum", "sg_backend"),
+                ("changed", "func", "sg_setup"),
+                ("changed", "struct", "sg_range"),
+                ("removed", "func", "sg_reset_state_cache"),
+            ],
+        )
+        range_change = [c for c in changes if c["name"] == "sg_range"][0]
+        self.assertIn("field added: extra: int", range_change["details"])
+
+    def test_func_ignored_by_some_backends(self):
+        old_ir = load_fixture("gfx")
+        new_ir = copy.deepcopy(old_ir)
+        find_decl(new_ir, "sg_install_trace_hooks")["params"][0]["name"] = "hooks"
+        changes = self.check_affected_outputs("sg_", old_ir, new_ir)
+        affected = gen_ir.affected_outputs(changes, "sg_", backend_modules)
+        self.assertNotIn("odin", affected)
+        self.assertNotIn("v", affected)
+
+    def test_dependency_func_change(self):
+        old_ir = load_fixture(fixtures["sgl_"])
+        new_ir = copy.deepcopy(old_ir)
+        find_decl(new_ir, "sg_setup")["params"][0]["name"] = "d"
+        changes = self.check_affected_outputs("sgl_", old_ir, new_ir)
+        self.assertTrue(changes[0]["is_dep"])
+        self.assertEqual(gen_ir.affected_outputs(changes, "sgl_", backend_modules), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
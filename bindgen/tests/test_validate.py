@@ -0,0 +1,68 @@
+# -------------------------------------------------------------------------------
+#   Tests for the validation of generated files (gen_validate.py), with the
+#   Python validator only, since it doesn't need another toolchain.
+#
+#       python3 -m unittest discover -s tests
+# -------------------------------------------------------------------------------
+import os, sys, tempfile, unittest
+from unittest import mock
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(tests_dir))
+import gen_validate
+
+
+class ValidateTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.prev_cache_path = gen_validate.cache_path
+        gen_validate.cache_path = os.path.join(self.tmp_dir.name, "validate_cache.json")
+        self.num_runs = 0
+
+    def tearDown(self):
+        gen_validate.cache_path = self.prev_cache_path
+        self.tmp_dir.cleanup()
+
+    def write(self, name, src):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "w") as f:
+            f.write(src)
+        return path
+
+    def validate(self, generated_files):
+        run_validator = gen_validate.run_validator
+
+        def counting_run_validator(cmd):
+            self.num_runs += 1
+            return run_validator(cmd)
+
+        with mock.patch.object(gen_validate, "run_validator", counting_run_validator):
+            gen_validate.validate(generated_files)
+
+    def test_only_changed_files_are_validated_again(self):
+        a = self.write("a.py", "a = 1\n")
+        b = self.write("b.py", "b = 2\n")
+        self.validate({a: "python", b: "python"})
+        self.assertEqual(self.num_runs, 2)
+        self.validate({a: "python", b: "python"})
+        self.assertEqual(self.num_runs, 2)
+        self.write("b.py", "b = 3\n")
+        self.validate({a: "python", b: "python"})
+        self.assertEqual(self.num_runs, 3)
+
+    def test_failure_stops_and_isnt_cached(self):
+        bad = self.write("bad.py", "def bad(:\n")
+        for _ in range(2):
+            with self.assertRaises(SystemExit):
+                self.validate({bad: "python"})
+        self.assertEqual(self.num_runs, 2)
+
+    def test_missing_toolchain_is_skipped(self):
+        path = self.write("a.zig", "this isn't Zig\n")
+        with mock.patch.dict(os.environ, {"SOKOL_BINDGEN_ZIG": os.path.join(self.tmp_dir.name, "no-zig")}):
+            self.validate({path: "zig", self.write("a.jai", ""): "jai"})
+        self.assertEqual(self.num_runs, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
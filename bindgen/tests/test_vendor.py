@@ -0,0 +1,72 @@
+# -------------------------------------------------------------------------------
+#   Tests for the header vendoring into the bindings repositories
+#   (gen_util.vendor_file).
+#
+#       python3 -m unittest discover -s tests
+# -------------------------------------------------------------------------------
+import importlib, os, sys, tempfile, unittest
+from unittest import mock
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(tests_dir))
+import gen_util as util
+
+
+class VendorTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.src_path = os.path.join(self.tmp_dir.name, "sokol_bla.h")
+        self.dst_dir = os.path.join(self.tmp_dir.name, "c")
+        self.dst_path = os.path.join(self.dst_dir, "sokol_bla.h")
+        os.makedirs(self.dst_dir)
+        with open(self.src_path, "w") as f:
+            f.write("// sokol_bla.h\n" * 100)
+        self.prev_hardlinks = util.vendor_hardlinks
+        util.vendor_hardlinks = False
+        util.vendored_files.clear()
+
+    def tearDown(self):
+        util.vendor_hardlinks = self.prev_hardlinks
+        util.vendored_files.clear()
+        self.tmp_dir.cleanup()
+
+    def read(self, path):
+        with open(path, "r") as f:
+            return f.read()
+
+    def test_vendor_and_skip_unchanged(self):
+        self.assertIn(util.vendor_file(self.src_path, self.dst_path), ["reflinked", "hardlinked", "copied"])
+        self.assertEqual(self.read(self.dst_path), self.read(self.src_path))
+        self.assertEqual(util.vendor_file(self.src_path, self.dst_path), "unchanged")
+        self.assertEqual(os.listdir(self.dst_dir), ["sokol_bla.h"])
+
+    def test_replace_changed_file(self):
+        with open(self.dst_path, "w") as f:
+            f.write("// an old version\n")
+        self.assertIn(util.vendor_file(self.src_path, self.dst_path), ["reflinked", "copied"])
+        self.assertEqual(self.read(self.dst_path), self.read(self.src_path))
+        self.assertFalse(os.path.samefile(self.src_path, self.dst_path))
+        # a second vendoring run keeps the first change in the summary
+        util.vendor_file(self.src_path, self.dst_path)
+        self.assertNotEqual(util.vendored_files[self.dst_path], "unchanged")
+
+    def test_same_size_and_mtime_is_compared_by_content(self):
+        with open(self.dst_path, "w") as f:
+            f.write("// sokol_blx.h\n" * 100)
+        src_stat = os.stat(self.src_path)
+        os.utime(self.dst_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        self.assertNotEqual(util.vendor_file(self.src_path, self.dst_path), "unchanged")
+        self.assertEqual(self.read(self.dst_path), self.read(self.src_path))
+
+    def test_no_hardlinks_by_default(self):
+        # evaluate the module-level default without the environment override
+        with mock.patch.dict(os.environ):
+            os.environ.pop("SOKOL_BINDGEN_VENDOR_HARDLINKS", None)
+            importlib.reload(util)
+        self.assertIs(util.vendor_hardlinks, False)
+        util.vendor_file(self.src_path, self.dst_path)
+        self.assertFalse(os.path.samefile(self.src_path, self.dst_path))
+
+
+if __name__ == "__main__":
+    unittest.main()